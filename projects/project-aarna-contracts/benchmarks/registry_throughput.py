@@ -0,0 +1,505 @@
+"""
+Offline throughput benchmark for AarnaRegistry.
+
+Drives the contract in the algorand-python-testing emulator, so no network or
+localnet is needed. Phases run in lifecycle order:
+
+  submit   submit_project for `--projects` records from a pool of submitters
+  review   review_projects_batch over the pending queue (approve / reject mix)
+  issue    issue_credits (or issue_credits_batch) for every verified project
+  market   list_for_sale, then a seeded churn of buy / partial buy / cancel /
+           relist calls
+
+Each ABI call is timed on its own. After every phase the app's boxes are
+counted by probing the keys the contract can have written, and the minimum
+balance they lock up is reported per project and per open listing.
+
+Wall times measure the Python emulator, not the AVM, so they are only good for
+comparing runs on the same machine; box counts, bytes and MBR are exact.
+
+    poetry run python -m benchmarks.registry_throughput --output results.json
+"""
+
+import argparse
+import dataclasses
+import hashlib
+import json
+import logging
+import random
+import statistics
+import sys
+import time
+from collections.abc import Callable, Iterator
+from pathlib import Path
+from typing import Any
+
+from algopy import Account, arc4, gtxn
+from algopy_testing import AlgopyTestContext, algopy_testing_context
+
+from smart_contracts.aarna_registry.contract import (
+    INDEX_PAGE_IDS,
+    LISTING_DEPOSIT,
+    MAX_ID_PAGE,
+    MAX_ISSUE_BATCH,
+    MAX_REVIEW_BATCH,
+    NO_ID,
+    AarnaRegistry,
+    ReviewDecision,
+)
+
+logger = logging.getLogger(__name__)
+
+# Box MBR on Algorand: 2500 µAlgo per box plus 400 per byte of key and value.
+BOX_FLAT_MBR = 2_500
+BOX_BYTE_MBR = 400
+
+# Key prefix -> box family, grouped by the record the MBR is charged to.
+project_boxes = {
+    b"h": "project header",
+    b"m": "project meta",
+    b"q": "review queue link",
+    b"s": "submitter index",
+    b"c": "cid index",
+}
+listing_boxes = {
+    b"l": "listing",
+    b"k": "book link",
+    b"o": "price level",
+    b"f": "free listing id",
+    b"t": "seller index",
+}
+
+
+@dataclasses.dataclass
+class OpTimings:
+    samples: list[float] = dataclasses.field(default_factory=list)
+
+    def summary(self) -> dict[str, float]:
+        ordered = sorted(self.samples)
+        total = sum(ordered)
+        return {
+            "calls": len(ordered),
+            "total_s": round(total, 6),
+            "mean_us": round(total / len(ordered) * 1e6, 2),
+            "p50_us": round(statistics.median(ordered) * 1e6, 2),
+            "p95_us": round(ordered[int(len(ordered) * 0.95) - 1] * 1e6, 2),
+            "ops_per_s": round(len(ordered) / total, 1) if total else 0.0,
+        }
+
+
+@dataclasses.dataclass
+class Bench:
+    ctx: AlgopyTestContext
+    contract: AarnaRegistry
+    admin: Account
+    validator: Account
+    submitters: list[Account]
+    traders: list[Account]
+    rng: random.Random
+    timings: dict[str, OpTimings] = dataclasses.field(default_factory=dict)
+    prices: set[int] = dataclasses.field(default_factory=set)
+
+    def payment(self, sender: Account, amount: int) -> gtxn.PaymentTransaction:
+        """A payment from `sender` to the app, for a call to take as an argument."""
+        return self.ctx.any.txn.payment(
+            sender=sender,
+            receiver=self.ctx.ledger.get_app(self.contract).address,
+            amount=amount,
+        )
+
+    def call(
+        self,
+        op_name: str,
+        sender: Account,
+        method: Callable[[], Any],
+        payment: gtxn.PaymentTransaction | None = None,
+    ) -> Any:
+        """
+        Runs one ABI call as `sender`, timing only the call itself. A call that
+        takes a `payment` argument runs grouped behind that payment.
+        """
+        if payment is None:
+            group = self.ctx.txn.create_group(active_txn_overrides={"sender": sender})
+        else:
+            app_call = self.ctx.any.txn.application_call(
+                sender=sender, app_id=self.ctx.ledger.get_app(self.contract)
+            )
+            group = self.ctx.txn.create_group(
+                gtxns=[payment, app_call], active_txn_index=1
+            )
+        with group:
+            start = time.perf_counter()
+            result = method()
+            elapsed = time.perf_counter() - start
+        self.timings.setdefault(op_name, OpTimings()).samples.append(elapsed)
+        return result
+
+
+def _native(value: arc4.UInt64) -> int:
+    return value.native.value
+
+
+def _itob(value: int) -> bytes:
+    return value.to_bytes(8, "big")
+
+
+def _cid(project: int) -> str:
+    # CIDv1 base32 strings are 59 characters long
+    return f"bafybeig{project:051d}"
+
+
+# ----------------------------- Phases ----------------------------- #
+
+
+def run_submit(bench: Bench, projects: int) -> None:
+    for i in range(projects):
+        submitter = bench.submitters[i % len(bench.submitters)]
+        bench.call(
+            "submit_project",
+            submitter,
+            lambda i=i: bench.contract.submit_project(
+                arc4.String(f"Mangrove restoration block {i}"),
+                arc4.String(f"Sundarbans, West Bengal plot {i % 977}"),
+                arc4.String(("mangrove", "seagrass", "salt marsh")[i % 3]),
+                arc4.String(_cid(i)),
+            ),
+        )
+
+
+def run_review(bench: Bench, batch_size: int, reject_ratio: float) -> None:
+    project_count = _native(bench.contract.get_project_count())
+    for start in range(0, project_count, batch_size):
+        decisions = [
+            ReviewDecision(
+                project_id=arc4.UInt64(pid),
+                decision=arc4.UInt8(3 if bench.rng.random() < reject_ratio else 2),
+                credits=arc4.UInt64(bench.rng.randint(100, 5_000)),
+            )
+            for pid in range(start, min(start + batch_size, project_count))
+        ]
+        bench.call(
+            "review_projects_batch",
+            bench.validator,
+            lambda decisions=decisions: bench.contract.review_projects_batch(
+                arc4.DynamicArray[ReviewDecision](*decisions)
+            ),
+        )
+
+
+def _verified_pages(bench: Bench) -> Iterator[list[int]]:
+    """Drains the verified queue a page at a time, the way the validator would."""
+    while True:
+        page = bench.contract.get_verified_ids(
+            arc4.UInt64(NO_ID), arc4.UInt64(MAX_ID_PAGE)
+        )
+        if not page.length:
+            return
+        yield [_native(item) for item in page]
+
+
+def run_issue(bench: Bench, batch_size: int) -> None:
+    for page in _verified_pages(bench):
+        if batch_size <= 1:
+            for pid in page:
+                bench.call(
+                    "issue_credits",
+                    bench.validator,
+                    lambda pid=pid: bench.contract.issue_credits(arc4.UInt64(pid)),
+                )
+            continue
+        for start in range(0, len(page), batch_size):
+            ids = arc4.DynamicArray[arc4.UInt64](
+                *(arc4.UInt64(pid) for pid in page[start : start + batch_size])
+            )
+            bench.call(
+                "issue_credits_batch",
+                bench.validator,
+                lambda ids=ids: bench.contract.issue_credits_batch(ids),
+            )
+
+
+def _list(bench: Bench, open_listings: dict[int, tuple[Account, int, int]]) -> None:
+    seller = bench.rng.choice(bench.traders)
+    amount = bench.rng.randint(1, 500)
+    # A narrow band of prices so levels hold several listings each.
+    price = bench.rng.randint(20, 60) * 1_000
+    bench.prices.add(price)
+    # The level hint is looked up outside the timing, as a client would.
+    hint = bench.contract.get_price_hint(arc4.UInt64(price))
+    # Like the frontend, always send the full deposit; a reused id refunds the rest.
+    deposit = bench.payment(seller, LISTING_DEPOSIT)
+    lid = _native(
+        bench.call(
+            "list_for_sale",
+            seller,
+            lambda: bench.contract.list_for_sale(
+                arc4.UInt64(amount), arc4.UInt64(price), hint, deposit
+            ),
+            deposit,
+        )
+    )
+    open_listings[lid] = (seller, amount, price)
+
+
+def run_market(bench: Bench, listings: int, churn: int) -> None:
+    open_listings: dict[int, tuple[Account, int, int]] = {}
+    for _ in range(listings):
+        _list(bench, open_listings)
+
+    for _ in range(churn):
+        roll = bench.rng.random()
+        if roll < 0.3 or not open_listings:
+            _list(bench, open_listings)
+            continue
+        lid = bench.rng.choice(list(open_listings))
+        seller, amount, price = open_listings[lid]
+        buyer = bench.rng.choice(bench.traders)
+        if roll < 0.55:
+            pay = bench.payment(buyer, amount * price)
+            bench.call(
+                "buy_listing",
+                buyer,
+                lambda lid=lid, pay=pay: bench.contract.buy_listing(
+                    arc4.UInt64(lid), pay
+                ),
+                pay,
+            )
+            del open_listings[lid]
+        elif roll < 0.8 and amount > 1:
+            quantity = bench.rng.randint(1, amount - 1)
+            pay = bench.payment(buyer, quantity * price)
+            bench.call(
+                "buy_listing_partial",
+                buyer,
+                lambda lid=lid, quantity=quantity, pay=pay: (
+                    bench.contract.buy_listing_partial(
+                        arc4.UInt64(lid), arc4.UInt64(quantity), pay
+                    )
+                ),
+                pay,
+            )
+            open_listings[lid] = (seller, amount - quantity, price)
+        else:
+            bench.call(
+                "cancel_listing",
+                seller,
+                lambda lid=lid: bench.contract.cancel_listing(arc4.UInt64(lid)),
+            )
+            del open_listings[lid]
+
+
+# --------------------------- Box accounting --------------------------- #
+
+
+def _candidate_keys(bench: Bench) -> Iterator[bytes]:
+    """Every box key the contract may have written so far."""
+    project_count = _native(bench.contract.get_project_count())
+    listing_count = _native(bench.contract.get_listing_count())
+    for pid in range(project_count):
+        for prefix in (b"h", b"m", b"q"):
+            yield prefix + _itob(pid)
+        yield b"c" + hashlib.sha256(_cid(pid).encode()).digest()
+    for lid in range(listing_count):
+        for prefix in (b"l", b"k", b"f"):
+            yield prefix + _itob(lid)
+    for price in sorted(bench.prices):
+        yield b"o" + _itob(price)
+    for prefix, accounts in ((b"s", bench.submitters), (b"t", bench.traders)):
+        for account in accounts:
+            key = prefix + account.bytes.value
+            yield key
+            if bench.ctx.ledger.box_exists(bench.contract, key):
+                ids = int.from_bytes(bench.ctx.ledger.get_box(bench.contract, key))
+                for page in range((ids + INDEX_PAGE_IDS - 1) // INDEX_PAGE_IDS):
+                    yield key + _itob(page)
+
+
+def box_snapshot(bench: Bench) -> dict[str, Any]:
+    families: dict[str, dict[str, int]] = {}
+    project_mbr = listing_mbr = 0
+    for key in _candidate_keys(bench):
+        if not bench.ctx.ledger.box_exists(bench.contract, key):
+            continue
+        value = bench.ctx.ledger.get_box(bench.contract, key)
+        prefix = key[:1]
+        name = project_boxes.get(prefix) or listing_boxes[prefix]
+        mbr = BOX_FLAT_MBR + BOX_BYTE_MBR * (len(key) + len(value))
+        family = families.setdefault(name, {"boxes": 0, "bytes": 0, "mbr": 0})
+        family["boxes"] += 1
+        family["bytes"] += len(key) + len(value)
+        family["mbr"] += mbr
+        if prefix in project_boxes:
+            project_mbr += mbr
+        else:
+            listing_mbr += mbr
+
+    projects = _native(bench.contract.get_project_count())
+    open_listings = _native(bench.contract.get_open_listing_count())
+    return {
+        "boxes": sum(f["boxes"] for f in families.values()),
+        "box_bytes": sum(f["bytes"] for f in families.values()),
+        "mbr_microalgo": project_mbr + listing_mbr,
+        "mbr_per_project": round(project_mbr / projects, 1) if projects else None,
+        "mbr_per_open_listing": (
+            round(listing_mbr / open_listings, 1) if open_listings else None
+        ),
+        "families": dict(sorted(families.items())),
+    }
+
+
+# ----------------------------- Driver ----------------------------- #
+
+
+def run(args: argparse.Namespace) -> dict[str, Any]:
+    results: dict[str, Any] = {"parameters": vars(args).copy(), "phases": {}}
+    results["parameters"].pop("output")
+    results["parameters"].pop("baseline")
+
+    with algopy_testing_context() as ctx:
+        admin, validator = ctx.any.account(), ctx.any.account()
+        bench = Bench(
+            ctx=ctx,
+            contract=AarnaRegistry(),
+            admin=admin,
+            validator=validator,
+            submitters=[ctx.any.account() for _ in range(args.submitters)],
+            traders=[ctx.any.account() for _ in range(args.traders)],
+            rng=random.Random(args.seed),
+        )
+        # Set up outside the timings: create the app, then the validator role.
+        # The token is assigned directly; ensure_token is not what we measure.
+        with ctx.txn.create_group(active_txn_overrides={"sender": admin}):
+            bench.contract.init()
+        with ctx.txn.create_group(active_txn_overrides={"sender": admin}):
+            bench.contract.set_validator(arc4.Address(validator))
+        bench.contract.aarna_asset = ctx.any.asset().id
+
+        phases: list[tuple[str, Callable[[], None]]] = [
+            ("submit", lambda: run_submit(bench, args.projects)),
+            ("review", lambda: run_review(bench, args.review_batch, args.reject_ratio)),
+            ("issue", lambda: run_issue(bench, args.issue_batch)),
+            ("market", lambda: run_market(bench, args.listings, args.churn)),
+        ]
+        for phase, body in phases:
+            logger.info(f"Running {phase}")
+            bench.timings = {}
+            start = time.perf_counter()
+            body()
+            results["phases"][phase] = {
+                "wall_s": round(time.perf_counter() - start, 3),
+                "ops": {
+                    name: timings.summary()
+                    for name, timings in sorted(bench.timings.items())
+                },
+                "storage": box_snapshot(bench),
+            }
+    return results
+
+
+def _microalgo(value: float | None) -> str:
+    # Per-record MBR is None while there are no records to share it.
+    return "n/a" if value is None else f"{value}µA"
+
+
+def report(results: dict[str, Any]) -> None:
+    for phase, data in results["phases"].items():
+        storage = data["storage"]
+        print(
+            f"{phase:<8} {data['wall_s']:>8.2f}s  boxes={storage['boxes']} "
+            f"bytes={storage['box_bytes']} mbr={storage['mbr_microalgo'] / 1e6:.3f}A "
+            f"per project={_microalgo(storage['mbr_per_project'])} "
+            f"per open listing={_microalgo(storage['mbr_per_open_listing'])}"
+        )
+        for name, summary in data["ops"].items():
+            print(
+                f"    {name:<24} {summary['calls']:>7} calls "
+                f"{summary['mean_us']:>10.1f}µs mean "
+                f"{summary['p95_us']:>10.1f}µs p95 "
+                f"{summary['ops_per_s']:>9.1f}/s"
+            )
+
+
+def compare(
+    baseline: dict[str, Any], results: dict[str, Any], tolerance: float
+) -> list[str]:
+    """
+    Storage must match the baseline exactly (same parameters, same seed);
+    mean call time may grow by at most `tolerance`.
+    """
+    regressions = []
+    for phase, data in results["phases"].items():
+        previous = baseline["phases"].get(phase)
+        if previous is None:
+            continue
+        for metric in ("boxes", "box_bytes", "mbr_microalgo"):
+            before, after = previous["storage"][metric], data["storage"][metric]
+            if after > before:
+                regressions.append(f"{phase}: {metric} {before} -> {after}")
+        for name, summary in data["ops"].items():
+            before = previous["ops"].get(name, {}).get("mean_us")
+            if before and summary["mean_us"] > before * (1 + tolerance):
+                regressions.append(
+                    f"{phase}: {name} mean {before}µs -> {summary['mean_us']}µs"
+                )
+    return regressions
+
+
+def parse_args(argv: list[str]) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(
+        prog="python -m benchmarks.registry_throughput",
+        description="Benchmark AarnaRegistry in the offline emulator.",
+    )
+    parser.add_argument("--projects", type=int, default=10_000)
+    parser.add_argument("--submitters", type=int, default=50)
+    parser.add_argument(
+        "--review-batch",
+        type=int,
+        default=8,
+        help=f"decisions per review_projects_batch call (at most {MAX_REVIEW_BATCH})",
+    )
+    parser.add_argument("--reject-ratio", type=float, default=0.2)
+    parser.add_argument(
+        "--issue-batch",
+        type=int,
+        default=0,
+        help=(
+            "issue through issue_credits_batch with this many ids per call"
+            f" (at most {MAX_ISSUE_BATCH})"
+        ),
+    )
+    parser.add_argument("--listings", type=int, default=2_000)
+    parser.add_argument("--churn", type=int, default=10_000)
+    parser.add_argument("--traders", type=int, default=100)
+    parser.add_argument("--seed", type=int, default=1)
+    parser.add_argument(
+        "--output", type=Path, help="write results as JSON to this file"
+    )
+    parser.add_argument(
+        "--baseline",
+        type=Path,
+        help="results JSON of an earlier run; fail on storage growth or slowdown",
+    )
+    parser.add_argument(
+        "--tolerance",
+        type=float,
+        default=0.25,
+        help="allowed relative growth of mean call time against --baseline",
+    )
+    return parser.parse_args(argv)
+
+
+if __name__ == "__main__":
+    logging.basicConfig(level=logging.INFO, format="%(asctime)s %(message)s")
+    args = parse_args(sys.argv[1:])
+    results = run(args)
+    report(results)
+    if args.output:
+        args.output.write_text(json.dumps(results, indent=2) + "\n")
+        logger.info(f"Wrote {args.output}")
+    if args.baseline:
+        regressions = compare(
+            json.loads(args.baseline.read_text()), results, args.tolerance
+        )
+        if regressions:
+            print("Regressions against the baseline:\n  " + "\n  ".join(regressions))
+            sys.exit(1)
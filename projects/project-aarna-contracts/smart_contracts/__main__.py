@@ -1,31 +1,81 @@
+import argparse
+import ast
+import contextlib
 import dataclasses
+import functools
+import hashlib
 import importlib
+import importlib.metadata
+import json
 import logging
+import os
+import shutil
 import subprocess
 import sys
-from collections.abc import Callable
+import tempfile
+import threading
+import time
+from collections.abc import Callable, Iterator
+from concurrent.futures import Future, ThreadPoolExecutor, as_completed
 from pathlib import Path
-from shutil import rmtree
 
-from algokit_utils.config import config
-from dotenv import load_dotenv
-
-# Set trace_all to True to capture all transactions, defaults to capturing traces only on failure
-# Learn more about using AlgoKit AVM Debugger to debug your TEAL source codes and inspect various kinds of
-# Algorand transactions in atomic groups -> https://github.com/algorandfoundation/algokit-avm-vscode-debugger
-config.configure(debug=True, trace_all=False)
-
-# Set up logging and load environment variables.
-logging.basicConfig(
-    level=logging.DEBUG, format="%(asctime)s %(levelname)-10s: %(message)s"
-)
+# Importing this module is kept cheap on purpose: algokit_utils, dotenv and the
+# per-contract deploy modules are only imported once an action needs them.
 logger = logging.getLogger(__name__)
-logger.info("Loading .env")
-load_dotenv()
 
 # Determine the root path based on this file's location.
 root_path = Path(__file__).parent
 
+# --------------------------- Phase Timings --------------------------- #
+
+phase_names = ["import", "discovery", "compile", "generate", "deploy"]
+phase_timings: dict[str, float] = {}
+_phase_lock = threading.Lock()
+
+
+@contextlib.contextmanager
+def timed_phase(name: str) -> Iterator[None]:
+    """Adds the wall time of the block to `phase_timings[name]` (thread-safe)."""
+    start = time.perf_counter()
+    try:
+        yield
+    finally:
+        elapsed = time.perf_counter() - start
+        with _phase_lock:
+            phase_timings[name] = phase_timings.get(name, 0.0) + elapsed
+
+
+def report_timings() -> None:
+    """Prints time per phase; parallel compile / generate times are summed."""
+    print("Phase timings:")
+    for name in phase_names:
+        print(f"  {name:<10} {phase_timings.get(name, 0.0):8.3f}s")
+
+
+# ----------------------- Environment Setup ----------------------- #
+
+
+def configure_logging() -> None:
+    logging.basicConfig(
+        level=logging.DEBUG, format="%(asctime)s %(levelname)-10s: %(message)s"
+    )
+
+
+def configure_deploy_environment() -> None:
+    """Loads algokit_utils and the .env files; only deploying needs either."""
+    with timed_phase("import"):
+        from algokit_utils.config import config
+        from dotenv import load_dotenv
+
+    # Set trace_all to True to capture all transactions, defaults to capturing traces only on failure
+    # Learn more about using AlgoKit AVM Debugger to debug your TEAL source codes and inspect various kinds of
+    # Algorand transactions in atomic groups -> https://github.com/algorandfoundation/algokit-avm-vscode-debugger
+    config.configure(debug=True, trace_all=False)
+
+    logger.info("Loading .env")
+    load_dotenv()
+
+
 # ----------------------- Contract Configuration ----------------------- #
 
 
@@ -33,7 +83,12 @@ root_path = Path(__file__).parent
 class SmartContract:
     path: Path
     name: str
-    deploy: Callable[[], None] | None = None
+
+    @functools.cached_property
+    def deploy(self) -> Callable[[], None] | None:
+        """The contract's deploy function, imported the first time it is needed."""
+        with timed_phase("import"):
+            return import_deploy_if_exists(self.path.parent)
 
 
 def import_contract(folder: Path) -> Path:
@@ -60,22 +115,179 @@ def has_contract_file(directory: Path) -> bool:
     return (directory / "contract.py").exists()
 
 
-# Use the current directory (root_path) as the base for contract folders and exclude
-# folders that start with '_' (internal helpers).
-contracts: list[SmartContract] = [
-    SmartContract(
-        path=import_contract(folder),
-        name=folder.name,
-        deploy=import_deploy_if_exists(folder),
+def discover_contracts(contract_name: str | None = None) -> list[SmartContract]:
+    """
+    Finds contract folders under root_path, excluding folders that start with '_'
+    (internal helpers). With a contract name only that folder is looked at.
+    """
+    if contract_name is not None:
+        folders = [root_path / contract_name]
+    else:
+        folders = sorted(root_path.iterdir())
+    return [
+        SmartContract(path=import_contract(folder), name=folder.name)
+        for folder in folders
+        if folder.is_dir()
+        and has_contract_file(folder)
+        and not folder.name.startswith("_")
+    ]
+
+# -------------------------- Build Cache -------------------------- #
+
+# Fingerprints of the last successful build per contract. Kept outside the
+# committed artifacts so a cache hit never dirties the tree.
+build_cache_dir = root_path.parent / ".algokit" / "build-cache"
+compile_flags = ["--output-source-map"]
+# Packages whose version changes what the compiler or client generator emits.
+toolchain_packages = ["puyapy", "algorand-python", "algokit-client-generator"]
+
+
+def _module_files(parts: list[str]) -> list[Path]:
+    """The file(s) of this package's module `parts`, e.g. ["smart_contracts", "x"]."""
+    if not parts or parts[0] != root_path.name:
+        return []
+    base = root_path.resolve().joinpath(*parts[1:])
+    return [c for c in (base.with_suffix(".py"), base / "__init__.py") if c.is_file()]
+
+
+def _local_imports(source_path: Path) -> set[Path]:
+    """
+    Finds the modules of this package that a source file imports, recursively.
+    Relative imports resolve against the importing file's package, and
+    `from pkg import name` also counts `pkg.name` when that is a module.
+    """
+    found: set[Path] = set()
+    pending = [source_path.resolve()]
+    while pending:
+        current = pending.pop()
+        package = list(current.parent.relative_to(root_path.resolve().parent).parts)
+        tree = ast.parse(current.read_bytes(), filename=str(current))
+        for node in ast.walk(tree):
+            if isinstance(node, ast.Import):
+                modules = [alias.name.split(".") for alias in node.names]
+            elif isinstance(node, ast.ImportFrom):
+                if node.level > len(package):
+                    continue
+                base = package[: len(package) - node.level + 1] if node.level else []
+                module = base + (node.module.split(".") if node.module else [])
+                modules = [module, *(module + [alias.name] for alias in node.names)]
+            else:
+                continue
+            for parts in modules:
+                for candidate in _module_files(parts):
+                    if candidate not in found:
+                        found.add(candidate)
+                        pending.append(candidate)
+    return found
+
+
+def _build_inputs(contract_path: Path) -> list[Path]:
+    """The contract source plus every local module it pulls in."""
+    return sorted({contract_path.resolve(), *_local_imports(contract_path.resolve())})
+
+
+def _toolchain_versions() -> dict[str, str]:
+    versions: dict[str, str] = {}
+    for package in toolchain_packages:
+        try:
+            versions[package] = importlib.metadata.version(package)
+        except importlib.metadata.PackageNotFoundError:
+            versions[package] = "missing"
+    # The algokit CLI usually lives outside this venv; asking it for its version
+    # costs a subprocess, so its resolved binary identity stands in for it.
+    algokit_bin = shutil.which("algokit")
+    if algokit_bin:
+        stat = Path(algokit_bin).resolve().stat()
+        versions["algokit"] = f"{Path(algokit_bin).resolve()}:{stat.st_mtime_ns}"
+    return versions
+
+
+def build_fingerprint(contract_path: Path) -> str:
+    """Hashes everything that determines a contract's build outputs."""
+    digest = hashlib.sha256()
+    settings = {
+        "toolchain": _toolchain_versions(),
+        "compile_flags": compile_flags,
+        "client_extension": deployment_extension,
+    }
+    digest.update(json.dumps(settings, sort_keys=True).encode())
+    for source in _build_inputs(contract_path):
+        digest.update(str(source.relative_to(root_path)).encode())
+        digest.update(hashlib.sha256(source.read_bytes()).digest())
+    return digest.hexdigest()
+
+
+def _cache_file(output_dir: Path) -> Path:
+    return build_cache_dir / f"{output_dir.name}.json"
+
+
+def _is_cached(output_dir: Path, fingerprint: str) -> bool:
+    """True when the last build had this fingerprint and its outputs are intact."""
+    try:
+        entry = json.loads(_cache_file(output_dir).read_text())
+    except (OSError, ValueError):
+        return False
+    return entry.get("fingerprint") == fingerprint and all(
+        (output_dir / name).is_file() for name in entry.get("files", [])
     )
-    for folder in root_path.iterdir()
-    if folder.is_dir() and has_contract_file(folder) and not folder.name.startswith("_")
-]
+
+
+def _write_cache(output_dir: Path, fingerprint: str) -> None:
+    build_cache_dir.mkdir(parents=True, exist_ok=True)
+    entry = {
+        "fingerprint": fingerprint,
+        "files": sorted(f.name for f in output_dir.iterdir() if f.is_file()),
+    }
+    tmp_file = _cache_file(output_dir).with_suffix(".tmp")
+    tmp_file.write_text(json.dumps(entry, indent=2))
+    os.replace(tmp_file, _cache_file(output_dir))
+
+
+def _publish(staging_dir: Path, output_dir: Path) -> None:
+    """
+    Moves freshly built files over the previous artifacts one atomic rename at a
+    time, then drops artifacts the new build no longer produces. Readers never
+    see an empty or half-written output directory.
+    """
+    output_dir.mkdir(parents=True, exist_ok=True)
+    produced = {f.name for f in staging_dir.iterdir() if f.is_file()}
+    for name in produced:
+        os.replace(staging_dir / name, output_dir / name)
+    for stale in output_dir.iterdir():
+        if stale.is_file() and stale.name not in produced:
+            stale.unlink()
+
 
 # -------------------------- Build Logic -------------------------- #
 
 deployment_extension = "py"
 
+# Serialises console output so lines from parallel builds never interleave.
+_output_lock = threading.Lock()
+
+
+def _echo(label: str, text: str) -> None:
+    with _output_lock:
+        for line in text.splitlines():
+            print(f"[{label}] {line}", flush=True)
+
+
+def _run_streamed(command: list[str], label: str) -> subprocess.CompletedProcess[str]:
+    """Runs a command, echoing each output line with a `label` prefix as it arrives."""
+    lines: list[str] = []
+    with subprocess.Popen(
+        command,
+        stdout=subprocess.PIPE,
+        stderr=subprocess.STDOUT,
+        text=True,
+        bufsize=1,
+    ) as process:
+        assert process.stdout is not None
+        for line in process.stdout:
+            lines.append(line)
+            _echo(label, line)
+    return subprocess.CompletedProcess(command, process.returncode, "".join(lines))
+
 
 def _get_output_path(output_dir: Path, deployment_extension: str) -> Path:
     """Constructs the output path for the generated client file."""
@@ -86,34 +298,53 @@ def _get_output_path(output_dir: Path, deployment_extension: str) -> Path:
     )
 
 
-def build(output_dir: Path, contract_path: Path) -> Path:
+def _build_result(output_dir: Path) -> Path:
+    """The app spec of a built contract, or its output directory if there is none."""
+    app_specs = sorted(output_dir.glob("*.arc56.json"))
+    return app_specs[-1] if app_specs else output_dir
+
+
+def build(output_dir: Path, contract_path: Path, force: bool = False) -> Path:
     """
     Builds the contract by exporting (compiling) its source and generating a client.
-    If the output directory already exists, it is cleared.
+    Skipped when the build fingerprint matches the last successful build, unless
+    `force` is set. Outputs are staged next to the output directory and moved in
+    atomically, so a failed build leaves the previous artifacts untouched.
     """
     output_dir = output_dir.resolve()
-    if output_dir.exists():
-        rmtree(output_dir)
-    output_dir.mkdir(exist_ok=True, parents=True)
+    fingerprint = build_fingerprint(contract_path)
+    if not force and _is_cached(output_dir, fingerprint):
+        logger.info(f"{contract_path} is unchanged, reusing {output_dir}")
+        return _build_result(output_dir)
+
+    output_dir.parent.mkdir(exist_ok=True, parents=True)
+    with tempfile.TemporaryDirectory(
+        dir=output_dir.parent, prefix=f".{output_dir.name}-"
+    ) as staging:
+        staging_dir = Path(staging)
+        _compile_and_generate(staging_dir, contract_path, output_dir.name)
+        _publish(staging_dir, output_dir)
+    _write_cache(output_dir, fingerprint)
+    return _build_result(output_dir)
+
+
+def _compile_and_generate(output_dir: Path, contract_path: Path, label: str) -> None:
+    """Compiles the contract into `output_dir` and generates its typed clients."""
     logger.info(f"Exporting {contract_path} to {output_dir}")
 
-    build_result = subprocess.run(
-        [
-            "algokit",
-            "--no-color",
-            "compile",
-            "python",
-            str(contract_path.resolve()),
-            f"--out-dir={output_dir}",
-            "--output-source-map",
-        ],
-        stdout=subprocess.PIPE,
-        stderr=subprocess.STDOUT,
-        text=True,
-    )
-
-    if build_result.stdout:
-        print(build_result.stdout)
+    with timed_phase("compile"):
+        build_result = _run_streamed(
+            [
+                "algokit",
+                "--no-color",
+                "compile",
+                "python",
+                str(contract_path.resolve()),
+                f"--out-dir={output_dir}",
+                *compile_flags,
+            ],
+            label,
+        )
 
     if build_result.returncode:
         raise Exception(f"Could not build contract:\n{build_result.stdout}")
@@ -123,31 +354,25 @@ def build(output_dir: Path, contract_path: Path) -> Path:
         file.name for file in output_dir.glob("*.arc56.json")
     ]
 
-    client_file: str | None = None
     if not app_spec_file_names:
         logger.warning(
             "No '*.arc56.json' file found (likely a logic signature being compiled). Skipping client generation."
         )
     else:
         for file_name in app_spec_file_names:
-            client_file = file_name
-            print(file_name)
-            generate_result = subprocess.run(
-                [
-                    "algokit",
-                    "generate",
-                    "client",
-                    str(output_dir),
-                    "--output",
-                    str(_get_output_path(output_dir, deployment_extension)),
-                ],
-                stdout=subprocess.PIPE,
-                stderr=subprocess.STDOUT,
-                text=True,
-            )
-
-            if generate_result.stdout:
-                print(generate_result.stdout)
+            _echo(label, file_name)
+            with timed_phase("generate"):
+                generate_result = _run_streamed(
+                    [
+                        "algokit",
+                        "generate",
+                        "client",
+                        str(output_dir),
+                        "--output",
+                        str(_get_output_path(output_dir, deployment_extension)),
+                    ],
+                    label,
+                )
 
             if generate_result.returncode:
                 if "No such command" in generate_result.stdout:
@@ -158,30 +383,184 @@ def build(output_dir: Path, contract_path: Path) -> Path:
                     raise Exception(
                         f"Could not generate typed client:\n{generate_result.stdout}"
                     )
-    if client_file:
-        return output_dir / client_file
-    return output_dir
+
+
+def _input_snapshot(contract_path: Path) -> list[tuple[str, int, int]]:
+    """Cheap change detector for watch mode: (path, mtime, size) of every input."""
+    return [
+        (str(source), source.stat().st_mtime_ns, source.stat().st_size)
+        for source in _build_inputs(contract_path)
+    ]
+
+
+def watch(
+    artifact_path: Path, contracts: list[SmartContract], interval: float = 1.0
+) -> None:
+    """Rebuilds each contract whenever one of its inputs changes, until interrupted."""
+    snapshots: dict[str, list[tuple[str, int, int]]] = {}
+    logger.info("Watching contracts for changes (Ctrl+C to stop)")
+    try:
+        while True:
+            for contract in contracts:
+                try:
+                    snapshot = _input_snapshot(contract.path)
+                except (OSError, SyntaxError) as e:
+                    logger.warning(f"Skipping {contract.name}: {e}")
+                    continue
+                if snapshots.get(contract.name) == snapshot:
+                    continue
+                snapshots[contract.name] = snapshot
+                logger.info(f"Building app at {contract.path}")
+                try:
+                    build(artifact_path / contract.name, contract.path)
+                except Exception as e:
+                    # Keep watching; the previous artifacts are still in place.
+                    logger.error(f"Build of {contract.name} failed: {e}")
+            time.sleep(interval)
+    except KeyboardInterrupt:
+        logger.info("Stopped watching")
 
 
 # --------------------------- Main Logic --------------------------- #
 
 
-def main(action: str, contract_name: str | None = None) -> None:
+def _timed_build(artifact_path: Path, contract: SmartContract) -> float:
+    logger.info(f"Building app at {contract.path}")
+    start = time.perf_counter()
+    build(artifact_path / contract.name, contract.path)
+    return time.perf_counter() - start
+
+
+def build_all(
+    artifact_path: Path,
+    contracts: list[SmartContract],
+    jobs: int = 1,
+    keep_going: bool = False,
+) -> dict[str, float]:
+    """
+    Builds contracts on a pool of `jobs` workers (the heavy lifting happens in
+    algokit subprocesses, so threads are enough). By default the first failure
+    cancels builds that have not started yet; with `keep_going` every contract
+    is attempted and all failures are reported together. Returns build seconds
+    per successfully built contract.
+    """
+    timings: dict[str, float] = {}
+    errors: dict[str, Exception] = {}
+    with ThreadPoolExecutor(max_workers=max(jobs, 1)) as pool:
+        futures: dict[Future[float], SmartContract] = {
+            pool.submit(_timed_build, artifact_path, contract): contract
+            for contract in contracts
+        }
+        for future in as_completed(futures):
+            contract = futures[future]
+            try:
+                timings[contract.name] = future.result()
+            except Exception as e:
+                errors[contract.name] = e
+                logger.error(f"Build of {contract.name} failed: {e}")
+                if not keep_going:
+                    pool.shutdown(wait=True, cancel_futures=True)
+                    break
+
+    _log_timings("Build", contracts, timings, set(errors))
+    if errors:
+        raise Exception(f"Could not build: {', '.join(sorted(errors))}")
+    return timings
+
+
+def _log_timings(
+    phase: str,
+    contracts: list[SmartContract],
+    timings: dict[str, float],
+    failed: set[str] | None = None,
+) -> None:
+    logger.info(f"{phase} summary:")
+    for contract in contracts:
+        elapsed = timings.get(contract.name)
+        if elapsed is not None:
+            status = f"{elapsed:.2f}s"
+        elif failed and contract.name in failed:
+            status = "failed"
+        else:
+            status = "skipped"
+        logger.info(f"  {contract.name:<30} {status}")
+
+
+def deploy_all(contracts: list[SmartContract]) -> None:
+    """Deploys contracts serially, in order; deployments may depend on each other."""
+    timings: dict[str, float] = {}
+    for contract in contracts:
+        if contract.deploy:
+            logger.info(f"Deploying {contract.name}")
+            start = time.perf_counter()
+            with timed_phase("deploy"):
+                contract.deploy()
+            timings[contract.name] = time.perf_counter() - start
+    if timings:
+        _log_timings("Deploy", [c for c in contracts if c.deploy], timings)
+
+
+def profile_all(
+    artifact_path: Path, contracts: list[SmartContract], update_baseline: bool = False
+) -> None:
+    """
+    Prints the static cost profile of each built contract and compares it with
+    the baseline committed next to the contract; any method that got more
+    expensive, or a contract without a baseline, fails the run.
+    `update_baseline` rewrites the baselines instead.
+    """
+    from smart_contracts import profiler
+
+    regressions: list[str] = []
+    missing: list[str] = []
+    for contract in contracts:
+        profiles = profiler.profile_artifacts(artifact_path / contract.name)
+        print(profiler.format_report(contract.name, profiles))
+        current = profiler.to_baseline(profiles)
+        baseline_file = contract.path.parent / "profile_baseline.json"
+        if update_baseline:
+            baseline_file.write_text(json.dumps(current, indent=2) + "\n")
+            logger.info(f"Wrote {baseline_file}")
+        elif baseline_file.exists():
+            baseline = json.loads(baseline_file.read_text())
+            regressions += [
+                f"{contract.name}.{regression}"
+                for regression in profiler.diff_baseline(baseline, current)
+            ]
+        else:
+            missing.append(contract.name)
+    if missing:
+        raise Exception(
+            f"No profile baseline for {', '.join(missing)}; build, then create one"
+            " with --update-baseline and commit it"
+        )
+    if regressions:
+        raise Exception(
+            "Cost regressions against the profile baseline:\n  "
+            + "\n  ".join(regressions)
+        )
+
+
+def main(
+    action: str,
+    contract_name: str | None = None,
+    jobs: int = 1,
+    keep_going: bool = False,
+    update_baseline: bool = False,
+) -> None:
     """Main entry point to build and/or deploy smart contracts."""
     artifact_path = root_path / "artifacts"
-    # Filter contracts based on an optional specific contract name.
-    filtered_contracts = [
-        contract
-        for contract in contracts
-        if contract_name is None or contract.name == contract_name
-    ]
+    # Only the requested contract is discovered when a name is given.
+    with timed_phase("discovery"):
+        filtered_contracts = discover_contracts(contract_name)
+    if contract_name is not None and not filtered_contracts:
+        logger.warning(f"No contract named {contract_name} in {root_path}")
 
     match action:
         case "build":
-            for contract in filtered_contracts:
-                logger.info(f"Building app at {contract.path}")
-                build(artifact_path / contract.name, contract.path)
+            build_all(artifact_path, filtered_contracts, jobs, keep_going)
         case "deploy":
+            configure_deploy_environment()
             for contract in filtered_contracts:
                 output_dir = artifact_path / contract.name
                 app_spec_file_name = next(
@@ -194,24 +573,69 @@ def main(action: str, contract_name: str | None = None) -> None:
                 )
                 if app_spec_file_name is None:
                     raise Exception("Could not deploy app, .arc56.json file not found")
-                if contract.deploy:
-                    logger.info(f"Deploying app {contract.name}")
-                    contract.deploy()
+            deploy_all(filtered_contracts)
         case "all":
-            for contract in filtered_contracts:
-                logger.info(f"Building app at {contract.path}")
-                build(artifact_path / contract.name, contract.path)
-                if contract.deploy:
-                    logger.info(f"Deploying {contract.name}")
-                    contract.deploy()
+            configure_deploy_environment()
+            build_all(artifact_path, filtered_contracts, jobs, keep_going)
+            deploy_all(filtered_contracts)
+        case "watch":
+            watch(artifact_path, filtered_contracts)
+        case "profile":
+            profile_all(artifact_path, filtered_contracts, update_baseline)
         case _:
             logger.error(f"Unknown action: {action}")
 
 
+def parse_args(argv: list[str]) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(
+        prog="python -m smart_contracts",
+        description="Build and/or deploy the smart contracts in this project.",
+    )
+    parser.add_argument(
+        "action",
+        nargs="?",
+        default="all",
+        choices=["build", "deploy", "all", "watch", "profile"],
+    )
+    parser.add_argument(
+        "contract_name", nargs="?", help="only act on this contract folder"
+    )
+    parser.add_argument(
+        "-j",
+        "--jobs",
+        type=int,
+        default=1,
+        help="number of contracts to compile and generate clients for in parallel",
+    )
+    parser.add_argument(
+        "--keep-going",
+        action="store_true",
+        help="build every contract and report all failures instead of stopping early",
+    )
+    parser.add_argument(
+        "--timings",
+        action="store_true",
+        help="report time spent on import, discovery, compile, generate and deploy",
+    )
+    parser.add_argument(
+        "--update-baseline",
+        action="store_true",
+        help="with profile: overwrite profile_baseline.json instead of diffing",
+    )
+    return parser.parse_args(argv)
+
+
 if __name__ == "__main__":
-    if len(sys.argv) > 2:
-        main(sys.argv[1], sys.argv[2])
-    elif len(sys.argv) > 1:
-        main(sys.argv[1])
-    else:
-        main("all")
+    args = parse_args(sys.argv[1:])
+    configure_logging()
+    try:
+        main(
+            args.action,
+            args.contract_name,
+            args.jobs,
+            args.keep_going,
+            args.update_baseline,
+        )
+    finally:
+        if args.timings:
+            report_timings()
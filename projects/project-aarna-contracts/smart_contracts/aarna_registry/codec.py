@@ -0,0 +1,106 @@
+"""
+Off-chain view of the AarnaRegistry box layout.
+
+Key builders and decoders for the boxes `contract.py` writes, for tooling that
+reads raw box contents from algod instead of calling the readonly getters.
+Kept free of algopy so it runs anywhere; the constants mirror the contract's.
+"""
+
+import hashlib
+import struct
+from typing import NamedTuple
+
+NO_ID = 2**64 - 1
+
+HEADER_PREFIX = b"h"
+META_PREFIX = b"m"
+LISTING_PREFIX = b"l"
+FREE_LISTING_PREFIX = b"f"
+CID_INDEX_PREFIX = b"c"
+
+# ProjectHeader: submitter (32) + status + credits, 48 bytes.
+_header = struct.Struct(">32sQQ")
+# ListingRecord: seller (32) + amount + price + active, 56 bytes.
+_listing = struct.Struct(">32sQQQ")
+# FreeLink: next free id + push sequence number, 16 bytes.
+_free_link = struct.Struct(">QQ")
+_uint64 = struct.Struct(">Q")
+_uint16 = struct.Struct(">H")
+
+PROJECT_STATUS_NAMES = {1: "pending", 2: "verified", 3: "rejected", 4: "issued"}
+
+
+class ProjectHeader(NamedTuple):
+    submitter: bytes
+    status: int
+    credits: int
+
+
+class ProjectMeta(NamedTuple):
+    name: str
+    location: str
+    ecosystem: str
+    cid: str
+
+
+class Listing(NamedTuple):
+    seller: bytes
+    amount: int
+    price: int
+    active: int
+
+
+class FreeLink(NamedTuple):
+    next: int
+    seq: int
+
+
+def _id_key(prefix: bytes, item_id: int) -> bytes:
+    return prefix + _uint64.pack(item_id)
+
+
+def header_key(project_id: int) -> bytes:
+    return _id_key(HEADER_PREFIX, project_id)
+
+
+def meta_key(project_id: int) -> bytes:
+    return _id_key(META_PREFIX, project_id)
+
+
+def listing_key(listing_id: int) -> bytes:
+    return _id_key(LISTING_PREFIX, listing_id)
+
+
+def free_listing_key(listing_id: int) -> bytes:
+    return _id_key(FREE_LISTING_PREFIX, listing_id)
+
+
+def cid_index_key(cid: str) -> bytes:
+    """Box mapping an evidence CID to its project id (value: uint64)."""
+    return CID_INDEX_PREFIX + hashlib.sha256(cid.encode()).digest()
+
+
+def decode_uint64(value: bytes) -> int:
+    return _uint64.unpack(value)[0]  # type: ignore[no-any-return]
+
+
+def decode_header(value: bytes) -> ProjectHeader:
+    return ProjectHeader(*_header.unpack(value))
+
+
+def decode_meta(value: bytes) -> ProjectMeta:
+    """ARC-4 (string, string, string, string): four offsets, then the strings."""
+    fields = []
+    for i in range(4):
+        (offset,) = _uint16.unpack_from(value, 2 * i)
+        (length,) = _uint16.unpack_from(value, offset)
+        fields.append(value[offset + 2 : offset + 2 + length].decode())
+    return ProjectMeta(*fields)
+
+
+def decode_listing(value: bytes) -> Listing:
+    return Listing(*_listing.unpack(value))
+
+
+def decode_free_link(value: bytes) -> FreeLink:
+    return FreeLink(*_free_link.unpack(value))
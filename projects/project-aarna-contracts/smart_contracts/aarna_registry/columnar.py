@@ -0,0 +1,320 @@
+"""
+Bulk columnar decoding of AarnaRegistry boxes.
+
+For analytics over whole-registry snapshots. Instead of decoding one struct at
+a time, box values of a kind are concatenated and their fixed-width fields
+lifted out as whole columns through memoryview casts and strided slices, with
+no int or str created per fixed-width field. Dynamic strings are copied into
+Arrow-style columns (one offsets array plus one data buffer per field), with
+the ARC-4 offset heads of all records read in one batch.
+
+Three tables come out, keyed by project / listing id:
+
+  projects       id, submitter, status, credits          (h<id> boxes)
+  project_meta   id, name, location, ecosystem, cid      (m<id> boxes)
+  listings       id, seller, amount, price, active       (l<id> boxes)
+
+Columns convert to Arrow without copying, and Parquet can be written straight
+from a box dump file (see `write_dump`) in fixed-size chunks, so snapshots
+larger than memory stream through. pyarrow is only imported for that export.
+"""
+
+import dataclasses
+import struct
+import sys
+from array import array
+from collections.abc import Iterable, Iterator
+from pathlib import Path
+from typing import Any, BinaryIO
+
+from smart_contracts.aarna_registry import codec
+
+_NEEDS_SWAP = sys.byteorder == "little"
+# Box dump entry: key length, value length, then the key and value bytes.
+_dump_entry = struct.Struct(">HI")
+_DUMP_READ_BYTES = 8 << 20
+
+HEADER_BYTES = 48
+LISTING_BYTES = 56
+_META_FIELDS = ("name", "location", "ecosystem", "cid")
+
+
+def _uint64s(buffer: bytes | bytearray | memoryview) -> array:
+    """Big-endian uint64s, contiguous, as a native array."""
+    column = array("Q")
+    column.frombytes(buffer)
+    if _NEEDS_SWAP:
+        column.byteswap()
+    return column
+
+
+def _word_column(words: memoryview, field: int, stride: int) -> array:
+    """Every `stride`-th uint64 starting at word `field` (one strided copy)."""
+    return _uint64s(words[field::stride].tobytes())
+
+
+@dataclasses.dataclass
+class FixedBinaryColumn:
+    """`width`-byte values packed back to back, e.g. 32-byte addresses."""
+
+    data: bytes | bytearray
+    width: int
+
+    def __len__(self) -> int:
+        return len(self.data) // self.width
+
+    def __getitem__(self, index: int) -> bytes:
+        start = index * self.width
+        return bytes(self.data[start : start + self.width])
+
+    def to_arrow(self) -> Any:
+        import pyarrow as pa
+
+        return pa.FixedSizeBinaryArray.from_buffers(
+            pa.binary(self.width), len(self), [None, pa.py_buffer(self.data)]
+        )
+
+
+@dataclasses.dataclass
+class StringColumn:
+    """UTF-8 strings as Arrow lays them out: int32 offsets plus one data buffer."""
+
+    offsets: array
+    data: bytearray
+
+    def __len__(self) -> int:
+        return len(self.offsets) - 1
+
+    def __getitem__(self, index: int) -> str:
+        return self.data[self.offsets[index] : self.offsets[index + 1]].decode()
+
+    def to_arrow(self) -> Any:
+        import pyarrow as pa
+
+        return pa.StringArray.from_buffers(
+            len(self), pa.py_buffer(self.offsets), pa.py_buffer(self.data)
+        )
+
+
+Column = array | FixedBinaryColumn | StringColumn
+
+
+def _to_arrow(column: Column) -> Any:
+    import pyarrow as pa
+
+    if isinstance(column, array):
+        return pa.Array.from_buffers(
+            pa.uint64(), len(column), [None, pa.py_buffer(column)]
+        )
+    return column.to_arrow()
+
+
+def to_arrow_table(columns: dict[str, Column]) -> Any:
+    import pyarrow as pa
+
+    return pa.table({name: _to_arrow(column) for name, column in columns.items()})
+
+
+def _prefix_column(words: memoryview, width: int, stride: int) -> FixedBinaryColumn:
+    """
+    The leading `width` bytes of every `stride`-word record, packed back to
+    back: one strided copy per uint64 of the prefix, none per record.
+    """
+    span = width // 8
+    data = bytearray(len(words) // stride * width)
+    packed = memoryview(data).cast("Q")
+    for word in range(span):
+        packed[word::span] = words[word::stride]
+    return FixedBinaryColumn(data, width)
+
+
+# ── Decoders over concatenated box values ──
+
+
+def decode_headers(ids: array, values: bytearray) -> dict[str, Column]:
+    """Columns of back-to-back 48-byte ProjectHeader values."""
+    assert len(values) == len(ids) * HEADER_BYTES, "truncated ProjectHeader values"
+    words = memoryview(values).cast("Q")
+    return {
+        "id": ids,
+        "submitter": _prefix_column(words, 32, HEADER_BYTES // 8),
+        "status": _word_column(words, 4, HEADER_BYTES // 8),
+        "credits": _word_column(words, 5, HEADER_BYTES // 8),
+    }
+
+
+def decode_listings(ids: array, values: bytearray) -> dict[str, Column]:
+    """Columns of back-to-back 56-byte ListingRecord values."""
+    assert len(values) == len(ids) * LISTING_BYTES, "truncated ListingRecord values"
+    words = memoryview(values).cast("Q")
+    return {
+        "id": ids,
+        "seller": _prefix_column(words, 32, LISTING_BYTES // 8),
+        "amount": _word_column(words, 4, LISTING_BYTES // 8),
+        "price": _word_column(words, 5, LISTING_BYTES // 8),
+        "active": _word_column(words, 6, LISTING_BYTES // 8),
+    }
+
+
+def decode_meta(ids: array, values: bytearray, starts: array) -> dict[str, Column]:
+    """
+    Columns of back-to-back ProjectMeta values; `starts` holds the offset of
+    each value in `values`. The four uint16 offsets at the head of every
+    record are gathered and byte-swapped as one array first.
+    """
+    view = memoryview(values)
+    heads = array("H")
+    heads.frombytes(b"".join(view[start : start + 8] for start in starts))
+    if _NEEDS_SWAP:
+        heads.byteswap()
+    columns: dict[str, Column] = {"id": ids}
+    for field, name in enumerate(_META_FIELDS):
+        offsets, data = array("i", [0]), bytearray()
+        for record, start in enumerate(starts):
+            position = start + heads[4 * record + field]
+            length = (view[position] << 8) | view[position + 1]
+            data += view[position + 2 : position + 2 + length]
+            offsets.append(len(data))
+        columns[name] = StringColumn(offsets, data)
+    return columns
+
+
+# ── Accumulating boxes into tables ──
+
+
+class _Batch:
+    """Raw id keys and values of one box kind, waiting to be decoded."""
+
+    def __init__(self) -> None:
+        self.ids = bytearray()
+        self.values = bytearray()
+        self.starts = array("Q")
+
+    def __len__(self) -> int:
+        return len(self.starts)
+
+    def add(self, key: memoryview | bytes, value: memoryview | bytes) -> None:
+        self.ids += key[1:9]
+        self.starts.append(len(self.values))
+        self.values += value
+
+
+class SnapshotDecoder:
+    """Feed (key, value) boxes with `add`; `tables` decodes what was fed."""
+
+    def __init__(self) -> None:
+        self._batches = {
+            codec.HEADER_PREFIX[0]: _Batch(),
+            codec.META_PREFIX[0]: _Batch(),
+            codec.LISTING_PREFIX[0]: _Batch(),
+        }
+
+    def __len__(self) -> int:
+        return sum(map(len, self._batches.values()))
+
+    def add(self, key: memoryview | bytes, value: memoryview | bytes) -> None:
+        # Other box kinds (queues, book, indexes) are not exported.
+        batch = self._batches.get(key[0])
+        if batch is not None and len(key) == 9:
+            batch.add(key, value)
+
+    def tables(self) -> dict[str, dict[str, Column]]:
+        headers = self._batches[codec.HEADER_PREFIX[0]]
+        meta = self._batches[codec.META_PREFIX[0]]
+        listings = self._batches[codec.LISTING_PREFIX[0]]
+        return {
+            "projects": decode_headers(_uint64s(headers.ids), headers.values),
+            "project_meta": decode_meta(_uint64s(meta.ids), meta.values, meta.starts),
+            "listings": decode_listings(_uint64s(listings.ids), listings.values),
+        }
+
+
+def decode_boxes(boxes: Iterable[tuple[bytes, bytes]]) -> dict[str, dict[str, Column]]:
+    """Decodes an in-memory snapshot, e.g. `RecordedAlgod(...).boxes.items()`."""
+    decoder = SnapshotDecoder()
+    for key, value in boxes:
+        decoder.add(key, value)
+    return decoder.tables()
+
+
+# ── Dump files ──
+
+
+def write_dump(boxes: Iterable[tuple[bytes, bytes]], output: BinaryIO) -> int:
+    """Writes boxes as length-prefixed entries; returns the number written."""
+    count = 0
+    for key, value in boxes:
+        output.write(_dump_entry.pack(len(key), len(value)))
+        output.write(key)
+        output.write(value)
+        count += 1
+    return count
+
+
+def iter_dump(source: BinaryIO) -> Iterator[tuple[memoryview, memoryview]]:
+    """
+    Boxes of a dump file as views into the current read buffer, so entries
+    are not copied; the file is read `_DUMP_READ_BYTES` at a time.
+    """
+    buffer = bytearray()
+    while chunk := source.read(_DUMP_READ_BYTES):
+        buffer += chunk
+        view = memoryview(buffer)
+        position = 0
+        while position + _dump_entry.size <= len(view):
+            key_len, value_len = _dump_entry.unpack_from(view, position)
+            key_start = position + _dump_entry.size
+            end = key_start + key_len + value_len
+            if end > len(view):
+                break
+            yield view[key_start : key_start + key_len], view[key_start + key_len : end]
+            position = end
+        # Views handed out may still be alive, so start a new buffer with the
+        # partial entry instead of resizing this one.
+        buffer = bytearray(view[position:])
+    assert not buffer, "dump ends in a truncated entry"
+
+
+def iter_dump_tables(
+    source: BinaryIO, chunk_records: int = 100_000
+) -> Iterator[dict[str, dict[str, Column]]]:
+    """Decoded tables for every `chunk_records` boxes of a dump file."""
+    decoder = SnapshotDecoder()
+    for key, value in iter_dump(source):
+        decoder.add(key, value)
+        if len(decoder) >= chunk_records:
+            yield decoder.tables()
+            decoder = SnapshotDecoder()
+    if len(decoder):
+        yield decoder.tables()
+
+
+def dump_to_parquet(
+    dump_path: Path, output_dir: Path, chunk_records: int = 100_000
+) -> dict[str, int]:
+    """
+    Streams a dump file into `<table>.parquet` files, one row group per chunk,
+    so memory stays bounded by `chunk_records`. Returns rows per table.
+    """
+    import pyarrow.parquet as pq
+
+    output_dir.mkdir(parents=True, exist_ok=True)
+    writers: dict[str, Any] = {}
+    rows: dict[str, int] = {}
+    try:
+        with dump_path.open("rb") as source:
+            for tables in iter_dump_tables(source, chunk_records):
+                for name, columns in tables.items():
+                    if not len(columns["id"]):
+                        continue
+                    table = to_arrow_table(columns)
+                    if name not in writers:
+                        writers[name] = pq.ParquetWriter(
+                            output_dir / f"{name}.parquet", table.schema
+                        )
+                    writers[name].write_table(table)
+                    rows[name] = rows.get(name, 0) + table.num_rows
+    finally:
+        for writer in writers.values():
+            writer.close()
+    return rows
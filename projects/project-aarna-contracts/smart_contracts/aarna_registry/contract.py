@@ -4,20 +4,162 @@ AarnaRegistry — Box-storage version
 Lifecycle: SUBMIT → REVIEW → VERIFY / REJECT → ISSUE → TRADE
 
 Status codes: 1=pending  2=verified  3=rejected  4=issued
+
+Storage layout
+--------------
+Each project is split across two boxes:
+  h<id>  ProjectHeader — fixed 48 bytes (submitter, status, credits), the
+         only box touched by review and issuance, updated in place.
+  m<id>  ProjectMeta   — name / location / ecosystem / cid, written once.
+
+Pending and verified-but-unissued projects are also threaded onto two
+doubly-linked work queues (q<id> link boxes), so validators can page
+through their queue without scanning the registry.
+
+Active listings form a price-ordered order book: o<price> PriceLevel boxes
+are chained in ascending price from `best_price`, and each level keeps its
+listings in FIFO order through k<id> link boxes. A link box also records
+the listing's slot in its seller's index, so closing it never scans.
+
+Listing boxes only exist while a listing is open. Once it is bought out or
+cancelled its box is deleted and the id goes onto a free list (f<id>) to be
+handed out again by the next list_for_sale. Each f<id> box also carries the
+sequence number of the push that freed it, so off-chain mirrors can tell a
+re-freed id from one that never left the list.
+
+A seller pays LISTING_DEPOSIT into the app with each listing, enough for every
+box it can add, and gets all of it back but the f<id> box's share when the
+listing is bought out or cancelled. A listing that reuses a freed id inherits
+that share and is charged only the difference.
+
+Per-address indexes hold packed uint64 ids in pages of 128: s<address><page>
+lists every project a submitter has filed (append-only), t<address><page> a
+seller's open listings; s<address> / t<address> hold the id counts.
+
+c<sha256(cid)> maps an evidence bundle's CID to the project that filed it,
+so a resubmitted bundle is caught with one box read.
 """
 
 from algopy import (
     ARC4Contract,
+    Account,
     Asset,
     BoxMap,
+    Bytes,
     Global,
+    TransactionType,
     Txn,
     UInt64,
     arc4,
+    gtxn,
     itxn,
+    op,
     subroutine,
+    urange,
 )
 
+# ── Project header layout ───────────────────────────────────────────────────
+# Byte offsets into the fixed-size ProjectHeader box, for in-place updates.
+HEADER_KEY_PREFIX = b"h"
+HEADER_STATUS_OFFSET = 32
+HEADER_CREDITS_OFFSET = 40
+# ProjectRecord encodes to its ProjectMeta plus this many bytes
+# (submitter + status + credits, less the meta's own head).
+RECORD_EXTRA_BYTES = 48
+
+# ── Review queues ───────────────────────────────────────────────────────────
+# Sentinel for "no id" in queue links and cursors.
+NO_ID = 2**64 - 1
+LINK_KEY_PREFIX = b"q"
+LINK_PREV_OFFSET = 0
+LINK_NEXT_OFFSET = 8
+# Most uint64 ids that fit in one ABI return: (1020 - 2-byte length) // 8.
+MAX_ID_PAGE = 127
+
+# ── Log budget ──────────────────────────────────────────────────────────────
+# A transaction logs at most 32 times and 1024 bytes in all; ARC-28 events
+# and the ABI return share that budget, so batch methods are capped by it.
+MAX_LOGS = 32
+MAX_LOG_BYTES = 1024
+
+# ── Marketplace sweep ───────────────────────────────────────────────────────
+# A sweep settles in one inner group: one payment per filled listing, the
+# token transfer to the buyer and the refund of the unspent payment, and an
+# inner group holds at most 16 txns. Its logs, 68 B Bought per fill plus a
+# 24 B return, stay under MAX_LOG_BYTES at this cap (976 B).
+MAX_SWEEP_FILLS = 14
+
+# ── Batch issuance ──────────────────────────────────────────────────────────
+# Each issued id logs a 52 B CreditsIssued event next to a 6 + 8n byte return,
+# so 16 ids (966 B) is the most that fits MAX_LOG_BYTES; 16 is also the most
+# transfers one inner group holds, so a batch settles in a single group.
+MAX_ISSUE_BATCH = 16
+
+# ── Order book ──────────────────────────────────────────────────────────────
+# Price 0 is never listed, so it doubles as "no level" in the level chain.
+NO_PRICE = 0
+LEVEL_KEY_PREFIX = b"o"
+LEVEL_PREV_OFFSET = 0
+LEVEL_NEXT_OFFSET = 8
+LISTING_LINK_KEY_PREFIX = b"k"
+# ListingLink shares QueueLink's prev / next offsets; slot follows them.
+LINK_SLOT_OFFSET = 16
+# Most 24-byte Offer / DepthLevel entries per ABI return: (1020 - 2) // 24.
+MAX_BOOK_PAGE = 42
+
+# ── Listing storage ─────────────────────────────────────────────────────────
+# ListingRecord is fully static: seller (32) + amount + price + active.
+LISTING_RECORD_BYTES = 56
+# Box MBR: 2500 µAlgo per box plus 400 per byte of key and value.
+BOX_FLAT_MBR = 2_500
+BOX_BYTE_MBR = 400
+# Key + value bytes of each box a listing can create, counting each as new:
+# l<id> (9 + 56), k<id> (9 + 24), o<price> (9 + 48), the seller's t<address>
+# count (33 + 8) and a fresh t<address><page> (41 + 8). Levels, seller counts
+# and index pages are never more numerous than open listings, so open
+# deposits always cover them.
+LISTING_DEPOSIT = 5 * BOX_FLAT_MBR + BOX_BYTE_MBR * (65 + 33 + 57 + 41 + 49)
+# f<id> (9 + 16) outlives the listing, so its share stays behind on close.
+FREE_LINK_MBR = BOX_FLAT_MBR + BOX_BYTE_MBR * 25
+LISTING_REFUND = LISTING_DEPOSIT - FREE_LINK_MBR
+
+# ── Per-address indexes ─────────────────────────────────────────────────────
+# A uint64 id count per address (s<address>), with the ids themselves packed
+# big-endian into fixed-size pages (s<address><page>). A page fills exactly
+# one 1 KiB box reference, so appends and removals cost the same at any size.
+SUBMITTER_INDEX_PREFIX = b"s"
+SELLER_INDEX_PREFIX = b"t"
+INDEX_PAGE_IDS = 128
+
+# ── Evidence index ──────────────────────────────────────────────────────────
+# Keyed by sha256 of the CID's UTF-8 bytes: a fixed 33-byte key whatever the
+# CID length or version.
+CID_INDEX_PREFIX = b"c"
+
+# ── Read paging limits ──────────────────────────────────────────────────────
+# ABI return values are logged behind a 4-byte prefix and a log entry is
+# capped at 1024 bytes, so a page never encodes to more than this.
+MAX_RETURN_BYTES = 1020
+# Opcode budget held back so the last record can still be encoded and returned.
+PAGE_BUDGET_RESERVE = 500
+# Encoded size of a page before any record: next_id (8) + items offset (2) + length (2).
+PAGE_HEADER_BYTES = 12
+# Largest encoded ProjectMeta that still fits a page on its own, so a page always
+# holds at least one record and the cursor of get_projects_page always moves.
+MAX_META_BYTES = MAX_RETURN_BYTES - PAGE_HEADER_BYTES - RECORD_EXTRA_BYTES - 2
+
+# ── Batch review ────────────────────────────────────────────────────────────
+# Decisions carry the target status: 2=verify  3=reject
+# Per-id results: 0=applied  1=unknown id  2=not pending  3=invalid decision
+REVIEW_APPLIED = 0
+REVIEW_UNKNOWN_ID = 1
+REVIEW_NOT_PENDING = 2
+REVIEW_INVALID = 3
+# One event per applied decision, plus the ABI return, must fit MAX_LOGS.
+# The events (20 B approved or rejected) and the 6 + n byte return stay
+# far inside MAX_LOG_BYTES at this size.
+MAX_REVIEW_BATCH = MAX_LOGS - 1
+
 
 # ── ABI Structs ────────────────────────────────────────────────────────────
 class ProjectRecord(arc4.Struct):
@@ -30,6 +172,19 @@ class ProjectRecord(arc4.Struct):
     credits: arc4.UInt64
 
 
+class ProjectHeader(arc4.Struct):
+    submitter: arc4.Address
+    status: arc4.UInt64
+    credits: arc4.UInt64
+
+
+class ProjectMeta(arc4.Struct):
+    name: arc4.String
+    location: arc4.String
+    ecosystem: arc4.String
+    cid: arc4.String
+
+
 class ListingRecord(arc4.Struct):
     seller: arc4.Address
     amount: arc4.UInt64
@@ -37,6 +192,212 @@ class ListingRecord(arc4.Struct):
     active: arc4.UInt64
 
 
+class QueueLink(arc4.Struct):
+    prev: arc4.UInt64
+    next: arc4.UInt64
+
+
+class FreeLink(arc4.Struct):
+    next: arc4.UInt64
+    seq: arc4.UInt64
+
+
+class ListingLink(arc4.Struct):
+    """A listing's place in its price level's queue and in its seller's index."""
+
+    prev: arc4.UInt64
+    next: arc4.UInt64
+    slot: arc4.UInt64
+
+
+class ReviewDecision(arc4.Struct):
+    project_id: arc4.UInt64
+    decision: arc4.UInt8
+    credits: arc4.UInt64
+
+
+class PriceLevel(arc4.Struct):
+    prev_price: arc4.UInt64
+    next_price: arc4.UInt64
+    head: arc4.UInt64
+    tail: arc4.UInt64
+    depth: arc4.UInt64
+    listings: arc4.UInt64
+
+
+class Offer(arc4.Struct):
+    listing_id: arc4.UInt64
+    amount: arc4.UInt64
+    price: arc4.UInt64
+
+
+class DepthLevel(arc4.Struct):
+    price: arc4.UInt64
+    depth: arc4.UInt64
+    listings: arc4.UInt64
+
+
+class RegistryStats(arc4.Struct):
+    project_count: arc4.UInt64
+    pending: arc4.UInt64
+    verified: arc4.UInt64
+    rejected: arc4.UInt64
+    issued: arc4.UInt64
+    total_credits_issued: arc4.UInt64
+    open_listings: arc4.UInt64
+    escrowed_tokens: arc4.UInt64
+    tokens_traded: arc4.UInt64
+    volume_traded: arc4.UInt64
+
+
+class SweepResult(arc4.Struct):
+    filled: arc4.UInt64
+    spent: arc4.UInt64
+
+
+class ProjectPage(arc4.Struct):
+    next_id: arc4.UInt64
+    items: arc4.DynamicArray[ProjectRecord]
+
+
+class ListingPage(arc4.Struct):
+    next_id: arc4.UInt64
+    items: arc4.DynamicArray[ListingRecord]
+
+
+# ── ARC-28 events ───────────────────────────────────────────────────────────
+class ProjectSubmitted(arc4.Struct):
+    project_id: arc4.UInt64
+    submitter: arc4.Address
+
+
+class ProjectApproved(arc4.Struct):
+    project_id: arc4.UInt64
+    credits: arc4.UInt64
+
+
+class ProjectRejected(arc4.Struct):
+    project_id: arc4.UInt64
+    # rejected_count after this one, so a mirror can tell it missed an event
+    rejected: arc4.UInt64
+
+
+class CreditsIssued(arc4.Struct):
+    project_id: arc4.UInt64
+    receiver: arc4.Address
+    amount: arc4.UInt64
+
+
+class Listed(arc4.Struct):
+    listing_id: arc4.UInt64
+    seller: arc4.Address
+    amount: arc4.UInt64
+    price: arc4.UInt64
+
+
+class Bought(arc4.Struct):
+    listing_id: arc4.UInt64
+    buyer: arc4.Address
+    quantity: arc4.UInt64
+    cost: arc4.UInt64
+    remaining: arc4.UInt64
+
+
+class Cancelled(arc4.Struct):
+    listing_id: arc4.UInt64
+    seller: arc4.Address
+    amount: arc4.UInt64
+
+
+# ── Box key helpers ─────────────────────────────────────────────────────────
+@subroutine
+def _header_key(pid: UInt64) -> Bytes:
+    return Bytes(HEADER_KEY_PREFIX) + op.itob(pid)
+
+
+@subroutine
+def _link_key(pid: UInt64) -> Bytes:
+    return Bytes(LINK_KEY_PREFIX) + op.itob(pid)
+
+
+@subroutine
+def _submitter_key(addr: Account) -> Bytes:
+    return Bytes(SUBMITTER_INDEX_PREFIX) + addr.bytes
+
+
+@subroutine
+def _seller_key(addr: Account) -> Bytes:
+    return Bytes(SELLER_INDEX_PREFIX) + addr.bytes
+
+
+@subroutine
+def _index_length(key: Bytes) -> UInt64:
+    count, exists = op.Box.get(key)
+    if not exists:
+        return UInt64(0)
+    return op.btoi(count)
+
+
+@subroutine
+def _index_page_key(key: Bytes, slot: UInt64) -> Bytes:
+    return key + op.itob(slot // INDEX_PAGE_IDS)
+
+
+@subroutine
+def _index_append(key: Bytes, item: UInt64) -> UInt64:
+    """
+    Appends one id to a paged index, starting a new page when the last one is
+    full. Returns the slot it went into.
+    """
+    slot = _index_length(key)
+    op.Box.put(key, op.itob(slot + 1))
+    page_key = _index_page_key(key, slot)
+    offset = slot % INDEX_PAGE_IDS * 8
+    if offset == 0:
+        op.Box.put(page_key, op.itob(item))
+    else:
+        op.Box.resize(page_key, offset + 8)
+        op.Box.replace(page_key, offset, op.itob(item))
+    return slot
+
+
+@subroutine
+def _index_remove(key: Bytes, slot: UInt64) -> UInt64:
+    """
+    Swap-removes the id in `slot` from a paged index, deleting pages (and the
+    count) once empty. Returns the id moved into `slot` from the end, or NO_ID.
+    """
+    last = _index_length(key) - 1
+    last_page = _index_page_key(key, last)
+    last_offset = last % INDEX_PAGE_IDS * 8
+    moved = UInt64(NO_ID)
+    if slot != last:
+        moved_id = op.Box.extract(last_page, last_offset, 8)
+        op.Box.replace(
+            _index_page_key(key, slot), slot % INDEX_PAGE_IDS * 8, moved_id
+        )
+        moved = op.btoi(moved_id)
+    if last_offset == 0:
+        assert op.Box.delete(last_page)
+    else:
+        op.Box.resize(last_page, last_offset)
+    if last == 0:
+        assert op.Box.delete(key)
+    else:
+        op.Box.put(key, op.itob(last))
+    return moved
+
+
+@subroutine
+def _level_key(price: UInt64) -> Bytes:
+    return Bytes(LEVEL_KEY_PREFIX) + op.itob(price)
+
+
+@subroutine
+def _listing_link_key(lid: UInt64) -> Bytes:
+    return Bytes(LISTING_LINK_KEY_PREFIX) + op.itob(lid)
+
+
 # ── Contract ────────────────────────────────────────────────────────────────
 class AarnaRegistry(ARC4Contract):
     def __init__(self) -> None:
@@ -52,9 +413,47 @@ class AarnaRegistry(ARC4Contract):
         self.total_credits_issued: UInt64 = UInt64(0)
         self.listing_count: UInt64 = UInt64(0)
 
+        # ── Review queues (head / tail ids, NO_ID when empty) ──
+        self.pending_head: UInt64 = UInt64(NO_ID)
+        self.pending_tail: UInt64 = UInt64(NO_ID)
+        self.verified_head: UInt64 = UInt64(NO_ID)
+        self.verified_tail: UInt64 = UInt64(NO_ID)
+
+        # ── Order book (lowest listed price, NO_PRICE when empty) ──
+        self.best_price: UInt64 = UInt64(NO_PRICE)
+
+        # ── Listing recycling (free-list head, NO_ID when empty) ──
+        self.free_listing_head: UInt64 = UInt64(NO_ID)
+        self.free_listing_pushes: UInt64 = UInt64(0)
+        self.open_listing_count: UInt64 = UInt64(0)
+
+        # ── Aggregate stats (kept in step by every lifecycle / market call) ──
+        self.pending_count: UInt64 = UInt64(0)
+        self.verified_count: UInt64 = UInt64(0)
+        self.rejected_count: UInt64 = UInt64(0)
+        self.issued_count: UInt64 = UInt64(0)
+        self.escrowed_tokens: UInt64 = UInt64(0)
+        self.tokens_traded: UInt64 = UInt64(0)
+        self.volume_traded: UInt64 = UInt64(0)
+
         # ── Box storage ──
-        self.projects = BoxMap(UInt64, ProjectRecord, key_prefix=b"p")
+        self.project_headers = BoxMap(
+            UInt64, ProjectHeader, key_prefix=HEADER_KEY_PREFIX
+        )
+        self.project_meta = BoxMap(UInt64, ProjectMeta, key_prefix=b"m")
+        self.queue_links = BoxMap(UInt64, QueueLink, key_prefix=LINK_KEY_PREFIX)
         self.listings = BoxMap(UInt64, ListingRecord, key_prefix=b"l")
+        self.free_listings = BoxMap(UInt64, FreeLink, key_prefix=b"f")
+        self.price_levels = BoxMap(UInt64, PriceLevel, key_prefix=LEVEL_KEY_PREFIX)
+        self.listing_links = BoxMap(
+            UInt64, ListingLink, key_prefix=LISTING_LINK_KEY_PREFIX
+        )
+        # Id counts; the index pages are addressed directly (_index_page_key).
+        self.submitter_index = BoxMap(
+            Account, UInt64, key_prefix=SUBMITTER_INDEX_PREFIX
+        )
+        self.seller_index = BoxMap(Account, UInt64, key_prefix=SELLER_INDEX_PREFIX)
+        self.cid_index = BoxMap(Bytes, UInt64, key_prefix=CID_INDEX_PREFIX)
 
     # ══════════════════════════════════════════════════════════════════════
     # Internal helpers
@@ -67,6 +466,414 @@ class AarnaRegistry(ARC4Contract):
     def _only_validator(self) -> None:
         assert Txn.sender == self.validator.native, "unauthorized: validator only"
 
+    @subroutine
+    def _page_end(self, start: UInt64, count: UInt64, total: UInt64) -> UInt64:
+        """Exclusive end id of a page, clamped to `total` without overflowing."""
+        if start >= total:
+            return start
+        if count < total - start:
+            return start + count
+        return total
+
+    @subroutine
+    def _status(self, pid: UInt64) -> UInt64:
+        """Reads a project's status straight from its header box."""
+        return op.btoi(op.Box.extract(_header_key(pid), HEADER_STATUS_OFFSET, 8))
+
+    @subroutine
+    def _set_status(self, pid: UInt64, status: UInt64) -> None:
+        op.Box.replace(_header_key(pid), HEADER_STATUS_OFFSET, op.itob(status))
+
+    @subroutine
+    def _set_status_and_credits(
+        self, pid: UInt64, status: UInt64, credits: UInt64
+    ) -> None:
+        # status and credits are adjacent, so one 16-byte write covers both
+        op.Box.replace(
+            _header_key(pid),
+            HEADER_STATUS_OFFSET,
+            op.itob(status) + op.itob(credits),
+        )
+
+    # ── Status transitions: header, queue, counters and event move together ──
+    @subroutine
+    def _mark_verified(self, pid: UInt64, credits: UInt64) -> None:
+        self._set_status_and_credits(pid, UInt64(2), credits)
+        self._queue_move(pid)
+        self.pending_count -= 1
+        self.verified_count += 1
+        arc4.emit(
+            ProjectApproved(project_id=arc4.UInt64(pid), credits=arc4.UInt64(credits))
+        )
+
+    @subroutine
+    def _mark_rejected(self, pid: UInt64) -> None:
+        self._set_status(pid, UInt64(3))
+        self._queue_drop(UInt64(1), pid)
+        self.pending_count -= 1
+        self.rejected_count += 1
+        arc4.emit(
+            ProjectRejected(
+                project_id=arc4.UInt64(pid), rejected=arc4.UInt64(self.rejected_count)
+            )
+        )
+
+    @subroutine
+    def _mark_issued(self, pid: UInt64, receiver: arc4.Address, amount: UInt64) -> None:
+        self._set_status(pid, UInt64(4))
+        self._queue_drop(UInt64(2), pid)
+        self.verified_count -= 1
+        self.issued_count += 1
+        arc4.emit(
+            CreditsIssued(
+                project_id=arc4.UInt64(pid),
+                receiver=receiver.copy(),
+                amount=arc4.UInt64(amount),
+            )
+        )
+
+    @subroutine
+    def _load_project(self, pid: UInt64) -> ProjectRecord:
+        """Reassembles the full ABI record from the header and metadata boxes."""
+        header = self.project_headers[pid].copy()
+        meta = self.project_meta[pid].copy()
+        return ProjectRecord(
+            submitter=header.submitter.copy(),
+            name=meta.name,
+            location=meta.location,
+            ecosystem=meta.ecosystem,
+            cid=meta.cid,
+            status=header.status,
+            credits=header.credits,
+        )
+
+    # ── Review queues: status 1 = pending, status 2 = verified ──
+    @subroutine
+    def _queue_ends(self, status: UInt64) -> tuple[UInt64, UInt64]:
+        if status == 1:
+            return self.pending_head, self.pending_tail
+        return self.verified_head, self.verified_tail
+
+    @subroutine
+    def _set_queue_ends(self, status: UInt64, head: UInt64, tail: UInt64) -> None:
+        if status == 1:
+            self.pending_head = head
+            self.pending_tail = tail
+        else:
+            self.verified_head = head
+            self.verified_tail = tail
+
+    @subroutine
+    def _queue_push(self, status: UInt64, pid: UInt64) -> None:
+        """Appends `pid` to the tail of a queue, (re)writing its link box."""
+        head, tail = self._queue_ends(status)
+        self.queue_links[pid] = QueueLink(
+            prev=arc4.UInt64(tail), next=arc4.UInt64(NO_ID)
+        )
+        if tail == NO_ID:
+            head = pid
+        else:
+            op.Box.replace(_link_key(tail), LINK_NEXT_OFFSET, op.itob(pid))
+        self._set_queue_ends(status, head, pid)
+
+    @subroutine
+    def _queue_remove(self, status: UInt64, pid: UInt64) -> None:
+        """Unlinks `pid` from a queue in O(1); its own link box is left as is."""
+        link = self.queue_links[pid].copy()
+        prev = link.prev.native
+        nxt = link.next.native
+        head, tail = self._queue_ends(status)
+        if prev == NO_ID:
+            head = nxt
+        else:
+            op.Box.replace(_link_key(prev), LINK_NEXT_OFFSET, op.itob(nxt))
+        if nxt == NO_ID:
+            tail = prev
+        else:
+            op.Box.replace(_link_key(nxt), LINK_PREV_OFFSET, op.itob(prev))
+        self._set_queue_ends(status, head, tail)
+
+    @subroutine
+    def _queue_move(self, pid: UInt64) -> None:
+        """Pending → verified."""
+        self._queue_remove(UInt64(1), pid)
+        self._queue_push(UInt64(2), pid)
+
+    @subroutine
+    def _queue_drop(self, status: UInt64, pid: UInt64) -> None:
+        """Removes `pid` from its last queue and frees the link box."""
+        self._queue_remove(status, pid)
+        del self.queue_links[pid]
+
+    @subroutine
+    def _queue_page(
+        self, status: UInt64, after: UInt64, count: UInt64
+    ) -> arc4.DynamicArray[arc4.UInt64]:
+        """
+        Up to `count` ids following `after` in a queue. A cursor of NO_ID, or
+        one that has since left the queue, restarts from the head.
+        """
+        head, _tail = self._queue_ends(status)
+        pid = head
+        if after < self.project_count and self._status(after) == status:
+            pid = self.queue_links[after].next.native
+        if count > MAX_ID_PAGE:
+            count = UInt64(MAX_ID_PAGE)
+        ids = arc4.DynamicArray[arc4.UInt64]()
+        while pid != NO_ID and ids.length < count:
+            ids.append(arc4.UInt64(pid))
+            pid = op.btoi(op.Box.extract(_link_key(pid), LINK_NEXT_OFFSET, 8))
+        return ids.copy()
+
+    # ── Order book ──
+    @subroutine
+    def _book_insert(
+        self, lid: UInt64, price: UInt64, amount: UInt64, prev_price: UInt64
+    ) -> None:
+        """
+        Queues a new listing behind its price level. A missing level is linked
+        in after `prev_price`, the next cheaper level (NO_PRICE: none), which
+        is checked against its neighbours rather than searched for.
+        """
+        if price in self.price_levels:
+            level = self.price_levels[price].copy()
+            tail = level.tail.native
+            self.listing_links[lid] = ListingLink(
+                prev=arc4.UInt64(tail), next=arc4.UInt64(NO_ID), slot=arc4.UInt64(0)
+            )
+            op.Box.replace(_listing_link_key(tail), LINK_NEXT_OFFSET, op.itob(lid))
+            level.tail = arc4.UInt64(lid)
+            level.depth = arc4.UInt64(level.depth.native + amount)
+            level.listings = arc4.UInt64(level.listings.native + 1)
+            self.price_levels[price] = level.copy()
+            return
+
+        if prev_price == NO_PRICE:
+            cur = self.best_price
+        else:
+            assert prev_price < price, "price hint not below price"
+            assert prev_price in self.price_levels, "price hint not listed"
+            cur = op.btoi(
+                op.Box.extract(_level_key(prev_price), LEVEL_NEXT_OFFSET, 8)
+            )
+        assert cur == NO_PRICE or cur > price, "stale price hint"
+        self.price_levels[price] = PriceLevel(
+            prev_price=arc4.UInt64(prev_price),
+            next_price=arc4.UInt64(cur),
+            head=arc4.UInt64(lid),
+            tail=arc4.UInt64(lid),
+            depth=arc4.UInt64(amount),
+            listings=arc4.UInt64(1),
+        )
+        if prev_price == NO_PRICE:
+            self.best_price = price
+        else:
+            op.Box.replace(_level_key(prev_price), LEVEL_NEXT_OFFSET, op.itob(price))
+        if cur != NO_PRICE:
+            op.Box.replace(_level_key(cur), LEVEL_PREV_OFFSET, op.itob(price))
+        self.listing_links[lid] = ListingLink(
+            prev=arc4.UInt64(NO_ID), next=arc4.UInt64(NO_ID), slot=arc4.UInt64(0)
+        )
+
+    @subroutine
+    def _book_reduce(self, price: UInt64, quantity: UInt64) -> None:
+        """A partial fill: the level's depth shrinks, its queue is unchanged."""
+        level = self.price_levels[price].copy()
+        level.depth = arc4.UInt64(level.depth.native - quantity)
+        self.price_levels[price] = level.copy()
+
+    @subroutine
+    def _book_remove(self, lid: UInt64, price: UInt64, remaining: UInt64) -> None:
+        """
+        Takes a closing listing off the book, dropping its level once empty.
+        The link box stays for _close_listing, which still needs its slot.
+        """
+        level = self.price_levels[price].copy()
+        link = self.listing_links[lid].copy()
+        if link.prev.native == NO_ID:
+            level.head = link.next
+        else:
+            op.Box.replace(
+                _listing_link_key(link.prev.native), LINK_NEXT_OFFSET, link.next.bytes
+            )
+        if link.next.native == NO_ID:
+            level.tail = link.prev
+        else:
+            op.Box.replace(
+                _listing_link_key(link.next.native), LINK_PREV_OFFSET, link.prev.bytes
+            )
+
+        level.depth = arc4.UInt64(level.depth.native - remaining)
+        level.listings = arc4.UInt64(level.listings.native - 1)
+        if level.listings.native:
+            self.price_levels[price] = level.copy()
+            return
+
+        prev = level.prev_price.native
+        nxt = level.next_price.native
+        if prev == NO_PRICE:
+            self.best_price = nxt
+        else:
+            op.Box.replace(_level_key(prev), LEVEL_NEXT_OFFSET, op.itob(nxt))
+        if nxt != NO_PRICE:
+            op.Box.replace(_level_key(nxt), LEVEL_PREV_OFFSET, op.itob(prev))
+        del self.price_levels[price]
+
+    # ── Listing recycling ──
+    @subroutine
+    def _allocate_listing_id(self) -> UInt64:
+        """Reuses the most recently freed listing id, else mints a new one."""
+        self.open_listing_count += 1
+        lid = self.free_listing_head
+        if lid == NO_ID:
+            lid = self.listing_count
+            self.listing_count = lid + 1
+            return lid
+        self.free_listing_head = self.free_listings[lid].next.native
+        del self.free_listings[lid]
+        return lid
+
+    @subroutine
+    def _close_listing(self, lid: UInt64, seller: Account) -> None:
+        """
+        Deletes a finished listing's boxes (releasing their MBR) and frees the
+        id. The slot kept in its link box makes the seller index update O(1).
+        """
+        del self.listings[lid]
+        slot = self.listing_links[lid].slot
+        moved = _index_remove(_seller_key(seller), slot.native)
+        if moved != NO_ID:
+            op.Box.replace(_listing_link_key(moved), LINK_SLOT_OFFSET, slot.bytes)
+        del self.listing_links[lid]
+        self.free_listings[lid] = FreeLink(
+            next=arc4.UInt64(self.free_listing_head),
+            seq=arc4.UInt64(self.free_listing_pushes),
+        )
+        self.free_listing_head = lid
+        self.free_listing_pushes += 1
+        self.open_listing_count -= 1
+
+    @subroutine
+    def _empty_listing(self) -> ListingRecord:
+        return ListingRecord(
+            seller=arc4.Address(),
+            amount=arc4.UInt64(0),
+            price=arc4.UInt64(0),
+            active=arc4.UInt64(0),
+        )
+
+    # ── Marketplace ──
+    @subroutine
+    def _take_from_listing(
+        self, lid: UInt64, quantity: UInt64
+    ) -> tuple[Account, UInt64, UInt64]:
+        """
+        Removes `quantity` tokens from an active listing, closing it once empty.
+        Returns the seller, the cost and what the seller is owed: the cost plus
+        LISTING_REFUND if the listing closed. Settlement is the caller's.
+        """
+        record = self.listings[lid].copy()
+        price = record.price.native
+        remaining = record.amount.native - quantity
+        cost = quantity * price
+        proceeds = cost
+        if remaining == 0:
+            self._book_remove(lid, price, quantity)
+            self._close_listing(lid, record.seller.native)
+            proceeds += LISTING_REFUND
+        else:
+            self._book_reduce(price, quantity)
+            record.amount = arc4.UInt64(remaining)
+            self.listings[lid] = record.copy()
+        self.escrowed_tokens -= quantity
+        self.tokens_traded += quantity
+        self.volume_traded += cost
+        arc4.emit(
+            Bought(
+                listing_id=arc4.UInt64(lid),
+                buyer=arc4.Address(Txn.sender),
+                quantity=arc4.UInt64(quantity),
+                cost=arc4.UInt64(cost),
+                remaining=arc4.UInt64(remaining),
+            )
+        )
+        return record.seller.native, cost, proceeds
+
+    @subroutine
+    def _caller_payment(self, payment: gtxn.PaymentTransaction) -> UInt64:
+        """Checks a grouped payment is from the caller to the app; returns its amount."""
+        assert (
+            payment.receiver == Global.current_application_address
+        ), "payment must go to the app"
+        assert payment.sender == Txn.sender, "payment must come from the caller"
+        return payment.amount
+
+    @subroutine
+    def _settle_purchase(self, lid: UInt64, quantity: UInt64, paid: UInt64) -> None:
+        """
+        Fills `quantity` from one listing out of `paid` microAlgo. The tokens,
+        the seller's ALGO and the refund of any overpayment go in one inner group.
+        """
+        seller, cost, owed = self._take_from_listing(lid, quantity)
+        assert paid >= cost, "insufficient payment"
+        tokens = itxn.AssetTransfer(
+            xfer_asset=Asset(self.aarna_asset),
+            asset_receiver=Txn.sender,
+            asset_amount=quantity,
+        )
+        proceeds = itxn.Payment(receiver=seller, amount=owed)
+        if paid > cost:
+            itxn.submit_txns(
+                tokens,
+                proceeds,
+                itxn.Payment(receiver=Txn.sender, amount=paid - cost),
+            )
+        else:
+            itxn.submit_txns(tokens, proceeds)
+
+    @subroutine
+    def _index_page(
+        self, key: Bytes, start: UInt64, count: UInt64
+    ) -> arc4.DynamicArray[arc4.UInt64]:
+        """
+        Ids [start, start + count) of a paged index, capped at MAX_ID_PAGE.
+        The pages already hold the ABI encoding of the items, so the result is
+        at most two box_extracts behind a length prefix.
+        """
+        end = self._page_end(start, count, _index_length(key))
+        if end - start > MAX_ID_PAGE:
+            end = start + MAX_ID_PAGE
+        raw = Bytes()
+        slot = start
+        while slot < end:
+            take = INDEX_PAGE_IDS - slot % INDEX_PAGE_IDS
+            if take > end - slot:
+                take = end - slot
+            raw += op.Box.extract(
+                _index_page_key(key, slot), slot % INDEX_PAGE_IDS * 8, take * 8
+            )
+            slot += take
+        return arc4.DynamicArray[arc4.UInt64].from_bytes(
+            arc4.UInt16(end - start).bytes + raw
+        )
+
+    @subroutine
+    def _review(self, pid: UInt64, decision: UInt64, credits: UInt64) -> UInt64:
+        """Applies one review decision; returns a REVIEW_* code instead of failing."""
+        if pid >= self.project_count:
+            return UInt64(REVIEW_UNKNOWN_ID)
+        if self._status(pid) != 1:
+            return UInt64(REVIEW_NOT_PENDING)
+        if decision == 2:
+            if credits == 0:
+                return UInt64(REVIEW_INVALID)
+            self._mark_verified(pid, credits)
+        elif decision == 3:
+            self._mark_rejected(pid)
+        else:
+            return UInt64(REVIEW_INVALID)
+        return UInt64(REVIEW_APPLIED)
+
     # ══════════════════════════════════════════════════════════════════════
     # Lifecycle / Admin
     # ══════════════════════════════════════════════════════════════════════
@@ -122,18 +929,38 @@ class AarnaRegistry(ARC4Contract):
         ecosystem: arc4.String,
         cid: arc4.String,
     ) -> arc4.UInt64:
-        """Developer submits a new project. Returns the project index."""
-        idx = self.project_count
-        self.projects[idx] = ProjectRecord(
-            submitter=arc4.Address(Txn.sender),
+        """
+        Developer submits a new project. Returns the project index.
+        Each evidence bundle (CID) can back only one project, and the encoded
+        metadata is capped at MAX_META_BYTES so the record can always be read.
+        """
+        meta = ProjectMeta(
             name=name,
             location=location,
             ecosystem=ecosystem,
             cid=cid,
+        )
+        assert meta.bytes.length <= MAX_META_BYTES, "project metadata too large"
+        cid_hash = op.sha256(cid.native.bytes)
+        assert cid_hash not in self.cid_index, "duplicate cid: already submitted"
+        idx = self.project_count
+        self.cid_index[cid_hash] = idx
+        self.project_headers[idx] = ProjectHeader(
+            submitter=arc4.Address(Txn.sender),
             status=arc4.UInt64(1),
             credits=arc4.UInt64(0),
         )
+        self.project_meta[idx] = meta.copy()
+        self._queue_push(UInt64(1), idx)
+        # Append-only, so the slot is never needed again.
+        _slot = _index_append(_submitter_key(Txn.sender), idx)
+        self.pending_count += 1
         self.project_count = idx + UInt64(1)
+        arc4.emit(
+            ProjectSubmitted(
+                project_id=arc4.UInt64(idx), submitter=arc4.Address(Txn.sender)
+            )
+        )
         return arc4.UInt64(idx)
 
     @arc4.abimethod
@@ -143,11 +970,8 @@ class AarnaRegistry(ARC4Contract):
         pid = project_id.native
         assert pid < self.project_count, "invalid project id"
         assert credits.native > UInt64(0), "credits must be > 0"
-        record = self.projects[pid].copy()
-        assert record.status == arc4.UInt64(1), "project not pending"
-        record.status = arc4.UInt64(2)
-        record.credits = credits
-        self.projects[pid] = record.copy()
+        assert self._status(pid) == 1, "project not pending"
+        self._mark_verified(pid, credits.native)
 
     @arc4.abimethod
     def reject_project(self, project_id: arc4.UInt64) -> None:
@@ -155,10 +979,29 @@ class AarnaRegistry(ARC4Contract):
         self._only_validator()
         pid = project_id.native
         assert pid < self.project_count, "invalid project id"
-        record = self.projects[pid].copy()
-        assert record.status == arc4.UInt64(1), "project not pending"
-        record.status = arc4.UInt64(3)
-        self.projects[pid] = record.copy()
+        assert self._status(pid) == 1, "project not pending"
+        self._mark_rejected(pid)
+
+    @arc4.abimethod
+    def review_projects_batch(
+        self, decisions: arc4.DynamicArray[ReviewDecision]
+    ) -> arc4.DynamicArray[arc4.UInt8]:
+        """
+        Validator approves / rejects many projects in one call.
+        Ids that are unknown, no longer pending or carry an invalid decision are
+        skipped and reported; the returned codes line up with `decisions`.
+        At most MAX_REVIEW_BATCH decisions, as each applied one logs an event.
+        """
+        self._only_validator()
+        assert decisions.length <= MAX_REVIEW_BATCH, "too many decisions"
+        results = arc4.DynamicArray[arc4.UInt8]()
+        for i in urange(decisions.length):
+            item = decisions[i].copy()
+            code = self._review(
+                item.project_id.native, item.decision.native, item.credits.native
+            )
+            results.append(arc4.UInt8(code))
+        return results.copy()
 
     @arc4.abimethod
     def issue_credits(self, project_id: arc4.UInt64) -> arc4.UInt64:
@@ -170,21 +1013,62 @@ class AarnaRegistry(ARC4Contract):
         assert self.aarna_asset, "no AARNA token created"
         pid = project_id.native
         assert pid < self.project_count, "invalid project id"
-        record = self.projects[pid].copy()
-        assert record.status == arc4.UInt64(2), "project not verified"
+        header = self.project_headers[pid].copy()
+        assert header.status == arc4.UInt64(2), "project not verified"
 
         itxn.AssetTransfer(
             xfer_asset=Asset(self.aarna_asset),
-            asset_receiver=record.submitter.native,
-            asset_amount=record.credits.native,
+            asset_receiver=header.submitter.native,
+            asset_amount=header.credits.native,
         ).submit()
 
-        record.status = arc4.UInt64(4)
-        self.projects[pid] = record.copy()
-        creds = record.credits.native
+        creds = header.credits.native
+        self._mark_issued(pid, header.submitter, creds)
         self.total_credits_issued = self.total_credits_issued + creds
         return arc4.UInt64(creds)
 
+    @arc4.abimethod
+    def issue_credits_batch(
+        self, project_ids: arc4.DynamicArray[arc4.UInt64]
+    ) -> arc4.DynamicArray[arc4.UInt64]:
+        """
+        Validator issues credits for up to MAX_ISSUE_BATCH verified projects in
+        one call. Transfers go out as one inner group with zero fees, so the
+        outer transaction pays for all of them. Unknown or unverified ids are
+        skipped with an amount of 0; the amounts line up with `project_ids`.
+        """
+        self._only_validator()
+        assert self.aarna_asset, "no AARNA token created"
+        assert project_ids.length <= MAX_ISSUE_BATCH, "too many projects for one batch"
+        amounts = arc4.DynamicArray[arc4.UInt64]()
+        issued = UInt64(0)
+        grouped = UInt64(0)
+        for item in project_ids:
+            pid = item.native
+            amount = UInt64(0)
+            if pid < self.project_count:
+                header = self.project_headers[pid].copy()
+                if header.status == arc4.UInt64(2):
+                    amount = header.credits.native
+                    if grouped == 0:
+                        op.ITxnCreate.begin()
+                    else:
+                        op.ITxnCreate.next()
+                    op.ITxnCreate.set_type_enum(TransactionType.AssetTransfer)
+                    op.ITxnCreate.set_xfer_asset(self.aarna_asset)
+                    op.ITxnCreate.set_asset_receiver(header.submitter.native)
+                    op.ITxnCreate.set_asset_amount(amount)
+                    op.ITxnCreate.set_fee(0)
+                    grouped += 1
+                    self._mark_issued(pid, header.submitter, amount)
+                    issued += amount
+            amounts.append(arc4.UInt64(amount))
+
+        if grouped:
+            op.ITxnCreate.submit()
+        self.total_credits_issued += issued
+        return amounts.copy()
+
     # ══════════════════════════════════════════════════════════════════════
     # Marketplace
     # ══════════════════════════════════════════════════════════════════════
@@ -193,77 +1077,204 @@ class AarnaRegistry(ARC4Contract):
         self,
         amount: arc4.UInt64,
         price_per_token: arc4.UInt64,
+        prev_price: arc4.UInt64,
+        deposit: gtxn.PaymentTransaction,
     ) -> arc4.UInt64:
         """
         List AARNA tokens for sale using clawback to escrow.
-        Returns the listing index.
+        `prev_price` is the highest listed price below `price_per_token`
+        (0 if there is none; see get_price_hint), only needed when no
+        listing has that price yet. `deposit` (to the app, from the seller)
+        funds the listing's boxes: LISTING_DEPOSIT, or LISTING_REFUND when a
+        freed id is reused, with any excess refunded. Returns the listing index.
         """
         assert self.aarna_asset, "no AARNA token"
         assert amount.native > UInt64(0), "amount must be > 0"
         assert price_per_token.native > UInt64(0), "price must be > 0"
+        charge = UInt64(LISTING_DEPOSIT)
+        if self.free_listing_head != NO_ID:
+            charge = UInt64(LISTING_REFUND)
+        paid = self._caller_payment(deposit)
+        assert paid >= charge, "insufficient deposit"
 
-        itxn.AssetTransfer(
+        escrow = itxn.AssetTransfer(
             xfer_asset=Asset(self.aarna_asset),
             asset_sender=Txn.sender,
             asset_receiver=Global.current_application_address,
             asset_amount=amount.native,
-        ).submit()
+        )
+        if paid > charge:
+            itxn.submit_txns(
+                escrow, itxn.Payment(receiver=Txn.sender, amount=paid - charge)
+            )
+        else:
+            escrow.submit()
 
-        idx = self.listing_count
+        idx = self._allocate_listing_id()
         self.listings[idx] = ListingRecord(
             seller=arc4.Address(Txn.sender),
             amount=amount,
             price=price_per_token,
             active=arc4.UInt64(1),
         )
-        self.listing_count = idx + UInt64(1)
+        self._book_insert(
+            idx, price_per_token.native, amount.native, prev_price.native
+        )
+        slot = _index_append(_seller_key(Txn.sender), idx)
+        op.Box.replace(_listing_link_key(idx), LINK_SLOT_OFFSET, op.itob(slot))
+        arc4.emit(
+            Listed(
+                listing_id=arc4.UInt64(idx),
+                seller=arc4.Address(Txn.sender),
+                amount=amount,
+                price=price_per_token,
+            )
+        )
+        self.escrowed_tokens += amount.native
         return arc4.UInt64(idx)
 
     @arc4.abimethod
-    def buy_listing(self, listing_id: arc4.UInt64, payment: arc4.UInt64) -> None:
+    def buy_listing(
+        self, listing_id: arc4.UInt64, payment: gtxn.PaymentTransaction
+    ) -> None:
         """
         Buy tokens from a listing. Transfers tokens to buyer and ALGO to seller.
+        `payment` (to the app, from the buyer) must cover the cost; any excess
+        is refunded.
         """
         assert self.aarna_asset, "no AARNA token"
         lid = listing_id.native
         assert lid < self.listing_count, "invalid listing id"
-        record = self.listings[lid].copy()
-        assert record.active == arc4.UInt64(1), "listing not active"
+        record = self.listings.get(lid, default=self._empty_listing()).copy()
+        assert record.active.native, "listing not active"
 
-        total_cost = record.amount.native * record.price.native
-        assert payment.native >= total_cost, "insufficient payment"
+        self._settle_purchase(
+            lid, record.amount.native, self._caller_payment(payment)
+        )
 
-        itxn.AssetTransfer(
-            xfer_asset=Asset(self.aarna_asset),
-            asset_receiver=Txn.sender,
-            asset_amount=record.amount.native,
-        ).submit()
+    @arc4.abimethod
+    def buy_listing_partial(
+        self,
+        listing_id: arc4.UInt64,
+        quantity: arc4.UInt64,
+        payment: gtxn.PaymentTransaction,
+    ) -> None:
+        """
+        Buy part of a listing. The rest stays listed at the same price; the
+        listing closes once its amount reaches zero. Paid for like buy_listing.
+        """
+        assert self.aarna_asset, "no AARNA token"
+        lid = listing_id.native
+        assert lid < self.listing_count, "invalid listing id"
+        record = self.listings.get(lid, default=self._empty_listing()).copy()
+        assert record.active.native, "listing not active"
+        assert quantity.native > UInt64(0), "quantity must be > 0"
+        assert quantity.native <= record.amount.native, "quantity exceeds listing"
 
-        itxn.Payment(
-            receiver=record.seller.native,
-            amount=total_cost,
-        ).submit()
+        self._settle_purchase(lid, quantity.native, self._caller_payment(payment))
+
+    @arc4.abimethod
+    def sweep_listings(
+        self,
+        listing_ids: arc4.DynamicArray[arc4.UInt64],
+        max_quantity: arc4.UInt64,
+        max_total_price: arc4.UInt64,
+        payment: gtxn.PaymentTransaction,
+    ) -> SweepResult:
+        """
+        Fill listings in the given order until `max_quantity` tokens are bought
+        or `max_total_price` would be exceeded; the last one may fill partially.
+        Closed or unknown ids are skipped. `payment` (to the app, from the
+        buyer) must cover what is spent. All seller payments (each with the
+        LISTING_REFUND of a listing bought out), a single token transfer to the
+        buyer and the refund of the unspent payment go out as one inner group
+        (at most MAX_SWEEP_FILLS listings). Returns the tokens filled and the
+        ALGO spent.
+        """
+        assert self.aarna_asset, "no AARNA token"
+        paid = self._caller_payment(payment)
+        filled = UInt64(0)
+        spent = UInt64(0)
+        fills = UInt64(0)
+        for item in listing_ids:
+            lid = item.native
+            if filled == max_quantity.native:
+                break
+            record = self.listings.get(lid, default=self._empty_listing()).copy()
+            if not record.active.native:
+                continue
+            take = record.amount.native
+            if take > max_quantity.native - filled:
+                take = max_quantity.native - filled
+            affordable = (max_total_price.native - spent) // record.price.native
+            if take > affordable:
+                take = affordable
+            if take == 0:
+                continue
+            assert fills < MAX_SWEEP_FILLS, "too many fills for one sweep"
 
-        record.active = arc4.UInt64(0)
-        self.listings[lid] = record.copy()
+            seller, cost, owed = self._take_from_listing(lid, take)
+            if fills == 0:
+                op.ITxnCreate.begin()
+            else:
+                op.ITxnCreate.next()
+            op.ITxnCreate.set_type_enum(TransactionType.Payment)
+            op.ITxnCreate.set_receiver(seller)
+            op.ITxnCreate.set_amount(owed)
+            op.ITxnCreate.set_fee(0)
+            filled += take
+            spent += cost
+            fills += 1
+        assert spent <= paid, "insufficient payment"
+
+        if fills:
+            op.ITxnCreate.next()
+            op.ITxnCreate.set_type_enum(TransactionType.AssetTransfer)
+            op.ITxnCreate.set_xfer_asset(self.aarna_asset)
+            op.ITxnCreate.set_asset_receiver(Txn.sender)
+            op.ITxnCreate.set_asset_amount(filled)
+            op.ITxnCreate.set_fee(0)
+        if spent < paid:
+            if fills:
+                op.ITxnCreate.next()
+            else:
+                op.ITxnCreate.begin()
+            op.ITxnCreate.set_type_enum(TransactionType.Payment)
+            op.ITxnCreate.set_receiver(Txn.sender)
+            op.ITxnCreate.set_amount(paid - spent)
+            op.ITxnCreate.set_fee(0)
+        if fills or spent < paid:
+            op.ITxnCreate.submit()
+        return SweepResult(filled=arc4.UInt64(filled), spent=arc4.UInt64(spent))
 
     @arc4.abimethod
     def cancel_listing(self, listing_id: arc4.UInt64) -> None:
-        """Seller cancels their listing. Escrowed tokens returned."""
+        """Seller cancels their listing. Escrowed tokens and LISTING_REFUND returned."""
         lid = listing_id.native
         assert lid < self.listing_count, "invalid listing id"
-        record = self.listings[lid].copy()
-        assert record.active == arc4.UInt64(1), "listing not active"
+        record = self.listings.get(lid, default=self._empty_listing()).copy()
+        assert record.active.native, "listing not active"
         assert Txn.sender == record.seller.native, "only seller can cancel"
+        self._book_remove(lid, record.price.native, record.amount.native)
+        self.escrowed_tokens -= record.amount.native
+        arc4.emit(
+            Cancelled(
+                listing_id=arc4.UInt64(lid),
+                seller=record.seller.copy(),
+                amount=record.amount,
+            )
+        )
 
-        itxn.AssetTransfer(
-            xfer_asset=Asset(self.aarna_asset),
-            asset_receiver=record.seller.native,
-            asset_amount=record.amount.native,
-        ).submit()
+        itxn.submit_txns(
+            itxn.AssetTransfer(
+                xfer_asset=Asset(self.aarna_asset),
+                asset_receiver=record.seller.native,
+                asset_amount=record.amount.native,
+            ),
+            itxn.Payment(receiver=record.seller.native, amount=LISTING_REFUND),
+        )
 
-        record.active = arc4.UInt64(0)
-        self.listings[lid] = record.copy()
+        self._close_listing(lid, record.seller.native)
 
     # ══════════════════════════════════════════════════════════════════════
     # Read-Only Getters — field access from arc4.Struct copy
@@ -290,12 +1301,198 @@ class AarnaRegistry(ARC4Contract):
 
     @arc4.abimethod(readonly=True)
     def get_project(self, project_id: arc4.UInt64) -> ProjectRecord:
-        return self.projects[project_id.native].copy()
+        return self._load_project(project_id.native)
+
+    @arc4.abimethod(readonly=True)
+    def get_project_header(self, project_id: arc4.UInt64) -> ProjectHeader:
+        """Status / credits / submitter only — a single 48-byte box read."""
+        return self.project_headers[project_id.native].copy()
+
+    @arc4.abimethod(readonly=True)
+    def find_project_by_cid(self, cid: arc4.String) -> arc4.UInt64:
+        """Id of the project filed with this CID, or NO_ID if there is none."""
+        pid, exists = self.cid_index.maybe(op.sha256(cid.native.bytes))
+        if not exists:
+            return arc4.UInt64(NO_ID)
+        return arc4.UInt64(pid)
+
+    @arc4.abimethod(readonly=True)
+    def get_pending_ids(
+        self, after: arc4.UInt64, count: arc4.UInt64
+    ) -> arc4.DynamicArray[arc4.UInt64]:
+        """Next `count` pending project ids after `after` (NO_ID = from the start)."""
+        return self._queue_page(UInt64(1), after.native, count.native)
+
+    @arc4.abimethod(readonly=True)
+    def get_verified_ids(
+        self, after: arc4.UInt64, count: arc4.UInt64
+    ) -> arc4.DynamicArray[arc4.UInt64]:
+        """Next `count` verified, not yet issued ids after `after` (NO_ID = start)."""
+        return self._queue_page(UInt64(2), after.native, count.native)
+
+    @arc4.abimethod(readonly=True)
+    def get_projects_by_submitter(
+        self, addr: arc4.Address, start: arc4.UInt64, count: arc4.UInt64
+    ) -> arc4.DynamicArray[arc4.UInt64]:
+        """Project ids filed by `addr`, oldest first, paged by position."""
+        return self._index_page(_submitter_key(addr.native), start.native, count.native)
+
+    @arc4.abimethod(readonly=True)
+    def get_listings_by_seller(
+        self, addr: arc4.Address, start: arc4.UInt64, count: arc4.UInt64
+    ) -> arc4.DynamicArray[arc4.UInt64]:
+        """
+        Open listing ids of `addr`, paged by position. Closing a listing moves
+        the seller's last id into its slot, so order is not chronological.
+        """
+        return self._index_page(_seller_key(addr.native), start.native, count.native)
+
+    @arc4.abimethod(readonly=True)
+    def get_stats(self) -> RegistryStats:
+        """Every aggregate counter in one call; volume_traded is in microAlgo."""
+        return RegistryStats(
+            project_count=arc4.UInt64(self.project_count),
+            pending=arc4.UInt64(self.pending_count),
+            verified=arc4.UInt64(self.verified_count),
+            rejected=arc4.UInt64(self.rejected_count),
+            issued=arc4.UInt64(self.issued_count),
+            total_credits_issued=arc4.UInt64(self.total_credits_issued),
+            open_listings=arc4.UInt64(self.open_listing_count),
+            escrowed_tokens=arc4.UInt64(self.escrowed_tokens),
+            tokens_traded=arc4.UInt64(self.tokens_traded),
+            volume_traded=arc4.UInt64(self.volume_traded),
+        )
+
+    @arc4.abimethod(readonly=True)
+    def get_best_offers(self, count: arc4.UInt64) -> arc4.DynamicArray[Offer]:
+        """
+        The `count` cheapest active offers, in price then listing-time order.
+        Capped at MAX_BOOK_PAGE and by the available opcode budget.
+        """
+        limit = count.native
+        if limit > MAX_BOOK_PAGE:
+            limit = UInt64(MAX_BOOK_PAGE)
+        offers = arc4.DynamicArray[Offer]()
+        price = self.best_price
+        while price != NO_PRICE and offers.length < limit:
+            level = self.price_levels[price].copy()
+            lid = level.head.native
+            while (
+                lid != NO_ID
+                and offers.length < limit
+                and Global.opcode_budget() > PAGE_BUDGET_RESERVE
+            ):
+                offers.append(
+                    Offer(
+                        listing_id=arc4.UInt64(lid),
+                        amount=self.listings[lid].amount,
+                        price=arc4.UInt64(price),
+                    )
+                )
+                lid = op.btoi(
+                    op.Box.extract(_listing_link_key(lid), LINK_NEXT_OFFSET, 8)
+                )
+            if lid != NO_ID:
+                break
+            price = level.next_price.native
+        return offers.copy()
+
+    @arc4.abimethod(readonly=True)
+    def get_depth(self, price_limit: arc4.UInt64) -> arc4.DynamicArray[DepthLevel]:
+        """
+        Aggregate depth per price level, cheapest first, for every level priced
+        at or below `price_limit` (up to MAX_BOOK_PAGE levels).
+        """
+        levels = arc4.DynamicArray[DepthLevel]()
+        price = self.best_price
+        while (
+            price != NO_PRICE
+            and price <= price_limit.native
+            and levels.length < MAX_BOOK_PAGE
+        ):
+            level = self.price_levels[price].copy()
+            levels.append(
+                DepthLevel(
+                    price=arc4.UInt64(price),
+                    depth=level.depth,
+                    listings=level.listings,
+                )
+            )
+            price = level.next_price.native
+        return levels.copy()
+
+    @arc4.abimethod(readonly=True)
+    def get_price_hint(self, price: arc4.UInt64) -> arc4.UInt64:
+        """
+        The `prev_price` for list_for_sale at `price`: the highest listed price
+        below it, or 0. Walks the book, so simulate it with extra budget.
+        """
+        prev = UInt64(NO_PRICE)
+        cur = self.best_price
+        while cur != NO_PRICE and cur < price.native:
+            prev = cur
+            cur = op.btoi(op.Box.extract(_level_key(cur), LEVEL_NEXT_OFFSET, 8))
+        return arc4.UInt64(prev)
 
     @arc4.abimethod(readonly=True)
     def get_listing(self, listing_id: arc4.UInt64) -> ListingRecord:
-        return self.listings[listing_id.native].copy()
+        """Closed or never-used ids read back as an all-zero, inactive record."""
+        return self.listings.get(listing_id.native, default=self._empty_listing())
 
     @arc4.abimethod(readonly=True)
     def get_listing_count(self) -> arc4.UInt64:
+        """Upper bound on listing ids (ids are recycled), not the open count."""
         return arc4.UInt64(self.listing_count)
+
+    @arc4.abimethod(readonly=True)
+    def get_open_listing_count(self) -> arc4.UInt64:
+        return arc4.UInt64(self.open_listing_count)
+
+    # ══════════════════════════════════════════════════════════════════════
+    # Paged bulk reads — one simulate call instead of one read per id
+    # ══════════════════════════════════════════════════════════════════════
+    @arc4.abimethod(readonly=True)
+    def get_projects_page(
+        self, start: arc4.UInt64, count: arc4.UInt64
+    ) -> ProjectPage:
+        """
+        Returns up to `count` projects from `start`, stopping early when the
+        return-size limit or opcode budget is reached. `next_id` is the cursor
+        for the following call; the scan is done once it equals the project count.
+        Metadata is capped at submission, so any one record fits a page.
+        """
+        end = self._page_end(start.native, count.native, self.project_count)
+        items = arc4.DynamicArray[ProjectRecord]()
+        size = UInt64(PAGE_HEADER_BYTES)
+        pid = start.native
+        while pid < end and Global.opcode_budget() > PAGE_BUDGET_RESERVE:
+            # Each dynamic element also costs a 2-byte offset in the array head.
+            record_size = self.project_meta.length(pid) + RECORD_EXTRA_BYTES + 2
+            if size + record_size > MAX_RETURN_BYTES:
+                break
+            items.append(self._load_project(pid))
+            size += record_size
+            pid += 1
+        return ProjectPage(next_id=arc4.UInt64(pid), items=items.copy())
+
+    @arc4.abimethod(readonly=True)
+    def get_listings_page(
+        self, start: arc4.UInt64, count: arc4.UInt64
+    ) -> ListingPage:
+        """
+        Returns up to `count` listings from `start`, stopping early when the
+        return-size limit or opcode budget is reached. `next_id` is the cursor
+        for the following call; the scan is done once it equals the listing count.
+        Items stay positional: a freed id reads back as an all-zero record.
+        """
+        end = self._page_end(start.native, count.native, self.listing_count)
+        items = arc4.DynamicArray[ListingRecord]()
+        size = UInt64(PAGE_HEADER_BYTES)
+        lid = start.native
+        while lid < end and Global.opcode_budget() > PAGE_BUDGET_RESERVE:
+            if size + LISTING_RECORD_BYTES > MAX_RETURN_BYTES:
+                break
+            items.append(self.listings.get(lid, default=self._empty_listing()).copy())
+            size += LISTING_RECORD_BYTES
+            lid += 1
+        return ListingPage(next_id=arc4.UInt64(lid), items=items.copy())
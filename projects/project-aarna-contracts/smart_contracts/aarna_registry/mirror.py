@@ -0,0 +1,329 @@
+"""
+Incremental SQLite mirror of an AarnaRegistry app.
+
+Reads raw boxes from algod and upserts them into `projects` / `listings`
+tables, so reports and services can query a local database instead of each
+scanning the registry through `get_project` / `get_listing` calls.
+
+Each `poll` only fetches what can have changed since the previous one:
+
+- projects with ids at or beyond the last synced `project_count` (header and
+  meta), plus the header of every project still pending or verified; meta is
+  written once and rejected / issued projects never change again,
+- listings with ids at or beyond the last synced `listing_count`, plus every
+  listing that was open. A closed listing's id goes onto the contract's free
+  list and may be handed out again; ids that left the free list since the
+  last poll are fetched too, found by walking the list only down to the first
+  entry still carrying the push sequence number it had then.
+
+Box reads go through a bounded thread pool. The watermark is the algod round
+read before any box: every row is at least that fresh.
+"""
+
+import base64
+import dataclasses
+import sqlite3
+import time
+from collections.abc import Iterable
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import Any
+
+from algosdk.encoding import encode_address
+from algosdk.error import AlgodHTTPError
+from algosdk.v2client.algod import AlgodClient
+
+from smart_contracts.aarna_registry import codec
+
+_schema = """
+CREATE TABLE IF NOT EXISTS projects (
+    id INTEGER PRIMARY KEY,
+    submitter TEXT NOT NULL,
+    status INTEGER NOT NULL,
+    credits INTEGER NOT NULL,
+    name TEXT,
+    location TEXT,
+    ecosystem TEXT,
+    cid TEXT,
+    synced_round INTEGER NOT NULL
+);
+CREATE INDEX IF NOT EXISTS projects_status ON projects (status);
+CREATE TABLE IF NOT EXISTS listings (
+    id INTEGER PRIMARY KEY,
+    seller TEXT,
+    amount INTEGER,
+    price INTEGER,
+    active INTEGER NOT NULL,
+    -- Next id on the contract's free list while this id is free, else NULL,
+    -- and the sequence number of the push that put it there.
+    free_next INTEGER,
+    free_seq INTEGER,
+    synced_round INTEGER NOT NULL
+);
+CREATE INDEX IF NOT EXISTS listings_active ON listings (active);
+CREATE TABLE IF NOT EXISTS sync_state (
+    key TEXT PRIMARY KEY,
+    value INTEGER NOT NULL
+);
+"""
+
+# Projects in these states still change: pending -> verified -> issued.
+MUTABLE_STATUSES = (1, 2)
+# SQLite integers are signed 64-bit, so the contract's NO_ID is stored as -1.
+_DB_NO_ID = -1
+
+
+def _to_db(item_id: int) -> int:
+    return _DB_NO_ID if item_id == codec.NO_ID else item_id
+
+
+def _from_db(item_id: int) -> int:
+    return codec.NO_ID if item_id == _DB_NO_ID else item_id
+
+
+@dataclasses.dataclass
+class Watermark:
+    round: int
+    synced_at: float
+
+    @property
+    def age(self) -> float:
+        return time.time() - self.synced_at
+
+
+@dataclasses.dataclass
+class SyncReport:
+    round: int
+    new_projects: int = 0
+    refreshed_projects: int = 0
+    new_listings: int = 0
+    refreshed_listings: int = 0
+    box_reads: int = 0
+    elapsed: float = 0.0
+
+
+class RegistryMirror:
+    def __init__(
+        self,
+        algod: AlgodClient,
+        app_id: int,
+        db_path: Path | str = ":memory:",
+        max_concurrency: int = 8,
+    ) -> None:
+        self.algod = algod
+        self.app_id = app_id
+        self.connection = sqlite3.connect(db_path)
+        self.connection.executescript(_schema)
+        self._pool = ThreadPoolExecutor(
+            max_workers=max(max_concurrency, 1), thread_name_prefix="mirror"
+        )
+
+    @classmethod
+    def from_app_client(
+        cls, app_client: Any, db_path: Path | str = ":memory:", max_concurrency: int = 8
+    ) -> "RegistryMirror":
+        """Mirrors the app behind a generated `AarnaRegistryClient`."""
+        return cls(
+            app_client.algorand.client.algod,
+            app_client.app_id,
+            db_path,
+            max_concurrency,
+        )
+
+    def close(self) -> None:
+        self._pool.shutdown()
+        self.connection.close()
+
+    # ── Sync state ──
+    def _state(self, key: str, default: float = 0) -> Any:
+        row = self.connection.execute(
+            "SELECT value FROM sync_state WHERE key = ?", (key,)
+        ).fetchone()
+        return default if row is None else row[0]
+
+    def _set_state(self, values: dict[str, int | float]) -> None:
+        self.connection.executemany(
+            "INSERT OR REPLACE INTO sync_state (key, value) VALUES (?, ?)",
+            values.items(),
+        )
+
+    @property
+    def watermark(self) -> Watermark | None:
+        """Round and wall time of the last completed poll, None before the first."""
+        if self._state("round", -1) < 0:
+            return None
+        return Watermark(self._state("round"), self._state("synced_at"))
+
+    # ── algod reads ──
+    def _global_state(self) -> dict[str, int]:
+        info: Any = self.algod.application_info(self.app_id)
+        state = {}
+        for entry in info["params"].get("global-state", []):
+            if entry["value"]["type"] == 2:
+                key = base64.b64decode(entry["key"]).decode(errors="replace")
+                state[key] = entry["value"]["uint"]
+        return state
+
+    def _get_box(self, name: bytes) -> bytes | None:
+        try:
+            response: Any = self.algod.application_box_by_name(self.app_id, name)
+        except AlgodHTTPError as e:
+            if e.code == 404:
+                return None
+            raise
+        return base64.b64decode(response["value"])
+
+    def _get_boxes(self, names: list[bytes]) -> dict[bytes, bytes | None]:
+        return dict(zip(names, self._pool.map(self._get_box, names), strict=True))
+
+    def _ids(self, query: str, params: Iterable[Any] = ()) -> set[int]:
+        return {row[0] for row in self.connection.execute(query, tuple(params))}
+
+    def _free_list(self, head: int, pushes: int) -> dict[int, codec.FreeLink]:
+        """
+        The contract's free listing ids as {id: link}. The list is a stack: an
+        entry still holding the push sequence number we stored was not popped
+        since, and neither was anything under it, so the walk from the head
+        stops there and keeps the stored remainder.
+        """
+        known = {
+            lid: codec.FreeLink(_from_db(nxt), seq)
+            for lid, nxt, seq in self.connection.execute(
+                "SELECT id, free_next, free_seq FROM listings"
+                " WHERE free_next IS NOT NULL"
+            )
+        }
+        if head == _from_db(
+            self._state("free_listing_head", _DB_NO_ID)
+        ) and pushes == self._state("free_listing_pushes"):
+            return known
+        current: dict[int, codec.FreeLink] = {}
+        lid = head
+        while lid != codec.NO_ID and lid not in current:
+            value = self._get_box(codec.free_listing_key(lid))
+            if value is None:
+                break  # reused while we walked; the next poll picks it up
+            current[lid] = codec.decode_free_link(value)
+            if known.get(lid) == current[lid]:
+                lid = current[lid].next
+                while lid != codec.NO_ID and lid in known and lid not in current:
+                    current[lid] = known[lid]
+                    lid = known[lid].next
+                break
+            lid = current[lid].next
+        return current
+
+    # ── Polling ──
+    def poll(self) -> SyncReport:
+        start = time.perf_counter()
+        status: Any = self.algod.status()
+        round_ = status["last-round"]
+        report = SyncReport(round=round_)
+        state = self._global_state()
+        project_count = state.get("project_count", 0)
+        listing_count = state.get("listing_count", 0)
+        free_head = state.get("free_listing_head", codec.NO_ID)
+        free_pushes = state.get("free_listing_pushes", 0)
+
+        new_projects = range(self._state("project_count"), project_count)
+        mutable_projects = self._ids(
+            "SELECT id FROM projects WHERE status IN (?, ?)", MUTABLE_STATUSES
+        )
+        known_free = self._ids("SELECT id FROM listings WHERE free_next IS NOT NULL")
+        free_list = self._free_list(free_head, free_pushes)
+        new_listings = range(self._state("listing_count"), listing_count)
+        changed_listings = self._ids("SELECT id FROM listings WHERE active = 1") | (
+            known_free - set(free_list)
+        )
+
+        project_ids = sorted(mutable_projects | set(new_projects))
+        listing_ids = sorted(changed_listings | set(new_listings))
+        boxes = self._get_boxes(
+            [codec.header_key(pid) for pid in project_ids]
+            + [codec.meta_key(pid) for pid in new_projects]
+            + [codec.listing_key(lid) for lid in listing_ids]
+        )
+        report.box_reads = len(boxes)
+
+        with self.connection:
+            for pid in project_ids:
+                header_box = boxes[codec.header_key(pid)]
+                if header_box is None:
+                    continue
+                header = codec.decode_header(header_box)
+                row = (
+                    encode_address(header.submitter),
+                    header.status,
+                    header.credits,
+                    round_,
+                    pid,
+                )
+                meta_box = boxes.get(codec.meta_key(pid))
+                if meta_box is None:
+                    report.refreshed_projects += 1
+                    self.connection.execute(
+                        "UPDATE projects SET submitter = ?, status = ?, credits = ?,"
+                        " synced_round = ? WHERE id = ?",
+                        row,
+                    )
+                    continue
+                report.new_projects += 1
+                self.connection.execute(
+                    "INSERT OR REPLACE INTO projects (submitter, status, credits,"
+                    " synced_round, id, name, location, ecosystem, cid)"
+                    " VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                    row + tuple(codec.decode_meta(meta_box)),
+                )
+
+            for lid in listing_ids:
+                if lid in new_listings:
+                    report.new_listings += 1
+                else:
+                    report.refreshed_listings += 1
+                listing_box = boxes[codec.listing_key(lid)]
+                if listing_box is None:
+                    # Closed: keep the last known terms, mark inactive.
+                    self.connection.execute(
+                        "INSERT INTO listings (id, active, synced_round)"
+                        " VALUES (?, 0, ?) ON CONFLICT (id) DO UPDATE SET"
+                        " active = 0, synced_round = excluded.synced_round",
+                        (lid, round_),
+                    )
+                    continue
+                listing = codec.decode_listing(listing_box)
+                self.connection.execute(
+                    "INSERT OR REPLACE INTO listings (id, seller, amount, price,"
+                    " active, free_next, free_seq, synced_round)"
+                    " VALUES (?, ?, ?, ?, 1, NULL, NULL, ?)",
+                    (
+                        lid,
+                        encode_address(listing.seller),
+                        listing.amount,
+                        listing.price,
+                        round_,
+                    ),
+                )
+
+            self.connection.execute(
+                "UPDATE listings SET free_next = NULL, free_seq = NULL"
+                " WHERE free_next IS NOT NULL"
+            )
+            self.connection.executemany(
+                "UPDATE listings SET free_next = ?, free_seq = ? WHERE id = ?",
+                (
+                    (_to_db(link.next), link.seq, lid)
+                    for lid, link in free_list.items()
+                ),
+            )
+            self._set_state(
+                {
+                    "project_count": project_count,
+                    "listing_count": listing_count,
+                    "free_listing_head": _to_db(free_head),
+                    "free_listing_pushes": free_pushes,
+                    "round": round_,
+                    "synced_at": time.time(),
+                }
+            )
+        report.elapsed = time.perf_counter() - start
+        return report
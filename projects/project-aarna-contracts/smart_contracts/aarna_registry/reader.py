@@ -0,0 +1,333 @@
+"""
+Cached, batched reads of an AarnaRegistry app.
+
+Readonly getters are not sent one round trip at a time: `RegistryReader`
+packs up to MAX_GROUP_SIZE ABI calls into one atomic group and runs it
+through algod's simulate endpoint (empty signatures, unnamed resources
+allowed), with several groups in flight on a bounded pool.
+
+Results are cached by how they can change:
+
+- immutable project fields (submitter, name, location, ecosystem, cid) and
+  CID lookups that found a project never expire,
+- project status / credits, listings (ids are recycled) and counters expire
+  after `ttl` seconds; each cache holds at most `max_entries` (LRU).
+
+Once a project's immutable part is cached, refreshing it only simulates
+`get_project_header` (48 bytes). Hit / miss and latency counters are kept in
+`stats`.
+"""
+
+import base64
+import dataclasses
+import time
+from collections import OrderedDict
+from collections.abc import Hashable, Sequence
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any
+
+from algosdk import abi, transaction
+from algosdk.v2client.algod import AlgodClient
+from algosdk.v2client.models import SimulateRequest, SimulateRequestTransactionGroup
+
+from smart_contracts.aarna_registry import codec
+
+# Most transactions in one atomic group.
+MAX_GROUP_SIZE = 16
+ABI_RETURN_PREFIX = bytes.fromhex("151f7c75")
+
+GET_PROJECT = abi.Method.from_signature(
+    "get_project(uint64)(address,string,string,string,string,uint64,uint64)"
+)
+GET_PROJECT_HEADER = abi.Method.from_signature(
+    "get_project_header(uint64)(address,uint64,uint64)"
+)
+GET_LISTING = abi.Method.from_signature(
+    "get_listing(uint64)(address,uint64,uint64,uint64)"
+)
+FIND_PROJECT_BY_CID = abi.Method.from_signature("find_project_by_cid(string)uint64")
+COUNTERS = {
+    name: abi.Method.from_signature(f"{name}()uint64")
+    for name in (
+        "get_project_count",
+        "get_listing_count",
+        "get_open_listing_count",
+        "get_total_credits_issued",
+        "get_asset_id",
+    )
+}
+
+
+@dataclasses.dataclass(frozen=True)
+class ProjectView:
+    id: int
+    submitter: str
+    name: str
+    location: str
+    ecosystem: str
+    cid: str
+    status: int
+    credits: int
+
+
+@dataclasses.dataclass(frozen=True)
+class ListingView:
+    id: int
+    seller: str
+    amount: int
+    price: int
+    active: bool
+
+
+@dataclasses.dataclass
+class ReaderStats:
+    hits: int = 0
+    misses: int = 0
+    app_calls: int = 0
+    simulate_requests: int = 0
+    latency_total: float = 0.0
+    latency_max: float = 0.0
+
+    @property
+    def latency_mean(self) -> float:
+        if not self.simulate_requests:
+            return 0.0
+        return self.latency_total / self.simulate_requests
+
+
+class SimulateError(Exception):
+    pass
+
+
+class _Cache:
+    """LRU of at most `max_entries`, entries expiring after `ttl` (None: never)."""
+
+    def __init__(self, stats: ReaderStats, max_entries: int, ttl: float | None):
+        self._stats = stats
+        self._entries: OrderedDict[Hashable, tuple[float, Any]] = OrderedDict()
+        self._max_entries = max_entries
+        self._ttl = ttl
+
+    def get(self, key: Hashable, count_miss: bool = True) -> Any:
+        """
+        The cached value, or None. Pass count_miss=False when another cache is
+        consulted next, so one lookup is not counted as two misses.
+        """
+        entry = self._entries.get(key)
+        if entry is None or (
+            self._ttl is not None and time.monotonic() - entry[0] > self._ttl
+        ):
+            if count_miss:
+                self._stats.misses += 1
+            return None
+        self._entries.move_to_end(key)
+        self._stats.hits += 1
+        return entry[1]
+
+    def put(self, key: Hashable, value: Any) -> None:
+        self._entries[key] = (time.monotonic(), value)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self._max_entries:
+            self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        self._entries.clear()
+
+
+class RegistryReader:
+    def __init__(
+        self,
+        algod: AlgodClient,
+        app_id: int,
+        sender: str | None = None,
+        ttl: float = 5.0,
+        max_entries: int = 10_000,
+        max_concurrency: int = 4,
+    ) -> None:
+        self.algod = algod
+        self.app_id = app_id
+        self.stats = ReaderStats()
+        # Simulate still checks fees, so calls come from a funded account;
+        # the app creator by default.
+        self._sender = sender
+        self._immutable = _Cache(self.stats, max_entries, None)
+        self._mutable = _Cache(self.stats, max_entries, ttl)
+        self._pool = ThreadPoolExecutor(
+            max_workers=max(max_concurrency, 1), thread_name_prefix="reader"
+        )
+
+    @classmethod
+    def from_app_client(cls, app_client: Any, **kwargs: Any) -> "RegistryReader":
+        """Reads through the algod client behind a generated `AarnaRegistryClient`."""
+        return cls(app_client.algorand.client.algod, app_client.app_id, **kwargs)
+
+    def close(self) -> None:
+        self._pool.shutdown()
+
+    def invalidate(self) -> None:
+        """Drops everything that can change; immutable fields stay cached."""
+        self._mutable.clear()
+
+    # ── Simulate ──
+    @property
+    def sender(self) -> str:
+        if self._sender is None:
+            info: Any = self.algod.application_info(self.app_id)
+            self._sender = info["params"]["creator"]
+        return self._sender
+
+    def _simulate_group(
+        self,
+        calls: Sequence[tuple[abi.Method, list[Any]]],
+        params: transaction.SuggestedParams,
+    ) -> tuple[float, list[Any]]:
+        """Simulates one group; returns its latency and decoded return values."""
+        txns = [
+            transaction.ApplicationCallTxn(
+                self.sender,
+                params,
+                self.app_id,
+                transaction.OnComplete.NoOpOC,
+                app_args=[
+                    method.get_selector(),
+                    *(arg.type.encode(v) for arg, v in zip(method.args, args)),
+                ],
+            )
+            for method, args in calls
+        ]
+        if len(txns) > 1:
+            transaction.assign_group_id(txns)
+        request = SimulateRequest(
+            txn_groups=[
+                SimulateRequestTransactionGroup(
+                    txns=[transaction.SignedTransaction(txn, None) for txn in txns]
+                )
+            ],
+            allow_empty_signatures=True,
+            allow_unnamed_resources=True,
+        )
+        start = time.perf_counter()
+        response: Any = self.algod.simulate_transactions(request)
+        latency = time.perf_counter() - start
+
+        group = response["txn-groups"][0]
+        if group.get("failure-message"):
+            raise SimulateError(group["failure-message"])
+        results = []
+        for (method, _args), txn_result in zip(calls, group["txn-results"]):
+            logs = txn_result["txn-result"].get("logs", [])
+            raw = base64.b64decode(logs[-1]) if logs else b""
+            assert raw.startswith(ABI_RETURN_PREFIX), f"{method.name}: no ABI return"
+            results.append(
+                method.returns.type.decode(raw[len(ABI_RETURN_PREFIX) :])
+            )
+        return latency, results
+
+    def call(self, calls: Sequence[tuple[abi.Method, list[Any]]]) -> list[Any]:
+        """
+        Runs readonly ABI calls, MAX_GROUP_SIZE per simulated group, groups in
+        parallel. Returns the decoded return values in call order. Uncached.
+        """
+        if not calls:
+            return []
+        params = self.algod.suggested_params()
+        groups = [
+            calls[i : i + MAX_GROUP_SIZE] for i in range(0, len(calls), MAX_GROUP_SIZE)
+        ]
+        results: list[Any] = []
+        for latency, group_results in self._pool.map(
+            lambda group: self._simulate_group(group, params), groups
+        ):
+            self.stats.simulate_requests += 1
+            self.stats.latency_total += latency
+            self.stats.latency_max = max(self.stats.latency_max, latency)
+            results += group_results
+        self.stats.app_calls += len(calls)
+        return results
+
+    # ── Counters ──
+    def counter(self, name: str) -> int:
+        """One of COUNTERS, e.g. "get_project_count", cached for `ttl`."""
+        value = self._mutable.get(name)
+        if value is None:
+            (value,) = self.call([(COUNTERS[name], [])])
+            self._mutable.put(name, value)
+        return value  # type: ignore[no-any-return]
+
+    # ── Projects ──
+    def projects(self, project_ids: Sequence[int]) -> list[ProjectView | None]:
+        """Projects by id; None for ids the registry does not have."""
+        project_count = self.counter("get_project_count")
+        views: dict[int, ProjectView | None] = {}
+        full: list[int] = []
+        # Kept with the immutable part found now: the puts below may evict it.
+        headers: list[tuple[int, tuple[str, str, str, str, str]]] = []
+        for pid in dict.fromkeys(project_ids):
+            if pid >= project_count:
+                views[pid] = None
+                continue
+            fixed = self._immutable.get(("project", pid))
+            state = self._mutable.get(("project", pid)) if fixed is not None else None
+            if fixed is None:
+                full.append(pid)
+            elif state is None:
+                headers.append((pid, fixed))
+            else:
+                views[pid] = ProjectView(pid, *fixed, *state)
+
+        results = self.call(
+            [(GET_PROJECT, [pid]) for pid in full]
+            + [(GET_PROJECT_HEADER, [pid]) for pid, _fixed in headers]
+        )
+        for pid, record in zip(full, results):
+            submitter, name, location, ecosystem, cid, status, credits = record
+            self._immutable.put(
+                ("project", pid), (submitter, name, location, ecosystem, cid)
+            )
+            self._mutable.put(("project", pid), (status, credits))
+            views[pid] = ProjectView(pid, *record)
+        for (pid, fixed), (_submitter, status, credits) in zip(
+            headers, results[len(full) :]
+        ):
+            self._mutable.put(("project", pid), (status, credits))
+            views[pid] = ProjectView(pid, *fixed, status, credits)
+        return [views[pid] for pid in project_ids]
+
+    def project(self, project_id: int) -> ProjectView | None:
+        return self.projects([project_id])[0]
+
+    def find_project_by_cid(self, cid: str) -> int | None:
+        """A CID, once filed, stays with its project; misses expire with `ttl`."""
+        pid = self._immutable.get(("cid", cid), count_miss=False)
+        if pid is None and self._mutable.get(("cid", cid)) is None:
+            (pid,) = self.call([(FIND_PROJECT_BY_CID, [cid])])
+            if pid == codec.NO_ID:
+                self._mutable.put(("cid", cid), True)
+                return None
+            self._immutable.put(("cid", cid), pid)
+        return pid  # type: ignore[no-any-return]
+
+    # ── Listings ──
+    def listings(self, listing_ids: Sequence[int]) -> list[ListingView | None]:
+        """Open listings by id; None for closed or unknown ids."""
+        views: dict[int, ListingView | None] = {}
+        missing: list[int] = []
+        for lid in dict.fromkeys(listing_ids):
+            cached = self._mutable.get(("listing", lid))
+            if cached is None:
+                missing.append(lid)
+            else:
+                views[lid] = cached[0]
+        for lid, (seller, amount, price, active) in zip(
+            missing, self.call([(GET_LISTING, [lid]) for lid in missing])
+        ):
+            # get_listing answers closed / unknown ids with a zero record.
+            view = None
+            if active:
+                view = ListingView(lid, seller, amount, price, bool(active))
+            self._mutable.put(("listing", lid), (view,))
+            views[lid] = view
+        return [views[lid] for lid in listing_ids]
+
+    def listing(self, listing_id: int) -> ListingView | None:
+        return self.listings([listing_id])[0]
@@ -0,0 +1,230 @@
+"""
+Stand-in algod serving recorded AarnaRegistry state.
+
+Implements the few `algosdk.v2client.algod.AlgodClient` calls the off-chain
+readers use (`status`, `application_info`, `application_box_by_name`,
+`application_boxes`, `suggested_params`, `simulate_transactions`) over an
+in-memory snapshot of one app's global state and boxes. Snapshots are recorded
+from a live algod with `record` and stored as JSON, so sync code can be
+exercised and benchmarked without a network. Requests are counted per method
+to check how much a reader actually fetched.
+
+Simulate runs no TEAL: the readonly getters `reader.py` calls are answered
+from the recorded boxes, the way the contract computes them.
+"""
+
+import base64
+import json
+import threading
+from collections import Counter
+from pathlib import Path
+from typing import Any
+
+from algosdk import abi, transaction
+from algosdk.encoding import encode_address
+from algosdk.error import AlgodHTTPError
+from algosdk.v2client.algod import AlgodClient
+
+from smart_contracts.aarna_registry import codec, reader
+
+# Readonly counters and the global they return.
+_COUNTER_GLOBALS = {
+    "get_project_count": "project_count",
+    "get_listing_count": "listing_count",
+    "get_open_listing_count": "open_listing_count",
+    "get_total_credits_issued": "total_credits_issued",
+    "get_asset_id": "aarna_asset",
+}
+
+
+def _b64(value: bytes) -> str:
+    return base64.b64encode(value).decode()
+
+
+class RecordedAlgod:
+    def __init__(
+        self,
+        app_id: int,
+        global_state: dict[bytes, int | bytes] | None = None,
+        boxes: dict[bytes, bytes] | None = None,
+        last_round: int = 1,
+        creator: str | None = None,
+    ) -> None:
+        self.app_id = app_id
+        self.global_state = dict(global_state or {})
+        self.boxes = dict(boxes or {})
+        self.last_round = last_round
+        self.creator = creator or encode_address(bytes(32))
+        self.requests: Counter[str] = Counter()
+        self._lock = threading.Lock()
+
+    # ── algod API ──
+    def status(self) -> dict[str, Any]:
+        self._count("status")
+        return {"last-round": self.last_round}
+
+    def application_info(self, application_id: int) -> dict[str, Any]:
+        self._count("application_info")
+        self._check_app(application_id)
+        state = []
+        for key, value in self.global_state.items():
+            if isinstance(value, int):
+                encoded = {"type": 2, "uint": value, "bytes": ""}
+            else:
+                encoded = {"type": 1, "uint": 0, "bytes": _b64(value)}
+            state.append({"key": _b64(key), "value": encoded})
+        return {
+            "id": application_id,
+            "params": {"creator": self.creator, "global-state": state},
+        }
+
+    def application_box_by_name(
+        self, application_id: int, box_name: bytes
+    ) -> dict[str, Any]:
+        self._count("application_box_by_name")
+        self._check_app(application_id)
+        value = self.boxes.get(box_name)
+        if value is None:
+            raise AlgodHTTPError("box not found", code=404)
+        return {"round": self.last_round, "name": _b64(box_name), "value": _b64(value)}
+
+    def application_boxes(self, application_id: int, limit: int = 0) -> dict[str, Any]:
+        self._count("application_boxes")
+        self._check_app(application_id)
+        names = sorted(self.boxes)[:limit] if limit else sorted(self.boxes)
+        return {"round": self.last_round, "boxes": [{"name": _b64(n)} for n in names]}
+
+    def suggested_params(self) -> transaction.SuggestedParams:
+        self._count("suggested_params")
+        return transaction.SuggestedParams(
+            fee=1000,
+            first=self.last_round,
+            last=self.last_round + 1000,
+            gh=_b64(bytes(32)),
+            gen="recorded",
+            flat_fee=True,
+            min_fee=1000,
+        )
+
+    def simulate_transactions(self, request: Any) -> dict[str, Any]:
+        """Runs one group of readonly app calls; stops at the first failure."""
+        self._count("simulate_transactions")
+        (group,) = request.txn_groups
+        results: list[dict[str, Any]] = []
+        response_group: dict[str, Any] = {"txn-results": results}
+        for index, signed in enumerate(group.txns):
+            txn = signed.transaction
+            try:
+                self._check_app(txn.index)
+                selector, *args = txn.app_args
+                method = self._readonly_methods()[selector]
+                returned = self._call(
+                    method,
+                    [arg.type.decode(value) for arg, value in zip(method.args, args)],
+                )
+            except (AlgodHTTPError, LookupError) as e:
+                response_group["failure-message"] = f"transaction {index}: {e!r}"
+                response_group["failed-at"] = [index]
+                break
+            log = reader.ABI_RETURN_PREFIX + method.returns.type.encode(returned)
+            results.append({"txn-result": {"logs": [_b64(log)]}})
+        return {"last-round": self.last_round, "txn-groups": [response_group]}
+
+    @staticmethod
+    def _readonly_methods() -> dict[bytes, abi.Method]:
+        methods = [
+            reader.GET_PROJECT,
+            reader.GET_PROJECT_HEADER,
+            reader.GET_LISTING,
+            reader.FIND_PROJECT_BY_CID,
+            *reader.COUNTERS.values(),
+        ]
+        return {method.get_selector(): method for method in methods}
+
+    def _call(self, method: abi.Method, args: list[Any]) -> Any:
+        if method.name in _COUNTER_GLOBALS:
+            return self.global_state.get(_COUNTER_GLOBALS[method.name].encode(), 0)
+        if method.name == "find_project_by_cid":
+            value = self.boxes.get(codec.cid_index_key(args[0]))
+            return codec.NO_ID if value is None else codec.decode_uint64(value)
+        if method.name == "get_listing":
+            # Closed or never-used ids read back as an all-zero record.
+            value = self.boxes.get(codec.listing_key(args[0]), bytes(56))
+            listing = codec.decode_listing(value)
+            return [encode_address(listing.seller), *listing[1:]]
+        # get_project / get_project_header fail on unknown ids, like the contract.
+        header = codec.decode_header(self.boxes[codec.header_key(args[0])])
+        submitter = encode_address(header.submitter)
+        if method.name == "get_project_header":
+            return [submitter, header.status, header.credits]
+        meta = codec.decode_meta(self.boxes[codec.meta_key(args[0])])
+        return [submitter, *meta, header.status, header.credits]
+
+    def _count(self, method: str) -> None:
+        # Readers call in from thread pools.
+        with self._lock:
+            self.requests[method] += 1
+
+    def _check_app(self, application_id: int) -> None:
+        if application_id != self.app_id:
+            raise AlgodHTTPError("application does not exist", code=404)
+
+    # ── Recording ──
+    @classmethod
+    def record(cls, algod: AlgodClient, app_id: int) -> "RecordedAlgod":
+        """Snapshots the app's global state and every box from a live algod."""
+        status: Any = algod.status()
+        info: Any = algod.application_info(app_id)
+        global_state: dict[bytes, int | bytes] = {}
+        for entry in info["params"].get("global-state", []):
+            value = entry["value"]
+            global_state[base64.b64decode(entry["key"])] = (
+                value["uint"]
+                if value["type"] == 2
+                else base64.b64decode(value["bytes"])
+            )
+        boxes = {}
+        listing: Any = algod.application_boxes(app_id)
+        for box in listing["boxes"]:
+            name = base64.b64decode(box["name"])
+            response: Any = algod.application_box_by_name(app_id, name)
+            boxes[name] = base64.b64decode(response["value"])
+        return cls(
+            app_id, global_state, boxes, status["last-round"], info["params"]["creator"]
+        )
+
+    def save(self, path: Path) -> None:
+        path.write_text(
+            json.dumps(
+                {
+                    "app_id": self.app_id,
+                    "round": self.last_round,
+                    "creator": self.creator,
+                    "global_state": {
+                        _b64(k): v if isinstance(v, int) else {"bytes": _b64(v)}
+                        for k, v in self.global_state.items()
+                    },
+                    "boxes": {_b64(k): _b64(v) for k, v in sorted(self.boxes.items())},
+                },
+                indent=1,
+            )
+        )
+
+    @classmethod
+    def load(cls, path: Path) -> "RecordedAlgod":
+        data = json.loads(path.read_text())
+        return cls(
+            data["app_id"],
+            {
+                base64.b64decode(k): (
+                    v if isinstance(v, int) else base64.b64decode(v["bytes"])
+                )
+                for k, v in data["global_state"].items()
+            },
+            {
+                base64.b64decode(k): base64.b64decode(v)
+                for k, v in data["boxes"].items()
+            },
+            data["round"],
+            data.get("creator"),
+        )
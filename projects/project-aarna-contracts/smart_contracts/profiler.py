@@ -0,0 +1,625 @@
+"""
+Static cost and box I/O profile of compiled contracts.
+
+Works purely offline on the build outputs in `artifacts/<contract>`: the op
+stream and source positions come from `*.approval.puya.map`, the ABI methods
+and box maps from `*.arc56.json`. For every ABI method the worst-case path
+through the router and the method body is found (a loop costs one pass of its
+body before it exits and is flagged, paths ending in `err` are ignored) and
+along it we count opcode cost, box reads and writes with their size, and inner
+transactions. Box keys built by helper subroutines are traced back to their
+box map. Cost is mapped back to the contract source lines that produced it.
+"""
+
+import base64
+import dataclasses
+import json
+import re
+from collections import Counter
+from pathlib import Path
+
+# Opcode costs that differ from 1 (AVM v10/v11). Curve-dependent ops use the
+# most expensive curve so the estimate stays an upper bound.
+op_costs = {
+    "sha256": 35,
+    "keccak256": 130,
+    "sha512_256": 45,
+    "sha3_256": 130,
+    "ed25519verify": 1900,
+    "ed25519verify_bare": 1900,
+    "ecdsa_verify": 2500,
+    "ecdsa_pk_decompress": 2400,
+    "ecdsa_pk_recover": 2000,
+    "vrf_verify": 5700,
+    "falcon_verify": 1700,
+    "divmodw": 20,
+    "expw": 10,
+    "sqrt": 4,
+    "b+": 10,
+    "b-": 10,
+    "b*": 20,
+    "b/": 20,
+    "b%": 20,
+    "b|": 6,
+    "b&": 6,
+    "b^": 6,
+    "b~": 4,
+    "bsqrt": 40,
+}
+
+box_read_ops = {"box_get", "box_extract", "box_len"}
+box_write_ops = {
+    "box_put",
+    "box_replace",
+    "box_splice",
+    "box_create",
+    "box_del",
+    "box_resize",
+}
+# Stack depth of the key operand, counted from the top.
+box_key_depths = {
+    "box_get": 1,
+    "box_len": 1,
+    "box_del": 1,
+    "box_create": 2,
+    "box_put": 2,
+    "box_resize": 2,
+    "box_extract": 3,
+    "box_replace": 3,
+    "box_splice": 4,
+}
+inner_txn_ops = {"itxn_begin", "itxn_next"}
+jump_ops = {"b", "bz", "bnz", "match", "switch"}
+terminal_ops = {"b", "return", "err", "retsub"}
+
+# Sizes of the static ARC-4 types that show up in box values.
+static_type_sizes = {
+    "address": 32,
+    "bool": 1,
+    "byte": 1,
+    "AVMUint64": 8,
+}
+
+metric_names = [
+    "opcodes",
+    "box_reads",
+    "box_read_bytes",
+    "box_writes",
+    "box_write_bytes",
+    "inner_txns",
+]
+
+
+@dataclasses.dataclass
+class Op:
+    pc: int
+    name: str
+    args: list[str]
+    text: str
+    line: int | None
+    # Names of the values on the stack before the op, where puya recorded them.
+    stack: list[str] | None = None
+
+
+@dataclasses.dataclass
+class Block:
+    label: str | None
+    subroutine: str | None
+    ops: list[Op] = dataclasses.field(default_factory=list)
+
+    @property
+    def last(self) -> Op:
+        return self.ops[-1]
+
+
+@dataclasses.dataclass
+class PathCost:
+    """Totals along one path; `lines` is opcode cost per source line."""
+
+    opcodes: int = 0
+    box_reads: int = 0
+    box_read_bytes: int = 0
+    box_writes: int = 0
+    box_write_bytes: int = 0
+    inner_txns: int = 0
+    boxes: frozenset[str] = frozenset()
+    lines: Counter[int] = dataclasses.field(default_factory=Counter)
+
+    def __add__(self, other: "PathCost") -> "PathCost":
+        return PathCost(
+            *(getattr(self, name) + getattr(other, name) for name in metric_names),
+            boxes=self.boxes | other.boxes,
+            lines=self.lines + other.lines,
+        )
+
+    def metrics(self) -> dict[str, int]:
+        return {name: getattr(self, name) for name in metric_names}
+
+
+@dataclasses.dataclass
+class MethodProfile:
+    signature: str
+    cost: PathCost | None
+    has_loops: bool
+    # Static value size of each box map touched; None for dynamic values,
+    # whose reads and writes are left out of the byte totals.
+    box_sizes: dict[str, int | None] = dataclasses.field(default_factory=dict)
+
+
+# ----------------------------- Inputs ----------------------------- #
+
+_vlq_digits = {
+    c: i
+    for i, c in enumerate(
+        "ABCDEFGHIJKLMNOPQRSTUVWXYZabcdefghijklmnopqrstuvwxyz0123456789+/"
+    )
+}
+
+
+def _decode_vlq(segment: str) -> list[int]:
+    values, value, shift = [], 0, 0
+    for char in segment:
+        digit = _vlq_digits[char]
+        value += (digit & 31) << shift
+        if digit & 32:
+            shift += 5
+            continue
+        values.append(-(value >> 1) if value & 1 else value >> 1)
+        value, shift = 0, 0
+    return values
+
+
+def source_lines(source_map: dict) -> dict[int, int]:
+    """Maps each pc to its 1-based line in the contract source (mappings v3)."""
+    lines: dict[int, int] = {}
+    source, line = 0, 0
+    for pc, group in enumerate(source_map["mappings"].split(";")):
+        for segment in filter(None, group.split(",")):
+            fields = _decode_vlq(segment)
+            if len(fields) < 4:
+                continue
+            source += fields[1]
+            line += fields[2]
+            if source_map["sources"][source].endswith("contract.py"):
+                lines.setdefault(pc, line + 1)
+    return lines
+
+
+def load_ops(source_map: dict) -> list[Block]:
+    """Splits the program into basic blocks, labelled where puya named them."""
+    lines = source_lines(source_map)
+    blocks: list[Block] = []
+    ended = True
+    stack: list[str] | None = None
+    for pc, event in sorted(
+        ((int(pc), event) for pc, event in source_map["pc_events"].items()),
+        key=lambda item: item[0],
+    ):
+        text = event["op"]
+        name, *args = text.split("//")[0].split()
+        if "block" in event or ended:
+            blocks.append(Block(event.get("block"), event.get("subroutine")))
+        stack = event.get("stack_in", stack)
+        blocks[-1].ops.append(Op(pc, name, args, text, lines.get(pc), stack))
+        stack = event.get("stack_out")
+        ended = name in terminal_ops or name in jump_ops
+    return blocks
+
+
+def _type_size(type_name: str, structs: dict[str, list[dict]]) -> int | None:
+    if type_name in structs:
+        sizes = [_type_size(field["type"], structs) for field in structs[type_name]]
+        return None if None in sizes else sum(sizes)  # type: ignore[arg-type]
+    if type_name in static_type_sizes:
+        return static_type_sizes[type_name]
+    if match := re.fullmatch(r"u?int(\d+)", type_name):
+        return int(match.group(1)) // 8
+    if match := re.fullmatch(r"(.+)\[(\d+)\]", type_name):
+        element = _type_size(match.group(1), structs)
+        return None if element is None else element * int(match.group(2))
+    return None
+
+
+def box_maps(app_spec: dict) -> dict[bytes, tuple[str, int | None]]:
+    """Key prefix -> (box map name, static value size or None when dynamic)."""
+    structs = app_spec.get("structs", {})
+    return {
+        base64.b64decode(spec["prefix"]): (
+            name,
+            _type_size(spec["valueType"], structs),
+        )
+        for name, spec in app_spec["state"]["maps"]["box"].items()
+    }
+
+
+def _constant_token(op: Op) -> str:
+    """The immediate of a push op, or the value puya comments next to `*c` ops."""
+    if op.name.startswith("push"):
+        return op.text.split("//")[0].split(None, 1)[1].strip()
+    return op.text.split("//")[-1].strip()
+
+
+def _constant_bytes(op: Op) -> bytes | None:
+    if op.name not in ("pushbytes", "bytec") and not op.name.startswith("bytec_"):
+        return None
+    return _bytes_literal(_constant_token(op))
+
+
+def _bytes_literal(token: str) -> bytes | None:
+    if token.startswith("0x"):
+        return bytes.fromhex(token[2:])
+    if token.startswith('"') and token.endswith('"'):
+        return token[1:-1].encode()
+    return None
+
+
+def _constant_int(op: Op) -> int | None:
+    if op.name in ("pushint", "intc") or op.name.startswith("intc_"):
+        token = _constant_token(op)
+        return int(token) if token.isdigit() else None
+    return None
+
+
+def _value_name(name: str) -> str:
+    return name.removesuffix(" (copy)")
+
+
+# ----------------------------- Analysis ----------------------------- #
+
+
+class Program:
+    """Control flow graph of an approval program with memoized path costs."""
+
+    def __init__(self, blocks: list[Block], boxes: dict[bytes, tuple[str, int | None]]):
+        self.blocks = blocks
+        self.boxes = boxes
+        self.by_label = {b.label: i for i, b in enumerate(blocks) if b.label}
+        self.successors = [self._successors(i) for i in range(len(blocks))]
+        self.back_edges = self._find_back_edges()
+        self._own: dict[int, PathCost] = {}
+        self._worst: dict[int, PathCost | None] = {}
+        self._exit: dict[int, PathCost | None] = {}
+        self._prefix: dict[int, PathCost | None] = {}
+        self._key_box: dict[int, tuple[str, int | None] | None] = {}
+        self._calling: set[int] = set()
+        self.key_values = self._find_key_values()
+
+    def _successors(self, index: int) -> list[int]:
+        last = self.blocks[index].last
+        targets = []
+        if last.name in jump_ops:
+            targets = [self.by_label[label] for label in last.args]
+        if last.name not in terminal_ops and index + 1 < len(self.blocks):
+            targets.append(index + 1)
+        return targets
+
+    def _callees(self, index: int) -> list[int]:
+        return [
+            self.by_label[op.args[0]]
+            for op in self.blocks[index].ops
+            if op.name == "callsub"
+        ]
+
+    def _find_back_edges(self) -> set[tuple[int, int]]:
+        back_edges: set[tuple[int, int]] = set()
+        state: dict[int, str] = {}
+        roots = [0] + [c for i in range(len(self.blocks)) for c in self._callees(i)]
+        for root in roots:
+            if root in state:
+                continue
+            state[root] = "open"
+            stack = [(root, iter(self.successors[root]))]
+            while stack:
+                node, children = stack[-1]
+                child = next(children, None)
+                if child is None:
+                    state[node] = "done"
+                    stack.pop()
+                elif state.get(child) == "open":
+                    back_edges.add((node, child))
+                elif child not in state:
+                    state[child] = "open"
+                    stack.append((child, iter(self.successors[child])))
+        return back_edges
+
+    def _forward(self, index: int) -> list[int]:
+        return [s for s in self.successors[index] if (index, s) not in self.back_edges]
+
+    def _forward_reachable(self, index: int) -> set[int]:
+        seen, pending = set(), [index]
+        while pending:
+            node = pending.pop()
+            if node not in seen:
+                seen.add(node)
+                pending.extend(self._forward(node))
+        return seen
+
+    def key_box(self, entry: int) -> tuple[str, int | None] | None:
+        """
+        The box map a subroutine builds keys for: the last box prefix constant
+        in its body, provided it touches no box itself (a `_key(id)` helper).
+        """
+        if entry in self._key_box:
+            return self._key_box[entry]
+        found = None
+        for index in sorted(self._forward_reachable(entry)):
+            for op in self.blocks[index].ops:
+                if op.name in box_read_ops or op.name in box_write_ops:
+                    self._key_box[entry] = None
+                    return None
+                constant = _constant_bytes(op)
+                if constant is not None and constant in self.boxes:
+                    found = self.boxes[constant]
+        self._key_box[entry] = found
+        return found
+
+    def _find_key_values(self) -> dict[tuple[int, str], tuple[str, int | None]]:
+        """
+        Box map of each named stack value that holds a box key, per subroutine:
+        a concat onto a box prefix literal, or the result of a key helper.
+        Lets a key built in one block be traced to a box op in another.
+        """
+        values: dict[tuple[int, str], tuple[str, int | None]] = {}
+        owner = 0
+        for index, block in enumerate(self.blocks):
+            if block.subroutine is not None:
+                owner = index
+            for op, after in zip(block.ops, block.ops[1:]):
+                if not after.stack:
+                    continue
+                box = None
+                if op.name == "concat" and op.stack:
+                    literals = (_bytes_literal(name) for name in op.stack[-2:])
+                    box = next(
+                        (self.boxes[lit] for lit in literals if lit in self.boxes), None
+                    )
+                elif op.name == "callsub":
+                    box = self.key_box(self.by_label[op.args[0]])
+                if box is not None:
+                    values[(owner, _value_name(after.stack[-1]))] = box
+        return values
+
+    def _owner(self, index: int) -> int:
+        while index and self.blocks[index].subroutine is None:
+            index -= 1
+        return index
+
+    def _key_operand(self, index: int, op: Op) -> tuple[str, int | None] | None:
+        depth = box_key_depths.get(op.name)
+        if depth is None or not op.stack or len(op.stack) < depth:
+            return None
+        key = (self._owner(index), _value_name(op.stack[-depth]))
+        return self.key_values.get(key)
+
+    def own_cost(self, index: int) -> PathCost:
+        """Cost of one pass through the block, including subroutines it calls."""
+        if index in self._own:
+            return self._own[index]
+        total = PathCost()
+        current_box: tuple[str, int | None] | None = None
+        previous: Op | None = None
+        for op in self.blocks[index].ops:
+            step = PathCost(opcodes=op_costs.get(op.name, 1))
+            if op.line is not None:
+                step.lines[op.line] += step.opcodes
+            constant = _constant_bytes(op)
+            if constant is not None and constant in self.boxes:
+                current_box = self.boxes[constant]
+            if op.name in box_read_ops or op.name in box_write_ops:
+                box = self._key_operand(index, op) or current_box
+                step = step + self._box_access(op, previous, box)
+            elif op.name in inner_txn_ops:
+                step.inner_txns = 1
+            elif op.name == "callsub":
+                entry = self.by_label[op.args[0]]
+                callee = self.worst(entry)
+                if callee is not None:
+                    step = step + callee
+                current_box = self.key_box(entry) or current_box
+            total = total + step
+            previous = op
+        self._own[index] = total
+        return total
+
+    def _box_access(
+        self, op: Op, previous: Op | None, box: tuple[str, int | None] | None
+    ) -> PathCost:
+        name, size = box if box else ("?", None)
+        # An immediate constant right before the op is the length (box_extract)
+        # or the value (box_replace); otherwise assume the whole box.
+        length = None
+        if previous is not None and op.name == "box_extract":
+            length = _constant_int(previous)
+        elif previous is not None and op.name == "box_replace":
+            value = _constant_bytes(previous)
+            length = None if value is None else len(value)
+        if op.name in ("box_len", "box_del"):
+            length = 0
+        nbytes = length if length is not None else size or 0
+        if op.name in box_read_ops:
+            return PathCost(box_reads=1, box_read_bytes=nbytes, boxes=frozenset([name]))
+        return PathCost(box_writes=1, box_write_bytes=nbytes, boxes=frozenset([name]))
+
+    def worst(self, index: int) -> PathCost | None:
+        """Most expensive successful path from the start of a block to its exit."""
+        if index in self._worst:
+            return self._worst[index]
+        if index in self._calling:
+            return None  # recursion: no static bound
+        self._calling.add(index)
+        own = self.own_cost(index)
+        best: PathCost | None = None
+        if self.blocks[index].last.name in ("return", "retsub"):
+            best = own
+        for successor in self.successors[index]:
+            if (index, successor) in self.back_edges:
+                # Back to the loop header: the pass through the body ends here
+                # and the path leaves the loop from the header.
+                tail = self.loop_exit(successor)
+            else:
+                tail = self.worst(successor)
+            if tail is None:
+                continue
+            if best is None or own.opcodes + tail.opcodes > best.opcodes:
+                best = own + tail
+        self._calling.discard(index)
+        self._worst[index] = best
+        return best
+
+    def loop_exit(self, header: int) -> PathCost | None:
+        """Most expensive path from a loop header out through a loop exit."""
+        if header in self._exit:
+            return self._exit[header]
+        latches = [source for source, target in self.back_edges if target == header]
+        best: PathCost | None = None
+        own = self.own_cost(header)
+        for successor in self._forward(header):
+            inside = self._forward_reachable(successor)
+            if any(latch in inside for latch in latches):
+                continue
+            tail = self.worst(successor)
+            if tail is not None and (
+                best is None or own.opcodes + tail.opcodes > best.opcodes
+            ):
+                best = own + tail
+        self._exit[header] = best
+        return best
+
+    def prefix(self, index: int) -> PathCost | None:
+        """Most expensive path from program entry up to (excluding) a block."""
+        if index == 0:
+            return PathCost()
+        if index in self._prefix:
+            return self._prefix[index]
+        best: PathCost | None = None
+        for pred, successors in enumerate(self.successors):
+            if index in successors and (pred, index) not in self.back_edges:
+                head = self.prefix(pred)
+                if head is not None:
+                    candidate = head + self.own_cost(pred)
+                    if best is None or candidate.opcodes > best.opcodes:
+                        best = candidate
+        self._prefix[index] = best
+        return best
+
+    def reachable(self, index: int) -> set[int]:
+        seen, pending = set(), [index]
+        while pending:
+            node = pending.pop()
+            if node not in seen:
+                seen.add(node)
+                pending.extend(self.successors[node] + self._callees(node))
+        return seen
+
+    def method_entry(self, method_name: str) -> int | None:
+        """The block puya emits for the method's ARC-4 routing (`<name>[routing]`)."""
+        suffix = f".{method_name}[routing]"
+        return next(
+            (
+                index
+                for index, block in enumerate(self.blocks)
+                if block.subroutine and block.subroutine.endswith(suffix)
+            ),
+            None,
+        )
+
+
+def method_signature(method: dict) -> str:
+    args = ",".join(arg["type"] for arg in method["args"])
+    return f"{method['name']}({args}){method['returns']['type']}"
+
+
+def profile_artifacts(output_dir: Path) -> dict[str, MethodProfile]:
+    """Profiles every ABI method of the contract built into `output_dir`."""
+    spec_files = sorted(output_dir.glob("*.arc56.json"))
+    map_files = sorted(output_dir.glob("*.approval.puya.map"))
+    if not spec_files or not map_files:
+        raise Exception(
+            f"No .arc56.json / .approval.puya.map in {output_dir}, build it first"
+        )
+    app_spec = json.loads(spec_files[0].read_text())
+    source_map = json.loads(map_files[0].read_text())
+
+    program = Program(load_ops(source_map), box_maps(app_spec))
+    loop_blocks = {source for source, _ in program.back_edges}
+
+    profiles: dict[str, MethodProfile] = {}
+    for method in app_spec["methods"]:
+        signature = method_signature(method)
+        entry = program.method_entry(method["name"])
+        if entry is None:
+            raise Exception(f"No routing block for {signature} in the source map")
+        head, body = program.prefix(entry), program.worst(entry)
+        cost = None if head is None or body is None else head + body
+        has_loops = bool(program.reachable(entry) & loop_blocks)
+        profiles[signature] = MethodProfile(signature, cost, has_loops)
+        if cost is not None:
+            profiles[signature].box_sizes = {
+                name: size
+                for name, size in program.boxes.values()
+                if name in cost.boxes
+            }
+    return profiles
+
+
+# ----------------------------- Reporting ----------------------------- #
+
+
+def to_baseline(profiles: dict[str, MethodProfile]) -> dict[str, dict[str, int]]:
+    return {
+        signature: profile.cost.metrics()
+        for signature, profile in sorted(profiles.items())
+        if profile.cost is not None
+    }
+
+
+def format_report(
+    contract_name: str, profiles: dict[str, MethodProfile], hot_lines: int = 3
+) -> str:
+    width = max([len("method"), *map(len, profiles)])
+    rows = [
+        f"{contract_name}: worst-case cost per ABI method",
+        f"  {'method':<{width}} {'ops':>6} {'box r (B)':>12} {'box w (B)':>12} "
+        f"{'itxn':>5}",
+    ]
+    for signature, profile in sorted(profiles.items()):
+        cost = profile.cost
+        if cost is None:
+            rows.append(f"  {signature:<{width}} {'unbounded':>6}")
+            continue
+        loops = "  (one pass per loop)" if profile.has_loops else ""
+        rows.append(
+            f"  {signature:<{width}} {cost.opcodes:>6} "
+            f"{f'{cost.box_reads} ({cost.box_read_bytes})':>12} "
+            f"{f'{cost.box_writes} ({cost.box_write_bytes})':>12} "
+            f"{cost.inner_txns:>5}{loops}"
+        )
+        if profile.box_sizes:
+            boxes = ", ".join(
+                f"{name} ({'dynamic' if size is None else f'{size} B'})"
+                for name, size in sorted(profile.box_sizes.items())
+            )
+            rows.append(f"      boxes: {boxes}")
+        hottest = ", ".join(
+            f"contract.py:{line} ({ops})"
+            for line, ops in cost.lines.most_common(hot_lines)
+        )
+        if hottest:
+            rows.append(f"      hot lines: {hottest}")
+    return "\n".join(rows)
+
+
+def diff_baseline(
+    baseline: dict[str, dict[str, int]], current: dict[str, dict[str, int]]
+) -> list[str]:
+    """Human readable regressions: any metric of a known method that went up."""
+    regressions = []
+    for signature, metrics in sorted(current.items()):
+        previous = baseline.get(signature)
+        if previous is None:
+            continue
+        for name in metric_names:
+            before, after = previous.get(name, 0), metrics[name]
+            if after > before:
+                regressions.append(f"{signature}: {name} {before} -> {after}")
+    return regressions
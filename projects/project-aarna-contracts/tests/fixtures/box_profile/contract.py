@@ -0,0 +1,52 @@
+"""
+Fixture for tests/test_profiler.py: a few box accesses of known size.
+
+Rebuild the approval source map and app spec from this directory after
+editing (the clear program's map is not needed):
+
+    puyapy contract.py --output-source-map --no-output-teal --out-dir .
+"""
+
+from algopy import ARC4Contract, BoxMap, Bytes, UInt64, arc4, op, subroutine
+
+
+class Totals(arc4.Struct):
+    count: arc4.UInt64
+    amount: arc4.UInt64
+
+
+@subroutine
+def _total_key(key: UInt64) -> Bytes:
+    return b"t" + op.itob(key)
+
+
+class BoxProfile(ARC4Contract):
+    def __init__(self) -> None:
+        self.totals = BoxMap(UInt64, Totals, key_prefix=b"t")
+        self.notes = BoxMap(UInt64, arc4.String, key_prefix=b"n")
+
+    @arc4.abimethod
+    def put_total(self, key: UInt64, amount: UInt64) -> None:
+        self.totals[key] = Totals(count=arc4.UInt64(1), amount=arc4.UInt64(amount))
+
+    @arc4.abimethod(readonly=True)
+    def read_count(self, key: UInt64) -> UInt64:
+        return op.btoi(op.Box.extract(b"t" + op.itob(key), 0, 8))
+
+    @arc4.abimethod
+    def set_note(self, key: UInt64, note: arc4.String) -> None:
+        self.notes[key] = note
+
+    @arc4.abimethod
+    def drop(self, key: UInt64) -> None:
+        del self.totals[key]
+
+    @arc4.abimethod
+    def sum_counts(self, keys: arc4.DynamicArray[arc4.UInt64]) -> UInt64:
+        total = UInt64(0)
+        for key in keys:
+            total += op.btoi(op.Box.extract(_total_key(key.native), 0, 8))
+        self.totals[keys.length] = Totals(
+            count=arc4.UInt64(total), amount=arc4.UInt64(0)
+        )
+        return total
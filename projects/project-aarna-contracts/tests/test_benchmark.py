@@ -0,0 +1,21 @@
+import pytest
+
+from benchmarks import registry_throughput as bench
+
+
+@pytest.mark.parametrize("issue_batch", ["0", "4"])
+def test_small_run_covers_every_phase(
+    issue_batch: str, capsys: pytest.CaptureFixture[str]
+) -> None:
+    # Default reject ratio, so some reviews emit ProjectRejected.
+    args = bench.parse_args(
+        ["--projects", "12", "--listings", "4", "--churn", "24"]
+        + ["--submitters", "3", "--traders", "4", "--issue-batch", issue_batch]
+    )
+    results = bench.run(args)
+
+    assert list(results["phases"]) == ["submit", "review", "issue", "market"]
+    assert results["phases"]["submit"]["ops"]["submit_project"]["calls"] == 12
+    assert "list_for_sale" in results["phases"]["market"]["ops"]
+    bench.report(results)
+    assert "per open listing=n/a" in capsys.readouterr().out
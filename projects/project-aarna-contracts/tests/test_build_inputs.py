@@ -0,0 +1,39 @@
+from pathlib import Path
+
+import pytest
+
+import smart_contracts.__main__ as build
+
+
+def _write(path: Path, source: str = "") -> Path:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(source)
+    return path
+
+
+def test_local_imports_resolve_relative_imports(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    root = tmp_path / "smart_contracts"
+    monkeypatch.setattr(build, "root_path", root)
+    _write(root / "__init__.py")
+    _write(root / "shared.py")
+    _write(root / "registry" / "__init__.py")
+    _write(root / "registry" / "codec.py", "from ..shared import x\n")
+    _write(root / "registry" / "layout.py")
+    _write(root / "registry" / "events.py")
+    contract = _write(
+        root / "registry" / "contract.py",
+        "from .codec import decode\n"
+        "from . import layout\n"
+        "from smart_contracts.registry import events\n"
+        "import algopy\n",
+    )
+
+    assert build._local_imports(contract) == {
+        (root / "shared.py").resolve(),
+        (root / "registry" / "__init__.py").resolve(),
+        (root / "registry" / "codec.py").resolve(),
+        (root / "registry" / "layout.py").resolve(),
+        (root / "registry" / "events.py").resolve(),
+    }
@@ -0,0 +1,153 @@
+import io
+import struct
+from pathlib import Path
+
+import pytest
+
+from smart_contracts.aarna_registry import codec, columnar
+
+TABLES = ("projects", "project_meta", "listings")
+
+
+def _meta_box(*fields: str) -> bytes:
+    """ARC-4 (string, string, string, string)."""
+    encoded = [struct.pack(">H", len(f.encode())) + f.encode() for f in fields]
+    offsets, offset = b"", 2 * len(fields)
+    for item in encoded:
+        offsets += struct.pack(">H", offset)
+        offset += len(item)
+    return offsets + b"".join(encoded)
+
+
+def _address(seed: int) -> bytes:
+    return bytes((seed + i) % 256 for i in range(32))
+
+
+def _snapshot(projects: int, listings: int) -> list[tuple[bytes, bytes]]:
+    """Registry boxes with distinct fields per record, plus boxes not exported."""
+    boxes = []
+    for pid in range(projects):
+        boxes.append(
+            (codec.header_key(pid), struct.pack(">32sQQ", _address(pid), 2, pid * 7))
+        )
+        boxes.append(
+            (
+                codec.meta_key(pid),
+                _meta_box(f"project {pid}", "Kerala" * pid, "mangrove", f"cid{pid}"),
+            )
+        )
+        boxes.append((codec.cid_index_key(f"cid{pid}"), struct.pack(">Q", pid)))
+    for lid in range(listings):
+        record = struct.pack(">32sQQQ", _address(100 + lid), lid + 1, 10 * lid, lid % 2)
+        boxes.append((codec.listing_key(lid), record))
+        boxes.append((codec.free_listing_key(lid), struct.pack(">QQ", codec.NO_ID, 0)))
+    return boxes
+
+
+def _rows(columns: dict[str, columnar.Column]) -> list[tuple]:
+    names = list(columns)
+    return [
+        tuple(columns[name][i] for name in names) for i in range(len(columns["id"]))
+    ]
+
+
+def _expected(boxes: list[tuple[bytes, bytes]]) -> dict[str, list[tuple]]:
+    """The tables as the one-record codec decoders see them."""
+    tables: dict[str, list[tuple]] = {name: [] for name in TABLES}
+    decoders = {
+        codec.HEADER_PREFIX: ("projects", codec.decode_header),
+        codec.META_PREFIX: ("project_meta", codec.decode_meta),
+        codec.LISTING_PREFIX: ("listings", codec.decode_listing),
+    }
+    for key, value in boxes:
+        if len(key) == 9 and key[:1] in decoders:
+            name, decode = decoders[key[:1]]
+            tables[name].append((codec.decode_uint64(key[1:]), *decode(value)))
+    return tables
+
+
+def _tables_rows(tables: dict[str, dict[str, columnar.Column]]) -> dict[str, list]:
+    return {name: _rows(columns) for name, columns in tables.items()}
+
+
+def test_decode_boxes_matches_the_codec() -> None:
+    boxes = _snapshot(projects=5, listings=4)
+    tables = columnar.decode_boxes(boxes)
+
+    assert _tables_rows(tables) == _expected(boxes)
+    assert list(tables["listings"]) == ["id", "seller", "amount", "price", "active"]
+    assert tables["projects"]["submitter"][3] == _address(3)
+
+
+def test_decode_boxes_of_an_empty_snapshot() -> None:
+    tables = columnar.decode_boxes([])
+    assert _tables_rows(tables) == {name: [] for name in TABLES}
+
+
+def test_iter_dump_reassembles_entries_split_across_reads(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    boxes = _snapshot(projects=6, listings=5)
+    dump = io.BytesIO()
+    assert columnar.write_dump(boxes, dump) == len(boxes)
+
+    # Reads of 7, 13 and 61 bytes split headers, keys and values mid-entry.
+    for read_bytes in (7, 13, 61, len(dump.getvalue())):
+        monkeypatch.setattr(columnar, "_DUMP_READ_BYTES", read_bytes)
+        dump.seek(0)
+        entries = [(bytes(k), bytes(v)) for k, v in columnar.iter_dump(dump)]
+        assert entries == boxes
+
+
+def test_iter_dump_rejects_a_truncated_entry() -> None:
+    dump = io.BytesIO()
+    columnar.write_dump(_snapshot(projects=1, listings=0), dump)
+    truncated = io.BytesIO(dump.getvalue()[:-1])
+    with pytest.raises(AssertionError, match="truncated entry"):
+        list(columnar.iter_dump(truncated))
+
+
+def test_iter_dump_tables_chunks_the_snapshot(monkeypatch: pytest.MonkeyPatch) -> None:
+    boxes = _snapshot(projects=6, listings=5)
+    dump = io.BytesIO()
+    columnar.write_dump(boxes, dump)
+    dump.seek(0)
+    monkeypatch.setattr(columnar, "_DUMP_READ_BYTES", 29)
+
+    merged: dict[str, list] = {name: [] for name in TABLES}
+    chunks = 0
+    for tables in columnar.iter_dump_tables(dump, chunk_records=4):
+        chunks += 1
+        for name, rows in _tables_rows(tables).items():
+            merged[name] += rows
+    assert merged == _expected(boxes)
+    # 6 headers + 6 meta + 5 listings exported, 4 per chunk.
+    assert chunks == 5
+
+
+def test_arrow_table_round_trip() -> None:
+    pytest.importorskip("pyarrow")
+    boxes = _snapshot(projects=3, listings=3)
+    tables = columnar.decode_boxes(boxes)
+
+    for name, expected in _expected(boxes).items():
+        table = columnar.to_arrow_table(tables[name])
+        assert table.column_names == list(tables[name])
+        assert [tuple(row.values()) for row in table.to_pylist()] == expected
+
+
+def test_dump_to_parquet_round_trip(tmp_path: Path) -> None:
+    pytest.importorskip("pyarrow")
+    import pyarrow.parquet as pq
+
+    boxes = _snapshot(projects=7, listings=4)
+    dump_path = tmp_path / "boxes.dump"
+    with dump_path.open("wb") as output:
+        columnar.write_dump(boxes, output)
+
+    rows = columnar.dump_to_parquet(dump_path, tmp_path / "out", chunk_records=5)
+    expected = _expected(boxes)
+    assert rows == {name: len(table) for name, table in expected.items()}
+    for name, table in expected.items():
+        written = pq.read_table(tmp_path / "out" / f"{name}.parquet")
+        assert [tuple(row.values()) for row in written.to_pylist()] == table
@@ -0,0 +1,117 @@
+from collections.abc import Callable, Iterator
+from typing import Any
+
+import pytest
+from algopy import Account, arc4
+from algopy_testing import AlgopyTestContext, algopy_testing_context
+
+from smart_contracts.aarna_registry import codec
+from smart_contracts.aarna_registry.contract import MAX_ISSUE_BATCH, AarnaRegistry
+
+
+class Registry:
+    """An initialised registry with a token and a validator."""
+
+    def __init__(self, ctx: AlgopyTestContext) -> None:
+        self.ctx = ctx
+        self.contract = AarnaRegistry()
+        self.validator = ctx.any.account()
+        admin = ctx.any.account()
+        self.call(admin, self.contract.init)
+        self.call(
+            admin, lambda: self.contract.set_validator(arc4.Address(self.validator))
+        )
+        self.contract.aarna_asset = ctx.any.asset().id
+
+    def call(self, sender: Account, method: Callable[[], Any]) -> Any:
+        with self.ctx.txn.create_group(active_txn_overrides={"sender": sender}):
+            return method()
+
+    def submit(self, submitter: Account, cid: str) -> int:
+        pid = self.call(
+            submitter,
+            lambda: self.contract.submit_project(
+                arc4.String("Mangrove block"),
+                arc4.String("Sundarbans"),
+                arc4.String("mangrove"),
+                arc4.String(cid),
+            ),
+        )
+        return int(pid.native)
+
+    def approve(self, pid: int, credits: int) -> None:
+        self.call(
+            self.validator,
+            lambda: self.contract.approve_project(
+                arc4.UInt64(pid), arc4.UInt64(credits)
+            ),
+        )
+
+    def issue_batch(self, pids: list[int]) -> list[int]:
+        amounts = self.call(
+            self.validator,
+            lambda: self.contract.issue_credits_batch(
+                arc4.DynamicArray[arc4.UInt64](*(arc4.UInt64(pid) for pid in pids))
+            ),
+        )
+        return [int(amount.native) for amount in amounts]
+
+    def header(self, pid: int) -> codec.ProjectHeader:
+        return codec.decode_header(
+            self.ctx.ledger.get_box(self.contract, codec.header_key(pid))
+        )
+
+    def transfers(self) -> list[tuple[bytes, int]]:
+        """(receiver, amount) of each inner transfer the last group made."""
+        return [
+            (itxn.asset_receiver.bytes.value, int(itxn.asset_amount))
+            for group in self.ctx.txn.last_group.itxn_groups
+            for itxn in group
+        ]
+
+
+@pytest.fixture
+def registry() -> Iterator[Registry]:
+    with algopy_testing_context() as ctx:
+        yield Registry(ctx)
+
+
+def test_batch_issues_verified_ids_once_and_skips_the_rest(registry: Registry) -> None:
+    alice, bob = registry.ctx.any.account(), registry.ctx.any.account()
+    verified_a = registry.submit(alice, "bafy-a")
+    verified_b = registry.submit(bob, "bafy-b")
+    pending = registry.submit(alice, "bafy-pending")
+    rejected = registry.submit(bob, "bafy-rejected")
+    registry.approve(verified_a, 300)
+    registry.approve(verified_b, 500)
+    registry.call(
+        registry.validator,
+        lambda: registry.contract.reject_project(arc4.UInt64(rejected)),
+    )
+
+    unknown = 99
+    batch = [verified_a, unknown, pending, verified_a, rejected, verified_b]
+    assert registry.issue_batch(batch) == [300, 0, 0, 0, 0, 500]
+
+    # The repeated id was issued once, in a single inner group.
+    assert registry.transfers() == [(alice.bytes.value, 300), (bob.bytes.value, 500)]
+    assert registry.header(verified_a) == (alice.bytes.value, 4, 300)
+    assert registry.header(verified_b) == (bob.bytes.value, 4, 500)
+    assert registry.header(pending).status == 1
+    assert registry.header(rejected).status == 3
+    for pid in (verified_a, verified_b):
+        key = b"q" + pid.to_bytes(8, "big")
+        assert not registry.ctx.ledger.box_exists(registry.contract, key)
+    contract = registry.contract
+    assert int(contract.total_credits_issued) == 800
+    assert (int(contract.verified_count), int(contract.issued_count)) == (0, 2)
+
+    # Issued ids are skipped on a second pass, with nothing sent.
+    assert registry.issue_batch([verified_b, verified_a]) == [0, 0]
+    assert registry.transfers() == []
+    assert int(contract.total_credits_issued) == 800
+
+
+def test_batch_is_capped_at_max_issue_batch(registry: Registry) -> None:
+    with pytest.raises(AssertionError, match="too many projects for one batch"):
+        registry.issue_batch([0] * (MAX_ISSUE_BATCH + 1))
@@ -0,0 +1,449 @@
+import struct
+from collections import Counter
+from collections.abc import Callable, Iterator
+from typing import Any
+
+import pytest
+from algopy import Account, TransactionType, arc4, gtxn
+from algopy_testing import AlgopyTestContext, algopy_testing_context
+
+from smart_contracts.aarna_registry import codec
+from smart_contracts.aarna_registry.contract import (
+    BOX_BYTE_MBR,
+    BOX_FLAT_MBR,
+    FREE_LINK_MBR,
+    LISTING_DEPOSIT,
+    LISTING_REFUND,
+    AarnaRegistry,
+)
+
+
+class Market:
+    """An initialised registry with a token, driven one transaction group at a time."""
+
+    def __init__(self, ctx: AlgopyTestContext) -> None:
+        self.ctx = ctx
+        self.contract = AarnaRegistry()
+        with ctx.txn.create_group(active_txn_overrides={"sender": ctx.any.account()}):
+            self.contract.init()
+        self.contract.aarna_asset = ctx.any.asset().id
+        self.app = ctx.ledger.get_app(self.contract)
+
+    def payment(
+        self, sender: Account, amount: int, receiver: Account | None = None
+    ) -> gtxn.PaymentTransaction:
+        return self.ctx.any.txn.payment(
+            sender=sender, receiver=receiver or self.app.address, amount=amount
+        )
+
+    def call(
+        self,
+        sender: Account,
+        method: Callable[[], Any],
+        payment: gtxn.PaymentTransaction | None = None,
+    ) -> Any:
+        if payment is None:
+            group = self.ctx.txn.create_group(active_txn_overrides={"sender": sender})
+        else:
+            app_call = self.ctx.any.txn.application_call(sender=sender, app_id=self.app)
+            group = self.ctx.txn.create_group(
+                gtxns=[payment, app_call], active_txn_index=1
+            )
+        with group:
+            return method()
+
+    def list_tokens(
+        self,
+        seller: Account,
+        amount: int,
+        price: int,
+        hint: int | None = None,
+        deposit: int = LISTING_DEPOSIT,
+    ) -> int:
+        """Lists with the price hint a client would look up, unless one is given."""
+        prev_price = (
+            self.contract.get_price_hint(arc4.UInt64(price))
+            if hint is None
+            else arc4.UInt64(hint)
+        )
+        payment = self.payment(seller, deposit)
+        lid = self.call(
+            seller,
+            lambda: self.contract.list_for_sale(
+                arc4.UInt64(amount), arc4.UInt64(price), prev_price, payment
+            ),
+            payment,
+        )
+        return int(lid.native)
+
+    def buy(
+        self, buyer: Account, lid: int, paid: int, quantity: int | None = None
+    ) -> None:
+        payment = self.payment(buyer, paid)
+        if quantity is None:
+            self.call(
+                buyer,
+                lambda: self.contract.buy_listing(arc4.UInt64(lid), payment),
+                payment,
+            )
+        else:
+            self.call(
+                buyer,
+                lambda: self.contract.buy_listing_partial(
+                    arc4.UInt64(lid), arc4.UInt64(quantity), payment
+                ),
+                payment,
+            )
+
+    def sweep(
+        self, buyer: Account, lids: list[int], quantity: int, budget: int, paid: int
+    ) -> tuple[int, int]:
+        payment = self.payment(buyer, paid)
+        result = self.call(
+            buyer,
+            lambda: self.contract.sweep_listings(
+                arc4.DynamicArray[arc4.UInt64](*(arc4.UInt64(lid) for lid in lids)),
+                arc4.UInt64(quantity),
+                arc4.UInt64(budget),
+                payment,
+            ),
+            payment,
+        )
+        return int(result.filled.native), int(result.spent.native)
+
+    def box(self, key: bytes) -> bytes | None:
+        if not self.ctx.ledger.box_exists(self.contract, key):
+            return None
+        return self.ctx.ledger.get_box(self.contract, key)
+
+    def listing(self, lid: int) -> codec.Listing | None:
+        value = self.box(codec.listing_key(lid))
+        return None if value is None else codec.decode_listing(value)
+
+    def level(self, price: int) -> tuple[int, ...] | None:
+        """(prev_price, next_price, head, tail, depth, listings) of a price level."""
+        value = self.box(b"o" + price.to_bytes(8, "big"))
+        return None if value is None else struct.unpack(">6Q", value)
+
+    def cancel(self, seller: Account, lid: int) -> None:
+        self.call(seller, lambda: self.contract.cancel_listing(arc4.UInt64(lid)))
+
+    def free_link(self, lid: int) -> codec.FreeLink | None:
+        value = self.box(codec.free_listing_key(lid))
+        return None if value is None else codec.decode_free_link(value)
+
+    def seller_index(self, seller: Account) -> list[int]:
+        """A seller's open listing ids as stored, page by page."""
+        key = b"t" + seller.bytes.value
+        count = self.box(key)
+        if count is None:
+            return []
+        ids: list[int] = []
+        for page in range((codec.decode_uint64(count) + 127) // 128):
+            value = self.box(key + page.to_bytes(8, "big"))
+            assert value is not None
+            ids += struct.unpack(f">{len(value) // 8}Q", value)
+        assert len(ids) == codec.decode_uint64(count)
+        return ids
+
+    def link(self, lid: int) -> tuple[int, int, int]:
+        """(prev, next, slot) of a listing's order-book link."""
+        value = self.box(b"k" + lid.to_bytes(8, "big"))
+        assert value is not None
+        return struct.unpack(">3Q", value)
+
+    def inner_txns(self) -> list[Any]:
+        return [
+            itxn for group in self.ctx.txn.last_group.itxn_groups for itxn in group
+        ]
+
+    def payouts(self) -> Counter[bytes]:
+        """microAlgo the last group's inner payments sent, per receiver."""
+        paid: Counter[bytes] = Counter()
+        for itxn in self.inner_txns():
+            if itxn.type == TransactionType.Payment:
+                paid[itxn.receiver.bytes.value] += int(itxn.amount)
+        return paid
+
+    def token_transfers(self) -> Counter[bytes]:
+        """AARNA the last group's inner transfers sent, per receiver."""
+        sent: Counter[bytes] = Counter()
+        for itxn in self.inner_txns():
+            if itxn.type == TransactionType.AssetTransfer:
+                sent[itxn.asset_receiver.bytes.value] += int(itxn.asset_amount)
+        return sent
+
+
+def _key(account: Account) -> bytes:
+    return account.bytes.value
+
+
+@pytest.fixture
+def market() -> Iterator[Market]:
+    with algopy_testing_context() as ctx:
+        yield Market(ctx)
+
+
+def test_partial_fills_shrink_the_listing_until_it_closes(market: Market) -> None:
+    seller, buyer = market.ctx.any.account(), market.ctx.any.account()
+    lid = market.list_tokens(seller, 10, 1_000)
+
+    market.buy(buyer, lid, 4_500, quantity=4)
+    assert market.payouts() == {_key(seller): 4_000, _key(buyer): 500}
+    assert market.token_transfers() == {_key(buyer): 4}
+    listing = market.listing(lid)
+    assert listing is not None and (listing.amount, listing.price) == (6, 1_000)
+    assert market.level(1_000) == (0, 0, lid, lid, 6, 1)
+
+    market.buy(buyer, lid, 6_000, quantity=6)
+    assert market.payouts() == {_key(seller): 6_000 + LISTING_REFUND}
+    assert market.token_transfers() == {_key(buyer): 6}
+    assert market.listing(lid) is None
+    assert market.level(1_000) is None
+    assert int(market.contract.escrowed_tokens) == 0
+
+
+@pytest.mark.parametrize(
+    ("payer", "to_app", "amount", "error"),
+    [
+        ("buyer", True, 4_999, "insufficient payment"),
+        ("other", True, 5_000, "payment must come from the caller"),
+        ("buyer", False, 5_000, "payment must go to the app"),
+    ],
+)
+def test_buy_needs_a_grouped_payment_from_the_buyer(
+    market: Market, payer: str, to_app: bool, amount: int, error: str
+) -> None:
+    seller, buyer = market.ctx.any.account(), market.ctx.any.account()
+    lid = market.list_tokens(seller, 5, 1_000)
+    sender = buyer if payer == "buyer" else market.ctx.any.account()
+    payment = market.payment(
+        sender, amount, None if to_app else market.ctx.any.account()
+    )
+
+    with pytest.raises(AssertionError, match=error):
+        market.call(
+            buyer,
+            lambda: market.contract.buy_listing(arc4.UInt64(lid), payment),
+            payment,
+        )
+
+
+def test_sweep_fills_in_order_and_refunds_the_unspent_payment(market: Market) -> None:
+    first, second, buyer = (market.ctx.any.account() for _ in range(3))
+    cheap = market.list_tokens(first, 5, 10)
+    middle = market.list_tokens(second, 5, 20)
+    dear = market.list_tokens(first, 5, 30)
+
+    # 5 @ 10 fill, then 3 @ 20 reach max_quantity; the dear listing is untouched.
+    assert market.sweep(buyer, [cheap, middle, dear], 8, 500, 1_000) == (8, 110)
+    assert market.payouts() == {
+        _key(first): 50 + LISTING_REFUND,
+        _key(second): 60,
+        _key(buyer): 890,
+    }
+    assert market.token_transfers() == {_key(buyer): 8}
+    assert market.listing(cheap) is None
+    remaining = market.listing(middle)
+    assert remaining is not None and remaining.amount == 2
+    untouched = market.listing(dear)
+    assert untouched is not None and untouched.amount == 5
+    assert market.level(20) == (0, 30, middle, middle, 2, 1)
+
+
+def test_sweep_stops_at_the_price_budget_and_skips_closed_ids(market: Market) -> None:
+    seller, buyer = market.ctx.any.account(), market.ctx.any.account()
+    open_lid = market.list_tokens(seller, 10, 30)
+    closed = market.list_tokens(seller, 1, 10)
+    market.buy(buyer, closed, 10)
+
+    # 100 µA buys 3 tokens at 30; the closed id is skipped, not an error.
+    assert market.sweep(buyer, [closed, open_lid], 10, 100, 100) == (3, 90)
+    assert market.payouts() == {_key(seller): 90, _key(buyer): 10}
+    listing = market.listing(open_lid)
+    assert listing is not None and listing.amount == 7
+
+
+def test_sweep_rejects_a_payment_short_of_what_it_spends(market: Market) -> None:
+    seller, buyer = market.ctx.any.account(), market.ctx.any.account()
+    lid = market.list_tokens(seller, 5, 10)
+
+    with pytest.raises(AssertionError, match="insufficient payment"):
+        market.sweep(buyer, [lid], 5, 1_000, 49)
+
+
+def test_price_levels_chain_in_ascending_price_with_fifo_queues(
+    market: Market,
+) -> None:
+    seller = market.ctx.any.account()
+    first_20 = market.list_tokens(seller, 1, 20)
+    at_30 = market.list_tokens(seller, 2, 30)
+    at_10 = market.list_tokens(seller, 3, 10)
+    second_20 = market.list_tokens(seller, 4, 20)
+
+    assert int(market.contract.best_price) == 10
+    assert market.level(10) == (0, 20, at_10, at_10, 3, 1)
+    assert market.level(20) == (10, 30, first_20, second_20, 5, 2)
+    assert market.level(30) == (20, 0, at_30, at_30, 2, 1)
+    assert market.link(first_20)[:2] == (codec.NO_ID, second_20)
+    assert market.link(second_20)[:2] == (first_20, codec.NO_ID)
+
+    # Emptying the middle level splices its neighbours together.
+    buyer = market.ctx.any.account()
+    market.buy(buyer, first_20, 20)
+    market.buy(buyer, second_20, 80)
+    assert market.level(20) is None
+    assert market.level(10) == (0, 30, at_10, at_10, 3, 1)
+    assert market.level(30) == (10, 0, at_30, at_30, 2, 1)
+
+
+@pytest.mark.parametrize(
+    ("price", "hint", "error"),
+    [
+        (25, 25, "price hint not below price"),
+        (25, 15, "price hint not listed"),
+        # 10 is listed but 20 sits between it and 30
+        (30, 10, "stale price hint"),
+        # no hint claims 25 is the cheapest level
+        (25, 0, "stale price hint"),
+    ],
+)
+def test_a_new_level_rejects_a_wrong_prev_price_hint(
+    market: Market, price: int, hint: int, error: str
+) -> None:
+    seller = market.ctx.any.account()
+    market.list_tokens(seller, 1, 10)
+    market.list_tokens(seller, 1, 20)
+
+    with pytest.raises(AssertionError, match=error):
+        market.list_tokens(seller, 1, price, hint=hint)
+
+
+def test_closed_ids_are_reused_last_freed_first(market: Market) -> None:
+    seller = market.ctx.any.account()
+    a, b, c = (market.list_tokens(seller, 1, 10) for _ in range(3))
+    market.cancel(seller, a)
+    market.cancel(seller, c)
+
+    assert market.free_link(a) == (codec.NO_ID, 0)
+    assert market.free_link(c) == (a, 1)
+    assert int(market.contract.free_listing_head) == c
+
+    assert market.list_tokens(seller, 1, 10) == c
+    assert market.free_link(c) is None
+    assert int(market.contract.free_listing_head) == a
+    assert market.list_tokens(seller, 1, 10) == a
+    assert int(market.contract.free_listing_head) == codec.NO_ID
+    assert market.list_tokens(seller, 1, 10) == 3
+    assert int(market.contract.listing_count) == 4
+    assert market.listing(b) is not None
+
+
+def test_listing_deposit_is_refunded_on_close_and_discounted_on_reuse(
+    market: Market,
+) -> None:
+    seller, buyer = market.ctx.any.account(), market.ctx.any.account()
+    with pytest.raises(AssertionError, match="insufficient deposit"):
+        market.list_tokens(seller, 5, 10, deposit=LISTING_DEPOSIT - 1)
+
+    lid = market.list_tokens(seller, 5, 10, deposit=LISTING_DEPOSIT + 1)
+    assert market.payouts() == {_key(seller): 1}
+    market.cancel(seller, lid)
+    assert market.payouts() == {_key(seller): LISTING_REFUND}
+    assert market.token_transfers() == {_key(seller): 5}
+
+    # The freed id's f box is already paid for, so its share comes straight back.
+    assert market.list_tokens(seller, 5, 10) == lid
+    assert market.payouts() == {_key(seller): FREE_LINK_MBR}
+    market.buy(buyer, lid, 50)
+    assert market.payouts() == {_key(seller): 50 + LISTING_REFUND}
+
+
+def _listing_box_mbr(market: Market, sellers: list[Account], prices: set[int]) -> int:
+    keys = [
+        prefix + lid.to_bytes(8, "big")
+        for lid in range(int(market.contract.listing_count))
+        for prefix in (b"l", b"k", b"f")
+    ]
+    keys += [b"o" + price.to_bytes(8, "big") for price in prices]
+    for seller in sellers:
+        count_key = b"t" + _key(seller)
+        value = market.box(count_key)
+        if value is not None:
+            keys.append(count_key)
+            pages = (codec.decode_uint64(value) + 127) // 128
+            keys += [count_key + page.to_bytes(8, "big") for page in range(pages)]
+    return sum(
+        BOX_FLAT_MBR + BOX_BYTE_MBR * (len(key) + len(value))
+        for key in keys
+        if (value := market.box(key)) is not None
+    )
+
+
+def test_held_deposits_cover_every_listing_box(market: Market) -> None:
+    sellers = [market.ctx.any.account() for _ in range(3)]
+    buyer = market.ctx.any.account()
+    prices: set[int] = set()
+    open_listings: dict[int, tuple[Account, int]] = {}
+    for step in range(40):
+        if step % 5 in (3, 4) and open_listings:
+            ordered = sorted(open_listings.items())
+            lid, (owner, cost) = ordered[step % len(ordered)]
+            if step % 5 == 3:
+                market.cancel(owner, lid)
+            else:
+                market.buy(buyer, lid, cost)
+            del open_listings[lid]
+        else:
+            seller, price = sellers[step % 3], 10 * (1 + step % 7)
+            prices.add(price)
+            lid = market.list_tokens(seller, 2, price)
+            open_listings[lid] = (seller, 2 * price)
+
+        free = int(market.contract.listing_count) - len(open_listings)
+        held = len(open_listings) * LISTING_DEPOSIT + free * FREE_LINK_MBR
+        assert _listing_box_mbr(market, sellers, prices) <= held
+
+
+def test_closing_a_listing_swaps_the_sellers_last_id_into_its_slot(
+    market: Market,
+) -> None:
+    seller, other, buyer = (market.ctx.any.account() for _ in range(3))
+    a, b, c, d = (market.list_tokens(seller, 1, 10) for _ in range(4))
+    mine = market.list_tokens(other, 1, 10)
+    assert market.seller_index(seller) == [a, b, c, d]
+    assert [market.link(lid)[2] for lid in (a, b, c, d)] == [0, 1, 2, 3]
+
+    market.cancel(seller, b)
+    assert market.seller_index(seller) == [a, d, c]
+    assert market.link(d)[2] == 1
+    market.buy(buyer, d, 10)
+    assert market.seller_index(seller) == [a, c]
+    assert market.link(c)[2] == 1
+    listed = market.contract.get_listings_by_seller(
+        arc4.Address(seller), arc4.UInt64(0), arc4.UInt64(10)
+    )
+    assert [int(item.native) for item in listed] == [a, c]
+    assert market.seller_index(other) == [mine]
+
+    market.cancel(seller, a)
+    market.cancel(seller, c)
+    assert market.seller_index(seller) == []
+    assert market.box(b"t" + _key(seller)) is None
+
+
+def test_swap_remove_across_index_pages(market: Market) -> None:
+    seller = market.ctx.any.account()
+    lids = [market.list_tokens(seller, 1, 10) for _ in range(130)]
+    page_1 = b"t" + _key(seller) + (1).to_bytes(8, "big")
+    assert len(market.box(page_1) or b"") == 16
+
+    # The last id moves from page 1 into slot 5 of page 0.
+    market.cancel(seller, lids[5])
+    assert market.seller_index(seller) == lids[:5] + [lids[129]] + lids[6:129]
+    assert market.link(lids[129])[2] == 5
+    # Slot 0 takes the new last id; page 1 empties and is deleted.
+    market.cancel(seller, lids[0])
+    expected = [lids[128], *lids[1:5], lids[129], *lids[6:128]]
+    assert market.seller_index(seller) == expected
+    assert market.box(page_1) is None
@@ -0,0 +1,144 @@
+import struct
+
+from smart_contracts.aarna_registry import codec
+from smart_contracts.aarna_registry.mirror import RegistryMirror
+from smart_contracts.aarna_registry.recorded_algod import RecordedAlgod
+
+APP_ID = 1001
+SELLER = bytes(range(32))
+A, B, C, D, E = range(5)
+
+
+def _listing_box(amount: int = 10, price: int = 1_000) -> bytes:
+    return struct.pack(">32sQQQ", SELLER, amount, price, 1)
+
+
+class FreeStack:
+    """Replays the contract's listing-id free list onto a RecordedAlgod."""
+
+    def __init__(self, algod: RecordedAlgod) -> None:
+        self.algod = algod
+        self.head = codec.NO_ID
+        self.pushes = 0
+        self._sync()
+
+    def push(self, lid: int) -> None:
+        self.algod.boxes.pop(codec.listing_key(lid), None)
+        self.algod.boxes[codec.free_listing_key(lid)] = struct.pack(
+            ">QQ", self.head, self.pushes
+        )
+        self.head = lid
+        self.pushes += 1
+        self._sync()
+
+    def pop(self) -> int:
+        lid = self.head
+        value = self.algod.boxes.pop(codec.free_listing_key(lid))
+        self.head = codec.decode_free_link(value).next
+        self.algod.boxes[codec.listing_key(lid)] = _listing_box()
+        self._sync()
+        return lid
+
+    def _sync(self) -> None:
+        self.algod.global_state[b"free_listing_head"] = self.head
+        self.algod.global_state[b"free_listing_pushes"] = self.pushes
+        self.algod.last_round += 1
+
+
+def _open(algod: RecordedAlgod, lid: int) -> None:
+    algod.boxes[codec.listing_key(lid)] = _listing_box()
+    count = algod.global_state.get(b"listing_count", 0)
+    assert isinstance(count, int)
+    algod.global_state[b"listing_count"] = max(count, lid + 1)
+
+
+def _free_list(mirror: RegistryMirror) -> dict[int, int]:
+    return {
+        lid: codec.NO_ID if nxt == -1 else nxt
+        for lid, nxt in mirror.connection.execute(
+            "SELECT id, free_next FROM listings WHERE free_next IS NOT NULL"
+        )
+    }
+
+
+def _active(mirror: RegistryMirror) -> set[int]:
+    return {
+        lid
+        for (lid,) in mirror.connection.execute(
+            "SELECT id FROM listings WHERE active = 1"
+        )
+    }
+
+
+def _free_box_reads(mirror: RegistryMirror) -> int:
+    """Polls once, counting the free-list boxes read."""
+    reads = 0
+    get_box = mirror._get_box
+
+    def counting(name: bytes) -> bytes | None:
+        nonlocal reads
+        reads += name.startswith(codec.FREE_LISTING_PREFIX)
+        return get_box(name)
+
+    mirror._get_box = counting  # type: ignore[method-assign]
+    mirror.poll()
+    mirror._get_box = get_box  # type: ignore[method-assign]
+    return reads
+
+
+def _four_freed() -> tuple[RecordedAlgod, FreeStack, RegistryMirror]:
+    """A -> B -> C -> D on the free list, mirrored."""
+    algod = RecordedAlgod(APP_ID)
+    stack = FreeStack(algod)
+    for lid in (A, B, C, D):
+        _open(algod, lid)
+    for lid in (D, C, B, A):
+        stack.push(lid)
+    mirror = RegistryMirror(algod, APP_ID, max_concurrency=1)
+    mirror.poll()
+    assert _free_list(mirror) == {A: B, B: C, C: D, D: codec.NO_ID}
+    return algod, stack, mirror
+
+
+def test_free_list_rebuilt_after_ids_are_reused_and_refreed() -> None:
+    algod, stack, mirror = _four_freed()
+
+    # All four reused, a fifth listed, then E, C, B freed: B -> C -> E.
+    for _ in range(4):
+        stack.pop()
+    _open(algod, E)
+    for lid in (E, C, B):
+        stack.push(lid)
+    mirror.poll()
+
+    assert _free_list(mirror) == {B: C, C: E, E: codec.NO_ID}
+    assert _active(mirror) == {A, D}
+    mirror.close()
+
+
+def test_same_head_after_pop_and_push_is_rewalked() -> None:
+    algod, stack, mirror = _four_freed()
+
+    # A and B reused, A freed again: the head is A once more, over C.
+    stack.pop()
+    stack.pop()
+    stack.push(A)
+    mirror.poll()
+
+    assert _free_list(mirror) == {A: C, C: D, D: codec.NO_ID}
+    assert _active(mirror) == {B}
+    mirror.close()
+
+
+def test_free_list_walk_stops_at_unmoved_part() -> None:
+    algod, stack, mirror = _four_freed()
+
+    _open(algod, E)
+    stack.push(E)
+
+    # The new top, then A still carrying its old push number.
+    assert _free_box_reads(mirror) == 2
+    assert _free_list(mirror) == {E: A, A: B, B: C, C: D, D: codec.NO_ID}
+    # Nothing moved: no free-list box is read at all.
+    assert _free_box_reads(mirror) == 0
+    mirror.close()
@@ -0,0 +1,88 @@
+import shutil
+from pathlib import Path
+
+import pytest
+
+import smart_contracts.__main__ as build
+from smart_contracts import profiler
+
+FIXTURE = Path(__file__).parent / "fixtures" / "box_profile"
+
+
+@pytest.fixture(scope="module")
+def profiles() -> dict[str, profiler.MethodProfile]:
+    return profiler.profile_artifacts(FIXTURE)
+
+
+def _cost(
+    profiles: dict[str, profiler.MethodProfile], signature: str
+) -> profiler.PathCost:
+    cost = profiles[signature].cost
+    assert cost is not None
+    return cost
+
+
+def test_static_box_write_counts_the_value_size(
+    profiles: dict[str, profiler.MethodProfile],
+) -> None:
+    cost = _cost(profiles, "put_total(uint64,uint64)void")
+    assert (cost.box_writes, cost.box_write_bytes, cost.box_reads) == (1, 16, 0)
+    assert profiles["put_total(uint64,uint64)void"].box_sizes == {"totals": 16}
+
+
+def test_box_extract_counts_its_constant_length(
+    profiles: dict[str, profiler.MethodProfile],
+) -> None:
+    cost = _cost(profiles, "read_count(uint64)uint64")
+    assert (cost.box_reads, cost.box_read_bytes, cost.box_writes) == (1, 8, 0)
+    assert cost.boxes == {"totals"}
+
+
+def test_loop_body_is_counted_once_before_the_loop_exits(
+    profiles: dict[str, profiler.MethodProfile],
+) -> None:
+    # The read sits in the loop body behind a key-building subroutine; the
+    # write comes after the loop.
+    profile = profiles["sum_counts(uint64[])uint64"]
+    cost = _cost(profiles, "sum_counts(uint64[])uint64")
+    assert profile.has_loops
+    assert (cost.box_reads, cost.box_read_bytes) == (1, 8)
+    assert (cost.box_writes, cost.box_write_bytes) == (1, 16)
+    assert cost.boxes == {"totals"}
+
+
+def test_dynamic_and_delete_writes_count_no_bytes(
+    profiles: dict[str, profiler.MethodProfile],
+) -> None:
+    note = _cost(profiles, "set_note(uint64,string)void")
+    assert note.box_write_bytes == 0 and note.box_writes >= 1
+    assert profiles["set_note(uint64,string)void"].box_sizes == {"notes": None}
+    drop = _cost(profiles, "drop(uint64)void")
+    assert (drop.box_writes, drop.box_write_bytes) == (1, 0)
+
+
+def test_diff_baseline_reports_increases_only(
+    profiles: dict[str, profiler.MethodProfile],
+) -> None:
+    current = profiler.to_baseline(profiles)
+    baseline = {signature: dict(metrics) for signature, metrics in current.items()}
+    baseline["put_total(uint64,uint64)void"]["box_write_bytes"] = 8
+    baseline["drop(uint64)void"]["opcodes"] += 5
+    assert profiler.diff_baseline(baseline, current) == [
+        "put_total(uint64,uint64)void: box_write_bytes 8 -> 16"
+    ]
+
+
+def test_profile_fails_without_a_baseline(tmp_path: Path) -> None:
+    artifacts = tmp_path / "artifacts"
+    shutil.copytree(FIXTURE, artifacts / "box_profile")
+    source = tmp_path / "box_profile" / "contract.py"
+    source.parent.mkdir()
+    contract = build.SmartContract(path=source, name="box_profile")
+
+    with pytest.raises(Exception, match="No profile baseline for box_profile"):
+        build.profile_all(artifacts, [contract])
+
+    build.profile_all(artifacts, [contract], update_baseline=True)
+    assert (source.parent / "profile_baseline.json").is_file()
+    build.profile_all(artifacts, [contract])
@@ -0,0 +1,87 @@
+import struct
+
+from algosdk.encoding import encode_address
+
+from smart_contracts.aarna_registry import codec
+from smart_contracts.aarna_registry.reader import ProjectView, RegistryReader
+from smart_contracts.aarna_registry.recorded_algod import RecordedAlgod
+
+APP_ID = 1001
+SUBMITTER = bytes(range(32))
+
+
+def _meta_box(*fields: str) -> bytes:
+    """ARC-4 (string, string, string, string)."""
+    encoded = [struct.pack(">H", len(f.encode())) + f.encode() for f in fields]
+    offsets, offset = b"", 2 * len(fields)
+    for item in encoded:
+        offsets += struct.pack(">H", offset)
+        offset += len(item)
+    return offsets + b"".join(encoded)
+
+
+def _registry(projects: int) -> RecordedAlgod:
+    algod = RecordedAlgod(APP_ID, {b"project_count": projects})
+    for pid in range(projects):
+        algod.boxes[codec.header_key(pid)] = struct.pack(
+            ">32sQQ", SUBMITTER, 2, 100 + pid
+        )
+        algod.boxes[codec.meta_key(pid)] = _meta_box(
+            f"project {pid}", "Kerala", "mangrove", f"cid{pid}"
+        )
+        algod.boxes[codec.cid_index_key(f"cid{pid}")] = struct.pack(">Q", pid)
+    return algod
+
+
+def _view(pid: int, credits: int | None = None) -> ProjectView:
+    return ProjectView(
+        pid,
+        encode_address(SUBMITTER),
+        f"project {pid}",
+        "Kerala",
+        "mangrove",
+        f"cid{pid}",
+        2,
+        100 + pid if credits is None else credits,
+    )
+
+
+def test_header_refresh_reads_each_cache_once() -> None:
+    algod = _registry(2)
+    reader = RegistryReader(algod, APP_ID)
+    assert reader.projects([0, 1]) == [_view(0), _view(1)]
+    assert (reader.stats.hits, reader.stats.misses) == (0, 3)
+
+    algod.boxes[codec.header_key(0)] = struct.pack(">32sQQ", SUBMITTER, 2, 7)
+    reader.invalidate()
+    assert reader.project(0) == _view(0, credits=7)
+    # project_count and the header refetched, the immutable part hit once.
+    assert (reader.stats.hits, reader.stats.misses) == (1, 5)
+    reader.close()
+
+
+def test_header_refresh_survives_eviction_in_the_same_call() -> None:
+    algod = _registry(2)
+    reader = RegistryReader(algod, APP_ID, max_entries=1)
+    assert reader.project(0) == _view(0)
+    reader.invalidate()
+
+    # Fetching project 1 in full evicts project 0's immutable part before
+    # project 0's refreshed header is applied.
+    assert reader.projects([0, 1]) == [_view(0), _view(1)]
+    reader.close()
+
+
+def test_cid_lookup_counts_one_miss_then_one_hit() -> None:
+    reader = RegistryReader(_registry(1), APP_ID)
+    assert reader.find_project_by_cid("cid0") == 0
+    assert (reader.stats.hits, reader.stats.misses) == (0, 1)
+    assert reader.find_project_by_cid("cid0") == 0
+    assert (reader.stats.hits, reader.stats.misses) == (1, 1)
+
+    assert reader.find_project_by_cid("unknown") is None
+    assert (reader.stats.hits, reader.stats.misses) == (1, 2)
+    assert reader.find_project_by_cid("unknown") is None
+    assert (reader.stats.hits, reader.stats.misses) == (2, 2)
+    assert reader.stats.app_calls == 2
+    reader.close()
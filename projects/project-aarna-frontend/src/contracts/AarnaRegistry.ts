@@ -24,7 +24,7 @@ import { SendParams, SendSingleTransactionResult, SendAtomicTransactionComposerR
 import { Address, encodeAddress, modelsv2, OnApplicationComplete, Transaction, TransactionSigner } from 'algosdk'
 import SimulateResponse = modelsv2.SimulateResponse
 
-export const APP_SPEC: Arc56Contract = {"name":"AarnaRegistry","structs":{"ListingRecord":[{"name":"seller","type":"address"},{"name":"amount","type":"uint64"},{"name":"price","type":"uint64"},{"name":"active","type":"uint64"}],"ProjectRecord":[{"name":"submitter","type":"address"},{"name":"name","type":"string"},{"name":"location","type":"string"},{"name":"ecosystem","type":"string"},{"name":"cid","type":"string"},{"name":"status","type":"uint64"},{"name":"credits","type":"uint64"}]},"methods":[{"name":"init","args":[],"returns":{"type":"void"},"actions":{"create":["NoOp"],"call":[]},"readonly":false,"desc":"Deploy the contract and set the caller as admin.","events":[],"recommendations":{}},{"name":"set_validator","args":[{"type":"address","name":"addr"}],"returns":{"type":"void"},"actions":{"create":[],"call":["NoOp"]},"readonly":false,"desc":"Admin assigns a validator address for project reviews.","events":[],"recommendations":{}},{"name":"transfer_admin","args":[{"type":"address","name":"new_admin"}],"returns":{"type":"void"},"actions":{"create":[],"call":["NoOp"]},"readonly":false,"desc":"Admin transfers ownership to a new admin account.","events":[],"recommendations":{}},{"name":"ensure_token","args":[],"returns":{"type":"uint64"},"actions":{"create":[],"call":["NoOp"]},"readonly":false,"desc":"Create the AARNA ASA if it doesn't exist. Returns the ASA ID.","events":[],"recommendations":{}},{"name":"submit_project","args":[{"type":"string","name":"name"},{"type":"string","name":"location"},{"type":"string","name":"ecosystem"},{"type":"string","name":"cid"}],"returns":{"type":"uint64"},"actions":{"create":[],"call":["NoOp"]},"readonly":false,"desc":"Developer submits a new project. Returns the project index.","events":[],"recommendations":{}},{"name":"approve_project","args":[{"type":"uint64","name":"project_id"},{"type":"uint64","name":"credits"}],"returns":{"type":"void"},"actions":{"create":[],"call":["NoOp"]},"readonly":false,"desc":"Validator approves a project and assigns a credit amount.","events":[],"recommendations":{}},{"name":"reject_project","args":[{"type":"uint64","name":"project_id"}],"returns":{"type":"void"},"actions":{"create":[],"call":["NoOp"]},"readonly":false,"desc":"Validator rejects a pending project.","events":[],"recommendations":{}},{"name":"issue_credits","args":[{"type":"uint64","name":"project_id"}],"returns":{"type":"uint64"},"actions":{"create":[],"call":["NoOp"]},"readonly":false,"desc":"Validator issues AARNA tokens to submitter.\nStatus: 2 (verified) → 4 (issued). Prevents double-issuance.","events":[],"recommendations":{}},{"name":"list_for_sale","args":[{"type":"uint64","name":"amount"},{"type":"uint64","name":"price_per_token"}],"returns":{"type":"uint64"},"actions":{"create":[],"call":["NoOp"]},"readonly":false,"desc":"List AARNA tokens for sale using clawback to escrow.\nReturns the listing index.","events":[],"recommendations":{}},{"name":"buy_listing","args":[{"type":"uint64","name":"listing_id"},{"type":"uint64","name":"payment"}],"returns":{"type":"void"},"actions":{"create":[],"call":["NoOp"]},"readonly":false,"desc":"Buy tokens from a listing. Transfers tokens to buyer and ALGO to seller.","events":[],"recommendations":{}},{"name":"cancel_listing","args":[{"type":"uint64","name":"listing_id"}],"returns":{"type":"void"},"actions":{"create":[],"call":["NoOp"]},"readonly":false,"desc":"Seller cancels their listing. Escrowed tokens returned.","events":[],"recommendations":{}},{"name":"get_project_count","args":[],"returns":{"type":"uint64"},"actions":{"create":[],"call":["NoOp"]},"readonly":true,"events":[],"recommendations":{}},{"name":"get_asset_id","args":[],"returns":{"type":"uint64"},"actions":{"create":[],"call":["NoOp"]},"readonly":true,"events":[],"recommendations":{}},{"name":"get_admin","args":[],"returns":{"type":"address"},"actions":{"create":[],"call":["NoOp"]},"readonly":true,"events":[],"recommendations":{}},{"name":"get_validator","args":[],"returns":{"type":"address"},"actions":{"create":[],"call":["NoOp"]},"readonly":true,"events":[],"recommendations":{}},{"name":"get_total_credits_issued","args":[],"returns":{"type":"uint64"},"actions":{"create":[],"call":["NoOp"]},"readonly":true,"events":[],"recommendations":{}},{"name":"get_project","args":[{"type":"uint64","name":"project_id"}],"returns":{"type":"(address,string,string,string,string,uint64,uint64)","struct":"ProjectRecord"},"actions":{"create":[],"call":["NoOp"]},"readonly":true,"events":[],"recommendations":{}},{"name":"get_listing","args":[{"type":"uint64","name":"listing_id"}],"returns":{"type":"(address,uint64,uint64,uint64)","struct":"ListingRecord"},"actions":{"create":[],"call":["NoOp"]},"readonly":true,"events":[],"recommendations":{}},{"name":"get_listing_count","args":[],"returns":{"type":"uint64"},"actions":{"create":[],"call":["NoOp"]},"readonly":true,"events":[],"recommendations":{}}],"arcs":[22,28],"networks":{},"state":{"schema":{"global":{"ints":4,"bytes":2},"local":{"ints":0,"bytes":0}},"keys":{"global":{"admin":{"keyType":"AVMString","valueType":"address","key":"YWRtaW4="},"validator":{"keyType":"AVMString","valueType":"address","key":"dmFsaWRhdG9y"},"aarna_asset":{"keyType":"AVMString","valueType":"AVMUint64","key":"YWFybmFfYXNzZXQ="},"project_count":{"keyType":"AVMString","valueType":"AVMUint64","key":"cHJvamVjdF9jb3VudA=="},"total_credits_issued":{"keyType":"AVMString","valueType":"AVMUint64","key":"dG90YWxfY3JlZGl0c19pc3N1ZWQ="},"listing_count":{"keyType":"AVMString","valueType":"AVMUint64","key":"bGlzdGluZ19jb3VudA=="}},"local":{},"box":{}},"maps":{"global":{},"local":{},"box":{"projects":{"keyType":"uint64","valueType":"ProjectRecord","prefix":"cA=="},"listings":{"keyType":"uint64","valueType":"ListingRecord","prefix":"bA=="}}}},"bareActions":{"create":[],"call":[]},"sourceInfo":{"approval":{"sourceInfo":[{"pc":[890],"errorMessage":"amount must be > 0"},{"pc":[370,468,771,883,975,1116,1157],"errorMessage":"check self.aarna_asset exists"},{"pc":[1169,1260],"errorMessage":"check self.admin exists"},{"pc":[921,984,1079,1246],"errorMessage":"check self.listing_count exists"},{"pc":[996,1091,1236],"errorMessage":"check self.listings entry exists"},{"pc":[544,669,725,779,1146],"errorMessage":"check self.project_count exists"},{"pc":[685,791,1214],"errorMessage":"check self.projects entry exists"},{"pc":[852,1191],"errorMessage":"check self.total_credits_issued exists"},{"pc":[1180,1270],"errorMessage":"check self.validator exists"},{"pc":[677],"errorMessage":"credits must be > 0"},{"pc":[1022],"errorMessage":"insufficient payment"},{"pc":[481,498,515,532],"errorMessage":"invalid array length header"},{"pc":[988,1083],"errorMessage":"invalid listing id"},{"pc":[492,509,526,540],"errorMessage":"invalid number of bytes for arc4.dynamic_array<arc4.uint8>"},{"pc":[331,349],"errorMessage":"invalid number of bytes for arc4.static_array<arc4.uint8, 32>"},{"pc":[652,660,717,764,871,879,963,971,1074,1206,1228],"errorMessage":"invalid number of bytes for arc4.uint64"},{"pc":[673,729,783],"errorMessage":"invalid project id"},{"pc":[357],"errorMessage":"invalid: zero address"},{"pc":[1004,1099],"errorMessage":"listing not active"},{"pc":[885,977],"errorMessage":"no AARNA token"},{"pc":[773],"errorMessage":"no AARNA token created"},{"pc":[1111],"errorMessage":"only seller can cancel"},{"pc":[894],"errorMessage":"price must be > 0"},{"pc":[694,742],"errorMessage":"project not pending"},{"pc":[800],"errorMessage":"project not verified"},{"pc":[1262],"errorMessage":"unauthorized: admin only"},{"pc":[1272],"errorMessage":"unauthorized: validator only"}],"pcOffsetMethod":"none"},"clear":{"sourceInfo":[],"pcOffsetMethod":"none"}},"source":{"approval":"I3ByYWdtYSB2ZXJzaW9uIDExCiNwcmFnbWEgdHlwZXRyYWNrIGZhbHNlCgovLyBhbGdvcHkuYXJjNC5BUkM0Q29udHJhY3QuYXBwcm92YWxfcHJvZ3JhbSgpIC0+IHVpbnQ2NDoKbWFpbjoKICAgIGludGNibG9jayAwIDEgOCA0MAogICAgYnl0ZWNibG9jayAweDE1MWY3Yzc1ICJhYXJuYV9hc3NldCIgInByb2plY3RfY291bnQiICJsaXN0aW5nX2NvdW50IiAiYWRtaW4iIDB4NzAgMHgwMDAwMDAwMDAwMDAwMDAxICJ2YWxpZGF0b3IiICJ0b3RhbF9jcmVkaXRzX2lzc3VlZCIgMHg2YyAweDAwMDAwMDAwMDAwMDAwMDIgMHgwMDAwMDAwMDAwMDAwMDA0IDB4MDAwMDAwMDAwMDAwMDAwMAogICAgdHhuIEFwcGxpY2F0aW9uSUQKICAgIGJueiBtYWluX2FmdGVyX2lmX2Vsc2VAMgogICAgLy8gc21hcnRfY29udHJhY3RzL2Fhcm5hX3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjQzLTQ0CiAgICAvLyAjIOKUgOKUgCBSb2xlLWJhc2VkIGFjY2VzcyBjb250cm9sIOKUgOKUgAogICAgLy8gc2VsZi5hZG1pbjogYXJjNC5BZGRyZXNzID0gYXJjNC5BZGRyZXNzKEdsb2JhbC56ZXJvX2FkZHJlc3MpCiAgICBieXRlYyA0IC8vICJhZG1pbiIKICAgIGdsb2JhbCBaZXJvQWRkcmVzcwogICAgYXBwX2dsb2JhbF9wdXQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hYXJuYV9yZWdpc3RyeS9jb250cmFjdC5weTo0NQogICAgLy8gc2VsZi52YWxpZGF0b3I6IGFyYzQuQWRkcmVzcyA9IGFyYzQuQWRkcmVzcyhHbG9iYWwuemVyb19hZGRyZXNzKQogICAgYnl0ZWMgNyAvLyAidmFsaWRhdG9yIgogICAgZ2xvYmFsIFplcm9BZGRyZXNzCiAgICBhcHBfZ2xvYmFsX3B1dAogICAgLy8gc21hcnRfY29udHJhY3RzL2Fhcm5hX3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjQ3LTQ4CiAgICAvLyAjIOKUgOKUgCBBQVJOQSB0b2tlbiAoQVNBKSDilIDilIAKICAgIC8vIHNlbGYuYWFybmFfYXNzZXQ6IFVJbnQ2NCA9IFVJbnQ2NCgwKQogICAgYnl0ZWNfMSAvLyAiYWFybmFfYXNzZXQiCiAgICBpbnRjXzAgLy8gMAogICAgYXBwX2dsb2JhbF9wdXQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hYXJuYV9yZWdpc3RyeS9jb250cmFjdC5weTo1MC01MQogICAgLy8gIyDilIDilIAgQ291bnRlcnMg4pSA4pSACiAgICAvLyBzZWxmLnByb2plY3RfY291bnQ6IFVJbnQ2NCA9IFVJbnQ2NCgwKQogICAgYnl0ZWNfMiAvLyAicHJvamVjdF9jb3VudCIKICAgIGludGNfMCAvLyAwCiAgICBhcHBfZ2xvYmFsX3B1dAogICAgLy8gc21hcnRfY29udHJhY3RzL2Fhcm5hX3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjUyCiAgICAvLyBzZWxmLnRvdGFsX2NyZWRpdHNfaXNzdWVkOiBVSW50NjQgPSBVSW50NjQoMCkKICAgIGJ5dGVjIDggLy8gInRvdGFsX2NyZWRpdHNfaXNzdWVkIgogICAgaW50Y18wIC8vIDAKICAgIGFwcF9nbG9iYWxfcHV0CiAgICAvLyBzbWFydF9jb250cmFjdHMvYWFybmFfcmVnaXN0cnkvY29udHJhY3QucHk6NTMKICAgIC8vIHNlbGYubGlzdGluZ19jb3VudDogVUludDY0ID0gVUludDY0KDApCiAgICBieXRlY18zIC8vICJsaXN0aW5nX2NvdW50IgogICAgaW50Y18wIC8vIDAKICAgIGFwcF9nbG9iYWxfcHV0CgptYWluX2FmdGVyX2lmX2Vsc2VAMjoKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hYXJuYV9yZWdpc3RyeS9jb250cmFjdC5weTo0MC00MQogICAgLy8gIyDilIDilIAgQ29udHJhY3Qg4pSA4pSA4pSA4pSA4pSA4pSA4pSA4pSA4pSA4pSA4pSA4pSA4pSA4pSA4pSA4pSA4pSA4pSA4pSA4pSA4pSA4pSA4pSA4pSA4pSA4pSA4pSA4pSA4pSA4pSA4pSA4pSA4pSA4pSA4pSA4pSA4pSA4pSA4pSA4pSA4pSA4pSA4pSA4pSA4pSA4pSA4pSA4pSA4pSA4pSA4pSA4pSA4pSA4pSA4pSA4pSA4pSA4pSA4pSA4pSA4pSA4pSA4pSA4pSACiAgICAvLyBjbGFzcyBBYXJuYVJlZ2lzdHJ5KEFSQzRDb250cmFjdCk6CiAgICB0eG4gT25Db21wbGV0aW9uCiAgICAhCiAgICBhc3NlcnQKICAgIHR4biBBcHBsaWNhdGlvbklECiAgICBieiBtYWluX2NyZWF0ZV9Ob09wQDI0CiAgICBwdXNoYnl0ZXNzIDB4ZjEyNmQwNGIgMHhkMzQ4ZmJiMyAweDA4ZmI3YjdjIDB4YTIxYTgwNzcgMHg2NjQ1ZjJmOSAweDIxOTc5OTQzIDB4NjI2MjkwNjUgMHgyMjZmYTIzNyAweDMxOGU0MzIyIDB4NjNkNTViNmMgMHgzMDVlNzViZCAweDViYTIyYTg0IDB4MzQ2YjNkYmMgMHhmMzhlNjk0MSAweDVmMWNkMmRjIDB4MGExYzY1NmUgMHgxNmFlZGU2ZSAweDFkZWJhNGU5IC8vIG1ldGhvZCAic2V0X3ZhbGlkYXRvcihhZGRyZXNzKXZvaWQiLCBtZXRob2QgInRyYW5zZmVyX2FkbWluKGFkZHJlc3Mpdm9pZCIsIG1ldGhvZCAiZW5zdXJlX3Rva2VuKCl1aW50NjQiLCBtZXRob2QgInN1Ym1pdF9wcm9qZWN0KHN0cmluZyxzdHJpbmcsc3RyaW5nLHN0cmluZyl1aW50NjQiLCBtZXRob2QgImFwcHJvdmVfcHJvamVjdCh1aW50NjQsdWludDY0KXZvaWQiLCBtZXRob2QgInJlamVjdF9wcm9qZWN0KHVpbnQ2NCl2b2lkIiwgbWV0aG9kICJpc3N1ZV9jcmVkaXRzKHVpbnQ2NCl1aW50NjQiLCBtZXRob2QgImxpc3RfZm9yX3NhbGUodWludDY0LHVpbnQ2NCl1aW50NjQiLCBtZXRob2QgImJ1eV9saXN0aW5nKHVpbnQ2NCx1aW50NjQpdm9pZCIsIG1ldGhvZCAiY2FuY2VsX2xpc3RpbmcodWludDY0KXZvaWQiLCBtZXRob2QgImdldF9wcm9qZWN0X2NvdW50KCl1aW50NjQiLCBtZXRob2QgImdldF9hc3NldF9pZCgpdWludDY0IiwgbWV0aG9kICJnZXRfYWRtaW4oKWFkZHJlc3MiLCBtZXRob2QgImdldF92YWxpZGF0b3IoKWFkZHJlc3MiLCBtZXRob2QgImdldF90b3RhbF9jcmVkaXRzX2lzc3VlZCgpdWludDY0IiwgbWV0aG9kICJnZXRfcHJvamVjdCh1aW50NjQpKGFkZHJlc3Msc3RyaW5nLHN0cmluZyxzdHJpbmcsc3RyaW5nLHVpbnQ2NCx1aW50NjQpIiwgbWV0aG9kICJnZXRfbGlzdGluZyh1aW50NjQpKGFkZHJlc3MsdWludDY0LHVpbnQ2NCx1aW50NjQpIiwgbWV0aG9kICJnZXRfbGlzdGluZ19jb3VudCgpdWludDY0IgogICAgdHhuYSBBcHBsaWNhdGlvbkFyZ3MgMAogICAgbWF0Y2ggc2V0X3ZhbGlkYXRvciB0cmFuc2Zlcl9hZG1pbiBlbnN1cmVfdG9rZW4gc3VibWl0X3Byb2plY3QgYXBwcm92ZV9wcm9qZWN0IHJlamVjdF9wcm9qZWN0IGlzc3VlX2NyZWRpdHMgbGlzdF9mb3Jfc2FsZSBidXlfbGlzdGluZyBjYW5jZWxfbGlzdGluZyBnZXRfcHJvamVjdF9jb3VudCBnZXRfYXNzZXRfaWQgZ2V0X2FkbWluIGdldF92YWxpZGF0b3IgZ2V0X3RvdGFsX2NyZWRpdHNfaXNzdWVkIGdldF9wcm9qZWN0IGdldF9saXN0aW5nIGdldF9saXN0aW5nX2NvdW50CiAgICBlcnIKCm1haW5fY3JlYXRlX05vT3BAMjQ6CiAgICAvLyBzbWFydF9jb250cmFjdHMvYWFybmFfcmVnaXN0cnkvY29udHJhY3QucHk6NDAtNDEKICAgIC8vICMg4pSA4pSAIENvbnRyYWN0IOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgAogICAgLy8gY2xhc3MgQWFybmFSZWdpc3RyeShBUkM0Q29udHJhY3QpOgogICAgcHVzaGJ5dGVzIDB4ODNmMTQ3NDggLy8gbWV0aG9kICJpbml0KCl2b2lkIgogICAgdHhuYSBBcHBsaWNhdGlvbkFyZ3MgMAogICAgbWF0Y2ggaW5pdAogICAgZXJyCgoKLy8gc21hcnRfY29udHJhY3RzLmFhcm5hX3JlZ2lzdHJ5LmNvbnRyYWN0LkFhcm5hUmVnaXN0cnkuaW5pdFtyb3V0aW5nXSgpIC0+IHZvaWQ6CmluaXQ6CiAgICAvLyBzbWFydF9jb250cmFjdHMvYWFybmFfcmVnaXN0cnkvY29udHJhY3QucHk6NzYKICAgIC8vIHNlbGYuYWRtaW4gPSBhcmM0LkFkZHJlc3MoVHhuLnNlbmRlcikKICAgIGJ5dGVjIDQgLy8gImFkbWluIgogICAgdHhuIFNlbmRlcgogICAgYXBwX2dsb2JhbF9wdXQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hYXJuYV9yZWdpc3RyeS9jb250cmFjdC5weTo3MC03MwogICAgLy8gIyDilZDilZDilZDilZDilZDilZDilZDilZDilZDilZDilZDilZDilZDilZDilZDilZDilZDilZDilZDilZDilZDilZDilZDilZDilZDilZDilZDilZDilZDilZDilZDilZDilZDilZDilZDilZDilZDilZDilZDilZDilZDilZDilZDilZDilZDilZDilZDilZDilZDilZDilZDilZDilZDilZDilZDilZDilZDilZDilZDilZDilZDilZDilZDilZDilZDilZDilZDilZDilZDilZAKICAgIC8vICMgTGlmZWN5Y2xlIC8gQWRtaW4KICAgIC8vICMg4pWQ4pWQ4pWQ4pWQ4pWQ4pWQ4pWQ4pWQ4pWQ4pWQ4pWQ4pWQ4pWQ4pWQ4pWQ4pWQ4pWQ4pWQ4pWQ4pWQ4pWQ4pWQ4pWQ4pWQ4pWQ4pWQ4pWQ4pWQ4pWQ4pWQ4pWQ4pWQ4pWQ4pWQ4pWQ4pWQ4pWQ4pWQ4pWQ4pWQ4pWQ4pWQ4pWQ4pWQ4pWQ4pWQ4pWQ4pWQ4pWQ4pWQ4pWQ4pWQ4pWQ4pWQ4pWQ4pWQ4pWQ4pWQ4pWQ4pWQ4pWQ4pWQ4pWQ4pWQ4pWQ4pWQ4pWQ4pWQ4pWQ4pWQCiAgICAvLyBAYXJjNC5hYmltZXRob2QoY3JlYXRlPSJyZXF1aXJlIikKICAgIGludGNfMSAvLyAxCiAgICByZXR1cm4KCgovLyBzbWFydF9jb250cmFjdHMuYWFybmFfcmVnaXN0cnkuY29udHJhY3QuQWFybmFSZWdpc3RyeS5zZXRfdmFsaWRhdG9yW3JvdXRpbmddKCkgLT4gdm9pZDoKc2V0X3ZhbGlkYXRvcjoKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hYXJuYV9yZWdpc3RyeS9jb250cmFjdC5weTo3OAogICAgLy8gQGFyYzQuYWJpbWV0aG9kCiAgICB0eG5hIEFwcGxpY2F0aW9uQXJncyAxCiAgICBkdXAKICAgIGxlbgogICAgcHVzaGludCAzMgogICAgPT0KICAgIGFzc2VydCAvLyBpbnZhbGlkIG51bWJlciBvZiBieXRlcyBmb3IgYXJjNC5zdGF0aWNfYXJyYXk8YXJjNC51aW50OCwgMzI+CiAgICAvLyBzbWFydF9jb250cmFjdHMvYWFybmFfcmVnaXN0cnkvY29udHJhY3QucHk6ODEKICAgIC8vIHNlbGYuX29ubHlfYWRtaW4oKQogICAgY2FsbHN1YiBfb25seV9hZG1pbgogICAgLy8gc21hcnRfY29udHJhY3RzL2Fhcm5hX3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjgyCiAgICAvLyBzZWxmLnZhbGlkYXRvciA9IGFkZHIuY29weSgpCiAgICBieXRlYyA3IC8vICJ2YWxpZGF0b3IiCiAgICBzd2FwCiAgICBhcHBfZ2xvYmFsX3B1dAogICAgLy8gc21hcnRfY29udHJhY3RzL2Fhcm5hX3JlZ2lzdHJ5L2NvbnRyYWN0LnB5Ojc4CiAgICAvLyBAYXJjNC5hYmltZXRob2QKICAgIGludGNfMSAvLyAxCiAgICByZXR1cm4KCgovLyBzbWFydF9jb250cmFjdHMuYWFybmFfcmVnaXN0cnkuY29udHJhY3QuQWFybmFSZWdpc3RyeS50cmFuc2Zlcl9hZG1pbltyb3V0aW5nXSgpIC0+IHZvaWQ6CnRyYW5zZmVyX2FkbWluOgogICAgLy8gc21hcnRfY29udHJhY3RzL2Fhcm5hX3JlZ2lzdHJ5L2NvbnRyYWN0LnB5Ojg0CiAgICAvLyBAYXJjNC5hYmltZXRob2QKICAgIHR4bmEgQXBwbGljYXRpb25BcmdzIDEKICAgIGR1cAogICAgbGVuCiAgICBwdXNoaW50IDMyCiAgICA9PQogICAgYXNzZXJ0IC8vIGludmFsaWQgbnVtYmVyIG9mIGJ5dGVzIGZvciBhcmM0LnN0YXRpY19hcnJheTxhcmM0LnVpbnQ4LCAzMj4KICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hYXJuYV9yZWdpc3RyeS9jb250cmFjdC5weTo4NwogICAgLy8gc2VsZi5fb25seV9hZG1pbigpCiAgICBjYWxsc3ViIF9vbmx5X2FkbWluCiAgICAvLyBzbWFydF9jb250cmFjdHMvYWFybmFfcmVnaXN0cnkvY29udHJhY3QucHk6ODgKICAgIC8vIGFzc2VydCBuZXdfYWRtaW4ubmF0aXZlICE9IEdsb2JhbC56ZXJvX2FkZHJlc3MsICJpbnZhbGlkOiB6ZXJvIGFkZHJlc3MiCiAgICBkdXAKICAgIGdsb2JhbCBaZXJvQWRkcmVzcwogICAgIT0KICAgIGFzc2VydCAvLyBpbnZhbGlkOiB6ZXJvIGFkZHJlc3MKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hYXJuYV9yZWdpc3RyeS9jb250cmFjdC5weTo4OQogICAgLy8gc2VsZi5hZG1pbiA9IG5ld19hZG1pbi5jb3B5KCkKICAgIGJ5dGVjIDQgLy8gImFkbWluIgogICAgc3dhcAogICAgYXBwX2dsb2JhbF9wdXQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hYXJuYV9yZWdpc3RyeS9jb250cmFjdC5weTo4NAogICAgLy8gQGFyYzQuYWJpbWV0aG9kCiAgICBpbnRjXzEgLy8gMQogICAgcmV0dXJuCgoKLy8gc21hcnRfY29udHJhY3RzLmFhcm5hX3JlZ2lzdHJ5LmNvbnRyYWN0LkFhcm5hUmVnaXN0cnkuZW5zdXJlX3Rva2VuW3JvdXRpbmddKCkgLT4gdm9pZDoKZW5zdXJlX3Rva2VuOgogICAgLy8gc21hcnRfY29udHJhY3RzL2Fhcm5hX3JlZ2lzdHJ5L2NvbnRyYWN0LnB5Ojk3CiAgICAvLyBzZWxmLl9vbmx5X2FkbWluKCkKICAgIGNhbGxzdWIgX29ubHlfYWRtaW4KICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hYXJuYV9yZWdpc3RyeS9jb250cmFjdC5weTo5OAogICAgLy8gaWYgbm90IHNlbGYuYWFybmFfYXNzZXQ6CiAgICBpbnRjXzAgLy8gMAogICAgYnl0ZWNfMSAvLyAiYWFybmFfYXNzZXQiCiAgICBhcHBfZ2xvYmFsX2dldF9leAogICAgYXNzZXJ0IC8vIGNoZWNrIHNlbGYuYWFybmFfYXNzZXQgZXhpc3RzCiAgICBibnogZW5zdXJlX3Rva2VuX2FmdGVyX2lmX2Vsc2VANAogICAgLy8gc21hcnRfY29udHJhY3RzL2Fhcm5hX3JlZ2lzdHJ5L2NvbnRyYWN0LnB5Ojk5LTExMAogICAgLy8gcmVzdWx0ID0gaXR4bi5Bc3NldENvbmZpZygKICAgIC8vICAgICB0b3RhbD0xMF8wMDBfMDAwLAogICAgLy8gICAgIGRlY2ltYWxzPTAsCiAgICAvLyAgICAgZGVmYXVsdF9mcm96ZW49RmFsc2UsCiAgICAvLyAgICAgdW5pdF9uYW1lPSJBQVJOQSIsCiAgICAvLyAgICAgYXNzZXRfbmFtZT0iQWFybmEgQ2FyYm9uIENyZWRpdCIsCiAgICAvLyAgICAgdXJsPSJodHRwczovL2Fhcm5hLmVjbyIsCiAgICAvLyAgICAgbWFuYWdlcj1HbG9iYWwuY3VycmVudF9hcHBsaWNhdGlvbl9hZGRyZXNzLAogICAgLy8gICAgIHJlc2VydmU9R2xvYmFsLmN1cnJlbnRfYXBwbGljYXRpb25fYWRkcmVzcywKICAgIC8vICAgICBmcmVlemU9R2xvYmFsLmN1cnJlbnRfYXBwbGljYXRpb25fYWRkcmVzcywKICAgIC8vICAgICBjbGF3YmFjaz1HbG9iYWwuY3VycmVudF9hcHBsaWNhdGlvbl9hZGRyZXNzLAogICAgLy8gKS5zdWJtaXQoKQogICAgaXR4bl9iZWdpbgogICAgLy8gc21hcnRfY29udHJhY3RzL2Fhcm5hX3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjEwNgogICAgLy8gbWFuYWdlcj1HbG9iYWwuY3VycmVudF9hcHBsaWNhdGlvbl9hZGRyZXNzLAogICAgZ2xvYmFsIEN1cnJlbnRBcHBsaWNhdGlvbkFkZHJlc3MKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hYXJuYV9yZWdpc3RyeS9jb250cmFjdC5weToxMDctMTA5CiAgICAvLyByZXNlcnZlPUdsb2JhbC5jdXJyZW50X2FwcGxpY2F0aW9uX2FkZHJlc3MsCiAgICAvLyBmcmVlemU9R2xvYmFsLmN1cnJlbnRfYXBwbGljYXRpb25fYWRkcmVzcywKICAgIC8vIGNsYXdiYWNrPUdsb2JhbC5jdXJyZW50X2FwcGxpY2F0aW9uX2FkZHJlc3MsCiAgICBkdXBuIDMKICAgIGl0eG5fZmllbGQgQ29uZmlnQXNzZXRDbGF3YmFjawogICAgaXR4bl9maWVsZCBDb25maWdBc3NldEZyZWV6ZQogICAgaXR4bl9maWVsZCBDb25maWdBc3NldFJlc2VydmUKICAgIGl0eG5fZmllbGQgQ29uZmlnQXNzZXRNYW5hZ2VyCiAgICAvLyBzbWFydF9jb250cmFjdHMvYWFybmFfcmVnaXN0cnkvY29udHJhY3QucHk6MTA1CiAgICAvLyB1cmw9Imh0dHBzOi8vYWFybmEuZWNvIiwKICAgIHB1c2hieXRlcyAiaHR0cHM6Ly9hYXJuYS5lY28iCiAgICBpdHhuX2ZpZWxkIENvbmZpZ0Fzc2V0VVJMCiAgICAvLyBzbWFydF9jb250cmFjdHMvYWFybmFfcmVnaXN0cnkvY29udHJhY3QucHk6MTA0CiAgICAvLyBhc3NldF9uYW1lPSJBYXJuYSBDYXJib24gQ3JlZGl0IiwKICAgIHB1c2hieXRlcyAiQWFybmEgQ2FyYm9uIENyZWRpdCIKICAgIGl0eG5fZmllbGQgQ29uZmlnQXNzZXROYW1lCiAgICAvLyBzbWFydF9jb250cmFjdHMvYWFybmFfcmVnaXN0cnkvY29udHJhY3QucHk6MTAzCiAgICAvLyB1bml0X25hbWU9IkFBUk5BIiwKICAgIHB1c2hieXRlcyAiQUFSTkEiCiAgICBpdHhuX2ZpZWxkIENvbmZpZ0Fzc2V0VW5pdE5hbWUKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hYXJuYV9yZWdpc3RyeS9jb250cmFjdC5weToxMDIKICAgIC8vIGRlZmF1bHRfZnJvemVuPUZhbHNlLAogICAgaW50Y18wIC8vIDAKICAgIGl0eG5fZmllbGQgQ29uZmlnQXNzZXREZWZhdWx0RnJvemVuCiAgICAvLyBzbWFydF9jb250cmFjdHMvYWFybmFfcmVnaXN0cnkvY29udHJhY3QucHk6MTAxCiAgICAvLyBkZWNpbWFscz0wLAogICAgaW50Y18wIC8vIDAKICAgIGl0eG5fZmllbGQgQ29uZmlnQXNzZXREZWNpbWFscwogICAgLy8gc21hcnRfY29udHJhY3RzL2Fhcm5hX3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjEwMAogICAgLy8gdG90YWw9MTBfMDAwXzAwMCwKICAgIHB1c2hpbnQgMTAwMDAwMDAKICAgIGl0eG5fZmllbGQgQ29uZmlnQXNzZXRUb3RhbAogICAgLy8gc21hcnRfY29udHJhY3RzL2Fhcm5hX3JlZ2lzdHJ5L2NvbnRyYWN0LnB5Ojk5CiAgICAvLyByZXN1bHQgPSBpdHhuLkFzc2V0Q29uZmlnKAogICAgcHVzaGludCAzIC8vIGFjZmcKICAgIGl0eG5fZmllbGQgVHlwZUVudW0KICAgIGludGNfMCAvLyAwCiAgICBpdHhuX2ZpZWxkIEZlZQogICAgLy8gc21hcnRfY29udHJhY3RzL2Fhcm5hX3JlZ2lzdHJ5L2NvbnRyYWN0LnB5Ojk5LTExMAogICAgLy8gcmVzdWx0ID0gaXR4bi5Bc3NldENvbmZpZygKICAgIC8vICAgICB0b3RhbD0xMF8wMDBfMDAwLAogICAgLy8gICAgIGRlY2ltYWxzPTAsCiAgICAvLyAgICAgZGVmYXVsdF9mcm96ZW49RmFsc2UsCiAgICAvLyAgICAgdW5pdF9uYW1lPSJBQVJOQSIsCiAgICAvLyAgICAgYXNzZXRfbmFtZT0iQWFybmEgQ2FyYm9uIENyZWRpdCIsCiAgICAvLyAgICAgdXJsPSJodHRwczovL2Fhcm5hLmVjbyIsCiAgICAvLyAgICAgbWFuYWdlcj1HbG9iYWwuY3VycmVudF9hcHBsaWNhdGlvbl9hZGRyZXNzLAogICAgLy8gICAgIHJlc2VydmU9R2xvYmFsLmN1cnJlbnRfYXBwbGljYXRpb25fYWRkcmVzcywKICAgIC8vICAgICBmcmVlemU9R2xvYmFsLmN1cnJlbnRfYXBwbGljYXRpb25fYWRkcmVzcywKICAgIC8vICAgICBjbGF3YmFjaz1HbG9iYWwuY3VycmVudF9hcHBsaWNhdGlvbl9hZGRyZXNzLAogICAgLy8gKS5zdWJtaXQoKQogICAgaXR4bl9zdWJtaXQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hYXJuYV9yZWdpc3RyeS9jb250cmFjdC5weToxMTEKICAgIC8vIHNlbGYuYWFybmFfYXNzZXQgPSByZXN1bHQuY3JlYXRlZF9hc3NldC5pZAogICAgYnl0ZWNfMSAvLyAiYWFybmFfYXNzZXQiCiAgICBpdHhuIENyZWF0ZWRBc3NldElECiAgICBhcHBfZ2xvYmFsX3B1dAoKZW5zdXJlX3Rva2VuX2FmdGVyX2lmX2Vsc2VANDoKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hYXJuYV9yZWdpc3RyeS9jb250cmFjdC5weToxMTIKICAgIC8vIHJldHVybiBhcmM0LlVJbnQ2NChzZWxmLmFhcm5hX2Fzc2V0KQogICAgaW50Y18wIC8vIDAKICAgIGJ5dGVjXzEgLy8gImFhcm5hX2Fzc2V0IgogICAgYXBwX2dsb2JhbF9nZXRfZXgKICAgIGFzc2VydCAvLyBjaGVjayBzZWxmLmFhcm5hX2Fzc2V0IGV4aXN0cwogICAgaXRvYgogICAgLy8gc21hcnRfY29udHJhY3RzL2Fhcm5hX3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjkxLTk0CiAgICAvLyAjIOKVkOKVkOKVkOKVkOKVkOKVkOKVkOKVkOKVkOKVkOKVkOKVkOKVkOKVkOKVkOKVkOKVkOKVkOKVkOKVkOKVkOKVkOKVkOKVkOKVkOKVkOKVkOKVkOKVkOKVkOKVkOKVkOKVkOKVkOKVkOKVkOKVkOKVkOKVkOKVkOKVkOKVkOKVkOKVkOKVkOKVkOKVkOKVkOKVkOKVkOKVkOKVkOKVkOKVkOKVkOKVkOKVkOKVkOKVkOKVkOKVkOKVkOKVkOKVkOKVkOKVkOKVkOKVkOKVkOKVkAogICAgLy8gIyBBQVJOQSBUb2tlbgogICAgLy8gIyDilZDilZDilZDilZDilZDilZDilZDilZDilZDilZDilZDilZDilZDilZDilZDilZDilZDilZDilZDilZDilZDilZDilZDilZDilZDilZDilZDilZDilZDilZDilZDilZDilZDilZDilZDilZDilZDilZDilZDilZDilZDilZDilZDilZDilZDilZDilZDilZDilZDilZDilZDilZDilZDilZDilZDilZDilZDilZDilZDilZDilZDilZDilZDilZDilZDilZDilZDilZDilZDilZAKICAgIC8vIEBhcmM0LmFiaW1ldGhvZAogICAgYnl0ZWNfMCAvLyAweDE1MWY3Yzc1CiAgICBzd2FwCiAgICBjb25jYXQKICAgIGxvZwogICAgaW50Y18xIC8vIDEKICAgIHJldHVybgoKCi8vIHNtYXJ0X2NvbnRyYWN0cy5hYXJuYV9yZWdpc3RyeS5jb250cmFjdC5BYXJuYVJlZ2lzdHJ5LnN1Ym1pdF9wcm9qZWN0W3JvdXRpbmddKCkgLT4gdm9pZDoKc3VibWl0X3Byb2plY3Q6CiAgICAvLyBzbWFydF9jb250cmFjdHMvYWFybmFfcmVnaXN0cnkvY29udHJhY3QucHk6MTE0LTExNwogICAgLy8gIyDilZDilZDilZDilZDilZDilZDilZDilZDilZDilZDilZDilZDilZDilZDilZDilZDilZDilZDilZDilZDilZDilZDilZDilZDilZDilZDilZDilZDilZDilZDilZDilZDilZDilZDilZDilZDilZDilZDilZDilZDilZDilZDilZDilZDilZDilZDilZDilZDilZDilZDilZDilZDilZDilZDilZDilZDilZDilZDilZDilZDilZDilZDilZDilZDilZDilZDilZDilZDilZDilZAKICAgIC8vICMgUHJvamVjdCBMaWZlY3ljbGUKICAgIC8vICMg4pWQ4pWQ4pWQ4pWQ4pWQ4pWQ4pWQ4pWQ4pWQ4pWQ4pWQ4pWQ4pWQ4pWQ4pWQ4pWQ4pWQ4pWQ4pWQ4pWQ4pWQ4pWQ4pWQ4pWQ4pWQ4pWQ4pWQ4pWQ4pWQ4pWQ4pWQ4pWQ4pWQ4pWQ4pWQ4pWQ4pWQ4pWQ4pWQ4pWQ4pWQ4pWQ4pWQ4pWQ4pWQ4pWQ4pWQ4pWQ4pWQ4pWQ4pWQ4pWQ4pWQ4pWQ4pWQ4pWQ4pWQ4pWQ4pWQ4pWQ4pWQ4pWQ4pWQ4pWQ4pWQ4pWQ4pWQ4pWQ4pWQ4pWQCiAgICAvLyBAYXJjNC5hYmltZXRob2QKICAgIHR4bmEgQXBwbGljYXRpb25BcmdzIDEKICAgIGR1cAogICAgaW50Y18wIC8vIDAKICAgIGV4dHJhY3RfdWludDE2IC8vIG9uIGVycm9yOiBpbnZhbGlkIGFycmF5IGxlbmd0aCBoZWFkZXIKICAgIHB1c2hpbnQgMgogICAgKwogICAgZGlnIDEKICAgIGxlbgogICAgZHVwCiAgICB1bmNvdmVyIDIKICAgID09CiAgICBhc3NlcnQgLy8gaW52YWxpZCBudW1iZXIgb2YgYnl0ZXMgZm9yIGFyYzQuZHluYW1pY19hcnJheTxhcmM0LnVpbnQ4PgogICAgdHhuYSBBcHBsaWNhdGlvbkFyZ3MgMgogICAgZHVwCiAgICBpbnRjXzAgLy8gMAogICAgZXh0cmFjdF91aW50MTYgLy8gb24gZXJyb3I6IGludmFsaWQgYXJyYXkgbGVuZ3RoIGhlYWRlcgogICAgcHVzaGludCAyCiAgICArCiAgICBkaWcgMQogICAgbGVuCiAgICBkdXAKICAgIHVuY292ZXIgMgogICAgPT0KICAgIGFzc2VydCAvLyBpbnZhbGlkIG51bWJlciBvZiBieXRlcyBmb3IgYXJjNC5keW5hbWljX2FycmF5PGFyYzQudWludDg+CiAgICB0eG5hIEFwcGxpY2F0aW9uQXJncyAzCiAgICBkdXAKICAgIGludGNfMCAvLyAwCiAgICBleHRyYWN0X3VpbnQxNiAvLyBvbiBlcnJvcjogaW52YWxpZCBhcnJheSBsZW5ndGggaGVhZGVyCiAgICBwdXNoaW50IDIKICAgICsKICAgIGRpZyAxCiAgICBsZW4KICAgIGR1cAogICAgdW5jb3ZlciAyCiAgICA9PQogICAgYXNzZXJ0IC8vIGludmFsaWQgbnVtYmVyIG9mIGJ5dGVzIGZvciBhcmM0LmR5bmFtaWNfYXJyYXk8YXJjNC51aW50OD4KICAgIHR4bmEgQXBwbGljYXRpb25BcmdzIDQKICAgIGR1cAogICAgaW50Y18wIC8vIDAKICAgIGV4dHJhY3RfdWludDE2IC8vIG9uIGVycm9yOiBpbnZhbGlkIGFycmF5IGxlbmd0aCBoZWFkZXIKICAgIHB1c2hpbnQgMgogICAgKwogICAgZGlnIDEKICAgIGxlbgogICAgPT0KICAgIGFzc2VydCAvLyBpbnZhbGlkIG51bWJlciBvZiBieXRlcyBmb3IgYXJjNC5keW5hbWljX2FycmF5PGFyYzQudWludDg+CiAgICAvLyBzbWFydF9jb250cmFjdHMvYWFybmFfcmVnaXN0cnkvY29udHJhY3QucHk6MTI2CiAgICAvLyBpZHggPSBzZWxmLnByb2plY3RfY291bnQKICAgIGludGNfMCAvLyAwCiAgICBieXRlY18yIC8vICJwcm9qZWN0X2NvdW50IgogICAgYXBwX2dsb2JhbF9nZXRfZXgKICAgIGFzc2VydCAvLyBjaGVjayBzZWxmLnByb2plY3RfY291bnQgZXhpc3RzCiAgICAvLyBzbWFydF9jb250cmFjdHMvYWFybmFfcmVnaXN0cnkvY29udHJhY3QucHk6MTI4CiAgICAvLyBzdWJtaXR0ZXI9YXJjNC5BZGRyZXNzKFR4bi5zZW5kZXIpLAogICAgdHhuIFNlbmRlcgogICAgLy8gc21hcnRfY29udHJhY3RzL2Fhcm5hX3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjEyNy0xMzUKICAgIC8vIHNlbGYucHJvamVjdHNbaWR4XSA9IFByb2plY3RSZWNvcmQoCiAgICAvLyAgICAgc3VibWl0dGVyPWFyYzQuQWRkcmVzcyhUeG4uc2VuZGVyKSwKICAgIC8vICAgICBuYW1lPW5hbWUsCiAgICAvLyAgICAgbG9jYXRpb249bG9jYXRpb24sCiAgICAvLyAgICAgZWNvc3lzdGVtPWVjb3N5c3RlbSwKICAgIC8vICAgICBjaWQ9Y2lkLAogICAgLy8gICAgIHN0YXR1cz1hcmM0LlVJbnQ2NCgxKSwKICAgIC8vICAgICBjcmVkaXRzPWFyYzQuVUludDY0KDApLAogICAgLy8gKQogICAgcHVzaGJ5dGVzIDB4MDAzOAogICAgY29uY2F0CiAgICBwdXNoaW50IDU2CiAgICB1bmNvdmVyIDgKICAgICsKICAgIGR1cAogICAgaXRvYgogICAgZXh0cmFjdCA2IDIKICAgIHVuY292ZXIgMgogICAgc3dhcAogICAgY29uY2F0CiAgICBzd2FwCiAgICB1bmNvdmVyIDYKICAgICsKICAgIGR1cAogICAgaXRvYgogICAgZXh0cmFjdCA2IDIKICAgIHVuY292ZXIgMgogICAgc3dhcAogICAgY29uY2F0CiAgICBzd2FwCiAgICB1bmNvdmVyIDQKICAgICsKICAgIGl0b2IKICAgIGV4dHJhY3QgNiAyCiAgICBjb25jYXQKICAgIHB1c2hieXRlcyAweDAwMDAwMDAwMDAwMDAwMDEwMDAwMDAwMDAwMDAwMDAwCiAgICBjb25jYXQKICAgIHVuY292ZXIgNQogICAgY29uY2F0CiAgICB1bmNvdmVyIDQKICAgIGNvbmNhdAogICAgdW5jb3ZlciAzCiAgICBjb25jYXQKICAgIHVuY292ZXIgMgogICAgY29uY2F0CiAgICAvLyBzbWFydF9jb250cmFjdHMvYWFybmFfcmVnaXN0cnkvY29udHJhY3QucHk6MTI3CiAgICAvLyBzZWxmLnByb2plY3RzW2lkeF0gPSBQcm9qZWN0UmVjb3JkKAogICAgZGlnIDEKICAgIGl0b2IKICAgIGJ5dGVjIDUgLy8gMHg3MAogICAgZGlnIDEKICAgIGNvbmNhdAogICAgLy8gc21hcnRfY29udHJhY3RzL2Fhcm5hX3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjEyNy0xMzUKICAgIC8vIHNlbGYucHJvamVjdHNbaWR4XSA9IFByb2plY3RSZWNvcmQoCiAgICAvLyAgICAgc3VibWl0dGVyPWFyYzQuQWRkcmVzcyhUeG4uc2VuZGVyKSwKICAgIC8vICAgICBuYW1lPW5hbWUsCiAgICAvLyAgICAgbG9jYXRpb249bG9jYXRpb24sCiAgICAvLyAgICAgZWNvc3lzdGVtPWVjb3N5c3RlbSwKICAgIC8vICAgICBjaWQ9Y2lkLAogICAgLy8gICAgIHN0YXR1cz1hcmM0LlVJbnQ2NCgxKSwKICAgIC8vICAgICBjcmVkaXRzPWFyYzQuVUludDY0KDApLAogICAgLy8gKQogICAgZHVwCiAgICBib3hfZGVsCiAgICBwb3AKICAgIHVuY292ZXIgMgogICAgYm94X3B1dAogICAgLy8gc21hcnRfY29udHJhY3RzL2Fhcm5hX3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjEzNgogICAgLy8gc2VsZi5wcm9qZWN0X2NvdW50ID0gaWR4ICsgVUludDY0KDEpCiAgICBzd2FwCiAgICBpbnRjXzEgLy8gMQogICAgKwogICAgYnl0ZWNfMiAvLyAicHJvamVjdF9jb3VudCIKICAgIHN3YXAKICAgIGFwcF9nbG9iYWxfcHV0CiAgICAvLyBzbWFydF9jb250cmFjdHMvYWFybmFfcmVnaXN0cnkvY29udHJhY3QucHk6MTE0LTExNwogICAgLy8gIyDilZDilZDilZDilZDilZDilZDilZDilZDilZDilZDilZDilZDilZDilZDilZDilZDilZDilZDilZDilZDilZDilZDilZDilZDilZDilZDilZDilZDilZDilZDilZDilZDilZDilZDilZDilZDilZDilZDilZDilZDilZDilZDilZDilZDilZDilZDilZDilZDilZDilZDilZDilZDilZDilZDilZDilZDilZDilZDilZDilZDilZDilZDilZDilZDilZDilZDilZDilZDilZDilZAKICAgIC8vICMgUHJvamVjdCBMaWZlY3ljbGUKICAgIC8vICMg4pWQ4pWQ4pWQ4pWQ4pWQ4pWQ4pWQ4pWQ4pWQ4pWQ4pWQ4pWQ4pWQ4pWQ4pWQ4pWQ4pWQ4pWQ4pWQ4pWQ4pWQ4pWQ4pWQ4pWQ4pWQ4pWQ4pWQ4pWQ4pWQ4pWQ4pWQ4pWQ4pWQ4pWQ4pWQ4pWQ4pWQ4pWQ4pWQ4pWQ4pWQ4pWQ4pWQ4pWQ4pWQ4pWQ4pWQ4pWQ4pWQ4pWQ4pWQ4pWQ4pWQ4pWQ4pWQ4pWQ4pWQ4pWQ4pWQ4pWQ4pWQ4pWQ4pWQ4pWQ4pWQ4pWQ4pWQ4pWQ4pWQ4pWQCiAgICAvLyBAYXJjNC5hYmltZXRob2QKICAgIGJ5dGVjXzAgLy8gMHgxNTFmN2M3NQogICAgc3dhcAogICAgY29uY2F0CiAgICBsb2cKICAgIGludGNfMSAvLyAxCiAgICByZXR1cm4KCgovLyBzbWFydF9jb250cmFjdHMuYWFybmFfcmVnaXN0cnkuY29udHJhY3QuQWFybmFSZWdpc3RyeS5hcHByb3ZlX3Byb2plY3Rbcm91dGluZ10oKSAtPiB2b2lkOgphcHByb3ZlX3Byb2plY3Q6CiAgICAvLyBzbWFydF9jb250cmFjdHMvYWFybmFfcmVnaXN0cnkvY29udHJhY3QucHk6MTM5CiAgICAvLyBAYXJjNC5hYmltZXRob2QKICAgIHR4bmEgQXBwbGljYXRpb25BcmdzIDEKICAgIGR1cAogICAgbGVuCiAgICBpbnRjXzIgLy8gOAogICAgPT0KICAgIGFzc2VydCAvLyBpbnZhbGlkIG51bWJlciBvZiBieXRlcyBmb3IgYXJjNC51aW50NjQKICAgIHR4bmEgQXBwbGljYXRpb25BcmdzIDIKICAgIGR1cAogICAgbGVuCiAgICBpbnRjXzIgLy8gOAogICAgPT0KICAgIGFzc2VydCAvLyBpbnZhbGlkIG51bWJlciBvZiBieXRlcyBmb3IgYXJjNC51aW50NjQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hYXJuYV9yZWdpc3RyeS9jb250cmFjdC5weToxNDIKICAgIC8vIHNlbGYuX29ubHlfdmFsaWRhdG9yKCkKICAgIGNhbGxzdWIgX29ubHlfdmFsaWRhdG9yCiAgICAvLyBzbWFydF9jb250cmFjdHMvYWFybmFfcmVnaXN0cnkvY29udHJhY3QucHk6MTQzCiAgICAvLyBwaWQgPSBwcm9qZWN0X2lkLm5hdGl2ZQogICAgc3dhcAogICAgYnRvaQogICAgLy8gc21hcnRfY29udHJhY3RzL2Fhcm5hX3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjE0NAogICAgLy8gYXNzZXJ0IHBpZCA8IHNlbGYucHJvamVjdF9jb3VudCwgImludmFsaWQgcHJvamVjdCBpZCIKICAgIGludGNfMCAvLyAwCiAgICBieXRlY18yIC8vICJwcm9qZWN0X2NvdW50IgogICAgYXBwX2dsb2JhbF9nZXRfZXgKICAgIGFzc2VydCAvLyBjaGVjayBzZWxmLnByb2plY3RfY291bnQgZXhpc3RzCiAgICBkaWcgMQogICAgPgogICAgYXNzZXJ0IC8vIGludmFsaWQgcHJvamVjdCBpZAogICAgLy8gc21hcnRfY29udHJhY3RzL2Fhcm5hX3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjE0NQogICAgLy8gYXNzZXJ0IGNyZWRpdHMubmF0aXZlID4gVUludDY0KDApLCAiY3JlZGl0cyBtdXN0IGJlID4gMCIKICAgIGRpZyAxCiAgICBidG9pCiAgICBhc3NlcnQgLy8gY3JlZGl0cyBtdXN0IGJlID4gMAogICAgLy8gc21hcnRfY29udHJhY3RzL2Fhcm5hX3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjE0NgogICAgLy8gcmVjb3JkID0gc2VsZi5wcm9qZWN0c1twaWRdLmNvcHkoKQogICAgaXRvYgogICAgYnl0ZWMgNSAvLyAweDcwCiAgICBzd2FwCiAgICBjb25jYXQKICAgIGR1cAogICAgYm94X2dldAogICAgYXNzZXJ0IC8vIGNoZWNrIHNlbGYucHJvamVjdHMgZW50cnkgZXhpc3RzCiAgICAvLyBzbWFydF9jb250cmFjdHMvYWFybmFfcmVnaXN0cnkvY29udHJhY3QucHk6MTQ2LTE0NwogICAgLy8gcmVjb3JkID0gc2VsZi5wcm9qZWN0c1twaWRdLmNvcHkoKQogICAgLy8gYXNzZXJ0IHJlY29yZC5zdGF0dXMgPT0gYXJjNC5VSW50NjQoMSksICJwcm9qZWN0IG5vdCBwZW5kaW5nIgogICAgZGlnIDEKICAgIGludGNfMyAvLyA0MAogICAgaW50Y18yIC8vIDgKICAgIGJveF9leHRyYWN0CiAgICAvLyBzbWFydF9jb250cmFjdHMvYWFybmFfcmVnaXN0cnkvY29udHJhY3QucHk6MTQ3CiAgICAvLyBhc3NlcnQgcmVjb3JkLnN0YXR1cyA9PSBhcmM0LlVJbnQ2NCgxKSwgInByb2plY3Qgbm90IHBlbmRpbmciCiAgICBieXRlYyA2IC8vIDB4MDAwMDAwMDAwMDAwMDAwMQogICAgYj09CiAgICBhc3NlcnQgLy8gcHJvamVjdCBub3QgcGVuZGluZwogICAgLy8gc21hcnRfY29udHJhY3RzL2Fhcm5hX3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjE0OAogICAgLy8gcmVjb3JkLnN0YXR1cyA9IGFyYzQuVUludDY0KDIpCiAgICBieXRlYyAxMCAvLyAweDAwMDAwMDAwMDAwMDAwMDIKICAgIHJlcGxhY2UyIDQwCiAgICAvLyBzbWFydF9jb250cmFjdHMvYWFybmFfcmVnaXN0cnkvY29udHJhY3QucHk6MTQ5CiAgICAvLyByZWNvcmQuY3JlZGl0cyA9IGNyZWRpdHMKICAgIHVuY292ZXIgMgogICAgcmVwbGFjZTIgNDgKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hYXJuYV9yZWdpc3RyeS9jb250cmFjdC5weToxNTAKICAgIC8vIHNlbGYucHJvamVjdHNbcGlkXSA9IHJlY29yZC5jb3B5KCkKICAgIGRpZyAxCiAgICBib3hfZGVsCiAgICBwb3AKICAgIGJveF9wdXQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hYXJuYV9yZWdpc3RyeS9jb250cmFjdC5weToxMzkKICAgIC8vIEBhcmM0LmFiaW1ldGhvZAogICAgaW50Y18xIC8vIDEKICAgIHJldHVybgoKCi8vIHNtYXJ0X2NvbnRyYWN0cy5hYXJuYV9yZWdpc3RyeS5jb250cmFjdC5BYXJuYVJlZ2lzdHJ5LnJlamVjdF9wcm9qZWN0W3JvdXRpbmddKCkgLT4gdm9pZDoKcmVqZWN0X3Byb2plY3Q6CiAgICAvLyBzbWFydF9jb250cmFjdHMvYWFybmFfcmVnaXN0cnkvY29udHJhY3QucHk6MTUyCiAgICAvLyBAYXJjNC5hYmltZXRob2QKICAgIHR4bmEgQXBwbGljYXRpb25BcmdzIDEKICAgIGR1cAogICAgbGVuCiAgICBpbnRjXzIgLy8gOAogICAgPT0KICAgIGFzc2VydCAvLyBpbnZhbGlkIG51bWJlciBvZiBieXRlcyBmb3IgYXJjNC51aW50NjQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hYXJuYV9yZWdpc3RyeS9jb250cmFjdC5weToxNTUKICAgIC8vIHNlbGYuX29ubHlfdmFsaWRhdG9yKCkKICAgIGNhbGxzdWIgX29ubHlfdmFsaWRhdG9yCiAgICAvLyBzbWFydF9jb250cmFjdHMvYWFybmFfcmVnaXN0cnkvY29udHJhY3QucHk6MTU2CiAgICAvLyBwaWQgPSBwcm9qZWN0X2lkLm5hdGl2ZQogICAgYnRvaQogICAgLy8gc21hcnRfY29udHJhY3RzL2Fhcm5hX3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjE1NwogICAgLy8gYXNzZXJ0IHBpZCA8IHNlbGYucHJvamVjdF9jb3VudCwgImludmFsaWQgcHJvamVjdCBpZCIKICAgIGludGNfMCAvLyAwCiAgICBieXRlY18yIC8vICJwcm9qZWN0X2NvdW50IgogICAgYXBwX2dsb2JhbF9nZXRfZXgKICAgIGFzc2VydCAvLyBjaGVjayBzZWxmLnByb2plY3RfY291bnQgZXhpc3RzCiAgICBkaWcgMQogICAgPgogICAgYXNzZXJ0IC8vIGludmFsaWQgcHJvamVjdCBpZAogICAgLy8gc21hcnRfY29udHJhY3RzL2Fhcm5hX3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjE1OAogICAgLy8gcmVjb3JkID0gc2VsZi5wcm9qZWN0c1twaWRdLmNvcHkoKQogICAgaXRvYgogICAgYnl0ZWMgNSAvLyAweDcwCiAgICBzd2FwCiAgICBjb25jYXQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hYXJuYV9yZWdpc3RyeS9jb250cmFjdC5weToxNTgtMTU5CiAgICAvLyByZWNvcmQgPSBzZWxmLnByb2plY3RzW3BpZF0uY29weSgpCiAgICAvLyBhc3NlcnQgcmVjb3JkLnN0YXR1cyA9PSBhcmM0LlVJbnQ2NCgxKSwgInByb2plY3Qgbm90IHBlbmRpbmciCiAgICBkdXAKICAgIGludGNfMyAvLyA0MAogICAgaW50Y18yIC8vIDgKICAgIGJveF9leHRyYWN0CiAgICAvLyBzbWFydF9jb250cmFjdHMvYWFybmFfcmVnaXN0cnkvY29udHJhY3QucHk6MTU5CiAgICAvLyBhc3NlcnQgcmVjb3JkLnN0YXR1cyA9PSBhcmM0LlVJbnQ2NCgxKSwgInByb2plY3Qgbm90IHBlbmRpbmciCiAgICBieXRlYyA2IC8vIDB4MDAwMDAwMDAwMDAwMDAwMQogICAgYj09CiAgICBhc3NlcnQgLy8gcHJvamVjdCBub3QgcGVuZGluZwogICAgLy8gc21hcnRfY29udHJhY3RzL2Fhcm5hX3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjE2MC0xNjEKICAgIC8vIHJlY29yZC5zdGF0dXMgPSBhcmM0LlVJbnQ2NCgzKQogICAgLy8gc2VsZi5wcm9qZWN0c1twaWRdID0gcmVjb3JkLmNvcHkoKQogICAgaW50Y18zIC8vIDQwCiAgICAvLyBzbWFydF9jb250cmFjdHMvYWFybmFfcmVnaXN0cnkvY29udHJhY3QucHk6MTYwCiAgICAvLyByZWNvcmQuc3RhdHVzID0gYXJjNC5VSW50NjQoMykKICAgIHB1c2hieXRlcyAweDAwMDAwMDAwMDAwMDAwMDMKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hYXJuYV9yZWdpc3RyeS9jb250cmFjdC5weToxNjAtMTYxCiAgICAvLyByZWNvcmQuc3RhdHVzID0gYXJjNC5VSW50NjQoMykKICAgIC8vIHNlbGYucHJvamVjdHNbcGlkXSA9IHJlY29yZC5jb3B5KCkKICAgIGJveF9yZXBsYWNlCiAgICAvLyBzbWFydF9jb250cmFjdHMvYWFybmFfcmVnaXN0cnkvY29udHJhY3QucHk6MTUyCiAgICAvLyBAYXJjNC5hYmltZXRob2QKICAgIGludGNfMSAvLyAxCiAgICByZXR1cm4KCgovLyBzbWFydF9jb250cmFjdHMuYWFybmFfcmVnaXN0cnkuY29udHJhY3QuQWFybmFSZWdpc3RyeS5pc3N1ZV9jcmVkaXRzW3JvdXRpbmddKCkgLT4gdm9pZDoKaXNzdWVfY3JlZGl0czoKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hYXJuYV9yZWdpc3RyeS9jb250cmFjdC5weToxNjMKICAgIC8vIEBhcmM0LmFiaW1ldGhvZAogICAgdHhuYSBBcHBsaWNhdGlvbkFyZ3MgMQogICAgZHVwCiAgICBsZW4KICAgIGludGNfMiAvLyA4CiAgICA9PQogICAgYXNzZXJ0IC8vIGludmFsaWQgbnVtYmVyIG9mIGJ5dGVzIGZvciBhcmM0LnVpbnQ2NAogICAgLy8gc21hcnRfY29udHJhY3RzL2Fhcm5hX3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjE2OQogICAgLy8gc2VsZi5fb25seV92YWxpZGF0b3IoKQogICAgY2FsbHN1YiBfb25seV92YWxpZGF0b3IKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hYXJuYV9yZWdpc3RyeS9jb250cmFjdC5weToxNzAKICAgIC8vIGFzc2VydCBzZWxmLmFhcm5hX2Fzc2V0LCAibm8gQUFSTkEgdG9rZW4gY3JlYXRlZCIKICAgIGludGNfMCAvLyAwCiAgICBieXRlY18xIC8vICJhYXJuYV9hc3NldCIKICAgIGFwcF9nbG9iYWxfZ2V0X2V4CiAgICBhc3NlcnQgLy8gY2hlY2sgc2VsZi5hYXJuYV9hc3NldCBleGlzdHMKICAgIGR1cAogICAgYXNzZXJ0IC8vIG5vIEFBUk5BIHRva2VuIGNyZWF0ZWQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hYXJuYV9yZWdpc3RyeS9jb250cmFjdC5weToxNzEKICAgIC8vIHBpZCA9IHByb2plY3RfaWQubmF0aXZlCiAgICBzd2FwCiAgICBidG9pCiAgICAvLyBzbWFydF9jb250cmFjdHMvYWFybmFfcmVnaXN0cnkvY29udHJhY3QucHk6MTcyCiAgICAvLyBhc3NlcnQgcGlkIDwgc2VsZi5wcm9qZWN0X2NvdW50LCAiaW52YWxpZCBwcm9qZWN0IGlkIgogICAgaW50Y18wIC8vIDAKICAgIGJ5dGVjXzIgLy8gInByb2plY3RfY291bnQiCiAgICBhcHBfZ2xvYmFsX2dldF9leAogICAgYXNzZXJ0IC8vIGNoZWNrIHNlbGYucHJvamVjdF9jb3VudCBleGlzdHMKICAgIGRpZyAxCiAgICA+CiAgICBhc3NlcnQgLy8gaW52YWxpZCBwcm9qZWN0IGlkCiAgICAvLyBzbWFydF9jb250cmFjdHMvYWFybmFfcmVnaXN0cnkvY29udHJhY3QucHk6MTczCiAgICAvLyByZWNvcmQgPSBzZWxmLnByb2plY3RzW3BpZF0uY29weSgpCiAgICBpdG9iCiAgICBieXRlYyA1IC8vIDB4NzAKICAgIHN3YXAKICAgIGNvbmNhdAogICAgZHVwCiAgICBib3hfZ2V0CiAgICBhc3NlcnQgLy8gY2hlY2sgc2VsZi5wcm9qZWN0cyBlbnRyeSBleGlzdHMKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hYXJuYV9yZWdpc3RyeS9jb250cmFjdC5weToxNzMtMTc0CiAgICAvLyByZWNvcmQgPSBzZWxmLnByb2plY3RzW3BpZF0uY29weSgpCiAgICAvLyBhc3NlcnQgcmVjb3JkLnN0YXR1cyA9PSBhcmM0LlVJbnQ2NCgyKSwgInByb2plY3Qgbm90IHZlcmlmaWVkIgogICAgZGlnIDEKICAgIGludGNfMyAvLyA0MAogICAgaW50Y18yIC8vIDgKICAgIGJveF9leHRyYWN0CiAgICAvLyBzbWFydF9jb250cmFjdHMvYWFybmFfcmVnaXN0cnkvY29udHJhY3QucHk6MTc0CiAgICAvLyBhc3NlcnQgcmVjb3JkLnN0YXR1cyA9PSBhcmM0LlVJbnQ2NCgyKSwgInByb2plY3Qgbm90IHZlcmlmaWVkIgogICAgYnl0ZWMgMTAgLy8gMHgwMDAwMDAwMDAwMDAwMDAyCiAgICBiPT0KICAgIGFzc2VydCAvLyBwcm9qZWN0IG5vdCB2ZXJpZmllZAogICAgLy8gc21hcnRfY29udHJhY3RzL2Fhcm5hX3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjE3Ni0xODAKICAgIC8vIGl0eG4uQXNzZXRUcmFuc2ZlcigKICAgIC8vICAgICB4ZmVyX2Fzc2V0PUFzc2V0KHNlbGYuYWFybmFfYXNzZXQpLAogICAgLy8gICAgIGFzc2V0X3JlY2VpdmVyPXJlY29yZC5zdWJtaXR0ZXIubmF0aXZlLAogICAgLy8gICAgIGFzc2V0X2Ftb3VudD1yZWNvcmQuY3JlZGl0cy5uYXRpdmUsCiAgICAvLyApLnN1Ym1pdCgpCiAgICBpdHhuX2JlZ2luCiAgICAvLyBzbWFydF9jb250cmFjdHMvYWFybmFfcmVnaXN0cnkvY29udHJhY3QucHk6MTc4CiAgICAvLyBhc3NldF9yZWNlaXZlcj1yZWNvcmQuc3VibWl0dGVyLm5hdGl2ZSwKICAgIGRpZyAxCiAgICBpbnRjXzAgLy8gMAogICAgcHVzaGludCAzMgogICAgYm94X2V4dHJhY3QKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hYXJuYV9yZWdpc3RyeS9jb250cmFjdC5weToxNzkKICAgIC8vIGFzc2V0X2Ftb3VudD1yZWNvcmQuY3JlZGl0cy5uYXRpdmUsCiAgICBkaWcgMgogICAgcHVzaGludCA0OAogICAgaW50Y18yIC8vIDgKICAgIGJveF9leHRyYWN0CiAgICBidG9pCiAgICBpdHhuX2ZpZWxkIEFzc2V0QW1vdW50CiAgICBpdHhuX2ZpZWxkIEFzc2V0UmVjZWl2ZXIKICAgIHVuY292ZXIgMgogICAgaXR4bl9maWVsZCBYZmVyQXNzZXQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hYXJuYV9yZWdpc3RyeS9jb250cmFjdC5weToxNzYKICAgIC8vIGl0eG4uQXNzZXRUcmFuc2ZlcigKICAgIHB1c2hpbnQgNCAvLyBheGZlcgogICAgaXR4bl9maWVsZCBUeXBlRW51bQogICAgaW50Y18wIC8vIDAKICAgIGl0eG5fZmllbGQgRmVlCiAgICAvLyBzbWFydF9jb250cmFjdHMvYWFybmFfcmVnaXN0cnkvY29udHJhY3QucHk6MTc2LTE4MAogICAgLy8gaXR4bi5Bc3NldFRyYW5zZmVyKAogICAgLy8gICAgIHhmZXJfYXNzZXQ9QXNzZXQoc2VsZi5hYXJuYV9hc3NldCksCiAgICAvLyAgICAgYXNzZXRfcmVjZWl2ZXI9cmVjb3JkLnN1Ym1pdHRlci5uYXRpdmUsCiAgICAvLyAgICAgYXNzZXRfYW1vdW50PXJlY29yZC5jcmVkaXRzLm5hdGl2ZSwKICAgIC8vICkuc3VibWl0KCkKICAgIGl0eG5fc3VibWl0CiAgICAvLyBzbWFydF9jb250cmFjdHMvYWFybmFfcmVnaXN0cnkvY29udHJhY3QucHk6MTgyCiAgICAvLyByZWNvcmQuc3RhdHVzID0gYXJjNC5VSW50NjQoNCkKICAgIGJ5dGVjIDExIC8vIDB4MDAwMDAwMDAwMDAwMDAwNAogICAgcmVwbGFjZTIgNDAKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hYXJuYV9yZWdpc3RyeS9jb250cmFjdC5weToxODItMTgzCiAgICAvLyByZWNvcmQuc3RhdHVzID0gYXJjNC5VSW50NjQoNCkKICAgIC8vIHNlbGYucHJvamVjdHNbcGlkXSA9IHJlY29yZC5jb3B5KCkKICAgIHN3YXAKICAgIGludGNfMyAvLyA0MAogICAgLy8gc21hcnRfY29udHJhY3RzL2Fhcm5hX3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjE4MgogICAgLy8gcmVjb3JkLnN0YXR1cyA9IGFyYzQuVUludDY0KDQpCiAgICBieXRlYyAxMSAvLyAweDAwMDAwMDAwMDAwMDAwMDQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hYXJuYV9yZWdpc3RyeS9jb250cmFjdC5weToxODItMTgzCiAgICAvLyByZWNvcmQuc3RhdHVzID0gYXJjNC5VSW50NjQoNCkKICAgIC8vIHNlbGYucHJvamVjdHNbcGlkXSA9IHJlY29yZC5jb3B5KCkKICAgIGJveF9yZXBsYWNlCiAgICAvLyBzbWFydF9jb250cmFjdHMvYWFybmFfcmVnaXN0cnkvY29udHJhY3QucHk6MTg0CiAgICAvLyBjcmVkcyA9IHJlY29yZC5jcmVkaXRzLm5hdGl2ZQogICAgZHVwCiAgICBleHRyYWN0IDQ4IDgKICAgIHN3YXAKICAgIHB1c2hpbnQgNDgKICAgIGV4dHJhY3RfdWludDY0CiAgICAvLyBzbWFydF9jb250cmFjdHMvYWFybmFfcmVnaXN0cnkvY29udHJhY3QucHk6MTg1CiAgICAvLyBzZWxmLnRvdGFsX2NyZWRpdHNfaXNzdWVkID0gc2VsZi50b3RhbF9jcmVkaXRzX2lzc3VlZCArIGNyZWRzCiAgICBpbnRjXzAgLy8gMAogICAgYnl0ZWMgOCAvLyAidG90YWxfY3JlZGl0c19pc3N1ZWQiCiAgICBhcHBfZ2xvYmFsX2dldF9leAogICAgYXNzZXJ0IC8vIGNoZWNrIHNlbGYudG90YWxfY3JlZGl0c19pc3N1ZWQgZXhpc3RzCiAgICArCiAgICBieXRlYyA4IC8vICJ0b3RhbF9jcmVkaXRzX2lzc3VlZCIKICAgIHN3YXAKICAgIGFwcF9nbG9iYWxfcHV0CiAgICAvLyBzbWFydF9jb250cmFjdHMvYWFybmFfcmVnaXN0cnkvY29udHJhY3QucHk6MTYzCiAgICAvLyBAYXJjNC5hYmltZXRob2QKICAgIGJ5dGVjXzAgLy8gMHgxNTFmN2M3NQogICAgc3dhcAogICAgY29uY2F0CiAgICBsb2cKICAgIGludGNfMSAvLyAxCiAgICByZXR1cm4KCgovLyBzbWFydF9jb250cmFjdHMuYWFybmFfcmVnaXN0cnkuY29udHJhY3QuQWFybmFSZWdpc3RyeS5saXN0X2Zvcl9zYWxlW3JvdXRpbmddKCkgLT4gdm9pZDoKbGlzdF9mb3Jfc2FsZToKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hYXJuYV9yZWdpc3RyeS9jb250cmFjdC5weToxODgtMTkxCiAgICAvLyAjIOKVkOKVkOKVkOKVkOKVkOKVkOKVkOKVkOKVkOKVkOKVkOKVkOKVkOKVkOKVkOKVkOKVkOKVkOKVkOKVkOKVkOKVkOKVkOKVkOKVkOKVkOKVkOKVkOKVkOKVkOKVkOKVkOKVkOKVkOKVkOKVkOKVkOKVkOKVkOKVkOKVkOKVkOKVkOKVkOKVkOKVkOKVkOKVkOKVkOKVkOKVkOKVkOKVkOKVkOKVkOKVkOKVkOKVkOKVkOKVkOKVkOKVkOKVkOKVkOKVkOKVkOKVkOKVkOKVkOKVkAogICAgLy8gIyBNYXJrZXRwbGFjZQogICAgLy8gIyDilZDilZDilZDilZDilZDilZDilZDilZDilZDilZDilZDilZDilZDilZDilZDilZDilZDilZDilZDilZDilZDilZDilZDilZDilZDilZDilZDilZDilZDilZDilZDilZDilZDilZDilZDilZDilZDilZDilZDilZDilZDilZDilZDilZDilZDilZDilZDilZDilZDilZDilZDilZDilZDilZDilZDilZDilZDilZDilZDilZDilZDilZDilZDilZDilZDilZDilZDilZDilZDilZAKICAgIC8vIEBhcmM0LmFiaW1ldGhvZAogICAgdHhuYSBBcHBsaWNhdGlvbkFyZ3MgMQogICAgZHVwCiAgICBsZW4KICAgIGludGNfMiAvLyA4CiAgICA9PQogICAgYXNzZXJ0IC8vIGludmFsaWQgbnVtYmVyIG9mIGJ5dGVzIGZvciBhcmM0LnVpbnQ2NAogICAgdHhuYSBBcHBsaWNhdGlvbkFyZ3MgMgogICAgZHVwCiAgICBsZW4KICAgIGludGNfMiAvLyA4CiAgICA9PQogICAgYXNzZXJ0IC8vIGludmFsaWQgbnVtYmVyIG9mIGJ5dGVzIGZvciBhcmM0LnVpbnQ2NAogICAgLy8gc21hcnRfY29udHJhY3RzL2Fhcm5hX3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjIwMQogICAgLy8gYXNzZXJ0IHNlbGYuYWFybmFfYXNzZXQsICJubyBBQVJOQSB0b2tlbiIKICAgIGludGNfMCAvLyAwCiAgICBieXRlY18xIC8vICJhYXJuYV9hc3NldCIKICAgIGFwcF9nbG9iYWxfZ2V0X2V4CiAgICBhc3NlcnQgLy8gY2hlY2sgc2VsZi5hYXJuYV9hc3NldCBleGlzdHMKICAgIGR1cAogICAgYXNzZXJ0IC8vIG5vIEFBUk5BIHRva2VuCiAgICAvLyBzbWFydF9jb250cmFjdHMvYWFybmFfcmVnaXN0cnkvY29udHJhY3QucHk6MjAyCiAgICAvLyBhc3NlcnQgYW1vdW50Lm5hdGl2ZSA+IFVJbnQ2NCgwKSwgImFtb3VudCBtdXN0IGJlID4gMCIKICAgIGRpZyAyCiAgICBidG9pCiAgICBkdXAKICAgIGFzc2VydCAvLyBhbW91bnQgbXVzdCBiZSA+IDAKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hYXJuYV9yZWdpc3RyeS9jb250cmFjdC5weToyMDMKICAgIC8vIGFzc2VydCBwcmljZV9wZXJfdG9rZW4ubmF0aXZlID4gVUludDY0KDApLCAicHJpY2UgbXVzdCBiZSA+IDAiCiAgICBkaWcgMgogICAgYnRvaQogICAgYXNzZXJ0IC8vIHByaWNlIG11c3QgYmUgPiAwCiAgICAvLyBzbWFydF9jb250cmFjdHMvYWFybmFfcmVnaXN0cnkvY29udHJhY3QucHk6MjA1LTIxMAogICAgLy8gaXR4bi5Bc3NldFRyYW5zZmVyKAogICAgLy8gICAgIHhmZXJfYXNzZXQ9QXNzZXQoc2VsZi5hYXJuYV9hc3NldCksCiAgICAvLyAgICAgYXNzZXRfc2VuZGVyPVR4bi5zZW5kZXIsCiAgICAvLyAgICAgYXNzZXRfcmVjZWl2ZXI9R2xvYmFsLmN1cnJlbnRfYXBwbGljYXRpb25fYWRkcmVzcywKICAgIC8vICAgICBhc3NldF9hbW91bnQ9YW1vdW50Lm5hdGl2ZSwKICAgIC8vICkuc3VibWl0KCkKICAgIGl0eG5fYmVnaW4KICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hYXJuYV9yZWdpc3RyeS9jb250cmFjdC5weToyMDcKICAgIC8vIGFzc2V0X3NlbmRlcj1UeG4uc2VuZGVyLAogICAgdHhuIFNlbmRlcgogICAgLy8gc21hcnRfY29udHJhY3RzL2Fhcm5hX3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjIwOAogICAgLy8gYXNzZXRfcmVjZWl2ZXI9R2xvYmFsLmN1cnJlbnRfYXBwbGljYXRpb25fYWRkcmVzcywKICAgIGdsb2JhbCBDdXJyZW50QXBwbGljYXRpb25BZGRyZXNzCiAgICB1bmNvdmVyIDIKICAgIGl0eG5fZmllbGQgQXNzZXRBbW91bnQKICAgIGl0eG5fZmllbGQgQXNzZXRSZWNlaXZlcgogICAgaXR4bl9maWVsZCBBc3NldFNlbmRlcgogICAgaXR4bl9maWVsZCBYZmVyQXNzZXQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hYXJuYV9yZWdpc3RyeS9jb250cmFjdC5weToyMDUKICAgIC8vIGl0eG4uQXNzZXRUcmFuc2ZlcigKICAgIHB1c2hpbnQgNCAvLyBheGZlcgogICAgaXR4bl9maWVsZCBUeXBlRW51bQogICAgaW50Y18wIC8vIDAKICAgIGl0eG5fZmllbGQgRmVlCiAgICAvLyBzbWFydF9jb250cmFjdHMvYWFybmFfcmVnaXN0cnkvY29udHJhY3QucHk6MjA1LTIxMAogICAgLy8gaXR4bi5Bc3NldFRyYW5zZmVyKAogICAgLy8gICAgIHhmZXJfYXNzZXQ9QXNzZXQoc2VsZi5hYXJuYV9hc3NldCksCiAgICAvLyAgICAgYXNzZXRfc2VuZGVyPVR4bi5zZW5kZXIsCiAgICAvLyAgICAgYXNzZXRfcmVjZWl2ZXI9R2xvYmFsLmN1cnJlbnRfYXBwbGljYXRpb25fYWRkcmVzcywKICAgIC8vICAgICBhc3NldF9hbW91bnQ9YW1vdW50Lm5hdGl2ZSwKICAgIC8vICkuc3VibWl0KCkKICAgIGl0eG5fc3VibWl0CiAgICAvLyBzbWFydF9jb250cmFjdHMvYWFybmFfcmVnaXN0cnkvY29udHJhY3QucHk6MjEyCiAgICAvLyBpZHggPSBzZWxmLmxpc3RpbmdfY291bnQKICAgIGludGNfMCAvLyAwCiAgICBieXRlY18zIC8vICJsaXN0aW5nX2NvdW50IgogICAgYXBwX2dsb2JhbF9nZXRfZXgKICAgIGFzc2VydCAvLyBjaGVjayBzZWxmLmxpc3RpbmdfY291bnQgZXhpc3RzCiAgICAvLyBzbWFydF9jb250cmFjdHMvYWFybmFfcmVnaXN0cnkvY29udHJhY3QucHk6MjE0CiAgICAvLyBzZWxsZXI9YXJjNC5BZGRyZXNzKFR4bi5zZW5kZXIpLAogICAgdHhuIFNlbmRlcgogICAgLy8gc21hcnRfY29udHJhY3RzL2Fhcm5hX3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjIxMy0yMTgKICAgIC8vIHNlbGYubGlzdGluZ3NbaWR4XSA9IExpc3RpbmdSZWNvcmQoCiAgICAvLyAgICAgc2VsbGVyPWFyYzQuQWRkcmVzcyhUeG4uc2VuZGVyKSwKICAgIC8vICAgICBhbW91bnQ9YW1vdW50LAogICAgLy8gICAgIHByaWNlPXByaWNlX3Blcl90b2tlbiwKICAgIC8vICAgICBhY3RpdmU9YXJjNC5VSW50NjQoMSksCiAgICAvLyApCiAgICB1bmNvdmVyIDMKICAgIGNvbmNhdAogICAgdW5jb3ZlciAyCiAgICBjb25jYXQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hYXJuYV9yZWdpc3RyeS9jb250cmFjdC5weToyMTcKICAgIC8vIGFjdGl2ZT1hcmM0LlVJbnQ2NCgxKSwKICAgIGJ5dGVjIDYgLy8gMHgwMDAwMDAwMDAwMDAwMDAxCiAgICAvLyBzbWFydF9jb250cmFjdHMvYWFybmFfcmVnaXN0cnkvY29udHJhY3QucHk6MjEzLTIxOAogICAgLy8gc2VsZi5saXN0aW5nc1tpZHhdID0gTGlzdGluZ1JlY29yZCgKICAgIC8vICAgICBzZWxsZXI9YXJjNC5BZGRyZXNzKFR4bi5zZW5kZXIpLAogICAgLy8gICAgIGFtb3VudD1hbW91bnQsCiAgICAvLyAgICAgcHJpY2U9cHJpY2VfcGVyX3Rva2VuLAogICAgLy8gICAgIGFjdGl2ZT1hcmM0LlVJbnQ2NCgxKSwKICAgIC8vICkKICAgIGNvbmNhdAogICAgLy8gc21hcnRfY29udHJhY3RzL2Fhcm5hX3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjIxMwogICAgLy8gc2VsZi5saXN0aW5nc1tpZHhdID0gTGlzdGluZ1JlY29yZCgKICAgIGRpZyAxCiAgICBpdG9iCiAgICBieXRlYyA5IC8vIDB4NmMKICAgIGRpZyAxCiAgICBjb25jYXQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hYXJuYV9yZWdpc3RyeS9jb250cmFjdC5weToyMTMtMjE4CiAgICAvLyBzZWxmLmxpc3RpbmdzW2lkeF0gPSBMaXN0aW5nUmVjb3JkKAogICAgLy8gICAgIHNlbGxlcj1hcmM0LkFkZHJlc3MoVHhuLnNlbmRlciksCiAgICAvLyAgICAgYW1vdW50PWFtb3VudCwKICAgIC8vICAgICBwcmljZT1wcmljZV9wZXJfdG9rZW4sCiAgICAvLyAgICAgYWN0aXZlPWFyYzQuVUludDY0KDEpLAogICAgLy8gKQogICAgdW5jb3ZlciAyCiAgICBib3hfcHV0CiAgICAvLyBzbWFydF9jb250cmFjdHMvYWFybmFfcmVnaXN0cnkvY29udHJhY3QucHk6MjE5CiAgICAvLyBzZWxmLmxpc3RpbmdfY291bnQgPSBpZHggKyBVSW50NjQoMSkKICAgIHN3YXAKICAgIGludGNfMSAvLyAxCiAgICArCiAgICBieXRlY18zIC8vICJsaXN0aW5nX2NvdW50IgogICAgc3dhcAogICAgYXBwX2dsb2JhbF9wdXQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hYXJuYV9yZWdpc3RyeS9jb250cmFjdC5weToxODgtMTkxCiAgICAvLyAjIOKVkOKVkOKVkOKVkOKVkOKVkOKVkOKVkOKVkOKVkOKVkOKVkOKVkOKVkOKVkOKVkOKVkOKVkOKVkOKVkOKVkOKVkOKVkOKVkOKVkOKVkOKVkOKVkOKVkOKVkOKVkOKVkOKVkOKVkOKVkOKVkOKVkOKVkOKVkOKVkOKVkOKVkOKVkOKVkOKVkOKVkOKVkOKVkOKVkOKVkOKVkOKVkOKVkOKVkOKVkOKVkOKVkOKVkOKVkOKVkOKVkOKVkOKVkOKVkOKVkOKVkOKVkOKVkOKVkOKVkAogICAgLy8gIyBNYXJrZXRwbGFjZQogICAgLy8gIyDilZDilZDilZDilZDilZDilZDilZDilZDilZDilZDilZDilZDilZDilZDilZDilZDilZDilZDilZDilZDilZDilZDilZDilZDilZDilZDilZDilZDilZDilZDilZDilZDilZDilZDilZDilZDilZDilZDilZDilZDilZDilZDilZDilZDilZDilZDilZDilZDilZDilZDilZDilZDilZDilZDilZDilZDilZDilZDilZDilZDilZDilZDilZDilZDilZDilZDilZDilZDilZDilZAKICAgIC8vIEBhcmM0LmFiaW1ldGhvZAogICAgYnl0ZWNfMCAvLyAweDE1MWY3Yzc1CiAgICBzd2FwCiAgICBjb25jYXQKICAgIGxvZwogICAgaW50Y18xIC8vIDEKICAgIHJldHVybgoKCi8vIHNtYXJ0X2NvbnRyYWN0cy5hYXJuYV9yZWdpc3RyeS5jb250cmFjdC5BYXJuYVJlZ2lzdHJ5LmJ1eV9saXN0aW5nW3JvdXRpbmddKCkgLT4gdm9pZDoKYnV5X2xpc3Rpbmc6CiAgICAvLyBzbWFydF9jb250cmFjdHMvYWFybmFfcmVnaXN0cnkvY29udHJhY3QucHk6MjIyCiAgICAvLyBAYXJjNC5hYmltZXRob2QKICAgIHR4bmEgQXBwbGljYXRpb25BcmdzIDEKICAgIGR1cAogICAgbGVuCiAgICBpbnRjXzIgLy8gOAogICAgPT0KICAgIGFzc2VydCAvLyBpbnZhbGlkIG51bWJlciBvZiBieXRlcyBmb3IgYXJjNC51aW50NjQKICAgIHR4bmEgQXBwbGljYXRpb25BcmdzIDIKICAgIGR1cAogICAgbGVuCiAgICBpbnRjXzIgLy8gOAogICAgPT0KICAgIGFzc2VydCAvLyBpbnZhbGlkIG51bWJlciBvZiBieXRlcyBmb3IgYXJjNC51aW50NjQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hYXJuYV9yZWdpc3RyeS9jb250cmFjdC5weToyMjcKICAgIC8vIGFzc2VydCBzZWxmLmFhcm5hX2Fzc2V0LCAibm8gQUFSTkEgdG9rZW4iCiAgICBpbnRjXzAgLy8gMAogICAgYnl0ZWNfMSAvLyAiYWFybmFfYXNzZXQiCiAgICBhcHBfZ2xvYmFsX2dldF9leAogICAgYXNzZXJ0IC8vIGNoZWNrIHNlbGYuYWFybmFfYXNzZXQgZXhpc3RzCiAgICBkdXAKICAgIGFzc2VydCAvLyBubyBBQVJOQSB0b2tlbgogICAgLy8gc21hcnRfY29udHJhY3RzL2Fhcm5hX3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjIyOAogICAgLy8gbGlkID0gbGlzdGluZ19pZC5uYXRpdmUKICAgIHVuY292ZXIgMgogICAgYnRvaQogICAgLy8gc21hcnRfY29udHJhY3RzL2Fhcm5hX3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjIyOQogICAgLy8gYXNzZXJ0IGxpZCA8IHNlbGYubGlzdGluZ19jb3VudCwgImludmFsaWQgbGlzdGluZyBpZCIKICAgIGludGNfMCAvLyAwCiAgICBieXRlY18zIC8vICJsaXN0aW5nX2NvdW50IgogICAgYXBwX2dsb2JhbF9nZXRfZXgKICAgIGFzc2VydCAvLyBjaGVjayBzZWxmLmxpc3RpbmdfY291bnQgZXhpc3RzCiAgICBkaWcgMQogICAgPgogICAgYXNzZXJ0IC8vIGludmFsaWQgbGlzdGluZyBpZAogICAgLy8gc21hcnRfY29udHJhY3RzL2Fhcm5hX3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjIzMAogICAgLy8gcmVjb3JkID0gc2VsZi5saXN0aW5nc1tsaWRdLmNvcHkoKQogICAgaXRvYgogICAgYnl0ZWMgOSAvLyAweDZjCiAgICBzd2FwCiAgICBjb25jYXQKICAgIGR1cAogICAgYm94X2dldAogICAgYXNzZXJ0IC8vIGNoZWNrIHNlbGYubGlzdGluZ3MgZW50cnkgZXhpc3RzCiAgICAvLyBzbWFydF9jb250cmFjdHMvYWFybmFfcmVnaXN0cnkvY29udHJhY3QucHk6MjMxCiAgICAvLyBhc3NlcnQgcmVjb3JkLmFjdGl2ZSA9PSBhcmM0LlVJbnQ2NCgxKSwgImxpc3Rpbmcgbm90IGFjdGl2ZSIKICAgIGR1cAogICAgZXh0cmFjdCA0OCA4CiAgICBieXRlYyA2IC8vIDB4MDAwMDAwMDAwMDAwMDAwMQogICAgYj09CiAgICBhc3NlcnQgLy8gbGlzdGluZyBub3QgYWN0aXZlCiAgICAvLyBzbWFydF9jb250cmFjdHMvYWFybmFfcmVnaXN0cnkvY29udHJhY3QucHk6MjMzCiAgICAvLyB0b3RhbF9jb3N0ID0gcmVjb3JkLmFtb3VudC5uYXRpdmUgKiByZWNvcmQucHJpY2UubmF0aXZlCiAgICBkdXAKICAgIHB1c2hpbnQgMzIKICAgIGV4dHJhY3RfdWludDY0CiAgICBkaWcgMQogICAgaW50Y18zIC8vIDQwCiAgICBleHRyYWN0X3VpbnQ2NAogICAgZGlnIDEKICAgICoKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hYXJuYV9yZWdpc3RyeS9jb250cmFjdC5weToyMzQKICAgIC8vIGFzc2VydCBwYXltZW50Lm5hdGl2ZSA+PSB0b3RhbF9jb3N0LCAiaW5zdWZmaWNpZW50IHBheW1lbnQiCiAgICB1bmNvdmVyIDUKICAgIGJ0b2kKICAgIGRpZyAxCiAgICA+PQogICAgYXNzZXJ0IC8vIGluc3VmZmljaWVudCBwYXltZW50CiAgICAvLyBzbWFydF9jb250cmFjdHMvYWFybmFfcmVnaXN0cnkvY29udHJhY3QucHk6MjM2LTI0MAogICAgLy8gaXR4bi5Bc3NldFRyYW5zZmVyKAogICAgLy8gICAgIHhmZXJfYXNzZXQ9QXNzZXQoc2VsZi5hYXJuYV9hc3NldCksCiAgICAvLyAgICAgYXNzZXRfcmVjZWl2ZXI9VHhuLnNlbmRlciwKICAgIC8vICAgICBhc3NldF9hbW91bnQ9cmVjb3JkLmFtb3VudC5uYXRpdmUsCiAgICAvLyApLnN1Ym1pdCgpCiAgICBpdHhuX2JlZ2luCiAgICAvLyBzbWFydF9jb250cmFjdHMvYWFybmFfcmVnaXN0cnkvY29udHJhY3QucHk6MjM4CiAgICAvLyBhc3NldF9yZWNlaXZlcj1UeG4uc2VuZGVyLAogICAgdHhuIFNlbmRlcgogICAgdW5jb3ZlciAyCiAgICBpdHhuX2ZpZWxkIEFzc2V0QW1vdW50CiAgICBpdHhuX2ZpZWxkIEFzc2V0UmVjZWl2ZXIKICAgIHVuY292ZXIgMwogICAgaXR4bl9maWVsZCBYZmVyQXNzZXQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hYXJuYV9yZWdpc3RyeS9jb250cmFjdC5weToyMzYKICAgIC8vIGl0eG4uQXNzZXRUcmFuc2ZlcigKICAgIHB1c2hpbnQgNCAvLyBheGZlcgogICAgaXR4bl9maWVsZCBUeXBlRW51bQogICAgaW50Y18wIC8vIDAKICAgIGl0eG5fZmllbGQgRmVlCiAgICAvLyBzbWFydF9jb250cmFjdHMvYWFybmFfcmVnaXN0cnkvY29udHJhY3QucHk6MjM2LTI0MAogICAgLy8gaXR4bi5Bc3NldFRyYW5zZmVyKAogICAgLy8gICAgIHhmZXJfYXNzZXQ9QXNzZXQoc2VsZi5hYXJuYV9hc3NldCksCiAgICAvLyAgICAgYXNzZXRfcmVjZWl2ZXI9VHhuLnNlbmRlciwKICAgIC8vICAgICBhc3NldF9hbW91bnQ9cmVjb3JkLmFtb3VudC5uYXRpdmUsCiAgICAvLyApLnN1Ym1pdCgpCiAgICBpdHhuX3N1Ym1pdAogICAgLy8gc21hcnRfY29udHJhY3RzL2Fhcm5hX3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjI0Mi0yNDUKICAgIC8vIGl0eG4uUGF5bWVudCgKICAgIC8vICAgICByZWNlaXZlcj1yZWNvcmQuc2VsbGVyLm5hdGl2ZSwKICAgIC8vICAgICBhbW91bnQ9dG90YWxfY29zdCwKICAgIC8vICkuc3VibWl0KCkKICAgIGl0eG5fYmVnaW4KICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hYXJuYV9yZWdpc3RyeS9jb250cmFjdC5weToyNDMKICAgIC8vIHJlY2VpdmVyPXJlY29yZC5zZWxsZXIubmF0aXZlLAogICAgc3dhcAogICAgZXh0cmFjdCAwIDMyCiAgICBpdHhuX2ZpZWxkIFJlY2VpdmVyCiAgICBpdHhuX2ZpZWxkIEFtb3VudAogICAgLy8gc21hcnRfY29udHJhY3RzL2Fhcm5hX3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjI0MgogICAgLy8gaXR4bi5QYXltZW50KAogICAgaW50Y18xIC8vIHBheQogICAgaXR4bl9maWVsZCBUeXBlRW51bQogICAgaW50Y18wIC8vIDAKICAgIGl0eG5fZmllbGQgRmVlCiAgICAvLyBzbWFydF9jb250cmFjdHMvYWFybmFfcmVnaXN0cnkvY29udHJhY3QucHk6MjQyLTI0NQogICAgLy8gaXR4bi5QYXltZW50KAogICAgLy8gICAgIHJlY2VpdmVyPXJlY29yZC5zZWxsZXIubmF0aXZlLAogICAgLy8gICAgIGFtb3VudD10b3RhbF9jb3N0LAogICAgLy8gKS5zdWJtaXQoKQogICAgaXR4bl9zdWJtaXQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hYXJuYV9yZWdpc3RyeS9jb250cmFjdC5weToyNDctMjQ4CiAgICAvLyByZWNvcmQuYWN0aXZlID0gYXJjNC5VSW50NjQoMCkKICAgIC8vIHNlbGYubGlzdGluZ3NbbGlkXSA9IHJlY29yZC5jb3B5KCkKICAgIHB1c2hpbnQgNDgKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hYXJuYV9yZWdpc3RyeS9jb250cmFjdC5weToyNDcKICAgIC8vIHJlY29yZC5hY3RpdmUgPSBhcmM0LlVJbnQ2NCgwKQogICAgYnl0ZWMgMTIgLy8gMHgwMDAwMDAwMDAwMDAwMDAwCiAgICAvLyBzbWFydF9jb250cmFjdHMvYWFybmFfcmVnaXN0cnkvY29udHJhY3QucHk6MjQ3LTI0OAogICAgLy8gcmVjb3JkLmFjdGl2ZSA9IGFyYzQuVUludDY0KDApCiAgICAvLyBzZWxmLmxpc3RpbmdzW2xpZF0gPSByZWNvcmQuY29weSgpCiAgICBib3hfcmVwbGFjZQogICAgLy8gc21hcnRfY29udHJhY3RzL2Fhcm5hX3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjIyMgogICAgLy8gQGFyYzQuYWJpbWV0aG9kCiAgICBpbnRjXzEgLy8gMQogICAgcmV0dXJuCgoKLy8gc21hcnRfY29udHJhY3RzLmFhcm5hX3JlZ2lzdHJ5LmNvbnRyYWN0LkFhcm5hUmVnaXN0cnkuY2FuY2VsX2xpc3Rpbmdbcm91dGluZ10oKSAtPiB2b2lkOgpjYW5jZWxfbGlzdGluZzoKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hYXJuYV9yZWdpc3RyeS9jb250cmFjdC5weToyNTAKICAgIC8vIEBhcmM0LmFiaW1ldGhvZAogICAgdHhuYSBBcHBsaWNhdGlvbkFyZ3MgMQogICAgZHVwCiAgICBsZW4KICAgIGludGNfMiAvLyA4CiAgICA9PQogICAgYXNzZXJ0IC8vIGludmFsaWQgbnVtYmVyIG9mIGJ5dGVzIGZvciBhcmM0LnVpbnQ2NAogICAgLy8gc21hcnRfY29udHJhY3RzL2Fhcm5hX3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjI1MwogICAgLy8gbGlkID0gbGlzdGluZ19pZC5uYXRpdmUKICAgIGJ0b2kKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hYXJuYV9yZWdpc3RyeS9jb250cmFjdC5weToyNTQKICAgIC8vIGFzc2VydCBsaWQgPCBzZWxmLmxpc3RpbmdfY291bnQsICJpbnZhbGlkIGxpc3RpbmcgaWQiCiAgICBpbnRjXzAgLy8gMAogICAgYnl0ZWNfMyAvLyAibGlzdGluZ19jb3VudCIKICAgIGFwcF9nbG9iYWxfZ2V0X2V4CiAgICBhc3NlcnQgLy8gY2hlY2sgc2VsZi5saXN0aW5nX2NvdW50IGV4aXN0cwogICAgZGlnIDEKICAgID4KICAgIGFzc2VydCAvLyBpbnZhbGlkIGxpc3RpbmcgaWQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hYXJuYV9yZWdpc3RyeS9jb250cmFjdC5weToyNTUKICAgIC8vIHJlY29yZCA9IHNlbGYubGlzdGluZ3NbbGlkXS5jb3B5KCkKICAgIGl0b2IKICAgIGJ5dGVjIDkgLy8gMHg2YwogICAgc3dhcAogICAgY29uY2F0CiAgICBkdXAKICAgIGJveF9nZXQKICAgIGFzc2VydCAvLyBjaGVjayBzZWxmLmxpc3RpbmdzIGVudHJ5IGV4aXN0cwogICAgLy8gc21hcnRfY29udHJhY3RzL2Fhcm5hX3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjI1NgogICAgLy8gYXNzZXJ0IHJlY29yZC5hY3RpdmUgPT0gYXJjNC5VSW50NjQoMSksICJsaXN0aW5nIG5vdCBhY3RpdmUiCiAgICBkdXAKICAgIGV4dHJhY3QgNDggOAogICAgYnl0ZWMgNiAvLyAweDAwMDAwMDAwMDAwMDAwMDEKICAgIGI9PQogICAgYXNzZXJ0IC8vIGxpc3Rpbmcgbm90IGFjdGl2ZQogICAgLy8gc21hcnRfY29udHJhY3RzL2Fhcm5hX3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjI1NwogICAgLy8gYXNzZXJ0IFR4bi5zZW5kZXIgPT0gcmVjb3JkLnNlbGxlci5uYXRpdmUsICJvbmx5IHNlbGxlciBjYW4gY2FuY2VsIgogICAgdHhuIFNlbmRlcgogICAgZGlnIDEKICAgIGV4dHJhY3QgMCAzMgogICAgc3dhcAogICAgZGlnIDEKICAgID09CiAgICBhc3NlcnQgLy8gb25seSBzZWxsZXIgY2FuIGNhbmNlbAogICAgLy8gc21hcnRfY29udHJhY3RzL2Fhcm5hX3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjI1OS0yNjMKICAgIC8vIGl0eG4uQXNzZXRUcmFuc2ZlcigKICAgIC8vICAgICB4ZmVyX2Fzc2V0PUFzc2V0KHNlbGYuYWFybmFfYXNzZXQpLAogICAgLy8gICAgIGFzc2V0X3JlY2VpdmVyPXJlY29yZC5zZWxsZXIubmF0aXZlLAogICAgLy8gICAgIGFzc2V0X2Ftb3VudD1yZWNvcmQuYW1vdW50Lm5hdGl2ZSwKICAgIC8vICkuc3VibWl0KCkKICAgIGl0eG5fYmVnaW4KICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hYXJuYV9yZWdpc3RyeS9jb250cmFjdC5weToyNjAKICAgIC8vIHhmZXJfYXNzZXQ9QXNzZXQoc2VsZi5hYXJuYV9hc3NldCksCiAgICBpbnRjXzAgLy8gMAogICAgYnl0ZWNfMSAvLyAiYWFybmFfYXNzZXQiCiAgICBhcHBfZ2xvYmFsX2dldF9leAogICAgYXNzZXJ0IC8vIGNoZWNrIHNlbGYuYWFybmFfYXNzZXQgZXhpc3RzCiAgICAvLyBzbWFydF9jb250cmFjdHMvYWFybmFfcmVnaXN0cnkvY29udHJhY3QucHk6MjYyCiAgICAvLyBhc3NldF9hbW91bnQ9cmVjb3JkLmFtb3VudC5uYXRpdmUsCiAgICB1bmNvdmVyIDIKICAgIHB1c2hpbnQgMzIKICAgIGV4dHJhY3RfdWludDY0CiAgICBpdHhuX2ZpZWxkIEFzc2V0QW1vdW50CiAgICBpdHhuX2ZpZWxkIFhmZXJBc3NldAogICAgaXR4bl9maWVsZCBBc3NldFJlY2VpdmVyCiAgICAvLyBzbWFydF9jb250cmFjdHMvYWFybmFfcmVnaXN0cnkvY29udHJhY3QucHk6MjU5CiAgICAvLyBpdHhuLkFzc2V0VHJhbnNmZXIoCiAgICBwdXNoaW50IDQgLy8gYXhmZXIKICAgIGl0eG5fZmllbGQgVHlwZUVudW0KICAgIGludGNfMCAvLyAwCiAgICBpdHhuX2ZpZWxkIEZlZQogICAgLy8gc21hcnRfY29udHJhY3RzL2Fhcm5hX3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjI1OS0yNjMKICAgIC8vIGl0eG4uQXNzZXRUcmFuc2ZlcigKICAgIC8vICAgICB4ZmVyX2Fzc2V0PUFzc2V0KHNlbGYuYWFybmFfYXNzZXQpLAogICAgLy8gICAgIGFzc2V0X3JlY2VpdmVyPXJlY29yZC5zZWxsZXIubmF0aXZlLAogICAgLy8gICAgIGFzc2V0X2Ftb3VudD1yZWNvcmQuYW1vdW50Lm5hdGl2ZSwKICAgIC8vICkuc3VibWl0KCkKICAgIGl0eG5fc3VibWl0CiAgICAvLyBzbWFydF9jb250cmFjdHMvYWFybmFfcmVnaXN0cnkvY29udHJhY3QucHk6MjY1LTI2NgogICAgLy8gcmVjb3JkLmFjdGl2ZSA9IGFyYzQuVUludDY0KDApCiAgICAvLyBzZWxmLmxpc3RpbmdzW2xpZF0gPSByZWNvcmQuY29weSgpCiAgICBwdXNoaW50IDQ4CiAgICAvLyBzbWFydF9jb250cmFjdHMvYWFybmFfcmVnaXN0cnkvY29udHJhY3QucHk6MjY1CiAgICAvLyByZWNvcmQuYWN0aXZlID0gYXJjNC5VSW50NjQoMCkKICAgIGJ5dGVjIDEyIC8vIDB4MDAwMDAwMDAwMDAwMDAwMAogICAgLy8gc21hcnRfY29udHJhY3RzL2Fhcm5hX3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjI2NS0yNjYKICAgIC8vIHJlY29yZC5hY3RpdmUgPSBhcmM0LlVJbnQ2NCgwKQogICAgLy8gc2VsZi5saXN0aW5nc1tsaWRdID0gcmVjb3JkLmNvcHkoKQogICAgYm94X3JlcGxhY2UKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hYXJuYV9yZWdpc3RyeS9jb250cmFjdC5weToyNTAKICAgIC8vIEBhcmM0LmFiaW1ldGhvZAogICAgaW50Y18xIC8vIDEKICAgIHJldHVybgoKCi8vIHNtYXJ0X2NvbnRyYWN0cy5hYXJuYV9yZWdpc3RyeS5jb250cmFjdC5BYXJuYVJlZ2lzdHJ5LmdldF9wcm9qZWN0X2NvdW50W3JvdXRpbmddKCkgLT4gdm9pZDoKZ2V0X3Byb2plY3RfY291bnQ6CiAgICAvLyBzbWFydF9jb250cmFjdHMvYWFybmFfcmVnaXN0cnkvY29udHJhY3QucHk6MjczCiAgICAvLyByZXR1cm4gYXJjNC5VSW50NjQoc2VsZi5wcm9qZWN0X2NvdW50KQogICAgaW50Y18wIC8vIDAKICAgIGJ5dGVjXzIgLy8gInByb2plY3RfY291bnQiCiAgICBhcHBfZ2xvYmFsX2dldF9leAogICAgYXNzZXJ0IC8vIGNoZWNrIHNlbGYucHJvamVjdF9jb3VudCBleGlzdHMKICAgIGl0b2IKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hYXJuYV9yZWdpc3RyeS9jb250cmFjdC5weToyNjgtMjcxCiAgICAvLyAjIOKVkOKVkOKVkOKVkOKVkOKVkOKVkOKVkOKVkOKVkOKVkOKVkOKVkOKVkOKVkOKVkOKVkOKVkOKVkOKVkOKVkOKVkOKVkOKVkOKVkOKVkOKVkOKVkOKVkOKVkOKVkOKVkOKVkOKVkOKVkOKVkOKVkOKVkOKVkOKVkOKVkOKVkOKVkOKVkOKVkOKVkOKVkOKVkOKVkOKVkOKVkOKVkOKVkOKVkOKVkOKVkOKVkOKVkOKVkOKVkOKVkOKVkOKVkOKVkOKVkOKVkOKVkOKVkOKVkOKVkAogICAgLy8gIyBSZWFkLU9ubHkgR2V0dGVycyDigJQgZmllbGQgYWNjZXNzIGZyb20gYXJjNC5TdHJ1Y3QgY29weQogICAgLy8gIyDilZDilZDilZDilZDilZDilZDilZDilZDilZDilZDilZDilZDilZDilZDilZDilZDilZDilZDilZDilZDilZDilZDilZDilZDilZDilZDilZDilZDilZDilZDilZDilZDilZDilZDilZDilZDilZDilZDilZDilZDilZDilZDilZDilZDilZDilZDilZDilZDilZDilZDilZDilZDilZDilZDilZDilZDilZDilZDilZDilZDilZDilZDilZDilZDilZDilZDilZDilZDilZDilZAKICAgIC8vIEBhcmM0LmFiaW1ldGhvZChyZWFkb25seT1UcnVlKQogICAgYnl0ZWNfMCAvLyAweDE1MWY3Yzc1CiAgICBzd2FwCiAgICBjb25jYXQKICAgIGxvZwogICAgaW50Y18xIC8vIDEKICAgIHJldHVybgoKCi8vIHNtYXJ0X2NvbnRyYWN0cy5hYXJuYV9yZWdpc3RyeS5jb250cmFjdC5BYXJuYVJlZ2lzdHJ5LmdldF9hc3NldF9pZFtyb3V0aW5nXSgpIC0+IHZvaWQ6CmdldF9hc3NldF9pZDoKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hYXJuYV9yZWdpc3RyeS9jb250cmFjdC5weToyNzcKICAgIC8vIHJldHVybiBhcmM0LlVJbnQ2NChzZWxmLmFhcm5hX2Fzc2V0KQogICAgaW50Y18wIC8vIDAKICAgIGJ5dGVjXzEgLy8gImFhcm5hX2Fzc2V0IgogICAgYXBwX2dsb2JhbF9nZXRfZXgKICAgIGFzc2VydCAvLyBjaGVjayBzZWxmLmFhcm5hX2Fzc2V0IGV4aXN0cwogICAgaXRvYgogICAgLy8gc21hcnRfY29udHJhY3RzL2Fhcm5hX3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjI3NQogICAgLy8gQGFyYzQuYWJpbWV0aG9kKHJlYWRvbmx5PVRydWUpCiAgICBieXRlY18wIC8vIDB4MTUxZjdjNzUKICAgIHN3YXAKICAgIGNvbmNhdAogICAgbG9nCiAgICBpbnRjXzEgLy8gMQogICAgcmV0dXJuCgoKLy8gc21hcnRfY29udHJhY3RzLmFhcm5hX3JlZ2lzdHJ5LmNvbnRyYWN0LkFhcm5hUmVnaXN0cnkuZ2V0X2FkbWluW3JvdXRpbmddKCkgLT4gdm9pZDoKZ2V0X2FkbWluOgogICAgLy8gc21hcnRfY29udHJhY3RzL2Fhcm5hX3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjI4MQogICAgLy8gcmV0dXJuIHNlbGYuYWRtaW4uY29weSgpCiAgICBpbnRjXzAgLy8gMAogICAgYnl0ZWMgNCAvLyAiYWRtaW4iCiAgICBhcHBfZ2xvYmFsX2dldF9leAogICAgYXNzZXJ0IC8vIGNoZWNrIHNlbGYuYWRtaW4gZXhpc3RzCiAgICAvLyBzbWFydF9jb250cmFjdHMvYWFybmFfcmVnaXN0cnkvY29udHJhY3QucHk6Mjc5CiAgICAvLyBAYXJjNC5hYmltZXRob2QocmVhZG9ubHk9VHJ1ZSkKICAgIGJ5dGVjXzAgLy8gMHgxNTFmN2M3NQogICAgc3dhcAogICAgY29uY2F0CiAgICBsb2cKICAgIGludGNfMSAvLyAxCiAgICByZXR1cm4KCgovLyBzbWFydF9jb250cmFjdHMuYWFybmFfcmVnaXN0cnkuY29udHJhY3QuQWFybmFSZWdpc3RyeS5nZXRfdmFsaWRhdG9yW3JvdXRpbmddKCkgLT4gdm9pZDoKZ2V0X3ZhbGlkYXRvcjoKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hYXJuYV9yZWdpc3RyeS9jb250cmFjdC5weToyODUKICAgIC8vIHJldHVybiBzZWxmLnZhbGlkYXRvci5jb3B5KCkKICAgIGludGNfMCAvLyAwCiAgICBieXRlYyA3IC8vICJ2YWxpZGF0b3IiCiAgICBhcHBfZ2xvYmFsX2dldF9leAogICAgYXNzZXJ0IC8vIGNoZWNrIHNlbGYudmFsaWRhdG9yIGV4aXN0cwogICAgLy8gc21hcnRfY29udHJhY3RzL2Fhcm5hX3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjI4MwogICAgLy8gQGFyYzQuYWJpbWV0aG9kKHJlYWRvbmx5PVRydWUpCiAgICBieXRlY18wIC8vIDB4MTUxZjdjNzUKICAgIHN3YXAKICAgIGNvbmNhdAogICAgbG9nCiAgICBpbnRjXzEgLy8gMQogICAgcmV0dXJuCgoKLy8gc21hcnRfY29udHJhY3RzLmFhcm5hX3JlZ2lzdHJ5LmNvbnRyYWN0LkFhcm5hUmVnaXN0cnkuZ2V0X3RvdGFsX2NyZWRpdHNfaXNzdWVkW3JvdXRpbmddKCkgLT4gdm9pZDoKZ2V0X3RvdGFsX2NyZWRpdHNfaXNzdWVkOgogICAgLy8gc21hcnRfY29udHJhY3RzL2Fhcm5hX3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjI4OQogICAgLy8gcmV0dXJuIGFyYzQuVUludDY0KHNlbGYudG90YWxfY3JlZGl0c19pc3N1ZWQpCiAgICBpbnRjXzAgLy8gMAogICAgYnl0ZWMgOCAvLyAidG90YWxfY3JlZGl0c19pc3N1ZWQiCiAgICBhcHBfZ2xvYmFsX2dldF9leAogICAgYXNzZXJ0IC8vIGNoZWNrIHNlbGYudG90YWxfY3JlZGl0c19pc3N1ZWQgZXhpc3RzCiAgICBpdG9iCiAgICAvLyBzbWFydF9jb250cmFjdHMvYWFybmFfcmVnaXN0cnkvY29udHJhY3QucHk6Mjg3CiAgICAvLyBAYXJjNC5hYmltZXRob2QocmVhZG9ubHk9VHJ1ZSkKICAgIGJ5dGVjXzAgLy8gMHgxNTFmN2M3NQogICAgc3dhcAogICAgY29uY2F0CiAgICBsb2cKICAgIGludGNfMSAvLyAxCiAgICByZXR1cm4KCgovLyBzbWFydF9jb250cmFjdHMuYWFybmFfcmVnaXN0cnkuY29udHJhY3QuQWFybmFSZWdpc3RyeS5nZXRfcHJvamVjdFtyb3V0aW5nXSgpIC0+IHZvaWQ6CmdldF9wcm9qZWN0OgogICAgLy8gc21hcnRfY29udHJhY3RzL2Fhcm5hX3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjI5MQogICAgLy8gQGFyYzQuYWJpbWV0aG9kKHJlYWRvbmx5PVRydWUpCiAgICB0eG5hIEFwcGxpY2F0aW9uQXJncyAxCiAgICBkdXAKICAgIGxlbgogICAgaW50Y18yIC8vIDgKICAgID09CiAgICBhc3NlcnQgLy8gaW52YWxpZCBudW1iZXIgb2YgYnl0ZXMgZm9yIGFyYzQudWludDY0CiAgICAvLyBzbWFydF9jb250cmFjdHMvYWFybmFfcmVnaXN0cnkvY29udHJhY3QucHk6MjkzCiAgICAvLyByZXR1cm4gc2VsZi5wcm9qZWN0c1twcm9qZWN0X2lkLm5hdGl2ZV0uY29weSgpCiAgICBidG9pCiAgICBpdG9iCiAgICBieXRlYyA1IC8vIDB4NzAKICAgIHN3YXAKICAgIGNvbmNhdAogICAgYm94X2dldAogICAgYXNzZXJ0IC8vIGNoZWNrIHNlbGYucHJvamVjdHMgZW50cnkgZXhpc3RzCiAgICAvLyBzbWFydF9jb250cmFjdHMvYWFybmFfcmVnaXN0cnkvY29udHJhY3QucHk6MjkxCiAgICAvLyBAYXJjNC5hYmltZXRob2QocmVhZG9ubHk9VHJ1ZSkKICAgIGJ5dGVjXzAgLy8gMHgxNTFmN2M3NQogICAgc3dhcAogICAgY29uY2F0CiAgICBsb2cKICAgIGludGNfMSAvLyAxCiAgICByZXR1cm4KCgovLyBzbWFydF9jb250cmFjdHMuYWFybmFfcmVnaXN0cnkuY29udHJhY3QuQWFybmFSZWdpc3RyeS5nZXRfbGlzdGluZ1tyb3V0aW5nXSgpIC0+IHZvaWQ6CmdldF9saXN0aW5nOgogICAgLy8gc21hcnRfY29udHJhY3RzL2Fhcm5hX3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjI5NQogICAgLy8gQGFyYzQuYWJpbWV0aG9kKHJlYWRvbmx5PVRydWUpCiAgICB0eG5hIEFwcGxpY2F0aW9uQXJncyAxCiAgICBkdXAKICAgIGxlbgogICAgaW50Y18yIC8vIDgKICAgID09CiAgICBhc3NlcnQgLy8gaW52YWxpZCBudW1iZXIgb2YgYnl0ZXMgZm9yIGFyYzQudWludDY0CiAgICAvLyBzbWFydF9jb250cmFjdHMvYWFybmFfcmVnaXN0cnkvY29udHJhY3QucHk6Mjk3CiAgICAvLyByZXR1cm4gc2VsZi5saXN0aW5nc1tsaXN0aW5nX2lkLm5hdGl2ZV0uY29weSgpCiAgICBidG9pCiAgICBpdG9iCiAgICBieXRlYyA5IC8vIDB4NmMKICAgIHN3YXAKICAgIGNvbmNhdAogICAgYm94X2dldAogICAgYXNzZXJ0IC8vIGNoZWNrIHNlbGYubGlzdGluZ3MgZW50cnkgZXhpc3RzCiAgICAvLyBzbWFydF9jb250cmFjdHMvYWFybmFfcmVnaXN0cnkvY29udHJhY3QucHk6Mjk1CiAgICAvLyBAYXJjNC5hYmltZXRob2QocmVhZG9ubHk9VHJ1ZSkKICAgIGJ5dGVjXzAgLy8gMHgxNTFmN2M3NQogICAgc3dhcAogICAgY29uY2F0CiAgICBsb2cKICAgIGludGNfMSAvLyAxCiAgICByZXR1cm4KCgovLyBzbWFydF9jb250cmFjdHMuYWFybmFfcmVnaXN0cnkuY29udHJhY3QuQWFybmFSZWdpc3RyeS5nZXRfbGlzdGluZ19jb3VudFtyb3V0aW5nXSgpIC0+IHZvaWQ6CmdldF9saXN0aW5nX2NvdW50OgogICAgLy8gc21hcnRfY29udHJhY3RzL2Fhcm5hX3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjMwMQogICAgLy8gcmV0dXJuIGFyYzQuVUludDY0KHNlbGYubGlzdGluZ19jb3VudCkKICAgIGludGNfMCAvLyAwCiAgICBieXRlY18zIC8vICJsaXN0aW5nX2NvdW50IgogICAgYXBwX2dsb2JhbF9nZXRfZXgKICAgIGFzc2VydCAvLyBjaGVjayBzZWxmLmxpc3RpbmdfY291bnQgZXhpc3RzCiAgICBpdG9iCiAgICAvLyBzbWFydF9jb250cmFjdHMvYWFybmFfcmVnaXN0cnkvY29udHJhY3QucHk6Mjk5CiAgICAvLyBAYXJjNC5hYmltZXRob2QocmVhZG9ubHk9VHJ1ZSkKICAgIGJ5dGVjXzAgLy8gMHgxNTFmN2M3NQogICAgc3dhcAogICAgY29uY2F0CiAgICBsb2cKICAgIGludGNfMSAvLyAxCiAgICByZXR1cm4KCgovLyBzbWFydF9jb250cmFjdHMuYWFybmFfcmVnaXN0cnkuY29udHJhY3QuQWFybmFSZWdpc3RyeS5fb25seV9hZG1pbigpIC0+IHZvaWQ6Cl9vbmx5X2FkbWluOgogICAgLy8gc21hcnRfY29udHJhY3RzL2Fhcm5hX3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjY0CiAgICAvLyBhc3NlcnQgVHhuLnNlbmRlciA9PSBzZWxmLmFkbWluLm5hdGl2ZSwgInVuYXV0aG9yaXplZDogYWRtaW4gb25seSIKICAgIHR4biBTZW5kZXIKICAgIGludGNfMCAvLyAwCiAgICBieXRlYyA0IC8vICJhZG1pbiIKICAgIGFwcF9nbG9iYWxfZ2V0X2V4CiAgICBhc3NlcnQgLy8gY2hlY2sgc2VsZi5hZG1pbiBleGlzdHMKICAgID09CiAgICBhc3NlcnQgLy8gdW5hdXRob3JpemVkOiBhZG1pbiBvbmx5CiAgICByZXRzdWIKCgovLyBzbWFydF9jb250cmFjdHMuYWFybmFfcmVnaXN0cnkuY29udHJhY3QuQWFybmFSZWdpc3RyeS5fb25seV92YWxpZGF0b3IoKSAtPiB2b2lkOgpfb25seV92YWxpZGF0b3I6CiAgICAvLyBzbWFydF9jb250cmFjdHMvYWFybmFfcmVnaXN0cnkvY29udHJhY3QucHk6NjgKICAgIC8vIGFzc2VydCBUeG4uc2VuZGVyID09IHNlbGYudmFsaWRhdG9yLm5hdGl2ZSwgInVuYXV0aG9yaXplZDogdmFsaWRhdG9yIG9ubHkiCiAgICB0eG4gU2VuZGVyCiAgICBpbnRjXzAgLy8gMAogICAgYnl0ZWMgNyAvLyAidmFsaWRhdG9yIgogICAgYXBwX2dsb2JhbF9nZXRfZXgKICAgIGFzc2VydCAvLyBjaGVjayBzZWxmLnZhbGlkYXRvciBleGlzdHMKICAgID09CiAgICBhc3NlcnQgLy8gdW5hdXRob3JpemVkOiB2YWxpZGF0b3Igb25seQogICAgcmV0c3ViCg==","clear":"I3ByYWdtYSB2ZXJzaW9uIDExCiNwcmFnbWEgdHlwZXRyYWNrIGZhbHNlCgovLyBhbGdvcHkuYXJjNC5BUkM0Q29udHJhY3QuY2xlYXJfc3RhdGVfcHJvZ3JhbSgpIC0+IHVpbnQ2NDoKbWFpbjoKICAgIHB1c2hpbnQgMQogICAgcmV0dXJuCg=="},"byteCode":{"approval":"CyAEAAEIKCYNBBUffHULYWFybmFfYXNzZXQNcHJvamVjdF9jb3VudA1saXN0aW5nX2NvdW50BWFkbWluAXAIAAAAAAAAAAEJdmFsaWRhdG9yFHRvdGFsX2NyZWRpdHNfaXNzdWVkAWwIAAAAAAAAAAIIAAAAAAAAAAQIAAAAAAAAAAAxGEAAFycEMgNnJwcyA2cpImcqImcnCCJnKyJnMRkURDEYQQCGghIE8SbQSwTTSPuzBAj7e3wEohqAdwRmRfL5BCGXmUMEYmKQZQQib6I3BDGOQyIEY9VbbAQwXnW9BFuiKoQENGs9vATzjmlBBF8c0twEChxlbgQWrt5uBB3rpOk2GgCOEgAWACgAPwCvAVgBmQHIAjMCjwL+A0oDVQNgA2sDdgOCA5gDrgCABIPxR0g2GgCOAQABACcEMQBnI0M2GgFJFYEgEkSIA5cnB0xnI0M2GgFJFYEgEkSIA4VJMgMTRCcETGcjQ4gDdyIpZURAAFuxMgpHA7IssiuyKrIpgBFodHRwczovL2Fhcm5hLmVjb7IngBNBYXJuYSBDYXJib24gQ3JlZGl0siaABUFBUk5BsiUisiQisiOBgK3iBLIigQOyECKyAbMptDxnIillRBYoTFCwI0M2GgFJIlmBAghLARVJTwISRDYaAkkiWYECCEsBFUlPAhJENhoDSSJZgQIISwEVSU8CEkQ2GgRJIlmBAghLARUSRCIqZUQxAIACADhQgThPCAhJFlcGAk8CTFBMTwYISRZXBgJPAkxQTE8ECBZXBgJQgBAAAAAAAAAAAQAAAAAAAAAAUE8FUE8EUE8DUE8CUEsBFicFSwFQSbxITwK/TCMIKkxnKExQsCNDNhoBSRUkEkQ2GgJJFSQSRIgCWEwXIiplREsBDURLARdEFicFTFBJvkRLASUkuicGqEQnClwoTwJcMEsBvEi/I0M2GgFJFSQSRIgCHxciKmVESwENRBYnBUxQSSUkuicGqEQlgAgAAAAAAAAAA7sjQzYaAUkVJBJEiAHwIillRElETBciKmVESwENRBYnBUxQSb5ESwElJLonCqhEsUsBIoEguksCgTAkuheyErIUTwKyEYEEshAisgGzJwtcKEwlJwu7SVcwCEyBMFsiJwhlRAgnCExnKExQsCNDNhoBSRUkEkQ2GgJJFSQSRCIpZURJREsCF0lESwIXRLExADIKTwKyErIUshOyEYEEshAisgGzIitlRDEATwNQTwJQJwZQSwEWJwlLAVBPAr9MIwgrTGcoTFCwI0M2GgFJFSQSRDYaAkkVJBJEIillRElETwIXIitlREsBDUQWJwlMUEm+RElXMAgnBqhESYEgW0sBJVtLAQtPBRdLAQ9EsTEATwKyErIUTwOyEYEEshAisgGzsUxXACCyB7III7IQIrIBs4EwJwy7I0M2GgFJFSQSRBciK2VESwENRBYnCUxQSb5ESVcwCCcGqEQxAEsBVwAgTEsBEkSxIillRE8CgSBbshKyEbIUgQSyECKyAbOBMCcMuyNDIiplRBYoTFCwI0MiKWVEFihMULAjQyInBGVEKExQsCNDIicHZUQoTFCwI0MiJwhlRBYoTFCwI0M2GgFJFSQSRBcWJwVMUL5EKExQsCNDNhoBSRUkEkQXFicJTFC+RChMULAjQyIrZUQWKExQsCNDMQAiJwRlRBJEiTEAIicHZUQSRIk=","clear":"C4EBQw=="},"compilerInfo":{"compiler":"puya","compilerVersion":{"major":5,"minor":7,"patch":1}},"events":[],"templateVariables":{}} as unknown as Arc56Contract
+export const APP_SPEC: Arc56Contract = {"name":"AarnaRegistry","structs":{"FreeLink":[{"name":"next","type":"uint64"},{"name":"seq","type":"uint64"}],"ListingLink":[{"name":"prev","type":"uint64"},{"name":"next","type":"uint64"},{"name":"slot","type":"uint64"}],"ListingPage":[{"name":"next_id","type":"uint64"},{"name":"items","type":"(address,uint64,uint64,uint64)[]"}],"ListingRecord":[{"name":"seller","type":"address"},{"name":"amount","type":"uint64"},{"name":"price","type":"uint64"},{"name":"active","type":"uint64"}],"PriceLevel":[{"name":"prev_price","type":"uint64"},{"name":"next_price","type":"uint64"},{"name":"head","type":"uint64"},{"name":"tail","type":"uint64"},{"name":"depth","type":"uint64"},{"name":"listings","type":"uint64"}],"ProjectHeader":[{"name":"submitter","type":"address"},{"name":"status","type":"uint64"},{"name":"credits","type":"uint64"}],"ProjectMeta":[{"name":"name","type":"string"},{"name":"location","type":"string"},{"name":"ecosystem","type":"string"},{"name":"cid","type":"string"}],"ProjectPage":[{"name":"next_id","type":"uint64"},{"name":"items","type":"(address,string,string,string,string,uint64,uint64)[]"}],"ProjectRecord":[{"name":"submitter","type":"address"},{"name":"name","type":"string"},{"name":"location","type":"string"},{"name":"ecosystem","type":"string"},{"name":"cid","type":"string"},{"name":"status","type":"uint64"},{"name":"credits","type":"uint64"}],"QueueLink":[{"name":"prev","type":"uint64"},{"name":"next","type":"uint64"}],"RegistryStats":[{"name":"project_count","type":"uint64"},{"name":"pending","type":"uint64"},{"name":"verified","type":"uint64"},{"name":"rejected","type":"uint64"},{"name":"issued","type":"uint64"},{"name":"total_credits_issued","type":"uint64"},{"name":"open_listings","type":"uint64"},{"name":"escrowed_tokens","type":"uint64"},{"name":"tokens_traded","type":"uint64"},{"name":"volume_traded","type":"uint64"}],"SweepResult":[{"name":"filled","type":"uint64"},{"name":"spent","type":"uint64"}]},"methods":[{"name":"init","args":[],"returns":{"type":"void"},"actions":{"create":["NoOp"],"call":[]},"readonly":false,"desc":"Deploy the contract and set the caller as admin.","events":[],"recommendations":{}},{"name":"set_validator","args":[{"type":"address","name":"addr"}],"returns":{"type":"void"},"actions":{"create":[],"call":["NoOp"]},"readonly":false,"desc":"Admin assigns a validator address for project reviews.","events":[],"recommendations":{}},{"name":"transfer_admin","args":[{"type":"address","name":"new_admin"}],"returns":{"type":"void"},"actions":{"create":[],"call":["NoOp"]},"readonly":false,"desc":"Admin transfers ownership to a new admin account.","events":[],"recommendations":{}},{"name":"ensure_token","args":[],"returns":{"type":"uint64"},"actions":{"create":[],"call":["NoOp"]},"readonly":false,"desc":"Create the AARNA ASA if it doesn't exist. Returns the ASA ID.","events":[],"recommendations":{}},{"name":"submit_project","args":[{"type":"string","name":"name"},{"type":"string","name":"location"},{"type":"string","name":"ecosystem"},{"type":"string","name":"cid"}],"returns":{"type":"uint64"},"actions":{"create":[],"call":["NoOp"]},"readonly":false,"desc":"Developer submits a new project. Returns the project index.\nEach evidence bundle (CID) can back only one project, and the encoded metadata is capped at MAX_META_BYTES so the record can always be read.","events":[{"name":"ProjectSubmitted","args":[{"type":"uint64","name":"project_id"},{"type":"address","name":"submitter"}]}],"recommendations":{}},{"name":"approve_project","args":[{"type":"uint64","name":"project_id"},{"type":"uint64","name":"credits"}],"returns":{"type":"void"},"actions":{"create":[],"call":["NoOp"]},"readonly":false,"desc":"Validator approves a project and assigns a credit amount.","events":[{"name":"ProjectApproved","args":[{"type":"uint64","name":"project_id"},{"type":"uint64","name":"credits"}]}],"recommendations":{}},{"name":"reject_project","args":[{"type":"uint64","name":"project_id"}],"returns":{"type":"void"},"actions":{"create":[],"call":["NoOp"]},"readonly":false,"desc":"Validator rejects a pending project.","events":[{"name":"ProjectRejected","args":[{"type":"uint64","name":"project_id"},{"type":"uint64","name":"rejected"}]}],"recommendations":{}},{"name":"review_projects_batch","args":[{"type":"(uint64,uint8,uint64)[]","name":"decisions"}],"returns":{"type":"uint8[]"},"actions":{"create":[],"call":["NoOp"]},"readonly":false,"desc":"Validator approves / rejects many projects in one call.\nIds that are unknown, no longer pending or carry an invalid decision are skipped and reported; the returned codes line up with `decisions`. At most MAX_REVIEW_BATCH decisions, as each applied one logs an event.","events":[{"name":"ProjectApproved","args":[{"type":"uint64","name":"project_id"},{"type":"uint64","name":"credits"}]},{"name":"ProjectRejected","args":[{"type":"uint64","name":"project_id"},{"type":"uint64","name":"rejected"}]}],"recommendations":{}},{"name":"issue_credits","args":[{"type":"uint64","name":"project_id"}],"returns":{"type":"uint64"},"actions":{"create":[],"call":["NoOp"]},"readonly":false,"desc":"Validator issues AARNA tokens to submitter.\nStatus: 2 (verified) → 4 (issued). Prevents double-issuance.","events":[{"name":"CreditsIssued","args":[{"type":"uint64","name":"project_id"},{"type":"address","name":"receiver"},{"type":"uint64","name":"amount"}]}],"recommendations":{}},{"name":"issue_credits_batch","args":[{"type":"uint64[]","name":"project_ids"}],"returns":{"type":"uint64[]"},"actions":{"create":[],"call":["NoOp"]},"readonly":false,"desc":"Validator issues credits for up to MAX_ISSUE_BATCH verified projects in\none call. Transfers go out as one inner group with zero fees, so the outer transaction pays for all of them. Unknown or unverified ids are skipped with an amount of 0; the amounts line up with `project_ids`.","events":[{"name":"CreditsIssued","args":[{"type":"uint64","name":"project_id"},{"type":"address","name":"receiver"},{"type":"uint64","name":"amount"}]}],"recommendations":{}},{"name":"list_for_sale","args":[{"type":"uint64","name":"amount"},{"type":"uint64","name":"price_per_token"},{"type":"uint64","name":"prev_price"},{"type":"pay","name":"deposit"}],"returns":{"type":"uint64"},"actions":{"create":[],"call":["NoOp"]},"readonly":false,"desc":"List AARNA tokens for sale using clawback to escrow.\n`prev_price` is the highest listed price below `price_per_token` (0 if there is none; see get_price_hint), only needed when no listing has that price yet. `deposit` (to the app, from the seller) funds the listing's boxes: LISTING_DEPOSIT, or LISTING_REFUND when a freed id is reused, with any excess refunded. Returns the listing index.","events":[{"name":"Listed","args":[{"type":"uint64","name":"listing_id"},{"type":"address","name":"seller"},{"type":"uint64","name":"amount"},{"type":"uint64","name":"price"}]}],"recommendations":{}},{"name":"buy_listing","args":[{"type":"uint64","name":"listing_id"},{"type":"pay","name":"payment"}],"returns":{"type":"void"},"actions":{"create":[],"call":["NoOp"]},"readonly":false,"desc":"Buy tokens from a listing. Transfers tokens to buyer and ALGO to seller.\n`payment` (to the app, from the buyer) must cover the cost; any excess is refunded.","events":[{"name":"Bought","args":[{"type":"uint64","name":"listing_id"},{"type":"address","name":"buyer"},{"type":"uint64","name":"quantity"},{"type":"uint64","name":"cost"},{"type":"uint64","name":"remaining"}]}],"recommendations":{}},{"name":"buy_listing_partial","args":[{"type":"uint64","name":"listing_id"},{"type":"uint64","name":"quantity"},{"type":"pay","name":"payment"}],"returns":{"type":"void"},"actions":{"create":[],"call":["NoOp"]},"readonly":false,"desc":"Buy part of a listing. The rest stays listed at the same price; the\nlisting closes once its amount reaches zero. Paid for like buy_listing.","events":[{"name":"Bought","args":[{"type":"uint64","name":"listing_id"},{"type":"address","name":"buyer"},{"type":"uint64","name":"quantity"},{"type":"uint64","name":"cost"},{"type":"uint64","name":"remaining"}]}],"recommendations":{}},{"name":"sweep_listings","args":[{"type":"uint64[]","name":"listing_ids"},{"type":"uint64","name":"max_quantity"},{"type":"uint64","name":"max_total_price"},{"type":"pay","name":"payment"}],"returns":{"type":"(uint64,uint64)","struct":"SweepResult"},"actions":{"create":[],"call":["NoOp"]},"readonly":false,"desc":"Fill listings in the given order until `max_quantity` tokens are bought\nor `max_total_price` would be exceeded; the last one may fill partially. Closed or unknown ids are skipped. `payment` (to the app, from the buyer) must cover what is spent. All seller payments (each with the LISTING_REFUND of a listing bought out), a single token transfer to the buyer and the refund of the unspent payment go out as one inner group (at most MAX_SWEEP_FILLS listings). Returns the tokens filled and the ALGO spent.","events":[{"name":"Bought","args":[{"type":"uint64","name":"listing_id"},{"type":"address","name":"buyer"},{"type":"uint64","name":"quantity"},{"type":"uint64","name":"cost"},{"type":"uint64","name":"remaining"}]}],"recommendations":{}},{"name":"cancel_listing","args":[{"type":"uint64","name":"listing_id"}],"returns":{"type":"void"},"actions":{"create":[],"call":["NoOp"]},"readonly":false,"desc":"Seller cancels their listing. Escrowed tokens and LISTING_REFUND returned.","events":[{"name":"Cancelled","args":[{"type":"uint64","name":"listing_id"},{"type":"address","name":"seller"},{"type":"uint64","name":"amount"}]}],"recommendations":{}},{"name":"get_project_count","args":[],"returns":{"type":"uint64"},"actions":{"create":[],"call":["NoOp"]},"readonly":true,"events":[],"recommendations":{}},{"name":"get_asset_id","args":[],"returns":{"type":"uint64"},"actions":{"create":[],"call":["NoOp"]},"readonly":true,"events":[],"recommendations":{}},{"name":"get_admin","args":[],"returns":{"type":"address"},"actions":{"create":[],"call":["NoOp"]},"readonly":true,"events":[],"recommendations":{}},{"name":"get_validator","args":[],"returns":{"type":"address"},"actions":{"create":[],"call":["NoOp"]},"readonly":true,"events":[],"recommendations":{}},{"name":"get_total_credits_issued","args":[],"returns":{"type":"uint64"},"actions":{"create":[],"call":["NoOp"]},"readonly":true,"events":[],"recommendations":{}},{"name":"get_project","args":[{"type":"uint64","name":"project_id"}],"returns":{"type":"(address,string,string,string,string,uint64,uint64)","struct":"ProjectRecord"},"actions":{"create":[],"call":["NoOp"]},"readonly":true,"events":[],"recommendations":{}},{"name":"get_project_header","args":[{"type":"uint64","name":"project_id"}],"returns":{"type":"(address,uint64,uint64)","struct":"ProjectHeader"},"actions":{"create":[],"call":["NoOp"]},"readonly":true,"desc":"Status / credits / submitter only — a single 48-byte box read.","events":[],"recommendations":{}},{"name":"find_project_by_cid","args":[{"type":"string","name":"cid"}],"returns":{"type":"uint64"},"actions":{"create":[],"call":["NoOp"]},"readonly":true,"desc":"Id of the project filed with this CID, or NO_ID if there is none.","events":[],"recommendations":{}},{"name":"get_pending_ids","args":[{"type":"uint64","name":"after"},{"type":"uint64","name":"count"}],"returns":{"type":"uint64[]"},"actions":{"create":[],"call":["NoOp"]},"readonly":true,"desc":"Next `count` pending project ids after `after` (NO_ID = from the start).","events":[],"recommendations":{}},{"name":"get_verified_ids","args":[{"type":"uint64","name":"after"},{"type":"uint64","name":"count"}],"returns":{"type":"uint64[]"},"actions":{"create":[],"call":["NoOp"]},"readonly":true,"desc":"Next `count` verified, not yet issued ids after `after` (NO_ID = start).","events":[],"recommendations":{}},{"name":"get_projects_by_submitter","args":[{"type":"address","name":"addr"},{"type":"uint64","name":"start"},{"type":"uint64","name":"count"}],"returns":{"type":"uint64[]"},"actions":{"create":[],"call":["NoOp"]},"readonly":true,"desc":"Project ids filed by `addr`, oldest first, paged by position.","events":[],"recommendations":{}},{"name":"get_listings_by_seller","args":[{"type":"address","name":"addr"},{"type":"uint64","name":"start"},{"type":"uint64","name":"count"}],"returns":{"type":"uint64[]"},"actions":{"create":[],"call":["NoOp"]},"readonly":true,"desc":"Open listing ids of `addr`, paged by position. Closing a listing moves\nthe seller's last id into its slot, so order is not chronological.","events":[],"recommendations":{}},{"name":"get_stats","args":[],"returns":{"type":"(uint64,uint64,uint64,uint64,uint64,uint64,uint64,uint64,uint64,uint64)","struct":"RegistryStats"},"actions":{"create":[],"call":["NoOp"]},"readonly":true,"desc":"Every aggregate counter in one call; volume_traded is in microAlgo.","events":[],"recommendations":{}},{"name":"get_best_offers","args":[{"type":"uint64","name":"count"}],"returns":{"type":"(uint64,uint64,uint64)[]"},"actions":{"create":[],"call":["NoOp"]},"readonly":true,"desc":"The `count` cheapest active offers, in price then listing-time order.\nCapped at MAX_BOOK_PAGE and by the available opcode budget.","events":[],"recommendations":{}},{"name":"get_depth","args":[{"type":"uint64","name":"price_limit"}],"returns":{"type":"(uint64,uint64,uint64)[]"},"actions":{"create":[],"call":["NoOp"]},"readonly":true,"desc":"Aggregate depth per price level, cheapest first, for every level priced\nat or below `price_limit` (up to MAX_BOOK_PAGE levels).","events":[],"recommendations":{}},{"name":"get_price_hint","args":[{"type":"uint64","name":"price"}],"returns":{"type":"uint64"},"actions":{"create":[],"call":["NoOp"]},"readonly":true,"desc":"The `prev_price` for list_for_sale at `price`: the highest listed price\nbelow it, or 0. Walks the book, so simulate it with extra budget.","events":[],"recommendations":{}},{"name":"get_listing","args":[{"type":"uint64","name":"listing_id"}],"returns":{"type":"(address,uint64,uint64,uint64)","struct":"ListingRecord"},"actions":{"create":[],"call":["NoOp"]},"readonly":true,"desc":"Closed or never-used ids read back as an all-zero, inactive record.","events":[],"recommendations":{}},{"name":"get_listing_count","args":[],"returns":{"type":"uint64"},"actions":{"create":[],"call":["NoOp"]},"readonly":true,"desc":"Upper bound on listing ids (ids are recycled), not the open count.","events":[],"recommendations":{}},{"name":"get_open_listing_count","args":[],"returns":{"type":"uint64"},"actions":{"create":[],"call":["NoOp"]},"readonly":true,"events":[],"recommendations":{}},{"name":"get_projects_page","args":[{"type":"uint64","name":"start"},{"type":"uint64","name":"count"}],"returns":{"type":"(uint64,(address,string,string,string,string,uint64,uint64)[])","struct":"ProjectPage"},"actions":{"create":[],"call":["NoOp"]},"readonly":true,"desc":"Returns up to `count` projects from `start`, stopping early when the\nreturn-size limit or opcode budget is reached. `next_id` is the cursor for the following call; the scan is done once it equals the project count. Metadata is capped at submission, so any one record fits a page.","events":[],"recommendations":{}},{"name":"get_listings_page","args":[{"type":"uint64","name":"start"},{"type":"uint64","name":"count"}],"returns":{"type":"(uint64,(address,uint64,uint64,uint64)[])","struct":"ListingPage"},"actions":{"create":[],"call":["NoOp"]},"readonly":true,"desc":"Returns up to `count` listings from `start`, stopping early when the\nreturn-size limit or opcode budget is reached. `next_id` is the cursor for the following call; the scan is done once it equals the listing count. Items stay positional: a freed id reads back as an all-zero record.","events":[],"recommendations":{}}],"arcs":[22,28],"networks":{},"state":{"schema":{"global":{"ints":19,"bytes":2},"local":{"ints":0,"bytes":0}},"keys":{"global":{"admin":{"keyType":"AVMString","valueType":"address","key":"YWRtaW4="},"validator":{"keyType":"AVMString","valueType":"address","key":"dmFsaWRhdG9y"},"aarna_asset":{"keyType":"AVMString","valueType":"AVMUint64","key":"YWFybmFfYXNzZXQ="},"project_count":{"keyType":"AVMString","valueType":"AVMUint64","key":"cHJvamVjdF9jb3VudA=="},"total_credits_issued":{"keyType":"AVMString","valueType":"AVMUint64","key":"dG90YWxfY3JlZGl0c19pc3N1ZWQ="},"listing_count":{"keyType":"AVMString","valueType":"AVMUint64","key":"bGlzdGluZ19jb3VudA=="},"pending_head":{"keyType":"AVMString","valueType":"AVMUint64","key":"cGVuZGluZ19oZWFk"},"pending_tail":{"keyType":"AVMString","valueType":"AVMUint64","key":"cGVuZGluZ190YWls"},"verified_head":{"keyType":"AVMString","valueType":"AVMUint64","key":"dmVyaWZpZWRfaGVhZA=="},"verified_tail":{"keyType":"AVMString","valueType":"AVMUint64","key":"dmVyaWZpZWRfdGFpbA=="},"best_price":{"keyType":"AVMString","valueType":"AVMUint64","key":"YmVzdF9wcmljZQ=="},"free_listing_head":{"keyType":"AVMString","valueType":"AVMUint64","key":"ZnJlZV9saXN0aW5nX2hlYWQ="},"free_listing_pushes":{"keyType":"AVMString","valueType":"AVMUint64","key":"ZnJlZV9saXN0aW5nX3B1c2hlcw=="},"open_listing_count":{"keyType":"AVMString","valueType":"AVMUint64","key":"b3Blbl9saXN0aW5nX2NvdW50"},"pending_count":{"keyType":"AVMString","valueType":"AVMUint64","key":"cGVuZGluZ19jb3VudA=="},"verified_count":{"keyType":"AVMString","valueType":"AVMUint64","key":"dmVyaWZpZWRfY291bnQ="},"rejected_count":{"keyType":"AVMString","valueType":"AVMUint64","key":"cmVqZWN0ZWRfY291bnQ="},"issued_count":{"keyType":"AVMString","valueType":"AVMUint64","key":"aXNzdWVkX2NvdW50"},"escrowed_tokens":{"keyType":"AVMString","valueType":"AVMUint64","key":"ZXNjcm93ZWRfdG9rZW5z"},"tokens_traded":{"keyType":"AVMString","valueType":"AVMUint64","key":"dG9rZW5zX3RyYWRlZA=="},"volume_traded":{"keyType":"AVMString","valueType":"AVMUint64","key":"dm9sdW1lX3RyYWRlZA=="}},"local":{},"box":{}},"maps":{"global":{},"local":{},"box":{"project_headers":{"keyType":"uint64","valueType":"ProjectHeader","prefix":"aA=="},"project_meta":{"keyType":"uint64","valueType":"ProjectMeta","prefix":"bQ=="},"queue_links":{"keyType":"uint64","valueType":"QueueLink","prefix":"cQ=="},"listings":{"keyType":"uint64","valueType":"ListingRecord","prefix":"bA=="},"free_listings":{"keyType":"uint64","valueType":"FreeLink","prefix":"Zg=="},"price_levels":{"keyType":"uint64","valueType":"PriceLevel","prefix":"bw=="},"listing_links":{"keyType":"uint64","valueType":"ListingLink","prefix":"aw=="},"submitter_index":{"keyType":"address","valueType":"uint64","prefix":"cw=="},"seller_index":{"keyType":"address","valueType":"uint64","prefix":"dA=="},"cid_index":{"keyType":"AVMBytes","valueType":"uint64","prefix":"Yw=="}}}},"bareActions":{"create":[],"call":[]},"sourceInfo":{"approval":{"sourceInfo":[{"pc":[1877],"errorMessage":"amount must be > 0"},{"pc":[905,1003,1523,1640,1725,1870,1923,2426,2498,2604,2814,2991,3042,5537],"errorMessage":"check self.aarna_asset exists"},{"pc":[3054,4127],"errorMessage":"check self.admin exists"},{"pc":[2205,3447,3597,3690],"errorMessage":"check self.best_price exists"},{"pc":[2182,2962,3366,5365],"errorMessage":"check self.escrowed_tokens exists"},{"pc":[1891,1996,5235],"errorMessage":"check self.free_listing_head exists"},{"pc":[5241,5261],"errorMessage":"check self.free_listing_pushes exists"},{"pc":[2364],"errorMessage":"check self.free_listings entry exists"},{"pc":[3348,4342],"errorMessage":"check self.issued_count exists"},{"pc":[2008,2434,2507,2900,3759,4035],"errorMessage":"check self.listing_count exists"},{"pc":[4927,5106],"errorMessage":"check self.listing_links entry exists"},{"pc":[3520,5307],"errorMessage":"check self.listings entry exists"},{"pc":[1981,3360,3771,5272],"errorMessage":"check self.open_listing_count exists"},{"pc":[1205,3330,4217,4273],"errorMessage":"check self.pending_count exists"},{"pc":[4555],"errorMessage":"check self.pending_head exists"},{"pc":[4560],"errorMessage":"check self.pending_tail exists"},{"pc":[2081,3479,3631,4914,5449],"errorMessage":"check self.price_levels entry exists"},{"pc":[1147,1261,1304,1396,1531,1677,3031,3324,3806,4790],"errorMessage":"check self.project_count exists"},{"pc":[1542,1695,3116,4379],"errorMessage":"check self.project_headers entry exists"},{"pc":[3839],"errorMessage":"check self.project_meta entry exists"},{"pc":[4679,4893],"errorMessage":"check self.queue_links entry exists"},{"pc":[3342,4284],"errorMessage":"check self.rejected_count exists"},{"pc":[3372,5377],"errorMessage":"check self.tokens_traded exists"},{"pc":[1598,1808,3076,3354],"errorMessage":"check self.total_credits_issued exists"},{"pc":[3065,4137],"errorMessage":"check self.validator exists"},{"pc":[3336,4228,4331],"errorMessage":"check self.verified_count exists"},{"pc":[4566],"errorMessage":"check self.verified_head exists"},{"pc":[4571],"errorMessage":"check self.verified_tail exists"},{"pc":[3378,5389],"errorMessage":"check self.volume_traded exists"},{"pc":[1269],"errorMessage":"credits must be > 0"},{"pc":[1143],"errorMessage":"duplicate cid: already submitted"},{"pc":[1377],"errorMessage":"index access is out of bounds"},{"pc":[5460,5477],"errorMessage":"index out of bounds"},{"pc":[1916],"errorMessage":"insufficient deposit"},{"pc":[2800,5530],"errorMessage":"insufficient payment"},{"pc":[1016,1032,1048,1064,1333,1620,2563,3128,3455,3494,3614,4822],"errorMessage":"invalid array length header"},{"pc":[2438,2511,2904],"errorMessage":"invalid listing id"},{"pc":[1633,2574],"errorMessage":"invalid number of bytes for arc4.dynamic_array<arc4.uint64>"},{"pc":[1026,1042,1058,1071,3135],"errorMessage":"invalid number of bytes for arc4.dynamic_array<arc4.uint8>"},{"pc":[1347],"errorMessage":"invalid number of bytes for arc4.dynamic_array<smart_contracts.aarna_registry.contract.ReviewDecision>"},{"pc":[866,884,3238,3284],"errorMessage":"invalid number of bytes for arc4.static_array<arc4.uint8, 32>"},{"pc":[1244,1252,1296,1516,1833,1844,1854,2412,2476,2484,2582,2590,2893,3091,3109,3173,3181,3205,3213,3246,3254,3292,3300,3425,3590,3683,3736,3788,3796,4016,4024],"errorMessage":"invalid number of bytes for arc4.uint64"},{"pc":[1265,1308,1535],"errorMessage":"invalid project id"},{"pc":[892],"errorMessage":"invalid: zero address"},{"pc":[2455,2528,2921],"errorMessage":"listing not active"},{"pc":[1871,2427,2499,2605],"errorMessage":"no AARNA token"},{"pc":[1525,1641],"errorMessage":"no AARNA token created"},{"pc":[2933],"errorMessage":"only seller can cancel"},{"pc":[1409,5748],"errorMessage":"overflow"},{"pc":[5501],"errorMessage":"payment must come from the caller"},{"pc":[5493],"errorMessage":"payment must go to the app"},{"pc":[2333],"errorMessage":"price hint not below price"},{"pc":[2343],"errorMessage":"price hint not listed"},{"pc":[1880],"errorMessage":"price must be > 0"},{"pc":[1127],"errorMessage":"project metadata too large"},{"pc":[1283,1321],"errorMessage":"project not pending"},{"pc":[1550],"errorMessage":"project not verified"},{"pc":[2541],"errorMessage":"quantity exceeds listing"},{"pc":[2533],"errorMessage":"quantity must be > 0"},{"pc":[2218],"errorMessage":"stale price hint"},{"pc":[1354],"errorMessage":"too many decisions"},{"pc":[2727],"errorMessage":"too many fills for one sweep"},{"pc":[1645],"errorMessage":"too many projects for one batch"},{"pc":[1866,2422,2494,2600],"errorMessage":"transaction type is pay"},{"pc":[4129],"errorMessage":"unauthorized: admin only"},{"pc":[4139],"errorMessage":"unauthorized: validator only"}],"pcOffsetMethod":"none"},"clear":{"sourceInfo":[],"pcOffsetMethod":"none"}},"source":{"approval":"I3ByYWdtYSB2ZXJzaW9uIDExCiNwcmFnbWEgdHlwZXRyYWNrIGZhbHNlCgovLyBhbGdvcHkuYXJjNC5BUkM0Q29udHJhY3QuYXBwcm92YWxfcHJvZ3JhbSgpIC0+IHVpbnQ2NDoKbWFpbjoKICAgIGludGNibG9jayAwIDEgOCAyIDE4NDQ2NzQ0MDczNzA5NTUxNjE1IDEyOCA5ODAwMCA1MDAKICAgIGJ5dGVjYmxvY2sgMHgxNTFmN2M3NSAiYWFybmFfYXNzZXQiICJwcm9qZWN0X2NvdW50IiAweDY4IDB4NmYgMHg2YyAweDZiICJsaXN0aW5nX2NvdW50IiAicGVuZGluZ19jb3VudCIgImVzY3Jvd2VkX3Rva2VucyIgMHg3MSAidG90YWxfY3JlZGl0c19pc3N1ZWQiICJiZXN0X3ByaWNlIiAib3Blbl9saXN0aW5nX2NvdW50IiAweDAwMDAgImZyZWVfbGlzdGluZ19oZWFkIiAidmVyaWZpZWRfY291bnQiIGJhc2UzMihBQUFBQUFBQUFBQUFBQUFBQUFBQUFBQUFBQUFBQUFBQUFBQUFBQUFBQUFBQUFBQUFBQUFBQUFBQUFBQUFBQUFBQUFBQUFBQUFBQUFBQUFBQUFBQUFBQUFBQUEpICJhZG1pbiIgInZhbGlkYXRvciIgImZyZWVfbGlzdGluZ19wdXNoZXMiICJyZWplY3RlZF9jb3VudCIgImlzc3VlZF9jb3VudCIgInRva2Vuc190cmFkZWQiICJ2b2x1bWVfdHJhZGVkIiAicGVuZGluZ19oZWFkIiAicGVuZGluZ190YWlsIiAidmVyaWZpZWRfaGVhZCIgInZlcmlmaWVkX3RhaWwiIDB4NmQgMHg3NCAweDAwMGEKICAgIHR4biBBcHBsaWNhdGlvbklECiAgICBibnogbWFpbl9hZnRlcl9pZl9lbHNlQDIKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hYXJuYV9yZWdpc3RyeS9jb250cmFjdC5weTo0MDQtNDA1CiAgICAvLyAjIOKUgOKUgCBSb2xlLWJhc2VkIGFjY2VzcyBjb250cm9sIOKUgOKUgAogICAgLy8gc2VsZi5hZG1pbjogYXJjNC5BZGRyZXNzID0gYXJjNC5BZGRyZXNzKEdsb2JhbC56ZXJvX2FkZHJlc3MpCiAgICBieXRlYyAxOCAvLyAiYWRtaW4iCiAgICBnbG9iYWwgWmVyb0FkZHJlc3MKICAgIGFwcF9nbG9iYWxfcHV0CiAgICAvLyBzbWFydF9jb250cmFjdHMvYWFybmFfcmVnaXN0cnkvY29udHJhY3QucHk6NDA2CiAgICAvLyBzZWxmLnZhbGlkYXRvcjogYXJjNC5BZGRyZXNzID0gYXJjNC5BZGRyZXNzKEdsb2JhbC56ZXJvX2FkZHJlc3MpCiAgICBieXRlYyAxOSAvLyAidmFsaWRhdG9yIgogICAgZ2xvYmFsIFplcm9BZGRyZXNzCiAgICBhcHBfZ2xvYmFsX3B1dAogICAgLy8gc21hcnRfY29udHJhY3RzL2Fhcm5hX3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjQwOC00MDkKICAgIC8vICMg4pSA4pSAIEFBUk5BIHRva2VuIChBU0EpIOKUgOKUgAogICAgLy8gc2VsZi5hYXJuYV9hc3NldDogVUludDY0ID0gVUludDY0KDApCiAgICBieXRlY18xIC8vICJhYXJuYV9hc3NldCIKICAgIGludGNfMCAvLyAwCiAgICBhcHBfZ2xvYmFsX3B1dAogICAgLy8gc21hcnRfY29udHJhY3RzL2Fhcm5hX3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjQxMS00MTIKICAgIC8vICMg4pSA4pSAIENvdW50ZXJzIOKUgOKUgAogICAgLy8gc2VsZi5wcm9qZWN0X2NvdW50OiBVSW50NjQgPSBVSW50NjQoMCkKICAgIGJ5dGVjXzIgLy8gInByb2plY3RfY291bnQiCiAgICBpbnRjXzAgLy8gMAogICAgYXBwX2dsb2JhbF9wdXQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hYXJuYV9yZWdpc3RyeS9jb250cmFjdC5weTo0MTMKICAgIC8vIHNlbGYudG90YWxfY3JlZGl0c19pc3N1ZWQ6IFVJbnQ2NCA9IFVJbnQ2NCgwKQogICAgYnl0ZWMgMTEgLy8gInRvdGFsX2NyZWRpdHNfaXNzdWVkIgogICAgaW50Y18wIC8vIDAKICAgIGFwcF9nbG9iYWxfcHV0CiAgICAvLyBzbWFydF9jb250cmFjdHMvYWFybmFfcmVnaXN0cnkvY29udHJhY3QucHk6NDE0CiAgICAvLyBzZWxmLmxpc3RpbmdfY291bnQ6IFVJbnQ2NCA9IFVJbnQ2NCgwKQogICAgYnl0ZWMgNyAvLyAibGlzdGluZ19jb3VudCIKICAgIGludGNfMCAvLyAwCiAgICBhcHBfZ2xvYmFsX3B1dAogICAgLy8gc21hcnRfY29udHJhY3RzL2Fhcm5hX3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjQxNi00MTcKICAgIC8vICMg4pSA4pSAIFJldmlldyBxdWV1ZXMgKGhlYWQgLyB0YWlsIGlkcywgTk9fSUQgd2hlbiBlbXB0eSkg4pSA4pSACiAgICAvLyBzZWxmLnBlbmRpbmdfaGVhZDogVUludDY0ID0gVUludDY0KE5PX0lEKQogICAgYnl0ZWMgMjUgLy8gInBlbmRpbmdfaGVhZCIKICAgIGludGMgNCAvLyAxODQ0Njc0NDA3MzcwOTU1MTYxNQogICAgYXBwX2dsb2JhbF9wdXQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hYXJuYV9yZWdpc3RyeS9jb250cmFjdC5weTo0MTgKICAgIC8vIHNlbGYucGVuZGluZ190YWlsOiBVSW50NjQgPSBVSW50NjQoTk9fSUQpCiAgICBieXRlYyAyNiAvLyAicGVuZGluZ190YWlsIgogICAgaW50YyA0IC8vIDE4NDQ2NzQ0MDczNzA5NTUxNjE1CiAgICBhcHBfZ2xvYmFsX3B1dAogICAgLy8gc21hcnRfY29udHJhY3RzL2Fhcm5hX3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjQxOQogICAgLy8gc2VsZi52ZXJpZmllZF9oZWFkOiBVSW50NjQgPSBVSW50NjQoTk9fSUQpCiAgICBieXRlYyAyNyAvLyAidmVyaWZpZWRfaGVhZCIKICAgIGludGMgNCAvLyAxODQ0Njc0NDA3MzcwOTU1MTYxNQogICAgYXBwX2dsb2JhbF9wdXQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hYXJuYV9yZWdpc3RyeS9jb250cmFjdC5weTo0MjAKICAgIC8vIHNlbGYudmVyaWZpZWRfdGFpbDogVUludDY0ID0gVUludDY0KE5PX0lEKQogICAgYnl0ZWMgMjggLy8gInZlcmlmaWVkX3RhaWwiCiAgICBpbnRjIDQgLy8gMTg0NDY3NDQwNzM3MDk1NTE2MTUKICAgIGFwcF9nbG9iYWxfcHV0CiAgICAvLyBzbWFydF9jb250cmFjdHMvYWFybmFfcmVnaXN0cnkvY29udHJhY3QucHk6NDIyLTQyMwogICAgLy8gIyDilIDilIAgT3JkZXIgYm9vayAobG93ZXN0IGxpc3RlZCBwcmljZSwgTk9fUFJJQ0Ugd2hlbiBlbXB0eSkg4pSA4pSACiAgICAvLyBzZWxmLmJlc3RfcHJpY2U6IFVJbnQ2NCA9IFVJbnQ2NChOT19QUklDRSkKICAgIGJ5dGVjIDEyIC8vICJiZXN0X3ByaWNlIgogICAgaW50Y18wIC8vIDAKICAgIGFwcF9nbG9iYWxfcHV0CiAgICAvLyBzbWFydF9jb250cmFjdHMvYWFybmFfcmVnaXN0cnkvY29udHJhY3QucHk6NDI1LTQyNgogICAgLy8gIyDilIDilIAgTGlzdGluZyByZWN5Y2xpbmcgKGZyZWUtbGlzdCBoZWFkLCBOT19JRCB3aGVuIGVtcHR5KSDilIDilIAKICAgIC8vIHNlbGYuZnJlZV9saXN0aW5nX2hlYWQ6IFVJbnQ2NCA9IFVJbnQ2NChOT19JRCkKICAgIGJ5dGVjIDE1IC8vICJmcmVlX2xpc3RpbmdfaGVhZCIKICAgIGludGMgNCAvLyAxODQ0Njc0NDA3MzcwOTU1MTYxNQogICAgYXBwX2dsb2JhbF9wdXQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hYXJuYV9yZWdpc3RyeS9jb250cmFjdC5weTo0MjcKICAgIC8vIHNlbGYuZnJlZV9saXN0aW5nX3B1c2hlczogVUludDY0ID0gVUludDY0KDApCiAgICBieXRlYyAyMCAvLyAiZnJlZV9saXN0aW5nX3B1c2hlcyIKICAgIGludGNfMCAvLyAwCiAgICBhcHBfZ2xvYmFsX3B1dAogICAgLy8gc21hcnRfY29udHJhY3RzL2Fhcm5hX3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjQyOAogICAgLy8gc2VsZi5vcGVuX2xpc3RpbmdfY291bnQ6IFVJbnQ2NCA9IFVJbnQ2NCgwKQogICAgYnl0ZWMgMTMgLy8gIm9wZW5fbGlzdGluZ19jb3VudCIKICAgIGludGNfMCAvLyAwCiAgICBhcHBfZ2xvYmFsX3B1dAogICAgLy8gc21hcnRfY29udHJhY3RzL2Fhcm5hX3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjQzMC00MzEKICAgIC8vICMg4pSA4pSAIEFnZ3JlZ2F0ZSBzdGF0cyAoa2VwdCBpbiBzdGVwIGJ5IGV2ZXJ5IGxpZmVjeWNsZSAvIG1hcmtldCBjYWxsKSDilIDilIAKICAgIC8vIHNlbGYucGVuZGluZ19jb3VudDogVUludDY0ID0gVUludDY0KDApCiAgICBieXRlYyA4IC8vICJwZW5kaW5nX2NvdW50IgogICAgaW50Y18wIC8vIDAKICAgIGFwcF9nbG9iYWxfcHV0CiAgICAvLyBzbWFydF9jb250cmFjdHMvYWFybmFfcmVnaXN0cnkvY29udHJhY3QucHk6NDMyCiAgICAvLyBzZWxmLnZlcmlmaWVkX2NvdW50OiBVSW50NjQgPSBVSW50NjQoMCkKICAgIGJ5dGVjIDE2IC8vICJ2ZXJpZmllZF9jb3VudCIKICAgIGludGNfMCAvLyAwCiAgICBhcHBfZ2xvYmFsX3B1dAogICAgLy8gc21hcnRfY29udHJhY3RzL2Fhcm5hX3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjQzMwogICAgLy8gc2VsZi5yZWplY3RlZF9jb3VudDogVUludDY0ID0gVUludDY0KDApCiAgICBieXRlYyAyMSAvLyAicmVqZWN0ZWRfY291bnQiCiAgICBpbnRjXzAgLy8gMAogICAgYXBwX2dsb2JhbF9wdXQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hYXJuYV9yZWdpc3RyeS9jb250cmFjdC5weTo0MzQKICAgIC8vIHNlbGYuaXNzdWVkX2NvdW50OiBVSW50NjQgPSBVSW50NjQoMCkKICAgIGJ5dGVjIDIyIC8vICJpc3N1ZWRfY291bnQiCiAgICBpbnRjXzAgLy8gMAogICAgYXBwX2dsb2JhbF9wdXQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hYXJuYV9yZWdpc3RyeS9jb250cmFjdC5weTo0MzUKICAgIC8vIHNlbGYuZXNjcm93ZWRfdG9rZW5zOiBVSW50NjQgPSBVSW50NjQoMCkKICAgIGJ5dGVjIDkgLy8gImVzY3Jvd2VkX3Rva2VucyIKICAgIGludGNfMCAvLyAwCiAgICBhcHBfZ2xvYmFsX3B1dAogICAgLy8gc21hcnRfY29udHJhY3RzL2Fhcm5hX3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjQzNgogICAgLy8gc2VsZi50b2tlbnNfdHJhZGVkOiBVSW50NjQgPSBVSW50NjQoMCkKICAgIGJ5dGVjIDIzIC8vICJ0b2tlbnNfdHJhZGVkIgogICAgaW50Y18wIC8vIDAKICAgIGFwcF9nbG9iYWxfcHV0CiAgICAvLyBzbWFydF9jb250cmFjdHMvYWFybmFfcmVnaXN0cnkvY29udHJhY3QucHk6NDM3CiAgICAvLyBzZWxmLnZvbHVtZV90cmFkZWQ6IFVJbnQ2NCA9IFVJbnQ2NCgwKQogICAgYnl0ZWMgMjQgLy8gInZvbHVtZV90cmFkZWQiCiAgICBpbnRjXzAgLy8gMAogICAgYXBwX2dsb2JhbF9wdXQKCm1haW5fYWZ0ZXJfaWZfZWxzZUAyOgogICAgLy8gc21hcnRfY29udHJhY3RzL2Fhcm5hX3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjQwMS00MDIKICAgIC8vICMg4pSA4pSAIENvbnRyYWN0IOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgAogICAgLy8gY2xhc3MgQWFybmFSZWdpc3RyeShBUkM0Q29udHJhY3QpOgogICAgdHhuIE9uQ29tcGxldGlvbgogICAgIQogICAgYXNzZXJ0CiAgICB0eG4gQXBwbGljYXRpb25JRAogICAgYnogbWFpbl9jcmVhdGVfTm9PcEA0MQogICAgcHVzaGJ5dGVzcyAweGYxMjZkMDRiIDB4ZDM0OGZiYjMgMHgwOGZiN2I3YyAweGEyMWE4MDc3IDB4NjY0NWYyZjkgMHgyMTk3OTk0MyAweGI0ODIwNzFjIDB4NjI2MjkwNjUgMHhlNTU3NzMwOCAweGJkN2E4MWRkIDB4MDUwMGZjYTkgMHhhNmY0MTg3NiAweDBmNDQ1N2FhIDB4NjNkNTViNmMgMHgzMDVlNzViZCAweDViYTIyYTg0IDB4MzQ2YjNkYmMgMHhmMzhlNjk0MSAweDVmMWNkMmRjIDB4MGExYzY1NmUgMHgxYTQ3ZTcyNiAweDc3NmM3NGUzIDB4ZTM2YTdiZTIgMHhmODNlY2E3NSAweDZkMDk4ZTU1IDB4MGYyMTYwOTkgMHhhOGI3Nzg4NSAweDdmNDMxMGU1IDB4NmU4MTVhODcgMHg4ZGQyMTNiNSAweDE2YWVkZTZlIDB4MWRlYmE0ZTkgMHhiYzc0NWRlZCAweDM2OTRjZTRhIDB4NWE1Y2ZiM2YgLy8gbWV0aG9kICJzZXRfdmFsaWRhdG9yKGFkZHJlc3Mpdm9pZCIsIG1ldGhvZCAidHJhbnNmZXJfYWRtaW4oYWRkcmVzcyl2b2lkIiwgbWV0aG9kICJlbnN1cmVfdG9rZW4oKXVpbnQ2NCIsIG1ldGhvZCAic3VibWl0X3Byb2plY3Qoc3RyaW5nLHN0cmluZyxzdHJpbmcsc3RyaW5nKXVpbnQ2NCIsIG1ldGhvZCAiYXBwcm92ZV9wcm9qZWN0KHVpbnQ2NCx1aW50NjQpdm9pZCIsIG1ldGhvZCAicmVqZWN0X3Byb2plY3QodWludDY0KXZvaWQiLCBtZXRob2QgInJldmlld19wcm9qZWN0c19iYXRjaCgodWludDY0LHVpbnQ4LHVpbnQ2NClbXSl1aW50OFtdIiwgbWV0aG9kICJpc3N1ZV9jcmVkaXRzKHVpbnQ2NCl1aW50NjQiLCBtZXRob2QgImlzc3VlX2NyZWRpdHNfYmF0Y2godWludDY0W10pdWludDY0W10iLCBtZXRob2QgImxpc3RfZm9yX3NhbGUodWludDY0LHVpbnQ2NCx1aW50NjQscGF5KXVpbnQ2NCIsIG1ldGhvZCAiYnV5X2xpc3RpbmcodWludDY0LHBheSl2b2lkIiwgbWV0aG9kICJidXlfbGlzdGluZ19wYXJ0aWFsKHVpbnQ2NCx1aW50NjQscGF5KXZvaWQiLCBtZXRob2QgInN3ZWVwX2xpc3RpbmdzKHVpbnQ2NFtdLHVpbnQ2NCx1aW50NjQscGF5KSh1aW50NjQsdWludDY0KSIsIG1ldGhvZCAiY2FuY2VsX2xpc3RpbmcodWludDY0KXZvaWQiLCBtZXRob2QgImdldF9wcm9qZWN0X2NvdW50KCl1aW50NjQiLCBtZXRob2QgImdldF9hc3NldF9pZCgpdWludDY0IiwgbWV0aG9kICJnZXRfYWRtaW4oKWFkZHJlc3MiLCBtZXRob2QgImdldF92YWxpZGF0b3IoKWFkZHJlc3MiLCBtZXRob2QgImdldF90b3RhbF9jcmVkaXRzX2lzc3VlZCgpdWludDY0IiwgbWV0aG9kICJnZXRfcHJvamVjdCh1aW50NjQpKGFkZHJlc3Msc3RyaW5nLHN0cmluZyxzdHJpbmcsc3RyaW5nLHVpbnQ2NCx1aW50NjQpIiwgbWV0aG9kICJnZXRfcHJvamVjdF9oZWFkZXIodWludDY0KShhZGRyZXNzLHVpbnQ2NCx1aW50NjQpIiwgbWV0aG9kICJmaW5kX3Byb2plY3RfYnlfY2lkKHN0cmluZyl1aW50NjQiLCBtZXRob2QgImdldF9wZW5kaW5nX2lkcyh1aW50NjQsdWludDY0KXVpbnQ2NFtdIiwgbWV0aG9kICJnZXRfdmVyaWZpZWRfaWRzKHVpbnQ2NCx1aW50NjQpdWludDY0W10iLCBtZXRob2QgImdldF9wcm9qZWN0c19ieV9zdWJtaXR0ZXIoYWRkcmVzcyx1aW50NjQsdWludDY0KXVpbnQ2NFtdIiwgbWV0aG9kICJnZXRfbGlzdGluZ3NfYnlfc2VsbGVyKGFkZHJlc3MsdWludDY0LHVpbnQ2NCl1aW50NjRbXSIsIG1ldGhvZCAiZ2V0X3N0YXRzKCkodWludDY0LHVpbnQ2NCx1aW50NjQsdWludDY0LHVpbnQ2NCx1aW50NjQsdWludDY0LHVpbnQ2NCx1aW50NjQsdWludDY0KSIsIG1ldGhvZCAiZ2V0X2Jlc3Rfb2ZmZXJzKHVpbnQ2NCkodWludDY0LHVpbnQ2NCx1aW50NjQpW10iLCBtZXRob2QgImdldF9kZXB0aCh1aW50NjQpKHVpbnQ2NCx1aW50NjQsdWludDY0KVtdIiwgbWV0aG9kICJnZXRfcHJpY2VfaGludCh1aW50NjQpdWludDY0IiwgbWV0aG9kICJnZXRfbGlzdGluZyh1aW50NjQpKGFkZHJlc3MsdWludDY0LHVpbnQ2NCx1aW50NjQpIiwgbWV0aG9kICJnZXRfbGlzdGluZ19jb3VudCgpdWludDY0IiwgbWV0aG9kICJnZXRfb3Blbl9saXN0aW5nX2NvdW50KCl1aW50NjQiLCBtZXRob2QgImdldF9wcm9qZWN0c19wYWdlKHVpbnQ2NCx1aW50NjQpKHVpbnQ2NCwoYWRkcmVzcyxzdHJpbmcsc3RyaW5nLHN0cmluZyxzdHJpbmcsdWludDY0LHVpbnQ2NClbXSkiLCBtZXRob2QgImdldF9saXN0aW5nc19wYWdlKHVpbnQ2NCx1aW50NjQpKHVpbnQ2NCwoYWRkcmVzcyx1aW50NjQsdWludDY0LHVpbnQ2NClbXSkiCiAgICB0eG5hIEFwcGxpY2F0aW9uQXJncyAwCiAgICBtYXRjaCBzZXRfdmFsaWRhdG9yIHRyYW5zZmVyX2FkbWluIGVuc3VyZV90b2tlbiBzdWJtaXRfcHJvamVjdCBhcHByb3ZlX3Byb2plY3QgcmVqZWN0X3Byb2plY3QgcmV2aWV3X3Byb2plY3RzX2JhdGNoIGlzc3VlX2NyZWRpdHMgaXNzdWVfY3JlZGl0c19iYXRjaCBsaXN0X2Zvcl9zYWxlIGJ1eV9saXN0aW5nIGJ1eV9saXN0aW5nX3BhcnRpYWwgc3dlZXBfbGlzdGluZ3MgY2FuY2VsX2xpc3RpbmcgZ2V0X3Byb2plY3RfY291bnQgZ2V0X2Fzc2V0X2lkIGdldF9hZG1pbiBnZXRfdmFsaWRhdG9yIGdldF90b3RhbF9jcmVkaXRzX2lzc3VlZCBnZXRfcHJvamVjdCBnZXRfcHJvamVjdF9oZWFkZXIgZmluZF9wcm9qZWN0X2J5X2NpZCBnZXRfcGVuZGluZ19pZHMgZ2V0X3ZlcmlmaWVkX2lkcyBnZXRfcHJvamVjdHNfYnlfc3VibWl0dGVyIGdldF9saXN0aW5nc19ieV9zZWxsZXIgZ2V0X3N0YXRzIGdldF9iZXN0X29mZmVycyBnZXRfZGVwdGggZ2V0X3ByaWNlX2hpbnQgZ2V0X2xpc3RpbmcgZ2V0X2xpc3RpbmdfY291bnQgZ2V0X29wZW5fbGlzdGluZ19jb3VudCBnZXRfcHJvamVjdHNfcGFnZSBnZXRfbGlzdGluZ3NfcGFnZQogICAgZXJyCgptYWluX2NyZWF0ZV9Ob09wQDQxOgogICAgLy8gc21hcnRfY29udHJhY3RzL2Fhcm5hX3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjQwMS00MDIKICAgIC8vICMg4pSA4pSAIENvbnRyYWN0IOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgAogICAgLy8gY2xhc3MgQWFybmFSZWdpc3RyeShBUkM0Q29udHJhY3QpOgogICAgcHVzaGJ5dGVzIDB4ODNmMTQ3NDggLy8gbWV0aG9kICJpbml0KCl2b2lkIgogICAgdHhuYSBBcHBsaWNhdGlvbkFyZ3MgMAogICAgbWF0Y2ggaW5pdAogICAgZXJyCgoKLy8gc21hcnRfY29udHJhY3RzLmFhcm5hX3JlZ2lzdHJ5LmNvbnRyYWN0Ll9pbmRleF9sZW5ndGgoa2V5OiBieXRlcykgLT4gdWludDY0OgpfaW5kZXhfbGVuZ3RoOgogICAgLy8gc21hcnRfY29udHJhY3RzL2Fhcm5hX3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjMzMy0zMzQKICAgIC8vIEBzdWJyb3V0aW5lCiAgICAvLyBkZWYgX2luZGV4X2xlbmd0aChrZXk6IEJ5dGVzKSAtPiBVSW50NjQ6CiAgICBwcm90byAxIDEKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hYXJuYV9yZWdpc3RyeS9jb250cmFjdC5weTozMzUKICAgIC8vIGNvdW50LCBleGlzdHMgPSBvcC5Cb3guZ2V0KGtleSkKICAgIGZyYW1lX2RpZyAtMQogICAgYm94X2dldAogICAgLy8gc21hcnRfY29udHJhY3RzL2Fhcm5hX3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjMzNgogICAgLy8gaWYgbm90IGV4aXN0czoKICAgIGJueiBfaW5kZXhfbGVuZ3RoX2FmdGVyX2lmX2Vsc2VAMgogICAgLy8gc21hcnRfY29udHJhY3RzL2Fhcm5hX3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjMzNwogICAgLy8gcmV0dXJuIFVJbnQ2NCgwKQogICAgaW50Y18wIC8vIDAKICAgIHN3YXAKICAgIHJldHN1YgoKX2luZGV4X2xlbmd0aF9hZnRlcl9pZl9lbHNlQDI6CiAgICAvLyBzbWFydF9jb250cmFjdHMvYWFybmFfcmVnaXN0cnkvY29udHJhY3QucHk6MzM4CiAgICAvLyByZXR1cm4gb3AuYnRvaShjb3VudCkKICAgIGJ0b2kKICAgIHJldHN1YgoKCi8vIHNtYXJ0X2NvbnRyYWN0cy5hYXJuYV9yZWdpc3RyeS5jb250cmFjdC5faW5kZXhfYXBwZW5kKGtleTogYnl0ZXMsIGl0ZW06IHVpbnQ2NCkgLT4gdWludDY0OgpfaW5kZXhfYXBwZW5kOgogICAgLy8gc21hcnRfY29udHJhY3RzL2Fhcm5hX3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjM0Ni0zNDcKICAgIC8vIEBzdWJyb3V0aW5lCiAgICAvLyBkZWYgX2luZGV4X2FwcGVuZChrZXk6IEJ5dGVzLCBpdGVtOiBVSW50NjQpIC0+IFVJbnQ2NDoKICAgIHByb3RvIDIgMQogICAgLy8gc21hcnRfY29udHJhY3RzL2Fhcm5hX3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjM1MgogICAgLy8gc2xvdCA9IF9pbmRleF9sZW5ndGgoa2V5KQogICAgZnJhbWVfZGlnIC0yCiAgICBjYWxsc3ViIF9pbmRleF9sZW5ndGgKICAgIGR1cG4gMgogICAgLy8gc21hcnRfY29udHJhY3RzL2Fhcm5hX3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjM1MwogICAgLy8gb3AuQm94LnB1dChrZXksIG9wLml0b2Ioc2xvdCArIDEpKQogICAgaW50Y18xIC8vIDEKICAgICsKICAgIGl0b2IKICAgIGZyYW1lX2RpZyAtMgogICAgc3dhcAogICAgYm94X3B1dAogICAgLy8gc21hcnRfY29udHJhY3RzL2Fhcm5hX3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjM0MwogICAgLy8gcmV0dXJuIGtleSArIG9wLml0b2Ioc2xvdCAvLyBJTkRFWF9QQUdFX0lEUykKICAgIGR1cAogICAgaW50YyA1IC8vIDEyOAogICAgLwogICAgaXRvYgogICAgZnJhbWVfZGlnIC0yCiAgICBzd2FwCiAgICBjb25jYXQKICAgIHN3YXAKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hYXJuYV9yZWdpc3RyeS9jb250cmFjdC5weTozNTUKICAgIC8vIG9mZnNldCA9IHNsb3QgJSBJTkRFWF9QQUdFX0lEUyAqIDgKICAgIGludGMgNSAvLyAxMjgKICAgICUKICAgIGludGNfMiAvLyA4CiAgICAqCiAgICBkdXAKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hYXJuYV9yZWdpc3RyeS9jb250cmFjdC5weTozNTYKICAgIC8vIGlmIG9mZnNldCA9PSAwOgogICAgYm56IF9pbmRleF9hcHBlbmRfZWxzZV9ib2R5QDIKICAgIHBvcAogICAgLy8gc21hcnRfY29udHJhY3RzL2Fhcm5hX3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjM1NwogICAgLy8gb3AuQm94LnB1dChwYWdlX2tleSwgb3AuaXRvYihpdGVtKSkKICAgIGZyYW1lX2RpZyAtMQogICAgaXRvYgogICAgYm94X3B1dAogICAgLy8gc21hcnRfY29udHJhY3RzL2Fhcm5hX3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjM2MQogICAgLy8gcmV0dXJuIHNsb3QKICAgIHJldHN1YgoKX2luZGV4X2FwcGVuZF9lbHNlX2JvZHlAMjoKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hYXJuYV9yZWdpc3RyeS9jb250cmFjdC5weTozNTkKICAgIC8vIG9wLkJveC5yZXNpemUocGFnZV9rZXksIG9mZnNldCArIDgpCiAgICBkdXAKICAgIGludGNfMiAvLyA4CiAgICArCiAgICB1bmNvdmVyIDIKICAgIGR1cAogICAgdW5jb3ZlciAyCiAgICBib3hfcmVzaXplCiAgICAvLyBzbWFydF9jb250cmFjdHMvYWFybmFfcmVnaXN0cnkvY29udHJhY3QucHk6MzYwCiAgICAvLyBvcC5Cb3gucmVwbGFjZShwYWdlX2tleSwgb2Zmc2V0LCBvcC5pdG9iKGl0ZW0pKQogICAgZnJhbWVfZGlnIC0xCiAgICBpdG9iCiAgICBzd2FwCiAgICBjb3ZlciAyCiAgICBib3hfcmVwbGFjZQogICAgLy8gc21hcnRfY29udHJhY3RzL2Fhcm5hX3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjM2MQogICAgLy8gcmV0dXJuIHNsb3QKICAgIHJldHN1YgoKCi8vIHNtYXJ0X2NvbnRyYWN0cy5hYXJuYV9yZWdpc3RyeS5jb250cmFjdC5BYXJuYVJlZ2lzdHJ5LmluaXRbcm91dGluZ10oKSAtPiB2b2lkOgppbml0OgogICAgLy8gc21hcnRfY29udHJhY3RzL2Fhcm5hX3JlZ2lzdHJ5L2NvbnRyYWN0LnB5Ojg4MwogICAgLy8gc2VsZi5hZG1pbiA9IGFyYzQuQWRkcmVzcyhUeG4uc2VuZGVyKQogICAgYnl0ZWMgMTggLy8gImFkbWluIgogICAgdHhuIFNlbmRlcgogICAgYXBwX2dsb2JhbF9wdXQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hYXJuYV9yZWdpc3RyeS9jb250cmFjdC5weTo4NzctODgwCiAgICAvLyAjIOKVkOKVkOKVkOKVkOKVkOKVkOKVkOKVkOKVkOKVkOKVkOKVkOKVkOKVkOKVkOKVkOKVkOKVkOKVkOKVkOKVkOKVkOKVkOKVkOKVkOKVkOKVkOKVkOKVkOKVkOKVkOKVkOKVkOKVkOKVkOKVkOKVkOKVkOKVkOKVkOKVkOKVkOKVkOKVkOKVkOKVkOKVkOKVkOKVkOKVkOKVkOKVkOKVkOKVkOKVkOKVkOKVkOKVkOKVkOKVkOKVkOKVkOKVkOKVkOKVkOKVkOKVkOKVkOKVkOKVkAogICAgLy8gIyBMaWZlY3ljbGUgLyBBZG1pbgogICAgLy8gIyDilZDilZDilZDilZDilZDilZDilZDilZDilZDilZDilZDilZDilZDilZDilZDilZDilZDilZDilZDilZDilZDilZDilZDilZDilZDilZDilZDilZDilZDilZDilZDilZDilZDilZDilZDilZDilZDilZDilZDilZDilZDilZDilZDilZDilZDilZDilZDilZDilZDilZDilZDilZDilZDilZDilZDilZDilZDilZDilZDilZDilZDilZDilZDilZDilZDilZDilZDilZDilZDilZAKICAgIC8vIEBhcmM0LmFiaW1ldGhvZChjcmVhdGU9InJlcXVpcmUiKQogICAgaW50Y18xIC8vIDEKICAgIHJldHVybgoKCi8vIHNtYXJ0X2NvbnRyYWN0cy5hYXJuYV9yZWdpc3RyeS5jb250cmFjdC5BYXJuYVJlZ2lzdHJ5LnNldF92YWxpZGF0b3Jbcm91dGluZ10oKSAtPiB2b2lkOgpzZXRfdmFsaWRhdG9yOgogICAgLy8gc21hcnRfY29udHJhY3RzL2Fhcm5hX3JlZ2lzdHJ5L2NvbnRyYWN0LnB5Ojg4NQogICAgLy8gQGFyYzQuYWJpbWV0aG9kCiAgICB0eG5hIEFwcGxpY2F0aW9uQXJncyAxCiAgICBkdXAKICAgIGxlbgogICAgcHVzaGludCAzMgogICAgPT0KICAgIGFzc2VydCAvLyBpbnZhbGlkIG51bWJlciBvZiBieXRlcyBmb3IgYXJjNC5zdGF0aWNfYXJyYXk8YXJjNC51aW50OCwgMzI+CiAgICAvLyBzbWFydF9jb250cmFjdHMvYWFybmFfcmVnaXN0cnkvY29udHJhY3QucHk6ODg4CiAgICAvLyBzZWxmLl9vbmx5X2FkbWluKCkKICAgIGNhbGxzdWIgX29ubHlfYWRtaW4KICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hYXJuYV9yZWdpc3RyeS9jb250cmFjdC5weTo4ODkKICAgIC8vIHNlbGYudmFsaWRhdG9yID0gYWRkci5jb3B5KCkKICAgIGJ5dGVjIDE5IC8vICJ2YWxpZGF0b3IiCiAgICBzd2FwCiAgICBhcHBfZ2xvYmFsX3B1dAogICAgLy8gc21hcnRfY29udHJhY3RzL2Fhcm5hX3JlZ2lzdHJ5L2NvbnRyYWN0LnB5Ojg4NQogICAgLy8gQGFyYzQuYWJpbWV0aG9kCiAgICBpbnRjXzEgLy8gMQogICAgcmV0dXJuCgoKLy8gc21hcnRfY29udHJhY3RzLmFhcm5hX3JlZ2lzdHJ5LmNvbnRyYWN0LkFhcm5hUmVnaXN0cnkudHJhbnNmZXJfYWRtaW5bcm91dGluZ10oKSAtPiB2b2lkOgp0cmFuc2Zlcl9hZG1pbjoKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hYXJuYV9yZWdpc3RyeS9jb250cmFjdC5weTo4OTEKICAgIC8vIEBhcmM0LmFiaW1ldGhvZAogICAgdHhuYSBBcHBsaWNhdGlvbkFyZ3MgMQogICAgZHVwCiAgICBsZW4KICAgIHB1c2hpbnQgMzIKICAgID09CiAgICBhc3NlcnQgLy8gaW52YWxpZCBudW1iZXIgb2YgYnl0ZXMgZm9yIGFyYzQuc3RhdGljX2FycmF5PGFyYzQudWludDgsIDMyPgogICAgLy8gc21hcnRfY29udHJhY3RzL2Fhcm5hX3JlZ2lzdHJ5L2NvbnRyYWN0LnB5Ojg5NAogICAgLy8gc2VsZi5fb25seV9hZG1pbigpCiAgICBjYWxsc3ViIF9vbmx5X2FkbWluCiAgICAvLyBzbWFydF9jb250cmFjdHMvYWFybmFfcmVnaXN0cnkvY29udHJhY3QucHk6ODk1CiAgICAvLyBhc3NlcnQgbmV3X2FkbWluLm5hdGl2ZSAhPSBHbG9iYWwuemVyb19hZGRyZXNzLCAiaW52YWxpZDogemVybyBhZGRyZXNzIgogICAgZHVwCiAgICBnbG9iYWwgWmVyb0FkZHJlc3MKICAgICE9CiAgICBhc3NlcnQgLy8gaW52YWxpZDogemVybyBhZGRyZXNzCiAgICAvLyBzbWFydF9jb250cmFjdHMvYWFybmFfcmVnaXN0cnkvY29udHJhY3QucHk6ODk2CiAgICAvLyBzZWxmLmFkbWluID0gbmV3X2FkbWluLmNvcHkoKQogICAgYnl0ZWMgMTggLy8gImFkbWluIgogICAgc3dhcAogICAgYXBwX2dsb2JhbF9wdXQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hYXJuYV9yZWdpc3RyeS9jb250cmFjdC5weTo4OTEKICAgIC8vIEBhcmM0LmFiaW1ldGhvZAogICAgaW50Y18xIC8vIDEKICAgIHJldHVybgoKCi8vIHNtYXJ0X2NvbnRyYWN0cy5hYXJuYV9yZWdpc3RyeS5jb250cmFjdC5BYXJuYVJlZ2lzdHJ5LmVuc3VyZV90b2tlbltyb3V0aW5nXSgpIC0+IHZvaWQ6CmVuc3VyZV90b2tlbjoKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hYXJuYV9yZWdpc3RyeS9jb250cmFjdC5weTo5MDQKICAgIC8vIHNlbGYuX29ubHlfYWRtaW4oKQogICAgY2FsbHN1YiBfb25seV9hZG1pbgogICAgLy8gc21hcnRfY29udHJhY3RzL2Fhcm5hX3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjkwNQogICAgLy8gaWYgbm90IHNlbGYuYWFybmFfYXNzZXQ6CiAgICBpbnRjXzAgLy8gMAogICAgYnl0ZWNfMSAvLyAiYWFybmFfYXNzZXQiCiAgICBhcHBfZ2xvYmFsX2dldF9leAogICAgYXNzZXJ0IC8vIGNoZWNrIHNlbGYuYWFybmFfYXNzZXQgZXhpc3RzCiAgICBibnogZW5zdXJlX3Rva2VuX2FmdGVyX2lmX2Vsc2VANAogICAgLy8gc21hcnRfY29udHJhY3RzL2Fhcm5hX3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjkwNi05MTcKICAgIC8vIHJlc3VsdCA9IGl0eG4uQXNzZXRDb25maWcoCiAgICAvLyAgICAgdG90YWw9MTBfMDAwXzAwMCwKICAgIC8vICAgICBkZWNpbWFscz0wLAogICAgLy8gICAgIGRlZmF1bHRfZnJvemVuPUZhbHNlLAogICAgLy8gICAgIHVuaXRfbmFtZT0iQUFSTkEiLAogICAgLy8gICAgIGFzc2V0X25hbWU9IkFhcm5hIENhcmJvbiBDcmVkaXQiLAogICAgLy8gICAgIHVybD0iaHR0cHM6Ly9hYXJuYS5lY28iLAogICAgLy8gICAgIG1hbmFnZXI9R2xvYmFsLmN1cnJlbnRfYXBwbGljYXRpb25fYWRkcmVzcywKICAgIC8vICAgICByZXNlcnZlPUdsb2JhbC5jdXJyZW50X2FwcGxpY2F0aW9uX2FkZHJlc3MsCiAgICAvLyAgICAgZnJlZXplPUdsb2JhbC5jdXJyZW50X2FwcGxpY2F0aW9uX2FkZHJlc3MsCiAgICAvLyAgICAgY2xhd2JhY2s9R2xvYmFsLmN1cnJlbnRfYXBwbGljYXRpb25fYWRkcmVzcywKICAgIC8vICkuc3VibWl0KCkKICAgIGl0eG5fYmVnaW4KICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hYXJuYV9yZWdpc3RyeS9jb250cmFjdC5weTo5MTMKICAgIC8vIG1hbmFnZXI9R2xvYmFsLmN1cnJlbnRfYXBwbGljYXRpb25fYWRkcmVzcywKICAgIGdsb2JhbCBDdXJyZW50QXBwbGljYXRpb25BZGRyZXNzCiAgICAvLyBzbWFydF9jb250cmFjdHMvYWFybmFfcmVnaXN0cnkvY29udHJhY3QucHk6OTE0LTkxNgogICAgLy8gcmVzZXJ2ZT1HbG9iYWwuY3VycmVudF9hcHBsaWNhdGlvbl9hZGRyZXNzLAogICAgLy8gZnJlZXplPUdsb2JhbC5jdXJyZW50X2FwcGxpY2F0aW9uX2FkZHJlc3MsCiAgICAvLyBjbGF3YmFjaz1HbG9iYWwuY3VycmVudF9hcHBsaWNhdGlvbl9hZGRyZXNzLAogICAgZHVwbiAzCiAgICBpdHhuX2ZpZWxkIENvbmZpZ0Fzc2V0Q2xhd2JhY2sKICAgIGl0eG5fZmllbGQgQ29uZmlnQXNzZXRGcmVlemUKICAgIGl0eG5fZmllbGQgQ29uZmlnQXNzZXRSZXNlcnZlCiAgICBpdHhuX2ZpZWxkIENvbmZpZ0Fzc2V0TWFuYWdlcgogICAgLy8gc21hcnRfY29udHJhY3RzL2Fhcm5hX3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjkxMgogICAgLy8gdXJsPSJodHRwczovL2Fhcm5hLmVjbyIsCiAgICBwdXNoYnl0ZXMgImh0dHBzOi8vYWFybmEuZWNvIgogICAgaXR4bl9maWVsZCBDb25maWdBc3NldFVSTAogICAgLy8gc21hcnRfY29udHJhY3RzL2Fhcm5hX3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjkxMQogICAgLy8gYXNzZXRfbmFtZT0iQWFybmEgQ2FyYm9uIENyZWRpdCIsCiAgICBwdXNoYnl0ZXMgIkFhcm5hIENhcmJvbiBDcmVkaXQiCiAgICBpdHhuX2ZpZWxkIENvbmZpZ0Fzc2V0TmFtZQogICAgLy8gc21hcnRfY29udHJhY3RzL2Fhcm5hX3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjkxMAogICAgLy8gdW5pdF9uYW1lPSJBQVJOQSIsCiAgICBwdXNoYnl0ZXMgIkFBUk5BIgogICAgaXR4bl9maWVsZCBDb25maWdBc3NldFVuaXROYW1lCiAgICAvLyBzbWFydF9jb250cmFjdHMvYWFybmFfcmVnaXN0cnkvY29udHJhY3QucHk6OTA5CiAgICAvLyBkZWZhdWx0X2Zyb3plbj1GYWxzZSwKICAgIGludGNfMCAvLyAwCiAgICBpdHhuX2ZpZWxkIENvbmZpZ0Fzc2V0RGVmYXVsdEZyb3plbgogICAgLy8gc21hcnRfY29udHJhY3RzL2Fhcm5hX3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjkwOAogICAgLy8gZGVjaW1hbHM9MCwKICAgIGludGNfMCAvLyAwCiAgICBpdHhuX2ZpZWxkIENvbmZpZ0Fzc2V0RGVjaW1hbHMKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hYXJuYV9yZWdpc3RyeS9jb250cmFjdC5weTo5MDcKICAgIC8vIHRvdGFsPTEwXzAwMF8wMDAsCiAgICBwdXNoaW50IDEwMDAwMDAwCiAgICBpdHhuX2ZpZWxkIENvbmZpZ0Fzc2V0VG90YWwKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hYXJuYV9yZWdpc3RyeS9jb250cmFjdC5weTo5MDYKICAgIC8vIHJlc3VsdCA9IGl0eG4uQXNzZXRDb25maWcoCiAgICBwdXNoaW50IDMgLy8gYWNmZwogICAgaXR4bl9maWVsZCBUeXBlRW51bQogICAgaW50Y18wIC8vIDAKICAgIGl0eG5fZmllbGQgRmVlCiAgICAvLyBzbWFydF9jb250cmFjdHMvYWFybmFfcmVnaXN0cnkvY29udHJhY3QucHk6OTA2LTkxNwogICAgLy8gcmVzdWx0ID0gaXR4bi5Bc3NldENvbmZpZygKICAgIC8vICAgICB0b3RhbD0xMF8wMDBfMDAwLAogICAgLy8gICAgIGRlY2ltYWxzPTAsCiAgICAvLyAgICAgZGVmYXVsdF9mcm96ZW49RmFsc2UsCiAgICAvLyAgICAgdW5pdF9uYW1lPSJBQVJOQSIsCiAgICAvLyAgICAgYXNzZXRfbmFtZT0iQWFybmEgQ2FyYm9uIENyZWRpdCIsCiAgICAvLyAgICAgdXJsPSJodHRwczovL2Fhcm5hLmVjbyIsCiAgICAvLyAgICAgbWFuYWdlcj1HbG9iYWwuY3VycmVudF9hcHBsaWNhdGlvbl9hZGRyZXNzLAogICAgLy8gICAgIHJlc2VydmU9R2xvYmFsLmN1cnJlbnRfYXBwbGljYXRpb25fYWRkcmVzcywKICAgIC8vICAgICBmcmVlemU9R2xvYmFsLmN1cnJlbnRfYXBwbGljYXRpb25fYWRkcmVzcywKICAgIC8vICAgICBjbGF3YmFjaz1HbG9iYWwuY3VycmVudF9hcHBsaWNhdGlvbl9hZGRyZXNzLAogICAgLy8gKS5zdWJtaXQoKQogICAgaXR4bl9zdWJtaXQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hYXJuYV9yZWdpc3RyeS9jb250cmFjdC5weTo5MTgKICAgIC8vIHNlbGYuYWFybmFfYXNzZXQgPSByZXN1bHQuY3JlYXRlZF9hc3NldC5pZAogICAgYnl0ZWNfMSAvLyAiYWFybmFfYXNzZXQiCiAgICBpdHhuIENyZWF0ZWRBc3NldElECiAgICBhcHBfZ2xvYmFsX3B1dAoKZW5zdXJlX3Rva2VuX2FmdGVyX2lmX2Vsc2VANDoKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hYXJuYV9yZWdpc3RyeS9jb250cmFjdC5weTo5MTkKICAgIC8vIHJldHVybiBhcmM0LlVJbnQ2NChzZWxmLmFhcm5hX2Fzc2V0KQogICAgaW50Y18wIC8vIDAKICAgIGJ5dGVjXzEgLy8gImFhcm5hX2Fzc2V0IgogICAgYXBwX2dsb2JhbF9nZXRfZXgKICAgIGFzc2VydCAvLyBjaGVjayBzZWxmLmFhcm5hX2Fzc2V0IGV4aXN0cwogICAgaXRvYgogICAgLy8gc21hcnRfY29udHJhY3RzL2Fhcm5hX3JlZ2lzdHJ5L2NvbnRyYWN0LnB5Ojg5OC05MDEKICAgIC8vICMg4pWQ4pWQ4pWQ4pWQ4pWQ4pWQ4pWQ4pWQ4pWQ4pWQ4pWQ4pWQ4pWQ4pWQ4pWQ4pWQ4pWQ4pWQ4pWQ4pWQ4pWQ4pWQ4pWQ4pWQ4pWQ4pWQ4pWQ4pWQ4pWQ4pWQ4pWQ4pWQ4pWQ4pWQ4pWQ4pWQ4pWQ4pWQ4pWQ4pWQ4pWQ4pWQ4pWQ4pWQ4pWQ4pWQ4pWQ4pWQ4pWQ4pWQ4pWQ4pWQ4pWQ4pWQ4pWQ4pWQ4pWQ4pWQ4pWQ4pWQ4pWQ4pWQ4pWQ4pWQ4pWQ4pWQ4pWQ4pWQ4pWQ4pWQCiAgICAvLyAjIEFBUk5BIFRva2VuCiAgICAvLyAjIOKVkOKVkOKVkOKVkOKVkOKVkOKVkOKVkOKVkOKVkOKVkOKVkOKVkOKVkOKVkOKVkOKVkOKVkOKVkOKVkOKVkOKVkOKVkOKVkOKVkOKVkOKVkOKVkOKVkOKVkOKVkOKVkOKVkOKVkOKVkOKVkOKVkOKVkOKVkOKVkOKVkOKVkOKVkOKVkOKVkOKVkOKVkOKVkOKVkOKVkOKVkOKVkOKVkOKVkOKVkOKVkOKVkOKVkOKVkOKVkOKVkOKVkOKVkOKVkOKVkOKVkOKVkOKVkOKVkOKVkAogICAgLy8gQGFyYzQuYWJpbWV0aG9kCiAgICBieXRlY18wIC8vIDB4MTUxZjdjNzUKICAgIHN3YXAKICAgIGNvbmNhdAogICAgbG9nCiAgICBpbnRjXzEgLy8gMQogICAgcmV0dXJuCgoKLy8gc21hcnRfY29udHJhY3RzLmFhcm5hX3JlZ2lzdHJ5LmNvbnRyYWN0LkFhcm5hUmVnaXN0cnkuc3VibWl0X3Byb2plY3Rbcm91dGluZ10oKSAtPiB2b2lkOgpzdWJtaXRfcHJvamVjdDoKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hYXJuYV9yZWdpc3RyeS9jb250cmFjdC5weTo5MjEtOTI0CiAgICAvLyAjIOKVkOKVkOKVkOKVkOKVkOKVkOKVkOKVkOKVkOKVkOKVkOKVkOKVkOKVkOKVkOKVkOKVkOKVkOKVkOKVkOKVkOKVkOKVkOKVkOKVkOKVkOKVkOKVkOKVkOKVkOKVkOKVkOKVkOKVkOKVkOKVkOKVkOKVkOKVkOKVkOKVkOKVkOKVkOKVkOKVkOKVkOKVkOKVkOKVkOKVkOKVkOKVkOKVkOKVkOKVkOKVkOKVkOKVkOKVkOKVkOKVkOKVkOKVkOKVkOKVkOKVkOKVkOKVkOKVkOKVkAogICAgLy8gIyBQcm9qZWN0IExpZmVjeWNsZQogICAgLy8gIyDilZDilZDilZDilZDilZDilZDilZDilZDilZDilZDilZDilZDilZDilZDilZDilZDilZDilZDilZDilZDilZDilZDilZDilZDilZDilZDilZDilZDilZDilZDilZDilZDilZDilZDilZDilZDilZDilZDilZDilZDilZDilZDilZDilZDilZDilZDilZDilZDilZDilZDilZDilZDilZDilZDilZDilZDilZDilZDilZDilZDilZDilZDilZDilZDilZDilZDilZDilZDilZDilZAKICAgIC8vIEBhcmM0LmFiaW1ldGhvZAogICAgdHhuYSBBcHBsaWNhdGlvbkFyZ3MgMQogICAgZHVwCiAgICBpbnRjXzAgLy8gMAogICAgZXh0cmFjdF91aW50MTYgLy8gb24gZXJyb3I6IGludmFsaWQgYXJyYXkgbGVuZ3RoIGhlYWRlcgogICAgaW50Y18zIC8vIDIKICAgICsKICAgIGRpZyAxCiAgICBsZW4KICAgIGR1cAogICAgdW5jb3ZlciAyCiAgICA9PQogICAgYXNzZXJ0IC8vIGludmFsaWQgbnVtYmVyIG9mIGJ5dGVzIGZvciBhcmM0LmR5bmFtaWNfYXJyYXk8YXJjNC51aW50OD4KICAgIHR4bmEgQXBwbGljYXRpb25BcmdzIDIKICAgIGR1cAogICAgaW50Y18wIC8vIDAKICAgIGV4dHJhY3RfdWludDE2IC8vIG9uIGVycm9yOiBpbnZhbGlkIGFycmF5IGxlbmd0aCBoZWFkZXIKICAgIGludGNfMyAvLyAyCiAgICArCiAgICBkaWcgMQogICAgbGVuCiAgICBkdXAKICAgIHVuY292ZXIgMgogICAgPT0KICAgIGFzc2VydCAvLyBpbnZhbGlkIG51bWJlciBvZiBieXRlcyBmb3IgYXJjNC5keW5hbWljX2FycmF5PGFyYzQudWludDg+CiAgICB0eG5hIEFwcGxpY2F0aW9uQXJncyAzCiAgICBkdXAKICAgIGludGNfMCAvLyAwCiAgICBleHRyYWN0X3VpbnQxNiAvLyBvbiBlcnJvcjogaW52YWxpZCBhcnJheSBsZW5ndGggaGVhZGVyCiAgICBpbnRjXzMgLy8gMgogICAgKwogICAgZGlnIDEKICAgIGxlbgogICAgZHVwCiAgICB1bmNvdmVyIDIKICAgID09CiAgICBhc3NlcnQgLy8gaW52YWxpZCBudW1iZXIgb2YgYnl0ZXMgZm9yIGFyYzQuZHluYW1pY19hcnJheTxhcmM0LnVpbnQ4PgogICAgdHhuYSBBcHBsaWNhdGlvbkFyZ3MgNAogICAgZHVwCiAgICBpbnRjXzAgLy8gMAogICAgZXh0cmFjdF91aW50MTYgLy8gb24gZXJyb3I6IGludmFsaWQgYXJyYXkgbGVuZ3RoIGhlYWRlcgogICAgaW50Y18zIC8vIDIKICAgICsKICAgIGRpZyAxCiAgICBsZW4KICAgID09CiAgICBhc3NlcnQgLy8gaW52YWxpZCBudW1iZXIgb2YgYnl0ZXMgZm9yIGFyYzQuZHluYW1pY19hcnJheTxhcmM0LnVpbnQ4PgogICAgLy8gc21hcnRfY29udHJhY3RzL2Fhcm5hX3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjkzNy05NDIKICAgIC8vIG1ldGEgPSBQcm9qZWN0TWV0YSgKICAgIC8vICAgICBuYW1lPW5hbWUsCiAgICAvLyAgICAgbG9jYXRpb249bG9jYXRpb24sCiAgICAvLyAgICAgZWNvc3lzdGVtPWVjb3N5c3RlbSwKICAgIC8vICAgICBjaWQ9Y2lkLAogICAgLy8gKQogICAgaW50Y18yIC8vIDgKICAgIHVuY292ZXIgNgogICAgKwogICAgZHVwCiAgICBpdG9iCiAgICBleHRyYWN0IDYgMgogICAgcHVzaGJ5dGVzIDB4MDAwOAogICAgc3dhcAogICAgY29uY2F0CiAgICBzd2FwCiAgICB1bmNvdmVyIDUKICAgICsKICAgIGR1cAogICAgaXRvYgogICAgZXh0cmFjdCA2IDIKICAgIHVuY292ZXIgMgogICAgc3dhcAogICAgY29uY2F0CiAgICBzd2FwCiAgICB1bmNvdmVyIDMKICAgICsKICAgIGl0b2IKICAgIGV4dHJhY3QgNiAyCiAgICBjb25jYXQKICAgIHVuY292ZXIgNAogICAgY29uY2F0CiAgICB1bmNvdmVyIDMKICAgIGNvbmNhdAogICAgdW5jb3ZlciAyCiAgICBjb25jYXQKICAgIGRpZyAxCiAgICBjb25jYXQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hYXJuYV9yZWdpc3RyeS9jb250cmFjdC5weTo5NDMKICAgIC8vIGFzc2VydCBtZXRhLmJ5dGVzLmxlbmd0aCA8PSBNQVhfTUVUQV9CWVRFUywgInByb2plY3QgbWV0YWRhdGEgdG9vIGxhcmdlIgogICAgZHVwCiAgICBsZW4KICAgIHB1c2hpbnQgOTU4CiAgICA8PQogICAgYXNzZXJ0IC8vIHByb2plY3QgbWV0YWRhdGEgdG9vIGxhcmdlCiAgICAvLyBzbWFydF9jb250cmFjdHMvYWFybmFfcmVnaXN0cnkvY29udHJhY3QucHk6OTQ0CiAgICAvLyBjaWRfaGFzaCA9IG9wLnNoYTI1NihjaWQubmF0aXZlLmJ5dGVzKQogICAgc3dhcAogICAgZXh0cmFjdCAyIDAKICAgIHNoYTI1NgogICAgLy8gc21hcnRfY29udHJhY3RzL2Fhcm5hX3JlZ2lzdHJ5L2NvbnRyYWN0LnB5Ojk0NQogICAgLy8gYXNzZXJ0IGNpZF9oYXNoIG5vdCBpbiBzZWxmLmNpZF9pbmRleCwgImR1cGxpY2F0ZSBjaWQ6IGFscmVhZHkgc3VibWl0dGVkIgogICAgcHVzaGJ5dGVzIDB4NjMKICAgIHN3YXAKICAgIGNvbmNhdAogICAgZHVwCiAgICBib3hfbGVuCiAgICBidXJ5IDEKICAgICEKICAgIGFzc2VydCAvLyBkdXBsaWNhdGUgY2lkOiBhbHJlYWR5IHN1Ym1pdHRlZAogICAgLy8gc21hcnRfY29udHJhY3RzL2Fhcm5hX3JlZ2lzdHJ5L2NvbnRyYWN0LnB5Ojk0NgogICAgLy8gaWR4ID0gc2VsZi5wcm9qZWN0X2NvdW50CiAgICBpbnRjXzAgLy8gMAogICAgYnl0ZWNfMiAvLyAicHJvamVjdF9jb3VudCIKICAgIGFwcF9nbG9iYWxfZ2V0X2V4CiAgICBhc3NlcnQgLy8gY2hlY2sgc2VsZi5wcm9qZWN0X2NvdW50IGV4aXN0cwogICAgLy8gc21hcnRfY29udHJhY3RzL2Fhcm5hX3JlZ2lzdHJ5L2NvbnRyYWN0LnB5Ojk0NwogICAgLy8gc2VsZi5jaWRfaW5kZXhbY2lkX2hhc2hdID0gaWR4CiAgICBkdXAKICAgIGl0b2IKICAgIHVuY292ZXIgMgogICAgZGlnIDEKICAgIGJveF9wdXQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hYXJuYV9yZWdpc3RyeS9jb250cmFjdC5weTo5NDkKICAgIC8vIHN1Ym1pdHRlcj1hcmM0LkFkZHJlc3MoVHhuLnNlbmRlciksCiAgICB0eG4gU2VuZGVyCiAgICAvLyBzbWFydF9jb250cmFjdHMvYWFybmFfcmVnaXN0cnkvY29udHJhY3QucHk6OTUwCiAgICAvLyBzdGF0dXM9YXJjNC5VSW50NjQoMSksCiAgICBpbnRjXzEgLy8gMQogICAgaXRvYgogICAgLy8gc21hcnRfY29udHJhY3RzL2Fhcm5hX3JlZ2lzdHJ5L2NvbnRyYWN0LnB5Ojk1MQogICAgLy8gY3JlZGl0cz1hcmM0LlVJbnQ2NCgwKSwKICAgIGludGNfMCAvLyAwCiAgICBpdG9iCiAgICAvLyBzbWFydF9jb250cmFjdHMvYWFybmFfcmVnaXN0cnkvY29udHJhY3QucHk6OTQ4LTk1MgogICAgLy8gc2VsZi5wcm9qZWN0X2hlYWRlcnNbaWR4XSA9IFByb2plY3RIZWFkZXIoCiAgICAvLyAgICAgc3VibWl0dGVyPWFyYzQuQWRkcmVzcyhUeG4uc2VuZGVyKSwKICAgIC8vICAgICBzdGF0dXM9YXJjNC5VSW50NjQoMSksCiAgICAvLyAgICAgY3JlZGl0cz1hcmM0LlVJbnQ2NCgwKSwKICAgIC8vICkKICAgIGNvdmVyIDIKICAgIGNvbmNhdAogICAgc3dhcAogICAgY29uY2F0CiAgICAvLyBzbWFydF9jb250cmFjdHMvYWFybmFfcmVnaXN0cnkvY29udHJhY3QucHk6OTQ4CiAgICAvLyBzZWxmLnByb2plY3RfaGVhZGVyc1tpZHhdID0gUHJvamVjdEhlYWRlcigKICAgIGJ5dGVjXzMgLy8gMHg2OAogICAgZGlnIDIKICAgIGNvbmNhdAogICAgLy8gc21hcnRfY29udHJhY3RzL2Fhcm5hX3JlZ2lzdHJ5L2NvbnRyYWN0LnB5Ojk0OC05NTIKICAgIC8vIHNlbGYucHJvamVjdF9oZWFkZXJzW2lkeF0gPSBQcm9qZWN0SGVhZGVyKAogICAgLy8gICAgIHN1Ym1pdHRlcj1hcmM0LkFkZHJlc3MoVHhuLnNlbmRlciksCiAgICAvLyAgICAgc3RhdHVzPWFyYzQuVUludDY0KDEpLAogICAgLy8gICAgIGNyZWRpdHM9YXJjNC5VSW50NjQoMCksCiAgICAvLyApCiAgICBzd2FwCiAgICBib3hfcHV0CiAgICAvLyBzbWFydF9jb250cmFjdHMvYWFybmFfcmVnaXN0cnkvY29udHJhY3QucHk6OTUzCiAgICAvLyBzZWxmLnByb2plY3RfbWV0YVtpZHhdID0gbWV0YS5jb3B5KCkKICAgIGJ5dGVjIDI5IC8vIDB4NmQKICAgIGRpZyAxCiAgICBjb25jYXQKICAgIGR1cAogICAgYm94X2RlbAogICAgcG9wCiAgICB1bmNvdmVyIDMKICAgIGJveF9wdXQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hYXJuYV9yZWdpc3RyeS9jb250cmFjdC5weTo5NTQKICAgIC8vIHNlbGYuX3F1ZXVlX3B1c2goVUludDY0KDEpLCBpZHgpCiAgICBpbnRjXzEgLy8gMQogICAgZGlnIDIKICAgIGNhbGxzdWIgX3F1ZXVlX3B1c2gKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hYXJuYV9yZWdpc3RyeS9jb250cmFjdC5weTozMjUKICAgIC8vIHJldHVybiBCeXRlcyhTVUJNSVRURVJfSU5ERVhfUFJFRklYKSArIGFkZHIuYnl0ZXMKICAgIHB1c2hieXRlcyAweDczCiAgICAvLyBzbWFydF9jb250cmFjdHMvYWFybmFfcmVnaXN0cnkvY29udHJhY3QucHk6OTU1LTk1NgogICAgLy8gIyBBcHBlbmQtb25seSwgc28gdGhlIHNsb3QgaXMgbmV2ZXIgbmVlZGVkIGFnYWluLgogICAgLy8gX3Nsb3QgPSBfaW5kZXhfYXBwZW5kKF9zdWJtaXR0ZXJfa2V5KFR4bi5zZW5kZXIpLCBpZHgpCiAgICB0eG4gU2VuZGVyCiAgICAvLyBzbWFydF9jb250cmFjdHMvYWFybmFfcmVnaXN0cnkvY29udHJhY3QucHk6MzI1CiAgICAvLyByZXR1cm4gQnl0ZXMoU1VCTUlUVEVSX0lOREVYX1BSRUZJWCkgKyBhZGRyLmJ5dGVzCiAgICBjb25jYXQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hYXJuYV9yZWdpc3RyeS9jb250cmFjdC5weTo5NTUtOTU2CiAgICAvLyAjIEFwcGVuZC1vbmx5LCBzbyB0aGUgc2xvdCBpcyBuZXZlciBuZWVkZWQgYWdhaW4uCiAgICAvLyBfc2xvdCA9IF9pbmRleF9hcHBlbmQoX3N1Ym1pdHRlcl9rZXkoVHhuLnNlbmRlciksIGlkeCkKICAgIGRpZyAyCiAgICBjYWxsc3ViIF9pbmRleF9hcHBlbmQKICAgIHBvcAogICAgLy8gc21hcnRfY29udHJhY3RzL2Fhcm5hX3JlZ2lzdHJ5L2NvbnRyYWN0LnB5Ojk1NwogICAgLy8gc2VsZi5wZW5kaW5nX2NvdW50ICs9IDEKICAgIGludGNfMCAvLyAwCiAgICBieXRlYyA4IC8vICJwZW5kaW5nX2NvdW50IgogICAgYXBwX2dsb2JhbF9nZXRfZXgKICAgIGFzc2VydCAvLyBjaGVjayBzZWxmLnBlbmRpbmdfY291bnQgZXhpc3RzCiAgICBpbnRjXzEgLy8gMQogICAgKwogICAgYnl0ZWMgOCAvLyAicGVuZGluZ19jb3VudCIKICAgIHN3YXAKICAgIGFwcF9nbG9iYWxfcHV0CiAgICAvLyBzbWFydF9jb250cmFjdHMvYWFybmFfcmVnaXN0cnkvY29udHJhY3QucHk6OTU4CiAgICAvLyBzZWxmLnByb2plY3RfY291bnQgPSBpZHggKyBVSW50NjQoMSkKICAgIHN3YXAKICAgIGludGNfMSAvLyAxCiAgICArCiAgICBieXRlY18yIC8vICJwcm9qZWN0X2NvdW50IgogICAgc3dhcAogICAgYXBwX2dsb2JhbF9wdXQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hYXJuYV9yZWdpc3RyeS9jb250cmFjdC5weTo5NjAtOTYyCiAgICAvLyBQcm9qZWN0U3VibWl0dGVkKAogICAgLy8gICAgIHByb2plY3RfaWQ9YXJjNC5VSW50NjQoaWR4KSwgc3VibWl0dGVyPWFyYzQuQWRkcmVzcyhUeG4uc2VuZGVyKQogICAgLy8gKQogICAgZHVwCiAgICAvLyBzbWFydF9jb250cmFjdHMvYWFybmFfcmVnaXN0cnkvY29udHJhY3QucHk6OTYxCiAgICAvLyBwcm9qZWN0X2lkPWFyYzQuVUludDY0KGlkeCksIHN1Ym1pdHRlcj1hcmM0LkFkZHJlc3MoVHhuLnNlbmRlcikKICAgIHR4biBTZW5kZXIKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hYXJuYV9yZWdpc3RyeS9jb250cmFjdC5weTo5NjAtOTYyCiAgICAvLyBQcm9qZWN0U3VibWl0dGVkKAogICAgLy8gICAgIHByb2plY3RfaWQ9YXJjNC5VSW50NjQoaWR4KSwgc3VibWl0dGVyPWFyYzQuQWRkcmVzcyhUeG4uc2VuZGVyKQogICAgLy8gKQogICAgY29uY2F0CiAgICAvLyBzbWFydF9jb250cmFjdHMvYWFybmFfcmVnaXN0cnkvY29udHJhY3QucHk6OTU5LTk2MwogICAgLy8gYXJjNC5lbWl0KAogICAgLy8gICAgIFByb2plY3RTdWJtaXR0ZWQoCiAgICAvLyAgICAgICAgIHByb2plY3RfaWQ9YXJjNC5VSW50NjQoaWR4KSwgc3VibWl0dGVyPWFyYzQuQWRkcmVzcyhUeG4uc2VuZGVyKQogICAgLy8gICAgICkKICAgIC8vICkKICAgIHB1c2hieXRlcyAweDg3ZTMyNmE3IC8vIG1ldGhvZCAiUHJvamVjdFN1Ym1pdHRlZCh1aW50NjQsYWRkcmVzcykiCiAgICBzd2FwCiAgICBjb25jYXQKICAgIGxvZwogICAgLy8gc21hcnRfY29udHJhY3RzL2Fhcm5hX3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjkyMS05MjQKICAgIC8vICMg4pWQ4pWQ4pWQ4pWQ4pWQ4pWQ4pWQ4pWQ4pWQ4pWQ4pWQ4pWQ4pWQ4pWQ4pWQ4pWQ4pWQ4pWQ4pWQ4pWQ4pWQ4pWQ4pWQ4pWQ4pWQ4pWQ4pWQ4pWQ4pWQ4pWQ4pWQ4pWQ4pWQ4pWQ4pWQ4pWQ4pWQ4pWQ4pWQ4pWQ4pWQ4pWQ4pWQ4pWQ4pWQ4pWQ4pWQ4pWQ4pWQ4pWQ4pWQ4pWQ4pWQ4pWQ4pWQ4pWQ4pWQ4pWQ4pWQ4pWQ4pWQ4pWQ4pWQ4pWQ4pWQ4pWQ4pWQ4pWQ4pWQ4pWQCiAgICAvLyAjIFByb2plY3QgTGlmZWN5Y2xlCiAgICAvLyAjIOKVkOKVkOKVkOKVkOKVkOKVkOKVkOKVkOKVkOKVkOKVkOKVkOKVkOKVkOKVkOKVkOKVkOKVkOKVkOKVkOKVkOKVkOKVkOKVkOKVkOKVkOKVkOKVkOKVkOKVkOKVkOKVkOKVkOKVkOKVkOKVkOKVkOKVkOKVkOKVkOKVkOKVkOKVkOKVkOKVkOKVkOKVkOKVkOKVkOKVkOKVkOKVkOKVkOKVkOKVkOKVkOKVkOKVkOKVkOKVkOKVkOKVkOKVkOKVkOKVkOKVkOKVkOKVkOKVkOKVkAogICAgLy8gQGFyYzQuYWJpbWV0aG9kCiAgICBieXRlY18wIC8vIDB4MTUxZjdjNzUKICAgIHN3YXAKICAgIGNvbmNhdAogICAgbG9nCiAgICBpbnRjXzEgLy8gMQogICAgcmV0dXJuCgoKLy8gc21hcnRfY29udHJhY3RzLmFhcm5hX3JlZ2lzdHJ5LmNvbnRyYWN0LkFhcm5hUmVnaXN0cnkuYXBwcm92ZV9wcm9qZWN0W3JvdXRpbmddKCkgLT4gdm9pZDoKYXBwcm92ZV9wcm9qZWN0OgogICAgLy8gc21hcnRfY29udHJhY3RzL2Fhcm5hX3JlZ2lzdHJ5L2NvbnRyYWN0LnB5Ojk2NgogICAgLy8gQGFyYzQuYWJpbWV0aG9kCiAgICB0eG5hIEFwcGxpY2F0aW9uQXJncyAxCiAgICBkdXAKICAgIGxlbgogICAgaW50Y18yIC8vIDgKICAgID09CiAgICBhc3NlcnQgLy8gaW52YWxpZCBudW1iZXIgb2YgYnl0ZXMgZm9yIGFyYzQudWludDY0CiAgICB0eG5hIEFwcGxpY2F0aW9uQXJncyAyCiAgICBkdXAKICAgIGxlbgogICAgaW50Y18yIC8vIDgKICAgID09CiAgICBhc3NlcnQgLy8gaW52YWxpZCBudW1iZXIgb2YgYnl0ZXMgZm9yIGFyYzQudWludDY0CiAgICAvLyBzbWFydF9jb250cmFjdHMvYWFybmFfcmVnaXN0cnkvY29udHJhY3QucHk6OTY5CiAgICAvLyBzZWxmLl9vbmx5X3ZhbGlkYXRvcigpCiAgICBjYWxsc3ViIF9vbmx5X3ZhbGlkYXRvcgogICAgLy8gc21hcnRfY29udHJhY3RzL2Fhcm5hX3JlZ2lzdHJ5L2NvbnRyYWN0LnB5Ojk3MAogICAgLy8gcGlkID0gcHJvamVjdF9pZC5uYXRpdmUKICAgIHN3YXAKICAgIGJ0b2kKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hYXJuYV9yZWdpc3RyeS9jb250cmFjdC5weTo5NzEKICAgIC8vIGFzc2VydCBwaWQgPCBzZWxmLnByb2plY3RfY291bnQsICJpbnZhbGlkIHByb2plY3QgaWQiCiAgICBpbnRjXzAgLy8gMAogICAgYnl0ZWNfMiAvLyAicHJvamVjdF9jb3VudCIKICAgIGFwcF9nbG9iYWxfZ2V0X2V4CiAgICBhc3NlcnQgLy8gY2hlY2sgc2VsZi5wcm9qZWN0X2NvdW50IGV4aXN0cwogICAgZGlnIDEKICAgID4KICAgIGFzc2VydCAvLyBpbnZhbGlkIHByb2plY3QgaWQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hYXJuYV9yZWdpc3RyeS9jb250cmFjdC5weTo5NzIKICAgIC8vIGFzc2VydCBjcmVkaXRzLm5hdGl2ZSA+IFVJbnQ2NCgwKSwgImNyZWRpdHMgbXVzdCBiZSA+IDAiCiAgICBzd2FwCiAgICBidG9pCiAgICBkdXAKICAgIGFzc2VydCAvLyBjcmVkaXRzIG11c3QgYmUgPiAwCiAgICAvLyBzbWFydF9jb250cmFjdHMvYWFybmFfcmVnaXN0cnkvY29udHJhY3QucHk6MzE1CiAgICAvLyByZXR1cm4gQnl0ZXMoSEVBREVSX0tFWV9QUkVGSVgpICsgb3AuaXRvYihwaWQpCiAgICBkaWcgMQogICAgaXRvYgogICAgYnl0ZWNfMyAvLyAweDY4CiAgICBzd2FwCiAgICBjb25jYXQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hYXJuYV9yZWdpc3RyeS9jb250cmFjdC5weTo0ODEKICAgIC8vIHJldHVybiBvcC5idG9pKG9wLkJveC5leHRyYWN0KF9oZWFkZXJfa2V5KHBpZCksIEhFQURFUl9TVEFUVVNfT0ZGU0VULCA4KSkKICAgIHB1c2hpbnQgMzIKICAgIGludGNfMiAvLyA4CiAgICBib3hfZXh0cmFjdAogICAgYnRvaQogICAgLy8gc21hcnRfY29udHJhY3RzL2Fhcm5hX3JlZ2lzdHJ5L2NvbnRyYWN0LnB5Ojk3MwogICAgLy8gYXNzZXJ0IHNlbGYuX3N0YXR1cyhwaWQpID09IDEsICJwcm9qZWN0IG5vdCBwZW5kaW5nIgogICAgaW50Y18xIC8vIDEKICAgID09CiAgICBhc3NlcnQgLy8gcHJvamVjdCBub3QgcGVuZGluZwogICAgLy8gc21hcnRfY29udHJhY3RzL2Fhcm5hX3JlZ2lzdHJ5L2NvbnRyYWN0LnB5Ojk3NAogICAgLy8gc2VsZi5fbWFya192ZXJpZmllZChwaWQsIGNyZWRpdHMubmF0aXZlKQogICAgY2FsbHN1YiBfbWFya192ZXJpZmllZAogICAgLy8gc21hcnRfY29udHJhY3RzL2Fhcm5hX3JlZ2lzdHJ5L2NvbnRyYWN0LnB5Ojk2NgogICAgLy8gQGFyYzQuYWJpbWV0aG9kCiAgICBpbnRjXzEgLy8gMQogICAgcmV0dXJuCgoKLy8gc21hcnRfY29udHJhY3RzLmFhcm5hX3JlZ2lzdHJ5LmNvbnRyYWN0LkFhcm5hUmVnaXN0cnkucmVqZWN0X3Byb2plY3Rbcm91dGluZ10oKSAtPiB2b2lkOgpyZWplY3RfcHJvamVjdDoKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hYXJuYV9yZWdpc3RyeS9jb250cmFjdC5weTo5NzYKICAgIC8vIEBhcmM0LmFiaW1ldGhvZAogICAgdHhuYSBBcHBsaWNhdGlvbkFyZ3MgMQogICAgZHVwCiAgICBsZW4KICAgIGludGNfMiAvLyA4CiAgICA9PQogICAgYXNzZXJ0IC8vIGludmFsaWQgbnVtYmVyIG9mIGJ5dGVzIGZvciBhcmM0LnVpbnQ2NAogICAgLy8gc21hcnRfY29udHJhY3RzL2Fhcm5hX3JlZ2lzdHJ5L2NvbnRyYWN0LnB5Ojk3OQogICAgLy8gc2VsZi5fb25seV92YWxpZGF0b3IoKQogICAgY2FsbHN1YiBfb25seV92YWxpZGF0b3IKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hYXJuYV9yZWdpc3RyeS9jb250cmFjdC5weTo5ODAKICAgIC8vIHBpZCA9IHByb2plY3RfaWQubmF0aXZlCiAgICBidG9pCiAgICAvLyBzbWFydF9jb250cmFjdHMvYWFybmFfcmVnaXN0cnkvY29udHJhY3QucHk6OTgxCiAgICAvLyBhc3NlcnQgcGlkIDwgc2VsZi5wcm9qZWN0X2NvdW50LCAiaW52YWxpZCBwcm9qZWN0IGlkIgogICAgaW50Y18wIC8vIDAKICAgIGJ5dGVjXzIgLy8gInByb2plY3RfY291bnQiCiAgICBhcHBfZ2xvYmFsX2dldF9leAogICAgYXNzZXJ0IC8vIGNoZWNrIHNlbGYucHJvamVjdF9jb3VudCBleGlzdHMKICAgIGRpZyAxCiAgICA+CiAgICBhc3NlcnQgLy8gaW52YWxpZCBwcm9qZWN0IGlkCiAgICAvLyBzbWFydF9jb250cmFjdHMvYWFybmFfcmVnaXN0cnkvY29udHJhY3QucHk6MzE1CiAgICAvLyByZXR1cm4gQnl0ZXMoSEVBREVSX0tFWV9QUkVGSVgpICsgb3AuaXRvYihwaWQpCiAgICBkdXAKICAgIGl0b2IKICAgIGJ5dGVjXzMgLy8gMHg2OAogICAgc3dhcAogICAgY29uY2F0CiAgICAvLyBzbWFydF9jb250cmFjdHMvYWFybmFfcmVnaXN0cnkvY29udHJhY3QucHk6NDgxCiAgICAvLyByZXR1cm4gb3AuYnRvaShvcC5Cb3guZXh0cmFjdChfaGVhZGVyX2tleShwaWQpLCBIRUFERVJfU1RBVFVTX09GRlNFVCwgOCkpCiAgICBwdXNoaW50IDMyCiAgICBpbnRjXzIgLy8gOAogICAgYm94X2V4dHJhY3QKICAgIGJ0b2kKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hYXJuYV9yZWdpc3RyeS9jb250cmFjdC5weTo5ODIKICAgIC8vIGFzc2VydCBzZWxmLl9zdGF0dXMocGlkKSA9PSAxLCAicHJvamVjdCBub3QgcGVuZGluZyIKICAgIGludGNfMSAvLyAxCiAgICA9PQogICAgYXNzZXJ0IC8vIHByb2plY3Qgbm90IHBlbmRpbmcKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hYXJuYV9yZWdpc3RyeS9jb250cmFjdC5weTo5ODMKICAgIC8vIHNlbGYuX21hcmtfcmVqZWN0ZWQocGlkKQogICAgY2FsbHN1YiBfbWFya19yZWplY3RlZAogICAgLy8gc21hcnRfY29udHJhY3RzL2Fhcm5hX3JlZ2lzdHJ5L2NvbnRyYWN0LnB5Ojk3NgogICAgLy8gQGFyYzQuYWJpbWV0aG9kCiAgICBpbnRjXzEgLy8gMQogICAgcmV0dXJuCgoKLy8gc21hcnRfY29udHJhY3RzLmFhcm5hX3JlZ2lzdHJ5LmNvbnRyYWN0LkFhcm5hUmVnaXN0cnkucmV2aWV3X3Byb2plY3RzX2JhdGNoW3JvdXRpbmddKCkgLT4gdm9pZDoKcmV2aWV3X3Byb2plY3RzX2JhdGNoOgogICAgLy8gc21hcnRfY29udHJhY3RzL2Fhcm5hX3JlZ2lzdHJ5L2NvbnRyYWN0LnB5Ojk4NQogICAgLy8gQGFyYzQuYWJpbWV0aG9kCiAgICB0eG5hIEFwcGxpY2F0aW9uQXJncyAxCiAgICBkdXBuIDIKICAgIGludGNfMCAvLyAwCiAgICBleHRyYWN0X3VpbnQxNiAvLyBvbiBlcnJvcjogaW52YWxpZCBhcnJheSBsZW5ndGggaGVhZGVyCiAgICBkdXAKICAgIGNvdmVyIDIKICAgIGR1cAogICAgcHVzaGludCAxNwogICAgKgogICAgaW50Y18zIC8vIDIKICAgICsKICAgIHVuY292ZXIgMgogICAgbGVuCiAgICA9PQogICAgYXNzZXJ0IC8vIGludmFsaWQgbnVtYmVyIG9mIGJ5dGVzIGZvciBhcmM0LmR5bmFtaWNfYXJyYXk8c21hcnRfY29udHJhY3RzLmFhcm5hX3JlZ2lzdHJ5LmNvbnRyYWN0LlJldmlld0RlY2lzaW9uPgogICAgLy8gc21hcnRfY29udHJhY3RzL2Fhcm5hX3JlZ2lzdHJ5L2NvbnRyYWN0LnB5Ojk5NQogICAgLy8gc2VsZi5fb25seV92YWxpZGF0b3IoKQogICAgY2FsbHN1YiBfb25seV92YWxpZGF0b3IKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hYXJuYV9yZWdpc3RyeS9jb250cmFjdC5weTo5OTYKICAgIC8vIGFzc2VydCBkZWNpc2lvbnMubGVuZ3RoIDw9IE1BWF9SRVZJRVdfQkFUQ0gsICJ0b28gbWFueSBkZWNpc2lvbnMiCiAgICBwdXNoaW50IDMxCiAgICA8PQogICAgYXNzZXJ0IC8vIHRvbyBtYW55IGRlY2lzaW9ucwogICAgLy8gc21hcnRfY29udHJhY3RzL2Fhcm5hX3JlZ2lzdHJ5L2NvbnRyYWN0LnB5Ojk5NwogICAgLy8gcmVzdWx0cyA9IGFyYzQuRHluYW1pY0FycmF5W2FyYzQuVUludDhdKCkKICAgIGJ5dGVjIDE0IC8vIDB4MDAwMAogICAgLy8gc21hcnRfY29udHJhY3RzL2Fhcm5hX3JlZ2lzdHJ5L2NvbnRyYWN0LnB5Ojk5OAogICAgLy8gZm9yIGkgaW4gdXJhbmdlKGRlY2lzaW9ucy5sZW5ndGgpOgogICAgaW50Y18wIC8vIDAKCnJldmlld19wcm9qZWN0c19iYXRjaF9mb3JfaGVhZGVyQDI6CiAgICAvLyBzbWFydF9jb250cmFjdHMvYWFybmFfcmVnaXN0cnkvY29udHJhY3QucHk6OTk4CiAgICAvLyBmb3IgaSBpbiB1cmFuZ2UoZGVjaXNpb25zLmxlbmd0aCk6CiAgICBkdXAKICAgIGRpZyAzCiAgICA8CiAgICBieiByZXZpZXdfcHJvamVjdHNfYmF0Y2hfYWZ0ZXJfZm9yQDUKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hYXJuYV9yZWdpc3RyeS9jb250cmFjdC5weToxMDAxCiAgICAvLyBpdGVtLnByb2plY3RfaWQubmF0aXZlLCBpdGVtLmRlY2lzaW9uLm5hdGl2ZSwgaXRlbS5jcmVkaXRzLm5hdGl2ZQogICAgZGlnIDMKICAgIGV4dHJhY3QgMiAwCiAgICBkaWcgMQogICAgcHVzaGludCAxNwogICAgKgogICAgcHVzaGludCAxNwogICAgZXh0cmFjdDMgLy8gb24gZXJyb3I6IGluZGV4IGFjY2VzcyBpcyBvdXQgb2YgYm91bmRzCiAgICBkdXAKICAgIGludGNfMCAvLyAwCiAgICBleHRyYWN0X3VpbnQ2NAogICAgZHVwCiAgICB1bmNvdmVyIDIKICAgIGR1cAogICAgaW50Y18yIC8vIDgKICAgIGdldGJ5dGUKICAgIGNvdmVyIDIKICAgIHB1c2hpbnQgOQogICAgZXh0cmFjdF91aW50NjQKICAgIHN3YXAKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hYXJuYV9yZWdpc3RyeS9jb250cmFjdC5weTo4NjMKICAgIC8vIGlmIHBpZCA+PSBzZWxmLnByb2plY3RfY291bnQ6CiAgICBpbnRjXzAgLy8gMAogICAgYnl0ZWNfMiAvLyAicHJvamVjdF9jb3VudCIKICAgIGFwcF9nbG9iYWxfZ2V0X2V4CiAgICBhc3NlcnQgLy8gY2hlY2sgc2VsZi5wcm9qZWN0X2NvdW50IGV4aXN0cwogICAgPj0KICAgIGJ6IHJldmlld19wcm9qZWN0c19iYXRjaF9hZnRlcl9pZl9lbHNlQDgKICAgIHBvcG4gMwogICAgLy8gc21hcnRfY29udHJhY3RzL2Fhcm5hX3JlZ2lzdHJ5L2NvbnRyYWN0LnB5Ojg2NAogICAgLy8gcmV0dXJuIFVJbnQ2NChSRVZJRVdfVU5LTk9XTl9JRCkKICAgIGludGNfMSAvLyAxCgpyZXZpZXdfcHJvamVjdHNfYmF0Y2hfYWZ0ZXJfaW5saW5lZF9zbWFydF9jb250cmFjdHMuYWFybmFfcmVnaXN0cnkuY29udHJhY3QuQWFybmFSZWdpc3RyeS5fcmV2aWV3QDE4OgogICAgLy8gc21hcnRfY29udHJhY3RzL2Fhcm5hX3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjEwMDMKICAgIC8vIHJlc3VsdHMuYXBwZW5kKGFyYzQuVUludDgoY29kZSkpCiAgICBpdG9iCiAgICBkdXAKICAgIGJpdGxlbgogICAgaW50Y18yIC8vIDgKICAgIDw9CiAgICBhc3NlcnQgLy8gb3ZlcmZsb3cKICAgIGV4dHJhY3QgNyAxCiAgICB1bmNvdmVyIDIKICAgIGR1cAogICAgaW50Y18wIC8vIDAKICAgIGV4dHJhY3RfdWludDE2CiAgICAvLyBzbWFydF9jb250cmFjdHMvYWFybmFfcmVnaXN0cnkvY29udHJhY3QucHk6MTAwMwogICAgLy8gcmVzdWx0cy5hcHBlbmQoYXJjNC5VSW50OChjb2RlKSkKICAgIGludGNfMSAvLyAxCiAgICArCiAgICBpdG9iCiAgICBleHRyYWN0IDYgMAogICAgcmVwbGFjZTIgMAogICAgc3dhcAogICAgY29uY2F0CiAgICBzd2FwCiAgICAvLyBzbWFydF9jb250cmFjdHMvYWFybmFfcmVnaXN0cnkvY29udHJhY3QucHk6OTk4CiAgICAvLyBmb3IgaSBpbiB1cmFuZ2UoZGVjaXNpb25zLmxlbmd0aCk6CiAgICBpbnRjXzEgLy8gMQogICAgKwogICAgYiByZXZpZXdfcHJvamVjdHNfYmF0Y2hfZm9yX2hlYWRlckAyCgpyZXZpZXdfcHJvamVjdHNfYmF0Y2hfYWZ0ZXJfaWZfZWxzZUA4OgogICAgLy8gc21hcnRfY29udHJhY3RzL2Fhcm5hX3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjMxNQogICAgLy8gcmV0dXJuIEJ5dGVzKEhFQURFUl9LRVlfUFJFRklYKSArIG9wLml0b2IocGlkKQogICAgZGlnIDIKICAgIGl0b2IKICAgIGJ5dGVjXzMgLy8gMHg2OAogICAgc3dhcAogICAgY29uY2F0CiAgICAvLyBzbWFydF9jb250cmFjdHMvYWFybmFfcmVnaXN0cnkvY29udHJhY3QucHk6NDgxCiAgICAvLyByZXR1cm4gb3AuYnRvaShvcC5Cb3guZXh0cmFjdChfaGVhZGVyX2tleShwaWQpLCBIRUFERVJfU1RBVFVTX09GRlNFVCwgOCkpCiAgICBwdXNoaW50IDMyCiAgICBpbnRjXzIgLy8gOAogICAgYm94X2V4dHJhY3QKICAgIGJ0b2kKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hYXJuYV9yZWdpc3RyeS9jb250cmFjdC5weTo4NjUKICAgIC8vIGlmIHNlbGYuX3N0YXR1cyhwaWQpICE9IDE6CiAgICBpbnRjXzEgLy8gMQogICAgIT0KICAgIGJ6IHJldmlld19wcm9qZWN0c19iYXRjaF9hZnRlcl9pZl9lbHNlQDEwCiAgICBwb3BuIDMKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hYXJuYV9yZWdpc3RyeS9jb250cmFjdC5weTo4NjYKICAgIC8vIHJldHVybiBVSW50NjQoUkVWSUVXX05PVF9QRU5ESU5HKQogICAgaW50Y18zIC8vIDIKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hYXJuYV9yZWdpc3RyeS9jb250cmFjdC5weToxMDAwLTEwMDIKICAgIC8vIGNvZGUgPSBzZWxmLl9yZXZpZXcoCiAgICAvLyAgICAgaXRlbS5wcm9qZWN0X2lkLm5hdGl2ZSwgaXRlbS5kZWNpc2lvbi5uYXRpdmUsIGl0ZW0uY3JlZGl0cy5uYXRpdmUKICAgIC8vICkKICAgIGIgcmV2aWV3X3Byb2plY3RzX2JhdGNoX2FmdGVyX2lubGluZWRfc21hcnRfY29udHJhY3RzLmFhcm5hX3JlZ2lzdHJ5LmNvbnRyYWN0LkFhcm5hUmVnaXN0cnkuX3Jldmlld0AxOAoKcmV2aWV3X3Byb2plY3RzX2JhdGNoX2FmdGVyX2lmX2Vsc2VAMTA6CiAgICAvLyBzbWFydF9jb250cmFjdHMvYWFybmFfcmVnaXN0cnkvY29udHJhY3QucHk6ODY3CiAgICAvLyBpZiBkZWNpc2lvbiA9PSAyOgogICAgZGlnIDEKICAgIGludGNfMyAvLyAyCiAgICA9PQogICAgYnogcmV2aWV3X3Byb2plY3RzX2JhdGNoX2Vsc2VfYm9keUAxNAogICAgYnVyeSAxCiAgICAvLyBzbWFydF9jb250cmFjdHMvYWFybmFfcmVnaXN0cnkvY29udHJhY3QucHk6ODY4CiAgICAvLyBpZiBjcmVkaXRzID09IDA6CiAgICBkdXAKICAgIGJueiByZXZpZXdfcHJvamVjdHNfYmF0Y2hfYWZ0ZXJfaWZfZWxzZUAxMwogICAgcG9wbiAyCiAgICAvLyBzbWFydF9jb250cmFjdHMvYWFybmFfcmVnaXN0cnkvY29udHJhY3QucHk6ODY5CiAgICAvLyByZXR1cm4gVUludDY0KFJFVklFV19JTlZBTElEKQogICAgcHVzaGludCAzCiAgICAvLyBzbWFydF9jb250cmFjdHMvYWFybmFfcmVnaXN0cnkvY29udHJhY3QucHk6MTAwMC0xMDAyCiAgICAvLyBjb2RlID0gc2VsZi5fcmV2aWV3KAogICAgLy8gICAgIGl0ZW0ucHJvamVjdF9pZC5uYXRpdmUsIGl0ZW0uZGVjaXNpb24ubmF0aXZlLCBpdGVtLmNyZWRpdHMubmF0aXZlCiAgICAvLyApCiAgICBiIHJldmlld19wcm9qZWN0c19iYXRjaF9hZnRlcl9pbmxpbmVkX3NtYXJ0X2NvbnRyYWN0cy5hYXJuYV9yZWdpc3RyeS5jb250cmFjdC5BYXJuYVJlZ2lzdHJ5Ll9yZXZpZXdAMTgKCnJldmlld19wcm9qZWN0c19iYXRjaF9hZnRlcl9pZl9lbHNlQDEzOgogICAgLy8gc21hcnRfY29udHJhY3RzL2Fhcm5hX3JlZ2lzdHJ5L2NvbnRyYWN0LnB5Ojg3MAogICAgLy8gc2VsZi5fbWFya192ZXJpZmllZChwaWQsIGNyZWRpdHMpCiAgICBjYWxsc3ViIF9tYXJrX3ZlcmlmaWVkCgpyZXZpZXdfcHJvamVjdHNfYmF0Y2hfYWZ0ZXJfaWZfZWxzZUAxNzoKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hYXJuYV9yZWdpc3RyeS9jb250cmFjdC5weTo4NzUKICAgIC8vIHJldHVybiBVSW50NjQoUkVWSUVXX0FQUExJRUQpCiAgICBpbnRjXzAgLy8gMAogICAgLy8gc21hcnRfY29udHJhY3RzL2Fhcm5hX3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjEwMDAtMTAwMgogICAgLy8gY29kZSA9IHNlbGYuX3JldmlldygKICAgIC8vICAgICBpdGVtLnByb2plY3RfaWQubmF0aXZlLCBpdGVtLmRlY2lzaW9uLm5hdGl2ZSwgaXRlbS5jcmVkaXRzLm5hdGl2ZQogICAgLy8gKQogICAgYiByZXZpZXdfcHJvamVjdHNfYmF0Y2hfYWZ0ZXJfaW5saW5lZF9zbWFydF9jb250cmFjdHMuYWFybmFfcmVnaXN0cnkuY29udHJhY3QuQWFybmFSZWdpc3RyeS5fcmV2aWV3QDE4CgpyZXZpZXdfcHJvamVjdHNfYmF0Y2hfZWxzZV9ib2R5QDE0OgogICAgcG9wCiAgICAvLyBzbWFydF9jb250cmFjdHMvYWFybmFfcmVnaXN0cnkvY29udHJhY3QucHk6ODcxCiAgICAvLyBlbGlmIGRlY2lzaW9uID09IDM6CiAgICBwdXNoaW50IDMKICAgID09CiAgICBieiByZXZpZXdfcHJvamVjdHNfYmF0Y2hfZWxzZV9ib2R5QDE2CiAgICAvLyBzbWFydF9jb250cmFjdHMvYWFybmFfcmVnaXN0cnkvY29udHJhY3QucHk6ODcyCiAgICAvLyBzZWxmLl9tYXJrX3JlamVjdGVkKHBpZCkKICAgIGNhbGxzdWIgX21hcmtfcmVqZWN0ZWQKICAgIGIgcmV2aWV3X3Byb2plY3RzX2JhdGNoX2FmdGVyX2lmX2Vsc2VAMTcKCnJldmlld19wcm9qZWN0c19iYXRjaF9lbHNlX2JvZHlAMTY6CiAgICBwb3AKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hYXJuYV9yZWdpc3RyeS9jb250cmFjdC5weTo4NzQKICAgIC8vIHJldHVybiBVSW50NjQoUkVWSUVXX0lOVkFMSUQpCiAgICBwdXNoaW50IDMKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hYXJuYV9yZWdpc3RyeS9jb250cmFjdC5weToxMDAwLTEwMDIKICAgIC8vIGNvZGUgPSBzZWxmLl9yZXZpZXcoCiAgICAvLyAgICAgaXRlbS5wcm9qZWN0X2lkLm5hdGl2ZSwgaXRlbS5kZWNpc2lvbi5uYXRpdmUsIGl0ZW0uY3JlZGl0cy5uYXRpdmUKICAgIC8vICkKICAgIGIgcmV2aWV3X3Byb2plY3RzX2JhdGNoX2FmdGVyX2lubGluZWRfc21hcnRfY29udHJhY3RzLmFhcm5hX3JlZ2lzdHJ5LmNvbnRyYWN0LkFhcm5hUmVnaXN0cnkuX3Jldmlld0AxOAoKcmV2aWV3X3Byb2plY3RzX2JhdGNoX2FmdGVyX2ZvckA1OgogICAgcG9wCiAgICAvLyBzbWFydF9jb250cmFjdHMvYWFybmFfcmVnaXN0cnkvY29udHJhY3QucHk6OTg1CiAgICAvLyBAYXJjNC5hYmltZXRob2QKICAgIGJ5dGVjXzAgLy8gMHgxNTFmN2M3NQogICAgc3dhcAogICAgY29uY2F0CiAgICBsb2cKICAgIGludGNfMSAvLyAxCiAgICByZXR1cm4KCgovLyBzbWFydF9jb250cmFjdHMuYWFybmFfcmVnaXN0cnkuY29udHJhY3QuQWFybmFSZWdpc3RyeS5pc3N1ZV9jcmVkaXRzW3JvdXRpbmddKCkgLT4gdm9pZDoKaXNzdWVfY3JlZGl0czoKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hYXJuYV9yZWdpc3RyeS9jb250cmFjdC5weToxMDA2CiAgICAvLyBAYXJjNC5hYmltZXRob2QKICAgIHR4bmEgQXBwbGljYXRpb25BcmdzIDEKICAgIGR1cAogICAgbGVuCiAgICBpbnRjXzIgLy8gOAogICAgPT0KICAgIGFzc2VydCAvLyBpbnZhbGlkIG51bWJlciBvZiBieXRlcyBmb3IgYXJjNC51aW50NjQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hYXJuYV9yZWdpc3RyeS9jb250cmFjdC5weToxMDEyCiAgICAvLyBzZWxmLl9vbmx5X3ZhbGlkYXRvcigpCiAgICBjYWxsc3ViIF9vbmx5X3ZhbGlkYXRvcgogICAgLy8gc21hcnRfY29udHJhY3RzL2Fhcm5hX3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjEwMTMKICAgIC8vIGFzc2VydCBzZWxmLmFhcm5hX2Fzc2V0LCAibm8gQUFSTkEgdG9rZW4gY3JlYXRlZCIKICAgIGludGNfMCAvLyAwCiAgICBieXRlY18xIC8vICJhYXJuYV9hc3NldCIKICAgIGFwcF9nbG9iYWxfZ2V0X2V4CiAgICBhc3NlcnQgLy8gY2hlY2sgc2VsZi5hYXJuYV9hc3NldCBleGlzdHMKICAgIGR1cAogICAgYXNzZXJ0IC8vIG5vIEFBUk5BIHRva2VuIGNyZWF0ZWQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hYXJuYV9yZWdpc3RyeS9jb250cmFjdC5weToxMDE0CiAgICAvLyBwaWQgPSBwcm9qZWN0X2lkLm5hdGl2ZQogICAgc3dhcAogICAgYnRvaQogICAgLy8gc21hcnRfY29udHJhY3RzL2Fhcm5hX3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjEwMTUKICAgIC8vIGFzc2VydCBwaWQgPCBzZWxmLnByb2plY3RfY291bnQsICJpbnZhbGlkIHByb2plY3QgaWQiCiAgICBpbnRjXzAgLy8gMAogICAgYnl0ZWNfMiAvLyAicHJvamVjdF9jb3VudCIKICAgIGFwcF9nbG9iYWxfZ2V0X2V4CiAgICBhc3NlcnQgLy8gY2hlY2sgc2VsZi5wcm9qZWN0X2NvdW50IGV4aXN0cwogICAgZGlnIDEKICAgID4KICAgIGFzc2VydCAvLyBpbnZhbGlkIHByb2plY3QgaWQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hYXJuYV9yZWdpc3RyeS9jb250cmFjdC5weToxMDE2CiAgICAvLyBoZWFkZXIgPSBzZWxmLnByb2plY3RfaGVhZGVyc1twaWRdLmNvcHkoKQogICAgZHVwCiAgICBpdG9iCiAgICBieXRlY18zIC8vIDB4NjgKICAgIHN3YXAKICAgIGNvbmNhdAogICAgYm94X2dldAogICAgYXNzZXJ0IC8vIGNoZWNrIHNlbGYucHJvamVjdF9oZWFkZXJzIGVudHJ5IGV4aXN0cwogICAgLy8gc21hcnRfY29udHJhY3RzL2Fhcm5hX3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjEwMTcKICAgIC8vIGFzc2VydCBoZWFkZXIuc3RhdHVzID09IGFyYzQuVUludDY0KDIpLCAicHJvamVjdCBub3QgdmVyaWZpZWQiCiAgICBkdXAKICAgIGV4dHJhY3QgMzIgOAogICAgaW50Y18zIC8vIDIKICAgIGl0b2IKICAgIGI9PQogICAgYXNzZXJ0IC8vIHByb2plY3Qgbm90IHZlcmlmaWVkCiAgICAvLyBzbWFydF9jb250cmFjdHMvYWFybmFfcmVnaXN0cnkvY29udHJhY3QucHk6MTAxOS0xMDIzCiAgICAvLyBpdHhuLkFzc2V0VHJhbnNmZXIoCiAgICAvLyAgICAgeGZlcl9hc3NldD1Bc3NldChzZWxmLmFhcm5hX2Fzc2V0KSwKICAgIC8vICAgICBhc3NldF9yZWNlaXZlcj1oZWFkZXIuc3VibWl0dGVyLm5hdGl2ZSwKICAgIC8vICAgICBhc3NldF9hbW91bnQ9aGVhZGVyLmNyZWRpdHMubmF0aXZlLAogICAgLy8gKS5zdWJtaXQoKQogICAgaXR4bl9iZWdpbgogICAgLy8gc21hcnRfY29udHJhY3RzL2Fhcm5hX3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjEwMjEKICAgIC8vIGFzc2V0X3JlY2VpdmVyPWhlYWRlci5zdWJtaXR0ZXIubmF0aXZlLAogICAgZHVwCiAgICBleHRyYWN0IDAgMzIKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hYXJuYV9yZWdpc3RyeS9jb250cmFjdC5weToxMDIyCiAgICAvLyBhc3NldF9hbW91bnQ9aGVhZGVyLmNyZWRpdHMubmF0aXZlLAogICAgZGlnIDEKICAgIGV4dHJhY3QgNDAgOAogICAgdW5jb3ZlciAyCiAgICBwdXNoaW50IDQwCiAgICBleHRyYWN0X3VpbnQ2NAogICAgZHVwCiAgICBpdHhuX2ZpZWxkIEFzc2V0QW1vdW50CiAgICBkaWcgMgogICAgaXR4bl9maWVsZCBBc3NldFJlY2VpdmVyCiAgICB1bmNvdmVyIDQKICAgIGl0eG5fZmllbGQgWGZlckFzc2V0CiAgICAvLyBzbWFydF9jb250cmFjdHMvYWFybmFfcmVnaXN0cnkvY29udHJhY3QucHk6MTAxOQogICAgLy8gaXR4bi5Bc3NldFRyYW5zZmVyKAogICAgcHVzaGludCA0IC8vIGF4ZmVyCiAgICBpdHhuX2ZpZWxkIFR5cGVFbnVtCiAgICBpbnRjXzAgLy8gMAogICAgaXR4bl9maWVsZCBGZWUKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hYXJuYV9yZWdpc3RyeS9jb250cmFjdC5weToxMDE5LTEwMjMKICAgIC8vIGl0eG4uQXNzZXRUcmFuc2ZlcigKICAgIC8vICAgICB4ZmVyX2Fzc2V0PUFzc2V0KHNlbGYuYWFybmFfYXNzZXQpLAogICAgLy8gICAgIGFzc2V0X3JlY2VpdmVyPWhlYWRlci5zdWJtaXR0ZXIubmF0aXZlLAogICAgLy8gICAgIGFzc2V0X2Ftb3VudD1oZWFkZXIuY3JlZGl0cy5uYXRpdmUsCiAgICAvLyApLnN1Ym1pdCgpCiAgICBpdHhuX3N1Ym1pdAogICAgLy8gc21hcnRfY29udHJhY3RzL2Fhcm5hX3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjEwMjYKICAgIC8vIHNlbGYuX21hcmtfaXNzdWVkKHBpZCwgaGVhZGVyLnN1Ym1pdHRlciwgY3JlZHMpCiAgICB1bmNvdmVyIDMKICAgIHVuY292ZXIgMwogICAgZGlnIDIKICAgIGNhbGxzdWIgX21hcmtfaXNzdWVkCiAgICAvLyBzbWFydF9jb250cmFjdHMvYWFybmFfcmVnaXN0cnkvY29udHJhY3QucHk6MTAyNwogICAgLy8gc2VsZi50b3RhbF9jcmVkaXRzX2lzc3VlZCA9IHNlbGYudG90YWxfY3JlZGl0c19pc3N1ZWQgKyBjcmVkcwogICAgaW50Y18wIC8vIDAKICAgIGJ5dGVjIDExIC8vICJ0b3RhbF9jcmVkaXRzX2lzc3VlZCIKICAgIGFwcF9nbG9iYWxfZ2V0X2V4CiAgICBhc3NlcnQgLy8gY2hlY2sgc2VsZi50b3RhbF9jcmVkaXRzX2lzc3VlZCBleGlzdHMKICAgICsKICAgIGJ5dGVjIDExIC8vICJ0b3RhbF9jcmVkaXRzX2lzc3VlZCIKICAgIHN3YXAKICAgIGFwcF9nbG9iYWxfcHV0CiAgICAvLyBzbWFydF9jb250cmFjdHMvYWFybmFfcmVnaXN0cnkvY29udHJhY3QucHk6MTAwNgogICAgLy8gQGFyYzQuYWJpbWV0aG9kCiAgICBieXRlY18wIC8vIDB4MTUxZjdjNzUKICAgIHN3YXAKICAgIGNvbmNhdAogICAgbG9nCiAgICBpbnRjXzEgLy8gMQogICAgcmV0dXJuCgoKLy8gc21hcnRfY29udHJhY3RzLmFhcm5hX3JlZ2lzdHJ5LmNvbnRyYWN0LkFhcm5hUmVnaXN0cnkuaXNzdWVfY3JlZGl0c19iYXRjaFtyb3V0aW5nXSgpIC0+IHZvaWQ6Cmlzc3VlX2NyZWRpdHNfYmF0Y2g6CiAgICBpbnRjXzAgLy8gMAogICAgcHVzaGJ5dGVzICIiCiAgICBkdXAKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hYXJuYV9yZWdpc3RyeS9jb250cmFjdC5weToxMDMwCiAgICAvLyBAYXJjNC5hYmltZXRob2QKICAgIHR4bmEgQXBwbGljYXRpb25BcmdzIDEKICAgIGR1cG4gMgogICAgaW50Y18wIC8vIDAKICAgIGV4dHJhY3RfdWludDE2IC8vIG9uIGVycm9yOiBpbnZhbGlkIGFycmF5IGxlbmd0aCBoZWFkZXIKICAgIGR1cAogICAgY292ZXIgMgogICAgZHVwCiAgICBpbnRjXzIgLy8gOAogICAgKgogICAgaW50Y18zIC8vIDIKICAgICsKICAgIHVuY292ZXIgMgogICAgbGVuCiAgICA9PQogICAgYXNzZXJ0IC8vIGludmFsaWQgbnVtYmVyIG9mIGJ5dGVzIGZvciBhcmM0LmR5bmFtaWNfYXJyYXk8YXJjNC51aW50NjQ+CiAgICAvLyBzbWFydF9jb250cmFjdHMvYWFybmFfcmVnaXN0cnkvY29udHJhY3QucHk6MTA0MAogICAgLy8gc2VsZi5fb25seV92YWxpZGF0b3IoKQogICAgY2FsbHN1YiBfb25seV92YWxpZGF0b3IKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hYXJuYV9yZWdpc3RyeS9jb250cmFjdC5weToxMDQxCiAgICAvLyBhc3NlcnQgc2VsZi5hYXJuYV9hc3NldCwgIm5vIEFBUk5BIHRva2VuIGNyZWF0ZWQiCiAgICBpbnRjXzAgLy8gMAogICAgYnl0ZWNfMSAvLyAiYWFybmFfYXNzZXQiCiAgICBhcHBfZ2xvYmFsX2dldF9leAogICAgYXNzZXJ0IC8vIGNoZWNrIHNlbGYuYWFybmFfYXNzZXQgZXhpc3RzCiAgICBhc3NlcnQgLy8gbm8gQUFSTkEgdG9rZW4gY3JlYXRlZAogICAgLy8gc21hcnRfY29udHJhY3RzL2Fhcm5hX3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjEwNDIKICAgIC8vIGFzc2VydCBwcm9qZWN0X2lkcy5sZW5ndGggPD0gTUFYX0lTU1VFX0JBVENILCAidG9vIG1hbnkgcHJvamVjdHMgZm9yIG9uZSBiYXRjaCIKICAgIHB1c2hpbnQgMTYKICAgIDw9CiAgICBhc3NlcnQgLy8gdG9vIG1hbnkgcHJvamVjdHMgZm9yIG9uZSBiYXRjaAogICAgLy8gc21hcnRfY29udHJhY3RzL2Fhcm5hX3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjEwNDQKICAgIC8vIGlzc3VlZCA9IFVJbnQ2NCgwKQogICAgaW50Y18wIC8vIDAKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hYXJuYV9yZWdpc3RyeS9jb250cmFjdC5weToxMDQzCiAgICAvLyBhbW91bnRzID0gYXJjNC5EeW5hbWljQXJyYXlbYXJjNC5VSW50NjRdKCkKICAgIGJ5dGVjIDE0IC8vIDB4MDAwMAogICAgLy8gc21hcnRfY29udHJhY3RzL2Fhcm5hX3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjEwNDUKICAgIC8vIGdyb3VwZWQgPSBVSW50NjQoMCkKICAgIGludGNfMCAvLyAwCiAgICBkdXAKCmlzc3VlX2NyZWRpdHNfYmF0Y2hfZm9yX2hlYWRlckAyOgogICAgLy8gc21hcnRfY29udHJhY3RzL2Fhcm5hX3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjEwNDYKICAgIC8vIGZvciBpdGVtIGluIHByb2plY3RfaWRzOgogICAgZHVwCiAgICBkaWcgNQogICAgPAogICAgYnogaXNzdWVfY3JlZGl0c19iYXRjaF9hZnRlcl9mb3JAMTIKICAgIGRpZyA1CiAgICBleHRyYWN0IDIgMAogICAgZGlnIDEKICAgIGludGNfMiAvLyA4CiAgICAqCiAgICAvLyBzbWFydF9jb250cmFjdHMvYWFybmFfcmVnaXN0cnkvY29udHJhY3QucHk6MTA0NwogICAgLy8gcGlkID0gaXRlbS5uYXRpdmUKICAgIGV4dHJhY3RfdWludDY0CiAgICBkdXAKICAgIGJ1cnkgOAogICAgLy8gc21hcnRfY29udHJhY3RzL2Fhcm5hX3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjEwNDgKICAgIC8vIGFtb3VudCA9IFVJbnQ2NCgwKQogICAgaW50Y18wIC8vIDAKICAgIGJ1cnkgOQogICAgLy8gc21hcnRfY29udHJhY3RzL2Fhcm5hX3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjEwNDkKICAgIC8vIGlmIHBpZCA8IHNlbGYucHJvamVjdF9jb3VudDoKICAgIGludGNfMCAvLyAwCiAgICBieXRlY18yIC8vICJwcm9qZWN0X2NvdW50IgogICAgYXBwX2dsb2JhbF9nZXRfZXgKICAgIGFzc2VydCAvLyBjaGVjayBzZWxmLnByb2plY3RfY291bnQgZXhpc3RzCiAgICA8CiAgICBieiBpc3N1ZV9jcmVkaXRzX2JhdGNoX2FmdGVyX2lmX2Vsc2VAMTAKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hYXJuYV9yZWdpc3RyeS9jb250cmFjdC5weToxMDUwCiAgICAvLyBoZWFkZXIgPSBzZWxmLnByb2plY3RfaGVhZGVyc1twaWRdLmNvcHkoKQogICAgZGlnIDYKICAgIGl0b2IKICAgIGJ5dGVjXzMgLy8gMHg2OAogICAgc3dhcAogICAgY29uY2F0CiAgICBib3hfZ2V0CiAgICBzd2FwCiAgICBkdXAKICAgIGNvdmVyIDIKICAgIGJ1cnkgMTEKICAgIGFzc2VydCAvLyBjaGVjayBzZWxmLnByb2plY3RfaGVhZGVycyBlbnRyeSBleGlzdHMKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hYXJuYV9yZWdpc3RyeS9jb250cmFjdC5weToxMDUxCiAgICAvLyBpZiBoZWFkZXIuc3RhdHVzID09IGFyYzQuVUludDY0KDIpOgogICAgZXh0cmFjdCAzMiA4CiAgICBpbnRjXzMgLy8gMgogICAgaXRvYgogICAgYj09CiAgICBieiBpc3N1ZV9jcmVkaXRzX2JhdGNoX2FmdGVyX2lmX2Vsc2VAMTAKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hYXJuYV9yZWdpc3RyeS9jb250cmFjdC5weToxMDUyCiAgICAvLyBhbW91bnQgPSBoZWFkZXIuY3JlZGl0cy5uYXRpdmUKICAgIGRpZyA4CiAgICBwdXNoaW50IDQwCiAgICBleHRyYWN0X3VpbnQ2NAogICAgYnVyeSA4CiAgICAvLyBzbWFydF9jb250cmFjdHMvYWFybmFfcmVnaXN0cnkvY29udHJhY3QucHk6MTA1MwogICAgLy8gaWYgZ3JvdXBlZCA9PSAwOgogICAgZGlnIDEKICAgIGJueiBpc3N1ZV9jcmVkaXRzX2JhdGNoX2Vsc2VfYm9keUA3CiAgICAvLyBzbWFydF9jb250cmFjdHMvYWFybmFfcmVnaXN0cnkvY29udHJhY3QucHk6MTA1NAogICAgLy8gb3AuSVR4bkNyZWF0ZS5iZWdpbigpCiAgICBpdHhuX2JlZ2luCgppc3N1ZV9jcmVkaXRzX2JhdGNoX2FmdGVyX2lmX2Vsc2VAODoKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hYXJuYV9yZWdpc3RyeS9jb250cmFjdC5weToxMDU3CiAgICAvLyBvcC5JVHhuQ3JlYXRlLnNldF90eXBlX2VudW0oVHJhbnNhY3Rpb25UeXBlLkFzc2V0VHJhbnNmZXIpCiAgICBwdXNoaW50IDQgLy8gYXhmZXIKICAgIGl0eG5fZmllbGQgVHlwZUVudW0KICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hYXJuYV9yZWdpc3RyeS9jb250cmFjdC5weToxMDU4CiAgICAvLyBvcC5JVHhuQ3JlYXRlLnNldF94ZmVyX2Fzc2V0KHNlbGYuYWFybmFfYXNzZXQpCiAgICBpbnRjXzAgLy8gMAogICAgYnl0ZWNfMSAvLyAiYWFybmFfYXNzZXQiCiAgICBhcHBfZ2xvYmFsX2dldF9leAogICAgYXNzZXJ0IC8vIGNoZWNrIHNlbGYuYWFybmFfYXNzZXQgZXhpc3RzCiAgICBpdHhuX2ZpZWxkIFhmZXJBc3NldAogICAgLy8gc21hcnRfY29udHJhY3RzL2Fhcm5hX3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjEwNTkKICAgIC8vIG9wLklUeG5DcmVhdGUuc2V0X2Fzc2V0X3JlY2VpdmVyKGhlYWRlci5zdWJtaXR0ZXIubmF0aXZlKQogICAgZGlnIDgKICAgIGV4dHJhY3QgMCAzMgogICAgZHVwCiAgICBpdHhuX2ZpZWxkIEFzc2V0UmVjZWl2ZXIKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hYXJuYV9yZWdpc3RyeS9jb250cmFjdC5weToxMDYwCiAgICAvLyBvcC5JVHhuQ3JlYXRlLnNldF9hc3NldF9hbW91bnQoYW1vdW50KQogICAgZGlnIDgKICAgIGR1cAogICAgaXR4bl9maWVsZCBBc3NldEFtb3VudAogICAgLy8gc21hcnRfY29udHJhY3RzL2Fhcm5hX3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjEwNjEKICAgIC8vIG9wLklUeG5DcmVhdGUuc2V0X2ZlZSgwKQogICAgaW50Y18wIC8vIDAKICAgIGl0eG5fZmllbGQgRmVlCiAgICAvLyBzbWFydF9jb250cmFjdHMvYWFybmFfcmVnaXN0cnkvY29udHJhY3QucHk6MTA2MgogICAgLy8gZ3JvdXBlZCArPSAxCiAgICB1bmNvdmVyIDMKICAgIGludGNfMSAvLyAxCiAgICArCiAgICBjb3ZlciAzCiAgICAvLyBzbWFydF9jb250cmFjdHMvYWFybmFfcmVnaXN0cnkvY29udHJhY3QucHk6MTA2MwogICAgLy8gc2VsZi5fbWFya19pc3N1ZWQocGlkLCBoZWFkZXIuc3VibWl0dGVyLCBhbW91bnQpCiAgICBkaWcgOAogICAgdW5jb3ZlciAyCiAgICBkaWcgMgogICAgY2FsbHN1YiBfbWFya19pc3N1ZWQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hYXJuYV9yZWdpc3RyeS9jb250cmFjdC5weToxMDY0CiAgICAvLyBpc3N1ZWQgKz0gYW1vdW50CiAgICB1bmNvdmVyIDQKICAgICsKICAgIGNvdmVyIDMKCmlzc3VlX2NyZWRpdHNfYmF0Y2hfYWZ0ZXJfaWZfZWxzZUAxMDoKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hYXJuYV9yZWdpc3RyeS9jb250cmFjdC5weToxMDY1CiAgICAvLyBhbW91bnRzLmFwcGVuZChhcmM0LlVJbnQ2NChhbW91bnQpKQogICAgZGlnIDcKICAgIGl0b2IKICAgIHVuY292ZXIgMwogICAgZHVwCiAgICBpbnRjXzAgLy8gMAogICAgZXh0cmFjdF91aW50MTYKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hYXJuYV9yZWdpc3RyeS9jb250cmFjdC5weToxMDY1CiAgICAvLyBhbW91bnRzLmFwcGVuZChhcmM0LlVJbnQ2NChhbW91bnQpKQogICAgaW50Y18xIC8vIDEKICAgICsKICAgIGl0b2IKICAgIGV4dHJhY3QgNiAwCiAgICByZXBsYWNlMiAwCiAgICBzd2FwCiAgICBjb25jYXQKICAgIGNvdmVyIDIKICAgIGludGNfMSAvLyAxCiAgICArCiAgICBiIGlzc3VlX2NyZWRpdHNfYmF0Y2hfZm9yX2hlYWRlckAyCgppc3N1ZV9jcmVkaXRzX2JhdGNoX2Vsc2VfYm9keUA3OgogICAgLy8gc21hcnRfY29udHJhY3RzL2Fhcm5hX3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjEwNTYKICAgIC8vIG9wLklUeG5DcmVhdGUubmV4dCgpCiAgICBpdHhuX25leHQKICAgIGIgaXNzdWVfY3JlZGl0c19iYXRjaF9hZnRlcl9pZl9lbHNlQDgKCmlzc3VlX2NyZWRpdHNfYmF0Y2hfYWZ0ZXJfZm9yQDEyOgogICAgcG9wCiAgICB1bmNvdmVyIDMKICAgIHBvcAogICAgdW5jb3ZlciAzCiAgICBwb3AKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hYXJuYV9yZWdpc3RyeS9jb250cmFjdC5weToxMDY3CiAgICAvLyBpZiBncm91cGVkOgogICAgYnogaXNzdWVfY3JlZGl0c19iYXRjaF9hZnRlcl9pZl9lbHNlQDE0CiAgICAvLyBzbWFydF9jb250cmFjdHMvYWFybmFfcmVnaXN0cnkvY29udHJhY3QucHk6MTA2OAogICAgLy8gb3AuSVR4bkNyZWF0ZS5zdWJtaXQoKQogICAgaXR4bl9zdWJtaXQKCmlzc3VlX2NyZWRpdHNfYmF0Y2hfYWZ0ZXJfaWZfZWxzZUAxNDoKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hYXJuYV9yZWdpc3RyeS9jb250cmFjdC5weToxMDY5CiAgICAvLyBzZWxmLnRvdGFsX2NyZWRpdHNfaXNzdWVkICs9IGlzc3VlZAogICAgaW50Y18wIC8vIDAKICAgIGJ5dGVjIDExIC8vICJ0b3RhbF9jcmVkaXRzX2lzc3VlZCIKICAgIGFwcF9nbG9iYWxfZ2V0X2V4CiAgICBhc3NlcnQgLy8gY2hlY2sgc2VsZi50b3RhbF9jcmVkaXRzX2lzc3VlZCBleGlzdHMKICAgIHVuY292ZXIgMgogICAgKwogICAgYnl0ZWMgMTEgLy8gInRvdGFsX2NyZWRpdHNfaXNzdWVkIgogICAgc3dhcAogICAgYXBwX2dsb2JhbF9wdXQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hYXJuYV9yZWdpc3RyeS9jb250cmFjdC5weToxMDMwCiAgICAvLyBAYXJjNC5hYmltZXRob2QKICAgIGJ5dGVjXzAgLy8gMHgxNTFmN2M3NQogICAgc3dhcAogICAgY29uY2F0CiAgICBsb2cKICAgIGludGNfMSAvLyAxCiAgICByZXR1cm4KCgovLyBzbWFydF9jb250cmFjdHMuYWFybmFfcmVnaXN0cnkuY29udHJhY3QuQWFybmFSZWdpc3RyeS5saXN0X2Zvcl9zYWxlW3JvdXRpbmddKCkgLT4gdm9pZDoKbGlzdF9mb3Jfc2FsZToKICAgIGludGNfMCAvLyAwCiAgICBkdXBuIDIKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hYXJuYV9yZWdpc3RyeS9jb250cmFjdC5weToxMDcyLTEwNzUKICAgIC8vICMg4pWQ4pWQ4pWQ4pWQ4pWQ4pWQ4pWQ4pWQ4pWQ4pWQ4pWQ4pWQ4pWQ4pWQ4pWQ4pWQ4pWQ4pWQ4pWQ4pWQ4pWQ4pWQ4pWQ4pWQ4pWQ4pWQ4pWQ4pWQ4pWQ4pWQ4pWQ4pWQ4pWQ4pWQ4pWQ4pWQ4pWQ4pWQ4pWQ4pWQ4pWQ4pWQ4pWQ4pWQ4pWQ4pWQ4pWQ4pWQ4pWQ4pWQ4pWQ4pWQ4pWQ4pWQ4pWQ4pWQ4pWQ4pWQ4pWQ4pWQ4pWQ4pWQ4pWQ4pWQ4pWQ4pWQ4pWQ4pWQ4pWQ4pWQCiAgICAvLyAjIE1hcmtldHBsYWNlCiAgICAvLyAjIOKVkOKVkOKVkOKVkOKVkOKVkOKVkOKVkOKVkOKVkOKVkOKVkOKVkOKVkOKVkOKVkOKVkOKVkOKVkOKVkOKVkOKVkOKVkOKVkOKVkOKVkOKVkOKVkOKVkOKVkOKVkOKVkOKVkOKVkOKVkOKVkOKVkOKVkOKVkOKVkOKVkOKVkOKVkOKVkOKVkOKVkOKVkOKVkOKVkOKVkOKVkOKVkOKVkOKVkOKVkOKVkOKVkOKVkOKVkOKVkOKVkOKVkOKVkOKVkOKVkOKVkOKVkOKVkOKVkOKVkAogICAgLy8gQGFyYzQuYWJpbWV0aG9kCiAgICB0eG5hIEFwcGxpY2F0aW9uQXJncyAxCiAgICBkdXBuIDIKICAgIGxlbgogICAgaW50Y18yIC8vIDgKICAgID09CiAgICBhc3NlcnQgLy8gaW52YWxpZCBudW1iZXIgb2YgYnl0ZXMgZm9yIGFyYzQudWludDY0CiAgICB0eG5hIEFwcGxpY2F0aW9uQXJncyAyCiAgICBkdXAKICAgIGNvdmVyIDIKICAgIGR1cAogICAgbGVuCiAgICBpbnRjXzIgLy8gOAogICAgPT0KICAgIGFzc2VydCAvLyBpbnZhbGlkIG51bWJlciBvZiBieXRlcyBmb3IgYXJjNC51aW50NjQKICAgIHR4bmEgQXBwbGljYXRpb25BcmdzIDMKICAgIGR1cAogICAgY292ZXIgMwogICAgbGVuCiAgICBpbnRjXzIgLy8gOAogICAgPT0KICAgIGFzc2VydCAvLyBpbnZhbGlkIG51bWJlciBvZiBieXRlcyBmb3IgYXJjNC51aW50NjQKICAgIHR4biBHcm91cEluZGV4CiAgICBpbnRjXzEgLy8gMQogICAgLQogICAgZHVwCiAgICBjb3ZlciAzCiAgICBndHhucyBUeXBlRW51bQogICAgaW50Y18xIC8vIHBheQogICAgPT0KICAgIGFzc2VydCAvLyB0cmFuc2FjdGlvbiB0eXBlIGlzIHBheQogICAgLy8gc21hcnRfY29udHJhY3RzL2Fhcm5hX3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjEwOTEKICAgIC8vIGFzc2VydCBzZWxmLmFhcm5hX2Fzc2V0LCAibm8gQUFSTkEgdG9rZW4iCiAgICBpbnRjXzAgLy8gMAogICAgYnl0ZWNfMSAvLyAiYWFybmFfYXNzZXQiCiAgICBhcHBfZ2xvYmFsX2dldF9leAogICAgYXNzZXJ0IC8vIGNoZWNrIHNlbGYuYWFybmFfYXNzZXQgZXhpc3RzCiAgICBhc3NlcnQgLy8gbm8gQUFSTkEgdG9rZW4KICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hYXJuYV9yZWdpc3RyeS9jb250cmFjdC5weToxMDkyCiAgICAvLyBhc3NlcnQgYW1vdW50Lm5hdGl2ZSA+IFVJbnQ2NCgwKSwgImFtb3VudCBtdXN0IGJlID4gMCIKICAgIHN3YXAKICAgIGJ0b2kKICAgIGR1cAogICAgY292ZXIgMwogICAgYXNzZXJ0IC8vIGFtb3VudCBtdXN0IGJlID4gMAogICAgLy8gc21hcnRfY29udHJhY3RzL2Fhcm5hX3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjEwOTMKICAgIC8vIGFzc2VydCBwcmljZV9wZXJfdG9rZW4ubmF0aXZlID4gVUludDY0KDApLCAicHJpY2UgbXVzdCBiZSA+IDAiCiAgICBidG9pCiAgICBkdXAKICAgIGFzc2VydCAvLyBwcmljZSBtdXN0IGJlID4gMAogICAgLy8gc21hcnRfY29udHJhY3RzL2Fhcm5hX3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjEwOTQKICAgIC8vIGNoYXJnZSA9IFVJbnQ2NChMSVNUSU5HX0RFUE9TSVQpCiAgICBwdXNoaW50IDExMDUwMAogICAgY292ZXIgNgogICAgLy8gc21hcnRfY29udHJhY3RzL2Fhcm5hX3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjEwOTUKICAgIC8vIGlmIHNlbGYuZnJlZV9saXN0aW5nX2hlYWQgIT0gTk9fSUQ6CiAgICBpbnRjXzAgLy8gMAogICAgYnl0ZWMgMTUgLy8gImZyZWVfbGlzdGluZ19oZWFkIgogICAgYXBwX2dsb2JhbF9nZXRfZXgKICAgIGFzc2VydCAvLyBjaGVjayBzZWxmLmZyZWVfbGlzdGluZ19oZWFkIGV4aXN0cwogICAgaW50YyA0IC8vIDE4NDQ2NzQ0MDczNzA5NTUxNjE1CiAgICAhPQogICAgYnogbGlzdF9mb3Jfc2FsZV9hZnRlcl9pZl9lbHNlQDMKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hYXJuYV9yZWdpc3RyeS9jb250cmFjdC5weToxMDk2CiAgICAvLyBjaGFyZ2UgPSBVSW50NjQoTElTVElOR19SRUZVTkQpCiAgICBpbnRjIDYgLy8gOTgwMDAKICAgIGJ1cnkgNwoKbGlzdF9mb3Jfc2FsZV9hZnRlcl9pZl9lbHNlQDM6CiAgICAvLyBzbWFydF9jb250cmFjdHMvYWFybmFfcmVnaXN0cnkvY29udHJhY3QucHk6MTA5NwogICAgLy8gcGFpZCA9IHNlbGYuX2NhbGxlcl9wYXltZW50KGRlcG9zaXQpCiAgICBzd2FwCiAgICBjYWxsc3ViIF9jYWxsZXJfcGF5bWVudAogICAgZHVwCiAgICBjb3ZlciA2CiAgICAvLyBzbWFydF9jb250cmFjdHMvYWFybmFfcmVnaXN0cnkvY29udHJhY3QucHk6MTA5OAogICAgLy8gYXNzZXJ0IHBhaWQgPj0gY2hhcmdlLCAiaW5zdWZmaWNpZW50IGRlcG9zaXQiCiAgICBkdXAKICAgIGRpZyA4CiAgICBkdXAKICAgIGNvdmVyIDMKICAgID49CiAgICBhc3NlcnQgLy8gaW5zdWZmaWNpZW50IGRlcG9zaXQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hYXJuYV9yZWdpc3RyeS9jb250cmFjdC5weToxMTAxCiAgICAvLyB4ZmVyX2Fzc2V0PUFzc2V0KHNlbGYuYWFybmFfYXNzZXQpLAogICAgaW50Y18wIC8vIDAKICAgIGJ5dGVjXzEgLy8gImFhcm5hX2Fzc2V0IgogICAgYXBwX2dsb2JhbF9nZXRfZXgKICAgIHN3YXAKICAgIGNvdmVyIDUKICAgIGFzc2VydCAvLyBjaGVjayBzZWxmLmFhcm5hX2Fzc2V0IGV4aXN0cwogICAgLy8gc21hcnRfY29udHJhY3RzL2Fhcm5hX3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjExMDIKICAgIC8vIGFzc2V0X3NlbmRlcj1UeG4uc2VuZGVyLAogICAgdHhuIFNlbmRlcgogICAgY292ZXIgNAogICAgLy8gc21hcnRfY29udHJhY3RzL2Fhcm5hX3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjExMDMKICAgIC8vIGFzc2V0X3JlY2VpdmVyPUdsb2JhbC5jdXJyZW50X2FwcGxpY2F0aW9uX2FkZHJlc3MsCiAgICBnbG9iYWwgQ3VycmVudEFwcGxpY2F0aW9uQWRkcmVzcwogICAgY292ZXIgMgogICAgLy8gc21hcnRfY29udHJhY3RzL2Fhcm5hX3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjExMDYKICAgIC8vIGlmIHBhaWQgPiBjaGFyZ2U6CiAgICA8CiAgICBieiBsaXN0X2Zvcl9zYWxlX2Vsc2VfYm9keUA3CiAgICAvLyBzbWFydF9jb250cmFjdHMvYWFybmFfcmVnaXN0cnkvY29udHJhY3QucHk6MTEwNy0xMTA5CiAgICAvLyBpdHhuLnN1Ym1pdF90eG5zKAogICAgLy8gICAgIGVzY3JvdywgaXR4bi5QYXltZW50KHJlY2VpdmVyPVR4bi5zZW5kZXIsIGFtb3VudD1wYWlkIC0gY2hhcmdlKQogICAgLy8gKQogICAgaXR4bl9iZWdpbgogICAgZGlnIDIKICAgIGl0eG5fZmllbGQgQXNzZXRBbW91bnQKICAgIGl0eG5fZmllbGQgQXNzZXRSZWNlaXZlcgogICAgdW5jb3ZlciAyCiAgICBpdHhuX2ZpZWxkIEFzc2V0U2VuZGVyCiAgICB1bmNvdmVyIDIKICAgIGl0eG5fZmllbGQgWGZlckFzc2V0CiAgICAvLyBzbWFydF9jb250cmFjdHMvYWFybmFfcmVnaXN0cnkvY29udHJhY3QucHk6MTEwMAogICAgLy8gZXNjcm93ID0gaXR4bi5Bc3NldFRyYW5zZmVyKAogICAgcHVzaGludCA0IC8vIGF4ZmVyCiAgICBpdHhuX2ZpZWxkIFR5cGVFbnVtCiAgICBpbnRjXzAgLy8gMAogICAgaXR4bl9maWVsZCBGZWUKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hYXJuYV9yZWdpc3RyeS9jb250cmFjdC5weToxMTA4CiAgICAvLyBlc2Nyb3csIGl0eG4uUGF5bWVudChyZWNlaXZlcj1UeG4uc2VuZGVyLCBhbW91bnQ9cGFpZCAtIGNoYXJnZSkKICAgIGl0eG5fbmV4dAogICAgdHhuIFNlbmRlcgogICAgdW5jb3ZlciA2CiAgICBkaWcgNwogICAgLQogICAgaXR4bl9maWVsZCBBbW91bnQKICAgIGl0eG5fZmllbGQgUmVjZWl2ZXIKICAgIGludGNfMSAvLyBwYXkKICAgIGl0eG5fZmllbGQgVHlwZUVudW0KICAgIGludGNfMCAvLyAwCiAgICBpdHhuX2ZpZWxkIEZlZQogICAgLy8gc21hcnRfY29udHJhY3RzL2Fhcm5hX3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjExMDctMTEwOQogICAgLy8gaXR4bi5zdWJtaXRfdHhucygKICAgIC8vICAgICBlc2Nyb3csIGl0eG4uUGF5bWVudChyZWNlaXZlcj1UeG4uc2VuZGVyLCBhbW91bnQ9cGFpZCAtIGNoYXJnZSkKICAgIC8vICkKICAgIGl0eG5fc3VibWl0CgpsaXN0X2Zvcl9zYWxlX2FmdGVyX2lmX2Vsc2VAOToKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hYXJuYV9yZWdpc3RyeS9jb250cmFjdC5weTo3MjYKICAgIC8vIHNlbGYub3Blbl9saXN0aW5nX2NvdW50ICs9IDEKICAgIGludGNfMCAvLyAwCiAgICBieXRlYyAxMyAvLyAib3Blbl9saXN0aW5nX2NvdW50IgogICAgYXBwX2dsb2JhbF9nZXRfZXgKICAgIGFzc2VydCAvLyBjaGVjayBzZWxmLm9wZW5fbGlzdGluZ19jb3VudCBleGlzdHMKICAgIGludGNfMSAvLyAxCiAgICArCiAgICBieXRlYyAxMyAvLyAib3Blbl9saXN0aW5nX2NvdW50IgogICAgc3dhcAogICAgYXBwX2dsb2JhbF9wdXQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hYXJuYV9yZWdpc3RyeS9jb250cmFjdC5weTo3MjcKICAgIC8vIGxpZCA9IHNlbGYuZnJlZV9saXN0aW5nX2hlYWQKICAgIGludGNfMCAvLyAwCiAgICBieXRlYyAxNSAvLyAiZnJlZV9saXN0aW5nX2hlYWQiCiAgICBhcHBfZ2xvYmFsX2dldF9leAogICAgc3dhcAogICAgZHVwCiAgICB1bmNvdmVyIDIKICAgIGFzc2VydCAvLyBjaGVjayBzZWxmLmZyZWVfbGlzdGluZ19oZWFkIGV4aXN0cwogICAgLy8gc21hcnRfY29udHJhY3RzL2Fhcm5hX3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjcyOAogICAgLy8gaWYgbGlkID09IE5PX0lEOgogICAgaW50YyA0IC8vIDE4NDQ2NzQ0MDczNzA5NTUxNjE1CiAgICA9PQogICAgYnogbGlzdF9mb3Jfc2FsZV9hZnRlcl9pZl9lbHNlQDEyCiAgICBwb3AKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hYXJuYV9yZWdpc3RyeS9jb250cmFjdC5weTo3MjkKICAgIC8vIGxpZCA9IHNlbGYubGlzdGluZ19jb3VudAogICAgaW50Y18wIC8vIDAKICAgIGJ5dGVjIDcgLy8gImxpc3RpbmdfY291bnQiCiAgICBhcHBfZ2xvYmFsX2dldF9leAogICAgYXNzZXJ0IC8vIGNoZWNrIHNlbGYubGlzdGluZ19jb3VudCBleGlzdHMKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hYXJuYV9yZWdpc3RyeS9jb250cmFjdC5weTo3MzAKICAgIC8vIHNlbGYubGlzdGluZ19jb3VudCA9IGxpZCArIDEKICAgIGR1cAogICAgaW50Y18xIC8vIDEKICAgICsKICAgIGJ5dGVjIDcgLy8gImxpc3RpbmdfY291bnQiCiAgICBzd2FwCiAgICBhcHBfZ2xvYmFsX3B1dAoKbGlzdF9mb3Jfc2FsZV9hZnRlcl9pbmxpbmVkX3NtYXJ0X2NvbnRyYWN0cy5hYXJuYV9yZWdpc3RyeS5jb250cmFjdC5BYXJuYVJlZ2lzdHJ5Ll9hbGxvY2F0ZV9saXN0aW5nX2lkQDEzOgogICAgLy8gc21hcnRfY29udHJhY3RzL2Fhcm5hX3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjExMTUKICAgIC8vIHNlbGxlcj1hcmM0LkFkZHJlc3MoVHhuLnNlbmRlciksCiAgICB0eG4gU2VuZGVyCiAgICAvLyBzbWFydF9jb250cmFjdHMvYWFybmFfcmVnaXN0cnkvY29udHJhY3QucHk6MTExOAogICAgLy8gYWN0aXZlPWFyYzQuVUludDY0KDEpLAogICAgaW50Y18xIC8vIDEKICAgIGl0b2IKICAgIGR1cAogICAgY292ZXIgMgogICAgYnVyeSAxMgogICAgLy8gc21hcnRfY29udHJhY3RzL2Fhcm5hX3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjExMTQtMTExOQogICAgLy8gc2VsZi5saXN0aW5nc1tpZHhdID0gTGlzdGluZ1JlY29yZCgKICAgIC8vICAgICBzZWxsZXI9YXJjNC5BZGRyZXNzKFR4bi5zZW5kZXIpLAogICAgLy8gICAgIGFtb3VudD1hbW91bnQsCiAgICAvLyAgICAgcHJpY2U9cHJpY2VfcGVyX3Rva2VuLAogICAgLy8gICAgIGFjdGl2ZT1hcmM0LlVJbnQ2NCgxKSwKICAgIC8vICkKICAgIGRpZyA3CiAgICBjb25jYXQKICAgIGRpZyA2CiAgICBjb25jYXQKICAgIHN3YXAKICAgIGNvbmNhdAogICAgLy8gc21hcnRfY29udHJhY3RzL2Fhcm5hX3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjExMTQKICAgIC8vIHNlbGYubGlzdGluZ3NbaWR4XSA9IExpc3RpbmdSZWNvcmQoCiAgICBkaWcgMQogICAgaXRvYgogICAgZHVwCiAgICBjb3ZlciA0CiAgICBieXRlYyA1IC8vIDB4NmMKICAgIHN3YXAKICAgIGNvbmNhdAogICAgLy8gc21hcnRfY29udHJhY3RzL2Fhcm5hX3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjExMTQtMTExOQogICAgLy8gc2VsZi5saXN0aW5nc1tpZHhdID0gTGlzdGluZ1JlY29yZCgKICAgIC8vICAgICBzZWxsZXI9YXJjNC5BZGRyZXNzKFR4bi5zZW5kZXIpLAogICAgLy8gICAgIGFtb3VudD1hbW91bnQsCiAgICAvLyAgICAgcHJpY2U9cHJpY2VfcGVyX3Rva2VuLAogICAgLy8gICAgIGFjdGl2ZT1hcmM0LlVJbnQ2NCgxKSwKICAgIC8vICkKICAgIHN3YXAKICAgIGJveF9wdXQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hYXJuYV9yZWdpc3RyeS9jb250cmFjdC5weToxMTIxCiAgICAvLyBpZHgsIHByaWNlX3Blcl90b2tlbi5uYXRpdmUsIGFtb3VudC5uYXRpdmUsIHByZXZfcHJpY2UubmF0aXZlCiAgICBkaWcgNAogICAgYnRvaQogICAgY292ZXIgNAogICAgLy8gc21hcnRfY29udHJhY3RzL2Fhcm5hX3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjYzOAogICAgLy8gaWYgcHJpY2UgaW4gc2VsZi5wcmljZV9sZXZlbHM6CiAgICBkaWcgMQogICAgaXRvYgogICAgZHVwCiAgICBidXJ5IDExCiAgICBieXRlYyA0IC8vIDB4NmYKICAgIHN3YXAKICAgIGNvbmNhdAogICAgZHVwCiAgICBjb3ZlciA2CiAgICBib3hfbGVuCiAgICBidXJ5IDEKICAgIGJ6IGxpc3RfZm9yX3NhbGVfYWZ0ZXJfaWZfZWxzZUAxNgogICAgYnVyeSAxCiAgICB1bmNvdmVyIDMKICAgIHBvcAogICAgdW5jb3ZlciA0CiAgICBwb3AKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hYXJuYV9yZWdpc3RyeS9jb250cmFjdC5weTo2MzkKICAgIC8vIGxldmVsID0gc2VsZi5wcmljZV9sZXZlbHNbcHJpY2VdLmNvcHkoKQogICAgdW5jb3ZlciAzCiAgICBkdXAKICAgIGJveF9nZXQKICAgIGFzc2VydCAvLyBjaGVjayBzZWxmLnByaWNlX2xldmVscyBlbnRyeSBleGlzdHMKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hYXJuYV9yZWdpc3RyeS9jb250cmFjdC5weTo2NDAKICAgIC8vIHRhaWwgPSBsZXZlbC50YWlsLm5hdGl2ZQogICAgZHVwCiAgICBleHRyYWN0IDI0IDgKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hYXJuYV9yZWdpc3RyeS9jb250cmFjdC5weTo2NDIKICAgIC8vIHByZXY9YXJjNC5VSW50NjQodGFpbCksIG5leHQ9YXJjNC5VSW50NjQoTk9fSUQpLCBzbG90PWFyYzQuVUludDY0KDApCiAgICBpbnRjIDQgLy8gMTg0NDY3NDQwNzM3MDk1NTE2MTUKICAgIGl0b2IKICAgIGludGNfMCAvLyAwCiAgICBpdG9iCiAgICAvLyBzbWFydF9jb250cmFjdHMvYWFybmFfcmVnaXN0cnkvY29udHJhY3QucHk6NjQxLTY0MwogICAgLy8gc2VsZi5saXN0aW5nX2xpbmtzW2xpZF0gPSBMaXN0aW5nTGluaygKICAgIC8vICAgICBwcmV2PWFyYzQuVUludDY0KHRhaWwpLCBuZXh0PWFyYzQuVUludDY0KE5PX0lEKSwgc2xvdD1hcmM0LlVJbnQ2NCgwKQogICAgLy8gKQogICAgZGlnIDIKICAgIHVuY292ZXIgMgogICAgY29uY2F0CiAgICBzd2FwCiAgICBjb25jYXQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hYXJuYV9yZWdpc3RyeS9jb250cmFjdC5weTo2NDEKICAgIC8vIHNlbGYubGlzdGluZ19saW5rc1tsaWRdID0gTGlzdGluZ0xpbmsoCiAgICBieXRlYyA2IC8vIDB4NmIKICAgIGRpZyA2CiAgICBkdXAKICAgIGNvdmVyIDMKICAgIGNvbmNhdAogICAgLy8gc21hcnRfY29udHJhY3RzL2Fhcm5hX3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjY0MS02NDMKICAgIC8vIHNlbGYubGlzdGluZ19saW5rc1tsaWRdID0gTGlzdGluZ0xpbmsoCiAgICAvLyAgICAgcHJldj1hcmM0LlVJbnQ2NCh0YWlsKSwgbmV4dD1hcmM0LlVJbnQ2NChOT19JRCksIHNsb3Q9YXJjNC5VSW50NjQoMCkKICAgIC8vICkKICAgIHN3YXAKICAgIGJveF9wdXQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hYXJuYV9yZWdpc3RyeS9jb250cmFjdC5weTozOTgKICAgIC8vIHJldHVybiBCeXRlcyhMSVNUSU5HX0xJTktfS0VZX1BSRUZJWCkgKyBvcC5pdG9iKGxpZCkKICAgIGJ5dGVjIDYgLy8gMHg2YgogICAgdW5jb3ZlciAyCiAgICBjb25jYXQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hYXJuYV9yZWdpc3RyeS9jb250cmFjdC5weTo2NDQKICAgIC8vIG9wLkJveC5yZXBsYWNlKF9saXN0aW5nX2xpbmtfa2V5KHRhaWwpLCBMSU5LX05FWFRfT0ZGU0VULCBvcC5pdG9iKGxpZCkpCiAgICBpbnRjXzIgLy8gOAogICAgZGlnIDIKICAgIGJveF9yZXBsYWNlCiAgICAvLyBzbWFydF9jb250cmFjdHMvYWFybmFfcmVnaXN0cnkvY29udHJhY3QucHk6NjQ1CiAgICAvLyBsZXZlbC50YWlsID0gYXJjNC5VSW50NjQobGlkKQogICAgcmVwbGFjZTIgMjQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hYXJuYV9yZWdpc3RyeS9jb250cmFjdC5weTo2NDYKICAgIC8vIGxldmVsLmRlcHRoID0gYXJjNC5VSW50NjQobGV2ZWwuZGVwdGgubmF0aXZlICsgYW1vdW50KQogICAgZHVwCiAgICBwdXNoaW50IDMyCiAgICBleHRyYWN0X3VpbnQ2NAogICAgZGlnIDUKICAgICsKICAgIGl0b2IKICAgIHJlcGxhY2UyIDMyCiAgICAvLyBzbWFydF9jb250cmFjdHMvYWFybmFfcmVnaXN0cnkvY29udHJhY3QucHk6NjQ3CiAgICAvLyBsZXZlbC5saXN0aW5ncyA9IGFyYzQuVUludDY0KGxldmVsLmxpc3RpbmdzLm5hdGl2ZSArIDEpCiAgICBkdXAKICAgIHB1c2hpbnQgNDAKICAgIGV4dHJhY3RfdWludDY0CiAgICBpbnRjXzEgLy8gMQogICAgKwogICAgaXRvYgogICAgcmVwbGFjZTIgNDAKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hYXJuYV9yZWdpc3RyeS9jb250cmFjdC5weTo2NDgKICAgIC8vIHNlbGYucHJpY2VfbGV2ZWxzW3ByaWNlXSA9IGxldmVsLmNvcHkoKQogICAgYm94X3B1dAoKbGlzdF9mb3Jfc2FsZV9hZnRlcl9pbmxpbmVkX3NtYXJ0X2NvbnRyYWN0cy5hYXJuYV9yZWdpc3RyeS5jb250cmFjdC5BYXJuYVJlZ2lzdHJ5Ll9ib29rX2luc2VydEAyOToKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hYXJuYV9yZWdpc3RyeS9jb250cmFjdC5weTozMzAKICAgIC8vIHJldHVybiBCeXRlcyhTRUxMRVJfSU5ERVhfUFJFRklYKSArIGFkZHIuYnl0ZXMKICAgIGJ5dGVjIDMwIC8vIDB4NzQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hYXJuYV9yZWdpc3RyeS9jb250cmFjdC5weToxMTIzCiAgICAvLyBzbG90ID0gX2luZGV4X2FwcGVuZChfc2VsbGVyX2tleShUeG4uc2VuZGVyKSwgaWR4KQogICAgdHhuIFNlbmRlcgogICAgLy8gc21hcnRfY29udHJhY3RzL2Fhcm5hX3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjMzMAogICAgLy8gcmV0dXJuIEJ5dGVzKFNFTExFUl9JTkRFWF9QUkVGSVgpICsgYWRkci5ieXRlcwogICAgY29uY2F0CiAgICAvLyBzbWFydF9jb250cmFjdHMvYWFybmFfcmVnaXN0cnkvY29udHJhY3QucHk6MTEyMwogICAgLy8gc2xvdCA9IF9pbmRleF9hcHBlbmQoX3NlbGxlcl9rZXkoVHhuLnNlbmRlciksIGlkeCkKICAgIHN3YXAKICAgIGNhbGxzdWIgX2luZGV4X2FwcGVuZAogICAgLy8gc21hcnRfY29udHJhY3RzL2Fhcm5hX3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjM5OAogICAgLy8gcmV0dXJuIEJ5dGVzKExJU1RJTkdfTElOS19LRVlfUFJFRklYKSArIG9wLml0b2IobGlkKQogICAgYnl0ZWMgNiAvLyAweDZiCiAgICBkaWcgMgogICAgY29uY2F0CiAgICAvLyBzbWFydF9jb250cmFjdHMvYWFybmFfcmVnaXN0cnkvY29udHJhY3QucHk6MTEyNAogICAgLy8gb3AuQm94LnJlcGxhY2UoX2xpc3RpbmdfbGlua19rZXkoaWR4KSwgTElOS19TTE9UX09GRlNFVCwgb3AuaXRvYihzbG90KSkKICAgIHN3YXAKICAgIGl0b2IKICAgIHB1c2hpbnQgMTYKICAgIHN3YXAKICAgIGJveF9yZXBsYWNlCiAgICAvLyBzbWFydF9jb250cmFjdHMvYWFybmFfcmVnaXN0cnkvY29udHJhY3QucHk6MTEyNi0xMTMxCiAgICAvLyBMaXN0ZWQoCiAgICAvLyAgICAgbGlzdGluZ19pZD1hcmM0LlVJbnQ2NChpZHgpLAogICAgLy8gICAgIHNlbGxlcj1hcmM0LkFkZHJlc3MoVHhuLnNlbmRlciksCiAgICAvLyAgICAgYW1vdW50PWFtb3VudCwKICAgIC8vICAgICBwcmljZT1wcmljZV9wZXJfdG9rZW4sCiAgICAvLyApCiAgICBkdXAKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hYXJuYV9yZWdpc3RyeS9jb250cmFjdC5weToxMTI4CiAgICAvLyBzZWxsZXI9YXJjNC5BZGRyZXNzKFR4bi5zZW5kZXIpLAogICAgdHhuIFNlbmRlcgogICAgLy8gc21hcnRfY29udHJhY3RzL2Fhcm5hX3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjExMjYtMTEzMQogICAgLy8gTGlzdGVkKAogICAgLy8gICAgIGxpc3RpbmdfaWQ9YXJjNC5VSW50NjQoaWR4KSwKICAgIC8vICAgICBzZWxsZXI9YXJjNC5BZGRyZXNzKFR4bi5zZW5kZXIpLAogICAgLy8gICAgIGFtb3VudD1hbW91bnQsCiAgICAvLyAgICAgcHJpY2U9cHJpY2VfcGVyX3Rva2VuLAogICAgLy8gKQogICAgY29uY2F0CiAgICB1bmNvdmVyIDQKICAgIGNvbmNhdAogICAgdW5jb3ZlciAzCiAgICBjb25jYXQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hYXJuYV9yZWdpc3RyeS9jb250cmFjdC5weToxMTI1LTExMzIKICAgIC8vIGFyYzQuZW1pdCgKICAgIC8vICAgICBMaXN0ZWQoCiAgICAvLyAgICAgICAgIGxpc3RpbmdfaWQ9YXJjNC5VSW50NjQoaWR4KSwKICAgIC8vICAgICAgICAgc2VsbGVyPWFyYzQuQWRkcmVzcyhUeG4uc2VuZGVyKSwKICAgIC8vICAgICAgICAgYW1vdW50PWFtb3VudCwKICAgIC8vICAgICAgICAgcHJpY2U9cHJpY2VfcGVyX3Rva2VuLAogICAgLy8gICAgICkKICAgIC8vICkKICAgIHB1c2hieXRlcyAweDA5OGNjZGFmIC8vIG1ldGhvZCAiTGlzdGVkKHVpbnQ2NCxhZGRyZXNzLHVpbnQ2NCx1aW50NjQpIgogICAgc3dhcAogICAgY29uY2F0CiAgICBsb2cKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hYXJuYV9yZWdpc3RyeS9jb250cmFjdC5weToxMTMzCiAgICAvLyBzZWxmLmVzY3Jvd2VkX3Rva2VucyArPSBhbW91bnQubmF0aXZlCiAgICBpbnRjXzAgLy8gMAogICAgYnl0ZWMgOSAvLyAiZXNjcm93ZWRfdG9rZW5zIgogICAgYXBwX2dsb2JhbF9nZXRfZXgKICAgIGFzc2VydCAvLyBjaGVjayBzZWxmLmVzY3Jvd2VkX3Rva2VucyBleGlzdHMKICAgIHVuY292ZXIgMgogICAgKwogICAgYnl0ZWMgOSAvLyAiZXNjcm93ZWRfdG9rZW5zIgogICAgc3dhcAogICAgYXBwX2dsb2JhbF9wdXQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hYXJuYV9yZWdpc3RyeS9jb250cmFjdC5weToxMDcyLTEwNzUKICAgIC8vICMg4pWQ4pWQ4pWQ4pWQ4pWQ4pWQ4pWQ4pWQ4pWQ4pWQ4pWQ4pWQ4pWQ4pWQ4pWQ4pWQ4pWQ4pWQ4pWQ4pWQ4pWQ4pWQ4pWQ4pWQ4pWQ4pWQ4pWQ4pWQ4pWQ4pWQ4pWQ4pWQ4pWQ4pWQ4pWQ4pWQ4pWQ4pWQ4pWQ4pWQ4pWQ4pWQ4pWQ4pWQ4pWQ4pWQ4pWQ4pWQ4pWQ4pWQ4pWQ4pWQ4pWQ4pWQ4pWQ4pWQ4pWQ4pWQ4pWQ4pWQ4pWQ4pWQ4pWQ4pWQ4pWQ4pWQ4pWQ4pWQ4pWQ4pWQCiAgICAvLyAjIE1hcmtldHBsYWNlCiAgICAvLyAjIOKVkOKVkOKVkOKVkOKVkOKVkOKVkOKVkOKVkOKVkOKVkOKVkOKVkOKVkOKVkOKVkOKVkOKVkOKVkOKVkOKVkOKVkOKVkOKVkOKVkOKVkOKVkOKVkOKVkOKVkOKVkOKVkOKVkOKVkOKVkOKVkOKVkOKVkOKVkOKVkOKVkOKVkOKVkOKVkOKVkOKVkOKVkOKVkOKVkOKVkOKVkOKVkOKVkOKVkOKVkOKVkOKVkOKVkOKVkOKVkOKVkOKVkOKVkOKVkOKVkOKVkOKVkOKVkOKVkOKVkAogICAgLy8gQGFyYzQuYWJpbWV0aG9kCiAgICBieXRlY18wIC8vIDB4MTUxZjdjNzUKICAgIHN3YXAKICAgIGNvbmNhdAogICAgbG9nCiAgICBpbnRjXzEgLy8gMQogICAgcmV0dXJuCgpsaXN0X2Zvcl9zYWxlX2FmdGVyX2lmX2Vsc2VAMTY6CiAgICAvLyBzbWFydF9jb250cmFjdHMvYWFybmFfcmVnaXN0cnkvY29udHJhY3QucHk6NjUxCiAgICAvLyBpZiBwcmV2X3ByaWNlID09IE5PX1BSSUNFOgogICAgZGlnIDQKICAgIGJueiBsaXN0X2Zvcl9zYWxlX2Vsc2VfYm9keUAxOAogICAgLy8gc21hcnRfY29udHJhY3RzL2Fhcm5hX3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjY1MgogICAgLy8gY3VyID0gc2VsZi5iZXN0X3ByaWNlCiAgICBpbnRjXzAgLy8gMAogICAgYnl0ZWMgMTIgLy8gImJlc3RfcHJpY2UiCiAgICBhcHBfZ2xvYmFsX2dldF9leAogICAgYXNzZXJ0IC8vIGNoZWNrIHNlbGYuYmVzdF9wcmljZSBleGlzdHMKCmxpc3RfZm9yX3NhbGVfYWZ0ZXJfaWZfZWxzZUAxOToKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hYXJuYV9yZWdpc3RyeS9jb250cmFjdC5weTo2NTkKICAgIC8vIGFzc2VydCBjdXIgPT0gTk9fUFJJQ0Ugb3IgY3VyID4gcHJpY2UsICJzdGFsZSBwcmljZSBoaW50IgogICAgZHVwCiAgICBieiBsaXN0X2Zvcl9zYWxlX2Jvb2xfdHJ1ZUAyMQogICAgZHVwCiAgICBkaWcgMwogICAgPgogICAgYnogbGlzdF9mb3Jfc2FsZV9ib29sX2ZhbHNlQDIyCgpsaXN0X2Zvcl9zYWxlX2Jvb2xfdHJ1ZUAyMToKICAgIGludGNfMSAvLyAxCgpsaXN0X2Zvcl9zYWxlX2Jvb2xfbWVyZ2VAMjM6CiAgICAvLyBzbWFydF9jb250cmFjdHMvYWFybmFfcmVnaXN0cnkvY29udHJhY3QucHk6NjU5CiAgICAvLyBhc3NlcnQgY3VyID09IE5PX1BSSUNFIG9yIGN1ciA+IHByaWNlLCAic3RhbGUgcHJpY2UgaGludCIKICAgIGFzc2VydCAvLyBzdGFsZSBwcmljZSBoaW50CiAgICAvLyBzbWFydF9jb250cmFjdHMvYWFybmFfcmVnaXN0cnkvY29udHJhY3QucHk6NjYyCiAgICAvLyBuZXh0X3ByaWNlPWFyYzQuVUludDY0KGN1ciksCiAgICBkdXAKICAgIGl0b2IKICAgIGR1cAogICAgYnVyeSAxNAogICAgLy8gc21hcnRfY29udHJhY3RzL2Fhcm5hX3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjY2MC02NjcKICAgIC8vIHNlbGYucHJpY2VfbGV2ZWxzW3ByaWNlXSA9IFByaWNlTGV2ZWwoCiAgICAvLyAgICAgcHJldl9wcmljZT1hcmM0LlVJbnQ2NChwcmV2X3ByaWNlKSwKICAgIC8vICAgICBuZXh0X3ByaWNlPWFyYzQuVUludDY0KGN1ciksCiAgICAvLyAgICAgaGVhZD1hcmM0LlVJbnQ2NChsaWQpLAogICAgLy8gICAgIHRhaWw9YXJjNC5VSW50NjQobGlkKSwKICAgIC8vICAgICBkZXB0aD1hcmM0LlVJbnQ2NChhbW91bnQpLAogICAgLy8gICAgIGxpc3RpbmdzPWFyYzQuVUludDY0KDEpLAogICAgLy8gKQogICAgdW5jb3ZlciA4CiAgICBzd2FwCiAgICBjb25jYXQKICAgIGRpZyA0CiAgICBkdXAKICAgIGNvdmVyIDIKICAgIGNvbmNhdAogICAgc3dhcAogICAgY29uY2F0CiAgICBkaWcgOQogICAgY29uY2F0CiAgICBkaWcgMTMKICAgIGNvbmNhdAogICAgdW5jb3ZlciA3CiAgICBzd2FwCiAgICBib3hfcHV0CiAgICAvLyBzbWFydF9jb250cmFjdHMvYWFybmFfcmVnaXN0cnkvY29udHJhY3QucHk6NjY4CiAgICAvLyBpZiBwcmV2X3ByaWNlID09IE5PX1BSSUNFOgogICAgZGlnIDUKICAgIGJueiBsaXN0X2Zvcl9zYWxlX2Vsc2VfYm9keUAyNQogICAgdW5jb3ZlciA1CiAgICBwb3AKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hYXJuYV9yZWdpc3RyeS9jb250cmFjdC5weTo2NjkKICAgIC8vIHNlbGYuYmVzdF9wcmljZSA9IHByaWNlCiAgICBieXRlYyAxMiAvLyAiYmVzdF9wcmljZSIKICAgIHVuY292ZXIgMwogICAgYXBwX2dsb2JhbF9wdXQKCmxpc3RfZm9yX3NhbGVfYWZ0ZXJfaWZfZWxzZUAyNjoKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hYXJuYV9yZWdpc3RyeS9jb250cmFjdC5weTo2NzIKICAgIC8vIGlmIGN1ciAhPSBOT19QUklDRToKICAgIGJ6IGxpc3RfZm9yX3NhbGVfYWZ0ZXJfaWZfZWxzZUAyOAogICAgLy8gc21hcnRfY29udHJhY3RzL2Fhcm5hX3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjM5MwogICAgLy8gcmV0dXJuIEJ5dGVzKExFVkVMX0tFWV9QUkVGSVgpICsgb3AuaXRvYihwcmljZSkKICAgIGJ5dGVjIDQgLy8gMHg2ZgogICAgZGlnIDgKICAgIGNvbmNhdAogICAgLy8gc21hcnRfY29udHJhY3RzL2Fhcm5hX3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjY3MwogICAgLy8gb3AuQm94LnJlcGxhY2UoX2xldmVsX2tleShjdXIpLCBMRVZFTF9QUkVWX09GRlNFVCwgb3AuaXRvYihwcmljZSkpCiAgICBpbnRjXzAgLy8gMAogICAgZGlnIDgKICAgIGJveF9yZXBsYWNlCgpsaXN0X2Zvcl9zYWxlX2FmdGVyX2lmX2Vsc2VAMjg6CiAgICAvLyBzbWFydF9jb250cmFjdHMvYWFybmFfcmVnaXN0cnkvY29udHJhY3QucHk6Njc0CiAgICAvLyBzZWxmLmxpc3RpbmdfbGlua3NbbGlkXSA9IExpc3RpbmdMaW5rKAogICAgYnl0ZWMgNiAvLyAweDZiCiAgICBkaWcgMgogICAgY29uY2F0CiAgICAvLyBzbWFydF9jb250cmFjdHMvYWFybmFfcmVnaXN0cnkvY29udHJhY3QucHk6Njc0LTY3NgogICAgLy8gc2VsZi5saXN0aW5nX2xpbmtzW2xpZF0gPSBMaXN0aW5nTGluaygKICAgIC8vICAgICBwcmV2PWFyYzQuVUludDY0KE5PX0lEKSwgbmV4dD1hcmM0LlVJbnQ2NChOT19JRCksIHNsb3Q9YXJjNC5VSW50NjQoMCkKICAgIC8vICkKICAgIHB1c2hieXRlcyAweGZmZmZmZmZmZmZmZmZmZmZmZmZmZmZmZmZmZmZmZmZmMDAwMDAwMDAwMDAwMDAwMAogICAgYm94X3B1dAogICAgLy8gc21hcnRfY29udHJhY3RzL2Fhcm5hX3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjExMjAtMTEyMgogICAgLy8gc2VsZi5fYm9va19pbnNlcnQoCiAgICAvLyAgICAgaWR4LCBwcmljZV9wZXJfdG9rZW4ubmF0aXZlLCBhbW91bnQubmF0aXZlLCBwcmV2X3ByaWNlLm5hdGl2ZQogICAgLy8gKQogICAgYiBsaXN0X2Zvcl9zYWxlX2FmdGVyX2lubGluZWRfc21hcnRfY29udHJhY3RzLmFhcm5hX3JlZ2lzdHJ5LmNvbnRyYWN0LkFhcm5hUmVnaXN0cnkuX2Jvb2tfaW5zZXJ0QDI5CgpsaXN0X2Zvcl9zYWxlX2Vsc2VfYm9keUAyNToKICAgIHVuY292ZXIgMgogICAgcG9wCiAgICAvLyBzbWFydF9jb250cmFjdHMvYWFybmFfcmVnaXN0cnkvY29udHJhY3QucHk6MzkzCiAgICAvLyByZXR1cm4gQnl0ZXMoTEVWRUxfS0VZX1BSRUZJWCkgKyBvcC5pdG9iKHByaWNlKQogICAgdW5jb3ZlciA0CiAgICBpdG9iCiAgICBieXRlYyA0IC8vIDB4NmYKICAgIHN3YXAKICAgIGNvbmNhdAogICAgLy8gc21hcnRfY29udHJhY3RzL2Fhcm5hX3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjY3MQogICAgLy8gb3AuQm94LnJlcGxhY2UoX2xldmVsX2tleShwcmV2X3ByaWNlKSwgTEVWRUxfTkVYVF9PRkZTRVQsIG9wLml0b2IocHJpY2UpKQogICAgaW50Y18yIC8vIDgKICAgIGRpZyA5CiAgICBib3hfcmVwbGFjZQogICAgYiBsaXN0X2Zvcl9zYWxlX2FmdGVyX2lmX2Vsc2VAMjYKCmxpc3RfZm9yX3NhbGVfYm9vbF9mYWxzZUAyMjoKICAgIGludGNfMCAvLyAwCiAgICBiIGxpc3RfZm9yX3NhbGVfYm9vbF9tZXJnZUAyMwoKbGlzdF9mb3Jfc2FsZV9lbHNlX2JvZHlAMTg6CiAgICAvLyBzbWFydF9jb250cmFjdHMvYWFybmFfcmVnaXN0cnkvY29udHJhY3QucHk6NjU0CiAgICAvLyBhc3NlcnQgcHJldl9wcmljZSA8IHByaWNlLCAicHJpY2UgaGludCBub3QgYmVsb3cgcHJpY2UiCiAgICBkaWcgNAogICAgZHVwCiAgICBkaWcgMwogICAgPAogICAgYXNzZXJ0IC8vIHByaWNlIGhpbnQgbm90IGJlbG93IHByaWNlCiAgICAvLyBzbWFydF9jb250cmFjdHMvYWFybmFfcmVnaXN0cnkvY29udHJhY3QucHk6NjU1CiAgICAvLyBhc3NlcnQgcHJldl9wcmljZSBpbiBzZWxmLnByaWNlX2xldmVscywgInByaWNlIGhpbnQgbm90IGxpc3RlZCIKICAgIGl0b2IKICAgIGJ5dGVjIDQgLy8gMHg2ZgogICAgZGlnIDEKICAgIGNvbmNhdAogICAgYm94X2xlbgogICAgYnVyeSAxCiAgICBhc3NlcnQgLy8gcHJpY2UgaGludCBub3QgbGlzdGVkCiAgICAvLyBzbWFydF9jb250cmFjdHMvYWFybmFfcmVnaXN0cnkvY29udHJhY3QucHk6MzkzCiAgICAvLyByZXR1cm4gQnl0ZXMoTEVWRUxfS0VZX1BSRUZJWCkgKyBvcC5pdG9iKHByaWNlKQogICAgYnl0ZWMgNCAvLyAweDZmCiAgICBzd2FwCiAgICBjb25jYXQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hYXJuYV9yZWdpc3RyeS9jb250cmFjdC5weTo2NTcKICAgIC8vIG9wLkJveC5leHRyYWN0KF9sZXZlbF9rZXkocHJldl9wcmljZSksIExFVkVMX05FWFRfT0ZGU0VULCA4KQogICAgaW50Y18yIC8vIDgKICAgIGR1cAogICAgYm94X2V4dHJhY3QKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hYXJuYV9yZWdpc3RyeS9jb250cmFjdC5weTo2NTYtNjU4CiAgICAvLyBjdXIgPSBvcC5idG9pKAogICAgLy8gICAgIG9wLkJveC5leHRyYWN0KF9sZXZlbF9rZXkocHJldl9wcmljZSksIExFVkVMX05FWFRfT0ZGU0VULCA4KQogICAgLy8gKQogICAgYnRvaQogICAgYiBsaXN0X2Zvcl9zYWxlX2FmdGVyX2lmX2Vsc2VAMTkKCmxpc3RfZm9yX3NhbGVfYWZ0ZXJfaWZfZWxzZUAxMjoKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hYXJuYV9yZWdpc3RyeS9jb250cmFjdC5weTo3MzIKICAgIC8vIHNlbGYuZnJlZV9saXN0aW5nX2hlYWQgPSBzZWxmLmZyZWVfbGlzdGluZ3NbbGlkXS5uZXh0Lm5hdGl2ZQogICAgZHVwCiAgICBpdG9iCiAgICBwdXNoYnl0ZXMgMHg2NgogICAgc3dhcAogICAgY29uY2F0CiAgICBkdXAKICAgIGJveF9nZXQKICAgIGFzc2VydCAvLyBjaGVjayBzZWxmLmZyZWVfbGlzdGluZ3MgZW50cnkgZXhpc3RzCiAgICBpbnRjXzAgLy8gMAogICAgZXh0cmFjdF91aW50NjQKICAgIGJ5dGVjIDE1IC8vICJmcmVlX2xpc3RpbmdfaGVhZCIKICAgIHN3YXAKICAgIGFwcF9nbG9iYWxfcHV0CiAgICAvLyBzbWFydF9jb250cmFjdHMvYWFybmFfcmVnaXN0cnkvY29udHJhY3QucHk6NzMzCiAgICAvLyBkZWwgc2VsZi5mcmVlX2xpc3RpbmdzW2xpZF0KICAgIGJveF9kZWwKICAgIHBvcAogICAgLy8gc21hcnRfY29udHJhY3RzL2Fhcm5hX3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjExMTMKICAgIC8vIGlkeCA9IHNlbGYuX2FsbG9jYXRlX2xpc3RpbmdfaWQoKQogICAgYiBsaXN0X2Zvcl9zYWxlX2FmdGVyX2lubGluZWRfc21hcnRfY29udHJhY3RzLmFhcm5hX3JlZ2lzdHJ5LmNvbnRyYWN0LkFhcm5hUmVnaXN0cnkuX2FsbG9jYXRlX2xpc3RpbmdfaWRAMTMKCmxpc3RfZm9yX3NhbGVfZWxzZV9ib2R5QDc6CiAgICB1bmNvdmVyIDgKICAgIHBvcAogICAgLy8gc21hcnRfY29udHJhY3RzL2Fhcm5hX3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjExMTEKICAgIC8vIGVzY3Jvdy5zdWJtaXQoKQogICAgaXR4bl9iZWdpbgogICAgZGlnIDIKICAgIGl0eG5fZmllbGQgQXNzZXRBbW91bnQKICAgIGl0eG5fZmllbGQgQXNzZXRSZWNlaXZlcgogICAgdW5jb3ZlciAyCiAgICBpdHhuX2ZpZWxkIEFzc2V0U2VuZGVyCiAgICB1bmNvdmVyIDIKICAgIGl0eG5fZmllbGQgWGZlckFzc2V0CiAgICAvLyBzbWFydF9jb250cmFjdHMvYWFybmFfcmVnaXN0cnkvY29udHJhY3QucHk6MTEwMAogICAgLy8gZXNjcm93ID0gaXR4bi5Bc3NldFRyYW5zZmVyKAogICAgcHVzaGludCA0IC8vIGF4ZmVyCiAgICBpdHhuX2ZpZWxkIFR5cGVFbnVtCiAgICBpbnRjXzAgLy8gMAogICAgaXR4bl9maWVsZCBGZWUKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hYXJuYV9yZWdpc3RyeS9jb250cmFjdC5weToxMTExCiAgICAvLyBlc2Nyb3cuc3VibWl0KCkKICAgIGl0eG5fc3VibWl0CiAgICBiIGxpc3RfZm9yX3NhbGVfYWZ0ZXJfaWZfZWxzZUA5CgoKLy8gc21hcnRfY29udHJhY3RzLmFhcm5hX3JlZ2lzdHJ5LmNvbnRyYWN0LkFhcm5hUmVnaXN0cnkuYnV5X2xpc3Rpbmdbcm91dGluZ10oKSAtPiB2b2lkOgpidXlfbGlzdGluZzoKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hYXJuYV9yZWdpc3RyeS9jb250cmFjdC5weToxMTM2CiAgICAvLyBAYXJjNC5hYmltZXRob2QKICAgIHR4bmEgQXBwbGljYXRpb25BcmdzIDEKICAgIGR1cAogICAgbGVuCiAgICBpbnRjXzIgLy8gOAogICAgPT0KICAgIGFzc2VydCAvLyBpbnZhbGlkIG51bWJlciBvZiBieXRlcyBmb3IgYXJjNC51aW50NjQKICAgIHR4biBHcm91cEluZGV4CiAgICBpbnRjXzEgLy8gMQogICAgLQogICAgZHVwCiAgICBndHhucyBUeXBlRW51bQogICAgaW50Y18xIC8vIHBheQogICAgPT0KICAgIGFzc2VydCAvLyB0cmFuc2FjdGlvbiB0eXBlIGlzIHBheQogICAgLy8gc21hcnRfY29udHJhY3RzL2Fhcm5hX3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjExNDUKICAgIC8vIGFzc2VydCBzZWxmLmFhcm5hX2Fzc2V0LCAibm8gQUFSTkEgdG9rZW4iCiAgICBpbnRjXzAgLy8gMAogICAgYnl0ZWNfMSAvLyAiYWFybmFfYXNzZXQiCiAgICBhcHBfZ2xvYmFsX2dldF9leAogICAgYXNzZXJ0IC8vIGNoZWNrIHNlbGYuYWFybmFfYXNzZXQgZXhpc3RzCiAgICBhc3NlcnQgLy8gbm8gQUFSTkEgdG9rZW4KICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hYXJuYV9yZWdpc3RyeS9jb250cmFjdC5weToxMTQ2CiAgICAvLyBsaWQgPSBsaXN0aW5nX2lkLm5hdGl2ZQogICAgc3dhcAogICAgYnRvaQogICAgLy8gc21hcnRfY29udHJhY3RzL2Fhcm5hX3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjExNDcKICAgIC8vIGFzc2VydCBsaWQgPCBzZWxmLmxpc3RpbmdfY291bnQsICJpbnZhbGlkIGxpc3RpbmcgaWQiCiAgICBpbnRjXzAgLy8gMAogICAgYnl0ZWMgNyAvLyAibGlzdGluZ19jb3VudCIKICAgIGFwcF9nbG9iYWxfZ2V0X2V4CiAgICBhc3NlcnQgLy8gY2hlY2sgc2VsZi5saXN0aW5nX2NvdW50IGV4aXN0cwogICAgZGlnIDEKICAgID4KICAgIGFzc2VydCAvLyBpbnZhbGlkIGxpc3RpbmcgaWQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hYXJuYV9yZWdpc3RyeS9jb250cmFjdC5weToxMTQ4CiAgICAvLyByZWNvcmQgPSBzZWxmLmxpc3RpbmdzLmdldChsaWQsIGRlZmF1bHQ9c2VsZi5fZW1wdHlfbGlzdGluZygpKS5jb3B5KCkKICAgIGR1cAogICAgaXRvYgogICAgYnl0ZWMgNSAvLyAweDZjCiAgICBzd2FwCiAgICBjb25jYXQKICAgIGJveF9nZXQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hYXJuYV9yZWdpc3RyeS9jb250cmFjdC5weTo3NTgtNzYzCiAgICAvLyByZXR1cm4gTGlzdGluZ1JlY29yZCgKICAgIC8vICAgICBzZWxsZXI9YXJjNC5BZGRyZXNzKCksCiAgICAvLyAgICAgYW1vdW50PWFyYzQuVUludDY0KDApLAogICAgLy8gICAgIHByaWNlPWFyYzQuVUludDY0KDApLAogICAgLy8gICAgIGFjdGl2ZT1hcmM0LlVJbnQ2NCgwKSwKICAgIC8vICkKICAgIGJ5dGVjIDE3IC8vIGJhc2UzMihBQUFBQUFBQUFBQUFBQUFBQUFBQUFBQUFBQUFBQUFBQUFBQUFBQUFBQUFBQUFBQUFBQUFBQUFBQUFBQUFBQUFBQUFBQUFBQUFBQUFBQUFBQUFBQUFBQUFBQUEpCiAgICAvLyBzbWFydF9jb250cmFjdHMvYWFybmFfcmVnaXN0cnkvY29udHJhY3QucHk6MTE0OAogICAgLy8gcmVjb3JkID0gc2VsZi5saXN0aW5ncy5nZXQobGlkLCBkZWZhdWx0PXNlbGYuX2VtcHR5X2xpc3RpbmcoKSkuY29weSgpCiAgICBjb3ZlciAyCiAgICBzZWxlY3QKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hYXJuYV9yZWdpc3RyeS9jb250cmFjdC5weToxMTQ5CiAgICAvLyBhc3NlcnQgcmVjb3JkLmFjdGl2ZS5uYXRpdmUsICJsaXN0aW5nIG5vdCBhY3RpdmUiCiAgICBkdXAKICAgIHB1c2hpbnQgNDgKICAgIGV4dHJhY3RfdWludDY0CiAgICBhc3NlcnQgLy8gbGlzdGluZyBub3QgYWN0aXZlCiAgICAvLyBzbWFydF9jb250cmFjdHMvYWFybmFfcmVnaXN0cnkvY29udHJhY3QucHk6MTE1MgogICAgLy8gbGlkLCByZWNvcmQuYW1vdW50Lm5hdGl2ZSwgc2VsZi5fY2FsbGVyX3BheW1lbnQocGF5bWVudCkKICAgIHB1c2hpbnQgMzIKICAgIGV4dHJhY3RfdWludDY0CiAgICB1bmNvdmVyIDIKICAgIGNhbGxzdWIgX2NhbGxlcl9wYXltZW50CiAgICAvLyBzbWFydF9jb250cmFjdHMvYWFybmFfcmVnaXN0cnkvY29udHJhY3QucHk6MTE1MS0xMTUzCiAgICAvLyBzZWxmLl9zZXR0bGVfcHVyY2hhc2UoCiAgICAvLyAgICAgbGlkLCByZWNvcmQuYW1vdW50Lm5hdGl2ZSwgc2VsZi5fY2FsbGVyX3BheW1lbnQocGF5bWVudCkKICAgIC8vICkKICAgIGNhbGxzdWIgX3NldHRsZV9wdXJjaGFzZQogICAgLy8gc21hcnRfY29udHJhY3RzL2Fhcm5hX3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjExMzYKICAgIC8vIEBhcmM0LmFiaW1ldGhvZAogICAgaW50Y18xIC8vIDEKICAgIHJldHVybgoKCi8vIHNtYXJ0X2NvbnRyYWN0cy5hYXJuYV9yZWdpc3RyeS5jb250cmFjdC5BYXJuYVJlZ2lzdHJ5LmJ1eV9saXN0aW5nX3BhcnRpYWxbcm91dGluZ10oKSAtPiB2b2lkOgpidXlfbGlzdGluZ19wYXJ0aWFsOgogICAgLy8gc21hcnRfY29udHJhY3RzL2Fhcm5hX3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjExNTUKICAgIC8vIEBhcmM0LmFiaW1ldGhvZAogICAgdHhuYSBBcHBsaWNhdGlvbkFyZ3MgMQogICAgZHVwCiAgICBsZW4KICAgIGludGNfMiAvLyA4CiAgICA9PQogICAgYXNzZXJ0IC8vIGludmFsaWQgbnVtYmVyIG9mIGJ5dGVzIGZvciBhcmM0LnVpbnQ2NAogICAgdHhuYSBBcHBsaWNhdGlvbkFyZ3MgMgogICAgZHVwCiAgICBsZW4KICAgIGludGNfMiAvLyA4CiAgICA9PQogICAgYXNzZXJ0IC8vIGludmFsaWQgbnVtYmVyIG9mIGJ5dGVzIGZvciBhcmM0LnVpbnQ2NAogICAgdHhuIEdyb3VwSW5kZXgKICAgIGludGNfMSAvLyAxCiAgICAtCiAgICBkdXAKICAgIGd0eG5zIFR5cGVFbnVtCiAgICBpbnRjXzEgLy8gcGF5CiAgICA9PQogICAgYXNzZXJ0IC8vIHRyYW5zYWN0aW9uIHR5cGUgaXMgcGF5CiAgICAvLyBzbWFydF9jb250cmFjdHMvYWFybmFfcmVnaXN0cnkvY29udHJhY3QucHk6MTE2NgogICAgLy8gYXNzZXJ0IHNlbGYuYWFybmFfYXNzZXQsICJubyBBQVJOQSB0b2tlbiIKICAgIGludGNfMCAvLyAwCiAgICBieXRlY18xIC8vICJhYXJuYV9hc3NldCIKICAgIGFwcF9nbG9iYWxfZ2V0X2V4CiAgICBhc3NlcnQgLy8gY2hlY2sgc2VsZi5hYXJuYV9hc3NldCBleGlzdHMKICAgIGFzc2VydCAvLyBubyBBQVJOQSB0b2tlbgogICAgLy8gc21hcnRfY29udHJhY3RzL2Fhcm5hX3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjExNjcKICAgIC8vIGxpZCA9IGxpc3RpbmdfaWQubmF0aXZlCiAgICB1bmNvdmVyIDIKICAgIGJ0b2kKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hYXJuYV9yZWdpc3RyeS9jb250cmFjdC5weToxMTY4CiAgICAvLyBhc3NlcnQgbGlkIDwgc2VsZi5saXN0aW5nX2NvdW50LCAiaW52YWxpZCBsaXN0aW5nIGlkIgogICAgaW50Y18wIC8vIDAKICAgIGJ5dGVjIDcgLy8gImxpc3RpbmdfY291bnQiCiAgICBhcHBfZ2xvYmFsX2dldF9leAogICAgYXNzZXJ0IC8vIGNoZWNrIHNlbGYubGlzdGluZ19jb3VudCBleGlzdHMKICAgIGRpZyAxCiAgICA+CiAgICBhc3NlcnQgLy8gaW52YWxpZCBsaXN0aW5nIGlkCiAgICAvLyBzbWFydF9jb250cmFjdHMvYWFybmFfcmVnaXN0cnkvY29udHJhY3QucHk6MTE2OQogICAgLy8gcmVjb3JkID0gc2VsZi5saXN0aW5ncy5nZXQobGlkLCBkZWZhdWx0PXNlbGYuX2VtcHR5X2xpc3RpbmcoKSkuY29weSgpCiAgICBkdXAKICAgIGl0b2IKICAgIGJ5dGVjIDUgLy8gMHg2YwogICAgc3dhcAogICAgY29uY2F0CiAgICBib3hfZ2V0CiAgICAvLyBzbWFydF9jb250cmFjdHMvYWFybmFfcmVnaXN0cnkvY29udHJhY3QucHk6NzU4LTc2MwogICAgLy8gcmV0dXJuIExpc3RpbmdSZWNvcmQoCiAgICAvLyAgICAgc2VsbGVyPWFyYzQuQWRkcmVzcygpLAogICAgLy8gICAgIGFtb3VudD1hcmM0LlVJbnQ2NCgwKSwKICAgIC8vICAgICBwcmljZT1hcmM0LlVJbnQ2NCgwKSwKICAgIC8vICAgICBhY3RpdmU9YXJjNC5VSW50NjQoMCksCiAgICAvLyApCiAgICBieXRlYyAxNyAvLyBiYXNlMzIoQUFBQUFBQUFBQUFBQUFBQUFBQUFBQUFBQUFBQUFBQUFBQUFBQUFBQUFBQUFBQUFBQUFBQUFBQUFBQUFBQUFBQUFBQUFBQUFBQUFBQUFBQUFBQUFBQUFBQUFBKQogICAgLy8gc21hcnRfY29udHJhY3RzL2Fhcm5hX3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjExNjkKICAgIC8vIHJlY29yZCA9IHNlbGYubGlzdGluZ3MuZ2V0KGxpZCwgZGVmYXVsdD1zZWxmLl9lbXB0eV9saXN0aW5nKCkpLmNvcHkoKQogICAgY292ZXIgMgogICAgc2VsZWN0CiAgICAvLyBzbWFydF9jb250cmFjdHMvYWFybmFfcmVnaXN0cnkvY29udHJhY3QucHk6MTE3MAogICAgLy8gYXNzZXJ0IHJlY29yZC5hY3RpdmUubmF0aXZlLCAibGlzdGluZyBub3QgYWN0aXZlIgogICAgZHVwCiAgICBwdXNoaW50IDQ4CiAgICBleHRyYWN0X3VpbnQ2NAogICAgYXNzZXJ0IC8vIGxpc3Rpbmcgbm90IGFjdGl2ZQogICAgLy8gc21hcnRfY29udHJhY3RzL2Fhcm5hX3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjExNzEKICAgIC8vIGFzc2VydCBxdWFudGl0eS5uYXRpdmUgPiBVSW50NjQoMCksICJxdWFudGl0eSBtdXN0IGJlID4gMCIKICAgIHVuY292ZXIgMwogICAgYnRvaQogICAgZHVwCiAgICBhc3NlcnQgLy8gcXVhbnRpdHkgbXVzdCBiZSA+IDAKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hYXJuYV9yZWdpc3RyeS9jb250cmFjdC5weToxMTcyCiAgICAvLyBhc3NlcnQgcXVhbnRpdHkubmF0aXZlIDw9IHJlY29yZC5hbW91bnQubmF0aXZlLCAicXVhbnRpdHkgZXhjZWVkcyBsaXN0aW5nIgogICAgc3dhcAogICAgcHVzaGludCAzMgogICAgZXh0cmFjdF91aW50NjQKICAgIGRpZyAxCiAgICA+PQogICAgYXNzZXJ0IC8vIHF1YW50aXR5IGV4Y2VlZHMgbGlzdGluZwogICAgLy8gc21hcnRfY29udHJhY3RzL2Fhcm5hX3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjExNzQKICAgIC8vIHNlbGYuX3NldHRsZV9wdXJjaGFzZShsaWQsIHF1YW50aXR5Lm5hdGl2ZSwgc2VsZi5fY2FsbGVyX3BheW1lbnQocGF5bWVudCkpCiAgICB1bmNvdmVyIDIKICAgIGNhbGxzdWIgX2NhbGxlcl9wYXltZW50CiAgICBjYWxsc3ViIF9zZXR0bGVfcHVyY2hhc2UKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hYXJuYV9yZWdpc3RyeS9jb250cmFjdC5weToxMTU1CiAgICAvLyBAYXJjNC5hYmltZXRob2QKICAgIGludGNfMSAvLyAxCiAgICByZXR1cm4KCgovLyBzbWFydF9jb250cmFjdHMuYWFybmFfcmVnaXN0cnkuY29udHJhY3QuQWFybmFSZWdpc3RyeS5zd2VlcF9saXN0aW5nc1tyb3V0aW5nXSgpIC0+IHZvaWQ6CnN3ZWVwX2xpc3RpbmdzOgogICAgaW50Y18wIC8vIDAKICAgIHB1c2hieXRlcyAiIgogICAgZHVwbiA1CiAgICAvLyBzbWFydF9jb250cmFjdHMvYWFybmFfcmVnaXN0cnkvY29udHJhY3QucHk6MTE3NgogICAgLy8gQGFyYzQuYWJpbWV0aG9kCiAgICB0eG5hIEFwcGxpY2F0aW9uQXJncyAxCiAgICBkdXBuIDIKICAgIGludGNfMCAvLyAwCiAgICBleHRyYWN0X3VpbnQxNiAvLyBvbiBlcnJvcjogaW52YWxpZCBhcnJheSBsZW5ndGggaGVhZGVyCiAgICBkdXAKICAgIGNvdmVyIDIKICAgIGludGNfMiAvLyA4CiAgICAqCiAgICBpbnRjXzMgLy8gMgogICAgKwogICAgc3dhcAogICAgbGVuCiAgICA9PQogICAgYXNzZXJ0IC8vIGludmFsaWQgbnVtYmVyIG9mIGJ5dGVzIGZvciBhcmM0LmR5bmFtaWNfYXJyYXk8YXJjNC51aW50NjQ+CiAgICB0eG5hIEFwcGxpY2F0aW9uQXJncyAyCiAgICBkdXAKICAgIGxlbgogICAgaW50Y18yIC8vIDgKICAgID09CiAgICBhc3NlcnQgLy8gaW52YWxpZCBudW1iZXIgb2YgYnl0ZXMgZm9yIGFyYzQudWludDY0CiAgICB0eG5hIEFwcGxpY2F0aW9uQXJncyAzCiAgICBkdXAKICAgIGxlbgogICAgaW50Y18yIC8vIDgKICAgID09CiAgICBhc3NlcnQgLy8gaW52YWxpZCBudW1iZXIgb2YgYnl0ZXMgZm9yIGFyYzQudWludDY0CiAgICB0eG4gR3JvdXBJbmRleAogICAgaW50Y18xIC8vIDEKICAgIC0KICAgIGR1cAogICAgZ3R4bnMgVHlwZUVudW0KICAgIGludGNfMSAvLyBwYXkKICAgID09CiAgICBhc3NlcnQgLy8gdHJhbnNhY3Rpb24gdHlwZSBpcyBwYXkKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hYXJuYV9yZWdpc3RyeS9jb250cmFjdC5weToxMTk0CiAgICAvLyBhc3NlcnQgc2VsZi5hYXJuYV9hc3NldCwgIm5vIEFBUk5BIHRva2VuIgogICAgaW50Y18wIC8vIDAKICAgIGJ5dGVjXzEgLy8gImFhcm5hX2Fzc2V0IgogICAgYXBwX2dsb2JhbF9nZXRfZXgKICAgIGFzc2VydCAvLyBjaGVjayBzZWxmLmFhcm5hX2Fzc2V0IGV4aXN0cwogICAgYXNzZXJ0IC8vIG5vIEFBUk5BIHRva2VuCiAgICAvLyBzbWFydF9jb250cmFjdHMvYWFybmFfcmVnaXN0cnkvY29udHJhY3QucHk6MTE5NQogICAgLy8gcGFpZCA9IHNlbGYuX2NhbGxlcl9wYXltZW50KHBheW1lbnQpCiAgICBjYWxsc3ViIF9jYWxsZXJfcGF5bWVudAogICAgY292ZXIgNAogICAgLy8gc21hcnRfY29udHJhY3RzL2Fhcm5hX3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjExOTYKICAgIC8vIGZpbGxlZCA9IFVJbnQ2NCgwKQogICAgaW50Y18wIC8vIDAKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hYXJuYV9yZWdpc3RyeS9jb250cmFjdC5weToxMTk3LTExOTgKICAgIC8vIHNwZW50ID0gVUludDY0KDApCiAgICAvLyBmaWxscyA9IFVJbnQ2NCgwKQogICAgZHVwbiAzCgpzd2VlcF9saXN0aW5nc19mb3JfaGVhZGVyQDI6CiAgICAvLyBzbWFydF9jb250cmFjdHMvYWFybmFfcmVnaXN0cnkvY29udHJhY3QucHk6MTE5OQogICAgLy8gZm9yIGl0ZW0gaW4gbGlzdGluZ19pZHM6CiAgICBkdXAKICAgIGRpZyA3CiAgICA8CiAgICBieiBzd2VlcF9saXN0aW5nc19hZnRlcl9mb3JAMTgKICAgIGRpZyA3CiAgICBleHRyYWN0IDIgMAogICAgZGlnIDEKICAgIGludGNfMiAvLyA4CiAgICAqCiAgICAvLyBzbWFydF9jb250cmFjdHMvYWFybmFfcmVnaXN0cnkvY29udHJhY3QucHk6MTIwMAogICAgLy8gbGlkID0gaXRlbS5uYXRpdmUKICAgIGV4dHJhY3RfdWludDY0CiAgICBidXJ5IDE0CiAgICAvLyBzbWFydF9jb250cmFjdHMvYWFybmFfcmVnaXN0cnkvY29udHJhY3QucHk6MTIwMQogICAgLy8gaWYgZmlsbGVkID09IG1heF9xdWFudGl0eS5uYXRpdmU6CiAgICBkaWcgNQogICAgYnRvaQogICAgZHVwCiAgICBidXJ5IDEyCiAgICBkaWcgNAogICAgPT0KICAgIGJueiBzd2VlcF9saXN0aW5nc19hZnRlcl9mb3JAMTgKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hYXJuYV9yZWdpc3RyeS9jb250cmFjdC5weToxMjAzCiAgICAvLyByZWNvcmQgPSBzZWxmLmxpc3RpbmdzLmdldChsaWQsIGRlZmF1bHQ9c2VsZi5fZW1wdHlfbGlzdGluZygpKS5jb3B5KCkKICAgIGRpZyAxMwogICAgaXRvYgogICAgYnl0ZWMgNSAvLyAweDZjCiAgICBzd2FwCiAgICBjb25jYXQKICAgIGJveF9nZXQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hYXJuYV9yZWdpc3RyeS9jb250cmFjdC5weTo3NTgtNzYzCiAgICAvLyByZXR1cm4gTGlzdGluZ1JlY29yZCgKICAgIC8vICAgICBzZWxsZXI9YXJjNC5BZGRyZXNzKCksCiAgICAvLyAgICAgYW1vdW50PWFyYzQuVUludDY0KDApLAogICAgLy8gICAgIHByaWNlPWFyYzQuVUludDY0KDApLAogICAgLy8gICAgIGFjdGl2ZT1hcmM0LlVJbnQ2NCgwKSwKICAgIC8vICkKICAgIGJ5dGVjIDE3IC8vIGJhc2UzMihBQUFBQUFBQUFBQUFBQUFBQUFBQUFBQUFBQUFBQUFBQUFBQUFBQUFBQUFBQUFBQUFBQUFBQUFBQUFBQUFBQUFBQUFBQUFBQUFBQUFBQUFBQUFBQUFBQUFBQUEpCiAgICAvLyBzbWFydF9jb250cmFjdHMvYWFybmFfcmVnaXN0cnkvY29udHJhY3QucHk6MTIwMwogICAgLy8gcmVjb3JkID0gc2VsZi5saXN0aW5ncy5nZXQobGlkLCBkZWZhdWx0PXNlbGYuX2VtcHR5X2xpc3RpbmcoKSkuY29weSgpCiAgICBjb3ZlciAyCiAgICBzZWxlY3QKICAgIGR1cAogICAgYnVyeSAxNwogICAgLy8gc21hcnRfY29udHJhY3RzL2Fhcm5hX3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjEyMDQKICAgIC8vIGlmIG5vdCByZWNvcmQuYWN0aXZlLm5hdGl2ZToKICAgIHB1c2hpbnQgNDgKICAgIGV4dHJhY3RfdWludDY0CiAgICBieiBzd2VlcF9saXN0aW5nc19mb3JfZm9vdGVyQDE3CiAgICAvLyBzbWFydF9jb250cmFjdHMvYWFybmFfcmVnaXN0cnkvY29udHJhY3QucHk6MTIwNgogICAgLy8gdGFrZSA9IHJlY29yZC5hbW91bnQubmF0aXZlCiAgICBkaWcgMTUKICAgIHB1c2hpbnQgMzIKICAgIGV4dHJhY3RfdWludDY0CiAgICBkdXAKICAgIGJ1cnkgMTQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hYXJuYV9yZWdpc3RyeS9jb250cmFjdC5weToxMjA3CiAgICAvLyBpZiB0YWtlID4gbWF4X3F1YW50aXR5Lm5hdGl2ZSAtIGZpbGxlZDoKICAgIGRpZyAxMQogICAgZGlnIDUKICAgIC0KICAgIGR1cAogICAgYnVyeSAxNAogICAgPgogICAgYnogc3dlZXBfbGlzdGluZ3NfYWZ0ZXJfaWZfZWxzZUA5CiAgICBkaWcgMTEKICAgIGJ1cnkgMTMKCnN3ZWVwX2xpc3RpbmdzX2FmdGVyX2lmX2Vsc2VAOToKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hYXJuYV9yZWdpc3RyeS9jb250cmFjdC5weToxMjA5CiAgICAvLyBhZmZvcmRhYmxlID0gKG1heF90b3RhbF9wcmljZS5uYXRpdmUgLSBzcGVudCkgLy8gcmVjb3JkLnByaWNlLm5hdGl2ZQogICAgZGlnIDQKICAgIGJ0b2kKICAgIGRpZyAyCiAgICAtCiAgICBkaWcgMTYKICAgIHB1c2hpbnQgNDAKICAgIGV4dHJhY3RfdWludDY0CiAgICAvCiAgICBkdXAKICAgIGJ1cnkgMTYKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hYXJuYV9yZWdpc3RyeS9jb250cmFjdC5weToxMjEwCiAgICAvLyBpZiB0YWtlID4gYWZmb3JkYWJsZToKICAgIGRpZyAxMwogICAgPAogICAgYnogc3dlZXBfbGlzdGluZ3NfYWZ0ZXJfaWZfZWxzZUAxMQogICAgZGlnIDE0CiAgICBidXJ5IDEzCgpzd2VlcF9saXN0aW5nc19hZnRlcl9pZl9lbHNlQDExOgogICAgLy8gc21hcnRfY29udHJhY3RzL2Fhcm5hX3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjEyMTIKICAgIC8vIGlmIHRha2UgPT0gMDoKICAgIGRpZyAxMgogICAgYnogc3dlZXBfbGlzdGluZ3NfZm9yX2Zvb3RlckAxNwogICAgLy8gc21hcnRfY29udHJhY3RzL2Fhcm5hX3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjEyMTQKICAgIC8vIGFzc2VydCBmaWxscyA8IE1BWF9TV0VFUF9GSUxMUywgInRvbyBtYW55IGZpbGxzIGZvciBvbmUgc3dlZXAiCiAgICBkaWcgMgogICAgZHVwCiAgICBwdXNoaW50IDE0CiAgICA8CiAgICBhc3NlcnQgLy8gdG9vIG1hbnkgZmlsbHMgZm9yIG9uZSBzd2VlcAogICAgLy8gc21hcnRfY29udHJhY3RzL2Fhcm5hX3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjEyMTYKICAgIC8vIHNlbGxlciwgY29zdCwgb3dlZCA9IHNlbGYuX3Rha2VfZnJvbV9saXN0aW5nKGxpZCwgdGFrZSkKICAgIGRpZyAxNAogICAgZGlnIDE0CiAgICBjYWxsc3ViIF90YWtlX2Zyb21fbGlzdGluZwogICAgY292ZXIgNgogICAgY292ZXIgOAogICAgc3dhcAogICAgLy8gc21hcnRfY29udHJhY3RzL2Fhcm5hX3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjEyMTcKICAgIC8vIGlmIGZpbGxzID09IDA6CiAgICBibnogc3dlZXBfbGlzdGluZ3NfZWxzZV9ib2R5QDE1CiAgICAvLyBzbWFydF9jb250cmFjdHMvYWFybmFfcmVnaXN0cnkvY29udHJhY3QucHk6MTIxOAogICAgLy8gb3AuSVR4bkNyZWF0ZS5iZWdpbigpCiAgICBpdHhuX2JlZ2luCgpzd2VlcF9saXN0aW5nc19hZnRlcl9pZl9lbHNlQDE2OgogICAgLy8gc21hcnRfY29udHJhY3RzL2Fhcm5hX3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjEyMjEKICAgIC8vIG9wLklUeG5DcmVhdGUuc2V0X3R5cGVfZW51bShUcmFuc2FjdGlvblR5cGUuUGF5bWVudCkKICAgIGludGNfMSAvLyBwYXkKICAgIGl0eG5fZmllbGQgVHlwZUVudW0KICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hYXJuYV9yZWdpc3RyeS9jb250cmFjdC5weToxMjIyCiAgICAvLyBvcC5JVHhuQ3JlYXRlLnNldF9yZWNlaXZlcihzZWxsZXIpCiAgICBpdHhuX2ZpZWxkIFJlY2VpdmVyCiAgICAvLyBzbWFydF9jb250cmFjdHMvYWFybmFfcmVnaXN0cnkvY29udHJhY3QucHk6MTIyMwogICAgLy8gb3AuSVR4bkNyZWF0ZS5zZXRfYW1vdW50KG93ZWQpCiAgICB1bmNvdmVyIDMKICAgIGl0eG5fZmllbGQgQW1vdW50CiAgICAvLyBzbWFydF9jb250cmFjdHMvYWFybmFfcmVnaXN0cnkvY29udHJhY3QucHk6MTIyNAogICAgLy8gb3AuSVR4bkNyZWF0ZS5zZXRfZmVlKDApCiAgICBpbnRjXzAgLy8gMAogICAgaXR4bl9maWVsZCBGZWUKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hYXJuYV9yZWdpc3RyeS9jb250cmFjdC5weToxMjI1CiAgICAvLyBmaWxsZWQgKz0gdGFrZQogICAgdW5jb3ZlciAzCiAgICBkaWcgMTMKICAgICsKICAgIGNvdmVyIDMKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hYXJuYV9yZWdpc3RyeS9jb250cmFjdC5weToxMjI2CiAgICAvLyBzcGVudCArPSBjb3N0CiAgICBzd2FwCiAgICB1bmNvdmVyIDUKICAgICsKICAgIHN3YXAKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hYXJuYV9yZWdpc3RyeS9jb250cmFjdC5weToxMjI3CiAgICAvLyBmaWxscyArPSAxCiAgICB1bmNvdmVyIDIKICAgIGludGNfMSAvLyAxCiAgICArCiAgICBjb3ZlciAyCgpzd2VlcF9saXN0aW5nc19mb3JfZm9vdGVyQDE3OgogICAgaW50Y18xIC8vIDEKICAgICsKICAgIGIgc3dlZXBfbGlzdGluZ3NfZm9yX2hlYWRlckAyCgpzd2VlcF9saXN0aW5nc19lbHNlX2JvZHlAMTU6CiAgICAvLyBzbWFydF9jb250cmFjdHMvYWFybmFfcmVnaXN0cnkvY29udHJhY3QucHk6MTIyMAogICAgLy8gb3AuSVR4bkNyZWF0ZS5uZXh0KCkKICAgIGl0eG5fbmV4dAogICAgYiBzd2VlcF9saXN0aW5nc19hZnRlcl9pZl9lbHNlQDE2Cgpzd2VlcF9saXN0aW5nc19hZnRlcl9mb3JAMTg6CiAgICBwb3AKICAgIHVuY292ZXIgMwogICAgcG9wCiAgICB1bmNvdmVyIDMKICAgIHBvcAogICAgdW5jb3ZlciAzCiAgICBwb3AKICAgIHVuY292ZXIgMwogICAgcG9wCiAgICAvLyBzbWFydF9jb250cmFjdHMvYWFybmFfcmVnaXN0cnkvY29udHJhY3QucHk6MTIyOAogICAgLy8gYXNzZXJ0IHNwZW50IDw9IHBhaWQsICJpbnN1ZmZpY2llbnQgcGF5bWVudCIKICAgIGR1cAogICAgZGlnIDQKICAgIDw9CiAgICBhc3NlcnQgLy8gaW5zdWZmaWNpZW50IHBheW1lbnQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hYXJuYV9yZWdpc3RyeS9jb250cmFjdC5weToxMjMwCiAgICAvLyBpZiBmaWxsczoKICAgIGRpZyAxCiAgICBieiBzd2VlcF9saXN0aW5nc19hZnRlcl9pZl9lbHNlQDIwCiAgICAvLyBzbWFydF9jb250cmFjdHMvYWFybmFfcmVnaXN0cnkvY29udHJhY3QucHk6MTIzMQogICAgLy8gb3AuSVR4bkNyZWF0ZS5uZXh0KCkKICAgIGl0eG5fbmV4dAogICAgLy8gc21hcnRfY29udHJhY3RzL2Fhcm5hX3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjEyMzIKICAgIC8vIG9wLklUeG5DcmVhdGUuc2V0X3R5cGVfZW51bShUcmFuc2FjdGlvblR5cGUuQXNzZXRUcmFuc2ZlcikKICAgIHB1c2hpbnQgNCAvLyBheGZlcgogICAgaXR4bl9maWVsZCBUeXBlRW51bQogICAgLy8gc21hcnRfY29udHJhY3RzL2Fhcm5hX3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjEyMzMKICAgIC8vIG9wLklUeG5DcmVhdGUuc2V0X3hmZXJfYXNzZXQoc2VsZi5hYXJuYV9hc3NldCkKICAgIGludGNfMCAvLyAwCiAgICBieXRlY18xIC8vICJhYXJuYV9hc3NldCIKICAgIGFwcF9nbG9iYWxfZ2V0X2V4CiAgICBhc3NlcnQgLy8gY2hlY2sgc2VsZi5hYXJuYV9hc3NldCBleGlzdHMKICAgIGl0eG5fZmllbGQgWGZlckFzc2V0CiAgICAvLyBzbWFydF9jb250cmFjdHMvYWFybmFfcmVnaXN0cnkvY29udHJhY3QucHk6MTIzNAogICAgLy8gb3AuSVR4bkNyZWF0ZS5zZXRfYXNzZXRfcmVjZWl2ZXIoVHhuLnNlbmRlcikKICAgIHR4biBTZW5kZXIKICAgIGl0eG5fZmllbGQgQXNzZXRSZWNlaXZlcgogICAgLy8gc21hcnRfY29udHJhY3RzL2Fhcm5hX3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjEyMzUKICAgIC8vIG9wLklUeG5DcmVhdGUuc2V0X2Fzc2V0X2Ftb3VudChmaWxsZWQpCiAgICBkaWcgMgogICAgaXR4bl9maWVsZCBBc3NldEFtb3VudAogICAgLy8gc21hcnRfY29udHJhY3RzL2Fhcm5hX3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjEyMzYKICAgIC8vIG9wLklUeG5DcmVhdGUuc2V0X2ZlZSgwKQogICAgaW50Y18wIC8vIDAKICAgIGl0eG5fZmllbGQgRmVlCgpzd2VlcF9saXN0aW5nc19hZnRlcl9pZl9lbHNlQDIwOgogICAgLy8gc21hcnRfY29udHJhY3RzL2Fhcm5hX3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjEyMzcKICAgIC8vIGlmIHNwZW50IDwgcGFpZDoKICAgIGR1cAogICAgZGlnIDQKICAgIDwKICAgIGR1cAogICAgYnVyeSA2CiAgICBieiBzd2VlcF9saXN0aW5nc19hZnRlcl9pZl9lbHNlQDI1CiAgICAvLyBzbWFydF9jb250cmFjdHMvYWFybmFfcmVnaXN0cnkvY29udHJhY3QucHk6MTIzOAogICAgLy8gaWYgZmlsbHM6CiAgICBkaWcgMQogICAgYnogc3dlZXBfbGlzdGluZ3NfZWxzZV9ib2R5QDIzCiAgICAvLyBzbWFydF9jb250cmFjdHMvYWFybmFfcmVnaXN0cnkvY29udHJhY3QucHk6MTIzOQogICAgLy8gb3AuSVR4bkNyZWF0ZS5uZXh0KCkKICAgIGl0eG5fbmV4dAoKc3dlZXBfbGlzdGluZ3NfYWZ0ZXJfaWZfZWxzZUAyNDoKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hYXJuYV9yZWdpc3RyeS9jb250cmFjdC5weToxMjQyCiAgICAvLyBvcC5JVHhuQ3JlYXRlLnNldF90eXBlX2VudW0oVHJhbnNhY3Rpb25UeXBlLlBheW1lbnQpCiAgICBpbnRjXzEgLy8gcGF5CiAgICBpdHhuX2ZpZWxkIFR5cGVFbnVtCiAgICAvLyBzbWFydF9jb250cmFjdHMvYWFybmFfcmVnaXN0cnkvY29udHJhY3QucHk6MTI0MwogICAgLy8gb3AuSVR4bkNyZWF0ZS5zZXRfcmVjZWl2ZXIoVHhuLnNlbmRlcikKICAgIHR4biBTZW5kZXIKICAgIGl0eG5fZmllbGQgUmVjZWl2ZXIKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hYXJuYV9yZWdpc3RyeS9jb250cmFjdC5weToxMjQ0CiAgICAvLyBvcC5JVHhuQ3JlYXRlLnNldF9hbW91bnQocGFpZCAtIHNwZW50KQogICAgZGlnIDMKICAgIGRpZyAxCiAgICAtCiAgICBpdHhuX2ZpZWxkIEFtb3VudAogICAgLy8gc21hcnRfY29udHJhY3RzL2Fhcm5hX3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjEyNDUKICAgIC8vIG9wLklUeG5DcmVhdGUuc2V0X2ZlZSgwKQogICAgaW50Y18wIC8vIDAKICAgIGl0eG5fZmllbGQgRmVlCgpzd2VlcF9saXN0aW5nc19hZnRlcl9pZl9lbHNlQDI1OgogICAgLy8gc21hcnRfY29udHJhY3RzL2Fhcm5hX3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjEyNDYKICAgIC8vIGlmIGZpbGxzIG9yIHNwZW50IDwgcGFpZDoKICAgIHN3YXAKICAgIGJueiBzd2VlcF9saXN0aW5nc19pZl9ib2R5QDI3CiAgICBkaWcgMwogICAgYnogc3dlZXBfbGlzdGluZ3NfYWZ0ZXJfaWZfZWxzZUAyOAoKc3dlZXBfbGlzdGluZ3NfaWZfYm9keUAyNzoKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hYXJuYV9yZWdpc3RyeS9jb250cmFjdC5weToxMjQ3CiAgICAvLyBvcC5JVHhuQ3JlYXRlLnN1Ym1pdCgpCiAgICBpdHhuX3N1Ym1pdAoKc3dlZXBfbGlzdGluZ3NfYWZ0ZXJfaWZfZWxzZUAyODoKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hYXJuYV9yZWdpc3RyeS9jb250cmFjdC5weToxMjQ4CiAgICAvLyByZXR1cm4gU3dlZXBSZXN1bHQoZmlsbGVkPWFyYzQuVUludDY0KGZpbGxlZCksIHNwZW50PWFyYzQuVUludDY0KHNwZW50KSkKICAgIHN3YXAKICAgIGl0b2IKICAgIHN3YXAKICAgIGl0b2IKICAgIGNvbmNhdAogICAgLy8gc21hcnRfY29udHJhY3RzL2Fhcm5hX3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjExNzYKICAgIC8vIEBhcmM0LmFiaW1ldGhvZAogICAgYnl0ZWNfMCAvLyAweDE1MWY3Yzc1CiAgICBzd2FwCiAgICBjb25jYXQKICAgIGxvZwogICAgaW50Y18xIC8vIDEKICAgIHJldHVybgoKc3dlZXBfbGlzdGluZ3NfZWxzZV9ib2R5QDIzOgogICAgLy8gc21hcnRfY29udHJhY3RzL2Fhcm5hX3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjEyNDEKICAgIC8vIG9wLklUeG5DcmVhdGUuYmVnaW4oKQogICAgaXR4bl9iZWdpbgogICAgYiBzd2VlcF9saXN0aW5nc19hZnRlcl9pZl9lbHNlQDI0CgoKLy8gc21hcnRfY29udHJhY3RzLmFhcm5hX3JlZ2lzdHJ5LmNvbnRyYWN0LkFhcm5hUmVnaXN0cnkuY2FuY2VsX2xpc3Rpbmdbcm91dGluZ10oKSAtPiB2b2lkOgpjYW5jZWxfbGlzdGluZzoKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hYXJuYV9yZWdpc3RyeS9jb250cmFjdC5weToxMjUwCiAgICAvLyBAYXJjNC5hYmltZXRob2QKICAgIHR4bmEgQXBwbGljYXRpb25BcmdzIDEKICAgIGR1cAogICAgbGVuCiAgICBpbnRjXzIgLy8gOAogICAgPT0KICAgIGFzc2VydCAvLyBpbnZhbGlkIG51bWJlciBvZiBieXRlcyBmb3IgYXJjNC51aW50NjQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hYXJuYV9yZWdpc3RyeS9jb250cmFjdC5weToxMjUzCiAgICAvLyBsaWQgPSBsaXN0aW5nX2lkLm5hdGl2ZQogICAgZHVwCiAgICBidG9pCiAgICAvLyBzbWFydF9jb250cmFjdHMvYWFybmFfcmVnaXN0cnkvY29udHJhY3QucHk6MTI1NAogICAgLy8gYXNzZXJ0IGxpZCA8IHNlbGYubGlzdGluZ19jb3VudCwgImludmFsaWQgbGlzdGluZyBpZCIKICAgIGludGNfMCAvLyAwCiAgICBieXRlYyA3IC8vICJsaXN0aW5nX2NvdW50IgogICAgYXBwX2dsb2JhbF9nZXRfZXgKICAgIGFzc2VydCAvLyBjaGVjayBzZWxmLmxpc3RpbmdfY291bnQgZXhpc3RzCiAgICBkaWcgMQogICAgPgogICAgYXNzZXJ0IC8vIGludmFsaWQgbGlzdGluZyBpZAogICAgLy8gc21hcnRfY29udHJhY3RzL2Fhcm5hX3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjEyNTUKICAgIC8vIHJlY29yZCA9IHNlbGYubGlzdGluZ3MuZ2V0KGxpZCwgZGVmYXVsdD1zZWxmLl9lbXB0eV9saXN0aW5nKCkpLmNvcHkoKQogICAgZHVwCiAgICBpdG9iCiAgICBieXRlYyA1IC8vIDB4NmMKICAgIHN3YXAKICAgIGNvbmNhdAogICAgYm94X2dldAogICAgLy8gc21hcnRfY29udHJhY3RzL2Fhcm5hX3JlZ2lzdHJ5L2NvbnRyYWN0LnB5Ojc1OC03NjMKICAgIC8vIHJldHVybiBMaXN0aW5nUmVjb3JkKAogICAgLy8gICAgIHNlbGxlcj1hcmM0LkFkZHJlc3MoKSwKICAgIC8vICAgICBhbW91bnQ9YXJjNC5VSW50NjQoMCksCiAgICAvLyAgICAgcHJpY2U9YXJjNC5VSW50NjQoMCksCiAgICAvLyAgICAgYWN0aXZlPWFyYzQuVUludDY0KDApLAogICAgLy8gKQogICAgYnl0ZWMgMTcgLy8gYmFzZTMyKEFBQUFBQUFBQUFBQUFBQUFBQUFBQUFBQUFBQUFBQUFBQUFBQUFBQUFBQUFBQUFBQUFBQUFBQUFBQUFBQUFBQUFBQUFBQUFBQUFBQUFBQUFBQUFBQUFBQUFBQSkKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hYXJuYV9yZWdpc3RyeS9jb250cmFjdC5weToxMjU1CiAgICAvLyByZWNvcmQgPSBzZWxmLmxpc3RpbmdzLmdldChsaWQsIGRlZmF1bHQ9c2VsZi5fZW1wdHlfbGlzdGluZygpKS5jb3B5KCkKICAgIGNvdmVyIDIKICAgIHNlbGVjdAogICAgLy8gc21hcnRfY29udHJhY3RzL2Fhcm5hX3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjEyNTYKICAgIC8vIGFzc2VydCByZWNvcmQuYWN0aXZlLm5hdGl2ZSwgImxpc3Rpbmcgbm90IGFjdGl2ZSIKICAgIGR1cAogICAgcHVzaGludCA0OAogICAgZXh0cmFjdF91aW50NjQKICAgIGFzc2VydCAvLyBsaXN0aW5nIG5vdCBhY3RpdmUKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hYXJuYV9yZWdpc3RyeS9jb250cmFjdC5weToxMjU3CiAgICAvLyBhc3NlcnQgVHhuLnNlbmRlciA9PSByZWNvcmQuc2VsbGVyLm5hdGl2ZSwgIm9ubHkgc2VsbGVyIGNhbiBjYW5jZWwiCiAgICB0eG4gU2VuZGVyCiAgICBkaWcgMQogICAgZXh0cmFjdCAwIDMyCiAgICBzd2FwCiAgICBkaWcgMQogICAgPT0KICAgIGFzc2VydCAvLyBvbmx5IHNlbGxlciBjYW4gY2FuY2VsCiAgICAvLyBzbWFydF9jb250cmFjdHMvYWFybmFfcmVnaXN0cnkvY29udHJhY3QucHk6MTI1OAogICAgLy8gc2VsZi5fYm9va19yZW1vdmUobGlkLCByZWNvcmQucHJpY2UubmF0aXZlLCByZWNvcmQuYW1vdW50Lm5hdGl2ZSkKICAgIGRpZyAxCiAgICBwdXNoaW50IDQwCiAgICBleHRyYWN0X3VpbnQ2NAogICAgZGlnIDIKICAgIGV4dHJhY3QgMzIgOAogICAgdW5jb3ZlciAzCiAgICBwdXNoaW50IDMyCiAgICBleHRyYWN0X3VpbnQ2NAogICAgZGlnIDQKICAgIHVuY292ZXIgMwogICAgZGlnIDIKICAgIGNhbGxzdWIgX2Jvb2tfcmVtb3ZlCiAgICAvLyBzbWFydF9jb250cmFjdHMvYWFybmFfcmVnaXN0cnkvY29udHJhY3QucHk6MTI1OQogICAgLy8gc2VsZi5lc2Nyb3dlZF90b2tlbnMgLT0gcmVjb3JkLmFtb3VudC5uYXRpdmUKICAgIGludGNfMCAvLyAwCiAgICBieXRlYyA5IC8vICJlc2Nyb3dlZF90b2tlbnMiCiAgICBhcHBfZ2xvYmFsX2dldF9leAogICAgYXNzZXJ0IC8vIGNoZWNrIHNlbGYuZXNjcm93ZWRfdG9rZW5zIGV4aXN0cwogICAgZGlnIDEKICAgIC0KICAgIGJ5dGVjIDkgLy8gImVzY3Jvd2VkX3Rva2VucyIKICAgIHN3YXAKICAgIGFwcF9nbG9iYWxfcHV0CiAgICAvLyBzbWFydF9jb250cmFjdHMvYWFybmFfcmVnaXN0cnkvY29udHJhY3QucHk6MTI2MS0xMjY1CiAgICAvLyBDYW5jZWxsZWQoCiAgICAvLyAgICAgbGlzdGluZ19pZD1hcmM0LlVJbnQ2NChsaWQpLAogICAgLy8gICAgIHNlbGxlcj1yZWNvcmQuc2VsbGVyLmNvcHkoKSwKICAgIC8vICAgICBhbW91bnQ9cmVjb3JkLmFtb3VudCwKICAgIC8vICkKICAgIHVuY292ZXIgNAogICAgZGlnIDMKICAgIGNvbmNhdAogICAgdW5jb3ZlciAyCiAgICBjb25jYXQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hYXJuYV9yZWdpc3RyeS9jb250cmFjdC5weToxMjYwLTEyNjYKICAgIC8vIGFyYzQuZW1pdCgKICAgIC8vICAgICBDYW5jZWxsZWQoCiAgICAvLyAgICAgICAgIGxpc3RpbmdfaWQ9YXJjNC5VSW50NjQobGlkKSwKICAgIC8vICAgICAgICAgc2VsbGVyPXJlY29yZC5zZWxsZXIuY29weSgpLAogICAgLy8gICAgICAgICBhbW91bnQ9cmVjb3JkLmFtb3VudCwKICAgIC8vICAgICApCiAgICAvLyApCiAgICBwdXNoYnl0ZXMgMHhhYTFkNGNkOSAvLyBtZXRob2QgIkNhbmNlbGxlZCh1aW50NjQsYWRkcmVzcyx1aW50NjQpIgogICAgc3dhcAogICAgY29uY2F0CiAgICBsb2cKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hYXJuYV9yZWdpc3RyeS9jb250cmFjdC5weToxMjY4LTEyNzUKICAgIC8vIGl0eG4uc3VibWl0X3R4bnMoCiAgICAvLyAgICAgaXR4bi5Bc3NldFRyYW5zZmVyKAogICAgLy8gICAgICAgICB4ZmVyX2Fzc2V0PUFzc2V0KHNlbGYuYWFybmFfYXNzZXQpLAogICAgLy8gICAgICAgICBhc3NldF9yZWNlaXZlcj1yZWNvcmQuc2VsbGVyLm5hdGl2ZSwKICAgIC8vICAgICAgICAgYXNzZXRfYW1vdW50PXJlY29yZC5hbW91bnQubmF0aXZlLAogICAgLy8gICAgICksCiAgICAvLyAgICAgaXR4bi5QYXltZW50KHJlY2VpdmVyPXJlY29yZC5zZWxsZXIubmF0aXZlLCBhbW91bnQ9TElTVElOR19SRUZVTkQpLAogICAgLy8gKQogICAgaXR4bl9iZWdpbgogICAgLy8gc21hcnRfY29udHJhY3RzL2Fhcm5hX3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjEyNzAKICAgIC8vIHhmZXJfYXNzZXQ9QXNzZXQoc2VsZi5hYXJuYV9hc3NldCksCiAgICBpbnRjXzAgLy8gMAogICAgYnl0ZWNfMSAvLyAiYWFybmFfYXNzZXQiCiAgICBhcHBfZ2xvYmFsX2dldF9leAogICAgYXNzZXJ0IC8vIGNoZWNrIHNlbGYuYWFybmFfYXNzZXQgZXhpc3RzCiAgICBzd2FwCiAgICBpdHhuX2ZpZWxkIEFzc2V0QW1vdW50CiAgICBkaWcgMQogICAgaXR4bl9maWVsZCBBc3NldFJlY2VpdmVyCiAgICBpdHhuX2ZpZWxkIFhmZXJBc3NldAogICAgLy8gc21hcnRfY29udHJhY3RzL2Fhcm5hX3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjEyNjkKICAgIC8vIGl0eG4uQXNzZXRUcmFuc2ZlcigKICAgIHB1c2hpbnQgNCAvLyBheGZlcgogICAgaXR4bl9maWVsZCBUeXBlRW51bQogICAgaW50Y18wIC8vIDAKICAgIGl0eG5fZmllbGQgRmVlCiAgICAvLyBzbWFydF9jb250cmFjdHMvYWFybmFfcmVnaXN0cnkvY29udHJhY3QucHk6MTI3NAogICAgLy8gaXR4bi5QYXltZW50KHJlY2VpdmVyPXJlY29yZC5zZWxsZXIubmF0aXZlLCBhbW91bnQ9TElTVElOR19SRUZVTkQpLAogICAgaXR4bl9uZXh0CiAgICBpbnRjIDYgLy8gOTgwMDAKICAgIGl0eG5fZmllbGQgQW1vdW50CiAgICBkdXAKICAgIGl0eG5fZmllbGQgUmVjZWl2ZXIKICAgIGludGNfMSAvLyBwYXkKICAgIGl0eG5fZmllbGQgVHlwZUVudW0KICAgIGludGNfMCAvLyAwCiAgICBpdHhuX2ZpZWxkIEZlZQogICAgLy8gc21hcnRfY29udHJhY3RzL2Fhcm5hX3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjEyNjgtMTI3NQogICAgLy8gaXR4bi5zdWJtaXRfdHhucygKICAgIC8vICAgICBpdHhuLkFzc2V0VHJhbnNmZXIoCiAgICAvLyAgICAgICAgIHhmZXJfYXNzZXQ9QXNzZXQoc2VsZi5hYXJuYV9hc3NldCksCiAgICAvLyAgICAgICAgIGFzc2V0X3JlY2VpdmVyPXJlY29yZC5zZWxsZXIubmF0aXZlLAogICAgLy8gICAgICAgICBhc3NldF9hbW91bnQ9cmVjb3JkLmFtb3VudC5uYXRpdmUsCiAgICAvLyAgICAgKSwKICAgIC8vICAgICBpdHhuLlBheW1lbnQocmVjZWl2ZXI9cmVjb3JkLnNlbGxlci5uYXRpdmUsIGFtb3VudD1MSVNUSU5HX1JFRlVORCksCiAgICAvLyApCiAgICBpdHhuX3N1Ym1pdAogICAgLy8gc21hcnRfY29udHJhY3RzL2Fhcm5hX3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjEyNzcKICAgIC8vIHNlbGYuX2Nsb3NlX2xpc3RpbmcobGlkLCByZWNvcmQuc2VsbGVyLm5hdGl2ZSkKICAgIGNhbGxzdWIgX2Nsb3NlX2xpc3RpbmcKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hYXJuYV9yZWdpc3RyeS9jb250cmFjdC5weToxMjUwCiAgICAvLyBAYXJjNC5hYmltZXRob2QKICAgIGludGNfMSAvLyAxCiAgICByZXR1cm4KCgovLyBzbWFydF9jb250cmFjdHMuYWFybmFfcmVnaXN0cnkuY29udHJhY3QuQWFybmFSZWdpc3RyeS5nZXRfcHJvamVjdF9jb3VudFtyb3V0aW5nXSgpIC0+IHZvaWQ6CmdldF9wcm9qZWN0X2NvdW50OgogICAgLy8gc21hcnRfY29udHJhY3RzL2Fhcm5hX3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjEyODQKICAgIC8vIHJldHVybiBhcmM0LlVJbnQ2NChzZWxmLnByb2plY3RfY291bnQpCiAgICBpbnRjXzAgLy8gMAogICAgYnl0ZWNfMiAvLyAicHJvamVjdF9jb3VudCIKICAgIGFwcF9nbG9iYWxfZ2V0X2V4CiAgICBhc3NlcnQgLy8gY2hlY2sgc2VsZi5wcm9qZWN0X2NvdW50IGV4aXN0cwogICAgaXRvYgogICAgLy8gc21hcnRfY29udHJhY3RzL2Fhcm5hX3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjEyNzktMTI4MgogICAgLy8gIyDilZDilZDilZDilZDilZDilZDilZDilZDilZDilZDilZDilZDilZDilZDilZDilZDilZDilZDilZDilZDilZDilZDilZDilZDilZDilZDilZDilZDilZDilZDilZDilZDilZDilZDilZDilZDilZDilZDilZDilZDilZDilZDilZDilZDilZDilZDilZDilZDilZDilZDilZDilZDilZDilZDilZDilZDilZDilZDilZDilZDilZDilZDilZDilZDilZDilZDilZDilZDilZDilZAKICAgIC8vICMgUmVhZC1Pbmx5IEdldHRlcnMg4oCUIGZpZWxkIGFjY2VzcyBmcm9tIGFyYzQuU3RydWN0IGNvcHkKICAgIC8vICMg4pWQ4pWQ4pWQ4pWQ4pWQ4pWQ4pWQ4pWQ4pWQ4pWQ4pWQ4pWQ4pWQ4pWQ4pWQ4pWQ4pWQ4pWQ4pWQ4pWQ4pWQ4pWQ4pWQ4pWQ4pWQ4pWQ4pWQ4pWQ4pWQ4pWQ4pWQ4pWQ4pWQ4pWQ4pWQ4pWQ4pWQ4pWQ4pWQ4pWQ4pWQ4pWQ4pWQ4pWQ4pWQ4pWQ4pWQ4pWQ4pWQ4pWQ4pWQ4pWQ4pWQ4pWQ4pWQ4pWQ4pWQ4pWQ4pWQ4pWQ4pWQ4pWQ4pWQ4pWQ4pWQ4pWQ4pWQ4pWQ4pWQ4pWQCiAgICAvLyBAYXJjNC5hYmltZXRob2QocmVhZG9ubHk9VHJ1ZSkKICAgIGJ5dGVjXzAgLy8gMHgxNTFmN2M3NQogICAgc3dhcAogICAgY29uY2F0CiAgICBsb2cKICAgIGludGNfMSAvLyAxCiAgICByZXR1cm4KCgovLyBzbWFydF9jb250cmFjdHMuYWFybmFfcmVnaXN0cnkuY29udHJhY3QuQWFybmFSZWdpc3RyeS5nZXRfYXNzZXRfaWRbcm91dGluZ10oKSAtPiB2b2lkOgpnZXRfYXNzZXRfaWQ6CiAgICAvLyBzbWFydF9jb250cmFjdHMvYWFybmFfcmVnaXN0cnkvY29udHJhY3QucHk6MTI4OAogICAgLy8gcmV0dXJuIGFyYzQuVUludDY0KHNlbGYuYWFybmFfYXNzZXQpCiAgICBpbnRjXzAgLy8gMAogICAgYnl0ZWNfMSAvLyAiYWFybmFfYXNzZXQiCiAgICBhcHBfZ2xvYmFsX2dldF9leAogICAgYXNzZXJ0IC8vIGNoZWNrIHNlbGYuYWFybmFfYXNzZXQgZXhpc3RzCiAgICBpdG9iCiAgICAvLyBzbWFydF9jb250cmFjdHMvYWFybmFfcmVnaXN0cnkvY29udHJhY3QucHk6MTI4NgogICAgLy8gQGFyYzQuYWJpbWV0aG9kKHJlYWRvbmx5PVRydWUpCiAgICBieXRlY18wIC8vIDB4MTUxZjdjNzUKICAgIHN3YXAKICAgIGNvbmNhdAogICAgbG9nCiAgICBpbnRjXzEgLy8gMQogICAgcmV0dXJuCgoKLy8gc21hcnRfY29udHJhY3RzLmFhcm5hX3JlZ2lzdHJ5LmNvbnRyYWN0LkFhcm5hUmVnaXN0cnkuZ2V0X2FkbWluW3JvdXRpbmddKCkgLT4gdm9pZDoKZ2V0X2FkbWluOgogICAgLy8gc21hcnRfY29udHJhY3RzL2Fhcm5hX3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjEyOTIKICAgIC8vIHJldHVybiBzZWxmLmFkbWluLmNvcHkoKQogICAgaW50Y18wIC8vIDAKICAgIGJ5dGVjIDE4IC8vICJhZG1pbiIKICAgIGFwcF9nbG9iYWxfZ2V0X2V4CiAgICBhc3NlcnQgLy8gY2hlY2sgc2VsZi5hZG1pbiBleGlzdHMKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hYXJuYV9yZWdpc3RyeS9jb250cmFjdC5weToxMjkwCiAgICAvLyBAYXJjNC5hYmltZXRob2QocmVhZG9ubHk9VHJ1ZSkKICAgIGJ5dGVjXzAgLy8gMHgxNTFmN2M3NQogICAgc3dhcAogICAgY29uY2F0CiAgICBsb2cKICAgIGludGNfMSAvLyAxCiAgICByZXR1cm4KCgovLyBzbWFydF9jb250cmFjdHMuYWFybmFfcmVnaXN0cnkuY29udHJhY3QuQWFybmFSZWdpc3RyeS5nZXRfdmFsaWRhdG9yW3JvdXRpbmddKCkgLT4gdm9pZDoKZ2V0X3ZhbGlkYXRvcjoKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hYXJuYV9yZWdpc3RyeS9jb250cmFjdC5weToxMjk2CiAgICAvLyByZXR1cm4gc2VsZi52YWxpZGF0b3IuY29weSgpCiAgICBpbnRjXzAgLy8gMAogICAgYnl0ZWMgMTkgLy8gInZhbGlkYXRvciIKICAgIGFwcF9nbG9iYWxfZ2V0X2V4CiAgICBhc3NlcnQgLy8gY2hlY2sgc2VsZi52YWxpZGF0b3IgZXhpc3RzCiAgICAvLyBzbWFydF9jb250cmFjdHMvYWFybmFfcmVnaXN0cnkvY29udHJhY3QucHk6MTI5NAogICAgLy8gQGFyYzQuYWJpbWV0aG9kKHJlYWRvbmx5PVRydWUpCiAgICBieXRlY18wIC8vIDB4MTUxZjdjNzUKICAgIHN3YXAKICAgIGNvbmNhdAogICAgbG9nCiAgICBpbnRjXzEgLy8gMQogICAgcmV0dXJuCgoKLy8gc21hcnRfY29udHJhY3RzLmFhcm5hX3JlZ2lzdHJ5LmNvbnRyYWN0LkFhcm5hUmVnaXN0cnkuZ2V0X3RvdGFsX2NyZWRpdHNfaXNzdWVkW3JvdXRpbmddKCkgLT4gdm9pZDoKZ2V0X3RvdGFsX2NyZWRpdHNfaXNzdWVkOgogICAgLy8gc21hcnRfY29udHJhY3RzL2Fhcm5hX3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjEzMDAKICAgIC8vIHJldHVybiBhcmM0LlVJbnQ2NChzZWxmLnRvdGFsX2NyZWRpdHNfaXNzdWVkKQogICAgaW50Y18wIC8vIDAKICAgIGJ5dGVjIDExIC8vICJ0b3RhbF9jcmVkaXRzX2lzc3VlZCIKICAgIGFwcF9nbG9iYWxfZ2V0X2V4CiAgICBhc3NlcnQgLy8gY2hlY2sgc2VsZi50b3RhbF9jcmVkaXRzX2lzc3VlZCBleGlzdHMKICAgIGl0b2IKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hYXJuYV9yZWdpc3RyeS9jb250cmFjdC5weToxMjk4CiAgICAvLyBAYXJjNC5hYmltZXRob2QocmVhZG9ubHk9VHJ1ZSkKICAgIGJ5dGVjXzAgLy8gMHgxNTFmN2M3NQogICAgc3dhcAogICAgY29uY2F0CiAgICBsb2cKICAgIGludGNfMSAvLyAxCiAgICByZXR1cm4KCgovLyBzbWFydF9jb250cmFjdHMuYWFybmFfcmVnaXN0cnkuY29udHJhY3QuQWFybmFSZWdpc3RyeS5nZXRfcHJvamVjdFtyb3V0aW5nXSgpIC0+IHZvaWQ6CmdldF9wcm9qZWN0OgogICAgLy8gc21hcnRfY29udHJhY3RzL2Fhcm5hX3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjEzMDIKICAgIC8vIEBhcmM0LmFiaW1ldGhvZChyZWFkb25seT1UcnVlKQogICAgdHhuYSBBcHBsaWNhdGlvbkFyZ3MgMQogICAgZHVwCiAgICBsZW4KICAgIGludGNfMiAvLyA4CiAgICA9PQogICAgYXNzZXJ0IC8vIGludmFsaWQgbnVtYmVyIG9mIGJ5dGVzIGZvciBhcmM0LnVpbnQ2NAogICAgLy8gc21hcnRfY29udHJhY3RzL2Fhcm5hX3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjEzMDQKICAgIC8vIHJldHVybiBzZWxmLl9sb2FkX3Byb2plY3QocHJvamVjdF9pZC5uYXRpdmUpCiAgICBidG9pCiAgICBjYWxsc3ViIF9sb2FkX3Byb2plY3QKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hYXJuYV9yZWdpc3RyeS9jb250cmFjdC5weToxMzAyCiAgICAvLyBAYXJjNC5hYmltZXRob2QocmVhZG9ubHk9VHJ1ZSkKICAgIGJ5dGVjXzAgLy8gMHgxNTFmN2M3NQogICAgc3dhcAogICAgY29uY2F0CiAgICBsb2cKICAgIGludGNfMSAvLyAxCiAgICByZXR1cm4KCgovLyBzbWFydF9jb250cmFjdHMuYWFybmFfcmVnaXN0cnkuY29udHJhY3QuQWFybmFSZWdpc3RyeS5nZXRfcHJvamVjdF9oZWFkZXJbcm91dGluZ10oKSAtPiB2b2lkOgpnZXRfcHJvamVjdF9oZWFkZXI6CiAgICAvLyBzbWFydF9jb250cmFjdHMvYWFybmFfcmVnaXN0cnkvY29udHJhY3QucHk6MTMwNgogICAgLy8gQGFyYzQuYWJpbWV0aG9kKHJlYWRvbmx5PVRydWUpCiAgICB0eG5hIEFwcGxpY2F0aW9uQXJncyAxCiAgICBkdXAKICAgIGxlbgogICAgaW50Y18yIC8vIDgKICAgID09CiAgICBhc3NlcnQgLy8gaW52YWxpZCBudW1iZXIgb2YgYnl0ZXMgZm9yIGFyYzQudWludDY0CiAgICAvLyBzbWFydF9jb250cmFjdHMvYWFybmFfcmVnaXN0cnkvY29udHJhY3QucHk6MTMwOQogICAgLy8gcmV0dXJuIHNlbGYucHJvamVjdF9oZWFkZXJzW3Byb2plY3RfaWQubmF0aXZlXS5jb3B5KCkKICAgIGJ0b2kKICAgIGl0b2IKICAgIGJ5dGVjXzMgLy8gMHg2OAogICAgc3dhcAogICAgY29uY2F0CiAgICBib3hfZ2V0CiAgICBhc3NlcnQgLy8gY2hlY2sgc2VsZi5wcm9qZWN0X2hlYWRlcnMgZW50cnkgZXhpc3RzCiAgICAvLyBzbWFydF9jb250cmFjdHMvYWFybmFfcmVnaXN0cnkvY29udHJhY3QucHk6MTMwNgogICAgLy8gQGFyYzQuYWJpbWV0aG9kKHJlYWRvbmx5PVRydWUpCiAgICBieXRlY18wIC8vIDB4MTUxZjdjNzUKICAgIHN3YXAKICAgIGNvbmNhdAogICAgbG9nCiAgICBpbnRjXzEgLy8gMQogICAgcmV0dXJuCgoKLy8gc21hcnRfY29udHJhY3RzLmFhcm5hX3JlZ2lzdHJ5LmNvbnRyYWN0LkFhcm5hUmVnaXN0cnkuZmluZF9wcm9qZWN0X2J5X2NpZFtyb3V0aW5nXSgpIC0+IHZvaWQ6CmZpbmRfcHJvamVjdF9ieV9jaWQ6CiAgICAvLyBzbWFydF9jb250cmFjdHMvYWFybmFfcmVnaXN0cnkvY29udHJhY3QucHk6MTMxMQogICAgLy8gQGFyYzQuYWJpbWV0aG9kKHJlYWRvbmx5PVRydWUpCiAgICB0eG5hIEFwcGxpY2F0aW9uQXJncyAxCiAgICBkdXAKICAgIGludGNfMCAvLyAwCiAgICBleHRyYWN0X3VpbnQxNiAvLyBvbiBlcnJvcjogaW52YWxpZCBhcnJheSBsZW5ndGggaGVhZGVyCiAgICBpbnRjXzMgLy8gMgogICAgKwogICAgZGlnIDEKICAgIGxlbgogICAgPT0KICAgIGFzc2VydCAvLyBpbnZhbGlkIG51bWJlciBvZiBieXRlcyBmb3IgYXJjNC5keW5hbWljX2FycmF5PGFyYzQudWludDg+CiAgICAvLyBzbWFydF9jb250cmFjdHMvYWFybmFfcmVnaXN0cnkvY29udHJhY3QucHk6MTMxNAogICAgLy8gcGlkLCBleGlzdHMgPSBzZWxmLmNpZF9pbmRleC5tYXliZShvcC5zaGEyNTYoY2lkLm5hdGl2ZS5ieXRlcykpCiAgICBleHRyYWN0IDIgMAogICAgc2hhMjU2CiAgICBwdXNoYnl0ZXMgMHg2MwogICAgc3dhcAogICAgY29uY2F0CiAgICBib3hfZ2V0CiAgICBzd2FwCiAgICBidG9pCiAgICBzd2FwCiAgICAvLyBzbWFydF9jb250cmFjdHMvYWFybmFfcmVnaXN0cnkvY29udHJhY3QucHk6MTMxNQogICAgLy8gaWYgbm90IGV4aXN0czoKICAgIGJueiBmaW5kX3Byb2plY3RfYnlfY2lkX2FmdGVyX2lmX2Vsc2VAMwogICAgcG9wCiAgICAvLyBzbWFydF9jb250cmFjdHMvYWFybmFfcmVnaXN0cnkvY29udHJhY3QucHk6MTMxNgogICAgLy8gcmV0dXJuIGFyYzQuVUludDY0KE5PX0lEKQogICAgaW50YyA0IC8vIDE4NDQ2NzQ0MDczNzA5NTUxNjE1CiAgICBpdG9iCgpmaW5kX3Byb2plY3RfYnlfY2lkX2FmdGVyX2lubGluZWRfc21hcnRfY29udHJhY3RzLmFhcm5hX3JlZ2lzdHJ5LmNvbnRyYWN0LkFhcm5hUmVnaXN0cnkuZmluZF9wcm9qZWN0X2J5X2NpZEA0OgogICAgLy8gc21hcnRfY29udHJhY3RzL2Fhcm5hX3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjEzMTEKICAgIC8vIEBhcmM0LmFiaW1ldGhvZChyZWFkb25seT1UcnVlKQogICAgYnl0ZWNfMCAvLyAweDE1MWY3Yzc1CiAgICBzd2FwCiAgICBjb25jYXQKICAgIGxvZwogICAgaW50Y18xIC8vIDEKICAgIHJldHVybgoKZmluZF9wcm9qZWN0X2J5X2NpZF9hZnRlcl9pZl9lbHNlQDM6CiAgICAvLyBzbWFydF9jb250cmFjdHMvYWFybmFfcmVnaXN0cnkvY29udHJhY3QucHk6MTMxNwogICAgLy8gcmV0dXJuIGFyYzQuVUludDY0KHBpZCkKICAgIGl0b2IKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hYXJuYV9yZWdpc3RyeS9jb250cmFjdC5weToxMzExCiAgICAvLyBAYXJjNC5hYmltZXRob2QocmVhZG9ubHk9VHJ1ZSkKICAgIGIgZmluZF9wcm9qZWN0X2J5X2NpZF9hZnRlcl9pbmxpbmVkX3NtYXJ0X2NvbnRyYWN0cy5hYXJuYV9yZWdpc3RyeS5jb250cmFjdC5BYXJuYVJlZ2lzdHJ5LmZpbmRfcHJvamVjdF9ieV9jaWRANAoKCi8vIHNtYXJ0X2NvbnRyYWN0cy5hYXJuYV9yZWdpc3RyeS5jb250cmFjdC5BYXJuYVJlZ2lzdHJ5LmdldF9wZW5kaW5nX2lkc1tyb3V0aW5nXSgpIC0+IHZvaWQ6CmdldF9wZW5kaW5nX2lkczoKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hYXJuYV9yZWdpc3RyeS9jb250cmFjdC5weToxMzE5CiAgICAvLyBAYXJjNC5hYmltZXRob2QocmVhZG9ubHk9VHJ1ZSkKICAgIHR4bmEgQXBwbGljYXRpb25BcmdzIDEKICAgIGR1cAogICAgbGVuCiAgICBpbnRjXzIgLy8gOAogICAgPT0KICAgIGFzc2VydCAvLyBpbnZhbGlkIG51bWJlciBvZiBieXRlcyBmb3IgYXJjNC51aW50NjQKICAgIHR4bmEgQXBwbGljYXRpb25BcmdzIDIKICAgIGR1cAogICAgbGVuCiAgICBpbnRjXzIgLy8gOAogICAgPT0KICAgIGFzc2VydCAvLyBpbnZhbGlkIG51bWJlciBvZiBieXRlcyBmb3IgYXJjNC51aW50NjQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hYXJuYV9yZWdpc3RyeS9jb250cmFjdC5weToxMzI0CiAgICAvLyByZXR1cm4gc2VsZi5fcXVldWVfcGFnZShVSW50NjQoMSksIGFmdGVyLm5hdGl2ZSwgY291bnQubmF0aXZlKQogICAgc3dhcAogICAgYnRvaQogICAgc3dhcAogICAgYnRvaQogICAgaW50Y18xIC8vIDEKICAgIGNvdmVyIDIKICAgIGNhbGxzdWIgX3F1ZXVlX3BhZ2UKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hYXJuYV9yZWdpc3RyeS9jb250cmFjdC5weToxMzE5CiAgICAvLyBAYXJjNC5hYmltZXRob2QocmVhZG9ubHk9VHJ1ZSkKICAgIGJ5dGVjXzAgLy8gMHgxNTFmN2M3NQogICAgc3dhcAogICAgY29uY2F0CiAgICBsb2cKICAgIGludGNfMSAvLyAxCiAgICByZXR1cm4KCgovLyBzbWFydF9jb250cmFjdHMuYWFybmFfcmVnaXN0cnkuY29udHJhY3QuQWFybmFSZWdpc3RyeS5nZXRfdmVyaWZpZWRfaWRzW3JvdXRpbmddKCkgLT4gdm9pZDoKZ2V0X3ZlcmlmaWVkX2lkczoKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hYXJuYV9yZWdpc3RyeS9jb250cmFjdC5weToxMzI2CiAgICAvLyBAYXJjNC5hYmltZXRob2QocmVhZG9ubHk9VHJ1ZSkKICAgIHR4bmEgQXBwbGljYXRpb25BcmdzIDEKICAgIGR1cAogICAgbGVuCiAgICBpbnRjXzIgLy8gOAogICAgPT0KICAgIGFzc2VydCAvLyBpbnZhbGlkIG51bWJlciBvZiBieXRlcyBmb3IgYXJjNC51aW50NjQKICAgIHR4bmEgQXBwbGljYXRpb25BcmdzIDIKICAgIGR1cAogICAgbGVuCiAgICBpbnRjXzIgLy8gOAogICAgPT0KICAgIGFzc2VydCAvLyBpbnZhbGlkIG51bWJlciBvZiBieXRlcyBmb3IgYXJjNC51aW50NjQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hYXJuYV9yZWdpc3RyeS9jb250cmFjdC5weToxMzMxCiAgICAvLyByZXR1cm4gc2VsZi5fcXVldWVfcGFnZShVSW50NjQoMiksIGFmdGVyLm5hdGl2ZSwgY291bnQubmF0aXZlKQogICAgc3dhcAogICAgYnRvaQogICAgc3dhcAogICAgYnRvaQogICAgaW50Y18zIC8vIDIKICAgIGNvdmVyIDIKICAgIGNhbGxzdWIgX3F1ZXVlX3BhZ2UKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hYXJuYV9yZWdpc3RyeS9jb250cmFjdC5weToxMzI2CiAgICAvLyBAYXJjNC5hYmltZXRob2QocmVhZG9ubHk9VHJ1ZSkKICAgIGJ5dGVjXzAgLy8gMHgxNTFmN2M3NQogICAgc3dhcAogICAgY29uY2F0CiAgICBsb2cKICAgIGludGNfMSAvLyAxCiAgICByZXR1cm4KCgovLyBzbWFydF9jb250cmFjdHMuYWFybmFfcmVnaXN0cnkuY29udHJhY3QuQWFybmFSZWdpc3RyeS5nZXRfcHJvamVjdHNfYnlfc3VibWl0dGVyW3JvdXRpbmddKCkgLT4gdm9pZDoKZ2V0X3Byb2plY3RzX2J5X3N1Ym1pdHRlcjoKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hYXJuYV9yZWdpc3RyeS9jb250cmFjdC5weToxMzMzCiAgICAvLyBAYXJjNC5hYmltZXRob2QocmVhZG9ubHk9VHJ1ZSkKICAgIHR4bmEgQXBwbGljYXRpb25BcmdzIDEKICAgIGR1cAogICAgbGVuCiAgICBwdXNoaW50IDMyCiAgICA9PQogICAgYXNzZXJ0IC8vIGludmFsaWQgbnVtYmVyIG9mIGJ5dGVzIGZvciBhcmM0LnN0YXRpY19hcnJheTxhcmM0LnVpbnQ4LCAzMj4KICAgIHR4bmEgQXBwbGljYXRpb25BcmdzIDIKICAgIGR1cAogICAgbGVuCiAgICBpbnRjXzIgLy8gOAogICAgPT0KICAgIGFzc2VydCAvLyBpbnZhbGlkIG51bWJlciBvZiBieXRlcyBmb3IgYXJjNC51aW50NjQKICAgIHR4bmEgQXBwbGljYXRpb25BcmdzIDMKICAgIGR1cAogICAgbGVuCiAgICBpbnRjXzIgLy8gOAogICAgPT0KICAgIGFzc2VydCAvLyBpbnZhbGlkIG51bWJlciBvZiBieXRlcyBmb3IgYXJjNC51aW50NjQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hYXJuYV9yZWdpc3RyeS9jb250cmFjdC5weTozMjUKICAgIC8vIHJldHVybiBCeXRlcyhTVUJNSVRURVJfSU5ERVhfUFJFRklYKSArIGFkZHIuYnl0ZXMKICAgIHB1c2hieXRlcyAweDczCiAgICB1bmNvdmVyIDMKICAgIGNvbmNhdAogICAgLy8gc21hcnRfY29udHJhY3RzL2Fhcm5hX3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjEzMzgKICAgIC8vIHJldHVybiBzZWxmLl9pbmRleF9wYWdlKF9zdWJtaXR0ZXJfa2V5KGFkZHIubmF0aXZlKSwgc3RhcnQubmF0aXZlLCBjb3VudC5uYXRpdmUpCiAgICB1bmNvdmVyIDIKICAgIGJ0b2kKICAgIHVuY292ZXIgMgogICAgYnRvaQogICAgY2FsbHN1YiBfaW5kZXhfcGFnZQogICAgLy8gc21hcnRfY29udHJhY3RzL2Fhcm5hX3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjEzMzMKICAgIC8vIEBhcmM0LmFiaW1ldGhvZChyZWFkb25seT1UcnVlKQogICAgYnl0ZWNfMCAvLyAweDE1MWY3Yzc1CiAgICBzd2FwCiAgICBjb25jYXQKICAgIGxvZwogICAgaW50Y18xIC8vIDEKICAgIHJldHVybgoKCi8vIHNtYXJ0X2NvbnRyYWN0cy5hYXJuYV9yZWdpc3RyeS5jb250cmFjdC5BYXJuYVJlZ2lzdHJ5LmdldF9saXN0aW5nc19ieV9zZWxsZXJbcm91dGluZ10oKSAtPiB2b2lkOgpnZXRfbGlzdGluZ3NfYnlfc2VsbGVyOgogICAgLy8gc21hcnRfY29udHJhY3RzL2Fhcm5hX3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjEzNDAKICAgIC8vIEBhcmM0LmFiaW1ldGhvZChyZWFkb25seT1UcnVlKQogICAgdHhuYSBBcHBsaWNhdGlvbkFyZ3MgMQogICAgZHVwCiAgICBsZW4KICAgIHB1c2hpbnQgMzIKICAgID09CiAgICBhc3NlcnQgLy8gaW52YWxpZCBudW1iZXIgb2YgYnl0ZXMgZm9yIGFyYzQuc3RhdGljX2FycmF5PGFyYzQudWludDgsIDMyPgogICAgdHhuYSBBcHBsaWNhdGlvbkFyZ3MgMgogICAgZHVwCiAgICBsZW4KICAgIGludGNfMiAvLyA4CiAgICA9PQogICAgYXNzZXJ0IC8vIGludmFsaWQgbnVtYmVyIG9mIGJ5dGVzIGZvciBhcmM0LnVpbnQ2NAogICAgdHhuYSBBcHBsaWNhdGlvbkFyZ3MgMwogICAgZHVwCiAgICBsZW4KICAgIGludGNfMiAvLyA4CiAgICA9PQogICAgYXNzZXJ0IC8vIGludmFsaWQgbnVtYmVyIG9mIGJ5dGVzIGZvciBhcmM0LnVpbnQ2NAogICAgLy8gc21hcnRfY29udHJhY3RzL2Fhcm5hX3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjMzMAogICAgLy8gcmV0dXJuIEJ5dGVzKFNFTExFUl9JTkRFWF9QUkVGSVgpICsgYWRkci5ieXRlcwogICAgYnl0ZWMgMzAgLy8gMHg3NAogICAgdW5jb3ZlciAzCiAgICBjb25jYXQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hYXJuYV9yZWdpc3RyeS9jb250cmFjdC5weToxMzQ4CiAgICAvLyByZXR1cm4gc2VsZi5faW5kZXhfcGFnZShfc2VsbGVyX2tleShhZGRyLm5hdGl2ZSksIHN0YXJ0Lm5hdGl2ZSwgY291bnQubmF0aXZlKQogICAgdW5jb3ZlciAyCiAgICBidG9pCiAgICB1bmNvdmVyIDIKICAgIGJ0b2kKICAgIGNhbGxzdWIgX2luZGV4X3BhZ2UKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hYXJuYV9yZWdpc3RyeS9jb250cmFjdC5weToxMzQwCiAgICAvLyBAYXJjNC5hYmltZXRob2QocmVhZG9ubHk9VHJ1ZSkKICAgIGJ5dGVjXzAgLy8gMHgxNTFmN2M3NQogICAgc3dhcAogICAgY29uY2F0CiAgICBsb2cKICAgIGludGNfMSAvLyAxCiAgICByZXR1cm4KCgovLyBzbWFydF9jb250cmFjdHMuYWFybmFfcmVnaXN0cnkuY29udHJhY3QuQWFybmFSZWdpc3RyeS5nZXRfc3RhdHNbcm91dGluZ10oKSAtPiB2b2lkOgpnZXRfc3RhdHM6CiAgICAvLyBzbWFydF9jb250cmFjdHMvYWFybmFfcmVnaXN0cnkvY29udHJhY3QucHk6MTM1NAogICAgLy8gcHJvamVjdF9jb3VudD1hcmM0LlVJbnQ2NChzZWxmLnByb2plY3RfY291bnQpLAogICAgaW50Y18wIC8vIDAKICAgIGJ5dGVjXzIgLy8gInByb2plY3RfY291bnQiCiAgICBhcHBfZ2xvYmFsX2dldF9leAogICAgYXNzZXJ0IC8vIGNoZWNrIHNlbGYucHJvamVjdF9jb3VudCBleGlzdHMKICAgIGl0b2IKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hYXJuYV9yZWdpc3RyeS9jb250cmFjdC5weToxMzU1CiAgICAvLyBwZW5kaW5nPWFyYzQuVUludDY0KHNlbGYucGVuZGluZ19jb3VudCksCiAgICBpbnRjXzAgLy8gMAogICAgYnl0ZWMgOCAvLyAicGVuZGluZ19jb3VudCIKICAgIGFwcF9nbG9iYWxfZ2V0X2V4CiAgICBhc3NlcnQgLy8gY2hlY2sgc2VsZi5wZW5kaW5nX2NvdW50IGV4aXN0cwogICAgaXRvYgogICAgLy8gc21hcnRfY29udHJhY3RzL2Fhcm5hX3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjEzNTYKICAgIC8vIHZlcmlmaWVkPWFyYzQuVUludDY0KHNlbGYudmVyaWZpZWRfY291bnQpLAogICAgaW50Y18wIC8vIDAKICAgIGJ5dGVjIDE2IC8vICJ2ZXJpZmllZF9jb3VudCIKICAgIGFwcF9nbG9iYWxfZ2V0X2V4CiAgICBhc3NlcnQgLy8gY2hlY2sgc2VsZi52ZXJpZmllZF9jb3VudCBleGlzdHMKICAgIGl0b2IKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hYXJuYV9yZWdpc3RyeS9jb250cmFjdC5weToxMzU3CiAgICAvLyByZWplY3RlZD1hcmM0LlVJbnQ2NChzZWxmLnJlamVjdGVkX2NvdW50KSwKICAgIGludGNfMCAvLyAwCiAgICBieXRlYyAyMSAvLyAicmVqZWN0ZWRfY291bnQiCiAgICBhcHBfZ2xvYmFsX2dldF9leAogICAgYXNzZXJ0IC8vIGNoZWNrIHNlbGYucmVqZWN0ZWRfY291bnQgZXhpc3RzCiAgICBpdG9iCiAgICAvLyBzbWFydF9jb250cmFjdHMvYWFybmFfcmVnaXN0cnkvY29udHJhY3QucHk6MTM1OAogICAgLy8gaXNzdWVkPWFyYzQuVUludDY0KHNlbGYuaXNzdWVkX2NvdW50KSwKICAgIGludGNfMCAvLyAwCiAgICBieXRlYyAyMiAvLyAiaXNzdWVkX2NvdW50IgogICAgYXBwX2dsb2JhbF9nZXRfZXgKICAgIGFzc2VydCAvLyBjaGVjayBzZWxmLmlzc3VlZF9jb3VudCBleGlzdHMKICAgIGl0b2IKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hYXJuYV9yZWdpc3RyeS9jb250cmFjdC5weToxMzU5CiAgICAvLyB0b3RhbF9jcmVkaXRzX2lzc3VlZD1hcmM0LlVJbnQ2NChzZWxmLnRvdGFsX2NyZWRpdHNfaXNzdWVkKSwKICAgIGludGNfMCAvLyAwCiAgICBieXRlYyAxMSAvLyAidG90YWxfY3JlZGl0c19pc3N1ZWQiCiAgICBhcHBfZ2xvYmFsX2dldF9leAogICAgYXNzZXJ0IC8vIGNoZWNrIHNlbGYudG90YWxfY3JlZGl0c19pc3N1ZWQgZXhpc3RzCiAgICBpdG9iCiAgICAvLyBzbWFydF9jb250cmFjdHMvYWFybmFfcmVnaXN0cnkvY29udHJhY3QucHk6MTM2MAogICAgLy8gb3Blbl9saXN0aW5ncz1hcmM0LlVJbnQ2NChzZWxmLm9wZW5fbGlzdGluZ19jb3VudCksCiAgICBpbnRjXzAgLy8gMAogICAgYnl0ZWMgMTMgLy8gIm9wZW5fbGlzdGluZ19jb3VudCIKICAgIGFwcF9nbG9iYWxfZ2V0X2V4CiAgICBhc3NlcnQgLy8gY2hlY2sgc2VsZi5vcGVuX2xpc3RpbmdfY291bnQgZXhpc3RzCiAgICBpdG9iCiAgICAvLyBzbWFydF9jb250cmFjdHMvYWFybmFfcmVnaXN0cnkvY29udHJhY3QucHk6MTM2MQogICAgLy8gZXNjcm93ZWRfdG9rZW5zPWFyYzQuVUludDY0KHNlbGYuZXNjcm93ZWRfdG9rZW5zKSwKICAgIGludGNfMCAvLyAwCiAgICBieXRlYyA5IC8vICJlc2Nyb3dlZF90b2tlbnMiCiAgICBhcHBfZ2xvYmFsX2dldF9leAogICAgYXNzZXJ0IC8vIGNoZWNrIHNlbGYuZXNjcm93ZWRfdG9rZW5zIGV4aXN0cwogICAgaXRvYgogICAgLy8gc21hcnRfY29udHJhY3RzL2Fhcm5hX3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjEzNjIKICAgIC8vIHRva2Vuc190cmFkZWQ9YXJjNC5VSW50NjQoc2VsZi50b2tlbnNfdHJhZGVkKSwKICAgIGludGNfMCAvLyAwCiAgICBieXRlYyAyMyAvLyAidG9rZW5zX3RyYWRlZCIKICAgIGFwcF9nbG9iYWxfZ2V0X2V4CiAgICBhc3NlcnQgLy8gY2hlY2sgc2VsZi50b2tlbnNfdHJhZGVkIGV4aXN0cwogICAgaXRvYgogICAgLy8gc21hcnRfY29udHJhY3RzL2Fhcm5hX3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjEzNjMKICAgIC8vIHZvbHVtZV90cmFkZWQ9YXJjNC5VSW50NjQoc2VsZi52b2x1bWVfdHJhZGVkKSwKICAgIGludGNfMCAvLyAwCiAgICBieXRlYyAyNCAvLyAidm9sdW1lX3RyYWRlZCIKICAgIGFwcF9nbG9iYWxfZ2V0X2V4CiAgICBhc3NlcnQgLy8gY2hlY2sgc2VsZi52b2x1bWVfdHJhZGVkIGV4aXN0cwogICAgaXRvYgogICAgLy8gc21hcnRfY29udHJhY3RzL2Fhcm5hX3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjEzNTMtMTM2NAogICAgLy8gcmV0dXJuIFJlZ2lzdHJ5U3RhdHMoCiAgICAvLyAgICAgcHJvamVjdF9jb3VudD1hcmM0LlVJbnQ2NChzZWxmLnByb2plY3RfY291bnQpLAogICAgLy8gICAgIHBlbmRpbmc9YXJjNC5VSW50NjQoc2VsZi5wZW5kaW5nX2NvdW50KSwKICAgIC8vICAgICB2ZXJpZmllZD1hcmM0LlVJbnQ2NChzZWxmLnZlcmlmaWVkX2NvdW50KSwKICAgIC8vICAgICByZWplY3RlZD1hcmM0LlVJbnQ2NChzZWxmLnJlamVjdGVkX2NvdW50KSwKICAgIC8vICAgICBpc3N1ZWQ9YXJjNC5VSW50NjQoc2VsZi5pc3N1ZWRfY291bnQpLAogICAgLy8gICAgIHRvdGFsX2NyZWRpdHNfaXNzdWVkPWFyYzQuVUludDY0KHNlbGYudG90YWxfY3JlZGl0c19pc3N1ZWQpLAogICAgLy8gICAgIG9wZW5fbGlzdGluZ3M9YXJjNC5VSW50NjQoc2VsZi5vcGVuX2xpc3RpbmdfY291bnQpLAogICAgLy8gICAgIGVzY3Jvd2VkX3Rva2Vucz1hcmM0LlVJbnQ2NChzZWxmLmVzY3Jvd2VkX3Rva2VucyksCiAgICAvLyAgICAgdG9rZW5zX3RyYWRlZD1hcmM0LlVJbnQ2NChzZWxmLnRva2Vuc190cmFkZWQpLAogICAgLy8gICAgIHZvbHVtZV90cmFkZWQ9YXJjNC5VSW50NjQoc2VsZi52b2x1bWVfdHJhZGVkKSwKICAgIC8vICkKICAgIHVuY292ZXIgOQogICAgdW5jb3ZlciA5CiAgICBjb25jYXQKICAgIHVuY292ZXIgOAogICAgY29uY2F0CiAgICB1bmNvdmVyIDcKICAgIGNvbmNhdAogICAgdW5jb3ZlciA2CiAgICBjb25jYXQKICAgIHVuY292ZXIgNQogICAgY29uY2F0CiAgICB1bmNvdmVyIDQKICAgIGNvbmNhdAogICAgdW5jb3ZlciAzCiAgICBjb25jYXQKICAgIHVuY292ZXIgMgogICAgY29uY2F0CiAgICBzd2FwCiAgICBjb25jYXQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hYXJuYV9yZWdpc3RyeS9jb250cmFjdC5weToxMzUwCiAgICAvLyBAYXJjNC5hYmltZXRob2QocmVhZG9ubHk9VHJ1ZSkKICAgIGJ5dGVjXzAgLy8gMHgxNTFmN2M3NQogICAgc3dhcAogICAgY29uY2F0CiAgICBsb2cKICAgIGludGNfMSAvLyAxCiAgICByZXR1cm4KCgovLyBzbWFydF9jb250cmFjdHMuYWFybmFfcmVnaXN0cnkuY29udHJhY3QuQWFybmFSZWdpc3RyeS5nZXRfYmVzdF9vZmZlcnNbcm91dGluZ10oKSAtPiB2b2lkOgpnZXRfYmVzdF9vZmZlcnM6CiAgICBpbnRjXzAgLy8gMAogICAgcHVzaGJ5dGVzICIiCiAgICBkdXAKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hYXJuYV9yZWdpc3RyeS9jb250cmFjdC5weToxMzY2CiAgICAvLyBAYXJjNC5hYmltZXRob2QocmVhZG9ubHk9VHJ1ZSkKICAgIHR4bmEgQXBwbGljYXRpb25BcmdzIDEKICAgIGR1cAogICAgbGVuCiAgICBpbnRjXzIgLy8gOAogICAgPT0KICAgIGFzc2VydCAvLyBpbnZhbGlkIG51bWJlciBvZiBieXRlcyBmb3IgYXJjNC51aW50NjQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hYXJuYV9yZWdpc3RyeS9jb250cmFjdC5weToxMzcyCiAgICAvLyBsaW1pdCA9IGNvdW50Lm5hdGl2ZQogICAgYnRvaQogICAgZHVwCiAgICAvLyBzbWFydF9jb250cmFjdHMvYWFybmFfcmVnaXN0cnkvY29udHJhY3QucHk6MTM3MwogICAgLy8gaWYgbGltaXQgPiBNQVhfQk9PS19QQUdFOgogICAgcHVzaGludCA0MgogICAgPgogICAgYnogZ2V0X2Jlc3Rfb2ZmZXJzX2FmdGVyX2lmX2Vsc2VAMwogICAgLy8gc21hcnRfY29udHJhY3RzL2Fhcm5hX3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjEzNzQKICAgIC8vIGxpbWl0ID0gVUludDY0KE1BWF9CT09LX1BBR0UpCiAgICBwdXNoaW50IDQyCiAgICBidXJ5IDEKCmdldF9iZXN0X29mZmVyc19hZnRlcl9pZl9lbHNlQDM6CiAgICAvLyBzbWFydF9jb250cmFjdHMvYWFybmFfcmVnaXN0cnkvY29udHJhY3QucHk6MTM3NQogICAgLy8gb2ZmZXJzID0gYXJjNC5EeW5hbWljQXJyYXlbT2ZmZXJdKCkKICAgIGJ5dGVjIDE0IC8vIDB4MDAwMAogICAgLy8gc21hcnRfY29udHJhY3RzL2Fhcm5hX3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjEzNzYKICAgIC8vIHByaWNlID0gc2VsZi5iZXN0X3ByaWNlCiAgICBpbnRjXzAgLy8gMAogICAgYnl0ZWMgMTIgLy8gImJlc3RfcHJpY2UiCiAgICBhcHBfZ2xvYmFsX2dldF9leAogICAgc3dhcAogICAgYnVyeSA0CiAgICBhc3NlcnQgLy8gY2hlY2sgc2VsZi5iZXN0X3ByaWNlIGV4aXN0cwoKZ2V0X2Jlc3Rfb2ZmZXJzX3doaWxlX3RvcEA0OgogICAgLy8gc21hcnRfY29udHJhY3RzL2Fhcm5hX3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjEzNzcKICAgIC8vIHdoaWxlIHByaWNlICE9IE5PX1BSSUNFIGFuZCBvZmZlcnMubGVuZ3RoIDwgbGltaXQ6CiAgICBkaWcgMgogICAgYnogZ2V0X2Jlc3Rfb2ZmZXJzX2FmdGVyX3doaWxlQDE0CiAgICBkdXAKICAgIGludGNfMCAvLyAwCiAgICBleHRyYWN0X3VpbnQxNiAvLyBvbiBlcnJvcjogaW52YWxpZCBhcnJheSBsZW5ndGggaGVhZGVyCiAgICBkaWcgMgogICAgPAogICAgYnogZ2V0X2Jlc3Rfb2ZmZXJzX2FmdGVyX3doaWxlQDE0CiAgICAvLyBzbWFydF9jb250cmFjdHMvYWFybmFfcmVnaXN0cnkvY29udHJhY3QucHk6MTM3OAogICAgLy8gbGV2ZWwgPSBzZWxmLnByaWNlX2xldmVsc1twcmljZV0uY29weSgpCiAgICBkaWcgMgogICAgaXRvYgogICAgZHVwCiAgICBjb3ZlciAyCiAgICBieXRlYyA0IC8vIDB4NmYKICAgIHN3YXAKICAgIGNvbmNhdAogICAgYm94X2dldAogICAgc3dhcAogICAgZHVwCiAgICBjb3ZlciAyCiAgICBidXJ5IDgKICAgIGFzc2VydCAvLyBjaGVjayBzZWxmLnByaWNlX2xldmVscyBlbnRyeSBleGlzdHMKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hYXJuYV9yZWdpc3RyeS9jb250cmFjdC5weToxMzc5CiAgICAvLyBsaWQgPSBsZXZlbC5oZWFkLm5hdGl2ZQogICAgcHVzaGludCAxNgogICAgZXh0cmFjdF91aW50NjQKCmdldF9iZXN0X29mZmVyc193aGlsZV90b3BANzoKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hYXJuYV9yZWdpc3RyeS9jb250cmFjdC5weToxMzgxCiAgICAvLyBsaWQgIT0gTk9fSUQKICAgIGR1cAogICAgaW50YyA0IC8vIDE4NDQ2NzQ0MDczNzA5NTUxNjE1CiAgICAhPQogICAgZHVwCiAgICAvLyBzbWFydF9jb250cmFjdHMvYWFybmFfcmVnaXN0cnkvY29udHJhY3QucHk6MTM4MS0xMzgzCiAgICAvLyBsaWQgIT0gTk9fSUQKICAgIC8vIGFuZCBvZmZlcnMubGVuZ3RoIDwgbGltaXQKICAgIC8vIGFuZCBHbG9iYWwub3Bjb2RlX2J1ZGdldCgpID4gUEFHRV9CVURHRVRfUkVTRVJWRQogICAgYnogZ2V0X2Jlc3Rfb2ZmZXJzX2FmdGVyX3doaWxlQDExCiAgICAvLyBzbWFydF9jb250cmFjdHMvYWFybmFfcmVnaXN0cnkvY29udHJhY3QucHk6MTM4MgogICAgLy8gYW5kIG9mZmVycy5sZW5ndGggPCBsaW1pdAogICAgZGlnIDIKICAgIGludGNfMCAvLyAwCiAgICBleHRyYWN0X3VpbnQxNiAvLyBvbiBlcnJvcjogaW52YWxpZCBhcnJheSBsZW5ndGggaGVhZGVyCiAgICBkdXAKICAgIGJ1cnkgOAogICAgZGlnIDUKICAgIDwKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hYXJuYV9yZWdpc3RyeS9jb250cmFjdC5weToxMzgxLTEzODMKICAgIC8vIGxpZCAhPSBOT19JRAogICAgLy8gYW5kIG9mZmVycy5sZW5ndGggPCBsaW1pdAogICAgLy8gYW5kIEdsb2JhbC5vcGNvZGVfYnVkZ2V0KCkgPiBQQUdFX0JVREdFVF9SRVNFUlZFCiAgICBieiBnZXRfYmVzdF9vZmZlcnNfYWZ0ZXJfd2hpbGVAMTEKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hYXJuYV9yZWdpc3RyeS9jb250cmFjdC5weToxMzgzCiAgICAvLyBhbmQgR2xvYmFsLm9wY29kZV9idWRnZXQoKSA+IFBBR0VfQlVER0VUX1JFU0VSVkUKICAgIGdsb2JhbCBPcGNvZGVCdWRnZXQKICAgIGludGMgNyAvLyA1MDAKICAgID4KICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hYXJuYV9yZWdpc3RyeS9jb250cmFjdC5weToxMzgxLTEzODMKICAgIC8vIGxpZCAhPSBOT19JRAogICAgLy8gYW5kIG9mZmVycy5sZW5ndGggPCBsaW1pdAogICAgLy8gYW5kIEdsb2JhbC5vcGNvZGVfYnVkZ2V0KCkgPiBQQUdFX0JVREdFVF9SRVNFUlZFCiAgICBieiBnZXRfYmVzdF9vZmZlcnNfYWZ0ZXJfd2hpbGVAMTEKICAgIHBvcAogICAgLy8gc21hcnRfY29udHJhY3RzL2Fhcm5hX3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjEzODcKICAgIC8vIGxpc3RpbmdfaWQ9YXJjNC5VSW50NjQobGlkKSwKICAgIGl0b2IKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hYXJuYV9yZWdpc3RyeS9jb250cmFjdC5weToxMzg4CiAgICAvLyBhbW91bnQ9c2VsZi5saXN0aW5nc1tsaWRdLmFtb3VudCwKICAgIGJ5dGVjIDUgLy8gMHg2YwogICAgZGlnIDEKICAgIGNvbmNhdAogICAgYm94X2dldAogICAgYXNzZXJ0IC8vIGNoZWNrIHNlbGYubGlzdGluZ3MgZW50cnkgZXhpc3RzCiAgICBleHRyYWN0IDMyIDgKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hYXJuYV9yZWdpc3RyeS9jb250cmFjdC5weToxMzg2LTEzOTAKICAgIC8vIE9mZmVyKAogICAgLy8gICAgIGxpc3RpbmdfaWQ9YXJjNC5VSW50NjQobGlkKSwKICAgIC8vICAgICBhbW91bnQ9c2VsZi5saXN0aW5nc1tsaWRdLmFtb3VudCwKICAgIC8vICAgICBwcmljZT1hcmM0LlVJbnQ2NChwcmljZSksCiAgICAvLyApCiAgICBkaWcgMQogICAgc3dhcAogICAgY29uY2F0CiAgICBkaWcgMwogICAgY29uY2F0CiAgICBkaWcgNgogICAgLy8gc21hcnRfY29udHJhY3RzL2Fhcm5hX3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjEzODUtMTM5MQogICAgLy8gb2ZmZXJzLmFwcGVuZCgKICAgIC8vICAgICBPZmZlcigKICAgIC8vICAgICAgICAgbGlzdGluZ19pZD1hcmM0LlVJbnQ2NChsaWQpLAogICAgLy8gICAgICAgICBhbW91bnQ9c2VsZi5saXN0aW5nc1tsaWRdLmFtb3VudCwKICAgIC8vICAgICAgICAgcHJpY2U9YXJjNC5VSW50NjQocHJpY2UpLAogICAgLy8gICAgICkKICAgIC8vICkKICAgIGludGNfMSAvLyAxCiAgICArCiAgICBpdG9iCiAgICBleHRyYWN0IDYgMAogICAgdW5jb3ZlciAzCiAgICBzd2FwCiAgICByZXBsYWNlMiAwCiAgICBzd2FwCiAgICBjb25jYXQKICAgIHN3YXAKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hYXJuYV9yZWdpc3RyeS9jb250cmFjdC5weTozOTgKICAgIC8vIHJldHVybiBCeXRlcyhMSVNUSU5HX0xJTktfS0VZX1BSRUZJWCkgKyBvcC5pdG9iKGxpZCkKICAgIGJ5dGVjIDYgLy8gMHg2YgogICAgc3dhcAogICAgY29uY2F0CiAgICAvLyBzbWFydF9jb250cmFjdHMvYWFybmFfcmVnaXN0cnkvY29udHJhY3QucHk6MTM5MwogICAgLy8gb3AuQm94LmV4dHJhY3QoX2xpc3RpbmdfbGlua19rZXkobGlkKSwgTElOS19ORVhUX09GRlNFVCwgOCkKICAgIGludGNfMiAvLyA4CiAgICBkdXAKICAgIGJveF9leHRyYWN0CiAgICAvLyBzbWFydF9jb250cmFjdHMvYWFybmFfcmVnaXN0cnkvY29udHJhY3QucHk6MTM5Mi0xMzk0CiAgICAvLyBsaWQgPSBvcC5idG9pKAogICAgLy8gICAgIG9wLkJveC5leHRyYWN0KF9saXN0aW5nX2xpbmtfa2V5KGxpZCksIExJTktfTkVYVF9PRkZTRVQsIDgpCiAgICAvLyApCiAgICBidG9pCiAgICBiIGdldF9iZXN0X29mZmVyc193aGlsZV90b3BANwoKZ2V0X2Jlc3Rfb2ZmZXJzX2FmdGVyX3doaWxlQDExOgogICAgYnVyeSAxCiAgICB1bmNvdmVyIDIKICAgIHBvcAogICAgLy8gc21hcnRfY29udHJhY3RzL2Fhcm5hX3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjEzOTUKICAgIC8vIGlmIGxpZCAhPSBOT19JRDoKICAgIGJueiBnZXRfYmVzdF9vZmZlcnNfYWZ0ZXJfd2hpbGVAMTQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hYXJuYV9yZWdpc3RyeS9jb250cmFjdC5weToxMzk3CiAgICAvLyBwcmljZSA9IGxldmVsLm5leHRfcHJpY2UubmF0aXZlCiAgICBkaWcgNAogICAgaW50Y18yIC8vIDgKICAgIGV4dHJhY3RfdWludDY0CiAgICBidXJ5IDMKICAgIGIgZ2V0X2Jlc3Rfb2ZmZXJzX3doaWxlX3RvcEA0CgpnZXRfYmVzdF9vZmZlcnNfYWZ0ZXJfd2hpbGVAMTQ6CiAgICAvLyBzbWFydF9jb250cmFjdHMvYWFybmFfcmVnaXN0cnkvY29udHJhY3QucHk6MTM2NgogICAgLy8gQGFyYzQuYWJpbWV0aG9kKHJlYWRvbmx5PVRydWUpCiAgICBieXRlY18wIC8vIDB4MTUxZjdjNzUKICAgIHN3YXAKICAgIGNvbmNhdAogICAgbG9nCiAgICBpbnRjXzEgLy8gMQogICAgcmV0dXJuCgoKLy8gc21hcnRfY29udHJhY3RzLmFhcm5hX3JlZ2lzdHJ5LmNvbnRyYWN0LkFhcm5hUmVnaXN0cnkuZ2V0X2RlcHRoW3JvdXRpbmddKCkgLT4gdm9pZDoKZ2V0X2RlcHRoOgogICAgcHVzaGJ5dGVzICIiCiAgICAvLyBzbWFydF9jb250cmFjdHMvYWFybmFfcmVnaXN0cnkvY29udHJhY3QucHk6MTQwMAogICAgLy8gQGFyYzQuYWJpbWV0aG9kKHJlYWRvbmx5PVRydWUpCiAgICB0eG5hIEFwcGxpY2F0aW9uQXJncyAxCiAgICBkdXAKICAgIGxlbgogICAgaW50Y18yIC8vIDgKICAgID09CiAgICBhc3NlcnQgLy8gaW52YWxpZCBudW1iZXIgb2YgYnl0ZXMgZm9yIGFyYzQudWludDY0CiAgICAvLyBzbWFydF9jb250cmFjdHMvYWFybmFfcmVnaXN0cnkvY29udHJhY3QucHk6MTQwNgogICAgLy8gbGV2ZWxzID0gYXJjNC5EeW5hbWljQXJyYXlbRGVwdGhMZXZlbF0oKQogICAgYnl0ZWMgMTQgLy8gMHgwMDAwCiAgICAvLyBzbWFydF9jb250cmFjdHMvYWFybmFfcmVnaXN0cnkvY29udHJhY3QucHk6MTQwNwogICAgLy8gcHJpY2UgPSBzZWxmLmJlc3RfcHJpY2UKICAgIGludGNfMCAvLyAwCiAgICBieXRlYyAxMiAvLyAiYmVzdF9wcmljZSIKICAgIGFwcF9nbG9iYWxfZ2V0X2V4CiAgICBhc3NlcnQgLy8gY2hlY2sgc2VsZi5iZXN0X3ByaWNlIGV4aXN0cwoKZ2V0X2RlcHRoX3doaWxlX3RvcEAyOgogICAgLy8gc21hcnRfY29udHJhY3RzL2Fhcm5hX3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjE0MDktMTQxMQogICAgLy8gcHJpY2UgIT0gTk9fUFJJQ0UKICAgIC8vIGFuZCBwcmljZSA8PSBwcmljZV9saW1pdC5uYXRpdmUKICAgIC8vIGFuZCBsZXZlbHMubGVuZ3RoIDwgTUFYX0JPT0tfUEFHRQogICAgZHVwCiAgICBieiBnZXRfZGVwdGhfYWZ0ZXJfd2hpbGVANgogICAgLy8gc21hcnRfY29udHJhY3RzL2Fhcm5hX3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjE0MTAKICAgIC8vIGFuZCBwcmljZSA8PSBwcmljZV9saW1pdC5uYXRpdmUKICAgIGRpZyAyCiAgICBidG9pCiAgICBkaWcgMQogICAgPj0KICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hYXJuYV9yZWdpc3RyeS9jb250cmFjdC5weToxNDA5LTE0MTEKICAgIC8vIHByaWNlICE9IE5PX1BSSUNFCiAgICAvLyBhbmQgcHJpY2UgPD0gcHJpY2VfbGltaXQubmF0aXZlCiAgICAvLyBhbmQgbGV2ZWxzLmxlbmd0aCA8IE1BWF9CT09LX1BBR0UKICAgIGJ6IGdldF9kZXB0aF9hZnRlcl93aGlsZUA2CiAgICAvLyBzbWFydF9jb250cmFjdHMvYWFybmFfcmVnaXN0cnkvY29udHJhY3QucHk6MTQxMQogICAgLy8gYW5kIGxldmVscy5sZW5ndGggPCBNQVhfQk9PS19QQUdFCiAgICBkaWcgMQogICAgaW50Y18wIC8vIDAKICAgIGV4dHJhY3RfdWludDE2IC8vIG9uIGVycm9yOiBpbnZhbGlkIGFycmF5IGxlbmd0aCBoZWFkZXIKICAgIGR1cAogICAgYnVyeSA1CiAgICBwdXNoaW50IDQyCiAgICA8CiAgICAvLyBzbWFydF9jb250cmFjdHMvYWFybmFfcmVnaXN0cnkvY29udHJhY3QucHk6MTQwOS0xNDExCiAgICAvLyBwcmljZSAhPSBOT19QUklDRQogICAgLy8gYW5kIHByaWNlIDw9IHByaWNlX2xpbWl0Lm5hdGl2ZQogICAgLy8gYW5kIGxldmVscy5sZW5ndGggPCBNQVhfQk9PS19QQUdFCiAgICBieiBnZXRfZGVwdGhfYWZ0ZXJfd2hpbGVANgogICAgLy8gc21hcnRfY29udHJhY3RzL2Fhcm5hX3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjE0MTMKICAgIC8vIGxldmVsID0gc2VsZi5wcmljZV9sZXZlbHNbcHJpY2VdLmNvcHkoKQogICAgaXRvYgogICAgYnl0ZWMgNCAvLyAweDZmCiAgICBkaWcgMQogICAgY29uY2F0CiAgICBib3hfZ2V0CiAgICBhc3NlcnQgLy8gY2hlY2sgc2VsZi5wcmljZV9sZXZlbHMgZW50cnkgZXhpc3RzCiAgICAvLyBzbWFydF9jb250cmFjdHMvYWFybmFfcmVnaXN0cnkvY29udHJhY3QucHk6MTQxNwogICAgLy8gZGVwdGg9bGV2ZWwuZGVwdGgsCiAgICBkdXAKICAgIGV4dHJhY3QgMzIgOAogICAgLy8gc21hcnRfY29udHJhY3RzL2Fhcm5hX3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjE0MTgKICAgIC8vIGxpc3RpbmdzPWxldmVsLmxpc3RpbmdzLAogICAgZGlnIDEKICAgIGV4dHJhY3QgNDAgOAogICAgLy8gc21hcnRfY29udHJhY3RzL2Fhcm5hX3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjE0MTUtMTQxOQogICAgLy8gRGVwdGhMZXZlbCgKICAgIC8vICAgICBwcmljZT1hcmM0LlVJbnQ2NChwcmljZSksCiAgICAvLyAgICAgZGVwdGg9bGV2ZWwuZGVwdGgsCiAgICAvLyAgICAgbGlzdGluZ3M9bGV2ZWwubGlzdGluZ3MsCiAgICAvLyApCiAgICB1bmNvdmVyIDMKICAgIHVuY292ZXIgMgogICAgY29uY2F0CiAgICBzd2FwCiAgICBjb25jYXQKICAgIGRpZyA0CiAgICAvLyBzbWFydF9jb250cmFjdHMvYWFybmFfcmVnaXN0cnkvY29udHJhY3QucHk6MTQxNC0xNDIwCiAgICAvLyBsZXZlbHMuYXBwZW5kKAogICAgLy8gICAgIERlcHRoTGV2ZWwoCiAgICAvLyAgICAgICAgIHByaWNlPWFyYzQuVUludDY0KHByaWNlKSwKICAgIC8vICAgICAgICAgZGVwdGg9bGV2ZWwuZGVwdGgsCiAgICAvLyAgICAgICAgIGxpc3RpbmdzPWxldmVsLmxpc3RpbmdzLAogICAgLy8gICAgICkKICAgIC8vICkKICAgIGludGNfMSAvLyAxCiAgICArCiAgICBpdG9iCiAgICBleHRyYWN0IDYgMAogICAgdW5jb3ZlciAzCiAgICBzd2FwCiAgICByZXBsYWNlMiAwCiAgICBzd2FwCiAgICBjb25jYXQKICAgIHN3YXAKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hYXJuYV9yZWdpc3RyeS9jb250cmFjdC5weToxNDIxCiAgICAvLyBwcmljZSA9IGxldmVsLm5leHRfcHJpY2UubmF0aXZlCiAgICBpbnRjXzIgLy8gOAogICAgZXh0cmFjdF91aW50NjQKICAgIGIgZ2V0X2RlcHRoX3doaWxlX3RvcEAyCgpnZXRfZGVwdGhfYWZ0ZXJfd2hpbGVANjoKICAgIHBvcAogICAgLy8gc21hcnRfY29udHJhY3RzL2Fhcm5hX3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjE0MDAKICAgIC8vIEBhcmM0LmFiaW1ldGhvZChyZWFkb25seT1UcnVlKQogICAgYnl0ZWNfMCAvLyAweDE1MWY3Yzc1CiAgICBzd2FwCiAgICBjb25jYXQKICAgIGxvZwogICAgaW50Y18xIC8vIDEKICAgIHJldHVybgoKCi8vIHNtYXJ0X2NvbnRyYWN0cy5hYXJuYV9yZWdpc3RyeS5jb250cmFjdC5BYXJuYVJlZ2lzdHJ5LmdldF9wcmljZV9oaW50W3JvdXRpbmddKCkgLT4gdm9pZDoKZ2V0X3ByaWNlX2hpbnQ6CiAgICAvLyBzbWFydF9jb250cmFjdHMvYWFybmFfcmVnaXN0cnkvY29udHJhY3QucHk6MTQyNAogICAgLy8gQGFyYzQuYWJpbWV0aG9kKHJlYWRvbmx5PVRydWUpCiAgICB0eG5hIEFwcGxpY2F0aW9uQXJncyAxCiAgICBkdXAKICAgIGxlbgogICAgaW50Y18yIC8vIDgKICAgID09CiAgICBhc3NlcnQgLy8gaW52YWxpZCBudW1iZXIgb2YgYnl0ZXMgZm9yIGFyYzQudWludDY0CiAgICAvLyBzbWFydF9jb250cmFjdHMvYWFybmFfcmVnaXN0cnkvY29udHJhY3QucHk6MTQzMAogICAgLy8gcHJldiA9IFVJbnQ2NChOT19QUklDRSkKICAgIGludGNfMCAvLyAwCiAgICBzd2FwCiAgICAvLyBzbWFydF9jb250cmFjdHMvYWFybmFfcmVnaXN0cnkvY29udHJhY3QucHk6MTQzMQogICAgLy8gY3VyID0gc2VsZi5iZXN0X3ByaWNlCiAgICBpbnRjXzAgLy8gMAogICAgYnl0ZWMgMTIgLy8gImJlc3RfcHJpY2UiCiAgICBhcHBfZ2xvYmFsX2dldF9leAogICAgYXNzZXJ0IC8vIGNoZWNrIHNlbGYuYmVzdF9wcmljZSBleGlzdHMKCmdldF9wcmljZV9oaW50X3doaWxlX3RvcEAyOgogICAgLy8gc21hcnRfY29udHJhY3RzL2Fhcm5hX3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjE0MzIKICAgIC8vIHdoaWxlIGN1ciAhPSBOT19QUklDRSBhbmQgY3VyIDwgcHJpY2UubmF0aXZlOgogICAgZHVwCiAgICBieiBnZXRfcHJpY2VfaGludF9hZnRlcl93aGlsZUA1CiAgICBkaWcgMQogICAgYnRvaQogICAgZGlnIDEKICAgID4KICAgIGJ6IGdldF9wcmljZV9oaW50X2FmdGVyX3doaWxlQDUKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hYXJuYV9yZWdpc3RyeS9jb250cmFjdC5weTozOTMKICAgIC8vIHJldHVybiBCeXRlcyhMRVZFTF9LRVlfUFJFRklYKSArIG9wLml0b2IocHJpY2UpCiAgICBkdXAKICAgIGl0b2IKICAgIGJ5dGVjIDQgLy8gMHg2ZgogICAgc3dhcAogICAgY29uY2F0CiAgICAvLyBzbWFydF9jb250cmFjdHMvYWFybmFfcmVnaXN0cnkvY29udHJhY3QucHk6MTQzNAogICAgLy8gY3VyID0gb3AuYnRvaShvcC5Cb3guZXh0cmFjdChfbGV2ZWxfa2V5KGN1ciksIExFVkVMX05FWFRfT0ZGU0VULCA4KSkKICAgIGludGNfMiAvLyA4CiAgICBkdXAKICAgIGJveF9leHRyYWN0CiAgICBidG9pCiAgICBzd2FwCiAgICBidXJ5IDMKICAgIGIgZ2V0X3ByaWNlX2hpbnRfd2hpbGVfdG9wQDIKCmdldF9wcmljZV9oaW50X2FmdGVyX3doaWxlQDU6CiAgICAvLyBzbWFydF9jb250cmFjdHMvYWFybmFfcmVnaXN0cnkvY29udHJhY3QucHk6MTQzNQogICAgLy8gcmV0dXJuIGFyYzQuVUludDY0KHByZXYpCiAgICBkaWcgMgogICAgaXRvYgogICAgLy8gc21hcnRfY29udHJhY3RzL2Fhcm5hX3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjE0MjQKICAgIC8vIEBhcmM0LmFiaW1ldGhvZChyZWFkb25seT1UcnVlKQogICAgYnl0ZWNfMCAvLyAweDE1MWY3Yzc1CiAgICBzd2FwCiAgICBjb25jYXQKICAgIGxvZwogICAgaW50Y18xIC8vIDEKICAgIHJldHVybgoKCi8vIHNtYXJ0X2NvbnRyYWN0cy5hYXJuYV9yZWdpc3RyeS5jb250cmFjdC5BYXJuYVJlZ2lzdHJ5LmdldF9saXN0aW5nW3JvdXRpbmddKCkgLT4gdm9pZDoKZ2V0X2xpc3Rpbmc6CiAgICAvLyBzbWFydF9jb250cmFjdHMvYWFybmFfcmVnaXN0cnkvY29udHJhY3QucHk6MTQzNwogICAgLy8gQGFyYzQuYWJpbWV0aG9kKHJlYWRvbmx5PVRydWUpCiAgICB0eG5hIEFwcGxpY2F0aW9uQXJncyAxCiAgICBkdXAKICAgIGxlbgogICAgaW50Y18yIC8vIDgKICAgID09CiAgICBhc3NlcnQgLy8gaW52YWxpZCBudW1iZXIgb2YgYnl0ZXMgZm9yIGFyYzQudWludDY0CiAgICAvLyBzbWFydF9jb250cmFjdHMvYWFybmFfcmVnaXN0cnkvY29udHJhY3QucHk6MTQ0MAogICAgLy8gcmV0dXJuIHNlbGYubGlzdGluZ3MuZ2V0KGxpc3RpbmdfaWQubmF0aXZlLCBkZWZhdWx0PXNlbGYuX2VtcHR5X2xpc3RpbmcoKSkKICAgIGJ0b2kKICAgIGl0b2IKICAgIGJ5dGVjIDUgLy8gMHg2YwogICAgc3dhcAogICAgY29uY2F0CiAgICBib3hfZ2V0CiAgICAvLyBzbWFydF9jb250cmFjdHMvYWFybmFfcmVnaXN0cnkvY29udHJhY3QucHk6NzU4LTc2MwogICAgLy8gcmV0dXJuIExpc3RpbmdSZWNvcmQoCiAgICAvLyAgICAgc2VsbGVyPWFyYzQuQWRkcmVzcygpLAogICAgLy8gICAgIGFtb3VudD1hcmM0LlVJbnQ2NCgwKSwKICAgIC8vICAgICBwcmljZT1hcmM0LlVJbnQ2NCgwKSwKICAgIC8vICAgICBhY3RpdmU9YXJjNC5VSW50NjQoMCksCiAgICAvLyApCiAgICBieXRlYyAxNyAvLyBiYXNlMzIoQUFBQUFBQUFBQUFBQUFBQUFBQUFBQUFBQUFBQUFBQUFBQUFBQUFBQUFBQUFBQUFBQUFBQUFBQUFBQUFBQUFBQUFBQUFBQUFBQUFBQUFBQUFBQUFBQUFBQUFBKQogICAgLy8gc21hcnRfY29udHJhY3RzL2Fhcm5hX3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjE0NDAKICAgIC8vIHJldHVybiBzZWxmLmxpc3RpbmdzLmdldChsaXN0aW5nX2lkLm5hdGl2ZSwgZGVmYXVsdD1zZWxmLl9lbXB0eV9saXN0aW5nKCkpCiAgICBjb3ZlciAyCiAgICBzZWxlY3QKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hYXJuYV9yZWdpc3RyeS9jb250cmFjdC5weToxNDM3CiAgICAvLyBAYXJjNC5hYmltZXRob2QocmVhZG9ubHk9VHJ1ZSkKICAgIGJ5dGVjXzAgLy8gMHgxNTFmN2M3NQogICAgc3dhcAogICAgY29uY2F0CiAgICBsb2cKICAgIGludGNfMSAvLyAxCiAgICByZXR1cm4KCgovLyBzbWFydF9jb250cmFjdHMuYWFybmFfcmVnaXN0cnkuY29udHJhY3QuQWFybmFSZWdpc3RyeS5nZXRfbGlzdGluZ19jb3VudFtyb3V0aW5nXSgpIC0+IHZvaWQ6CmdldF9saXN0aW5nX2NvdW50OgogICAgLy8gc21hcnRfY29udHJhY3RzL2Fhcm5hX3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjE0NDUKICAgIC8vIHJldHVybiBhcmM0LlVJbnQ2NChzZWxmLmxpc3RpbmdfY291bnQpCiAgICBpbnRjXzAgLy8gMAogICAgYnl0ZWMgNyAvLyAibGlzdGluZ19jb3VudCIKICAgIGFwcF9nbG9iYWxfZ2V0X2V4CiAgICBhc3NlcnQgLy8gY2hlY2sgc2VsZi5saXN0aW5nX2NvdW50IGV4aXN0cwogICAgaXRvYgogICAgLy8gc21hcnRfY29udHJhY3RzL2Fhcm5hX3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjE0NDIKICAgIC8vIEBhcmM0LmFiaW1ldGhvZChyZWFkb25seT1UcnVlKQogICAgYnl0ZWNfMCAvLyAweDE1MWY3Yzc1CiAgICBzd2FwCiAgICBjb25jYXQKICAgIGxvZwogICAgaW50Y18xIC8vIDEKICAgIHJldHVybgoKCi8vIHNtYXJ0X2NvbnRyYWN0cy5hYXJuYV9yZWdpc3RyeS5jb250cmFjdC5BYXJuYVJlZ2lzdHJ5LmdldF9vcGVuX2xpc3RpbmdfY291bnRbcm91dGluZ10oKSAtPiB2b2lkOgpnZXRfb3Blbl9saXN0aW5nX2NvdW50OgogICAgLy8gc21hcnRfY29udHJhY3RzL2Fhcm5hX3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjE0NDkKICAgIC8vIHJldHVybiBhcmM0LlVJbnQ2NChzZWxmLm9wZW5fbGlzdGluZ19jb3VudCkKICAgIGludGNfMCAvLyAwCiAgICBieXRlYyAxMyAvLyAib3Blbl9saXN0aW5nX2NvdW50IgogICAgYXBwX2dsb2JhbF9nZXRfZXgKICAgIGFzc2VydCAvLyBjaGVjayBzZWxmLm9wZW5fbGlzdGluZ19jb3VudCBleGlzdHMKICAgIGl0b2IKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hYXJuYV9yZWdpc3RyeS9jb250cmFjdC5weToxNDQ3CiAgICAvLyBAYXJjNC5hYmltZXRob2QocmVhZG9ubHk9VHJ1ZSkKICAgIGJ5dGVjXzAgLy8gMHgxNTFmN2M3NQogICAgc3dhcAogICAgY29uY2F0CiAgICBsb2cKICAgIGludGNfMSAvLyAxCiAgICByZXR1cm4KCgovLyBzbWFydF9jb250cmFjdHMuYWFybmFfcmVnaXN0cnkuY29udHJhY3QuQWFybmFSZWdpc3RyeS5nZXRfcHJvamVjdHNfcGFnZVtyb3V0aW5nXSgpIC0+IHZvaWQ6CmdldF9wcm9qZWN0c19wYWdlOgogICAgcHVzaGJ5dGVzICIiCiAgICAvLyBzbWFydF9jb250cmFjdHMvYWFybmFfcmVnaXN0cnkvY29udHJhY3QucHk6MTQ1MS0xNDU0CiAgICAvLyAjIOKVkOKVkOKVkOKVkOKVkOKVkOKVkOKVkOKVkOKVkOKVkOKVkOKVkOKVkOKVkOKVkOKVkOKVkOKVkOKVkOKVkOKVkOKVkOKVkOKVkOKVkOKVkOKVkOKVkOKVkOKVkOKVkOKVkOKVkOKVkOKVkOKVkOKVkOKVkOKVkOKVkOKVkOKVkOKVkOKVkOKVkOKVkOKVkOKVkOKVkOKVkOKVkOKVkOKVkOKVkOKVkOKVkOKVkOKVkOKVkOKVkOKVkOKVkOKVkOKVkOKVkOKVkOKVkOKVkOKVkAogICAgLy8gIyBQYWdlZCBidWxrIHJlYWRzIOKAlCBvbmUgc2ltdWxhdGUgY2FsbCBpbnN0ZWFkIG9mIG9uZSByZWFkIHBlciBpZAogICAgLy8gIyDilZDilZDilZDilZDilZDilZDilZDilZDilZDilZDilZDilZDilZDilZDilZDilZDilZDilZDilZDilZDilZDilZDilZDilZDilZDilZDilZDilZDilZDilZDilZDilZDilZDilZDilZDilZDilZDilZDilZDilZDilZDilZDilZDilZDilZDilZDilZDilZDilZDilZDilZDilZDilZDilZDilZDilZDilZDilZDilZDilZDilZDilZDilZDilZDilZDilZDilZDilZDilZDilZAKICAgIC8vIEBhcmM0LmFiaW1ldGhvZChyZWFkb25seT1UcnVlKQogICAgdHhuYSBBcHBsaWNhdGlvbkFyZ3MgMQogICAgZHVwCiAgICBsZW4KICAgIGludGNfMiAvLyA4CiAgICA9PQogICAgYXNzZXJ0IC8vIGludmFsaWQgbnVtYmVyIG9mIGJ5dGVzIGZvciBhcmM0LnVpbnQ2NAogICAgdHhuYSBBcHBsaWNhdGlvbkFyZ3MgMgogICAgZHVwCiAgICBsZW4KICAgIGludGNfMiAvLyA4CiAgICA9PQogICAgYXNzZXJ0IC8vIGludmFsaWQgbnVtYmVyIG9mIGJ5dGVzIGZvciBhcmM0LnVpbnQ2NAogICAgLy8gc21hcnRfY29udHJhY3RzL2Fhcm5hX3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjE0NjQKICAgIC8vIGVuZCA9IHNlbGYuX3BhZ2VfZW5kKHN0YXJ0Lm5hdGl2ZSwgY291bnQubmF0aXZlLCBzZWxmLnByb2plY3RfY291bnQpCiAgICBzd2FwCiAgICBidG9pCiAgICBkdXAKICAgIHVuY292ZXIgMgogICAgYnRvaQogICAgaW50Y18wIC8vIDAKICAgIGJ5dGVjXzIgLy8gInByb2plY3RfY291bnQiCiAgICBhcHBfZ2xvYmFsX2dldF9leAogICAgYXNzZXJ0IC8vIGNoZWNrIHNlbGYucHJvamVjdF9jb3VudCBleGlzdHMKICAgIGNhbGxzdWIgX3BhZ2VfZW5kCiAgICBzd2FwCiAgICAvLyBzbWFydF9jb250cmFjdHMvYWFybmFfcmVnaXN0cnkvY29udHJhY3QucHk6MTQ2NQogICAgLy8gaXRlbXMgPSBhcmM0LkR5bmFtaWNBcnJheVtQcm9qZWN0UmVjb3JkXSgpCiAgICBieXRlYyAxNCAvLyAweDAwMDAKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hYXJuYV9yZWdpc3RyeS9jb250cmFjdC5weToxNDY2CiAgICAvLyBzaXplID0gVUludDY0KFBBR0VfSEVBREVSX0JZVEVTKQogICAgcHVzaGludCAxMgoKZ2V0X3Byb2plY3RzX3BhZ2Vfd2hpbGVfdG9wQDI6CiAgICAvLyBzbWFydF9jb250cmFjdHMvYWFybmFfcmVnaXN0cnkvY29udHJhY3QucHk6MTQ2OAogICAgLy8gd2hpbGUgcGlkIDwgZW5kIGFuZCBHbG9iYWwub3Bjb2RlX2J1ZGdldCgpID4gUEFHRV9CVURHRVRfUkVTRVJWRToKICAgIGRpZyAyCiAgICBkaWcgNAogICAgPAogICAgYnogZ2V0X3Byb2plY3RzX3BhZ2VfYWZ0ZXJfd2hpbGVANwogICAgZ2xvYmFsIE9wY29kZUJ1ZGdldAogICAgaW50YyA3IC8vIDUwMAogICAgPgogICAgYnogZ2V0X3Byb2plY3RzX3BhZ2VfYWZ0ZXJfd2hpbGVANwogICAgLy8gc21hcnRfY29udHJhY3RzL2Fhcm5hX3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjE0NjktMTQ3MAogICAgLy8gIyBFYWNoIGR5bmFtaWMgZWxlbWVudCBhbHNvIGNvc3RzIGEgMi1ieXRlIG9mZnNldCBpbiB0aGUgYXJyYXkgaGVhZC4KICAgIC8vIHJlY29yZF9zaXplID0gc2VsZi5wcm9qZWN0X21ldGEubGVuZ3RoKHBpZCkgKyBSRUNPUkRfRVhUUkFfQllURVMgKyAyCiAgICBkaWcgMgogICAgaXRvYgogICAgYnl0ZWMgMjkgLy8gMHg2ZAogICAgc3dhcAogICAgY29uY2F0CiAgICBib3hfbGVuCiAgICBhc3NlcnQgLy8gY2hlY2sgc2VsZi5wcm9qZWN0X21ldGEgZW50cnkgZXhpc3RzCiAgICBwdXNoaW50IDUwCiAgICArCiAgICAvLyBzbWFydF9jb250cmFjdHMvYWFybmFfcmVnaXN0cnkvY29udHJhY3QucHk6MTQ3MQogICAgLy8gaWYgc2l6ZSArIHJlY29yZF9zaXplID4gTUFYX1JFVFVSTl9CWVRFUzoKICAgICsKICAgIGR1cAogICAgcHVzaGludCAxMDIwCiAgICA+CiAgICBibnogZ2V0X3Byb2plY3RzX3BhZ2VfYWZ0ZXJfd2hpbGVANwogICAgLy8gc21hcnRfY29udHJhY3RzL2Fhcm5hX3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjE0NzMKICAgIC8vIGl0ZW1zLmFwcGVuZChzZWxmLl9sb2FkX3Byb2plY3QocGlkKSkKICAgIGRpZyAyCiAgICBjYWxsc3ViIF9sb2FkX3Byb2plY3QKICAgIHB1c2hieXRlcyAweDAwMDIKICAgIHN3YXAKICAgIGNvbmNhdAogICAgY292ZXIgMwogICAgc3dhcAogICAgZHVwCiAgICBpbnRjXzAgLy8gMAogICAgZXh0cmFjdF91aW50MTYKICAgIGR1cAogICAgLy8gc21hcnRfY29udHJhY3RzL2Fhcm5hX3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjE0NzMKICAgIC8vIGl0ZW1zLmFwcGVuZChzZWxmLl9sb2FkX3Byb2plY3QocGlkKSkKICAgIGludGNfMSAvLyAxCiAgICArCiAgICBpdG9iCiAgICBleHRyYWN0IDYgMAogICAgY292ZXIgNAogICAgc3dhcAogICAgZXh0cmFjdCAyIDAKICAgIGNvdmVyIDIKICAgIGludGNfMyAvLyAyCiAgICAqCiAgICBjb3ZlciAyCiAgICBpbnRjXzAgLy8gMAogICAgYnVyeSA4CgpnZXRfcHJvamVjdHNfcGFnZV9mb3JfaGVhZGVyQDk6CiAgICBkaWcgNwogICAgZGlnIDMKICAgIDwKICAgIGJ6IGdldF9wcm9qZWN0c19wYWdlX2FmdGVyX2ZvckAxMQogICAgZGlnIDEKICAgIGRpZyA4CiAgICBkdXAKICAgIGNvdmVyIDIKICAgIGV4dHJhY3RfdWludDE2CiAgICBpbnRjXzMgLy8gMgogICAgKwogICAgaXRvYgogICAgZXh0cmFjdCA2IDAKICAgIHVuY292ZXIgNgogICAgc3dhcAogICAgY29uY2F0CiAgICBjb3ZlciA1CiAgICBpbnRjXzMgLy8gMgogICAgKwogICAgYnVyeSA4CiAgICBiIGdldF9wcm9qZWN0c19wYWdlX2Zvcl9oZWFkZXJAOQoKZ2V0X3Byb2plY3RzX3BhZ2VfYWZ0ZXJfZm9yQDExOgogICAgZGlnIDEKICAgIGxlbgogICAgY292ZXIgNAogICAgaW50Y18wIC8vIDAKICAgIGJ1cnkgOQoKZ2V0X3Byb2plY3RzX3BhZ2VfZm9yX2hlYWRlckAxMjoKICAgIGRpZyA4CiAgICBpbnRjXzMgLy8gMgogICAgPAogICAgYnogZ2V0X3Byb2plY3RzX3BhZ2VfYWZ0ZXJfZm9yQDE0CiAgICBkaWcgNgogICAgZGlnIDkKICAgIGR1cAogICAgY292ZXIgMgogICAgZXh0cmFjdF91aW50MTYKICAgIGRpZyA2CiAgICArCiAgICBpdG9iCiAgICBleHRyYWN0IDYgMAogICAgdW5jb3ZlciA3CiAgICBzd2FwCiAgICBjb25jYXQKICAgIGNvdmVyIDYKICAgIGludGNfMyAvLyAyCiAgICArCiAgICBidXJ5IDkKICAgIGIgZ2V0X3Byb2plY3RzX3BhZ2VfZm9yX2hlYWRlckAxMgoKZ2V0X3Byb2plY3RzX3BhZ2VfYWZ0ZXJfZm9yQDE0OgogICAgc3dhcAogICAgdW5jb3ZlciAyCiAgICB1bmNvdmVyIDQKICAgIHN1YnN0cmluZzMKICAgIHVuY292ZXIgMwogICAgc3dhcAogICAgY29uY2F0CiAgICB1bmNvdmVyIDMKICAgIGV4dHJhY3QgMiAwCiAgICBjb25jYXQKICAgIHN3YXAKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hYXJuYV9yZWdpc3RyeS9jb250cmFjdC5weToxNDc1CiAgICAvLyBwaWQgKz0gMQogICAgdW5jb3ZlciAyCiAgICBpbnRjXzEgLy8gMQogICAgKwogICAgY292ZXIgMgogICAgYiBnZXRfcHJvamVjdHNfcGFnZV93aGlsZV90b3BAMgoKZ2V0X3Byb2plY3RzX3BhZ2VfYWZ0ZXJfd2hpbGVANzoKICAgIHBvcAogICAgLy8gc21hcnRfY29udHJhY3RzL2Fhcm5hX3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjE0NzYKICAgIC8vIHJldHVybiBQcm9qZWN0UGFnZShuZXh0X2lkPWFyYzQuVUludDY0KHBpZCksIGl0ZW1zPWl0ZW1zLmNvcHkoKSkKICAgIHN3YXAKICAgIGl0b2IKICAgIGJ5dGVjIDMxIC8vIDB4MDAwYQogICAgY29uY2F0CiAgICBzd2FwCiAgICBjb25jYXQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hYXJuYV9yZWdpc3RyeS9jb250cmFjdC5weToxNDUxLTE0NTQKICAgIC8vICMg4pWQ4pWQ4pWQ4pWQ4pWQ4pWQ4pWQ4pWQ4pWQ4pWQ4pWQ4pWQ4pWQ4pWQ4pWQ4pWQ4pWQ4pWQ4pWQ4pWQ4pWQ4pWQ4pWQ4pWQ4pWQ4pWQ4pWQ4pWQ4pWQ4pWQ4pWQ4pWQ4pWQ4pWQ4pWQ4pWQ4pWQ4pWQ4pWQ4pWQ4pWQ4pWQ4pWQ4pWQ4pWQ4pWQ4pWQ4pWQ4pWQ4pWQ4pWQ4pWQ4pWQ4pWQ4pWQ4pWQ4pWQ4pWQ4pWQ4pWQ4pWQ4pWQ4pWQ4pWQ4pWQ4pWQ4pWQ4pWQ4pWQ4pWQCiAgICAvLyAjIFBhZ2VkIGJ1bGsgcmVhZHMg4oCUIG9uZSBzaW11bGF0ZSBjYWxsIGluc3RlYWQgb2Ygb25lIHJlYWQgcGVyIGlkCiAgICAvLyAjIOKVkOKVkOKVkOKVkOKVkOKVkOKVkOKVkOKVkOKVkOKVkOKVkOKVkOKVkOKVkOKVkOKVkOKVkOKVkOKVkOKVkOKVkOKVkOKVkOKVkOKVkOKVkOKVkOKVkOKVkOKVkOKVkOKVkOKVkOKVkOKVkOKVkOKVkOKVkOKVkOKVkOKVkOKVkOKVkOKVkOKVkOKVkOKVkOKVkOKVkOKVkOKVkOKVkOKVkOKVkOKVkOKVkOKVkOKVkOKVkOKVkOKVkOKVkOKVkOKVkOKVkOKVkOKVkOKVkOKVkAogICAgLy8gQGFyYzQuYWJpbWV0aG9kKHJlYWRvbmx5PVRydWUpCiAgICBieXRlY18wIC8vIDB4MTUxZjdjNzUKICAgIHN3YXAKICAgIGNvbmNhdAogICAgbG9nCiAgICBpbnRjXzEgLy8gMQogICAgcmV0dXJuCgoKLy8gc21hcnRfY29udHJhY3RzLmFhcm5hX3JlZ2lzdHJ5LmNvbnRyYWN0LkFhcm5hUmVnaXN0cnkuZ2V0X2xpc3RpbmdzX3BhZ2Vbcm91dGluZ10oKSAtPiB2b2lkOgpnZXRfbGlzdGluZ3NfcGFnZToKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hYXJuYV9yZWdpc3RyeS9jb250cmFjdC5weToxNDc4CiAgICAvLyBAYXJjNC5hYmltZXRob2QocmVhZG9ubHk9VHJ1ZSkKICAgIHR4bmEgQXBwbGljYXRpb25BcmdzIDEKICAgIGR1cAogICAgbGVuCiAgICBpbnRjXzIgLy8gOAogICAgPT0KICAgIGFzc2VydCAvLyBpbnZhbGlkIG51bWJlciBvZiBieXRlcyBmb3IgYXJjNC51aW50NjQKICAgIHR4bmEgQXBwbGljYXRpb25BcmdzIDIKICAgIGR1cAogICAgbGVuCiAgICBpbnRjXzIgLy8gOAogICAgPT0KICAgIGFzc2VydCAvLyBpbnZhbGlkIG51bWJlciBvZiBieXRlcyBmb3IgYXJjNC51aW50NjQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hYXJuYV9yZWdpc3RyeS9jb250cmFjdC5weToxNDg4CiAgICAvLyBlbmQgPSBzZWxmLl9wYWdlX2VuZChzdGFydC5uYXRpdmUsIGNvdW50Lm5hdGl2ZSwgc2VsZi5saXN0aW5nX2NvdW50KQogICAgc3dhcAogICAgYnRvaQogICAgZHVwCiAgICB1bmNvdmVyIDIKICAgIGJ0b2kKICAgIGludGNfMCAvLyAwCiAgICBieXRlYyA3IC8vICJsaXN0aW5nX2NvdW50IgogICAgYXBwX2dsb2JhbF9nZXRfZXgKICAgIGFzc2VydCAvLyBjaGVjayBzZWxmLmxpc3RpbmdfY291bnQgZXhpc3RzCiAgICBjYWxsc3ViIF9wYWdlX2VuZAogICAgc3dhcAogICAgLy8gc21hcnRfY29udHJhY3RzL2Fhcm5hX3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjE0ODkKICAgIC8vIGl0ZW1zID0gYXJjNC5EeW5hbWljQXJyYXlbTGlzdGluZ1JlY29yZF0oKQogICAgYnl0ZWMgMTQgLy8gMHgwMDAwCiAgICBzd2FwCiAgICAvLyBzbWFydF9jb250cmFjdHMvYWFybmFfcmVnaXN0cnkvY29udHJhY3QucHk6MTQ5MAogICAgLy8gc2l6ZSA9IFVJbnQ2NChQQUdFX0hFQURFUl9CWVRFUykKICAgIHB1c2hpbnQgMTIKCmdldF9saXN0aW5nc19wYWdlX3doaWxlX3RvcEAyOgogICAgLy8gc21hcnRfY29udHJhY3RzL2Fhcm5hX3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjE0OTIKICAgIC8vIHdoaWxlIGxpZCA8IGVuZCBhbmQgR2xvYmFsLm9wY29kZV9idWRnZXQoKSA+IFBBR0VfQlVER0VUX1JFU0VSVkU6CiAgICBkaWcgMQogICAgZGlnIDQKICAgIDwKICAgIGJ6IGdldF9saXN0aW5nc19wYWdlX2FmdGVyX3doaWxlQDcKICAgIGdsb2JhbCBPcGNvZGVCdWRnZXQKICAgIGludGMgNyAvLyA1MDAKICAgID4KICAgIGJ6IGdldF9saXN0aW5nc19wYWdlX2FmdGVyX3doaWxlQDcKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hYXJuYV9yZWdpc3RyeS9jb250cmFjdC5weToxNDkzCiAgICAvLyBpZiBzaXplICsgTElTVElOR19SRUNPUkRfQllURVMgPiBNQVhfUkVUVVJOX0JZVEVTOgogICAgcHVzaGludCA1NgogICAgKwogICAgZHVwCiAgICBwdXNoaW50IDEwMjAKICAgID4KICAgIGJueiBnZXRfbGlzdGluZ3NfcGFnZV9hZnRlcl93aGlsZUA3CiAgICAvLyBzbWFydF9jb250cmFjdHMvYWFybmFfcmVnaXN0cnkvY29udHJhY3QucHk6MTQ5NQogICAgLy8gaXRlbXMuYXBwZW5kKHNlbGYubGlzdGluZ3MuZ2V0KGxpZCwgZGVmYXVsdD1zZWxmLl9lbXB0eV9saXN0aW5nKCkpLmNvcHkoKSkKICAgIHN3YXAKICAgIGR1cAogICAgaXRvYgogICAgYnl0ZWMgNSAvLyAweDZjCiAgICBzd2FwCiAgICBjb25jYXQKICAgIGJveF9nZXQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hYXJuYV9yZWdpc3RyeS9jb250cmFjdC5weTo3NTgtNzYzCiAgICAvLyByZXR1cm4gTGlzdGluZ1JlY29yZCgKICAgIC8vICAgICBzZWxsZXI9YXJjNC5BZGRyZXNzKCksCiAgICAvLyAgICAgYW1vdW50PWFyYzQuVUludDY0KDApLAogICAgLy8gICAgIHByaWNlPWFyYzQuVUludDY0KDApLAogICAgLy8gICAgIGFjdGl2ZT1hcmM0LlVJbnQ2NCgwKSwKICAgIC8vICkKICAgIGJ5dGVjIDE3IC8vIGJhc2UzMihBQUFBQUFBQUFBQUFBQUFBQUFBQUFBQUFBQUFBQUFBQUFBQUFBQUFBQUFBQUFBQUFBQUFBQUFBQUFBQUFBQUFBQUFBQUFBQUFBQUFBQUFBQUFBQUFBQUFBQUEpCiAgICAvLyBzbWFydF9jb250cmFjdHMvYWFybmFfcmVnaXN0cnkvY29udHJhY3QucHk6MTQ5NQogICAgLy8gaXRlbXMuYXBwZW5kKHNlbGYubGlzdGluZ3MuZ2V0KGxpZCwgZGVmYXVsdD1zZWxmLl9lbXB0eV9saXN0aW5nKCkpLmNvcHkoKSkKICAgIGNvdmVyIDIKICAgIHNlbGVjdAogICAgdW5jb3ZlciAzCiAgICBkdXAKICAgIGludGNfMCAvLyAwCiAgICBleHRyYWN0X3VpbnQxNgogICAgLy8gc21hcnRfY29udHJhY3RzL2Fhcm5hX3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjE0OTUKICAgIC8vIGl0ZW1zLmFwcGVuZChzZWxmLmxpc3RpbmdzLmdldChsaWQsIGRlZmF1bHQ9c2VsZi5fZW1wdHlfbGlzdGluZygpKS5jb3B5KCkpCiAgICBpbnRjXzEgLy8gMQogICAgKwogICAgaXRvYgogICAgZXh0cmFjdCA2IDAKICAgIHJlcGxhY2UyIDAKICAgIHN3YXAKICAgIGNvbmNhdAogICAgY292ZXIgMgogICAgLy8gc21hcnRfY29udHJhY3RzL2Fhcm5hX3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjE0OTcKICAgIC8vIGxpZCArPSAxCiAgICBpbnRjXzEgLy8gMQogICAgKwogICAgc3dhcAogICAgYiBnZXRfbGlzdGluZ3NfcGFnZV93aGlsZV90b3BAMgoKZ2V0X2xpc3RpbmdzX3BhZ2VfYWZ0ZXJfd2hpbGVANzoKICAgIHBvcAogICAgLy8gc21hcnRfY29udHJhY3RzL2Fhcm5hX3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjE0OTgKICAgIC8vIHJldHVybiBMaXN0aW5nUGFnZShuZXh0X2lkPWFyYzQuVUludDY0KGxpZCksIGl0ZW1zPWl0ZW1zLmNvcHkoKSkKICAgIGl0b2IKICAgIGJ5dGVjIDMxIC8vIDB4MDAwYQogICAgY29uY2F0CiAgICBzd2FwCiAgICBjb25jYXQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hYXJuYV9yZWdpc3RyeS9jb250cmFjdC5weToxNDc4CiAgICAvLyBAYXJjNC5hYmltZXRob2QocmVhZG9ubHk9VHJ1ZSkKICAgIGJ5dGVjXzAgLy8gMHgxNTFmN2M3NQogICAgc3dhcAogICAgY29uY2F0CiAgICBsb2cKICAgIGludGNfMSAvLyAxCiAgICByZXR1cm4KCgovLyBzbWFydF9jb250cmFjdHMuYWFybmFfcmVnaXN0cnkuY29udHJhY3QuQWFybmFSZWdpc3RyeS5fb25seV9hZG1pbigpIC0+IHZvaWQ6Cl9vbmx5X2FkbWluOgogICAgLy8gc21hcnRfY29udHJhY3RzL2Fhcm5hX3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjQ2MwogICAgLy8gYXNzZXJ0IFR4bi5zZW5kZXIgPT0gc2VsZi5hZG1pbi5uYXRpdmUsICJ1bmF1dGhvcml6ZWQ6IGFkbWluIG9ubHkiCiAgICB0eG4gU2VuZGVyCiAgICBpbnRjXzAgLy8gMAogICAgYnl0ZWMgMTggLy8gImFkbWluIgogICAgYXBwX2dsb2JhbF9nZXRfZXgKICAgIGFzc2VydCAvLyBjaGVjayBzZWxmLmFkbWluIGV4aXN0cwogICAgPT0KICAgIGFzc2VydCAvLyB1bmF1dGhvcml6ZWQ6IGFkbWluIG9ubHkKICAgIHJldHN1YgoKCi8vIHNtYXJ0X2NvbnRyYWN0cy5hYXJuYV9yZWdpc3RyeS5jb250cmFjdC5BYXJuYVJlZ2lzdHJ5Ll9vbmx5X3ZhbGlkYXRvcigpIC0+IHZvaWQ6Cl9vbmx5X3ZhbGlkYXRvcjoKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hYXJuYV9yZWdpc3RyeS9jb250cmFjdC5weTo0NjcKICAgIC8vIGFzc2VydCBUeG4uc2VuZGVyID09IHNlbGYudmFsaWRhdG9yLm5hdGl2ZSwgInVuYXV0aG9yaXplZDogdmFsaWRhdG9yIG9ubHkiCiAgICB0eG4gU2VuZGVyCiAgICBpbnRjXzAgLy8gMAogICAgYnl0ZWMgMTkgLy8gInZhbGlkYXRvciIKICAgIGFwcF9nbG9iYWxfZ2V0X2V4CiAgICBhc3NlcnQgLy8gY2hlY2sgc2VsZi52YWxpZGF0b3IgZXhpc3RzCiAgICA9PQogICAgYXNzZXJ0IC8vIHVuYXV0aG9yaXplZDogdmFsaWRhdG9yIG9ubHkKICAgIHJldHN1YgoKCi8vIHNtYXJ0X2NvbnRyYWN0cy5hYXJuYV9yZWdpc3RyeS5jb250cmFjdC5BYXJuYVJlZ2lzdHJ5Ll9wYWdlX2VuZChzdGFydDogdWludDY0LCBjb3VudDogdWludDY0LCB0b3RhbDogdWludDY0KSAtPiB1aW50NjQ6Cl9wYWdlX2VuZDoKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hYXJuYV9yZWdpc3RyeS9jb250cmFjdC5weTo0NjktNDcwCiAgICAvLyBAc3Vicm91dGluZQogICAgLy8gZGVmIF9wYWdlX2VuZChzZWxmLCBzdGFydDogVUludDY0LCBjb3VudDogVUludDY0LCB0b3RhbDogVUludDY0KSAtPiBVSW50NjQ6CiAgICBwcm90byAzIDEKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hYXJuYV9yZWdpc3RyeS9jb250cmFjdC5weTo0NzIKICAgIC8vIGlmIHN0YXJ0ID49IHRvdGFsOgogICAgZnJhbWVfZGlnIC0zCiAgICBmcmFtZV9kaWcgLTEKICAgID49CiAgICBieiBfcGFnZV9lbmRfYWZ0ZXJfaWZfZWxzZUAyCiAgICAvLyBzbWFydF9jb250cmFjdHMvYWFybmFfcmVnaXN0cnkvY29udHJhY3QucHk6NDczCiAgICAvLyByZXR1cm4gc3RhcnQKICAgIGZyYW1lX2RpZyAtMwogICAgcmV0c3ViCgpfcGFnZV9lbmRfYWZ0ZXJfaWZfZWxzZUAyOgogICAgLy8gc21hcnRfY29udHJhY3RzL2Fhcm5hX3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjQ3NAogICAgLy8gaWYgY291bnQgPCB0b3RhbCAtIHN0YXJ0OgogICAgZnJhbWVfZGlnIC0xCiAgICBmcmFtZV9kaWcgLTMKICAgIC0KICAgIGZyYW1lX2RpZyAtMgogICAgPgogICAgYnogX3BhZ2VfZW5kX2FmdGVyX2lmX2Vsc2VANAogICAgLy8gc21hcnRfY29udHJhY3RzL2Fhcm5hX3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjQ3NQogICAgLy8gcmV0dXJuIHN0YXJ0ICsgY291bnQKICAgIGZyYW1lX2RpZyAtMwogICAgZnJhbWVfZGlnIC0yCiAgICArCiAgICByZXRzdWIKCl9wYWdlX2VuZF9hZnRlcl9pZl9lbHNlQDQ6CiAgICAvLyBzbWFydF9jb250cmFjdHMvYWFybmFfcmVnaXN0cnkvY29udHJhY3QucHk6NDc2CiAgICAvLyByZXR1cm4gdG90YWwKICAgIGZyYW1lX2RpZyAtMQogICAgcmV0c3ViCgoKLy8gc21hcnRfY29udHJhY3RzLmFhcm5hX3JlZ2lzdHJ5LmNvbnRyYWN0LkFhcm5hUmVnaXN0cnkuX21hcmtfdmVyaWZpZWQocGlkOiB1aW50NjQsIGNyZWRpdHM6IHVpbnQ2NCkgLT4gdm9pZDoKX21hcmtfdmVyaWZpZWQ6CiAgICAvLyBzbWFydF9jb250cmFjdHMvYWFybmFfcmVnaXN0cnkvY29udHJhY3QucHk6NDk4LTUwMAogICAgLy8gIyDilIDilIAgU3RhdHVzIHRyYW5zaXRpb25zOiBoZWFkZXIsIHF1ZXVlLCBjb3VudGVycyBhbmQgZXZlbnQgbW92ZSB0b2dldGhlciDilIDilIAKICAgIC8vIEBzdWJyb3V0aW5lCiAgICAvLyBkZWYgX21hcmtfdmVyaWZpZWQoc2VsZiwgcGlkOiBVSW50NjQsIGNyZWRpdHM6IFVJbnQ2NCkgLT4gTm9uZToKICAgIHByb3RvIDIgMAogICAgLy8gc21hcnRfY29udHJhY3RzL2Fhcm5hX3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjMxNQogICAgLy8gcmV0dXJuIEJ5dGVzKEhFQURFUl9LRVlfUFJFRklYKSArIG9wLml0b2IocGlkKQogICAgZnJhbWVfZGlnIC0yCiAgICBpdG9iCiAgICBieXRlY18zIC8vIDB4NjgKICAgIGRpZyAxCiAgICBjb25jYXQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hYXJuYV9yZWdpc3RyeS9jb250cmFjdC5weTo1MDEKICAgIC8vIHNlbGYuX3NldF9zdGF0dXNfYW5kX2NyZWRpdHMocGlkLCBVSW50NjQoMiksIGNyZWRpdHMpCiAgICBpbnRjXzMgLy8gMgogICAgLy8gc21hcnRfY29udHJhY3RzL2Fhcm5hX3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjQ5NQogICAgLy8gb3AuaXRvYihzdGF0dXMpICsgb3AuaXRvYihjcmVkaXRzKSwKICAgIGl0b2IKICAgIGZyYW1lX2RpZyAtMQogICAgaXRvYgogICAgc3dhcAogICAgZGlnIDEKICAgIGNvbmNhdAogICAgLy8gc21hcnRfY29udHJhY3RzL2Fhcm5hX3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjQ5MS00OTYKICAgIC8vICMgc3RhdHVzIGFuZCBjcmVkaXRzIGFyZSBhZGphY2VudCwgc28gb25lIDE2LWJ5dGUgd3JpdGUgY292ZXJzIGJvdGgKICAgIC8vIG9wLkJveC5yZXBsYWNlKAogICAgLy8gICAgIF9oZWFkZXJfa2V5KHBpZCksCiAgICAvLyAgICAgSEVBREVSX1NUQVRVU19PRkZTRVQsCiAgICAvLyAgICAgb3AuaXRvYihzdGF0dXMpICsgb3AuaXRvYihjcmVkaXRzKSwKICAgIC8vICkKICAgIHVuY292ZXIgMgogICAgLy8gc21hcnRfY29udHJhY3RzL2Fhcm5hX3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjQ5NAogICAgLy8gSEVBREVSX1NUQVRVU19PRkZTRVQsCiAgICBwdXNoaW50IDMyCiAgICAvLyBzbWFydF9jb250cmFjdHMvYWFybmFfcmVnaXN0cnkvY29udHJhY3QucHk6NDkxLTQ5NgogICAgLy8gIyBzdGF0dXMgYW5kIGNyZWRpdHMgYXJlIGFkamFjZW50LCBzbyBvbmUgMTYtYnl0ZSB3cml0ZSBjb3ZlcnMgYm90aAogICAgLy8gb3AuQm94LnJlcGxhY2UoCiAgICAvLyAgICAgX2hlYWRlcl9rZXkocGlkKSwKICAgIC8vICAgICBIRUFERVJfU1RBVFVTX09GRlNFVCwKICAgIC8vICAgICBvcC5pdG9iKHN0YXR1cykgKyBvcC5pdG9iKGNyZWRpdHMpLAogICAgLy8gKQogICAgdW5jb3ZlciAyCiAgICBib3hfcmVwbGFjZQogICAgLy8gc21hcnRfY29udHJhY3RzL2Fhcm5hX3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjU5OQogICAgLy8gc2VsZi5fcXVldWVfcmVtb3ZlKFVJbnQ2NCgxKSwgcGlkKQogICAgaW50Y18xIC8vIDEKICAgIGZyYW1lX2RpZyAtMgogICAgY2FsbHN1YiBfcXVldWVfcmVtb3ZlCiAgICAvLyBzbWFydF9jb250cmFjdHMvYWFybmFfcmVnaXN0cnkvY29udHJhY3QucHk6NjAwCiAgICAvLyBzZWxmLl9xdWV1ZV9wdXNoKFVJbnQ2NCgyKSwgcGlkKQogICAgaW50Y18zIC8vIDIKICAgIGZyYW1lX2RpZyAtMgogICAgY2FsbHN1YiBfcXVldWVfcHVzaAogICAgLy8gc21hcnRfY29udHJhY3RzL2Fhcm5hX3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjUwMwogICAgLy8gc2VsZi5wZW5kaW5nX2NvdW50IC09IDEKICAgIGludGNfMCAvLyAwCiAgICBieXRlYyA4IC8vICJwZW5kaW5nX2NvdW50IgogICAgYXBwX2dsb2JhbF9nZXRfZXgKICAgIGFzc2VydCAvLyBjaGVjayBzZWxmLnBlbmRpbmdfY291bnQgZXhpc3RzCiAgICBpbnRjXzEgLy8gMQogICAgLQogICAgYnl0ZWMgOCAvLyAicGVuZGluZ19jb3VudCIKICAgIHN3YXAKICAgIGFwcF9nbG9iYWxfcHV0CiAgICAvLyBzbWFydF9jb250cmFjdHMvYWFybmFfcmVnaXN0cnkvY29udHJhY3QucHk6NTA0CiAgICAvLyBzZWxmLnZlcmlmaWVkX2NvdW50ICs9IDEKICAgIGludGNfMCAvLyAwCiAgICBieXRlYyAxNiAvLyAidmVyaWZpZWRfY291bnQiCiAgICBhcHBfZ2xvYmFsX2dldF9leAogICAgYXNzZXJ0IC8vIGNoZWNrIHNlbGYudmVyaWZpZWRfY291bnQgZXhpc3RzCiAgICBpbnRjXzEgLy8gMQogICAgKwogICAgYnl0ZWMgMTYgLy8gInZlcmlmaWVkX2NvdW50IgogICAgc3dhcAogICAgYXBwX2dsb2JhbF9wdXQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hYXJuYV9yZWdpc3RyeS9jb250cmFjdC5weTo1MDYKICAgIC8vIFByb2plY3RBcHByb3ZlZChwcm9qZWN0X2lkPWFyYzQuVUludDY0KHBpZCksIGNyZWRpdHM9YXJjNC5VSW50NjQoY3JlZGl0cykpCiAgICBjb25jYXQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hYXJuYV9yZWdpc3RyeS9jb250cmFjdC5weTo1MDUtNTA3CiAgICAvLyBhcmM0LmVtaXQoCiAgICAvLyAgICAgUHJvamVjdEFwcHJvdmVkKHByb2plY3RfaWQ9YXJjNC5VSW50NjQocGlkKSwgY3JlZGl0cz1hcmM0LlVJbnQ2NChjcmVkaXRzKSkKICAgIC8vICkKICAgIHB1c2hieXRlcyAweDBmNjYzZTc5IC8vIG1ldGhvZCAiUHJvamVjdEFwcHJvdmVkKHVpbnQ2NCx1aW50NjQpIgogICAgc3dhcAogICAgY29uY2F0CiAgICBsb2cKICAgIHJldHN1YgoKCi8vIHNtYXJ0X2NvbnRyYWN0cy5hYXJuYV9yZWdpc3RyeS5jb250cmFjdC5BYXJuYVJlZ2lzdHJ5Ll9tYXJrX3JlamVjdGVkKHBpZDogdWludDY0KSAtPiB2b2lkOgpfbWFya19yZWplY3RlZDoKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hYXJuYV9yZWdpc3RyeS9jb250cmFjdC5weTo1MDktNTEwCiAgICAvLyBAc3Vicm91dGluZQogICAgLy8gZGVmIF9tYXJrX3JlamVjdGVkKHNlbGYsIHBpZDogVUludDY0KSAtPiBOb25lOgogICAgcHJvdG8gMSAwCiAgICAvLyBzbWFydF9jb250cmFjdHMvYWFybmFfcmVnaXN0cnkvY29udHJhY3QucHk6MzE1CiAgICAvLyByZXR1cm4gQnl0ZXMoSEVBREVSX0tFWV9QUkVGSVgpICsgb3AuaXRvYihwaWQpCiAgICBmcmFtZV9kaWcgLTEKICAgIGl0b2IKICAgIGJ5dGVjXzMgLy8gMHg2OAogICAgZGlnIDEKICAgIGNvbmNhdAogICAgLy8gc21hcnRfY29udHJhY3RzL2Fhcm5hX3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjUxMQogICAgLy8gc2VsZi5fc2V0X3N0YXR1cyhwaWQsIFVJbnQ2NCgzKSkKICAgIHB1c2hpbnQgMwogICAgLy8gc21hcnRfY29udHJhY3RzL2Fhcm5hX3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjQ4NQogICAgLy8gb3AuQm94LnJlcGxhY2UoX2hlYWRlcl9rZXkocGlkKSwgSEVBREVSX1NUQVRVU19PRkZTRVQsIG9wLml0b2Ioc3RhdHVzKSkKICAgIGl0b2IKICAgIHB1c2hpbnQgMzIKICAgIHN3YXAKICAgIGJveF9yZXBsYWNlCiAgICAvLyBzbWFydF9jb250cmFjdHMvYWFybmFfcmVnaXN0cnkvY29udHJhY3QucHk6NTEyCiAgICAvLyBzZWxmLl9xdWV1ZV9kcm9wKFVJbnQ2NCgxKSwgcGlkKQogICAgaW50Y18xIC8vIDEKICAgIGZyYW1lX2RpZyAtMQogICAgY2FsbHN1YiBfcXVldWVfZHJvcAogICAgLy8gc21hcnRfY29udHJhY3RzL2Fhcm5hX3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjUxMwogICAgLy8gc2VsZi5wZW5kaW5nX2NvdW50IC09IDEKICAgIGludGNfMCAvLyAwCiAgICBieXRlYyA4IC8vICJwZW5kaW5nX2NvdW50IgogICAgYXBwX2dsb2JhbF9nZXRfZXgKICAgIGFzc2VydCAvLyBjaGVjayBzZWxmLnBlbmRpbmdfY291bnQgZXhpc3RzCiAgICBpbnRjXzEgLy8gMQogICAgLQogICAgYnl0ZWMgOCAvLyAicGVuZGluZ19jb3VudCIKICAgIHN3YXAKICAgIGFwcF9nbG9iYWxfcHV0CiAgICAvLyBzbWFydF9jb250cmFjdHMvYWFybmFfcmVnaXN0cnkvY29udHJhY3QucHk6NTE0CiAgICAvLyBzZWxmLnJlamVjdGVkX2NvdW50ICs9IDEKICAgIGludGNfMCAvLyAwCiAgICBieXRlYyAyMSAvLyAicmVqZWN0ZWRfY291bnQiCiAgICBhcHBfZ2xvYmFsX2dldF9leAogICAgYXNzZXJ0IC8vIGNoZWNrIHNlbGYucmVqZWN0ZWRfY291bnQgZXhpc3RzCiAgICBpbnRjXzEgLy8gMQogICAgKwogICAgYnl0ZWMgMjEgLy8gInJlamVjdGVkX2NvdW50IgogICAgZGlnIDEKICAgIGFwcF9nbG9iYWxfcHV0CiAgICAvLyBzbWFydF9jb250cmFjdHMvYWFybmFfcmVnaXN0cnkvY29udHJhY3QucHk6NTE3CiAgICAvLyBwcm9qZWN0X2lkPWFyYzQuVUludDY0KHBpZCksIHJlamVjdGVkPWFyYzQuVUludDY0KHNlbGYucmVqZWN0ZWRfY291bnQpCiAgICBpdG9iCiAgICAvLyBzbWFydF9jb250cmFjdHMvYWFybmFfcmVnaXN0cnkvY29udHJhY3QucHk6NTE2LTUxOAogICAgLy8gUHJvamVjdFJlamVjdGVkKAogICAgLy8gICAgIHByb2plY3RfaWQ9YXJjNC5VSW50NjQocGlkKSwgcmVqZWN0ZWQ9YXJjNC5VSW50NjQoc2VsZi5yZWplY3RlZF9jb3VudCkKICAgIC8vICkKICAgIGNvbmNhdAogICAgLy8gc21hcnRfY29udHJhY3RzL2Fhcm5hX3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjUxNS01MTkKICAgIC8vIGFyYzQuZW1pdCgKICAgIC8vICAgICBQcm9qZWN0UmVqZWN0ZWQoCiAgICAvLyAgICAgICAgIHByb2plY3RfaWQ9YXJjNC5VSW50NjQocGlkKSwgcmVqZWN0ZWQ9YXJjNC5VSW50NjQoc2VsZi5yZWplY3RlZF9jb3VudCkKICAgIC8vICAgICApCiAgICAvLyApCiAgICBwdXNoYnl0ZXMgMHg1MDgwM2ExNCAvLyBtZXRob2QgIlByb2plY3RSZWplY3RlZCh1aW50NjQsdWludDY0KSIKICAgIHN3YXAKICAgIGNvbmNhdAogICAgbG9nCiAgICByZXRzdWIKCgovLyBzbWFydF9jb250cmFjdHMuYWFybmFfcmVnaXN0cnkuY29udHJhY3QuQWFybmFSZWdpc3RyeS5fbWFya19pc3N1ZWQocGlkOiB1aW50NjQsIHJlY2VpdmVyOiBieXRlcywgYW1vdW50OiB1aW50NjQpIC0+IHZvaWQ6Cl9tYXJrX2lzc3VlZDoKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hYXJuYV9yZWdpc3RyeS9jb250cmFjdC5weTo1MjEtNTIyCiAgICAvLyBAc3Vicm91dGluZQogICAgLy8gZGVmIF9tYXJrX2lzc3VlZChzZWxmLCBwaWQ6IFVJbnQ2NCwgcmVjZWl2ZXI6IGFyYzQuQWRkcmVzcywgYW1vdW50OiBVSW50NjQpIC0+IE5vbmU6CiAgICBwcm90byAzIDAKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hYXJuYV9yZWdpc3RyeS9jb250cmFjdC5weTozMTUKICAgIC8vIHJldHVybiBCeXRlcyhIRUFERVJfS0VZX1BSRUZJWCkgKyBvcC5pdG9iKHBpZCkKICAgIGZyYW1lX2RpZyAtMwogICAgaXRvYgogICAgYnl0ZWNfMyAvLyAweDY4CiAgICBkaWcgMQogICAgY29uY2F0CiAgICAvLyBzbWFydF9jb250cmFjdHMvYWFybmFfcmVnaXN0cnkvY29udHJhY3QucHk6NTIzCiAgICAvLyBzZWxmLl9zZXRfc3RhdHVzKHBpZCwgVUludDY0KDQpKQogICAgcHVzaGludCA0CiAgICAvLyBzbWFydF9jb250cmFjdHMvYWFybmFfcmVnaXN0cnkvY29udHJhY3QucHk6NDg1CiAgICAvLyBvcC5Cb3gucmVwbGFjZShfaGVhZGVyX2tleShwaWQpLCBIRUFERVJfU1RBVFVTX09GRlNFVCwgb3AuaXRvYihzdGF0dXMpKQogICAgaXRvYgogICAgcHVzaGludCAzMgogICAgc3dhcAogICAgYm94X3JlcGxhY2UKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hYXJuYV9yZWdpc3RyeS9jb250cmFjdC5weTo1MjQKICAgIC8vIHNlbGYuX3F1ZXVlX2Ryb3AoVUludDY0KDIpLCBwaWQpCiAgICBpbnRjXzMgLy8gMgogICAgZnJhbWVfZGlnIC0zCiAgICBjYWxsc3ViIF9xdWV1ZV9kcm9wCiAgICAvLyBzbWFydF9jb250cmFjdHMvYWFybmFfcmVnaXN0cnkvY29udHJhY3QucHk6NTI1CiAgICAvLyBzZWxmLnZlcmlmaWVkX2NvdW50IC09IDEKICAgIGludGNfMCAvLyAwCiAgICBieXRlYyAxNiAvLyAidmVyaWZpZWRfY291bnQiCiAgICBhcHBfZ2xvYmFsX2dldF9leAogICAgYXNzZXJ0IC8vIGNoZWNrIHNlbGYudmVyaWZpZWRfY291bnQgZXhpc3RzCiAgICBpbnRjXzEgLy8gMQogICAgLQogICAgYnl0ZWMgMTYgLy8gInZlcmlmaWVkX2NvdW50IgogICAgc3dhcAogICAgYXBwX2dsb2JhbF9wdXQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hYXJuYV9yZWdpc3RyeS9jb250cmFjdC5weTo1MjYKICAgIC8vIHNlbGYuaXNzdWVkX2NvdW50ICs9IDEKICAgIGludGNfMCAvLyAwCiAgICBieXRlYyAyMiAvLyAiaXNzdWVkX2NvdW50IgogICAgYXBwX2dsb2JhbF9nZXRfZXgKICAgIGFzc2VydCAvLyBjaGVjayBzZWxmLmlzc3VlZF9jb3VudCBleGlzdHMKICAgIGludGNfMSAvLyAxCiAgICArCiAgICBieXRlYyAyMiAvLyAiaXNzdWVkX2NvdW50IgogICAgc3dhcAogICAgYXBwX2dsb2JhbF9wdXQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hYXJuYV9yZWdpc3RyeS9jb250cmFjdC5weTo1MzEKICAgIC8vIGFtb3VudD1hcmM0LlVJbnQ2NChhbW91bnQpLAogICAgZnJhbWVfZGlnIC0xCiAgICBpdG9iCiAgICAvLyBzbWFydF9jb250cmFjdHMvYWFybmFfcmVnaXN0cnkvY29udHJhY3QucHk6NTI4LTUzMgogICAgLy8gQ3JlZGl0c0lzc3VlZCgKICAgIC8vICAgICBwcm9qZWN0X2lkPWFyYzQuVUludDY0KHBpZCksCiAgICAvLyAgICAgcmVjZWl2ZXI9cmVjZWl2ZXIuY29weSgpLAogICAgLy8gICAgIGFtb3VudD1hcmM0LlVJbnQ2NChhbW91bnQpLAogICAgLy8gKQogICAgc3dhcAogICAgZnJhbWVfZGlnIC0yCiAgICBjb25jYXQKICAgIHN3YXAKICAgIGNvbmNhdAogICAgLy8gc21hcnRfY29udHJhY3RzL2Fhcm5hX3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjUyNy01MzMKICAgIC8vIGFyYzQuZW1pdCgKICAgIC8vICAgICBDcmVkaXRzSXNzdWVkKAogICAgLy8gICAgICAgICBwcm9qZWN0X2lkPWFyYzQuVUludDY0KHBpZCksCiAgICAvLyAgICAgICAgIHJlY2VpdmVyPXJlY2VpdmVyLmNvcHkoKSwKICAgIC8vICAgICAgICAgYW1vdW50PWFyYzQuVUludDY0KGFtb3VudCksCiAgICAvLyAgICAgKQogICAgLy8gKQogICAgcHVzaGJ5dGVzIDB4ZGEzNzFjZTAgLy8gbWV0aG9kICJDcmVkaXRzSXNzdWVkKHVpbnQ2NCxhZGRyZXNzLHVpbnQ2NCkiCiAgICBzd2FwCiAgICBjb25jYXQKICAgIGxvZwogICAgcmV0c3ViCgoKLy8gc21hcnRfY29udHJhY3RzLmFhcm5hX3JlZ2lzdHJ5LmNvbnRyYWN0LkFhcm5hUmVnaXN0cnkuX2xvYWRfcHJvamVjdChwaWQ6IHVpbnQ2NCkgLT4gYnl0ZXM6Cl9sb2FkX3Byb2plY3Q6CiAgICAvLyBzbWFydF9jb250cmFjdHMvYWFybmFfcmVnaXN0cnkvY29udHJhY3QucHk6NTM1LTUzNgogICAgLy8gQHN1YnJvdXRpbmUKICAgIC8vIGRlZiBfbG9hZF9wcm9qZWN0KHNlbGYsIHBpZDogVUludDY0KSAtPiBQcm9qZWN0UmVjb3JkOgogICAgcHJvdG8gMSAxCiAgICAvLyBzbWFydF9jb250cmFjdHMvYWFybmFfcmVnaXN0cnkvY29udHJhY3QucHk6NTM4CiAgICAvLyBoZWFkZXIgPSBzZWxmLnByb2plY3RfaGVhZGVyc1twaWRdLmNvcHkoKQogICAgZnJhbWVfZGlnIC0xCiAgICBpdG9iCiAgICBieXRlY18zIC8vIDB4NjgKICAgIGRpZyAxCiAgICBjb25jYXQKICAgIGJveF9nZXQKICAgIGFzc2VydCAvLyBjaGVjayBzZWxmLnByb2plY3RfaGVhZGVycyBlbnRyeSBleGlzdHMKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hYXJuYV9yZWdpc3RyeS9jb250cmFjdC5weTo1MzkKICAgIC8vIG1ldGEgPSBzZWxmLnByb2plY3RfbWV0YVtwaWRdLmNvcHkoKQogICAgYnl0ZWMgMjkgLy8gMHg2ZAogICAgdW5jb3ZlciAyCiAgICBjb25jYXQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hYXJuYV9yZWdpc3RyeS9jb250cmFjdC5weTo1NDEKICAgIC8vIHN1Ym1pdHRlcj1oZWFkZXIuc3VibWl0dGVyLmNvcHkoKSwKICAgIGRpZyAxCiAgICBleHRyYWN0IDAgMzIKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hYXJuYV9yZWdpc3RyeS9jb250cmFjdC5weTo1NDIKICAgIC8vIG5hbWU9bWV0YS5uYW1lLAogICAgZGlnIDEKICAgIGludGNfMiAvLyA4CiAgICBpbnRjXzMgLy8gMgogICAgYm94X2V4dHJhY3QKICAgIGJ0b2kKICAgIGludGNfMyAvLyAyCiAgICArCiAgICBkaWcgMgogICAgaW50Y18yIC8vIDgKICAgIHVuY292ZXIgMgogICAgYm94X2V4dHJhY3QKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hYXJuYV9yZWdpc3RyeS9jb250cmFjdC5weTo1NDMKICAgIC8vIGxvY2F0aW9uPW1ldGEubG9jYXRpb24sCiAgICBkaWcgMgogICAgaW50Y18zIC8vIDIKICAgIGR1cAogICAgYm94X2V4dHJhY3QKICAgIGJ0b2kKICAgIGRpZyAzCiAgICBkaWcgMQogICAgaW50Y18zIC8vIDIKICAgIGJveF9leHRyYWN0CiAgICBidG9pCiAgICBpbnRjXzMgLy8gMgogICAgKwogICAgZGlnIDQKICAgIGNvdmVyIDIKICAgIGJveF9leHRyYWN0CiAgICAvLyBzbWFydF9jb250cmFjdHMvYWFybmFfcmVnaXN0cnkvY29udHJhY3QucHk6NTQ0CiAgICAvLyBlY29zeXN0ZW09bWV0YS5lY29zeXN0ZW0sCiAgICBkaWcgMwogICAgcHVzaGludCA0CiAgICBpbnRjXzMgLy8gMgogICAgYm94X2V4dHJhY3QKICAgIGJ0b2kKICAgIGRpZyA0CiAgICBkaWcgMQogICAgaW50Y18zIC8vIDIKICAgIGJveF9leHRyYWN0CiAgICBidG9pCiAgICBpbnRjXzMgLy8gMgogICAgKwogICAgZGlnIDUKICAgIGNvdmVyIDIKICAgIGJveF9leHRyYWN0CiAgICAvLyBzbWFydF9jb250cmFjdHMvYWFybmFfcmVnaXN0cnkvY29udHJhY3QucHk6NTQ1CiAgICAvLyBjaWQ9bWV0YS5jaWQsCiAgICBkaWcgNAogICAgcHVzaGludCA2CiAgICBpbnRjXzMgLy8gMgogICAgYm94X2V4dHJhY3QKICAgIGJ0b2kKICAgIGRpZyA1CiAgICBkaWcgMQogICAgaW50Y18zIC8vIDIKICAgIGJveF9leHRyYWN0CiAgICBidG9pCiAgICBpbnRjXzMgLy8gMgogICAgKwogICAgdW5jb3ZlciA2CiAgICBjb3ZlciAyCiAgICBib3hfZXh0cmFjdAogICAgLy8gc21hcnRfY29udHJhY3RzL2Fhcm5hX3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjU0NgogICAgLy8gc3RhdHVzPWhlYWRlci5zdGF0dXMsCiAgICBkaWcgNQogICAgZXh0cmFjdCAzMiA4CiAgICAvLyBzbWFydF9jb250cmFjdHMvYWFybmFfcmVnaXN0cnkvY29udHJhY3QucHk6NTQ3CiAgICAvLyBjcmVkaXRzPWhlYWRlci5jcmVkaXRzLAogICAgdW5jb3ZlciA2CiAgICBleHRyYWN0IDQwIDgKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hYXJuYV9yZWdpc3RyeS9jb250cmFjdC5weTo1NDAtNTQ4CiAgICAvLyByZXR1cm4gUHJvamVjdFJlY29yZCgKICAgIC8vICAgICBzdWJtaXR0ZXI9aGVhZGVyLnN1Ym1pdHRlci5jb3B5KCksCiAgICAvLyAgICAgbmFtZT1tZXRhLm5hbWUsCiAgICAvLyAgICAgbG9jYXRpb249bWV0YS5sb2NhdGlvbiwKICAgIC8vICAgICBlY29zeXN0ZW09bWV0YS5lY29zeXN0ZW0sCiAgICAvLyAgICAgY2lkPW1ldGEuY2lkLAogICAgLy8gICAgIHN0YXR1cz1oZWFkZXIuc3RhdHVzLAogICAgLy8gICAgIGNyZWRpdHM9aGVhZGVyLmNyZWRpdHMsCiAgICAvLyApCiAgICB1bmNvdmVyIDYKICAgIHB1c2hieXRlcyAweDAwMzgKICAgIGNvbmNhdAogICAgZGlnIDYKICAgIGxlbgogICAgcHVzaGludCA1NgogICAgKwogICAgZHVwCiAgICBpdG9iCiAgICBleHRyYWN0IDYgMgogICAgdW5jb3ZlciAyCiAgICBzd2FwCiAgICBjb25jYXQKICAgIGRpZyA2CiAgICBsZW4KICAgIHVuY292ZXIgMgogICAgKwogICAgZHVwCiAgICBpdG9iCiAgICBleHRyYWN0IDYgMgogICAgdW5jb3ZlciAyCiAgICBzd2FwCiAgICBjb25jYXQKICAgIGRpZyA1CiAgICBsZW4KICAgIHVuY292ZXIgMgogICAgKwogICAgaXRvYgogICAgZXh0cmFjdCA2IDIKICAgIGNvbmNhdAogICAgdW5jb3ZlciAyCiAgICBjb25jYXQKICAgIHN3YXAKICAgIGNvbmNhdAogICAgdW5jb3ZlciA0CiAgICBjb25jYXQKICAgIHVuY292ZXIgMwogICAgY29uY2F0CiAgICB1bmNvdmVyIDIKICAgIGNvbmNhdAogICAgc3dhcAogICAgY29uY2F0CiAgICByZXRzdWIKCgovLyBzbWFydF9jb250cmFjdHMuYWFybmFfcmVnaXN0cnkuY29udHJhY3QuQWFybmFSZWdpc3RyeS5fcXVldWVfZW5kcyhzdGF0dXM6IHVpbnQ2NCkgLT4gdWludDY0LCB1aW50NjQ6Cl9xdWV1ZV9lbmRzOgogICAgLy8gc21hcnRfY29udHJhY3RzL2Fhcm5hX3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjU1MC01NTIKICAgIC8vICMg4pSA4pSAIFJldmlldyBxdWV1ZXM6IHN0YXR1cyAxID0gcGVuZGluZywgc3RhdHVzIDIgPSB2ZXJpZmllZCDilIDilIAKICAgIC8vIEBzdWJyb3V0aW5lCiAgICAvLyBkZWYgX3F1ZXVlX2VuZHMoc2VsZiwgc3RhdHVzOiBVSW50NjQpIC0+IHR1cGxlW1VJbnQ2NCwgVUludDY0XToKICAgIHByb3RvIDEgMgogICAgLy8gc21hcnRfY29udHJhY3RzL2Fhcm5hX3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjU1MwogICAgLy8gaWYgc3RhdHVzID09IDE6CiAgICBmcmFtZV9kaWcgLTEKICAgIGludGNfMSAvLyAxCiAgICA9PQogICAgYnogX3F1ZXVlX2VuZHNfYWZ0ZXJfaWZfZWxzZUAyCiAgICAvLyBzbWFydF9jb250cmFjdHMvYWFybmFfcmVnaXN0cnkvY29udHJhY3QucHk6NTU0CiAgICAvLyByZXR1cm4gc2VsZi5wZW5kaW5nX2hlYWQsIHNlbGYucGVuZGluZ190YWlsCiAgICBpbnRjXzAgLy8gMAogICAgYnl0ZWMgMjUgLy8gInBlbmRpbmdfaGVhZCIKICAgIGFwcF9nbG9iYWxfZ2V0X2V4CiAgICBhc3NlcnQgLy8gY2hlY2sgc2VsZi5wZW5kaW5nX2hlYWQgZXhpc3RzCiAgICBpbnRjXzAgLy8gMAogICAgYnl0ZWMgMjYgLy8gInBlbmRpbmdfdGFpbCIKICAgIGFwcF9nbG9iYWxfZ2V0X2V4CiAgICBhc3NlcnQgLy8gY2hlY2sgc2VsZi5wZW5kaW5nX3RhaWwgZXhpc3RzCiAgICByZXRzdWIKCl9xdWV1ZV9lbmRzX2FmdGVyX2lmX2Vsc2VAMjoKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hYXJuYV9yZWdpc3RyeS9jb250cmFjdC5weTo1NTUKICAgIC8vIHJldHVybiBzZWxmLnZlcmlmaWVkX2hlYWQsIHNlbGYudmVyaWZpZWRfdGFpbAogICAgaW50Y18wIC8vIDAKICAgIGJ5dGVjIDI3IC8vICJ2ZXJpZmllZF9oZWFkIgogICAgYXBwX2dsb2JhbF9nZXRfZXgKICAgIGFzc2VydCAvLyBjaGVjayBzZWxmLnZlcmlmaWVkX2hlYWQgZXhpc3RzCiAgICBpbnRjXzAgLy8gMAogICAgYnl0ZWMgMjggLy8gInZlcmlmaWVkX3RhaWwiCiAgICBhcHBfZ2xvYmFsX2dldF9leAogICAgYXNzZXJ0IC8vIGNoZWNrIHNlbGYudmVyaWZpZWRfdGFpbCBleGlzdHMKICAgIHJldHN1YgoKCi8vIHNtYXJ0X2NvbnRyYWN0cy5hYXJuYV9yZWdpc3RyeS5jb250cmFjdC5BYXJuYVJlZ2lzdHJ5Ll9zZXRfcXVldWVfZW5kcyhzdGF0dXM6IHVpbnQ2NCwgaGVhZDogdWludDY0LCB0YWlsOiB1aW50NjQpIC0+IHZvaWQ6Cl9zZXRfcXVldWVfZW5kczoKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hYXJuYV9yZWdpc3RyeS9jb250cmFjdC5weTo1NTctNTU4CiAgICAvLyBAc3Vicm91dGluZQogICAgLy8gZGVmIF9zZXRfcXVldWVfZW5kcyhzZWxmLCBzdGF0dXM6IFVJbnQ2NCwgaGVhZDogVUludDY0LCB0YWlsOiBVSW50NjQpIC0+IE5vbmU6CiAgICBwcm90byAzIDAKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hYXJuYV9yZWdpc3RyeS9jb250cmFjdC5weTo1NTkKICAgIC8vIGlmIHN0YXR1cyA9PSAxOgogICAgZnJhbWVfZGlnIC0zCiAgICBpbnRjXzEgLy8gMQogICAgPT0KICAgIGJ6IF9zZXRfcXVldWVfZW5kc19lbHNlX2JvZHlAMgogICAgLy8gc21hcnRfY29udHJhY3RzL2Fhcm5hX3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjU2MAogICAgLy8gc2VsZi5wZW5kaW5nX2hlYWQgPSBoZWFkCiAgICBieXRlYyAyNSAvLyAicGVuZGluZ19oZWFkIgogICAgZnJhbWVfZGlnIC0yCiAgICBhcHBfZ2xvYmFsX3B1dAogICAgLy8gc21hcnRfY29udHJhY3RzL2Fhcm5hX3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjU2MQogICAgLy8gc2VsZi5wZW5kaW5nX3RhaWwgPSB0YWlsCiAgICBieXRlYyAyNiAvLyAicGVuZGluZ190YWlsIgogICAgZnJhbWVfZGlnIC0xCiAgICBhcHBfZ2xvYmFsX3B1dAogICAgcmV0c3ViCgpfc2V0X3F1ZXVlX2VuZHNfZWxzZV9ib2R5QDI6CiAgICAvLyBzbWFydF9jb250cmFjdHMvYWFybmFfcmVnaXN0cnkvY29udHJhY3QucHk6NTYzCiAgICAvLyBzZWxmLnZlcmlmaWVkX2hlYWQgPSBoZWFkCiAgICBieXRlYyAyNyAvLyAidmVyaWZpZWRfaGVhZCIKICAgIGZyYW1lX2RpZyAtMgogICAgYXBwX2dsb2JhbF9wdXQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hYXJuYV9yZWdpc3RyeS9jb250cmFjdC5weTo1NjQKICAgIC8vIHNlbGYudmVyaWZpZWRfdGFpbCA9IHRhaWwKICAgIGJ5dGVjIDI4IC8vICJ2ZXJpZmllZF90YWlsIgogICAgZnJhbWVfZGlnIC0xCiAgICBhcHBfZ2xvYmFsX3B1dAogICAgcmV0c3ViCgoKLy8gc21hcnRfY29udHJhY3RzLmFhcm5hX3JlZ2lzdHJ5LmNvbnRyYWN0LkFhcm5hUmVnaXN0cnkuX3F1ZXVlX3B1c2goc3RhdHVzOiB1aW50NjQsIHBpZDogdWludDY0KSAtPiB2b2lkOgpfcXVldWVfcHVzaDoKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hYXJuYV9yZWdpc3RyeS9jb250cmFjdC5weTo1NjYtNTY3CiAgICAvLyBAc3Vicm91dGluZQogICAgLy8gZGVmIF9xdWV1ZV9wdXNoKHNlbGYsIHN0YXR1czogVUludDY0LCBwaWQ6IFVJbnQ2NCkgLT4gTm9uZToKICAgIHByb3RvIDIgMAogICAgLy8gc21hcnRfY29udHJhY3RzL2Fhcm5hX3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjU2OQogICAgLy8gaGVhZCwgdGFpbCA9IHNlbGYuX3F1ZXVlX2VuZHMoc3RhdHVzKQogICAgZnJhbWVfZGlnIC0yCiAgICBjYWxsc3ViIF9xdWV1ZV9lbmRzCiAgICAvLyBzbWFydF9jb250cmFjdHMvYWFybmFfcmVnaXN0cnkvY29udHJhY3QucHk6NTcxCiAgICAvLyBwcmV2PWFyYzQuVUludDY0KHRhaWwpLCBuZXh0PWFyYzQuVUludDY0KE5PX0lEKQogICAgZHVwCiAgICBpdG9iCiAgICBkdXAKICAgIGNvdmVyIDIKICAgIGludGMgNCAvLyAxODQ0Njc0NDA3MzcwOTU1MTYxNQogICAgaXRvYgogICAgLy8gc21hcnRfY29udHJhY3RzL2Fhcm5hX3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjU3MC01NzIKICAgIC8vIHNlbGYucXVldWVfbGlua3NbcGlkXSA9IFF1ZXVlTGluaygKICAgIC8vICAgICBwcmV2PWFyYzQuVUludDY0KHRhaWwpLCBuZXh0PWFyYzQuVUludDY0KE5PX0lEKQogICAgLy8gKQogICAgY29uY2F0CiAgICAvLyBzbWFydF9jb250cmFjdHMvYWFybmFfcmVnaXN0cnkvY29udHJhY3QucHk6NTcwCiAgICAvLyBzZWxmLnF1ZXVlX2xpbmtzW3BpZF0gPSBRdWV1ZUxpbmsoCiAgICBmcmFtZV9kaWcgLTEKICAgIGl0b2IKICAgIGR1cAogICAgY292ZXIgMwogICAgYnl0ZWMgMTAgLy8gMHg3MQogICAgc3dhcAogICAgY29uY2F0CiAgICAvLyBzbWFydF9jb250cmFjdHMvYWFybmFfcmVnaXN0cnkvY29udHJhY3QucHk6NTcwLTU3MgogICAgLy8gc2VsZi5xdWV1ZV9saW5rc1twaWRdID0gUXVldWVMaW5rKAogICAgLy8gICAgIHByZXY9YXJjNC5VSW50NjQodGFpbCksIG5leHQ9YXJjNC5VSW50NjQoTk9fSUQpCiAgICAvLyApCiAgICBzd2FwCiAgICBib3hfcHV0CiAgICAvLyBzbWFydF9jb250cmFjdHMvYWFybmFfcmVnaXN0cnkvY29udHJhY3QucHk6NTczCiAgICAvLyBpZiB0YWlsID09IE5PX0lEOgogICAgaW50YyA0IC8vIDE4NDQ2NzQ0MDczNzA5NTUxNjE1CiAgICA9PQogICAgYnogX3F1ZXVlX3B1c2hfZWxzZV9ib2R5QDIKICAgIHBvcG4gMgogICAgZnJhbWVfZGlnIC0xCiAgICBmcmFtZV9idXJ5IDAKCl9xdWV1ZV9wdXNoX2FmdGVyX2lmX2Vsc2VAMzoKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hYXJuYV9yZWdpc3RyeS9jb250cmFjdC5weTo1NzcKICAgIC8vIHNlbGYuX3NldF9xdWV1ZV9lbmRzKHN0YXR1cywgaGVhZCwgcGlkKQogICAgZnJhbWVfZGlnIC0yCiAgICBmcmFtZV9kaWcgMAogICAgZnJhbWVfZGlnIC0xCiAgICBjYWxsc3ViIF9zZXRfcXVldWVfZW5kcwogICAgcmV0c3ViCgpfcXVldWVfcHVzaF9lbHNlX2JvZHlAMjoKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hYXJuYV9yZWdpc3RyeS9jb250cmFjdC5weTozMjAKICAgIC8vIHJldHVybiBCeXRlcyhMSU5LX0tFWV9QUkVGSVgpICsgb3AuaXRvYihwaWQpCiAgICBieXRlYyAxMCAvLyAweDcxCiAgICB1bmNvdmVyIDIKICAgIGNvbmNhdAogICAgLy8gc21hcnRfY29udHJhY3RzL2Fhcm5hX3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjU3NgogICAgLy8gb3AuQm94LnJlcGxhY2UoX2xpbmtfa2V5KHRhaWwpLCBMSU5LX05FWFRfT0ZGU0VULCBvcC5pdG9iKHBpZCkpCiAgICBpbnRjXzIgLy8gOAogICAgdW5jb3ZlciAyCiAgICBib3hfcmVwbGFjZQogICAgYiBfcXVldWVfcHVzaF9hZnRlcl9pZl9lbHNlQDMKCgovLyBzbWFydF9jb250cmFjdHMuYWFybmFfcmVnaXN0cnkuY29udHJhY3QuQWFybmFSZWdpc3RyeS5fcXVldWVfcmVtb3ZlKHN0YXR1czogdWludDY0LCBwaWQ6IHVpbnQ2NCkgLT4gdm9pZDoKX3F1ZXVlX3JlbW92ZToKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hYXJuYV9yZWdpc3RyeS9jb250cmFjdC5weTo1NzktNTgwCiAgICAvLyBAc3Vicm91dGluZQogICAgLy8gZGVmIF9xdWV1ZV9yZW1vdmUoc2VsZiwgc3RhdHVzOiBVSW50NjQsIHBpZDogVUludDY0KSAtPiBOb25lOgogICAgcHJvdG8gMiAwCiAgICAvLyBzbWFydF9jb250cmFjdHMvYWFybmFfcmVnaXN0cnkvY29udHJhY3QucHk6NTgyCiAgICAvLyBsaW5rID0gc2VsZi5xdWV1ZV9saW5rc1twaWRdLmNvcHkoKQogICAgZnJhbWVfZGlnIC0xCiAgICBpdG9iCiAgICBieXRlYyAxMCAvLyAweDcxCiAgICBzd2FwCiAgICBjb25jYXQKICAgIGJveF9nZXQKICAgIGFzc2VydCAvLyBjaGVjayBzZWxmLnF1ZXVlX2xpbmtzIGVudHJ5IGV4aXN0cwogICAgLy8gc21hcnRfY29udHJhY3RzL2Fhcm5hX3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjU4MwogICAgLy8gcHJldiA9IGxpbmsucHJldi5uYXRpdmUKICAgIGR1cAogICAgaW50Y18wIC8vIDAKICAgIGV4dHJhY3RfdWludDY0CiAgICBkdXAKICAgIHVuY292ZXIgMgogICAgLy8gc21hcnRfY29udHJhY3RzL2Fhcm5hX3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjU4NAogICAgLy8gbnh0ID0gbGluay5uZXh0Lm5hdGl2ZQogICAgaW50Y18yIC8vIDgKICAgIGV4dHJhY3RfdWludDY0CiAgICBzd2FwCiAgICAvLyBzbWFydF9jb250cmFjdHMvYWFybmFfcmVnaXN0cnkvY29udHJhY3QucHk6NTg1CiAgICAvLyBoZWFkLCB0YWlsID0gc2VsZi5fcXVldWVfZW5kcyhzdGF0dXMpCiAgICBmcmFtZV9kaWcgLTIKICAgIGNhbGxzdWIgX3F1ZXVlX2VuZHMKICAgIGNvdmVyIDQKICAgIGNvdmVyIDMKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hYXJuYV9yZWdpc3RyeS9jb250cmFjdC5weTo1ODYKICAgIC8vIGlmIHByZXYgPT0gTk9fSUQ6CiAgICBpbnRjIDQgLy8gMTg0NDY3NDQwNzM3MDk1NTE2MTUKICAgID09CiAgICBieiBfcXVldWVfcmVtb3ZlX2Vsc2VfYm9keUAyCiAgICBkdXAKICAgIGZyYW1lX2J1cnkgMQoKX3F1ZXVlX3JlbW92ZV9hZnRlcl9pZl9lbHNlQDM6CiAgICAvLyBzbWFydF9jb250cmFjdHMvYWFybmFfcmVnaXN0cnkvY29udHJhY3QucHk6NTkwCiAgICAvLyBpZiBueHQgPT0gTk9fSUQ6CiAgICBkdXAKICAgIGludGMgNCAvLyAxODQ0Njc0NDA3MzcwOTU1MTYxNQogICAgPT0KICAgIGJ6IF9xdWV1ZV9yZW1vdmVfZWxzZV9ib2R5QDUKICAgIHBvcAogICAgZnJhbWVfYnVyeSAwCgpfcXVldWVfcmVtb3ZlX2FmdGVyX2lmX2Vsc2VANjoKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hYXJuYV9yZWdpc3RyeS9jb250cmFjdC5weTo1OTQKICAgIC8vIHNlbGYuX3NldF9xdWV1ZV9lbmRzKHN0YXR1cywgaGVhZCwgdGFpbCkKICAgIGZyYW1lX2RpZyAtMgogICAgZnJhbWVfZGlnIDEKICAgIGZyYW1lX2RpZyAwCiAgICBjYWxsc3ViIF9zZXRfcXVldWVfZW5kcwogICAgcmV0c3ViCgpfcXVldWVfcmVtb3ZlX2Vsc2VfYm9keUA1OgogICAgLy8gc21hcnRfY29udHJhY3RzL2Fhcm5hX3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjMyMAogICAgLy8gcmV0dXJuIEJ5dGVzKExJTktfS0VZX1BSRUZJWCkgKyBvcC5pdG9iKHBpZCkKICAgIGl0b2IKICAgIGJ5dGVjIDEwIC8vIDB4NzEKICAgIHN3YXAKICAgIGNvbmNhdAogICAgLy8gc21hcnRfY29udHJhY3RzL2Fhcm5hX3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjU5MwogICAgLy8gb3AuQm94LnJlcGxhY2UoX2xpbmtfa2V5KG54dCksIExJTktfUFJFVl9PRkZTRVQsIG9wLml0b2IocHJldikpCiAgICBzd2FwCiAgICBpdG9iCiAgICBpbnRjXzAgLy8gMAogICAgc3dhcAogICAgYm94X3JlcGxhY2UKICAgIGIgX3F1ZXVlX3JlbW92ZV9hZnRlcl9pZl9lbHNlQDYKCl9xdWV1ZV9yZW1vdmVfZWxzZV9ib2R5QDI6CiAgICAvLyBzbWFydF9jb250cmFjdHMvYWFybmFfcmVnaXN0cnkvY29udHJhY3QucHk6MzIwCiAgICAvLyByZXR1cm4gQnl0ZXMoTElOS19LRVlfUFJFRklYKSArIG9wLml0b2IocGlkKQogICAgZGlnIDEKICAgIGl0b2IKICAgIGJ5dGVjIDEwIC8vIDB4NzEKICAgIHN3YXAKICAgIGNvbmNhdAogICAgLy8gc21hcnRfY29udHJhY3RzL2Fhcm5hX3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjU4OQogICAgLy8gb3AuQm94LnJlcGxhY2UoX2xpbmtfa2V5KHByZXYpLCBMSU5LX05FWFRfT0ZGU0VULCBvcC5pdG9iKG54dCkpCiAgICBkaWcgMQogICAgaXRvYgogICAgaW50Y18yIC8vIDgKICAgIHN3YXAKICAgIGJveF9yZXBsYWNlCiAgICBiIF9xdWV1ZV9yZW1vdmVfYWZ0ZXJfaWZfZWxzZUAzCgoKLy8gc21hcnRfY29udHJhY3RzLmFhcm5hX3JlZ2lzdHJ5LmNvbnRyYWN0LkFhcm5hUmVnaXN0cnkuX3F1ZXVlX2Ryb3Aoc3RhdHVzOiB1aW50NjQsIHBpZDogdWludDY0KSAtPiB2b2lkOgpfcXVldWVfZHJvcDoKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hYXJuYV9yZWdpc3RyeS9jb250cmFjdC5weTo2MDItNjAzCiAgICAvLyBAc3Vicm91dGluZQogICAgLy8gZGVmIF9xdWV1ZV9kcm9wKHNlbGYsIHN0YXR1czogVUludDY0LCBwaWQ6IFVJbnQ2NCkgLT4gTm9uZToKICAgIHByb3RvIDIgMAogICAgLy8gc21hcnRfY29udHJhY3RzL2Fhcm5hX3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjYwNQogICAgLy8gc2VsZi5fcXVldWVfcmVtb3ZlKHN0YXR1cywgcGlkKQogICAgZnJhbWVfZGlnIC0yCiAgICBmcmFtZV9kaWcgLTEKICAgIGNhbGxzdWIgX3F1ZXVlX3JlbW92ZQogICAgLy8gc21hcnRfY29udHJhY3RzL2Fhcm5hX3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjYwNgogICAgLy8gZGVsIHNlbGYucXVldWVfbGlua3NbcGlkXQogICAgZnJhbWVfZGlnIC0xCiAgICBpdG9iCiAgICBieXRlYyAxMCAvLyAweDcxCiAgICBzd2FwCiAgICBjb25jYXQKICAgIGJveF9kZWwKICAgIHBvcAogICAgcmV0c3ViCgoKLy8gc21hcnRfY29udHJhY3RzLmFhcm5hX3JlZ2lzdHJ5LmNvbnRyYWN0LkFhcm5hUmVnaXN0cnkuX3F1ZXVlX3BhZ2Uoc3RhdHVzOiB1aW50NjQsIGFmdGVyOiB1aW50NjQsIGNvdW50OiB1aW50NjQpIC0+IGJ5dGVzOgpfcXVldWVfcGFnZToKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hYXJuYV9yZWdpc3RyeS9jb250cmFjdC5weTo2MDgtNjExCiAgICAvLyBAc3Vicm91dGluZQogICAgLy8gZGVmIF9xdWV1ZV9wYWdlKAogICAgLy8gICAgIHNlbGYsIHN0YXR1czogVUludDY0LCBhZnRlcjogVUludDY0LCBjb3VudDogVUludDY0CiAgICAvLyApIC0+IGFyYzQuRHluYW1pY0FycmF5W2FyYzQuVUludDY0XToKICAgIHByb3RvIDMgMQogICAgcHVzaGJ5dGVzICIiCiAgICAvLyBzbWFydF9jb250cmFjdHMvYWFybmFfcmVnaXN0cnkvY29udHJhY3QucHk6NjE2CiAgICAvLyBoZWFkLCBfdGFpbCA9IHNlbGYuX3F1ZXVlX2VuZHMoc3RhdHVzKQogICAgZnJhbWVfZGlnIC0zCiAgICBjYWxsc3ViIF9xdWV1ZV9lbmRzCiAgICBwb3AKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hYXJuYV9yZWdpc3RyeS9jb250cmFjdC5weTo2MTgKICAgIC8vIGlmIGFmdGVyIDwgc2VsZi5wcm9qZWN0X2NvdW50IGFuZCBzZWxmLl9zdGF0dXMoYWZ0ZXIpID09IHN0YXR1czoKICAgIGludGNfMCAvLyAwCiAgICBieXRlY18yIC8vICJwcm9qZWN0X2NvdW50IgogICAgYXBwX2dsb2JhbF9nZXRfZXgKICAgIGFzc2VydCAvLyBjaGVjayBzZWxmLnByb2plY3RfY291bnQgZXhpc3RzCiAgICBmcmFtZV9kaWcgLTIKICAgID4KICAgIGJueiBfcXVldWVfcGFnZV9hbmRfY29udGRAMQoKX3F1ZXVlX3BhZ2VfYWZ0ZXJfaWZfZWxzZUAzOgogICAgLy8gc21hcnRfY29udHJhY3RzL2Fhcm5hX3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjYyMAogICAgLy8gaWYgY291bnQgPiBNQVhfSURfUEFHRToKICAgIGZyYW1lX2RpZyAtMQogICAgcHVzaGludCAxMjcKICAgID4KICAgIGJ6IF9xdWV1ZV9wYWdlX2FmdGVyX2lmX2Vsc2VANQogICAgLy8gc21hcnRfY29udHJhY3RzL2Fhcm5hX3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjYyMQogICAgLy8gY291bnQgPSBVSW50NjQoTUFYX0lEX1BBR0UpCiAgICBwdXNoaW50IDEyNwogICAgZnJhbWVfYnVyeSAtMQoKX3F1ZXVlX3BhZ2VfYWZ0ZXJfaWZfZWxzZUA1OgogICAgLy8gc21hcnRfY29udHJhY3RzL2Fhcm5hX3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjYyMgogICAgLy8gaWRzID0gYXJjNC5EeW5hbWljQXJyYXlbYXJjNC5VSW50NjRdKCkKICAgIGJ5dGVjIDE0IC8vIDB4MDAwMAogICAgc3dhcAoKX3F1ZXVlX3BhZ2Vfd2hpbGVfdG9wQDY6CiAgICAvLyBzbWFydF9jb250cmFjdHMvYWFybmFfcmVnaXN0cnkvY29udHJhY3QucHk6NjIzCiAgICAvLyB3aGlsZSBwaWQgIT0gTk9fSUQgYW5kIGlkcy5sZW5ndGggPCBjb3VudDoKICAgIGR1cAogICAgaW50YyA0IC8vIDE4NDQ2NzQ0MDczNzA5NTUxNjE1CiAgICAhPQogICAgYnogX3F1ZXVlX3BhZ2VfYWZ0ZXJfd2hpbGVAOQogICAgZGlnIDEKICAgIGludGNfMCAvLyAwCiAgICBleHRyYWN0X3VpbnQxNiAvLyBvbiBlcnJvcjogaW52YWxpZCBhcnJheSBsZW5ndGggaGVhZGVyCiAgICBkdXAKICAgIGZyYW1lX2J1cnkgMAogICAgZnJhbWVfZGlnIC0xCiAgICA8CiAgICBieiBfcXVldWVfcGFnZV9hZnRlcl93aGlsZUA5CiAgICAvLyBzbWFydF9jb250cmFjdHMvYWFybmFfcmVnaXN0cnkvY29udHJhY3QucHk6NjI0CiAgICAvLyBpZHMuYXBwZW5kKGFyYzQuVUludDY0KHBpZCkpCiAgICBpdG9iCiAgICBmcmFtZV9kaWcgMAogICAgLy8gc21hcnRfY29udHJhY3RzL2Fhcm5hX3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjYyNAogICAgLy8gaWRzLmFwcGVuZChhcmM0LlVJbnQ2NChwaWQpKQogICAgaW50Y18xIC8vIDEKICAgICsKICAgIGl0b2IKICAgIGV4dHJhY3QgNiAwCiAgICB1bmNvdmVyIDIKICAgIHN3YXAKICAgIHJlcGxhY2UyIDAKICAgIGRpZyAxCiAgICBjb25jYXQKICAgIHN3YXAKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hYXJuYV9yZWdpc3RyeS9jb250cmFjdC5weTozMjAKICAgIC8vIHJldHVybiBCeXRlcyhMSU5LX0tFWV9QUkVGSVgpICsgb3AuaXRvYihwaWQpCiAgICBieXRlYyAxMCAvLyAweDcxCiAgICBzd2FwCiAgICBjb25jYXQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hYXJuYV9yZWdpc3RyeS9jb250cmFjdC5weTo2MjUKICAgIC8vIHBpZCA9IG9wLmJ0b2kob3AuQm94LmV4dHJhY3QoX2xpbmtfa2V5KHBpZCksIExJTktfTkVYVF9PRkZTRVQsIDgpKQogICAgaW50Y18yIC8vIDgKICAgIGR1cAogICAgYm94X2V4dHJhY3QKICAgIGJ0b2kKICAgIGIgX3F1ZXVlX3BhZ2Vfd2hpbGVfdG9wQDYKCl9xdWV1ZV9wYWdlX2FmdGVyX3doaWxlQDk6CiAgICBwb3AKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hYXJuYV9yZWdpc3RyeS9jb250cmFjdC5weTo2MjYKICAgIC8vIHJldHVybiBpZHMuY29weSgpCiAgICBzd2FwCiAgICByZXRzdWIKCl9xdWV1ZV9wYWdlX2FuZF9jb250ZEAxOgogICAgLy8gc21hcnRfY29udHJhY3RzL2Fhcm5hX3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjMxNQogICAgLy8gcmV0dXJuIEJ5dGVzKEhFQURFUl9LRVlfUFJFRklYKSArIG9wLml0b2IocGlkKQogICAgZnJhbWVfZGlnIC0yCiAgICBpdG9iCiAgICBkdXAKICAgIGJ5dGVjXzMgLy8gMHg2OAogICAgc3dhcAogICAgY29uY2F0CiAgICAvLyBzbWFydF9jb250cmFjdHMvYWFybmFfcmVnaXN0cnkvY29udHJhY3QucHk6NDgxCiAgICAvLyByZXR1cm4gb3AuYnRvaShvcC5Cb3guZXh0cmFjdChfaGVhZGVyX2tleShwaWQpLCBIRUFERVJfU1RBVFVTX09GRlNFVCwgOCkpCiAgICBwdXNoaW50IDMyCiAgICBpbnRjXzIgLy8gOAogICAgYm94X2V4dHJhY3QKICAgIGJ0b2kKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hYXJuYV9yZWdpc3RyeS9jb250cmFjdC5weTo2MTgKICAgIC8vIGlmIGFmdGVyIDwgc2VsZi5wcm9qZWN0X2NvdW50IGFuZCBzZWxmLl9zdGF0dXMoYWZ0ZXIpID09IHN0YXR1czoKICAgIGZyYW1lX2RpZyAtMwogICAgPT0KICAgIGJueiBfcXVldWVfcGFnZV9pZl9ib2R5QDIKICAgIHBvcAogICAgYiBfcXVldWVfcGFnZV9hZnRlcl9pZl9lbHNlQDMKCl9xdWV1ZV9wYWdlX2lmX2JvZHlAMjoKICAgIGJ1cnkgMQogICAgLy8gc21hcnRfY29udHJhY3RzL2Fhcm5hX3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjYxOQogICAgLy8gcGlkID0gc2VsZi5xdWV1ZV9saW5rc1thZnRlcl0ubmV4dC5uYXRpdmUKICAgIGJ5dGVjIDEwIC8vIDB4NzEKICAgIHN3YXAKICAgIGNvbmNhdAogICAgYm94X2dldAogICAgYXNzZXJ0IC8vIGNoZWNrIHNlbGYucXVldWVfbGlua3MgZW50cnkgZXhpc3RzCiAgICBpbnRjXzIgLy8gOAogICAgZXh0cmFjdF91aW50NjQKICAgIGIgX3F1ZXVlX3BhZ2VfYWZ0ZXJfaWZfZWxzZUAzCgoKLy8gc21hcnRfY29udHJhY3RzLmFhcm5hX3JlZ2lzdHJ5LmNvbnRyYWN0LkFhcm5hUmVnaXN0cnkuX2Jvb2tfcmVtb3ZlKGxpZDogdWludDY0LCBwcmljZTogdWludDY0LCByZW1haW5pbmc6IHVpbnQ2NCkgLT4gdm9pZDoKX2Jvb2tfcmVtb3ZlOgogICAgLy8gc21hcnRfY29udHJhY3RzL2Fhcm5hX3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjY4NS02ODYKICAgIC8vIEBzdWJyb3V0aW5lCiAgICAvLyBkZWYgX2Jvb2tfcmVtb3ZlKHNlbGYsIGxpZDogVUludDY0LCBwcmljZTogVUludDY0LCByZW1haW5pbmc6IFVJbnQ2NCkgLT4gTm9uZToKICAgIHByb3RvIDMgMAogICAgcHVzaGJ5dGVzICIiCiAgICBkdXAKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hYXJuYV9yZWdpc3RyeS9jb250cmFjdC5weTo2OTEKICAgIC8vIGxldmVsID0gc2VsZi5wcmljZV9sZXZlbHNbcHJpY2VdLmNvcHkoKQogICAgZnJhbWVfZGlnIC0yCiAgICBpdG9iCiAgICBieXRlYyA0IC8vIDB4NmYKICAgIHN3YXAKICAgIGNvbmNhdAogICAgZHVwCiAgICBib3hfZ2V0CiAgICBhc3NlcnQgLy8gY2hlY2sgc2VsZi5wcmljZV9sZXZlbHMgZW50cnkgZXhpc3RzCiAgICAvLyBzbWFydF9jb250cmFjdHMvYWFybmFfcmVnaXN0cnkvY29udHJhY3QucHk6NjkyCiAgICAvLyBsaW5rID0gc2VsZi5saXN0aW5nX2xpbmtzW2xpZF0uY29weSgpCiAgICBmcmFtZV9kaWcgLTMKICAgIGl0b2IKICAgIGJ5dGVjIDYgLy8gMHg2YgogICAgc3dhcAogICAgY29uY2F0CiAgICBib3hfZ2V0CiAgICBzd2FwCiAgICBkdXAKICAgIHVuY292ZXIgMgogICAgYXNzZXJ0IC8vIGNoZWNrIHNlbGYubGlzdGluZ19saW5rcyBlbnRyeSBleGlzdHMKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hYXJuYV9yZWdpc3RyeS9jb250cmFjdC5weTo2OTMKICAgIC8vIGlmIGxpbmsucHJldi5uYXRpdmUgPT0gTk9fSUQ6CiAgICBkdXAKICAgIGV4dHJhY3QgMCA4CiAgICBjb3ZlciAyCiAgICBpbnRjXzAgLy8gMAogICAgZXh0cmFjdF91aW50NjQKICAgIGR1cAogICAgZnJhbWVfYnVyeSAtMwogICAgaW50YyA0IC8vIDE4NDQ2NzQ0MDczNzA5NTUxNjE1CiAgICA9PQogICAgYnogX2Jvb2tfcmVtb3ZlX2Vsc2VfYm9keUAyCiAgICAvLyBzbWFydF9jb250cmFjdHMvYWFybmFfcmVnaXN0cnkvY29udHJhY3QucHk6Njk0CiAgICAvLyBsZXZlbC5oZWFkID0gbGluay5uZXh0CiAgICBkdXAKICAgIGV4dHJhY3QgOCA4CiAgICB1bmNvdmVyIDMKICAgIHN3YXAKICAgIHJlcGxhY2UyIDE2CiAgICBjb3ZlciAyCgpfYm9va19yZW1vdmVfYWZ0ZXJfaWZfZWxzZUAzOgogICAgLy8gc21hcnRfY29udHJhY3RzL2Fhcm5hX3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjY5OQogICAgLy8gaWYgbGluay5uZXh0Lm5hdGl2ZSA9PSBOT19JRDoKICAgIGludGNfMiAvLyA4CiAgICBleHRyYWN0X3VpbnQ2NAogICAgZHVwCiAgICBmcmFtZV9idXJ5IC0zCiAgICBpbnRjIDQgLy8gMTg0NDY3NDQwNzM3MDk1NTE2MTUKICAgID09CiAgICBieiBfYm9va19yZW1vdmVfZWxzZV9ib2R5QDUKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hYXJuYV9yZWdpc3RyeS9jb250cmFjdC5weTo3MDAKICAgIC8vIGxldmVsLnRhaWwgPSBsaW5rLnByZXYKICAgIHJlcGxhY2UyIDI0CgpfYm9va19yZW1vdmVfYWZ0ZXJfaWZfZWxzZUA2OgogICAgLy8gc21hcnRfY29udHJhY3RzL2Fhcm5hX3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjcwNgogICAgLy8gbGV2ZWwuZGVwdGggPSBhcmM0LlVJbnQ2NChsZXZlbC5kZXB0aC5uYXRpdmUgLSByZW1haW5pbmcpCiAgICBkdXAKICAgIHB1c2hpbnQgMzIKICAgIGV4dHJhY3RfdWludDY0CiAgICBmcmFtZV9kaWcgLTEKICAgIC0KICAgIGl0b2IKICAgIHJlcGxhY2UyIDMyCiAgICAvLyBzbWFydF9jb250cmFjdHMvYWFybmFfcmVnaXN0cnkvY29udHJhY3QucHk6NzA3CiAgICAvLyBsZXZlbC5saXN0aW5ncyA9IGFyYzQuVUludDY0KGxldmVsLmxpc3RpbmdzLm5hdGl2ZSAtIDEpCiAgICBkdXAKICAgIHB1c2hpbnQgNDAKICAgIGV4dHJhY3RfdWludDY0CiAgICBpbnRjXzEgLy8gMQogICAgLQogICAgaXRvYgogICAgcmVwbGFjZTIgNDAKICAgIGR1cAogICAgLy8gc21hcnRfY29udHJhY3RzL2Fhcm5hX3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjcwOAogICAgLy8gaWYgbGV2ZWwubGlzdGluZ3MubmF0aXZlOgogICAgcHVzaGludCA0MAogICAgZXh0cmFjdF91aW50NjQKICAgIGJ6IF9ib29rX3JlbW92ZV9hZnRlcl9pZl9lbHNlQDgKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hYXJuYV9yZWdpc3RyeS9jb250cmFjdC5weTo3MDkKICAgIC8vIHNlbGYucHJpY2VfbGV2ZWxzW3ByaWNlXSA9IGxldmVsLmNvcHkoKQogICAgYm94X3B1dAogICAgLy8gc21hcnRfY29udHJhY3RzL2Fhcm5hX3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjcxMAogICAgLy8gcmV0dXJuCiAgICByZXRzdWIKCl9ib29rX3JlbW92ZV9hZnRlcl9pZl9lbHNlQDg6CiAgICAvLyBzbWFydF9jb250cmFjdHMvYWFybmFfcmVnaXN0cnkvY29udHJhY3QucHk6NzEyCiAgICAvLyBwcmV2ID0gbGV2ZWwucHJldl9wcmljZS5uYXRpdmUKICAgIGR1cAogICAgaW50Y18wIC8vIDAKICAgIGV4dHJhY3RfdWludDY0CiAgICBkdXAKICAgIGNvdmVyIDIKICAgIGZyYW1lX2J1cnkgMQogICAgLy8gc21hcnRfY29udHJhY3RzL2Fhcm5hX3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjcxMwogICAgLy8gbnh0ID0gbGV2ZWwubmV4dF9wcmljZS5uYXRpdmUKICAgIGludGNfMiAvLyA4CiAgICBleHRyYWN0X3VpbnQ2NAogICAgZnJhbWVfYnVyeSAwCiAgICAvLyBzbWFydF9jb250cmFjdHMvYWFybmFfcmVnaXN0cnkvY29udHJhY3QucHk6NzE0CiAgICAvLyBpZiBwcmV2ID09IE5PX1BSSUNFOgogICAgYm56IF9ib29rX3JlbW92ZV9lbHNlX2JvZHlAMTAKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hYXJuYV9yZWdpc3RyeS9jb250cmFjdC5weTo3MTUKICAgIC8vIHNlbGYuYmVzdF9wcmljZSA9IG54dAogICAgYnl0ZWMgMTIgLy8gImJlc3RfcHJpY2UiCiAgICBmcmFtZV9kaWcgMAogICAgYXBwX2dsb2JhbF9wdXQKCl9ib29rX3JlbW92ZV9hZnRlcl9pZl9lbHNlQDExOgogICAgLy8gc21hcnRfY29udHJhY3RzL2Fhcm5hX3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjcxOAogICAgLy8gaWYgbnh0ICE9IE5PX1BSSUNFOgogICAgZnJhbWVfZGlnIDAKICAgIGJ6IF9ib29rX3JlbW92ZV9hZnRlcl9pZl9lbHNlQDEzCiAgICAvLyBzbWFydF9jb250cmFjdHMvYWFybmFfcmVnaXN0cnkvY29udHJhY3QucHk6MzkzCiAgICAvLyByZXR1cm4gQnl0ZXMoTEVWRUxfS0VZX1BSRUZJWCkgKyBvcC5pdG9iKHByaWNlKQogICAgZnJhbWVfZGlnIDAKICAgIGl0b2IKICAgIGJ5dGVjIDQgLy8gMHg2ZgogICAgc3dhcAogICAgY29uY2F0CiAgICAvLyBzbWFydF9jb250cmFjdHMvYWFybmFfcmVnaXN0cnkvY29udHJhY3QucHk6NzE5CiAgICAvLyBvcC5Cb3gucmVwbGFjZShfbGV2ZWxfa2V5KG54dCksIExFVkVMX1BSRVZfT0ZGU0VULCBvcC5pdG9iKHByZXYpKQogICAgZnJhbWVfZGlnIDEKICAgIGl0b2IKICAgIGludGNfMCAvLyAwCiAgICBzd2FwCiAgICBib3hfcmVwbGFjZQoKX2Jvb2tfcmVtb3ZlX2FmdGVyX2lmX2Vsc2VAMTM6CiAgICAvLyBzbWFydF9jb250cmFjdHMvYWFybmFfcmVnaXN0cnkvY29udHJhY3QucHk6NzIwCiAgICAvLyBkZWwgc2VsZi5wcmljZV9sZXZlbHNbcHJpY2VdCiAgICBib3hfZGVsCiAgICBwb3AKICAgIHJldHN1YgoKX2Jvb2tfcmVtb3ZlX2Vsc2VfYm9keUAxMDoKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hYXJuYV9yZWdpc3RyeS9jb250cmFjdC5weTozOTMKICAgIC8vIHJldHVybiBCeXRlcyhMRVZFTF9LRVlfUFJFRklYKSArIG9wLml0b2IocHJpY2UpCiAgICBmcmFtZV9kaWcgMQogICAgaXRvYgogICAgYnl0ZWMgNCAvLyAweDZmCiAgICBzd2FwCiAgICBjb25jYXQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hYXJuYV9yZWdpc3RyeS9jb250cmFjdC5weTo3MTcKICAgIC8vIG9wLkJveC5yZXBsYWNlKF9sZXZlbF9rZXkocHJldiksIExFVkVMX05FWFRfT0ZGU0VULCBvcC5pdG9iKG54dCkpCiAgICBmcmFtZV9kaWcgMAogICAgaXRvYgogICAgaW50Y18yIC8vIDgKICAgIHN3YXAKICAgIGJveF9yZXBsYWNlCiAgICBiIF9ib29rX3JlbW92ZV9hZnRlcl9pZl9lbHNlQDExCgpfYm9va19yZW1vdmVfZWxzZV9ib2R5QDU6CiAgICAvLyBzbWFydF9jb250cmFjdHMvYWFybmFfcmVnaXN0cnkvY29udHJhY3QucHk6Mzk4CiAgICAvLyByZXR1cm4gQnl0ZXMoTElTVElOR19MSU5LX0tFWV9QUkVGSVgpICsgb3AuaXRvYihsaWQpCiAgICBmcmFtZV9kaWcgLTMKICAgIGl0b2IKICAgIGJ5dGVjIDYgLy8gMHg2YgogICAgc3dhcAogICAgY29uY2F0CiAgICAvLyBzbWFydF9jb250cmFjdHMvYWFybmFfcmVnaXN0cnkvY29udHJhY3QucHk6NzAzCiAgICAvLyBfbGlzdGluZ19saW5rX2tleShsaW5rLm5leHQubmF0aXZlKSwgTElOS19QUkVWX09GRlNFVCwgbGluay5wcmV2LmJ5dGVzCiAgICBpbnRjXzAgLy8gMAogICAgLy8gc21hcnRfY29udHJhY3RzL2Fhcm5hX3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjcwMi03MDQKICAgIC8vIG9wLkJveC5yZXBsYWNlKAogICAgLy8gICAgIF9saXN0aW5nX2xpbmtfa2V5KGxpbmsubmV4dC5uYXRpdmUpLCBMSU5LX1BSRVZfT0ZGU0VULCBsaW5rLnByZXYuYnl0ZXMKICAgIC8vICkKICAgIHVuY292ZXIgMgogICAgYm94X3JlcGxhY2UKICAgIGIgX2Jvb2tfcmVtb3ZlX2FmdGVyX2lmX2Vsc2VANgoKX2Jvb2tfcmVtb3ZlX2Vsc2VfYm9keUAyOgogICAgLy8gc21hcnRfY29udHJhY3RzL2Fhcm5hX3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjM5OAogICAgLy8gcmV0dXJuIEJ5dGVzKExJU1RJTkdfTElOS19LRVlfUFJFRklYKSArIG9wLml0b2IobGlkKQogICAgZnJhbWVfZGlnIC0zCiAgICBpdG9iCiAgICBieXRlYyA2IC8vIDB4NmIKICAgIHN3YXAKICAgIGNvbmNhdAogICAgLy8gc21hcnRfY29udHJhY3RzL2Fhcm5hX3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjY5NwogICAgLy8gX2xpc3RpbmdfbGlua19rZXkobGluay5wcmV2Lm5hdGl2ZSksIExJTktfTkVYVF9PRkZTRVQsIGxpbmsubmV4dC5ieXRlcwogICAgZGlnIDEKICAgIGV4dHJhY3QgOCA4CiAgICBpbnRjXzIgLy8gOAogICAgLy8gc21hcnRfY29udHJhY3RzL2Fhcm5hX3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjY5Ni02OTgKICAgIC8vIG9wLkJveC5yZXBsYWNlKAogICAgLy8gICAgIF9saXN0aW5nX2xpbmtfa2V5KGxpbmsucHJldi5uYXRpdmUpLCBMSU5LX05FWFRfT0ZGU0VULCBsaW5rLm5leHQuYnl0ZXMKICAgIC8vICkKICAgIHN3YXAKICAgIGJveF9yZXBsYWNlCiAgICBiIF9ib29rX3JlbW92ZV9hZnRlcl9pZl9lbHNlQDMKCgovLyBzbWFydF9jb250cmFjdHMuYWFybmFfcmVnaXN0cnkuY29udHJhY3QuQWFybmFSZWdpc3RyeS5fY2xvc2VfbGlzdGluZyhsaWQ6IHVpbnQ2NCwgc2VsbGVyOiBieXRlcykgLT4gdm9pZDoKX2Nsb3NlX2xpc3Rpbmc6CiAgICAvLyBzbWFydF9jb250cmFjdHMvYWFybmFfcmVnaXN0cnkvY29udHJhY3QucHk6NzM2LTczNwogICAgLy8gQHN1YnJvdXRpbmUKICAgIC8vIGRlZiBfY2xvc2VfbGlzdGluZyhzZWxmLCBsaWQ6IFVJbnQ2NCwgc2VsbGVyOiBBY2NvdW50KSAtPiBOb25lOgogICAgcHJvdG8gMiAwCiAgICAvLyBzbWFydF9jb250cmFjdHMvYWFybmFfcmVnaXN0cnkvY29udHJhY3QucHk6NzQyCiAgICAvLyBkZWwgc2VsZi5saXN0aW5nc1tsaWRdCiAgICBmcmFtZV9kaWcgLTIKICAgIGl0b2IKICAgIGR1cAogICAgYnl0ZWMgNSAvLyAweDZjCiAgICBkaWcgMQogICAgY29uY2F0CiAgICBib3hfZGVsCiAgICBwb3AKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hYXJuYV9yZWdpc3RyeS9jb250cmFjdC5weTo3NDMKICAgIC8vIHNsb3QgPSBzZWxmLmxpc3RpbmdfbGlua3NbbGlkXS5zbG90CiAgICBieXRlYyA2IC8vIDB4NmIKICAgIHN3YXAKICAgIGNvbmNhdAogICAgZHVwCiAgICBib3hfZ2V0CiAgICBhc3NlcnQgLy8gY2hlY2sgc2VsZi5saXN0aW5nX2xpbmtzIGVudHJ5IGV4aXN0cwogICAgZHVwCiAgICBleHRyYWN0IDE2IDgKICAgIGNvdmVyIDMKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hYXJuYV9yZWdpc3RyeS9jb250cmFjdC5weTozMzAKICAgIC8vIHJldHVybiBCeXRlcyhTRUxMRVJfSU5ERVhfUFJFRklYKSArIGFkZHIuYnl0ZXMKICAgIGJ5dGVjIDMwIC8vIDB4NzQKICAgIGZyYW1lX2RpZyAtMQogICAgY29uY2F0CiAgICBkdXAKICAgIHVuY292ZXIgMgogICAgLy8gc21hcnRfY29udHJhY3RzL2Fhcm5hX3JlZ2lzdHJ5L2NvbnRyYWN0LnB5Ojc0MwogICAgLy8gc2xvdCA9IHNlbGYubGlzdGluZ19saW5rc1tsaWRdLnNsb3QKICAgIHB1c2hpbnQgMTYKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hYXJuYV9yZWdpc3RyeS9jb250cmFjdC5weTo3NDQKICAgIC8vIG1vdmVkID0gX2luZGV4X3JlbW92ZShfc2VsbGVyX2tleShzZWxsZXIpLCBzbG90Lm5hdGl2ZSkKICAgIGV4dHJhY3RfdWludDY0CiAgICBkdXAKICAgIGNvdmVyIDIKICAgIGNvdmVyIDUKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hYXJuYV9yZWdpc3RyeS9jb250cmFjdC5weTozNzAKICAgIC8vIGxhc3QgPSBfaW5kZXhfbGVuZ3RoKGtleSkgLSAxCiAgICBkdXAKICAgIGNhbGxzdWIgX2luZGV4X2xlbmd0aAogICAgaW50Y18xIC8vIDEKICAgIC0KICAgIGR1cAogICAgY292ZXIgMwogICAgLy8gc21hcnRfY29udHJhY3RzL2Fhcm5hX3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjM0MwogICAgLy8gcmV0dXJuIGtleSArIG9wLml0b2Ioc2xvdCAvLyBJTkRFWF9QQUdFX0lEUykKICAgIGR1cAogICAgaW50YyA1IC8vIDEyOAogICAgLwogICAgaXRvYgogICAgdW5jb3ZlciAyCiAgICBzd2FwCiAgICBjb25jYXQKICAgIGNvdmVyIDIKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hYXJuYV9yZWdpc3RyeS9jb250cmFjdC5weTozNzIKICAgIC8vIGxhc3Rfb2Zmc2V0ID0gbGFzdCAlIElOREVYX1BBR0VfSURTICogOAogICAgZHVwCiAgICBpbnRjIDUgLy8gMTI4CiAgICAlCiAgICBpbnRjXzIgLy8gOAogICAgKgogICAgY292ZXIgMwogICAgLy8gc21hcnRfY29udHJhY3RzL2Fhcm5hX3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjM3MwogICAgLy8gbW92ZWQgPSBVSW50NjQoTk9fSUQpCiAgICBpbnRjIDQgLy8gMTg0NDY3NDQwNzM3MDk1NTE2MTUKICAgIGNvdmVyIDgKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hYXJuYV9yZWdpc3RyeS9jb250cmFjdC5weTozNzQKICAgIC8vIGlmIHNsb3QgIT0gbGFzdDoKICAgICE9CiAgICBieiBfY2xvc2VfbGlzdGluZ19hZnRlcl9pZl9lbHNlQDUKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hYXJuYV9yZWdpc3RyeS9jb250cmFjdC5weTozNzUKICAgIC8vIG1vdmVkX2lkID0gb3AuQm94LmV4dHJhY3QobGFzdF9wYWdlLCBsYXN0X29mZnNldCwgOCkKICAgIGR1cAogICAgZGlnIDIKICAgIGludGNfMiAvLyA4CiAgICBib3hfZXh0cmFjdAogICAgLy8gc21hcnRfY29udHJhY3RzL2Fhcm5hX3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjM0MwogICAgLy8gcmV0dXJuIGtleSArIG9wLml0b2Ioc2xvdCAvLyBJTkRFWF9QQUdFX0lEUykKICAgIGZyYW1lX2RpZyAxCiAgICBkdXAKICAgIGludGMgNSAvLyAxMjgKICAgIC8KICAgIGl0b2IKICAgIGRpZyA2CiAgICBzd2FwCiAgICBjb25jYXQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hYXJuYV9yZWdpc3RyeS9jb250cmFjdC5weTozNzcKICAgIC8vIF9pbmRleF9wYWdlX2tleShrZXksIHNsb3QpLCBzbG90ICUgSU5ERVhfUEFHRV9JRFMgKiA4LCBtb3ZlZF9pZAogICAgc3dhcAogICAgaW50YyA1IC8vIDEyOAogICAgJQogICAgaW50Y18yIC8vIDgKICAgICoKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hYXJuYV9yZWdpc3RyeS9jb250cmFjdC5weTozNzYtMzc4CiAgICAvLyBvcC5Cb3gucmVwbGFjZSgKICAgIC8vICAgICBfaW5kZXhfcGFnZV9rZXkoa2V5LCBzbG90KSwgc2xvdCAlIElOREVYX1BBR0VfSURTICogOCwgbW92ZWRfaWQKICAgIC8vICkKICAgIGRpZyAyCiAgICBib3hfcmVwbGFjZQogICAgLy8gc21hcnRfY29udHJhY3RzL2Fhcm5hX3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjM3OQogICAgLy8gbW92ZWQgPSBvcC5idG9pKG1vdmVkX2lkKQogICAgYnRvaQogICAgZnJhbWVfYnVyeSAyCgpfY2xvc2VfbGlzdGluZ19hZnRlcl9pZl9lbHNlQDU6CiAgICAvLyBzbWFydF9jb250cmFjdHMvYWFybmFfcmVnaXN0cnkvY29udHJhY3QucHk6MzgwCiAgICAvLyBpZiBsYXN0X29mZnNldCA9PSAwOgogICAgZGlnIDEKICAgIGJueiBfY2xvc2VfbGlzdGluZ19lbHNlX2JvZHlANwogICAgYnVyeSAxCiAgICAvLyBzbWFydF9jb250cmFjdHMvYWFybmFfcmVnaXN0cnkvY29udHJhY3QucHk6MzgxCiAgICAvLyBhc3NlcnQgb3AuQm94LmRlbGV0ZShsYXN0X3BhZ2UpCiAgICBib3hfZGVsCiAgICBhc3NlcnQKCl9jbG9zZV9saXN0aW5nX2FmdGVyX2lmX2Vsc2VAODoKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hYXJuYV9yZWdpc3RyeS9jb250cmFjdC5weTozODQKICAgIC8vIGlmIGxhc3QgPT0gMDoKICAgIGR1cAogICAgYm56IF9jbG9zZV9saXN0aW5nX2Vsc2VfYm9keUAxMAogICAgcG9wCiAgICAvLyBzbWFydF9jb250cmFjdHMvYWFybmFfcmVnaXN0cnkvY29udHJhY3QucHk6Mzg1CiAgICAvLyBhc3NlcnQgb3AuQm94LmRlbGV0ZShrZXkpCiAgICBib3hfZGVsCiAgICBhc3NlcnQKCl9jbG9zZV9saXN0aW5nX2FmdGVyX2lmX2Vsc2VAMTE6CiAgICAvLyBzbWFydF9jb250cmFjdHMvYWFybmFfcmVnaXN0cnkvY29udHJhY3QucHk6NzQ1CiAgICAvLyBpZiBtb3ZlZCAhPSBOT19JRDoKICAgIGZyYW1lX2RpZyAyCiAgICBpbnRjIDQgLy8gMTg0NDY3NDQwNzM3MDk1NTE2MTUKICAgICE9CiAgICBieiBfY2xvc2VfbGlzdGluZ19hZnRlcl9pZl9lbHNlQDIKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hYXJuYV9yZWdpc3RyeS9jb250cmFjdC5weTozOTgKICAgIC8vIHJldHVybiBCeXRlcyhMSVNUSU5HX0xJTktfS0VZX1BSRUZJWCkgKyBvcC5pdG9iKGxpZCkKICAgIGZyYW1lX2RpZyAyCiAgICBpdG9iCiAgICBieXRlYyA2IC8vIDB4NmIKICAgIHN3YXAKICAgIGNvbmNhdAogICAgLy8gc21hcnRfY29udHJhY3RzL2Fhcm5hX3JlZ2lzdHJ5L2NvbnRyYWN0LnB5Ojc0NgogICAgLy8gb3AuQm94LnJlcGxhY2UoX2xpc3RpbmdfbGlua19rZXkobW92ZWQpLCBMSU5LX1NMT1RfT0ZGU0VULCBzbG90LmJ5dGVzKQogICAgcHVzaGludCAxNgogICAgZnJhbWVfZGlnIDAKICAgIGJveF9yZXBsYWNlCgpfY2xvc2VfbGlzdGluZ19hZnRlcl9pZl9lbHNlQDI6CiAgICAvLyBzbWFydF9jb250cmFjdHMvYWFybmFfcmVnaXN0cnkvY29udHJhY3QucHk6NzQ3CiAgICAvLyBkZWwgc2VsZi5saXN0aW5nX2xpbmtzW2xpZF0KICAgIGJveF9kZWwKICAgIHBvcAogICAgLy8gc21hcnRfY29udHJhY3RzL2Fhcm5hX3JlZ2lzdHJ5L2NvbnRyYWN0LnB5Ojc0OQogICAgLy8gbmV4dD1hcmM0LlVJbnQ2NChzZWxmLmZyZWVfbGlzdGluZ19oZWFkKSwKICAgIGludGNfMCAvLyAwCiAgICBieXRlYyAxNSAvLyAiZnJlZV9saXN0aW5nX2hlYWQiCiAgICBhcHBfZ2xvYmFsX2dldF9leAogICAgYXNzZXJ0IC8vIGNoZWNrIHNlbGYuZnJlZV9saXN0aW5nX2hlYWQgZXhpc3RzCiAgICBpdG9iCiAgICAvLyBzbWFydF9jb250cmFjdHMvYWFybmFfcmVnaXN0cnkvY29udHJhY3QucHk6NzUwCiAgICAvLyBzZXE9YXJjNC5VSW50NjQoc2VsZi5mcmVlX2xpc3RpbmdfcHVzaGVzKSwKICAgIGludGNfMCAvLyAwCiAgICBieXRlYyAyMCAvLyAiZnJlZV9saXN0aW5nX3B1c2hlcyIKICAgIGFwcF9nbG9iYWxfZ2V0X2V4CiAgICBhc3NlcnQgLy8gY2hlY2sgc2VsZi5mcmVlX2xpc3RpbmdfcHVzaGVzIGV4aXN0cwogICAgaXRvYgogICAgLy8gc21hcnRfY29udHJhY3RzL2Fhcm5hX3JlZ2lzdHJ5L2NvbnRyYWN0LnB5Ojc0OC03NTEKICAgIC8vIHNlbGYuZnJlZV9saXN0aW5nc1tsaWRdID0gRnJlZUxpbmsoCiAgICAvLyAgICAgbmV4dD1hcmM0LlVJbnQ2NChzZWxmLmZyZWVfbGlzdGluZ19oZWFkKSwKICAgIC8vICAgICBzZXE9YXJjNC5VSW50NjQoc2VsZi5mcmVlX2xpc3RpbmdfcHVzaGVzKSwKICAgIC8vICkKICAgIGNvbmNhdAogICAgLy8gc21hcnRfY29udHJhY3RzL2Fhcm5hX3JlZ2lzdHJ5L2NvbnRyYWN0LnB5Ojc0OAogICAgLy8gc2VsZi5mcmVlX2xpc3RpbmdzW2xpZF0gPSBGcmVlTGluaygKICAgIHB1c2hieXRlcyAweDY2CiAgICB1bmNvdmVyIDIKICAgIGNvbmNhdAogICAgLy8gc21hcnRfY29udHJhY3RzL2Fhcm5hX3JlZ2lzdHJ5L2NvbnRyYWN0LnB5Ojc0OC03NTEKICAgIC8vIHNlbGYuZnJlZV9saXN0aW5nc1tsaWRdID0gRnJlZUxpbmsoCiAgICAvLyAgICAgbmV4dD1hcmM0LlVJbnQ2NChzZWxmLmZyZWVfbGlzdGluZ19oZWFkKSwKICAgIC8vICAgICBzZXE9YXJjNC5VSW50NjQoc2VsZi5mcmVlX2xpc3RpbmdfcHVzaGVzKSwKICAgIC8vICkKICAgIHN3YXAKICAgIGJveF9wdXQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hYXJuYV9yZWdpc3RyeS9jb250cmFjdC5weTo3NTIKICAgIC8vIHNlbGYuZnJlZV9saXN0aW5nX2hlYWQgPSBsaWQKICAgIGJ5dGVjIDE1IC8vICJmcmVlX2xpc3RpbmdfaGVhZCIKICAgIGZyYW1lX2RpZyAtMgogICAgYXBwX2dsb2JhbF9wdXQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hYXJuYV9yZWdpc3RyeS9jb250cmFjdC5weTo3NTMKICAgIC8vIHNlbGYuZnJlZV9saXN0aW5nX3B1c2hlcyArPSAxCiAgICBpbnRjXzAgLy8gMAogICAgYnl0ZWMgMjAgLy8gImZyZWVfbGlzdGluZ19wdXNoZXMiCiAgICBhcHBfZ2xvYmFsX2dldF9leAogICAgYXNzZXJ0IC8vIGNoZWNrIHNlbGYuZnJlZV9saXN0aW5nX3B1c2hlcyBleGlzdHMKICAgIGludGNfMSAvLyAxCiAgICArCiAgICBieXRlYyAyMCAvLyAiZnJlZV9saXN0aW5nX3B1c2hlcyIKICAgIHN3YXAKICAgIGFwcF9nbG9iYWxfcHV0CiAgICAvLyBzbWFydF9jb250cmFjdHMvYWFybmFfcmVnaXN0cnkvY29udHJhY3QucHk6NzU0CiAgICAvLyBzZWxmLm9wZW5fbGlzdGluZ19jb3VudCAtPSAxCiAgICBpbnRjXzAgLy8gMAogICAgYnl0ZWMgMTMgLy8gIm9wZW5fbGlzdGluZ19jb3VudCIKICAgIGFwcF9nbG9iYWxfZ2V0X2V4CiAgICBhc3NlcnQgLy8gY2hlY2sgc2VsZi5vcGVuX2xpc3RpbmdfY291bnQgZXhpc3RzCiAgICBpbnRjXzEgLy8gMQogICAgLQogICAgYnl0ZWMgMTMgLy8gIm9wZW5fbGlzdGluZ19jb3VudCIKICAgIHN3YXAKICAgIGFwcF9nbG9iYWxfcHV0CiAgICByZXRzdWIKCl9jbG9zZV9saXN0aW5nX2Vsc2VfYm9keUAxMDoKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hYXJuYV9yZWdpc3RyeS9jb250cmFjdC5weTozODcKICAgIC8vIG9wLkJveC5wdXQoa2V5LCBvcC5pdG9iKGxhc3QpKQogICAgaXRvYgogICAgYm94X3B1dAogICAgYiBfY2xvc2VfbGlzdGluZ19hZnRlcl9pZl9lbHNlQDExCgpfY2xvc2VfbGlzdGluZ19lbHNlX2JvZHlANzoKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hYXJuYV9yZWdpc3RyeS9jb250cmFjdC5weTozODMKICAgIC8vIG9wLkJveC5yZXNpemUobGFzdF9wYWdlLCBsYXN0X29mZnNldCkKICAgIHN3YXAKICAgIGJveF9yZXNpemUKICAgIGIgX2Nsb3NlX2xpc3RpbmdfYWZ0ZXJfaWZfZWxzZUA4CgoKLy8gc21hcnRfY29udHJhY3RzLmFhcm5hX3JlZ2lzdHJ5LmNvbnRyYWN0LkFhcm5hUmVnaXN0cnkuX3Rha2VfZnJvbV9saXN0aW5nKGxpZDogdWludDY0LCBxdWFudGl0eTogdWludDY0KSAtPiBieXRlcywgdWludDY0LCB1aW50NjQ6Cl90YWtlX2Zyb21fbGlzdGluZzoKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hYXJuYV9yZWdpc3RyeS9jb250cmFjdC5weTo3NjUtNzY5CiAgICAvLyAjIOKUgOKUgCBNYXJrZXRwbGFjZSDilIDilIAKICAgIC8vIEBzdWJyb3V0aW5lCiAgICAvLyBkZWYgX3Rha2VfZnJvbV9saXN0aW5nKAogICAgLy8gICAgIHNlbGYsIGxpZDogVUludDY0LCBxdWFudGl0eTogVUludDY0CiAgICAvLyApIC0+IHR1cGxlW0FjY291bnQsIFVJbnQ2NCwgVUludDY0XToKICAgIHByb3RvIDIgMwogICAgLy8gc21hcnRfY29udHJhY3RzL2Fhcm5hX3JlZ2lzdHJ5L2NvbnRyYWN0LnB5Ojc3NQogICAgLy8gcmVjb3JkID0gc2VsZi5saXN0aW5nc1tsaWRdLmNvcHkoKQogICAgZnJhbWVfZGlnIC0yCiAgICBpdG9iCiAgICBkdXAKICAgIGJ5dGVjIDUgLy8gMHg2YwogICAgc3dhcAogICAgY29uY2F0CiAgICBkdXAKICAgIGJveF9nZXQKICAgIHN3YXAKICAgIGR1cAogICAgdW5jb3ZlciAyCiAgICBhc3NlcnQgLy8gY2hlY2sgc2VsZi5saXN0aW5ncyBlbnRyeSBleGlzdHMKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hYXJuYV9yZWdpc3RyeS9jb250cmFjdC5weTo3NzYKICAgIC8vIHByaWNlID0gcmVjb3JkLnByaWNlLm5hdGl2ZQogICAgZHVwCiAgICBwdXNoaW50IDQwCiAgICBleHRyYWN0X3VpbnQ2NAogICAgZHVwCiAgICB1bmNvdmVyIDIKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hYXJuYV9yZWdpc3RyeS9jb250cmFjdC5weTo3NzcKICAgIC8vIHJlbWFpbmluZyA9IHJlY29yZC5hbW91bnQubmF0aXZlIC0gcXVhbnRpdHkKICAgIHB1c2hpbnQgMzIKICAgIGV4dHJhY3RfdWludDY0CiAgICBmcmFtZV9kaWcgLTEKICAgIC0KICAgIGR1cAogICAgY292ZXIgMwogICAgLy8gc21hcnRfY29udHJhY3RzL2Fhcm5hX3JlZ2lzdHJ5L2NvbnRyYWN0LnB5Ojc3OAogICAgLy8gY29zdCA9IHF1YW50aXR5ICogcHJpY2UKICAgIGZyYW1lX2RpZyAtMQogICAgdW5jb3ZlciAyCiAgICAqCiAgICBjb3ZlciAzCiAgICAvLyBzbWFydF9jb250cmFjdHMvYWFybmFfcmVnaXN0cnkvY29udHJhY3QucHk6NzgwCiAgICAvLyBpZiByZW1haW5pbmcgPT0gMDoKICAgIGJueiBfdGFrZV9mcm9tX2xpc3RpbmdfZWxzZV9ib2R5QDIKICAgIHVuY292ZXIgNAogICAgcG9wCiAgICAvLyBzbWFydF9jb250cmFjdHMvYWFybmFfcmVnaXN0cnkvY29udHJhY3QucHk6NzgxCiAgICAvLyBzZWxmLl9ib29rX3JlbW92ZShsaWQsIHByaWNlLCBxdWFudGl0eSkKICAgIGZyYW1lX2RpZyAtMgogICAgc3dhcAogICAgZnJhbWVfZGlnIC0xCiAgICBjYWxsc3ViIF9ib29rX3JlbW92ZQogICAgLy8gc21hcnRfY29udHJhY3RzL2Fhcm5hX3JlZ2lzdHJ5L2NvbnRyYWN0LnB5Ojc4MgogICAgLy8gc2VsZi5fY2xvc2VfbGlzdGluZyhsaWQsIHJlY29yZC5zZWxsZXIubmF0aXZlKQogICAgZGlnIDIKICAgIGV4dHJhY3QgMCAzMgogICAgZnJhbWVfZGlnIC0yCiAgICBzd2FwCiAgICBjYWxsc3ViIF9jbG9zZV9saXN0aW5nCiAgICAvLyBzbWFydF9jb250cmFjdHMvYWFybmFfcmVnaXN0cnkvY29udHJhY3QucHk6NzgzCiAgICAvLyBwcm9jZWVkcyArPSBMSVNUSU5HX1JFRlVORAogICAgZGlnIDEKICAgIGludGMgNiAvLyA5ODAwMAogICAgKwoKX3Rha2VfZnJvbV9saXN0aW5nX2FmdGVyX2lmX2Vsc2VAMzoKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hYXJuYV9yZWdpc3RyeS9jb250cmFjdC5weTo3ODgKICAgIC8vIHNlbGYuZXNjcm93ZWRfdG9rZW5zIC09IHF1YW50aXR5CiAgICBpbnRjXzAgLy8gMAogICAgYnl0ZWMgOSAvLyAiZXNjcm93ZWRfdG9rZW5zIgogICAgYXBwX2dsb2JhbF9nZXRfZXgKICAgIGFzc2VydCAvLyBjaGVjayBzZWxmLmVzY3Jvd2VkX3Rva2VucyBleGlzdHMKICAgIGZyYW1lX2RpZyAtMQogICAgLQogICAgYnl0ZWMgOSAvLyAiZXNjcm93ZWRfdG9rZW5zIgogICAgc3dhcAogICAgYXBwX2dsb2JhbF9wdXQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hYXJuYV9yZWdpc3RyeS9jb250cmFjdC5weTo3ODkKICAgIC8vIHNlbGYudG9rZW5zX3RyYWRlZCArPSBxdWFudGl0eQogICAgaW50Y18wIC8vIDAKICAgIGJ5dGVjIDIzIC8vICJ0b2tlbnNfdHJhZGVkIgogICAgYXBwX2dsb2JhbF9nZXRfZXgKICAgIGFzc2VydCAvLyBjaGVjayBzZWxmLnRva2Vuc190cmFkZWQgZXhpc3RzCiAgICBmcmFtZV9kaWcgLTEKICAgICsKICAgIGJ5dGVjIDIzIC8vICJ0b2tlbnNfdHJhZGVkIgogICAgc3dhcAogICAgYXBwX2dsb2JhbF9wdXQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hYXJuYV9yZWdpc3RyeS9jb250cmFjdC5weTo3OTAKICAgIC8vIHNlbGYudm9sdW1lX3RyYWRlZCArPSBjb3N0CiAgICBpbnRjXzAgLy8gMAogICAgYnl0ZWMgMjQgLy8gInZvbHVtZV90cmFkZWQiCiAgICBhcHBfZ2xvYmFsX2dldF9leAogICAgYXNzZXJ0IC8vIGNoZWNrIHNlbGYudm9sdW1lX3RyYWRlZCBleGlzdHMKICAgIHVuY292ZXIgMwogICAgZHVwCiAgICBjb3ZlciAyCiAgICArCiAgICBieXRlYyAyNCAvLyAidm9sdW1lX3RyYWRlZCIKICAgIHN3YXAKICAgIGFwcF9nbG9iYWxfcHV0CiAgICAvLyBzbWFydF9jb250cmFjdHMvYWFybmFfcmVnaXN0cnkvY29udHJhY3QucHk6Nzk0CiAgICAvLyBidXllcj1hcmM0LkFkZHJlc3MoVHhuLnNlbmRlciksCiAgICB0eG4gU2VuZGVyCiAgICAvLyBzbWFydF9jb250cmFjdHMvYWFybmFfcmVnaXN0cnkvY29udHJhY3QucHk6Nzk1CiAgICAvLyBxdWFudGl0eT1hcmM0LlVJbnQ2NChxdWFudGl0eSksCiAgICBmcmFtZV9kaWcgLTEKICAgIGl0b2IKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hYXJuYV9yZWdpc3RyeS9jb250cmFjdC5weTo3OTYKICAgIC8vIGNvc3Q9YXJjNC5VSW50NjQoY29zdCksCiAgICBkaWcgMgogICAgaXRvYgogICAgLy8gc21hcnRfY29udHJhY3RzL2Fhcm5hX3JlZ2lzdHJ5L2NvbnRyYWN0LnB5Ojc5NwogICAgLy8gcmVtYWluaW5nPWFyYzQuVUludDY0KHJlbWFpbmluZyksCiAgICB1bmNvdmVyIDUKICAgIGl0b2IKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hYXJuYV9yZWdpc3RyeS9jb250cmFjdC5weTo3OTItNzk4CiAgICAvLyBCb3VnaHQoCiAgICAvLyAgICAgbGlzdGluZ19pZD1hcmM0LlVJbnQ2NChsaWQpLAogICAgLy8gICAgIGJ1eWVyPWFyYzQuQWRkcmVzcyhUeG4uc2VuZGVyKSwKICAgIC8vICAgICBxdWFudGl0eT1hcmM0LlVJbnQ2NChxdWFudGl0eSksCiAgICAvLyAgICAgY29zdD1hcmM0LlVJbnQ2NChjb3N0KSwKICAgIC8vICAgICByZW1haW5pbmc9YXJjNC5VSW50NjQocmVtYWluaW5nKSwKICAgIC8vICkKICAgIHVuY292ZXIgNwogICAgdW5jb3ZlciA0CiAgICBjb25jYXQKICAgIHVuY292ZXIgMwogICAgY29uY2F0CiAgICB1bmNvdmVyIDIKICAgIGNvbmNhdAogICAgc3dhcAogICAgY29uY2F0CiAgICAvLyBzbWFydF9jb250cmFjdHMvYWFybmFfcmVnaXN0cnkvY29udHJhY3QucHk6NzkxLTc5OQogICAgLy8gYXJjNC5lbWl0KAogICAgLy8gICAgIEJvdWdodCgKICAgIC8vICAgICAgICAgbGlzdGluZ19pZD1hcmM0LlVJbnQ2NChsaWQpLAogICAgLy8gICAgICAgICBidXllcj1hcmM0LkFkZHJlc3MoVHhuLnNlbmRlciksCiAgICAvLyAgICAgICAgIHF1YW50aXR5PWFyYzQuVUludDY0KHF1YW50aXR5KSwKICAgIC8vICAgICAgICAgY29zdD1hcmM0LlVJbnQ2NChjb3N0KSwKICAgIC8vICAgICAgICAgcmVtYWluaW5nPWFyYzQuVUludDY0KHJlbWFpbmluZyksCiAgICAvLyAgICAgKQogICAgLy8gKQogICAgcHVzaGJ5dGVzIDB4YzIyZDRmY2MgLy8gbWV0aG9kICJCb3VnaHQodWludDY0LGFkZHJlc3MsdWludDY0LHVpbnQ2NCx1aW50NjQpIgogICAgc3dhcAogICAgY29uY2F0CiAgICBsb2cKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hYXJuYV9yZWdpc3RyeS9jb250cmFjdC5weTo4MDAKICAgIC8vIHJldHVybiByZWNvcmQuc2VsbGVyLm5hdGl2ZSwgY29zdCwgcHJvY2VlZHMKICAgIHVuY292ZXIgMgogICAgZXh0cmFjdCAwIDMyCiAgICBzd2FwCiAgICB1bmNvdmVyIDIKICAgIHJldHN1YgoKX3Rha2VfZnJvbV9saXN0aW5nX2Vsc2VfYm9keUAyOgogICAgLy8gc21hcnRfY29udHJhY3RzL2Fhcm5hX3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjY4MQogICAgLy8gbGV2ZWwgPSBzZWxmLnByaWNlX2xldmVsc1twcmljZV0uY29weSgpCiAgICBpdG9iCiAgICBieXRlYyA0IC8vIDB4NmYKICAgIHN3YXAKICAgIGNvbmNhdAogICAgZHVwCiAgICBib3hfZ2V0CiAgICBhc3NlcnQgLy8gY2hlY2sgc2VsZi5wcmljZV9sZXZlbHMgZW50cnkgZXhpc3RzCiAgICAvLyBzbWFydF9jb250cmFjdHMvYWFybmFfcmVnaXN0cnkvY29udHJhY3QucHk6NjgyCiAgICAvLyBsZXZlbC5kZXB0aCA9IGFyYzQuVUludDY0KGxldmVsLmRlcHRoLm5hdGl2ZSAtIHF1YW50aXR5KQogICAgcHVzaGludCAzMgogICAgZXh0cmFjdF91aW50NjQKICAgIGZyYW1lX2RpZyAtMQogICAgLQogICAgaXRvYgogICAgLy8gc21hcnRfY29udHJhY3RzL2Fhcm5hX3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjY4Mi02ODMKICAgIC8vIGxldmVsLmRlcHRoID0gYXJjNC5VSW50NjQobGV2ZWwuZGVwdGgubmF0aXZlIC0gcXVhbnRpdHkpCiAgICAvLyBzZWxmLnByaWNlX2xldmVsc1twcmljZV0gPSBsZXZlbC5jb3B5KCkKICAgIHB1c2hpbnQgMzIKICAgIHN3YXAKICAgIGJveF9yZXBsYWNlIC8vIG9uIGVycm9yOiBpbmRleCBvdXQgb2YgYm91bmRzCiAgICAvLyBzbWFydF9jb250cmFjdHMvYWFybmFfcmVnaXN0cnkvY29udHJhY3QucHk6Nzg2CiAgICAvLyByZWNvcmQuYW1vdW50ID0gYXJjNC5VSW50NjQocmVtYWluaW5nKQogICAgZHVwCiAgICBpdG9iCiAgICB1bmNvdmVyIDMKICAgIGRpZyAxCiAgICByZXBsYWNlMiAzMgogICAgY292ZXIgMwogICAgLy8gc21hcnRfY29udHJhY3RzL2Fhcm5hX3JlZ2lzdHJ5L2NvbnRyYWN0LnB5Ojc4Ni03ODcKICAgIC8vIHJlY29yZC5hbW91bnQgPSBhcmM0LlVJbnQ2NChyZW1haW5pbmcpCiAgICAvLyBzZWxmLmxpc3RpbmdzW2xpZF0gPSByZWNvcmQuY29weSgpCiAgICB1bmNvdmVyIDQKICAgIHB1c2hpbnQgMzIKICAgIHVuY292ZXIgMgogICAgYm94X3JlcGxhY2UgLy8gb24gZXJyb3I6IGluZGV4IG91dCBvZiBib3VuZHMKICAgIGRpZyAxCiAgICBiIF90YWtlX2Zyb21fbGlzdGluZ19hZnRlcl9pZl9lbHNlQDMKCgovLyBzbWFydF9jb250cmFjdHMuYWFybmFfcmVnaXN0cnkuY29udHJhY3QuQWFybmFSZWdpc3RyeS5fY2FsbGVyX3BheW1lbnQocGF5bWVudDogdWludDY0KSAtPiB1aW50NjQ6Cl9jYWxsZXJfcGF5bWVudDoKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hYXJuYV9yZWdpc3RyeS9jb250cmFjdC5weTo4MDItODAzCiAgICAvLyBAc3Vicm91dGluZQogICAgLy8gZGVmIF9jYWxsZXJfcGF5bWVudChzZWxmLCBwYXltZW50OiBndHhuLlBheW1lbnRUcmFuc2FjdGlvbikgLT4gVUludDY0OgogICAgcHJvdG8gMSAxCiAgICAvLyBzbWFydF9jb250cmFjdHMvYWFybmFfcmVnaXN0cnkvY29udHJhY3QucHk6ODA2CiAgICAvLyBwYXltZW50LnJlY2VpdmVyID09IEdsb2JhbC5jdXJyZW50X2FwcGxpY2F0aW9uX2FkZHJlc3MKICAgIGZyYW1lX2RpZyAtMQogICAgZ3R4bnMgUmVjZWl2ZXIKICAgIGdsb2JhbCBDdXJyZW50QXBwbGljYXRpb25BZGRyZXNzCiAgICA9PQogICAgLy8gc21hcnRfY29udHJhY3RzL2Fhcm5hX3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjgwNS04MDcKICAgIC8vIGFzc2VydCAoCiAgICAvLyAgICAgcGF5bWVudC5yZWNlaXZlciA9PSBHbG9iYWwuY3VycmVudF9hcHBsaWNhdGlvbl9hZGRyZXNzCiAgICAvLyApLCAicGF5bWVudCBtdXN0IGdvIHRvIHRoZSBhcHAiCiAgICBhc3NlcnQgLy8gcGF5bWVudCBtdXN0IGdvIHRvIHRoZSBhcHAKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hYXJuYV9yZWdpc3RyeS9jb250cmFjdC5weTo4MDgKICAgIC8vIGFzc2VydCBwYXltZW50LnNlbmRlciA9PSBUeG4uc2VuZGVyLCAicGF5bWVudCBtdXN0IGNvbWUgZnJvbSB0aGUgY2FsbGVyIgogICAgZnJhbWVfZGlnIC0xCiAgICBndHhucyBTZW5kZXIKICAgIHR4biBTZW5kZXIKICAgID09CiAgICBhc3NlcnQgLy8gcGF5bWVudCBtdXN0IGNvbWUgZnJvbSB0aGUgY2FsbGVyCiAgICAvLyBzbWFydF9jb250cmFjdHMvYWFybmFfcmVnaXN0cnkvY29udHJhY3QucHk6ODA5CiAgICAvLyByZXR1cm4gcGF5bWVudC5hbW91bnQKICAgIGZyYW1lX2RpZyAtMQogICAgZ3R4bnMgQW1vdW50CiAgICByZXRzdWIKCgovLyBzbWFydF9jb250cmFjdHMuYWFybmFfcmVnaXN0cnkuY29udHJhY3QuQWFybmFSZWdpc3RyeS5fc2V0dGxlX3B1cmNoYXNlKGxpZDogdWludDY0LCBxdWFudGl0eTogdWludDY0LCBwYWlkOiB1aW50NjQpIC0+IHZvaWQ6Cl9zZXR0bGVfcHVyY2hhc2U6CiAgICAvLyBzbWFydF9jb250cmFjdHMvYWFybmFfcmVnaXN0cnkvY29udHJhY3QucHk6ODExLTgxMgogICAgLy8gQHN1YnJvdXRpbmUKICAgIC8vIGRlZiBfc2V0dGxlX3B1cmNoYXNlKHNlbGYsIGxpZDogVUludDY0LCBxdWFudGl0eTogVUludDY0LCBwYWlkOiBVSW50NjQpIC0+IE5vbmU6CiAgICBwcm90byAzIDAKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hYXJuYV9yZWdpc3RyeS9jb250cmFjdC5weTo4MTcKICAgIC8vIHNlbGxlciwgY29zdCwgb3dlZCA9IHNlbGYuX3Rha2VfZnJvbV9saXN0aW5nKGxpZCwgcXVhbnRpdHkpCiAgICBmcmFtZV9kaWcgLTMKICAgIGZyYW1lX2RpZyAtMgogICAgY2FsbHN1YiBfdGFrZV9mcm9tX2xpc3RpbmcKICAgIGNvdmVyIDIKICAgIGR1cAogICAgY292ZXIgMgogICAgY292ZXIgMwogICAgc3dhcAogICAgLy8gc21hcnRfY29udHJhY3RzL2Fhcm5hX3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjgxOAogICAgLy8gYXNzZXJ0IHBhaWQgPj0gY29zdCwgImluc3VmZmljaWVudCBwYXltZW50IgogICAgZnJhbWVfZGlnIC0xCiAgICBkaWcgMQogICAgPj0KICAgIGFzc2VydCAvLyBpbnN1ZmZpY2llbnQgcGF5bWVudAogICAgLy8gc21hcnRfY29udHJhY3RzL2Fhcm5hX3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjgyMAogICAgLy8geGZlcl9hc3NldD1Bc3NldChzZWxmLmFhcm5hX2Fzc2V0KSwKICAgIGludGNfMCAvLyAwCiAgICBieXRlY18xIC8vICJhYXJuYV9hc3NldCIKICAgIGFwcF9nbG9iYWxfZ2V0X2V4CiAgICBzd2FwCiAgICBjb3ZlciAyCiAgICBhc3NlcnQgLy8gY2hlY2sgc2VsZi5hYXJuYV9hc3NldCBleGlzdHMKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hYXJuYV9yZWdpc3RyeS9jb250cmFjdC5weTo4MjEKICAgIC8vIGFzc2V0X3JlY2VpdmVyPVR4bi5zZW5kZXIsCiAgICB0eG4gU2VuZGVyCiAgICBzd2FwCiAgICAvLyBzbWFydF9jb250cmFjdHMvYWFybmFfcmVnaXN0cnkvY29udHJhY3QucHk6ODI1CiAgICAvLyBpZiBwYWlkID4gY29zdDoKICAgIGZyYW1lX2RpZyAtMQogICAgPAogICAgYnogX3NldHRsZV9wdXJjaGFzZV9lbHNlX2JvZHlANQogICAgLy8gc21hcnRfY29udHJhY3RzL2Fhcm5hX3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjgyNi04MzAKICAgIC8vIGl0eG4uc3VibWl0X3R4bnMoCiAgICAvLyAgICAgdG9rZW5zLAogICAgLy8gICAgIHByb2NlZWRzLAogICAgLy8gICAgIGl0eG4uUGF5bWVudChyZWNlaXZlcj1UeG4uc2VuZGVyLCBhbW91bnQ9cGFpZCAtIGNvc3QpLAogICAgLy8gKQogICAgaXR4bl9iZWdpbgogICAgZnJhbWVfZGlnIC0yCiAgICBpdHhuX2ZpZWxkIEFzc2V0QW1vdW50CiAgICBpdHhuX2ZpZWxkIEFzc2V0UmVjZWl2ZXIKICAgIGl0eG5fZmllbGQgWGZlckFzc2V0CiAgICAvLyBzbWFydF9jb250cmFjdHMvYWFybmFfcmVnaXN0cnkvY29udHJhY3QucHk6ODE5CiAgICAvLyB0b2tlbnMgPSBpdHhuLkFzc2V0VHJhbnNmZXIoCiAgICBwdXNoaW50IDQgLy8gYXhmZXIKICAgIGl0eG5fZmllbGQgVHlwZUVudW0KICAgIGludGNfMCAvLyAwCiAgICBpdHhuX2ZpZWxkIEZlZQogICAgLy8gc21hcnRfY29udHJhY3RzL2Fhcm5hX3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjgyOAogICAgLy8gcHJvY2VlZHMsCiAgICBpdHhuX25leHQKICAgIGl0eG5fZmllbGQgUmVjZWl2ZXIKICAgIGl0eG5fZmllbGQgQW1vdW50CiAgICAvLyBzbWFydF9jb250cmFjdHMvYWFybmFfcmVnaXN0cnkvY29udHJhY3QucHk6ODI0CiAgICAvLyBwcm9jZWVkcyA9IGl0eG4uUGF5bWVudChyZWNlaXZlcj1zZWxsZXIsIGFtb3VudD1vd2VkKQogICAgaW50Y18xIC8vIHBheQogICAgaXR4bl9maWVsZCBUeXBlRW51bQogICAgaW50Y18wIC8vIDAKICAgIGl0eG5fZmllbGQgRmVlCiAgICAvLyBzbWFydF9jb250cmFjdHMvYWFybmFfcmVnaXN0cnkvY29udHJhY3QucHk6ODI5CiAgICAvLyBpdHhuLlBheW1lbnQocmVjZWl2ZXI9VHhuLnNlbmRlciwgYW1vdW50PXBhaWQgLSBjb3N0KSwKICAgIGl0eG5fbmV4dAogICAgdHhuIFNlbmRlcgogICAgZnJhbWVfZGlnIC0xCiAgICB1bmNvdmVyIDIKICAgIC0KICAgIGl0eG5fZmllbGQgQW1vdW50CiAgICBpdHhuX2ZpZWxkIFJlY2VpdmVyCiAgICBpbnRjXzEgLy8gcGF5CiAgICBpdHhuX2ZpZWxkIFR5cGVFbnVtCiAgICBpbnRjXzAgLy8gMAogICAgaXR4bl9maWVsZCBGZWUKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hYXJuYV9yZWdpc3RyeS9jb250cmFjdC5weTo4MjYtODMwCiAgICAvLyBpdHhuLnN1Ym1pdF90eG5zKAogICAgLy8gICAgIHRva2VucywKICAgIC8vICAgICBwcm9jZWVkcywKICAgIC8vICAgICBpdHhuLlBheW1lbnQocmVjZWl2ZXI9VHhuLnNlbmRlciwgYW1vdW50PXBhaWQgLSBjb3N0KSwKICAgIC8vICkKICAgIGl0eG5fc3VibWl0CiAgICByZXRzdWIKCl9zZXR0bGVfcHVyY2hhc2VfZWxzZV9ib2R5QDU6CiAgICB1bmNvdmVyIDQKICAgIHBvcAogICAgLy8gc21hcnRfY29udHJhY3RzL2Fhcm5hX3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjgzMgogICAgLy8gaXR4bi5zdWJtaXRfdHhucyh0b2tlbnMsIHByb2NlZWRzKQogICAgaXR4bl9iZWdpbgogICAgZnJhbWVfZGlnIC0yCiAgICBpdHhuX2ZpZWxkIEFzc2V0QW1vdW50CiAgICBpdHhuX2ZpZWxkIEFzc2V0UmVjZWl2ZXIKICAgIGl0eG5fZmllbGQgWGZlckFzc2V0CiAgICAvLyBzbWFydF9jb250cmFjdHMvYWFybmFfcmVnaXN0cnkvY29udHJhY3QucHk6ODE5CiAgICAvLyB0b2tlbnMgPSBpdHhuLkFzc2V0VHJhbnNmZXIoCiAgICBwdXNoaW50IDQgLy8gYXhmZXIKICAgIGl0eG5fZmllbGQgVHlwZUVudW0KICAgIGludGNfMCAvLyAwCiAgICBpdHhuX2ZpZWxkIEZlZQogICAgLy8gc21hcnRfY29udHJhY3RzL2Fhcm5hX3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjgzMgogICAgLy8gaXR4bi5zdWJtaXRfdHhucyh0b2tlbnMsIHByb2NlZWRzKQogICAgaXR4bl9uZXh0CiAgICBpdHhuX2ZpZWxkIFJlY2VpdmVyCiAgICBpdHhuX2ZpZWxkIEFtb3VudAogICAgLy8gc21hcnRfY29udHJhY3RzL2Fhcm5hX3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjgyNAogICAgLy8gcHJvY2VlZHMgPSBpdHhuLlBheW1lbnQocmVjZWl2ZXI9c2VsbGVyLCBhbW91bnQ9b3dlZCkKICAgIGludGNfMSAvLyBwYXkKICAgIGl0eG5fZmllbGQgVHlwZUVudW0KICAgIGludGNfMCAvLyAwCiAgICBpdHhuX2ZpZWxkIEZlZQogICAgLy8gc21hcnRfY29udHJhY3RzL2Fhcm5hX3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjgzMgogICAgLy8gaXR4bi5zdWJtaXRfdHhucyh0b2tlbnMsIHByb2NlZWRzKQogICAgaXR4bl9zdWJtaXQKICAgIHJldHN1YgoKCi8vIHNtYXJ0X2NvbnRyYWN0cy5hYXJuYV9yZWdpc3RyeS5jb250cmFjdC5BYXJuYVJlZ2lzdHJ5Ll9pbmRleF9wYWdlKGtleTogYnl0ZXMsIHN0YXJ0OiB1aW50NjQsIGNvdW50OiB1aW50NjQpIC0+IGJ5dGVzOgpfaW5kZXhfcGFnZToKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hYXJuYV9yZWdpc3RyeS9jb250cmFjdC5weTo4MzQtODM3CiAgICAvLyBAc3Vicm91dGluZQogICAgLy8gZGVmIF9pbmRleF9wYWdlKAogICAgLy8gICAgIHNlbGYsIGtleTogQnl0ZXMsIHN0YXJ0OiBVSW50NjQsIGNvdW50OiBVSW50NjQKICAgIC8vICkgLT4gYXJjNC5EeW5hbWljQXJyYXlbYXJjNC5VSW50NjRdOgogICAgcHJvdG8gMyAxCiAgICBwdXNoYnl0ZXMgIiIKICAgIGR1cAogICAgLy8gc21hcnRfY29udHJhY3RzL2Fhcm5hX3JlZ2lzdHJ5L2NvbnRyYWN0LnB5Ojg0MwogICAgLy8gZW5kID0gc2VsZi5fcGFnZV9lbmQoc3RhcnQsIGNvdW50LCBfaW5kZXhfbGVuZ3RoKGtleSkpCiAgICBmcmFtZV9kaWcgLTMKICAgIGNhbGxzdWIgX2luZGV4X2xlbmd0aAogICAgZnJhbWVfZGlnIC0yCiAgICBmcmFtZV9kaWcgLTEKICAgIHVuY292ZXIgMgogICAgY2FsbHN1YiBfcGFnZV9lbmQKICAgIGR1cAogICAgLy8gc21hcnRfY29udHJhY3RzL2Fhcm5hX3JlZ2lzdHJ5L2NvbnRyYWN0LnB5Ojg0NAogICAgLy8gaWYgZW5kIC0gc3RhcnQgPiBNQVhfSURfUEFHRToKICAgIGZyYW1lX2RpZyAtMgogICAgLQogICAgcHVzaGludCAxMjcKICAgID4KICAgIGJ6IF9pbmRleF9wYWdlX2FmdGVyX2lmX2Vsc2VAMgogICAgLy8gc21hcnRfY29udHJhY3RzL2Fhcm5hX3JlZ2lzdHJ5L2NvbnRyYWN0LnB5Ojg0NQogICAgLy8gZW5kID0gc3RhcnQgKyBNQVhfSURfUEFHRQogICAgZnJhbWVfZGlnIC0yCiAgICBwdXNoaW50IDEyNwogICAgKwogICAgZnJhbWVfYnVyeSAyCgpfaW5kZXhfcGFnZV9hZnRlcl9pZl9lbHNlQDI6CiAgICAvLyBzbWFydF9jb250cmFjdHMvYWFybmFfcmVnaXN0cnkvY29udHJhY3QucHk6ODQ2CiAgICAvLyByYXcgPSBCeXRlcygpCiAgICBwdXNoYnl0ZXMgMHgKICAgIGZyYW1lX2RpZyAtMgoKX2luZGV4X3BhZ2Vfd2hpbGVfdG9wQDM6CiAgICAvLyBzbWFydF9jb250cmFjdHMvYWFybmFfcmVnaXN0cnkvY29udHJhY3QucHk6ODQ4CiAgICAvLyB3aGlsZSBzbG90IDwgZW5kOgogICAgZHVwCiAgICBmcmFtZV9kaWcgMgogICAgPAogICAgYnogX2luZGV4X3BhZ2VfYWZ0ZXJfd2hpbGVANwogICAgLy8gc21hcnRfY29udHJhY3RzL2Fhcm5hX3JlZ2lzdHJ5L2NvbnRyYWN0LnB5Ojg0OQogICAgLy8gdGFrZSA9IElOREVYX1BBR0VfSURTIC0gc2xvdCAlIElOREVYX1BBR0VfSURTCiAgICBkdXBuIDIKICAgIGludGMgNSAvLyAxMjgKICAgICUKICAgIGR1cAogICAgY292ZXIgNAogICAgaW50YyA1IC8vIDEyOAogICAgc3dhcAogICAgLQogICAgZHVwCiAgICBmcmFtZV9idXJ5IDAKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hYXJuYV9yZWdpc3RyeS9jb250cmFjdC5weTo4NTAKICAgIC8vIGlmIHRha2UgPiBlbmQgLSBzbG90OgogICAgZnJhbWVfZGlnIDIKICAgIHVuY292ZXIgMgogICAgLQogICAgZHVwCiAgICBmcmFtZV9idXJ5IDEKICAgID4KICAgIGJ6IF9pbmRleF9wYWdlX2FmdGVyX2lmX2Vsc2VANgogICAgZnJhbWVfZGlnIDEKICAgIGZyYW1lX2J1cnkgMAoKX2luZGV4X3BhZ2VfYWZ0ZXJfaWZfZWxzZUA2OgogICAgLy8gc21hcnRfY29udHJhY3RzL2Fhcm5hX3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjM0MwogICAgLy8gcmV0dXJuIGtleSArIG9wLml0b2Ioc2xvdCAvLyBJTkRFWF9QQUdFX0lEUykKICAgIGR1cAogICAgaW50YyA1IC8vIDEyOAogICAgLwogICAgaXRvYgogICAgZnJhbWVfZGlnIC0zCiAgICBzd2FwCiAgICBjb25jYXQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hYXJuYV9yZWdpc3RyeS9jb250cmFjdC5weTo4NTMKICAgIC8vIF9pbmRleF9wYWdlX2tleShrZXksIHNsb3QpLCBzbG90ICUgSU5ERVhfUEFHRV9JRFMgKiA4LCB0YWtlICogOAogICAgdW5jb3ZlciAzCiAgICBpbnRjXzIgLy8gOAogICAgKgogICAgZnJhbWVfZGlnIDAKICAgIGR1cAogICAgY292ZXIgMwogICAgaW50Y18yIC8vIDgKICAgICoKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hYXJuYV9yZWdpc3RyeS9jb250cmFjdC5weTo4NTItODU0CiAgICAvLyByYXcgKz0gb3AuQm94LmV4dHJhY3QoCiAgICAvLyAgICAgX2luZGV4X3BhZ2Vfa2V5KGtleSwgc2xvdCksIHNsb3QgJSBJTkRFWF9QQUdFX0lEUyAqIDgsIHRha2UgKiA4CiAgICAvLyApCiAgICBib3hfZXh0cmFjdAogICAgdW5jb3ZlciAzCiAgICBzd2FwCiAgICBjb25jYXQKICAgIGNvdmVyIDIKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hYXJuYV9yZWdpc3RyeS9jb250cmFjdC5weTo4NTUKICAgIC8vIHNsb3QgKz0gdGFrZQogICAgKwogICAgYiBfaW5kZXhfcGFnZV93aGlsZV90b3BAMwoKX2luZGV4X3BhZ2VfYWZ0ZXJfd2hpbGVANzoKICAgIHBvcAogICAgLy8gc21hcnRfY29udHJhY3RzL2Fhcm5hX3JlZ2lzdHJ5L2NvbnRyYWN0LnB5Ojg1NwogICAgLy8gYXJjNC5VSW50MTYoZW5kIC0gc3RhcnQpLmJ5dGVzICsgcmF3CiAgICBmcmFtZV9kaWcgMgogICAgZnJhbWVfZGlnIC0yCiAgICAtCiAgICBpdG9iCiAgICBkdXAKICAgIGJpdGxlbgogICAgcHVzaGludCAxNgogICAgPD0KICAgIGFzc2VydCAvLyBvdmVyZmxvdwogICAgZXh0cmFjdCA2IDIKICAgIHN3YXAKICAgIGNvbmNhdAogICAgLy8gc21hcnRfY29udHJhY3RzL2Fhcm5hX3JlZ2lzdHJ5L2NvbnRyYWN0LnB5Ojg1Ni04NTgKICAgIC8vIHJldHVybiBhcmM0LkR5bmFtaWNBcnJheVthcmM0LlVJbnQ2NF0uZnJvbV9ieXRlcygKICAgIC8vICAgICBhcmM0LlVJbnQxNihlbmQgLSBzdGFydCkuYnl0ZXMgKyByYXcKICAgIC8vICkKICAgIGZyYW1lX2J1cnkgMAogICAgcmV0c3ViCg==","clear":"I3ByYWdtYSB2ZXJzaW9uIDExCiNwcmFnbWEgdHlwZXRyYWNrIGZhbHNlCgovLyBhbGdvcHkuYXJjNC5BUkM0Q29udHJhY3QuY2xlYXJfc3RhdGVfcHJvZ3JhbSgpIC0+IHVpbnQ2NDoKbWFpbjoKICAgIHB1c2hpbnQgMQogICAgcmV0dXJuCg=="},"byteCode":{"approval":"CyAIAAEIAv///////////wGAAdD9BfQDJiAEFR98dQthYXJuYV9hc3NldA1wcm9qZWN0X2NvdW50AWgBbwFsAWsNbGlzdGluZ19jb3VudA1wZW5kaW5nX2NvdW50D2VzY3Jvd2VkX3Rva2VucwFxFHRvdGFsX2NyZWRpdHNfaXNzdWVkCmJlc3RfcHJpY2USb3Blbl9saXN0aW5nX2NvdW50AgAAEWZyZWVfbGlzdGluZ19oZWFkDnZlcmlmaWVkX2NvdW50OAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAABWFkbWluCXZhbGlkYXRvchNmcmVlX2xpc3RpbmdfcHVzaGVzDnJlamVjdGVkX2NvdW50DGlzc3VlZF9jb3VudA10b2tlbnNfdHJhZGVkDXZvbHVtZV90cmFkZWQMcGVuZGluZ19oZWFkDHBlbmRpbmdfdGFpbA12ZXJpZmllZF9oZWFkDXZlcmlmaWVkX3RhaWwBbQF0AgAKMRhAAFknEjIDZycTMgNnKSJnKiJnJwsiZycHImcnGSEEZycaIQRnJxshBGcnHCEEZycMImcnDyEEZycUImcnDSJnJwgiZycQImcnFSJnJxYiZycJImcnFyJnJxgiZzEZFEQxGEEA/YIjBPEm0EsE00j7swQI+3t8BKIagHcEZkXy+QQhl5lDBLSCBxwEYmKQZQTlV3MIBL16gd0EBQD8qQSm9Bh2BA9EV6oEY9VbbAQwXnW9BFuiKoQENGs9vATzjmlBBF8c0twEChxlbgQaR+cmBHdsdOME42p74gT4Psp1BG0JjlUEDyFgmQSot3iFBH9DEOUEboFahwSN0hO1BBau3m4EHeuk6QS8dF3tBDaUzkoEWlz7PzYaAI4jAF8AcQCIAPgB2gIOAjQC6gNPBCMGagaqBv0ISwjZCOQI7wj6CQUJEQkjCTgJYwmDCaMJ0Qn+ClsLAgthC5YLsAu8C8gMrgCABIPxR0g2GgCOAQBKAIoBAYv/vkAAAyJMiReJigIBi/6I/+pHAiMIFov+TL9JIQUKFov+TFBMIQUYJAtJQAAGSIv/Fr+JSSQITwJJTwLTi/8WTE4Cu4knEjEAZyNDNhoBSRWBIBJEiAyzJxNMZyNDNhoBSRWBIBJEiAyhSTIDE0QnEkxnI0OIDJMiKWVEQABbsTIKRwOyLLIrsiqyKYARaHR0cHM6Ly9hYXJuYS5lY2+yJ4ATQWFybmEgQ2FyYm9uIENyZWRpdLImgAVBQVJOQbIlIrIkIrIjgYCt4gSyIoEDshAisgGzKbQ8ZyIpZUQWKExQsCNDNhoBSSJZJQhLARVJTwISRDYaAkkiWSUISwEVSU8CEkQ2GgNJIlklCEsBFUlPAhJENhoESSJZJQhLARUSRCRPBghJFlcGAoACAAhMUExPBQhJFlcGAk8CTFBMTwMIFlcGAlBPBFBPA1BPAlBLAVBJFYG+Bw5ETFcCAAGAAWNMUEm9RQEURCIqZURJFk8CSwG/MQAjFiIWTgJQTFArSwJQTL8nHUsBUEm8SE8DvyNLAogNWIABczEAUEsCiP5oSCInCGVEIwgnCExnTCMIKkxnSTEAUIAEh+Mmp0xQsChMULAjQzYaAUkVJBJENhoCSRUkEkSICztMFyIqZURLAQ1ETBdJREsBFitMUIEgJLoXIxJEiAtII0M2GgFJFSQSRIgLDxciKmVESwENREkWK0xQgSAkuhcjEkSIC2kjQzYaAUcCIllJTgJJgRELJQhPAhUSRIgK3IEfDkQnDiJJSwMMQQCJSwNXAgBLAYERC4ERWEkiW0lPAkkkVU4CgQlbTCIqZUQPQQAhRgMjFkmTJA5EVwcBTwJJIlkjCBZXBgBcAExQTCMIQv+0SwIWK0xQgSAkuhcjE0EABkYDJUL/zEsBJRJBABRFAUlAAAdGAoEDQv+4iAqIIkL/sUiBAxJBAAaICsFC/+9IgQNC/55IKExQsCNDNhoBSRUkEkSICjMiKWVESURMFyIqZURLAQ1ESRYrTFC+RElXIAglFqhEsUlXACBLAVcoCE8CgShbSbISSwKyFE8EshGBBLIQIrIBs08DTwNLAogKliInC2VECCcLTGcoTFCwI0MigABJNhoBRwIiWUlOAkkkCyUITwIVEkSICb4iKWVERIEQDkQiJw4iSUlLBQxBAIdLBVcCAEsBJAtbSUUIIkUJIiplRAxBAFJLBhYrTFC+TElOAkULRFcgCCUWqEEAO0sIgShbRQhLAUAASLGBBLIQIillRLIRSwhXACBJshRLCEmyEiKyAU8DIwhOA0sITwJLAogJ8U8ECE4DSwcWTwNJIlkjCBZXBgBcAExQTgIjCEL/drZC/7VITwNITwNIQQABsyInC2VETwIIJwtMZyhMULAjQyJHAjYaAUcCFSQSRDYaAklOAkkVJBJENhoDSU4DFSQSRDEWIwlJTgM4ECMSRCIpZURETBdJTgNEF0lEgaTfBk4GIicPZUQhBBNBAAQhBkUHTIgN+UlOBklLCElOAw9EIillTE4FRDEATgQyCk4CDEEBuLFLArISshRPArITTwKyEYEEshAisgG2MQBPBksHCbIIsgcjshAisgGzIicNZUQjCCcNTGciJw9lTElPAkQhBBJBAWBIIicHZURJIwgnB0xnMQAjFklOAkUMSwdQSwZQTFBLARZJTgQnBUxQTL9LBBdOBEsBFklFCycETFBJTga9RQFBAH9FAU8DSE8ESE8DSb5ESVcYCCEEFiIWSwJPAlBMUCcGSwZJTgNQTL8nBk8CUCRLArtcGEmBIFtLBQgWXCBJgShbIwgWXCi/Jx4xAFBMiPq0JwZLAlBMFoEQTLtJMQBQTwRQTwNQgAQJjM2vTFCwIicJZURPAggnCUxnKExQsCNDSwRAAH4iJwxlRElBAAdJSwMNQQBqI0RJFklFDk8ITFBLBElOAlBMUEsJUEsNUE8HTL9LBUAAN08FSCcMTwNnQQAJJwRLCFAiSwi7JwZLAlCAGP////////////////////8AAAAAAAAAAL9C/1lPAkhPBBYnBExQJEsJu0L/wCJC/5NLBElLAwxEFicESwFQvUUBRCcETFAkSboXQv9rSRaAAWZMUEm+RCJbJw9MZ7xIQv6YTwhIsUsCshKyFE8CshNPArIRgQSyECKyAbNC/lQ2GgFJFSQSRDEWIwlJOBAjEkQiKWVEREwXIicHZURLAQ1ESRYnBUxQvicRTgJNSYEwW0SBIFtPAogLy4gL4CNDNhoBSRUkEkQ2GgJJFSQSRDEWIwlJOBAjEkQiKWVERE8CFyInB2VESwENREkWJwVMUL4nEU4CTUmBMFtETwMXSURMgSBbSwEPRE8CiAt4iAuNI0MigABHBTYaAUcCIllJTgIkCyUITBUSRDYaAkkVJBJENhoDSRUkEkQxFiMJSTgQIxJEIillRESICzpOBCJHA0lLBwxBAKJLB1cCAEsBJAtbRQ5LBRdJRQxLBBJAAIpLDRYnBUxQvicRTgJNSUURgTBbQQBrSw+BIFtJRQ5LC0sFCUlFDg1BAARLC0UNSwQXSwIJSxCBKFsKSUUQSw0MQQAESw5FDUsMQQA1SwJJgQ4MREsOSw6ICftOBk4ITEAAJLEjshCyB08DsggisgFPA0sNCE4DTE8FCExPAiMITgIjCEL/W7ZC/9lITwNITwNITwNITwNISUsEDkRLAUEAFraBBLIQIillRLIRMQCyFEsCshIisgFJSwQMSUUGQQAXSwFBACe2I7IQMQCyB0sDSwEJsggisgFMQAAFSwNBAAGzTBZMFlAoTFCwI0OxQv/WNhoBSRUkEkRJFyInB2VESwENREkWJwVMUL4nEU4CTUmBMFtEMQBLAVcAIExLARJESwGBKFtLAlcgCE8DgSBbSwRPA0sCiAeVIicJZURLAQknCUxnTwRLA1BPAlCABKodTNlMULCxIillREyyEksBshSyEYEEshAisgG2IQayCEmyByOyECKyAbOICAwjQyIqZUQWKExQsCNDIillRBYoTFCwI0MiJxJlRChMULAjQyInE2VEKExQsCNDIicLZUQWKExQsCNDNhoBSRUkEkQXiAT4KExQsCNDNhoBSRUkEkQXFitMUL5EKExQsCNDNhoBSSJZJQhLARUSRFcCAAGAAWNMUL5MF0xAAApIIQQWKExQsCNDFkL/9jYaAUkVJBJENhoCSRUkEkRMF0wXI04CiAYwKExQsCNDNhoBSRUkEkQ2GgJJFSQSREwXTBclTgKIBhAoTFCwI0M2GgFJFYEgEkQ2GgJJFSQSRDYaA0kVJBJEgAFzTwNQTwIXTwIXiAk0KExQsCNDNhoBSRWBIBJENhoCSRUkEkQ2GgNJFSQSRCceTwNQTwIXTwIXiAkHKExQsCNDIiplRBYiJwhlRBYiJxBlRBYiJxVlRBYiJxZlRBYiJwtlRBYiJw1lRBYiJwllRBYiJxdlRBYiJxhlRBZPCU8JUE8IUE8HUE8GUE8FUE8EUE8DUE8CUExQKExQsCNDIoAASTYaAUkVJBJEF0mBKg1BAASBKkUBJw4iJwxlTEUEREsCQQB6SSJZSwIMQQBxSwIWSU4CJwRMUL5MSU4CRQhEgRBbSSEEE0lBAENLAiJZSUUISwUMQQA2MgwhBw1BAC5IFicFSwFQvkRXIAhLAUxQSwNQSwYjCBZXBgBPA0xcAExQTCcGTFAkSboXQv+1RQFPAkhAAAlLBCRbRQNC/4EoTFCwI0OAADYaAUkVJBJEJw4iJwxlRElBAENLAhdLAQ9BADpLASJZSUUFgSoMQQAtFicESwFQvkRJVyAISwFXKAhPA08CUExQSwQjCBZXBgBPA0xcAExQTCRbQv+5SChMULAjQzYaAUkVJBJEIkwiJwxlRElBABlLARdLAQ1BABBJFicETFAkSboXTEUDQv/jSwIWKExQsCNDNhoBSRUkEkQXFicFTFC+JxFOAk0oTFCwI0MiJwdlRBYoTFCwI0MiJw1lRBYoTFCwI0OAADYaAUkVJBJENhoCSRUkEkRMF0lPAhciKmVEiAFLTCcOgQxLAksEDEEArDIMIQcNQQCkSwIWJx1MUL1EgTIICEmB/AcNQACPSwKIAf+AAgACTFBOA0xJIllJIwgWVwYATgRMVwIATgIlC04CIkUISwdLAwxBABtLAUsISU4CWSUIFlcGAE8GTFBOBSUIRQhC/91LARVOBCJFCUsIJQxBABxLBksJSU4CWUsGCBZXBgBPB0xQTgYlCEUJQv/dTE8CTwRSTwNMUE8DVwIAUExPAiMITgJC/0xITBYnH1BMUChMULAjQzYaAUkVJBJENhoCSRUkEkRMF0lPAhciJwdlRIgAZkwnDkyBDEsBSwQMQQA3MgwhBw1BAC+BOAhJgfwHDUAAJExJFicFTFC+JxFOAk1PA0kiWSMIFlcGAFwATFBOAiMITEL/wUgWJx9QTFAoTFCwI0MxACInEmVEEkSJMQAiJxNlRBJEiYoDAYv9i/8PQQADi/2Ji/+L/QmL/g1BAAaL/Yv+CImL/4mKAgCL/hYrSwFQJRaL/xZMSwFQTwKBIE8CuyOL/ogBzSWL/ogBiCInCGVEIwknCExnIicQZUQjCCcQTGdQgAQPZj55TFCwiYoBAIv/FitLAVCBAxaBIEy7I4v/iAHnIicIZUQjCScITGciJxVlRCMIJxVLAWcWUIAEUIA6FExQsImKAwCL/RYrSwFQgQQWgSBMuyWL/YgBrSInEGVEIwknEExnIicWZUQjCCcWTGeL/xZMi/5QTFCABNo3HOBMULCJigEBi/8WK0sBUL5EJx1PAlBLAVcAIEsBJCW6FyUISwIkTwK6SwIlSboXSwNLASW6FyUISwROArpLA4EEJboXSwRLASW6FyUISwVOArpLBIEGJboXSwVLASW6FyUITwZOArpLBVcgCE8GVygITwaAAgA4UEsGFYE4CEkWVwYCTwJMUEsGFU8CCEkWVwYCTwJMUEsFFU8CCBZXBgJQTwJQTFBPBFBPA1BPAlBMUImKAQKL/yMSQQALIicZZUQiJxplRIkiJxtlRCInHGVEiYoDAIv9IxJBAAsnGYv+Zycai/9niScbi/5nJxyL/2eJigIAi/6I/7hJFklOAiEEFlCL/xZJTgMnCkxQTL8hBBJBABBGAov/jACL/osAi/+I/66JJwpPAlAkTwK7Qv/qigIAi/8WJwpMUL5ESSJbSU8CJFtMi/6I/2dOBE4DIQQSQQAkSYwBSSEEEkEADUiMAIv+iwGLAIj/Z4kWJwpMUEwWIky7Qv/pSwEWJwpMUEsBFiRMu0L/z4oCAIv+i/+I/56L/xYnCkxQvEiJigMBgACL/Yj/C0giKmVEi/4NQABDi/+Bfw1BAASBf4z/Jw5MSSEEE0EAKksBIllJjACL/wxBAB0WiwAjCBZXBgBPAkxcAEsBUEwnCkxQJEm6F0L/z0hMiYv+FkkrTFCBICS6F4v9EkAABEhC/6dFAScKTFC+RCRbQv+aigMAgABJi/4WJwRMUEm+RIv9FicGTFC+TElPAkRJVwAITgIiW0mM/SEEEkEAe0lXCAhPA0xcEE4CJFtJjP0hBBJBAFdcGEmBIFuL/wkWXCBJgShbIwkWXChJgShbQQACv4lJIltJTgKMASRbjABAABonDIsAZ4sAQQANiwAWJwRMUIsBFiJMu7xIiYsBFicETFCLABYkTLtC/9uL/RYnBkxQIk8Cu0L/nYv9FicGTFBLAVcICCRMu0L/fooCAIv+FkknBUsBULxIJwZMUEm+RElXEAhOAycei/9QSU8CgRBbSU4CTgVJiO79IwlJTgNJIQUKFk8CTFBOAkkhBRgkC04DIQROCBNBABxJSwIkuosBSSEFChZLBkxQTCEFGCQLSwK7F4wCSwFAAFdFAbxESUAASki8RIsCIQQTQQAMiwIWJwZMUIEQiwC7vEgiJw9lRBYiJxRlRBZQgAFmTwJQTL8nD4v+ZyInFGVEIwgnFExnIicNZUQjCScNTGeJFr9C/7RM00L/qIoCA4v+FkknBUxQSb5MSU8CREmBKFtJTwKBIFuL/wlJTgOL/08CC04DQABsTwRIi/5Mi/+I/kJLAlcAIIv+TIj+8ksBIQYIIicJZUSL/wknCUxnIicXZUSL/wgnF0xnIicYZURPA0lOAggnGExnMQCL/xZLAhZPBRZPB08EUE8DUE8CUExQgATCLU/MTFCwTwJXACBMTwKJFicETFBJvkSBIFuL/wkWgSBMu0kWTwNLAVwgTgNPBIEgTwK7SwFC/4aKAQGL/zgHMgoSRIv/OAAxABJEi/84CImKAwCL/Yv+iP8dTgJJTgJOA0yL/0sBD0QiKWVMTgJEMQBMi/8MQQAvsYv+shKyFLIRgQSyECKyAbayB7III7IQIrIBtjEAi/9PAgmyCLIHI7IQIrIBs4lPBEixi/6yErIUshGBBLIQIrIBtrIHsggjshAisgGziYoDAYAASYv9iO0Fi/6L/08CiPofSYv+CYF/DUEAB4v+gX8IjAKAAIv+SYsCDEEAPkcCIQUYSU4EIQVMCUmMAIsCTwIJSYwBDUEABIsBjABJIQUKFov9TFBPAyQLiwBJTgMkC7pPA0xQTgIIQv+7SIsCi/4JFkmTgRAORFcGAkxQjACJ","clear":"C4EBQw=="},"compilerInfo":{"compiler":"puya","compilerVersion":{"major":5,"minor":10,"patch":1}},"events":[{"name":"ProjectSubmitted","args":[{"type":"uint64","name":"project_id"},{"type":"address","name":"submitter"}]},{"name":"ProjectApproved","args":[{"type":"uint64","name":"project_id"},{"type":"uint64","name":"credits"}]},{"name":"ProjectRejected","args":[{"type":"uint64","name":"project_id"},{"type":"uint64","name":"rejected"}]},{"name":"CreditsIssued","args":[{"type":"uint64","name":"project_id"},{"type":"address","name":"receiver"},{"type":"uint64","name":"amount"}]},{"name":"Listed","args":[{"type":"uint64","name":"listing_id"},{"type":"address","name":"seller"},{"type":"uint64","name":"amount"},{"type":"uint64","name":"price"}]},{"name":"Bought","args":[{"type":"uint64","name":"listing_id"},{"type":"address","name":"buyer"},{"type":"uint64","name":"quantity"},{"type":"uint64","name":"cost"},{"type":"uint64","name":"remaining"}]},{"name":"Cancelled","args":[{"type":"uint64","name":"listing_id"},{"type":"address","name":"seller"},{"type":"uint64","name":"amount"}]}],"templateVariables":{}} as unknown as Arc56Contract
 
 /**
  * A state record containing binary data
@@ -65,6 +65,46 @@ export type Expand<T> = T extends (...args: infer A) => infer R
 
 // Type definitions for ARC-56 structs
 
+export type FreeLink = {
+  next: bigint,
+  seq: bigint
+}
+
+
+/**
+ * Converts the ABI tuple representation of a FreeLink to the struct representation
+ */
+export function FreeLinkFromTuple(abiTuple: [bigint, bigint]) {
+  return getABIStructFromABITuple(abiTuple, APP_SPEC.structs.FreeLink, APP_SPEC.structs) as FreeLink
+}
+
+export type ListingLink = {
+  prev: bigint,
+  next: bigint,
+  slot: bigint
+}
+
+
+/**
+ * Converts the ABI tuple representation of a ListingLink to the struct representation
+ */
+export function ListingLinkFromTuple(abiTuple: [bigint, bigint, bigint]) {
+  return getABIStructFromABITuple(abiTuple, APP_SPEC.structs.ListingLink, APP_SPEC.structs) as ListingLink
+}
+
+export type ListingPage = {
+  next_id: bigint,
+  items: [string, bigint, bigint, bigint][]
+}
+
+
+/**
+ * Converts the ABI tuple representation of a ListingPage to the struct representation
+ */
+export function ListingPageFromTuple(abiTuple: [bigint, [string, bigint, bigint, bigint][]]) {
+  return getABIStructFromABITuple(abiTuple, APP_SPEC.structs.ListingPage, APP_SPEC.structs) as ListingPage
+}
+
 export type ListingRecord = {
   seller: string,
   amount: bigint,
@@ -80,6 +120,65 @@ export function ListingRecordFromTuple(abiTuple: [string, bigint, bigint, bigint
   return getABIStructFromABITuple(abiTuple, APP_SPEC.structs.ListingRecord, APP_SPEC.structs) as ListingRecord
 }
 
+export type PriceLevel = {
+  prev_price: bigint,
+  next_price: bigint,
+  head: bigint,
+  tail: bigint,
+  depth: bigint,
+  listings: bigint
+}
+
+
+/**
+ * Converts the ABI tuple representation of a PriceLevel to the struct representation
+ */
+export function PriceLevelFromTuple(abiTuple: [bigint, bigint, bigint, bigint, bigint, bigint]) {
+  return getABIStructFromABITuple(abiTuple, APP_SPEC.structs.PriceLevel, APP_SPEC.structs) as PriceLevel
+}
+
+export type ProjectHeader = {
+  submitter: string,
+  status: bigint,
+  credits: bigint
+}
+
+
+/**
+ * Converts the ABI tuple representation of a ProjectHeader to the struct representation
+ */
+export function ProjectHeaderFromTuple(abiTuple: [string, bigint, bigint]) {
+  return getABIStructFromABITuple(abiTuple, APP_SPEC.structs.ProjectHeader, APP_SPEC.structs) as ProjectHeader
+}
+
+export type ProjectMeta = {
+  name: string,
+  location: string,
+  ecosystem: string,
+  cid: string
+}
+
+
+/**
+ * Converts the ABI tuple representation of a ProjectMeta to the struct representation
+ */
+export function ProjectMetaFromTuple(abiTuple: [string, string, string, string]) {
+  return getABIStructFromABITuple(abiTuple, APP_SPEC.structs.ProjectMeta, APP_SPEC.structs) as ProjectMeta
+}
+
+export type ProjectPage = {
+  next_id: bigint,
+  items: [string, string, string, string, string, bigint, bigint][]
+}
+
+
+/**
+ * Converts the ABI tuple representation of a ProjectPage to the struct representation
+ */
+export function ProjectPageFromTuple(abiTuple: [bigint, [string, string, string, string, string, bigint, bigint][]]) {
+  return getABIStructFromABITuple(abiTuple, APP_SPEC.structs.ProjectPage, APP_SPEC.structs) as ProjectPage
+}
+
 export type ProjectRecord = {
   submitter: string,
   name: string,
@@ -98,6 +197,53 @@ export function ProjectRecordFromTuple(abiTuple: [string, string, string, string
   return getABIStructFromABITuple(abiTuple, APP_SPEC.structs.ProjectRecord, APP_SPEC.structs) as ProjectRecord
 }
 
+export type QueueLink = {
+  prev: bigint,
+  next: bigint
+}
+
+
+/**
+ * Converts the ABI tuple representation of a QueueLink to the struct representation
+ */
+export function QueueLinkFromTuple(abiTuple: [bigint, bigint]) {
+  return getABIStructFromABITuple(abiTuple, APP_SPEC.structs.QueueLink, APP_SPEC.structs) as QueueLink
+}
+
+export type RegistryStats = {
+  project_count: bigint,
+  pending: bigint,
+  verified: bigint,
+  rejected: bigint,
+  issued: bigint,
+  total_credits_issued: bigint,
+  open_listings: bigint,
+  escrowed_tokens: bigint,
+  tokens_traded: bigint,
+  volume_traded: bigint
+}
+
+
+/**
+ * Converts the ABI tuple representation of a RegistryStats to the struct representation
+ */
+export function RegistryStatsFromTuple(abiTuple: [bigint, bigint, bigint, bigint, bigint, bigint, bigint, bigint, bigint, bigint]) {
+  return getABIStructFromABITuple(abiTuple, APP_SPEC.structs.RegistryStats, APP_SPEC.structs) as RegistryStats
+}
+
+export type SweepResult = {
+  filled: bigint,
+  spent: bigint
+}
+
+
+/**
+ * Converts the ABI tuple representation of a SweepResult to the struct representation
+ */
+export function SweepResultFromTuple(abiTuple: [bigint, bigint]) {
+  return getABIStructFromABITuple(abiTuple, APP_SPEC.structs.SweepResult, APP_SPEC.structs) as SweepResult
+}
+
 /**
  * The argument types for the AarnaRegistry contract
  */
@@ -127,16 +273,35 @@ export type AarnaRegistryArgs = {
     'reject_project(uint64)void': {
       projectId: bigint | number
     }
+    'review_projects_batch((uint64,uint8,uint64)[])uint8[]': {
+      decisions: [bigint | number, number, bigint | number][]
+    }
     'issue_credits(uint64)uint64': {
       projectId: bigint | number
     }
-    'list_for_sale(uint64,uint64)uint64': {
+    'issue_credits_batch(uint64[])uint64[]': {
+      projectIds: (bigint | number)[]
+    }
+    'list_for_sale(uint64,uint64,uint64,pay)uint64': {
       amount: bigint | number
       pricePerToken: bigint | number
+      prevPrice: bigint | number
+      deposit: AppMethodCallTransactionArgument
+    }
+    'buy_listing(uint64,pay)void': {
+      listingId: bigint | number
+      payment: AppMethodCallTransactionArgument
     }
-    'buy_listing(uint64,uint64)void': {
+    'buy_listing_partial(uint64,uint64,pay)void': {
       listingId: bigint | number
-      payment: bigint | number
+      quantity: bigint | number
+      payment: AppMethodCallTransactionArgument
+    }
+    'sweep_listings(uint64[],uint64,uint64,pay)(uint64,uint64)': {
+      listingIds: (bigint | number)[]
+      maxQuantity: bigint | number
+      maxTotalPrice: bigint | number
+      payment: AppMethodCallTransactionArgument
     }
     'cancel_listing(uint64)void': {
       listingId: bigint | number
@@ -149,10 +314,53 @@ export type AarnaRegistryArgs = {
     'get_project(uint64)(address,string,string,string,string,uint64,uint64)': {
       projectId: bigint | number
     }
+    'get_project_header(uint64)(address,uint64,uint64)': {
+      projectId: bigint | number
+    }
+    'find_project_by_cid(string)uint64': {
+      cid: string
+    }
+    'get_pending_ids(uint64,uint64)uint64[]': {
+      after: bigint | number
+      count: bigint | number
+    }
+    'get_verified_ids(uint64,uint64)uint64[]': {
+      after: bigint | number
+      count: bigint | number
+    }
+    'get_projects_by_submitter(address,uint64,uint64)uint64[]': {
+      addr: string
+      start: bigint | number
+      count: bigint | number
+    }
+    'get_listings_by_seller(address,uint64,uint64)uint64[]': {
+      addr: string
+      start: bigint | number
+      count: bigint | number
+    }
+    'get_stats()(uint64,uint64,uint64,uint64,uint64,uint64,uint64,uint64,uint64,uint64)': Record<string, never>
+    'get_best_offers(uint64)(uint64,uint64,uint64)[]': {
+      count: bigint | number
+    }
+    'get_depth(uint64)(uint64,uint64,uint64)[]': {
+      priceLimit: bigint | number
+    }
+    'get_price_hint(uint64)uint64': {
+      price: bigint | number
+    }
     'get_listing(uint64)(address,uint64,uint64,uint64)': {
       listingId: bigint | number
     }
     'get_listing_count()uint64': Record<string, never>
+    'get_open_listing_count()uint64': Record<string, never>
+    'get_projects_page(uint64,uint64)(uint64,(address,string,string,string,string,uint64,uint64)[])': {
+      start: bigint | number
+      count: bigint | number
+    }
+    'get_listings_page(uint64,uint64)(uint64,(address,uint64,uint64,uint64)[])': {
+      start: bigint | number
+      count: bigint | number
+    }
   }
   /**
    * The tuple representation of the arguments for each method
@@ -165,9 +373,13 @@ export type AarnaRegistryArgs = {
     'submit_project(string,string,string,string)uint64': [name: string, location: string, ecosystem: string, cid: string]
     'approve_project(uint64,uint64)void': [projectId: bigint | number, credits: bigint | number]
     'reject_project(uint64)void': [projectId: bigint | number]
+    'review_projects_batch((uint64,uint8,uint64)[])uint8[]': [decisions: [bigint | number, number, bigint | number][]]
     'issue_credits(uint64)uint64': [projectId: bigint | number]
-    'list_for_sale(uint64,uint64)uint64': [amount: bigint | number, pricePerToken: bigint | number]
-    'buy_listing(uint64,uint64)void': [listingId: bigint | number, payment: bigint | number]
+    'issue_credits_batch(uint64[])uint64[]': [projectIds: (bigint | number)[]]
+    'list_for_sale(uint64,uint64,uint64,pay)uint64': [amount: bigint | number, pricePerToken: bigint | number, prevPrice: bigint | number, deposit: AppMethodCallTransactionArgument]
+    'buy_listing(uint64,pay)void': [listingId: bigint | number, payment: AppMethodCallTransactionArgument]
+    'buy_listing_partial(uint64,uint64,pay)void': [listingId: bigint | number, quantity: bigint | number, payment: AppMethodCallTransactionArgument]
+    'sweep_listings(uint64[],uint64,uint64,pay)(uint64,uint64)': [listingIds: (bigint | number)[], maxQuantity: bigint | number, maxTotalPrice: bigint | number, payment: AppMethodCallTransactionArgument]
     'cancel_listing(uint64)void': [listingId: bigint | number]
     'get_project_count()uint64': []
     'get_asset_id()uint64': []
@@ -175,8 +387,21 @@ export type AarnaRegistryArgs = {
     'get_validator()address': []
     'get_total_credits_issued()uint64': []
     'get_project(uint64)(address,string,string,string,string,uint64,uint64)': [projectId: bigint | number]
+    'get_project_header(uint64)(address,uint64,uint64)': [projectId: bigint | number]
+    'find_project_by_cid(string)uint64': [cid: string]
+    'get_pending_ids(uint64,uint64)uint64[]': [after: bigint | number, count: bigint | number]
+    'get_verified_ids(uint64,uint64)uint64[]': [after: bigint | number, count: bigint | number]
+    'get_projects_by_submitter(address,uint64,uint64)uint64[]': [addr: string, start: bigint | number, count: bigint | number]
+    'get_listings_by_seller(address,uint64,uint64)uint64[]': [addr: string, start: bigint | number, count: bigint | number]
+    'get_stats()(uint64,uint64,uint64,uint64,uint64,uint64,uint64,uint64,uint64,uint64)': []
+    'get_best_offers(uint64)(uint64,uint64,uint64)[]': [count: bigint | number]
+    'get_depth(uint64)(uint64,uint64,uint64)[]': [priceLimit: bigint | number]
+    'get_price_hint(uint64)uint64': [price: bigint | number]
     'get_listing(uint64)(address,uint64,uint64,uint64)': [listingId: bigint | number]
     'get_listing_count()uint64': []
+    'get_open_listing_count()uint64': []
+    'get_projects_page(uint64,uint64)(uint64,(address,string,string,string,string,uint64,uint64)[])': [start: bigint | number, count: bigint | number]
+    'get_listings_page(uint64,uint64)(uint64,(address,uint64,uint64,uint64)[])': [start: bigint | number, count: bigint | number]
   }
 }
 
@@ -191,9 +416,13 @@ export type AarnaRegistryReturns = {
   'submit_project(string,string,string,string)uint64': bigint
   'approve_project(uint64,uint64)void': void
   'reject_project(uint64)void': void
+  'review_projects_batch((uint64,uint8,uint64)[])uint8[]': number[]
   'issue_credits(uint64)uint64': bigint
-  'list_for_sale(uint64,uint64)uint64': bigint
-  'buy_listing(uint64,uint64)void': void
+  'issue_credits_batch(uint64[])uint64[]': bigint[]
+  'list_for_sale(uint64,uint64,uint64,pay)uint64': bigint
+  'buy_listing(uint64,pay)void': void
+  'buy_listing_partial(uint64,uint64,pay)void': void
+  'sweep_listings(uint64[],uint64,uint64,pay)(uint64,uint64)': SweepResult
   'cancel_listing(uint64)void': void
   'get_project_count()uint64': bigint
   'get_asset_id()uint64': bigint
@@ -201,8 +430,21 @@ export type AarnaRegistryReturns = {
   'get_validator()address': string
   'get_total_credits_issued()uint64': bigint
   'get_project(uint64)(address,string,string,string,string,uint64,uint64)': ProjectRecord
+  'get_project_header(uint64)(address,uint64,uint64)': ProjectHeader
+  'find_project_by_cid(string)uint64': bigint
+  'get_pending_ids(uint64,uint64)uint64[]': bigint[]
+  'get_verified_ids(uint64,uint64)uint64[]': bigint[]
+  'get_projects_by_submitter(address,uint64,uint64)uint64[]': bigint[]
+  'get_listings_by_seller(address,uint64,uint64)uint64[]': bigint[]
+  'get_stats()(uint64,uint64,uint64,uint64,uint64,uint64,uint64,uint64,uint64,uint64)': RegistryStats
+  'get_best_offers(uint64)(uint64,uint64,uint64)[]': [bigint, bigint, bigint][]
+  'get_depth(uint64)(uint64,uint64,uint64)[]': [bigint, bigint, bigint][]
+  'get_price_hint(uint64)uint64': bigint
   'get_listing(uint64)(address,uint64,uint64,uint64)': ListingRecord
   'get_listing_count()uint64': bigint
+  'get_open_listing_count()uint64': bigint
+  'get_projects_page(uint64,uint64)(uint64,(address,string,string,string,string,uint64,uint64)[])': ProjectPage
+  'get_listings_page(uint64,uint64)(uint64,(address,uint64,uint64,uint64)[])': ListingPage
 }
 
 /**
@@ -248,20 +490,40 @@ export type AarnaRegistryTypes = {
       argsTuple: AarnaRegistryArgs['tuple']['reject_project(uint64)void']
       returns: AarnaRegistryReturns['reject_project(uint64)void']
     }>
+    & Record<'review_projects_batch((uint64,uint8,uint64)[])uint8[]' | 'review_projects_batch', {
+      argsObj: AarnaRegistryArgs['obj']['review_projects_batch((uint64,uint8,uint64)[])uint8[]']
+      argsTuple: AarnaRegistryArgs['tuple']['review_projects_batch((uint64,uint8,uint64)[])uint8[]']
+      returns: AarnaRegistryReturns['review_projects_batch((uint64,uint8,uint64)[])uint8[]']
+    }>
     & Record<'issue_credits(uint64)uint64' | 'issue_credits', {
       argsObj: AarnaRegistryArgs['obj']['issue_credits(uint64)uint64']
       argsTuple: AarnaRegistryArgs['tuple']['issue_credits(uint64)uint64']
       returns: AarnaRegistryReturns['issue_credits(uint64)uint64']
     }>
-    & Record<'list_for_sale(uint64,uint64)uint64' | 'list_for_sale', {
-      argsObj: AarnaRegistryArgs['obj']['list_for_sale(uint64,uint64)uint64']
-      argsTuple: AarnaRegistryArgs['tuple']['list_for_sale(uint64,uint64)uint64']
-      returns: AarnaRegistryReturns['list_for_sale(uint64,uint64)uint64']
+    & Record<'issue_credits_batch(uint64[])uint64[]' | 'issue_credits_batch', {
+      argsObj: AarnaRegistryArgs['obj']['issue_credits_batch(uint64[])uint64[]']
+      argsTuple: AarnaRegistryArgs['tuple']['issue_credits_batch(uint64[])uint64[]']
+      returns: AarnaRegistryReturns['issue_credits_batch(uint64[])uint64[]']
+    }>
+    & Record<'list_for_sale(uint64,uint64,uint64,pay)uint64' | 'list_for_sale', {
+      argsObj: AarnaRegistryArgs['obj']['list_for_sale(uint64,uint64,uint64,pay)uint64']
+      argsTuple: AarnaRegistryArgs['tuple']['list_for_sale(uint64,uint64,uint64,pay)uint64']
+      returns: AarnaRegistryReturns['list_for_sale(uint64,uint64,uint64,pay)uint64']
+    }>
+    & Record<'buy_listing(uint64,pay)void' | 'buy_listing', {
+      argsObj: AarnaRegistryArgs['obj']['buy_listing(uint64,pay)void']
+      argsTuple: AarnaRegistryArgs['tuple']['buy_listing(uint64,pay)void']
+      returns: AarnaRegistryReturns['buy_listing(uint64,pay)void']
+    }>
+    & Record<'buy_listing_partial(uint64,uint64,pay)void' | 'buy_listing_partial', {
+      argsObj: AarnaRegistryArgs['obj']['buy_listing_partial(uint64,uint64,pay)void']
+      argsTuple: AarnaRegistryArgs['tuple']['buy_listing_partial(uint64,uint64,pay)void']
+      returns: AarnaRegistryReturns['buy_listing_partial(uint64,uint64,pay)void']
     }>
-    & Record<'buy_listing(uint64,uint64)void' | 'buy_listing', {
-      argsObj: AarnaRegistryArgs['obj']['buy_listing(uint64,uint64)void']
-      argsTuple: AarnaRegistryArgs['tuple']['buy_listing(uint64,uint64)void']
-      returns: AarnaRegistryReturns['buy_listing(uint64,uint64)void']
+    & Record<'sweep_listings(uint64[],uint64,uint64,pay)(uint64,uint64)' | 'sweep_listings', {
+      argsObj: AarnaRegistryArgs['obj']['sweep_listings(uint64[],uint64,uint64,pay)(uint64,uint64)']
+      argsTuple: AarnaRegistryArgs['tuple']['sweep_listings(uint64[],uint64,uint64,pay)(uint64,uint64)']
+      returns: AarnaRegistryReturns['sweep_listings(uint64[],uint64,uint64,pay)(uint64,uint64)']
     }>
     & Record<'cancel_listing(uint64)void' | 'cancel_listing', {
       argsObj: AarnaRegistryArgs['obj']['cancel_listing(uint64)void']
@@ -298,6 +560,56 @@ export type AarnaRegistryTypes = {
       argsTuple: AarnaRegistryArgs['tuple']['get_project(uint64)(address,string,string,string,string,uint64,uint64)']
       returns: AarnaRegistryReturns['get_project(uint64)(address,string,string,string,string,uint64,uint64)']
     }>
+    & Record<'get_project_header(uint64)(address,uint64,uint64)' | 'get_project_header', {
+      argsObj: AarnaRegistryArgs['obj']['get_project_header(uint64)(address,uint64,uint64)']
+      argsTuple: AarnaRegistryArgs['tuple']['get_project_header(uint64)(address,uint64,uint64)']
+      returns: AarnaRegistryReturns['get_project_header(uint64)(address,uint64,uint64)']
+    }>
+    & Record<'find_project_by_cid(string)uint64' | 'find_project_by_cid', {
+      argsObj: AarnaRegistryArgs['obj']['find_project_by_cid(string)uint64']
+      argsTuple: AarnaRegistryArgs['tuple']['find_project_by_cid(string)uint64']
+      returns: AarnaRegistryReturns['find_project_by_cid(string)uint64']
+    }>
+    & Record<'get_pending_ids(uint64,uint64)uint64[]' | 'get_pending_ids', {
+      argsObj: AarnaRegistryArgs['obj']['get_pending_ids(uint64,uint64)uint64[]']
+      argsTuple: AarnaRegistryArgs['tuple']['get_pending_ids(uint64,uint64)uint64[]']
+      returns: AarnaRegistryReturns['get_pending_ids(uint64,uint64)uint64[]']
+    }>
+    & Record<'get_verified_ids(uint64,uint64)uint64[]' | 'get_verified_ids', {
+      argsObj: AarnaRegistryArgs['obj']['get_verified_ids(uint64,uint64)uint64[]']
+      argsTuple: AarnaRegistryArgs['tuple']['get_verified_ids(uint64,uint64)uint64[]']
+      returns: AarnaRegistryReturns['get_verified_ids(uint64,uint64)uint64[]']
+    }>
+    & Record<'get_projects_by_submitter(address,uint64,uint64)uint64[]' | 'get_projects_by_submitter', {
+      argsObj: AarnaRegistryArgs['obj']['get_projects_by_submitter(address,uint64,uint64)uint64[]']
+      argsTuple: AarnaRegistryArgs['tuple']['get_projects_by_submitter(address,uint64,uint64)uint64[]']
+      returns: AarnaRegistryReturns['get_projects_by_submitter(address,uint64,uint64)uint64[]']
+    }>
+    & Record<'get_listings_by_seller(address,uint64,uint64)uint64[]' | 'get_listings_by_seller', {
+      argsObj: AarnaRegistryArgs['obj']['get_listings_by_seller(address,uint64,uint64)uint64[]']
+      argsTuple: AarnaRegistryArgs['tuple']['get_listings_by_seller(address,uint64,uint64)uint64[]']
+      returns: AarnaRegistryReturns['get_listings_by_seller(address,uint64,uint64)uint64[]']
+    }>
+    & Record<'get_stats()(uint64,uint64,uint64,uint64,uint64,uint64,uint64,uint64,uint64,uint64)' | 'get_stats', {
+      argsObj: AarnaRegistryArgs['obj']['get_stats()(uint64,uint64,uint64,uint64,uint64,uint64,uint64,uint64,uint64,uint64)']
+      argsTuple: AarnaRegistryArgs['tuple']['get_stats()(uint64,uint64,uint64,uint64,uint64,uint64,uint64,uint64,uint64,uint64)']
+      returns: AarnaRegistryReturns['get_stats()(uint64,uint64,uint64,uint64,uint64,uint64,uint64,uint64,uint64,uint64)']
+    }>
+    & Record<'get_best_offers(uint64)(uint64,uint64,uint64)[]' | 'get_best_offers', {
+      argsObj: AarnaRegistryArgs['obj']['get_best_offers(uint64)(uint64,uint64,uint64)[]']
+      argsTuple: AarnaRegistryArgs['tuple']['get_best_offers(uint64)(uint64,uint64,uint64)[]']
+      returns: AarnaRegistryReturns['get_best_offers(uint64)(uint64,uint64,uint64)[]']
+    }>
+    & Record<'get_depth(uint64)(uint64,uint64,uint64)[]' | 'get_depth', {
+      argsObj: AarnaRegistryArgs['obj']['get_depth(uint64)(uint64,uint64,uint64)[]']
+      argsTuple: AarnaRegistryArgs['tuple']['get_depth(uint64)(uint64,uint64,uint64)[]']
+      returns: AarnaRegistryReturns['get_depth(uint64)(uint64,uint64,uint64)[]']
+    }>
+    & Record<'get_price_hint(uint64)uint64' | 'get_price_hint', {
+      argsObj: AarnaRegistryArgs['obj']['get_price_hint(uint64)uint64']
+      argsTuple: AarnaRegistryArgs['tuple']['get_price_hint(uint64)uint64']
+      returns: AarnaRegistryReturns['get_price_hint(uint64)uint64']
+    }>
     & Record<'get_listing(uint64)(address,uint64,uint64,uint64)' | 'get_listing', {
       argsObj: AarnaRegistryArgs['obj']['get_listing(uint64)(address,uint64,uint64,uint64)']
       argsTuple: AarnaRegistryArgs['tuple']['get_listing(uint64)(address,uint64,uint64,uint64)']
@@ -308,6 +620,21 @@ export type AarnaRegistryTypes = {
       argsTuple: AarnaRegistryArgs['tuple']['get_listing_count()uint64']
       returns: AarnaRegistryReturns['get_listing_count()uint64']
     }>
+    & Record<'get_open_listing_count()uint64' | 'get_open_listing_count', {
+      argsObj: AarnaRegistryArgs['obj']['get_open_listing_count()uint64']
+      argsTuple: AarnaRegistryArgs['tuple']['get_open_listing_count()uint64']
+      returns: AarnaRegistryReturns['get_open_listing_count()uint64']
+    }>
+    & Record<'get_projects_page(uint64,uint64)(uint64,(address,string,string,string,string,uint64,uint64)[])' | 'get_projects_page', {
+      argsObj: AarnaRegistryArgs['obj']['get_projects_page(uint64,uint64)(uint64,(address,string,string,string,string,uint64,uint64)[])']
+      argsTuple: AarnaRegistryArgs['tuple']['get_projects_page(uint64,uint64)(uint64,(address,string,string,string,string,uint64,uint64)[])']
+      returns: AarnaRegistryReturns['get_projects_page(uint64,uint64)(uint64,(address,string,string,string,string,uint64,uint64)[])']
+    }>
+    & Record<'get_listings_page(uint64,uint64)(uint64,(address,uint64,uint64,uint64)[])' | 'get_listings_page', {
+      argsObj: AarnaRegistryArgs['obj']['get_listings_page(uint64,uint64)(uint64,(address,uint64,uint64,uint64)[])']
+      argsTuple: AarnaRegistryArgs['tuple']['get_listings_page(uint64,uint64)(uint64,(address,uint64,uint64,uint64)[])']
+      returns: AarnaRegistryReturns['get_listings_page(uint64,uint64)(uint64,(address,uint64,uint64,uint64)[])']
+    }>
   /**
    * Defines the shape of the state of the application.
    */
@@ -320,14 +647,37 @@ export type AarnaRegistryTypes = {
         projectCount: bigint
         totalCreditsIssued: bigint
         listingCount: bigint
+        pendingHead: bigint
+        pendingTail: bigint
+        verifiedHead: bigint
+        verifiedTail: bigint
+        bestPrice: bigint
+        freeListingHead: bigint
+        freeListingPushes: bigint
+        openListingCount: bigint
+        pendingCount: bigint
+        verifiedCount: bigint
+        rejectedCount: bigint
+        issuedCount: bigint
+        escrowedTokens: bigint
+        tokensTraded: bigint
+        volumeTraded: bigint
       }
       maps: {}
     }
     box: {
       keys: {}
       maps: {
-        projects: Map<bigint | number, ProjectRecord>
+        projectHeaders: Map<bigint | number, ProjectHeader>
+        projectMeta: Map<bigint | number, ProjectMeta>
+        queueLinks: Map<bigint | number, QueueLink>
         listings: Map<bigint | number, ListingRecord>
+        freeListings: Map<bigint | number, FreeLink>
+        priceLevels: Map<bigint | number, PriceLevel>
+        listingLinks: Map<bigint | number, ListingLink>
+        submitterIndex: Map<string, bigint>
+        sellerIndex: Map<string, bigint>
+        cidIndex: Map<Uint8Array, bigint>
       }
     }
   }
@@ -470,7 +820,9 @@ export abstract class AarnaRegistryParamsFactory {
   /**
    * Constructs a no op call for the submit_project(string,string,string,string)uint64 ABI method
    *
-   * Developer submits a new project. Returns the project index.
+  * Developer submits a new project. Returns the project index.
+  Each evidence bundle (CID) can back only one project, and the encoded metadata is capped at MAX_META_BYTES so the record can always be read.
+
    *
    * @param params Parameters for the call
    * @returns An `AppClientMethodCallParams` object for the call
@@ -512,6 +864,23 @@ export abstract class AarnaRegistryParamsFactory {
       args: Array.isArray(params.args) ? params.args : [params.args.projectId],
     }
   }
+  /**
+   * Constructs a no op call for the review_projects_batch((uint64,uint8,uint64)[])uint8[] ABI method
+   *
+  * Validator approves / rejects many projects in one call.
+  Ids that are unknown, no longer pending or carry an invalid decision are skipped and reported; the returned codes line up with `decisions`. At most MAX_REVIEW_BATCH decisions, as each applied one logs an event.
+
+   *
+   * @param params Parameters for the call
+   * @returns An `AppClientMethodCallParams` object for the call
+   */
+  static reviewProjectsBatch(params: CallParams<AarnaRegistryArgs['obj']['review_projects_batch((uint64,uint8,uint64)[])uint8[]'] | AarnaRegistryArgs['tuple']['review_projects_batch((uint64,uint8,uint64)[])uint8[]']> & CallOnComplete): AppClientMethodCallParams & CallOnComplete {
+    return {
+      ...params,
+      method: 'review_projects_batch((uint64,uint8,uint64)[])uint8[]' as const,
+      args: Array.isArray(params.args) ? params.args : [params.args.decisions],
+    }
+  }
   /**
    * Constructs a no op call for the issue_credits(uint64)uint64 ABI method
    *
@@ -530,41 +899,94 @@ export abstract class AarnaRegistryParamsFactory {
     }
   }
   /**
-   * Constructs a no op call for the list_for_sale(uint64,uint64)uint64 ABI method
+   * Constructs a no op call for the issue_credits_batch(uint64[])uint64[] ABI method
+   *
+  * Validator issues credits for up to MAX_ISSUE_BATCH verified projects in
+  one call. Transfers go out as one inner group with zero fees, so the outer transaction pays for all of them. Unknown or unverified ids are skipped with an amount of 0; the amounts line up with `project_ids`.
+
+   *
+   * @param params Parameters for the call
+   * @returns An `AppClientMethodCallParams` object for the call
+   */
+  static issueCreditsBatch(params: CallParams<AarnaRegistryArgs['obj']['issue_credits_batch(uint64[])uint64[]'] | AarnaRegistryArgs['tuple']['issue_credits_batch(uint64[])uint64[]']> & CallOnComplete): AppClientMethodCallParams & CallOnComplete {
+    return {
+      ...params,
+      method: 'issue_credits_batch(uint64[])uint64[]' as const,
+      args: Array.isArray(params.args) ? params.args : [params.args.projectIds],
+    }
+  }
+  /**
+   * Constructs a no op call for the list_for_sale(uint64,uint64,uint64,pay)uint64 ABI method
    *
   * List AARNA tokens for sale using clawback to escrow.
-  Returns the listing index.
+  `prev_price` is the highest listed price below `price_per_token` (0 if there is none; see get_price_hint), only needed when no listing has that price yet. `deposit` (to the app, from the seller) funds the listing's boxes: LISTING_DEPOSIT, or LISTING_REFUND when a freed id is reused, with any excess refunded. Returns the listing index.
 
    *
    * @param params Parameters for the call
    * @returns An `AppClientMethodCallParams` object for the call
    */
-  static listForSale(params: CallParams<AarnaRegistryArgs['obj']['list_for_sale(uint64,uint64)uint64'] | AarnaRegistryArgs['tuple']['list_for_sale(uint64,uint64)uint64']> & CallOnComplete): AppClientMethodCallParams & CallOnComplete {
+  static listForSale(params: CallParams<AarnaRegistryArgs['obj']['list_for_sale(uint64,uint64,uint64,pay)uint64'] | AarnaRegistryArgs['tuple']['list_for_sale(uint64,uint64,uint64,pay)uint64']> & CallOnComplete): AppClientMethodCallParams & CallOnComplete {
     return {
       ...params,
-      method: 'list_for_sale(uint64,uint64)uint64' as const,
-      args: Array.isArray(params.args) ? params.args : [params.args.amount, params.args.pricePerToken],
+      method: 'list_for_sale(uint64,uint64,uint64,pay)uint64' as const,
+      args: Array.isArray(params.args) ? params.args : [params.args.amount, params.args.pricePerToken, params.args.prevPrice, params.args.deposit],
     }
   }
   /**
-   * Constructs a no op call for the buy_listing(uint64,uint64)void ABI method
+   * Constructs a no op call for the buy_listing(uint64,pay)void ABI method
    *
-   * Buy tokens from a listing. Transfers tokens to buyer and ALGO to seller.
+  * Buy tokens from a listing. Transfers tokens to buyer and ALGO to seller.
+  `payment` (to the app, from the buyer) must cover the cost; any excess is refunded.
+
    *
    * @param params Parameters for the call
    * @returns An `AppClientMethodCallParams` object for the call
    */
-  static buyListing(params: CallParams<AarnaRegistryArgs['obj']['buy_listing(uint64,uint64)void'] | AarnaRegistryArgs['tuple']['buy_listing(uint64,uint64)void']> & CallOnComplete): AppClientMethodCallParams & CallOnComplete {
+  static buyListing(params: CallParams<AarnaRegistryArgs['obj']['buy_listing(uint64,pay)void'] | AarnaRegistryArgs['tuple']['buy_listing(uint64,pay)void']> & CallOnComplete): AppClientMethodCallParams & CallOnComplete {
     return {
       ...params,
-      method: 'buy_listing(uint64,uint64)void' as const,
+      method: 'buy_listing(uint64,pay)void' as const,
       args: Array.isArray(params.args) ? params.args : [params.args.listingId, params.args.payment],
     }
   }
+  /**
+   * Constructs a no op call for the buy_listing_partial(uint64,uint64,pay)void ABI method
+   *
+  * Buy part of a listing. The rest stays listed at the same price; the
+  listing closes once its amount reaches zero. Paid for like buy_listing.
+
+   *
+   * @param params Parameters for the call
+   * @returns An `AppClientMethodCallParams` object for the call
+   */
+  static buyListingPartial(params: CallParams<AarnaRegistryArgs['obj']['buy_listing_partial(uint64,uint64,pay)void'] | AarnaRegistryArgs['tuple']['buy_listing_partial(uint64,uint64,pay)void']> & CallOnComplete): AppClientMethodCallParams & CallOnComplete {
+    return {
+      ...params,
+      method: 'buy_listing_partial(uint64,uint64,pay)void' as const,
+      args: Array.isArray(params.args) ? params.args : [params.args.listingId, params.args.quantity, params.args.payment],
+    }
+  }
+  /**
+   * Constructs a no op call for the sweep_listings(uint64[],uint64,uint64,pay)(uint64,uint64) ABI method
+   *
+  * Fill listings in the given order until `max_quantity` tokens are bought
+  or `max_total_price` would be exceeded; the last one may fill partially. Closed or unknown ids are skipped. `payment` (to the app, from the buyer) must cover what is spent. All seller payments (each with the LISTING_REFUND of a listing bought out), a single token transfer to the buyer and the refund of the unspent payment go out as one inner group (at most MAX_SWEEP_FILLS listings). Returns the tokens filled and the ALGO spent.
+
+   *
+   * @param params Parameters for the call
+   * @returns An `AppClientMethodCallParams` object for the call
+   */
+  static sweepListings(params: CallParams<AarnaRegistryArgs['obj']['sweep_listings(uint64[],uint64,uint64,pay)(uint64,uint64)'] | AarnaRegistryArgs['tuple']['sweep_listings(uint64[],uint64,uint64,pay)(uint64,uint64)']> & CallOnComplete): AppClientMethodCallParams & CallOnComplete {
+    return {
+      ...params,
+      method: 'sweep_listings(uint64[],uint64,uint64,pay)(uint64,uint64)' as const,
+      args: Array.isArray(params.args) ? params.args : [params.args.listingIds, params.args.maxQuantity, params.args.maxTotalPrice, params.args.payment],
+    }
+  }
   /**
    * Constructs a no op call for the cancel_listing(uint64)void ABI method
    *
-   * Seller cancels their listing. Escrowed tokens returned.
+   * Seller cancels their listing. Escrowed tokens and LISTING_REFUND returned.
    *
    * @param params Parameters for the call
    * @returns An `AppClientMethodCallParams` object for the call
@@ -655,113 +1077,322 @@ export abstract class AarnaRegistryParamsFactory {
     }
   }
   /**
-   * Constructs a no op call for the get_listing(uint64)(address,uint64,uint64,uint64) ABI method
+   * Constructs a no op call for the get_project_header(uint64)(address,uint64,uint64) ABI method
+   *
+   * Status / credits / submitter only — a single 48-byte box read.
    *
    * @param params Parameters for the call
    * @returns An `AppClientMethodCallParams` object for the call
    */
-  static getListing(params: CallParams<AarnaRegistryArgs['obj']['get_listing(uint64)(address,uint64,uint64,uint64)'] | AarnaRegistryArgs['tuple']['get_listing(uint64)(address,uint64,uint64,uint64)']> & CallOnComplete): AppClientMethodCallParams & CallOnComplete {
+  static getProjectHeader(params: CallParams<AarnaRegistryArgs['obj']['get_project_header(uint64)(address,uint64,uint64)'] | AarnaRegistryArgs['tuple']['get_project_header(uint64)(address,uint64,uint64)']> & CallOnComplete): AppClientMethodCallParams & CallOnComplete {
     return {
       ...params,
-      method: 'get_listing(uint64)(address,uint64,uint64,uint64)' as const,
-      args: Array.isArray(params.args) ? params.args : [params.args.listingId],
+      method: 'get_project_header(uint64)(address,uint64,uint64)' as const,
+      args: Array.isArray(params.args) ? params.args : [params.args.projectId],
     }
   }
   /**
-   * Constructs a no op call for the get_listing_count()uint64 ABI method
+   * Constructs a no op call for the find_project_by_cid(string)uint64 ABI method
+   *
+   * Id of the project filed with this CID, or NO_ID if there is none.
    *
    * @param params Parameters for the call
    * @returns An `AppClientMethodCallParams` object for the call
    */
-  static getListingCount(params: CallParams<AarnaRegistryArgs['obj']['get_listing_count()uint64'] | AarnaRegistryArgs['tuple']['get_listing_count()uint64']> & CallOnComplete): AppClientMethodCallParams & CallOnComplete {
+  static findProjectByCid(params: CallParams<AarnaRegistryArgs['obj']['find_project_by_cid(string)uint64'] | AarnaRegistryArgs['tuple']['find_project_by_cid(string)uint64']> & CallOnComplete): AppClientMethodCallParams & CallOnComplete {
     return {
       ...params,
-      method: 'get_listing_count()uint64' as const,
-      args: Array.isArray(params.args) ? params.args : [],
+      method: 'find_project_by_cid(string)uint64' as const,
+      args: Array.isArray(params.args) ? params.args : [params.args.cid],
     }
   }
-}
-
-/**
- * A factory to create and deploy one or more instance of the AarnaRegistry smart contract and to create one or more app clients to interact with those (or other) app instances
- */
-export class AarnaRegistryFactory {
   /**
-   * The underlying `AppFactory` for when you want to have more flexibility
-   */
-  public readonly appFactory: _AppFactory
-
-  /**
-   * Creates a new instance of `AarnaRegistryFactory`
+   * Constructs a no op call for the get_pending_ids(uint64,uint64)uint64[] ABI method
    *
-   * @param params The parameters to initialise the app factory with
+   * Next `count` pending project ids after `after` (NO_ID = from the start).
+   *
+   * @param params Parameters for the call
+   * @returns An `AppClientMethodCallParams` object for the call
    */
-  constructor(params: Omit<AppFactoryParams, 'appSpec'>) {
-    this.appFactory = new _AppFactory({
+  static getPendingIds(params: CallParams<AarnaRegistryArgs['obj']['get_pending_ids(uint64,uint64)uint64[]'] | AarnaRegistryArgs['tuple']['get_pending_ids(uint64,uint64)uint64[]']> & CallOnComplete): AppClientMethodCallParams & CallOnComplete {
+    return {
       ...params,
-      appSpec: APP_SPEC,
-    })
-  }
-  
-  /** The name of the app (from the ARC-32 / ARC-56 app spec or override). */
-  public get appName() {
-    return this.appFactory.appName
-  }
-  
-  /** The ARC-56 app spec being used */
-  get appSpec() {
-    return APP_SPEC
-  }
-  
-  /** A reference to the underlying `AlgorandClient` this app factory is using. */
-  public get algorand(): AlgorandClient {
-    return this.appFactory.algorand
+      method: 'get_pending_ids(uint64,uint64)uint64[]' as const,
+      args: Array.isArray(params.args) ? params.args : [params.args.after, params.args.count],
+    }
   }
-  
   /**
-   * Returns a new `AppClient` client for an app instance of the given ID.
+   * Constructs a no op call for the get_verified_ids(uint64,uint64)uint64[] ABI method
    *
-   * Automatically populates appName, defaultSender and source maps from the factory
-   * if not specified in the params.
-   * @param params The parameters to create the app client
-   * @returns The `AppClient`
+   * Next `count` verified, not yet issued ids after `after` (NO_ID = start).
+   *
+   * @param params Parameters for the call
+   * @returns An `AppClientMethodCallParams` object for the call
    */
-  public getAppClientById(params: AppFactoryAppClientParams) {
-    return new AarnaRegistryClient(this.appFactory.getAppClientById(params))
+  static getVerifiedIds(params: CallParams<AarnaRegistryArgs['obj']['get_verified_ids(uint64,uint64)uint64[]'] | AarnaRegistryArgs['tuple']['get_verified_ids(uint64,uint64)uint64[]']> & CallOnComplete): AppClientMethodCallParams & CallOnComplete {
+    return {
+      ...params,
+      method: 'get_verified_ids(uint64,uint64)uint64[]' as const,
+      args: Array.isArray(params.args) ? params.args : [params.args.after, params.args.count],
+    }
   }
-  
   /**
-   * Returns a new `AppClient` client, resolving the app by creator address and name
-   * using AlgoKit app deployment semantics (i.e. looking for the app creation transaction note).
+   * Constructs a no op call for the get_projects_by_submitter(address,uint64,uint64)uint64[] ABI method
    *
-   * Automatically populates appName, defaultSender and source maps from the factory
-   * if not specified in the params.
-   * @param params The parameters to create the app client
-   * @returns The `AppClient`
+   * Project ids filed by `addr`, oldest first, paged by position.
+   *
+   * @param params Parameters for the call
+   * @returns An `AppClientMethodCallParams` object for the call
    */
-  public async getAppClientByCreatorAndName(
-    params: AppFactoryResolveAppClientByCreatorAndNameParams,
-  ) {
-    return new AarnaRegistryClient(await this.appFactory.getAppClientByCreatorAndName(params))
+  static getProjectsBySubmitter(params: CallParams<AarnaRegistryArgs['obj']['get_projects_by_submitter(address,uint64,uint64)uint64[]'] | AarnaRegistryArgs['tuple']['get_projects_by_submitter(address,uint64,uint64)uint64[]']> & CallOnComplete): AppClientMethodCallParams & CallOnComplete {
+    return {
+      ...params,
+      method: 'get_projects_by_submitter(address,uint64,uint64)uint64[]' as const,
+      args: Array.isArray(params.args) ? params.args : [params.args.addr, params.args.start, params.args.count],
+    }
   }
-
   /**
-   * Idempotently deploys the AarnaRegistry smart contract.
+   * Constructs a no op call for the get_listings_by_seller(address,uint64,uint64)uint64[] ABI method
    *
-   * @param params The arguments for the contract calls and any additional parameters for the call
-   * @returns The deployment result
+  * Open listing ids of `addr`, paged by position. Closing a listing moves
+  the seller's last id into its slot, so order is not chronological.
+
+   *
+   * @param params Parameters for the call
+   * @returns An `AppClientMethodCallParams` object for the call
    */
-  public async deploy(params: AarnaRegistryDeployParams = {}) {
-    const result = await this.appFactory.deploy({
+  static getListingsBySeller(params: CallParams<AarnaRegistryArgs['obj']['get_listings_by_seller(address,uint64,uint64)uint64[]'] | AarnaRegistryArgs['tuple']['get_listings_by_seller(address,uint64,uint64)uint64[]']> & CallOnComplete): AppClientMethodCallParams & CallOnComplete {
+    return {
       ...params,
-      createParams: params.createParams?.method ? AarnaRegistryParamsFactory.create._resolveByMethod(params.createParams) : params.createParams ? params.createParams as (AarnaRegistryCreateCallParams & { args: Uint8Array[] }) : undefined,
-    })
-    return { result: result.result, appClient: new AarnaRegistryClient(result.appClient) }
+      method: 'get_listings_by_seller(address,uint64,uint64)uint64[]' as const,
+      args: Array.isArray(params.args) ? params.args : [params.args.addr, params.args.start, params.args.count],
+    }
   }
-
   /**
-   * Get parameters to create transactions (create and deploy related calls) for the current app. A good mental model for this is that these parameters represent a deferred transaction creation.
-   */
+   * Constructs a no op call for the get_stats()(uint64,uint64,uint64,uint64,uint64,uint64,uint64,uint64,uint64,uint64) ABI method
+   *
+   * Every aggregate counter in one call; volume_traded is in microAlgo.
+   *
+   * @param params Parameters for the call
+   * @returns An `AppClientMethodCallParams` object for the call
+   */
+  static getStats(params: CallParams<AarnaRegistryArgs['obj']['get_stats()(uint64,uint64,uint64,uint64,uint64,uint64,uint64,uint64,uint64,uint64)'] | AarnaRegistryArgs['tuple']['get_stats()(uint64,uint64,uint64,uint64,uint64,uint64,uint64,uint64,uint64,uint64)']> & CallOnComplete): AppClientMethodCallParams & CallOnComplete {
+    return {
+      ...params,
+      method: 'get_stats()(uint64,uint64,uint64,uint64,uint64,uint64,uint64,uint64,uint64,uint64)' as const,
+      args: Array.isArray(params.args) ? params.args : [],
+    }
+  }
+  /**
+   * Constructs a no op call for the get_best_offers(uint64)(uint64,uint64,uint64)[] ABI method
+   *
+  * The `count` cheapest active offers, in price then listing-time order.
+  Capped at MAX_BOOK_PAGE and by the available opcode budget.
+
+   *
+   * @param params Parameters for the call
+   * @returns An `AppClientMethodCallParams` object for the call
+   */
+  static getBestOffers(params: CallParams<AarnaRegistryArgs['obj']['get_best_offers(uint64)(uint64,uint64,uint64)[]'] | AarnaRegistryArgs['tuple']['get_best_offers(uint64)(uint64,uint64,uint64)[]']> & CallOnComplete): AppClientMethodCallParams & CallOnComplete {
+    return {
+      ...params,
+      method: 'get_best_offers(uint64)(uint64,uint64,uint64)[]' as const,
+      args: Array.isArray(params.args) ? params.args : [params.args.count],
+    }
+  }
+  /**
+   * Constructs a no op call for the get_depth(uint64)(uint64,uint64,uint64)[] ABI method
+   *
+  * Aggregate depth per price level, cheapest first, for every level priced
+  at or below `price_limit` (up to MAX_BOOK_PAGE levels).
+
+   *
+   * @param params Parameters for the call
+   * @returns An `AppClientMethodCallParams` object for the call
+   */
+  static getDepth(params: CallParams<AarnaRegistryArgs['obj']['get_depth(uint64)(uint64,uint64,uint64)[]'] | AarnaRegistryArgs['tuple']['get_depth(uint64)(uint64,uint64,uint64)[]']> & CallOnComplete): AppClientMethodCallParams & CallOnComplete {
+    return {
+      ...params,
+      method: 'get_depth(uint64)(uint64,uint64,uint64)[]' as const,
+      args: Array.isArray(params.args) ? params.args : [params.args.priceLimit],
+    }
+  }
+  /**
+   * Constructs a no op call for the get_price_hint(uint64)uint64 ABI method
+   *
+  * The `prev_price` for list_for_sale at `price`: the highest listed price
+  below it, or 0. Walks the book, so simulate it with extra budget.
+
+   *
+   * @param params Parameters for the call
+   * @returns An `AppClientMethodCallParams` object for the call
+   */
+  static getPriceHint(params: CallParams<AarnaRegistryArgs['obj']['get_price_hint(uint64)uint64'] | AarnaRegistryArgs['tuple']['get_price_hint(uint64)uint64']> & CallOnComplete): AppClientMethodCallParams & CallOnComplete {
+    return {
+      ...params,
+      method: 'get_price_hint(uint64)uint64' as const,
+      args: Array.isArray(params.args) ? params.args : [params.args.price],
+    }
+  }
+  /**
+   * Constructs a no op call for the get_listing(uint64)(address,uint64,uint64,uint64) ABI method
+   *
+   * Closed or never-used ids read back as an all-zero, inactive record.
+   *
+   * @param params Parameters for the call
+   * @returns An `AppClientMethodCallParams` object for the call
+   */
+  static getListing(params: CallParams<AarnaRegistryArgs['obj']['get_listing(uint64)(address,uint64,uint64,uint64)'] | AarnaRegistryArgs['tuple']['get_listing(uint64)(address,uint64,uint64,uint64)']> & CallOnComplete): AppClientMethodCallParams & CallOnComplete {
+    return {
+      ...params,
+      method: 'get_listing(uint64)(address,uint64,uint64,uint64)' as const,
+      args: Array.isArray(params.args) ? params.args : [params.args.listingId],
+    }
+  }
+  /**
+   * Constructs a no op call for the get_listing_count()uint64 ABI method
+   *
+   * Upper bound on listing ids (ids are recycled), not the open count.
+   *
+   * @param params Parameters for the call
+   * @returns An `AppClientMethodCallParams` object for the call
+   */
+  static getListingCount(params: CallParams<AarnaRegistryArgs['obj']['get_listing_count()uint64'] | AarnaRegistryArgs['tuple']['get_listing_count()uint64']> & CallOnComplete): AppClientMethodCallParams & CallOnComplete {
+    return {
+      ...params,
+      method: 'get_listing_count()uint64' as const,
+      args: Array.isArray(params.args) ? params.args : [],
+    }
+  }
+  /**
+   * Constructs a no op call for the get_open_listing_count()uint64 ABI method
+   *
+   * @param params Parameters for the call
+   * @returns An `AppClientMethodCallParams` object for the call
+   */
+  static getOpenListingCount(params: CallParams<AarnaRegistryArgs['obj']['get_open_listing_count()uint64'] | AarnaRegistryArgs['tuple']['get_open_listing_count()uint64']> & CallOnComplete): AppClientMethodCallParams & CallOnComplete {
+    return {
+      ...params,
+      method: 'get_open_listing_count()uint64' as const,
+      args: Array.isArray(params.args) ? params.args : [],
+    }
+  }
+  /**
+   * Constructs a no op call for the get_projects_page(uint64,uint64)(uint64,(address,string,string,string,string,uint64,uint64)[]) ABI method
+   *
+  * Returns up to `count` projects from `start`, stopping early when the
+  return-size limit or opcode budget is reached. `next_id` is the cursor for the following call; the scan is done once it equals the project count. Metadata is capped at submission, so any one record fits a page.
+
+   *
+   * @param params Parameters for the call
+   * @returns An `AppClientMethodCallParams` object for the call
+   */
+  static getProjectsPage(params: CallParams<AarnaRegistryArgs['obj']['get_projects_page(uint64,uint64)(uint64,(address,string,string,string,string,uint64,uint64)[])'] | AarnaRegistryArgs['tuple']['get_projects_page(uint64,uint64)(uint64,(address,string,string,string,string,uint64,uint64)[])']> & CallOnComplete): AppClientMethodCallParams & CallOnComplete {
+    return {
+      ...params,
+      method: 'get_projects_page(uint64,uint64)(uint64,(address,string,string,string,string,uint64,uint64)[])' as const,
+      args: Array.isArray(params.args) ? params.args : [params.args.start, params.args.count],
+    }
+  }
+  /**
+   * Constructs a no op call for the get_listings_page(uint64,uint64)(uint64,(address,uint64,uint64,uint64)[]) ABI method
+   *
+  * Returns up to `count` listings from `start`, stopping early when the
+  return-size limit or opcode budget is reached. `next_id` is the cursor for the following call; the scan is done once it equals the listing count. Items stay positional: a freed id reads back as an all-zero record.
+
+   *
+   * @param params Parameters for the call
+   * @returns An `AppClientMethodCallParams` object for the call
+   */
+  static getListingsPage(params: CallParams<AarnaRegistryArgs['obj']['get_listings_page(uint64,uint64)(uint64,(address,uint64,uint64,uint64)[])'] | AarnaRegistryArgs['tuple']['get_listings_page(uint64,uint64)(uint64,(address,uint64,uint64,uint64)[])']> & CallOnComplete): AppClientMethodCallParams & CallOnComplete {
+    return {
+      ...params,
+      method: 'get_listings_page(uint64,uint64)(uint64,(address,uint64,uint64,uint64)[])' as const,
+      args: Array.isArray(params.args) ? params.args : [params.args.start, params.args.count],
+    }
+  }
+}
+
+/**
+ * A factory to create and deploy one or more instance of the AarnaRegistry smart contract and to create one or more app clients to interact with those (or other) app instances
+ */
+export class AarnaRegistryFactory {
+  /**
+   * The underlying `AppFactory` for when you want to have more flexibility
+   */
+  public readonly appFactory: _AppFactory
+
+  /**
+   * Creates a new instance of `AarnaRegistryFactory`
+   *
+   * @param params The parameters to initialise the app factory with
+   */
+  constructor(params: Omit<AppFactoryParams, 'appSpec'>) {
+    this.appFactory = new _AppFactory({
+      ...params,
+      appSpec: APP_SPEC,
+    })
+  }
+  
+  /** The name of the app (from the ARC-32 / ARC-56 app spec or override). */
+  public get appName() {
+    return this.appFactory.appName
+  }
+  
+  /** The ARC-56 app spec being used */
+  get appSpec() {
+    return APP_SPEC
+  }
+  
+  /** A reference to the underlying `AlgorandClient` this app factory is using. */
+  public get algorand(): AlgorandClient {
+    return this.appFactory.algorand
+  }
+  
+  /**
+   * Returns a new `AppClient` client for an app instance of the given ID.
+   *
+   * Automatically populates appName, defaultSender and source maps from the factory
+   * if not specified in the params.
+   * @param params The parameters to create the app client
+   * @returns The `AppClient`
+   */
+  public getAppClientById(params: AppFactoryAppClientParams) {
+    return new AarnaRegistryClient(this.appFactory.getAppClientById(params))
+  }
+  
+  /**
+   * Returns a new `AppClient` client, resolving the app by creator address and name
+   * using AlgoKit app deployment semantics (i.e. looking for the app creation transaction note).
+   *
+   * Automatically populates appName, defaultSender and source maps from the factory
+   * if not specified in the params.
+   * @param params The parameters to create the app client
+   * @returns The `AppClient`
+   */
+  public async getAppClientByCreatorAndName(
+    params: AppFactoryResolveAppClientByCreatorAndNameParams,
+  ) {
+    return new AarnaRegistryClient(await this.appFactory.getAppClientByCreatorAndName(params))
+  }
+
+  /**
+   * Idempotently deploys the AarnaRegistry smart contract.
+   *
+   * @param params The arguments for the contract calls and any additional parameters for the call
+   * @returns The deployment result
+   */
+  public async deploy(params: AarnaRegistryDeployParams = {}) {
+    const result = await this.appFactory.deploy({
+      ...params,
+      createParams: params.createParams?.method ? AarnaRegistryParamsFactory.create._resolveByMethod(params.createParams) : params.createParams ? params.createParams as (AarnaRegistryCreateCallParams & { args: Uint8Array[] }) : undefined,
+    })
+    return { result: result.result, appClient: new AarnaRegistryClient(result.appClient) }
+  }
+
+  /**
+   * Get parameters to create transactions (create and deploy related calls) for the current app. A good mental model for this is that these parameters represent a deferred transaction creation.
+   */
   readonly params = {
     /**
      * Gets available create methods
@@ -966,7 +1597,9 @@ export class AarnaRegistryClient {
     /**
      * Makes a call to the AarnaRegistry smart contract using the `submit_project(string,string,string,string)uint64` ABI method.
      *
-     * Developer submits a new project. Returns the project index.
+    * Developer submits a new project. Returns the project index.
+    Each evidence bundle (CID) can back only one project, and the encoded metadata is capped at MAX_META_BYTES so the record can always be read.
+
      *
      * @param params The params for the smart contract call
      * @returns The call params
@@ -999,6 +1632,20 @@ export class AarnaRegistryClient {
       return this.appClient.params.call(AarnaRegistryParamsFactory.rejectProject(params))
     },
 
+    /**
+     * Makes a call to the AarnaRegistry smart contract using the `review_projects_batch((uint64,uint8,uint64)[])uint8[]` ABI method.
+     *
+    * Validator approves / rejects many projects in one call.
+    Ids that are unknown, no longer pending or carry an invalid decision are skipped and reported; the returned codes line up with `decisions`. At most MAX_REVIEW_BATCH decisions, as each applied one logs an event.
+
+     *
+     * @param params The params for the smart contract call
+     * @returns The call params
+     */
+    reviewProjectsBatch: (params: CallParams<AarnaRegistryArgs['obj']['review_projects_batch((uint64,uint8,uint64)[])uint8[]'] | AarnaRegistryArgs['tuple']['review_projects_batch((uint64,uint8,uint64)[])uint8[]']> & {onComplete?: OnApplicationComplete.NoOpOC}) => {
+      return this.appClient.params.call(AarnaRegistryParamsFactory.reviewProjectsBatch(params))
+    },
+
     /**
      * Makes a call to the AarnaRegistry smart contract using the `issue_credits(uint64)uint64` ABI method.
      *
@@ -1014,35 +1661,79 @@ export class AarnaRegistryClient {
     },
 
     /**
-     * Makes a call to the AarnaRegistry smart contract using the `list_for_sale(uint64,uint64)uint64` ABI method.
+     * Makes a call to the AarnaRegistry smart contract using the `issue_credits_batch(uint64[])uint64[]` ABI method.
+     *
+    * Validator issues credits for up to MAX_ISSUE_BATCH verified projects in
+    one call. Transfers go out as one inner group with zero fees, so the outer transaction pays for all of them. Unknown or unverified ids are skipped with an amount of 0; the amounts line up with `project_ids`.
+
+     *
+     * @param params The params for the smart contract call
+     * @returns The call params
+     */
+    issueCreditsBatch: (params: CallParams<AarnaRegistryArgs['obj']['issue_credits_batch(uint64[])uint64[]'] | AarnaRegistryArgs['tuple']['issue_credits_batch(uint64[])uint64[]']> & {onComplete?: OnApplicationComplete.NoOpOC}) => {
+      return this.appClient.params.call(AarnaRegistryParamsFactory.issueCreditsBatch(params))
+    },
+
+    /**
+     * Makes a call to the AarnaRegistry smart contract using the `list_for_sale(uint64,uint64,uint64,pay)uint64` ABI method.
      *
     * List AARNA tokens for sale using clawback to escrow.
-    Returns the listing index.
+    `prev_price` is the highest listed price below `price_per_token` (0 if there is none; see get_price_hint), only needed when no listing has that price yet. `deposit` (to the app, from the seller) funds the listing's boxes: LISTING_DEPOSIT, or LISTING_REFUND when a freed id is reused, with any excess refunded. Returns the listing index.
 
      *
      * @param params The params for the smart contract call
      * @returns The call params
      */
-    listForSale: (params: CallParams<AarnaRegistryArgs['obj']['list_for_sale(uint64,uint64)uint64'] | AarnaRegistryArgs['tuple']['list_for_sale(uint64,uint64)uint64']> & {onComplete?: OnApplicationComplete.NoOpOC}) => {
+    listForSale: (params: CallParams<AarnaRegistryArgs['obj']['list_for_sale(uint64,uint64,uint64,pay)uint64'] | AarnaRegistryArgs['tuple']['list_for_sale(uint64,uint64,uint64,pay)uint64']> & {onComplete?: OnApplicationComplete.NoOpOC}) => {
       return this.appClient.params.call(AarnaRegistryParamsFactory.listForSale(params))
     },
 
     /**
-     * Makes a call to the AarnaRegistry smart contract using the `buy_listing(uint64,uint64)void` ABI method.
+     * Makes a call to the AarnaRegistry smart contract using the `buy_listing(uint64,pay)void` ABI method.
      *
-     * Buy tokens from a listing. Transfers tokens to buyer and ALGO to seller.
+    * Buy tokens from a listing. Transfers tokens to buyer and ALGO to seller.
+    `payment` (to the app, from the buyer) must cover the cost; any excess is refunded.
+
      *
      * @param params The params for the smart contract call
      * @returns The call params
      */
-    buyListing: (params: CallParams<AarnaRegistryArgs['obj']['buy_listing(uint64,uint64)void'] | AarnaRegistryArgs['tuple']['buy_listing(uint64,uint64)void']> & {onComplete?: OnApplicationComplete.NoOpOC}) => {
+    buyListing: (params: CallParams<AarnaRegistryArgs['obj']['buy_listing(uint64,pay)void'] | AarnaRegistryArgs['tuple']['buy_listing(uint64,pay)void']> & {onComplete?: OnApplicationComplete.NoOpOC}) => {
       return this.appClient.params.call(AarnaRegistryParamsFactory.buyListing(params))
     },
 
+    /**
+     * Makes a call to the AarnaRegistry smart contract using the `buy_listing_partial(uint64,uint64,pay)void` ABI method.
+     *
+    * Buy part of a listing. The rest stays listed at the same price; the
+    listing closes once its amount reaches zero. Paid for like buy_listing.
+
+     *
+     * @param params The params for the smart contract call
+     * @returns The call params
+     */
+    buyListingPartial: (params: CallParams<AarnaRegistryArgs['obj']['buy_listing_partial(uint64,uint64,pay)void'] | AarnaRegistryArgs['tuple']['buy_listing_partial(uint64,uint64,pay)void']> & {onComplete?: OnApplicationComplete.NoOpOC}) => {
+      return this.appClient.params.call(AarnaRegistryParamsFactory.buyListingPartial(params))
+    },
+
+    /**
+     * Makes a call to the AarnaRegistry smart contract using the `sweep_listings(uint64[],uint64,uint64,pay)(uint64,uint64)` ABI method.
+     *
+    * Fill listings in the given order until `max_quantity` tokens are bought
+    or `max_total_price` would be exceeded; the last one may fill partially. Closed or unknown ids are skipped. `payment` (to the app, from the buyer) must cover what is spent. All seller payments (each with the LISTING_REFUND of a listing bought out), a single token transfer to the buyer and the refund of the unspent payment go out as one inner group (at most MAX_SWEEP_FILLS listings). Returns the tokens filled and the ALGO spent.
+
+     *
+     * @param params The params for the smart contract call
+     * @returns The call params
+     */
+    sweepListings: (params: CallParams<AarnaRegistryArgs['obj']['sweep_listings(uint64[],uint64,uint64,pay)(uint64,uint64)'] | AarnaRegistryArgs['tuple']['sweep_listings(uint64[],uint64,uint64,pay)(uint64,uint64)']> & {onComplete?: OnApplicationComplete.NoOpOC}) => {
+      return this.appClient.params.call(AarnaRegistryParamsFactory.sweepListings(params))
+    },
+
     /**
      * Makes a call to the AarnaRegistry smart contract using the `cancel_listing(uint64)void` ABI method.
      *
-     * Seller cancels their listing. Escrowed tokens returned.
+     * Seller cancels their listing. Escrowed tokens and LISTING_REFUND returned.
      *
      * @param params The params for the smart contract call
      * @returns The call params
@@ -1124,59 +1815,255 @@ export class AarnaRegistryClient {
     },
 
     /**
-     * Makes a call to the AarnaRegistry smart contract using the `get_listing(uint64)(address,uint64,uint64,uint64)` ABI method.
+     * Makes a call to the AarnaRegistry smart contract using the `get_project_header(uint64)(address,uint64,uint64)` ABI method.
+     *
+     * Status / credits / submitter only — a single 48-byte box read.
      * 
      * This method is a readonly method; calling it with onComplete of NoOp will result in a simulated transaction rather than a real transaction.
      *
      * @param params The params for the smart contract call
      * @returns The call params
      */
-    getListing: (params: CallParams<AarnaRegistryArgs['obj']['get_listing(uint64)(address,uint64,uint64,uint64)'] | AarnaRegistryArgs['tuple']['get_listing(uint64)(address,uint64,uint64,uint64)']> & {onComplete?: OnApplicationComplete.NoOpOC}) => {
-      return this.appClient.params.call(AarnaRegistryParamsFactory.getListing(params))
+    getProjectHeader: (params: CallParams<AarnaRegistryArgs['obj']['get_project_header(uint64)(address,uint64,uint64)'] | AarnaRegistryArgs['tuple']['get_project_header(uint64)(address,uint64,uint64)']> & {onComplete?: OnApplicationComplete.NoOpOC}) => {
+      return this.appClient.params.call(AarnaRegistryParamsFactory.getProjectHeader(params))
     },
 
     /**
-     * Makes a call to the AarnaRegistry smart contract using the `get_listing_count()uint64` ABI method.
+     * Makes a call to the AarnaRegistry smart contract using the `find_project_by_cid(string)uint64` ABI method.
+     *
+     * Id of the project filed with this CID, or NO_ID if there is none.
      * 
      * This method is a readonly method; calling it with onComplete of NoOp will result in a simulated transaction rather than a real transaction.
      *
      * @param params The params for the smart contract call
      * @returns The call params
      */
-    getListingCount: (params: CallParams<AarnaRegistryArgs['obj']['get_listing_count()uint64'] | AarnaRegistryArgs['tuple']['get_listing_count()uint64']> & {onComplete?: OnApplicationComplete.NoOpOC} = {args: []}) => {
-      return this.appClient.params.call(AarnaRegistryParamsFactory.getListingCount(params))
+    findProjectByCid: (params: CallParams<AarnaRegistryArgs['obj']['find_project_by_cid(string)uint64'] | AarnaRegistryArgs['tuple']['find_project_by_cid(string)uint64']> & {onComplete?: OnApplicationComplete.NoOpOC}) => {
+      return this.appClient.params.call(AarnaRegistryParamsFactory.findProjectByCid(params))
     },
 
-  }
-
-  /**
-   * Create transactions for the current app
-   */
-  readonly createTransaction = {
     /**
-     * Makes a clear_state call to an existing instance of the AarnaRegistry smart contract.
+     * Makes a call to the AarnaRegistry smart contract using the `get_pending_ids(uint64,uint64)uint64[]` ABI method.
      *
-     * @param params The params for the bare (raw) call
-     * @returns The clearState result
+     * Next `count` pending project ids after `after` (NO_ID = from the start).
+     * 
+     * This method is a readonly method; calling it with onComplete of NoOp will result in a simulated transaction rather than a real transaction.
+     *
+     * @param params The params for the smart contract call
+     * @returns The call params
      */
-    clearState: (params?: Expand<AppClientBareCallParams>) => {
-      return this.appClient.createTransaction.bare.clearState(params)
+    getPendingIds: (params: CallParams<AarnaRegistryArgs['obj']['get_pending_ids(uint64,uint64)uint64[]'] | AarnaRegistryArgs['tuple']['get_pending_ids(uint64,uint64)uint64[]']> & {onComplete?: OnApplicationComplete.NoOpOC}) => {
+      return this.appClient.params.call(AarnaRegistryParamsFactory.getPendingIds(params))
     },
 
     /**
-     * Makes a call to the AarnaRegistry smart contract using the `set_validator(address)void` ABI method.
+     * Makes a call to the AarnaRegistry smart contract using the `get_verified_ids(uint64,uint64)uint64[]` ABI method.
      *
-     * Admin assigns a validator address for project reviews.
+     * Next `count` verified, not yet issued ids after `after` (NO_ID = start).
+     * 
+     * This method is a readonly method; calling it with onComplete of NoOp will result in a simulated transaction rather than a real transaction.
      *
      * @param params The params for the smart contract call
-     * @returns The call transaction
+     * @returns The call params
      */
-    setValidator: (params: CallParams<AarnaRegistryArgs['obj']['set_validator(address)void'] | AarnaRegistryArgs['tuple']['set_validator(address)void']> & {onComplete?: OnApplicationComplete.NoOpOC}) => {
-      return this.appClient.createTransaction.call(AarnaRegistryParamsFactory.setValidator(params))
+    getVerifiedIds: (params: CallParams<AarnaRegistryArgs['obj']['get_verified_ids(uint64,uint64)uint64[]'] | AarnaRegistryArgs['tuple']['get_verified_ids(uint64,uint64)uint64[]']> & {onComplete?: OnApplicationComplete.NoOpOC}) => {
+      return this.appClient.params.call(AarnaRegistryParamsFactory.getVerifiedIds(params))
     },
 
     /**
-     * Makes a call to the AarnaRegistry smart contract using the `transfer_admin(address)void` ABI method.
+     * Makes a call to the AarnaRegistry smart contract using the `get_projects_by_submitter(address,uint64,uint64)uint64[]` ABI method.
+     *
+     * Project ids filed by `addr`, oldest first, paged by position.
+     * 
+     * This method is a readonly method; calling it with onComplete of NoOp will result in a simulated transaction rather than a real transaction.
+     *
+     * @param params The params for the smart contract call
+     * @returns The call params
+     */
+    getProjectsBySubmitter: (params: CallParams<AarnaRegistryArgs['obj']['get_projects_by_submitter(address,uint64,uint64)uint64[]'] | AarnaRegistryArgs['tuple']['get_projects_by_submitter(address,uint64,uint64)uint64[]']> & {onComplete?: OnApplicationComplete.NoOpOC}) => {
+      return this.appClient.params.call(AarnaRegistryParamsFactory.getProjectsBySubmitter(params))
+    },
+
+    /**
+     * Makes a call to the AarnaRegistry smart contract using the `get_listings_by_seller(address,uint64,uint64)uint64[]` ABI method.
+     *
+    * Open listing ids of `addr`, paged by position. Closing a listing moves
+    the seller's last id into its slot, so order is not chronological.
+
+     * 
+     * This method is a readonly method; calling it with onComplete of NoOp will result in a simulated transaction rather than a real transaction.
+     *
+     * @param params The params for the smart contract call
+     * @returns The call params
+     */
+    getListingsBySeller: (params: CallParams<AarnaRegistryArgs['obj']['get_listings_by_seller(address,uint64,uint64)uint64[]'] | AarnaRegistryArgs['tuple']['get_listings_by_seller(address,uint64,uint64)uint64[]']> & {onComplete?: OnApplicationComplete.NoOpOC}) => {
+      return this.appClient.params.call(AarnaRegistryParamsFactory.getListingsBySeller(params))
+    },
+
+    /**
+     * Makes a call to the AarnaRegistry smart contract using the `get_stats()(uint64,uint64,uint64,uint64,uint64,uint64,uint64,uint64,uint64,uint64)` ABI method.
+     *
+     * Every aggregate counter in one call; volume_traded is in microAlgo.
+     * 
+     * This method is a readonly method; calling it with onComplete of NoOp will result in a simulated transaction rather than a real transaction.
+     *
+     * @param params The params for the smart contract call
+     * @returns The call params
+     */
+    getStats: (params: CallParams<AarnaRegistryArgs['obj']['get_stats()(uint64,uint64,uint64,uint64,uint64,uint64,uint64,uint64,uint64,uint64)'] | AarnaRegistryArgs['tuple']['get_stats()(uint64,uint64,uint64,uint64,uint64,uint64,uint64,uint64,uint64,uint64)']> & {onComplete?: OnApplicationComplete.NoOpOC} = {args: []}) => {
+      return this.appClient.params.call(AarnaRegistryParamsFactory.getStats(params))
+    },
+
+    /**
+     * Makes a call to the AarnaRegistry smart contract using the `get_best_offers(uint64)(uint64,uint64,uint64)[]` ABI method.
+     *
+    * The `count` cheapest active offers, in price then listing-time order.
+    Capped at MAX_BOOK_PAGE and by the available opcode budget.
+
+     * 
+     * This method is a readonly method; calling it with onComplete of NoOp will result in a simulated transaction rather than a real transaction.
+     *
+     * @param params The params for the smart contract call
+     * @returns The call params
+     */
+    getBestOffers: (params: CallParams<AarnaRegistryArgs['obj']['get_best_offers(uint64)(uint64,uint64,uint64)[]'] | AarnaRegistryArgs['tuple']['get_best_offers(uint64)(uint64,uint64,uint64)[]']> & {onComplete?: OnApplicationComplete.NoOpOC}) => {
+      return this.appClient.params.call(AarnaRegistryParamsFactory.getBestOffers(params))
+    },
+
+    /**
+     * Makes a call to the AarnaRegistry smart contract using the `get_depth(uint64)(uint64,uint64,uint64)[]` ABI method.
+     *
+    * Aggregate depth per price level, cheapest first, for every level priced
+    at or below `price_limit` (up to MAX_BOOK_PAGE levels).
+
+     * 
+     * This method is a readonly method; calling it with onComplete of NoOp will result in a simulated transaction rather than a real transaction.
+     *
+     * @param params The params for the smart contract call
+     * @returns The call params
+     */
+    getDepth: (params: CallParams<AarnaRegistryArgs['obj']['get_depth(uint64)(uint64,uint64,uint64)[]'] | AarnaRegistryArgs['tuple']['get_depth(uint64)(uint64,uint64,uint64)[]']> & {onComplete?: OnApplicationComplete.NoOpOC}) => {
+      return this.appClient.params.call(AarnaRegistryParamsFactory.getDepth(params))
+    },
+
+    /**
+     * Makes a call to the AarnaRegistry smart contract using the `get_price_hint(uint64)uint64` ABI method.
+     *
+    * The `prev_price` for list_for_sale at `price`: the highest listed price
+    below it, or 0. Walks the book, so simulate it with extra budget.
+
+     * 
+     * This method is a readonly method; calling it with onComplete of NoOp will result in a simulated transaction rather than a real transaction.
+     *
+     * @param params The params for the smart contract call
+     * @returns The call params
+     */
+    getPriceHint: (params: CallParams<AarnaRegistryArgs['obj']['get_price_hint(uint64)uint64'] | AarnaRegistryArgs['tuple']['get_price_hint(uint64)uint64']> & {onComplete?: OnApplicationComplete.NoOpOC}) => {
+      return this.appClient.params.call(AarnaRegistryParamsFactory.getPriceHint(params))
+    },
+
+    /**
+     * Makes a call to the AarnaRegistry smart contract using the `get_listing(uint64)(address,uint64,uint64,uint64)` ABI method.
+     *
+     * Closed or never-used ids read back as an all-zero, inactive record.
+     * 
+     * This method is a readonly method; calling it with onComplete of NoOp will result in a simulated transaction rather than a real transaction.
+     *
+     * @param params The params for the smart contract call
+     * @returns The call params
+     */
+    getListing: (params: CallParams<AarnaRegistryArgs['obj']['get_listing(uint64)(address,uint64,uint64,uint64)'] | AarnaRegistryArgs['tuple']['get_listing(uint64)(address,uint64,uint64,uint64)']> & {onComplete?: OnApplicationComplete.NoOpOC}) => {
+      return this.appClient.params.call(AarnaRegistryParamsFactory.getListing(params))
+    },
+
+    /**
+     * Makes a call to the AarnaRegistry smart contract using the `get_listing_count()uint64` ABI method.
+     *
+     * Upper bound on listing ids (ids are recycled), not the open count.
+     * 
+     * This method is a readonly method; calling it with onComplete of NoOp will result in a simulated transaction rather than a real transaction.
+     *
+     * @param params The params for the smart contract call
+     * @returns The call params
+     */
+    getListingCount: (params: CallParams<AarnaRegistryArgs['obj']['get_listing_count()uint64'] | AarnaRegistryArgs['tuple']['get_listing_count()uint64']> & {onComplete?: OnApplicationComplete.NoOpOC} = {args: []}) => {
+      return this.appClient.params.call(AarnaRegistryParamsFactory.getListingCount(params))
+    },
+
+    /**
+     * Makes a call to the AarnaRegistry smart contract using the `get_open_listing_count()uint64` ABI method.
+     * 
+     * This method is a readonly method; calling it with onComplete of NoOp will result in a simulated transaction rather than a real transaction.
+     *
+     * @param params The params for the smart contract call
+     * @returns The call params
+     */
+    getOpenListingCount: (params: CallParams<AarnaRegistryArgs['obj']['get_open_listing_count()uint64'] | AarnaRegistryArgs['tuple']['get_open_listing_count()uint64']> & {onComplete?: OnApplicationComplete.NoOpOC} = {args: []}) => {
+      return this.appClient.params.call(AarnaRegistryParamsFactory.getOpenListingCount(params))
+    },
+
+    /**
+     * Makes a call to the AarnaRegistry smart contract using the `get_projects_page(uint64,uint64)(uint64,(address,string,string,string,string,uint64,uint64)[])` ABI method.
+     *
+    * Returns up to `count` projects from `start`, stopping early when the
+    return-size limit or opcode budget is reached. `next_id` is the cursor for the following call; the scan is done once it equals the project count. Metadata is capped at submission, so any one record fits a page.
+
+     * 
+     * This method is a readonly method; calling it with onComplete of NoOp will result in a simulated transaction rather than a real transaction.
+     *
+     * @param params The params for the smart contract call
+     * @returns The call params
+     */
+    getProjectsPage: (params: CallParams<AarnaRegistryArgs['obj']['get_projects_page(uint64,uint64)(uint64,(address,string,string,string,string,uint64,uint64)[])'] | AarnaRegistryArgs['tuple']['get_projects_page(uint64,uint64)(uint64,(address,string,string,string,string,uint64,uint64)[])']> & {onComplete?: OnApplicationComplete.NoOpOC}) => {
+      return this.appClient.params.call(AarnaRegistryParamsFactory.getProjectsPage(params))
+    },
+
+    /**
+     * Makes a call to the AarnaRegistry smart contract using the `get_listings_page(uint64,uint64)(uint64,(address,uint64,uint64,uint64)[])` ABI method.
+     *
+    * Returns up to `count` listings from `start`, stopping early when the
+    return-size limit or opcode budget is reached. `next_id` is the cursor for the following call; the scan is done once it equals the listing count. Items stay positional: a freed id reads back as an all-zero record.
+
+     * 
+     * This method is a readonly method; calling it with onComplete of NoOp will result in a simulated transaction rather than a real transaction.
+     *
+     * @param params The params for the smart contract call
+     * @returns The call params
+     */
+    getListingsPage: (params: CallParams<AarnaRegistryArgs['obj']['get_listings_page(uint64,uint64)(uint64,(address,uint64,uint64,uint64)[])'] | AarnaRegistryArgs['tuple']['get_listings_page(uint64,uint64)(uint64,(address,uint64,uint64,uint64)[])']> & {onComplete?: OnApplicationComplete.NoOpOC}) => {
+      return this.appClient.params.call(AarnaRegistryParamsFactory.getListingsPage(params))
+    },
+
+  }
+
+  /**
+   * Create transactions for the current app
+   */
+  readonly createTransaction = {
+    /**
+     * Makes a clear_state call to an existing instance of the AarnaRegistry smart contract.
+     *
+     * @param params The params for the bare (raw) call
+     * @returns The clearState result
+     */
+    clearState: (params?: Expand<AppClientBareCallParams>) => {
+      return this.appClient.createTransaction.bare.clearState(params)
+    },
+
+    /**
+     * Makes a call to the AarnaRegistry smart contract using the `set_validator(address)void` ABI method.
+     *
+     * Admin assigns a validator address for project reviews.
+     *
+     * @param params The params for the smart contract call
+     * @returns The call transaction
+     */
+    setValidator: (params: CallParams<AarnaRegistryArgs['obj']['set_validator(address)void'] | AarnaRegistryArgs['tuple']['set_validator(address)void']> & {onComplete?: OnApplicationComplete.NoOpOC}) => {
+      return this.appClient.createTransaction.call(AarnaRegistryParamsFactory.setValidator(params))
+    },
+
+    /**
+     * Makes a call to the AarnaRegistry smart contract using the `transfer_admin(address)void` ABI method.
      *
      * Admin transfers ownership to a new admin account.
      *
@@ -1202,7 +2089,9 @@ export class AarnaRegistryClient {
     /**
      * Makes a call to the AarnaRegistry smart contract using the `submit_project(string,string,string,string)uint64` ABI method.
      *
-     * Developer submits a new project. Returns the project index.
+    * Developer submits a new project. Returns the project index.
+    Each evidence bundle (CID) can back only one project, and the encoded metadata is capped at MAX_META_BYTES so the record can always be read.
+
      *
      * @param params The params for the smart contract call
      * @returns The call transaction
@@ -1235,6 +2124,20 @@ export class AarnaRegistryClient {
       return this.appClient.createTransaction.call(AarnaRegistryParamsFactory.rejectProject(params))
     },
 
+    /**
+     * Makes a call to the AarnaRegistry smart contract using the `review_projects_batch((uint64,uint8,uint64)[])uint8[]` ABI method.
+     *
+    * Validator approves / rejects many projects in one call.
+    Ids that are unknown, no longer pending or carry an invalid decision are skipped and reported; the returned codes line up with `decisions`. At most MAX_REVIEW_BATCH decisions, as each applied one logs an event.
+
+     *
+     * @param params The params for the smart contract call
+     * @returns The call transaction
+     */
+    reviewProjectsBatch: (params: CallParams<AarnaRegistryArgs['obj']['review_projects_batch((uint64,uint8,uint64)[])uint8[]'] | AarnaRegistryArgs['tuple']['review_projects_batch((uint64,uint8,uint64)[])uint8[]']> & {onComplete?: OnApplicationComplete.NoOpOC}) => {
+      return this.appClient.createTransaction.call(AarnaRegistryParamsFactory.reviewProjectsBatch(params))
+    },
+
     /**
      * Makes a call to the AarnaRegistry smart contract using the `issue_credits(uint64)uint64` ABI method.
      *
@@ -1250,35 +2153,79 @@ export class AarnaRegistryClient {
     },
 
     /**
-     * Makes a call to the AarnaRegistry smart contract using the `list_for_sale(uint64,uint64)uint64` ABI method.
+     * Makes a call to the AarnaRegistry smart contract using the `issue_credits_batch(uint64[])uint64[]` ABI method.
+     *
+    * Validator issues credits for up to MAX_ISSUE_BATCH verified projects in
+    one call. Transfers go out as one inner group with zero fees, so the outer transaction pays for all of them. Unknown or unverified ids are skipped with an amount of 0; the amounts line up with `project_ids`.
+
+     *
+     * @param params The params for the smart contract call
+     * @returns The call transaction
+     */
+    issueCreditsBatch: (params: CallParams<AarnaRegistryArgs['obj']['issue_credits_batch(uint64[])uint64[]'] | AarnaRegistryArgs['tuple']['issue_credits_batch(uint64[])uint64[]']> & {onComplete?: OnApplicationComplete.NoOpOC}) => {
+      return this.appClient.createTransaction.call(AarnaRegistryParamsFactory.issueCreditsBatch(params))
+    },
+
+    /**
+     * Makes a call to the AarnaRegistry smart contract using the `list_for_sale(uint64,uint64,uint64,pay)uint64` ABI method.
      *
     * List AARNA tokens for sale using clawback to escrow.
-    Returns the listing index.
+    `prev_price` is the highest listed price below `price_per_token` (0 if there is none; see get_price_hint), only needed when no listing has that price yet. `deposit` (to the app, from the seller) funds the listing's boxes: LISTING_DEPOSIT, or LISTING_REFUND when a freed id is reused, with any excess refunded. Returns the listing index.
 
      *
      * @param params The params for the smart contract call
      * @returns The call transaction
      */
-    listForSale: (params: CallParams<AarnaRegistryArgs['obj']['list_for_sale(uint64,uint64)uint64'] | AarnaRegistryArgs['tuple']['list_for_sale(uint64,uint64)uint64']> & {onComplete?: OnApplicationComplete.NoOpOC}) => {
+    listForSale: (params: CallParams<AarnaRegistryArgs['obj']['list_for_sale(uint64,uint64,uint64,pay)uint64'] | AarnaRegistryArgs['tuple']['list_for_sale(uint64,uint64,uint64,pay)uint64']> & {onComplete?: OnApplicationComplete.NoOpOC}) => {
       return this.appClient.createTransaction.call(AarnaRegistryParamsFactory.listForSale(params))
     },
 
     /**
-     * Makes a call to the AarnaRegistry smart contract using the `buy_listing(uint64,uint64)void` ABI method.
+     * Makes a call to the AarnaRegistry smart contract using the `buy_listing(uint64,pay)void` ABI method.
      *
-     * Buy tokens from a listing. Transfers tokens to buyer and ALGO to seller.
+    * Buy tokens from a listing. Transfers tokens to buyer and ALGO to seller.
+    `payment` (to the app, from the buyer) must cover the cost; any excess is refunded.
+
      *
      * @param params The params for the smart contract call
      * @returns The call transaction
      */
-    buyListing: (params: CallParams<AarnaRegistryArgs['obj']['buy_listing(uint64,uint64)void'] | AarnaRegistryArgs['tuple']['buy_listing(uint64,uint64)void']> & {onComplete?: OnApplicationComplete.NoOpOC}) => {
+    buyListing: (params: CallParams<AarnaRegistryArgs['obj']['buy_listing(uint64,pay)void'] | AarnaRegistryArgs['tuple']['buy_listing(uint64,pay)void']> & {onComplete?: OnApplicationComplete.NoOpOC}) => {
       return this.appClient.createTransaction.call(AarnaRegistryParamsFactory.buyListing(params))
     },
 
+    /**
+     * Makes a call to the AarnaRegistry smart contract using the `buy_listing_partial(uint64,uint64,pay)void` ABI method.
+     *
+    * Buy part of a listing. The rest stays listed at the same price; the
+    listing closes once its amount reaches zero. Paid for like buy_listing.
+
+     *
+     * @param params The params for the smart contract call
+     * @returns The call transaction
+     */
+    buyListingPartial: (params: CallParams<AarnaRegistryArgs['obj']['buy_listing_partial(uint64,uint64,pay)void'] | AarnaRegistryArgs['tuple']['buy_listing_partial(uint64,uint64,pay)void']> & {onComplete?: OnApplicationComplete.NoOpOC}) => {
+      return this.appClient.createTransaction.call(AarnaRegistryParamsFactory.buyListingPartial(params))
+    },
+
+    /**
+     * Makes a call to the AarnaRegistry smart contract using the `sweep_listings(uint64[],uint64,uint64,pay)(uint64,uint64)` ABI method.
+     *
+    * Fill listings in the given order until `max_quantity` tokens are bought
+    or `max_total_price` would be exceeded; the last one may fill partially. Closed or unknown ids are skipped. `payment` (to the app, from the buyer) must cover what is spent. All seller payments (each with the LISTING_REFUND of a listing bought out), a single token transfer to the buyer and the refund of the unspent payment go out as one inner group (at most MAX_SWEEP_FILLS listings). Returns the tokens filled and the ALGO spent.
+
+     *
+     * @param params The params for the smart contract call
+     * @returns The call transaction
+     */
+    sweepListings: (params: CallParams<AarnaRegistryArgs['obj']['sweep_listings(uint64[],uint64,uint64,pay)(uint64,uint64)'] | AarnaRegistryArgs['tuple']['sweep_listings(uint64[],uint64,uint64,pay)(uint64,uint64)']> & {onComplete?: OnApplicationComplete.NoOpOC}) => {
+      return this.appClient.createTransaction.call(AarnaRegistryParamsFactory.sweepListings(params))
+    },
+
     /**
      * Makes a call to the AarnaRegistry smart contract using the `cancel_listing(uint64)void` ABI method.
      *
-     * Seller cancels their listing. Escrowed tokens returned.
+     * Seller cancels their listing. Escrowed tokens and LISTING_REFUND returned.
      *
      * @param params The params for the smart contract call
      * @returns The call transaction
@@ -1360,106 +2307,304 @@ export class AarnaRegistryClient {
     },
 
     /**
-     * Makes a call to the AarnaRegistry smart contract using the `get_listing(uint64)(address,uint64,uint64,uint64)` ABI method.
+     * Makes a call to the AarnaRegistry smart contract using the `get_project_header(uint64)(address,uint64,uint64)` ABI method.
+     *
+     * Status / credits / submitter only — a single 48-byte box read.
      * 
      * This method is a readonly method; calling it with onComplete of NoOp will result in a simulated transaction rather than a real transaction.
      *
      * @param params The params for the smart contract call
      * @returns The call transaction
      */
-    getListing: (params: CallParams<AarnaRegistryArgs['obj']['get_listing(uint64)(address,uint64,uint64,uint64)'] | AarnaRegistryArgs['tuple']['get_listing(uint64)(address,uint64,uint64,uint64)']> & {onComplete?: OnApplicationComplete.NoOpOC}) => {
-      return this.appClient.createTransaction.call(AarnaRegistryParamsFactory.getListing(params))
+    getProjectHeader: (params: CallParams<AarnaRegistryArgs['obj']['get_project_header(uint64)(address,uint64,uint64)'] | AarnaRegistryArgs['tuple']['get_project_header(uint64)(address,uint64,uint64)']> & {onComplete?: OnApplicationComplete.NoOpOC}) => {
+      return this.appClient.createTransaction.call(AarnaRegistryParamsFactory.getProjectHeader(params))
     },
 
     /**
-     * Makes a call to the AarnaRegistry smart contract using the `get_listing_count()uint64` ABI method.
+     * Makes a call to the AarnaRegistry smart contract using the `find_project_by_cid(string)uint64` ABI method.
+     *
+     * Id of the project filed with this CID, or NO_ID if there is none.
      * 
      * This method is a readonly method; calling it with onComplete of NoOp will result in a simulated transaction rather than a real transaction.
      *
      * @param params The params for the smart contract call
      * @returns The call transaction
      */
-    getListingCount: (params: CallParams<AarnaRegistryArgs['obj']['get_listing_count()uint64'] | AarnaRegistryArgs['tuple']['get_listing_count()uint64']> & {onComplete?: OnApplicationComplete.NoOpOC} = {args: []}) => {
-      return this.appClient.createTransaction.call(AarnaRegistryParamsFactory.getListingCount(params))
+    findProjectByCid: (params: CallParams<AarnaRegistryArgs['obj']['find_project_by_cid(string)uint64'] | AarnaRegistryArgs['tuple']['find_project_by_cid(string)uint64']> & {onComplete?: OnApplicationComplete.NoOpOC}) => {
+      return this.appClient.createTransaction.call(AarnaRegistryParamsFactory.findProjectByCid(params))
     },
 
-  }
-
-  /**
-   * Send calls to the current app
-   */
-  readonly send = {
     /**
-     * Makes a clear_state call to an existing instance of the AarnaRegistry smart contract.
+     * Makes a call to the AarnaRegistry smart contract using the `get_pending_ids(uint64,uint64)uint64[]` ABI method.
      *
-     * @param params The params for the bare (raw) call
-     * @returns The clearState result
+     * Next `count` pending project ids after `after` (NO_ID = from the start).
+     * 
+     * This method is a readonly method; calling it with onComplete of NoOp will result in a simulated transaction rather than a real transaction.
+     *
+     * @param params The params for the smart contract call
+     * @returns The call transaction
      */
-    clearState: (params?: Expand<AppClientBareCallParams & SendParams>) => {
-      return this.appClient.send.bare.clearState(params)
+    getPendingIds: (params: CallParams<AarnaRegistryArgs['obj']['get_pending_ids(uint64,uint64)uint64[]'] | AarnaRegistryArgs['tuple']['get_pending_ids(uint64,uint64)uint64[]']> & {onComplete?: OnApplicationComplete.NoOpOC}) => {
+      return this.appClient.createTransaction.call(AarnaRegistryParamsFactory.getPendingIds(params))
     },
 
     /**
-     * Makes a call to the AarnaRegistry smart contract using the `set_validator(address)void` ABI method.
+     * Makes a call to the AarnaRegistry smart contract using the `get_verified_ids(uint64,uint64)uint64[]` ABI method.
      *
-     * Admin assigns a validator address for project reviews.
+     * Next `count` verified, not yet issued ids after `after` (NO_ID = start).
+     * 
+     * This method is a readonly method; calling it with onComplete of NoOp will result in a simulated transaction rather than a real transaction.
      *
      * @param params The params for the smart contract call
-     * @returns The call result
+     * @returns The call transaction
      */
-    setValidator: async (params: CallParams<AarnaRegistryArgs['obj']['set_validator(address)void'] | AarnaRegistryArgs['tuple']['set_validator(address)void']> & SendParams & {onComplete?: OnApplicationComplete.NoOpOC}) => {
-      const result = await this.appClient.send.call(AarnaRegistryParamsFactory.setValidator(params))
-      return {...result, return: result.return as unknown as (undefined | AarnaRegistryReturns['set_validator(address)void'])}
+    getVerifiedIds: (params: CallParams<AarnaRegistryArgs['obj']['get_verified_ids(uint64,uint64)uint64[]'] | AarnaRegistryArgs['tuple']['get_verified_ids(uint64,uint64)uint64[]']> & {onComplete?: OnApplicationComplete.NoOpOC}) => {
+      return this.appClient.createTransaction.call(AarnaRegistryParamsFactory.getVerifiedIds(params))
     },
 
     /**
-     * Makes a call to the AarnaRegistry smart contract using the `transfer_admin(address)void` ABI method.
+     * Makes a call to the AarnaRegistry smart contract using the `get_projects_by_submitter(address,uint64,uint64)uint64[]` ABI method.
      *
-     * Admin transfers ownership to a new admin account.
+     * Project ids filed by `addr`, oldest first, paged by position.
+     * 
+     * This method is a readonly method; calling it with onComplete of NoOp will result in a simulated transaction rather than a real transaction.
      *
      * @param params The params for the smart contract call
-     * @returns The call result
+     * @returns The call transaction
      */
-    transferAdmin: async (params: CallParams<AarnaRegistryArgs['obj']['transfer_admin(address)void'] | AarnaRegistryArgs['tuple']['transfer_admin(address)void']> & SendParams & {onComplete?: OnApplicationComplete.NoOpOC}) => {
-      const result = await this.appClient.send.call(AarnaRegistryParamsFactory.transferAdmin(params))
-      return {...result, return: result.return as unknown as (undefined | AarnaRegistryReturns['transfer_admin(address)void'])}
+    getProjectsBySubmitter: (params: CallParams<AarnaRegistryArgs['obj']['get_projects_by_submitter(address,uint64,uint64)uint64[]'] | AarnaRegistryArgs['tuple']['get_projects_by_submitter(address,uint64,uint64)uint64[]']> & {onComplete?: OnApplicationComplete.NoOpOC}) => {
+      return this.appClient.createTransaction.call(AarnaRegistryParamsFactory.getProjectsBySubmitter(params))
     },
 
     /**
-     * Makes a call to the AarnaRegistry smart contract using the `ensure_token()uint64` ABI method.
+     * Makes a call to the AarnaRegistry smart contract using the `get_listings_by_seller(address,uint64,uint64)uint64[]` ABI method.
      *
-     * Create the AARNA ASA if it doesn't exist. Returns the ASA ID.
+    * Open listing ids of `addr`, paged by position. Closing a listing moves
+    the seller's last id into its slot, so order is not chronological.
+
+     * 
+     * This method is a readonly method; calling it with onComplete of NoOp will result in a simulated transaction rather than a real transaction.
      *
      * @param params The params for the smart contract call
-     * @returns The call result
+     * @returns The call transaction
      */
-    ensureToken: async (params: CallParams<AarnaRegistryArgs['obj']['ensure_token()uint64'] | AarnaRegistryArgs['tuple']['ensure_token()uint64']> & SendParams & {onComplete?: OnApplicationComplete.NoOpOC} = {args: []}) => {
-      const result = await this.appClient.send.call(AarnaRegistryParamsFactory.ensureToken(params))
-      return {...result, return: result.return as unknown as (undefined | AarnaRegistryReturns['ensure_token()uint64'])}
+    getListingsBySeller: (params: CallParams<AarnaRegistryArgs['obj']['get_listings_by_seller(address,uint64,uint64)uint64[]'] | AarnaRegistryArgs['tuple']['get_listings_by_seller(address,uint64,uint64)uint64[]']> & {onComplete?: OnApplicationComplete.NoOpOC}) => {
+      return this.appClient.createTransaction.call(AarnaRegistryParamsFactory.getListingsBySeller(params))
     },
 
     /**
-     * Makes a call to the AarnaRegistry smart contract using the `submit_project(string,string,string,string)uint64` ABI method.
+     * Makes a call to the AarnaRegistry smart contract using the `get_stats()(uint64,uint64,uint64,uint64,uint64,uint64,uint64,uint64,uint64,uint64)` ABI method.
      *
-     * Developer submits a new project. Returns the project index.
+     * Every aggregate counter in one call; volume_traded is in microAlgo.
+     * 
+     * This method is a readonly method; calling it with onComplete of NoOp will result in a simulated transaction rather than a real transaction.
      *
      * @param params The params for the smart contract call
-     * @returns The call result
+     * @returns The call transaction
      */
-    submitProject: async (params: CallParams<AarnaRegistryArgs['obj']['submit_project(string,string,string,string)uint64'] | AarnaRegistryArgs['tuple']['submit_project(string,string,string,string)uint64']> & SendParams & {onComplete?: OnApplicationComplete.NoOpOC}) => {
-      const result = await this.appClient.send.call(AarnaRegistryParamsFactory.submitProject(params))
-      return {...result, return: result.return as unknown as (undefined | AarnaRegistryReturns['submit_project(string,string,string,string)uint64'])}
+    getStats: (params: CallParams<AarnaRegistryArgs['obj']['get_stats()(uint64,uint64,uint64,uint64,uint64,uint64,uint64,uint64,uint64,uint64)'] | AarnaRegistryArgs['tuple']['get_stats()(uint64,uint64,uint64,uint64,uint64,uint64,uint64,uint64,uint64,uint64)']> & {onComplete?: OnApplicationComplete.NoOpOC} = {args: []}) => {
+      return this.appClient.createTransaction.call(AarnaRegistryParamsFactory.getStats(params))
     },
 
     /**
-     * Makes a call to the AarnaRegistry smart contract using the `approve_project(uint64,uint64)void` ABI method.
+     * Makes a call to the AarnaRegistry smart contract using the `get_best_offers(uint64)(uint64,uint64,uint64)[]` ABI method.
      *
-     * Validator approves a project and assigns a credit amount.
+    * The `count` cheapest active offers, in price then listing-time order.
+    Capped at MAX_BOOK_PAGE and by the available opcode budget.
+
+     * 
+     * This method is a readonly method; calling it with onComplete of NoOp will result in a simulated transaction rather than a real transaction.
      *
      * @param params The params for the smart contract call
-     * @returns The call result
+     * @returns The call transaction
      */
-    approveProject: async (params: CallParams<AarnaRegistryArgs['obj']['approve_project(uint64,uint64)void'] | AarnaRegistryArgs['tuple']['approve_project(uint64,uint64)void']> & SendParams & {onComplete?: OnApplicationComplete.NoOpOC}) => {
+    getBestOffers: (params: CallParams<AarnaRegistryArgs['obj']['get_best_offers(uint64)(uint64,uint64,uint64)[]'] | AarnaRegistryArgs['tuple']['get_best_offers(uint64)(uint64,uint64,uint64)[]']> & {onComplete?: OnApplicationComplete.NoOpOC}) => {
+      return this.appClient.createTransaction.call(AarnaRegistryParamsFactory.getBestOffers(params))
+    },
+
+    /**
+     * Makes a call to the AarnaRegistry smart contract using the `get_depth(uint64)(uint64,uint64,uint64)[]` ABI method.
+     *
+    * Aggregate depth per price level, cheapest first, for every level priced
+    at or below `price_limit` (up to MAX_BOOK_PAGE levels).
+
+     * 
+     * This method is a readonly method; calling it with onComplete of NoOp will result in a simulated transaction rather than a real transaction.
+     *
+     * @param params The params for the smart contract call
+     * @returns The call transaction
+     */
+    getDepth: (params: CallParams<AarnaRegistryArgs['obj']['get_depth(uint64)(uint64,uint64,uint64)[]'] | AarnaRegistryArgs['tuple']['get_depth(uint64)(uint64,uint64,uint64)[]']> & {onComplete?: OnApplicationComplete.NoOpOC}) => {
+      return this.appClient.createTransaction.call(AarnaRegistryParamsFactory.getDepth(params))
+    },
+
+    /**
+     * Makes a call to the AarnaRegistry smart contract using the `get_price_hint(uint64)uint64` ABI method.
+     *
+    * The `prev_price` for list_for_sale at `price`: the highest listed price
+    below it, or 0. Walks the book, so simulate it with extra budget.
+
+     * 
+     * This method is a readonly method; calling it with onComplete of NoOp will result in a simulated transaction rather than a real transaction.
+     *
+     * @param params The params for the smart contract call
+     * @returns The call transaction
+     */
+    getPriceHint: (params: CallParams<AarnaRegistryArgs['obj']['get_price_hint(uint64)uint64'] | AarnaRegistryArgs['tuple']['get_price_hint(uint64)uint64']> & {onComplete?: OnApplicationComplete.NoOpOC}) => {
+      return this.appClient.createTransaction.call(AarnaRegistryParamsFactory.getPriceHint(params))
+    },
+
+    /**
+     * Makes a call to the AarnaRegistry smart contract using the `get_listing(uint64)(address,uint64,uint64,uint64)` ABI method.
+     *
+     * Closed or never-used ids read back as an all-zero, inactive record.
+     * 
+     * This method is a readonly method; calling it with onComplete of NoOp will result in a simulated transaction rather than a real transaction.
+     *
+     * @param params The params for the smart contract call
+     * @returns The call transaction
+     */
+    getListing: (params: CallParams<AarnaRegistryArgs['obj']['get_listing(uint64)(address,uint64,uint64,uint64)'] | AarnaRegistryArgs['tuple']['get_listing(uint64)(address,uint64,uint64,uint64)']> & {onComplete?: OnApplicationComplete.NoOpOC}) => {
+      return this.appClient.createTransaction.call(AarnaRegistryParamsFactory.getListing(params))
+    },
+
+    /**
+     * Makes a call to the AarnaRegistry smart contract using the `get_listing_count()uint64` ABI method.
+     *
+     * Upper bound on listing ids (ids are recycled), not the open count.
+     * 
+     * This method is a readonly method; calling it with onComplete of NoOp will result in a simulated transaction rather than a real transaction.
+     *
+     * @param params The params for the smart contract call
+     * @returns The call transaction
+     */
+    getListingCount: (params: CallParams<AarnaRegistryArgs['obj']['get_listing_count()uint64'] | AarnaRegistryArgs['tuple']['get_listing_count()uint64']> & {onComplete?: OnApplicationComplete.NoOpOC} = {args: []}) => {
+      return this.appClient.createTransaction.call(AarnaRegistryParamsFactory.getListingCount(params))
+    },
+
+    /**
+     * Makes a call to the AarnaRegistry smart contract using the `get_open_listing_count()uint64` ABI method.
+     * 
+     * This method is a readonly method; calling it with onComplete of NoOp will result in a simulated transaction rather than a real transaction.
+     *
+     * @param params The params for the smart contract call
+     * @returns The call transaction
+     */
+    getOpenListingCount: (params: CallParams<AarnaRegistryArgs['obj']['get_open_listing_count()uint64'] | AarnaRegistryArgs['tuple']['get_open_listing_count()uint64']> & {onComplete?: OnApplicationComplete.NoOpOC} = {args: []}) => {
+      return this.appClient.createTransaction.call(AarnaRegistryParamsFactory.getOpenListingCount(params))
+    },
+
+    /**
+     * Makes a call to the AarnaRegistry smart contract using the `get_projects_page(uint64,uint64)(uint64,(address,string,string,string,string,uint64,uint64)[])` ABI method.
+     *
+    * Returns up to `count` projects from `start`, stopping early when the
+    return-size limit or opcode budget is reached. `next_id` is the cursor for the following call; the scan is done once it equals the project count. Metadata is capped at submission, so any one record fits a page.
+
+     * 
+     * This method is a readonly method; calling it with onComplete of NoOp will result in a simulated transaction rather than a real transaction.
+     *
+     * @param params The params for the smart contract call
+     * @returns The call transaction
+     */
+    getProjectsPage: (params: CallParams<AarnaRegistryArgs['obj']['get_projects_page(uint64,uint64)(uint64,(address,string,string,string,string,uint64,uint64)[])'] | AarnaRegistryArgs['tuple']['get_projects_page(uint64,uint64)(uint64,(address,string,string,string,string,uint64,uint64)[])']> & {onComplete?: OnApplicationComplete.NoOpOC}) => {
+      return this.appClient.createTransaction.call(AarnaRegistryParamsFactory.getProjectsPage(params))
+    },
+
+    /**
+     * Makes a call to the AarnaRegistry smart contract using the `get_listings_page(uint64,uint64)(uint64,(address,uint64,uint64,uint64)[])` ABI method.
+     *
+    * Returns up to `count` listings from `start`, stopping early when the
+    return-size limit or opcode budget is reached. `next_id` is the cursor for the following call; the scan is done once it equals the listing count. Items stay positional: a freed id reads back as an all-zero record.
+
+     * 
+     * This method is a readonly method; calling it with onComplete of NoOp will result in a simulated transaction rather than a real transaction.
+     *
+     * @param params The params for the smart contract call
+     * @returns The call transaction
+     */
+    getListingsPage: (params: CallParams<AarnaRegistryArgs['obj']['get_listings_page(uint64,uint64)(uint64,(address,uint64,uint64,uint64)[])'] | AarnaRegistryArgs['tuple']['get_listings_page(uint64,uint64)(uint64,(address,uint64,uint64,uint64)[])']> & {onComplete?: OnApplicationComplete.NoOpOC}) => {
+      return this.appClient.createTransaction.call(AarnaRegistryParamsFactory.getListingsPage(params))
+    },
+
+  }
+
+  /**
+   * Send calls to the current app
+   */
+  readonly send = {
+    /**
+     * Makes a clear_state call to an existing instance of the AarnaRegistry smart contract.
+     *
+     * @param params The params for the bare (raw) call
+     * @returns The clearState result
+     */
+    clearState: (params?: Expand<AppClientBareCallParams & SendParams>) => {
+      return this.appClient.send.bare.clearState(params)
+    },
+
+    /**
+     * Makes a call to the AarnaRegistry smart contract using the `set_validator(address)void` ABI method.
+     *
+     * Admin assigns a validator address for project reviews.
+     *
+     * @param params The params for the smart contract call
+     * @returns The call result
+     */
+    setValidator: async (params: CallParams<AarnaRegistryArgs['obj']['set_validator(address)void'] | AarnaRegistryArgs['tuple']['set_validator(address)void']> & SendParams & {onComplete?: OnApplicationComplete.NoOpOC}) => {
+      const result = await this.appClient.send.call(AarnaRegistryParamsFactory.setValidator(params))
+      return {...result, return: result.return as unknown as (undefined | AarnaRegistryReturns['set_validator(address)void'])}
+    },
+
+    /**
+     * Makes a call to the AarnaRegistry smart contract using the `transfer_admin(address)void` ABI method.
+     *
+     * Admin transfers ownership to a new admin account.
+     *
+     * @param params The params for the smart contract call
+     * @returns The call result
+     */
+    transferAdmin: async (params: CallParams<AarnaRegistryArgs['obj']['transfer_admin(address)void'] | AarnaRegistryArgs['tuple']['transfer_admin(address)void']> & SendParams & {onComplete?: OnApplicationComplete.NoOpOC}) => {
+      const result = await this.appClient.send.call(AarnaRegistryParamsFactory.transferAdmin(params))
+      return {...result, return: result.return as unknown as (undefined | AarnaRegistryReturns['transfer_admin(address)void'])}
+    },
+
+    /**
+     * Makes a call to the AarnaRegistry smart contract using the `ensure_token()uint64` ABI method.
+     *
+     * Create the AARNA ASA if it doesn't exist. Returns the ASA ID.
+     *
+     * @param params The params for the smart contract call
+     * @returns The call result
+     */
+    ensureToken: async (params: CallParams<AarnaRegistryArgs['obj']['ensure_token()uint64'] | AarnaRegistryArgs['tuple']['ensure_token()uint64']> & SendParams & {onComplete?: OnApplicationComplete.NoOpOC} = {args: []}) => {
+      const result = await this.appClient.send.call(AarnaRegistryParamsFactory.ensureToken(params))
+      return {...result, return: result.return as unknown as (undefined | AarnaRegistryReturns['ensure_token()uint64'])}
+    },
+
+    /**
+     * Makes a call to the AarnaRegistry smart contract using the `submit_project(string,string,string,string)uint64` ABI method.
+     *
+    * Developer submits a new project. Returns the project index.
+    Each evidence bundle (CID) can back only one project, and the encoded metadata is capped at MAX_META_BYTES so the record can always be read.
+
+     *
+     * @param params The params for the smart contract call
+     * @returns The call result
+     */
+    submitProject: async (params: CallParams<AarnaRegistryArgs['obj']['submit_project(string,string,string,string)uint64'] | AarnaRegistryArgs['tuple']['submit_project(string,string,string,string)uint64']> & SendParams & {onComplete?: OnApplicationComplete.NoOpOC}) => {
+      const result = await this.appClient.send.call(AarnaRegistryParamsFactory.submitProject(params))
+      return {...result, return: result.return as unknown as (undefined | AarnaRegistryReturns['submit_project(string,string,string,string)uint64'])}
+    },
+
+    /**
+     * Makes a call to the AarnaRegistry smart contract using the `approve_project(uint64,uint64)void` ABI method.
+     *
+     * Validator approves a project and assigns a credit amount.
+     *
+     * @param params The params for the smart contract call
+     * @returns The call result
+     */
+    approveProject: async (params: CallParams<AarnaRegistryArgs['obj']['approve_project(uint64,uint64)void'] | AarnaRegistryArgs['tuple']['approve_project(uint64,uint64)void']> & SendParams & {onComplete?: OnApplicationComplete.NoOpOC}) => {
       const result = await this.appClient.send.call(AarnaRegistryParamsFactory.approveProject(params))
       return {...result, return: result.return as unknown as (undefined | AarnaRegistryReturns['approve_project(uint64,uint64)void'])}
     },
@@ -1477,6 +2622,21 @@ export class AarnaRegistryClient {
       return {...result, return: result.return as unknown as (undefined | AarnaRegistryReturns['reject_project(uint64)void'])}
     },
 
+    /**
+     * Makes a call to the AarnaRegistry smart contract using the `review_projects_batch((uint64,uint8,uint64)[])uint8[]` ABI method.
+     *
+    * Validator approves / rejects many projects in one call.
+    Ids that are unknown, no longer pending or carry an invalid decision are skipped and reported; the returned codes line up with `decisions`. At most MAX_REVIEW_BATCH decisions, as each applied one logs an event.
+
+     *
+     * @param params The params for the smart contract call
+     * @returns The call result
+     */
+    reviewProjectsBatch: async (params: CallParams<AarnaRegistryArgs['obj']['review_projects_batch((uint64,uint8,uint64)[])uint8[]'] | AarnaRegistryArgs['tuple']['review_projects_batch((uint64,uint8,uint64)[])uint8[]']> & SendParams & {onComplete?: OnApplicationComplete.NoOpOC}) => {
+      const result = await this.appClient.send.call(AarnaRegistryParamsFactory.reviewProjectsBatch(params))
+      return {...result, return: result.return as unknown as (undefined | AarnaRegistryReturns['review_projects_batch((uint64,uint8,uint64)[])uint8[]'])}
+    },
+
     /**
      * Makes a call to the AarnaRegistry smart contract using the `issue_credits(uint64)uint64` ABI method.
      *
@@ -1493,37 +2653,84 @@ export class AarnaRegistryClient {
     },
 
     /**
-     * Makes a call to the AarnaRegistry smart contract using the `list_for_sale(uint64,uint64)uint64` ABI method.
+     * Makes a call to the AarnaRegistry smart contract using the `issue_credits_batch(uint64[])uint64[]` ABI method.
+     *
+    * Validator issues credits for up to MAX_ISSUE_BATCH verified projects in
+    one call. Transfers go out as one inner group with zero fees, so the outer transaction pays for all of them. Unknown or unverified ids are skipped with an amount of 0; the amounts line up with `project_ids`.
+
+     *
+     * @param params The params for the smart contract call
+     * @returns The call result
+     */
+    issueCreditsBatch: async (params: CallParams<AarnaRegistryArgs['obj']['issue_credits_batch(uint64[])uint64[]'] | AarnaRegistryArgs['tuple']['issue_credits_batch(uint64[])uint64[]']> & SendParams & {onComplete?: OnApplicationComplete.NoOpOC}) => {
+      const result = await this.appClient.send.call(AarnaRegistryParamsFactory.issueCreditsBatch(params))
+      return {...result, return: result.return as unknown as (undefined | AarnaRegistryReturns['issue_credits_batch(uint64[])uint64[]'])}
+    },
+
+    /**
+     * Makes a call to the AarnaRegistry smart contract using the `list_for_sale(uint64,uint64,uint64,pay)uint64` ABI method.
      *
     * List AARNA tokens for sale using clawback to escrow.
-    Returns the listing index.
+    `prev_price` is the highest listed price below `price_per_token` (0 if there is none; see get_price_hint), only needed when no listing has that price yet. `deposit` (to the app, from the seller) funds the listing's boxes: LISTING_DEPOSIT, or LISTING_REFUND when a freed id is reused, with any excess refunded. Returns the listing index.
 
      *
      * @param params The params for the smart contract call
      * @returns The call result
      */
-    listForSale: async (params: CallParams<AarnaRegistryArgs['obj']['list_for_sale(uint64,uint64)uint64'] | AarnaRegistryArgs['tuple']['list_for_sale(uint64,uint64)uint64']> & SendParams & {onComplete?: OnApplicationComplete.NoOpOC}) => {
+    listForSale: async (params: CallParams<AarnaRegistryArgs['obj']['list_for_sale(uint64,uint64,uint64,pay)uint64'] | AarnaRegistryArgs['tuple']['list_for_sale(uint64,uint64,uint64,pay)uint64']> & SendParams & {onComplete?: OnApplicationComplete.NoOpOC}) => {
       const result = await this.appClient.send.call(AarnaRegistryParamsFactory.listForSale(params))
-      return {...result, return: result.return as unknown as (undefined | AarnaRegistryReturns['list_for_sale(uint64,uint64)uint64'])}
+      return {...result, return: result.return as unknown as (undefined | AarnaRegistryReturns['list_for_sale(uint64,uint64,uint64,pay)uint64'])}
     },
 
     /**
-     * Makes a call to the AarnaRegistry smart contract using the `buy_listing(uint64,uint64)void` ABI method.
+     * Makes a call to the AarnaRegistry smart contract using the `buy_listing(uint64,pay)void` ABI method.
      *
-     * Buy tokens from a listing. Transfers tokens to buyer and ALGO to seller.
+    * Buy tokens from a listing. Transfers tokens to buyer and ALGO to seller.
+    `payment` (to the app, from the buyer) must cover the cost; any excess is refunded.
+
      *
      * @param params The params for the smart contract call
      * @returns The call result
      */
-    buyListing: async (params: CallParams<AarnaRegistryArgs['obj']['buy_listing(uint64,uint64)void'] | AarnaRegistryArgs['tuple']['buy_listing(uint64,uint64)void']> & SendParams & {onComplete?: OnApplicationComplete.NoOpOC}) => {
+    buyListing: async (params: CallParams<AarnaRegistryArgs['obj']['buy_listing(uint64,pay)void'] | AarnaRegistryArgs['tuple']['buy_listing(uint64,pay)void']> & SendParams & {onComplete?: OnApplicationComplete.NoOpOC}) => {
       const result = await this.appClient.send.call(AarnaRegistryParamsFactory.buyListing(params))
-      return {...result, return: result.return as unknown as (undefined | AarnaRegistryReturns['buy_listing(uint64,uint64)void'])}
+      return {...result, return: result.return as unknown as (undefined | AarnaRegistryReturns['buy_listing(uint64,pay)void'])}
+    },
+
+    /**
+     * Makes a call to the AarnaRegistry smart contract using the `buy_listing_partial(uint64,uint64,pay)void` ABI method.
+     *
+    * Buy part of a listing. The rest stays listed at the same price; the
+    listing closes once its amount reaches zero. Paid for like buy_listing.
+
+     *
+     * @param params The params for the smart contract call
+     * @returns The call result
+     */
+    buyListingPartial: async (params: CallParams<AarnaRegistryArgs['obj']['buy_listing_partial(uint64,uint64,pay)void'] | AarnaRegistryArgs['tuple']['buy_listing_partial(uint64,uint64,pay)void']> & SendParams & {onComplete?: OnApplicationComplete.NoOpOC}) => {
+      const result = await this.appClient.send.call(AarnaRegistryParamsFactory.buyListingPartial(params))
+      return {...result, return: result.return as unknown as (undefined | AarnaRegistryReturns['buy_listing_partial(uint64,uint64,pay)void'])}
+    },
+
+    /**
+     * Makes a call to the AarnaRegistry smart contract using the `sweep_listings(uint64[],uint64,uint64,pay)(uint64,uint64)` ABI method.
+     *
+    * Fill listings in the given order until `max_quantity` tokens are bought
+    or `max_total_price` would be exceeded; the last one may fill partially. Closed or unknown ids are skipped. `payment` (to the app, from the buyer) must cover what is spent. All seller payments (each with the LISTING_REFUND of a listing bought out), a single token transfer to the buyer and the refund of the unspent payment go out as one inner group (at most MAX_SWEEP_FILLS listings). Returns the tokens filled and the ALGO spent.
+
+     *
+     * @param params The params for the smart contract call
+     * @returns The call result
+     */
+    sweepListings: async (params: CallParams<AarnaRegistryArgs['obj']['sweep_listings(uint64[],uint64,uint64,pay)(uint64,uint64)'] | AarnaRegistryArgs['tuple']['sweep_listings(uint64[],uint64,uint64,pay)(uint64,uint64)']> & SendParams & {onComplete?: OnApplicationComplete.NoOpOC}) => {
+      const result = await this.appClient.send.call(AarnaRegistryParamsFactory.sweepListings(params))
+      return {...result, return: result.return as unknown as (undefined | AarnaRegistryReturns['sweep_listings(uint64[],uint64,uint64,pay)(uint64,uint64)'])}
     },
 
     /**
      * Makes a call to the AarnaRegistry smart contract using the `cancel_listing(uint64)void` ABI method.
      *
-     * Seller cancels their listing. Escrowed tokens returned.
+     * Seller cancels their listing. Escrowed tokens and LISTING_REFUND returned.
      *
      * @param params The params for the smart contract call
      * @returns The call result
@@ -1580,61 +2787,270 @@ export class AarnaRegistryClient {
      * @param params The params for the smart contract call
      * @returns The call result
      */
-    getValidator: async (params: CallParams<AarnaRegistryArgs['obj']['get_validator()address'] | AarnaRegistryArgs['tuple']['get_validator()address']> & SendParams & {onComplete?: OnApplicationComplete.NoOpOC} = {args: []}) => {
-      const result = await this.appClient.send.call(AarnaRegistryParamsFactory.getValidator(params))
-      return {...result, return: result.return as unknown as (undefined | AarnaRegistryReturns['get_validator()address'])}
+    getValidator: async (params: CallParams<AarnaRegistryArgs['obj']['get_validator()address'] | AarnaRegistryArgs['tuple']['get_validator()address']> & SendParams & {onComplete?: OnApplicationComplete.NoOpOC} = {args: []}) => {
+      const result = await this.appClient.send.call(AarnaRegistryParamsFactory.getValidator(params))
+      return {...result, return: result.return as unknown as (undefined | AarnaRegistryReturns['get_validator()address'])}
+    },
+
+    /**
+     * Makes a call to the AarnaRegistry smart contract using the `get_total_credits_issued()uint64` ABI method.
+     * 
+     * This method is a readonly method; calling it with onComplete of NoOp will result in a simulated transaction rather than a real transaction.
+     *
+     * @param params The params for the smart contract call
+     * @returns The call result
+     */
+    getTotalCreditsIssued: async (params: CallParams<AarnaRegistryArgs['obj']['get_total_credits_issued()uint64'] | AarnaRegistryArgs['tuple']['get_total_credits_issued()uint64']> & SendParams & {onComplete?: OnApplicationComplete.NoOpOC} = {args: []}) => {
+      const result = await this.appClient.send.call(AarnaRegistryParamsFactory.getTotalCreditsIssued(params))
+      return {...result, return: result.return as unknown as (undefined | AarnaRegistryReturns['get_total_credits_issued()uint64'])}
+    },
+
+    /**
+     * Makes a call to the AarnaRegistry smart contract using the `get_project(uint64)(address,string,string,string,string,uint64,uint64)` ABI method.
+     * 
+     * This method is a readonly method; calling it with onComplete of NoOp will result in a simulated transaction rather than a real transaction.
+     *
+     * @param params The params for the smart contract call
+     * @returns The call result
+     */
+    getProject: async (params: CallParams<AarnaRegistryArgs['obj']['get_project(uint64)(address,string,string,string,string,uint64,uint64)'] | AarnaRegistryArgs['tuple']['get_project(uint64)(address,string,string,string,string,uint64,uint64)']> & SendParams & {onComplete?: OnApplicationComplete.NoOpOC}) => {
+      const result = await this.appClient.send.call(AarnaRegistryParamsFactory.getProject(params))
+      return {...result, return: result.return as unknown as (undefined | AarnaRegistryReturns['get_project(uint64)(address,string,string,string,string,uint64,uint64)'])}
+    },
+
+    /**
+     * Makes a call to the AarnaRegistry smart contract using the `get_project_header(uint64)(address,uint64,uint64)` ABI method.
+     *
+     * Status / credits / submitter only — a single 48-byte box read.
+     * 
+     * This method is a readonly method; calling it with onComplete of NoOp will result in a simulated transaction rather than a real transaction.
+     *
+     * @param params The params for the smart contract call
+     * @returns The call result
+     */
+    getProjectHeader: async (params: CallParams<AarnaRegistryArgs['obj']['get_project_header(uint64)(address,uint64,uint64)'] | AarnaRegistryArgs['tuple']['get_project_header(uint64)(address,uint64,uint64)']> & SendParams & {onComplete?: OnApplicationComplete.NoOpOC}) => {
+      const result = await this.appClient.send.call(AarnaRegistryParamsFactory.getProjectHeader(params))
+      return {...result, return: result.return as unknown as (undefined | AarnaRegistryReturns['get_project_header(uint64)(address,uint64,uint64)'])}
+    },
+
+    /**
+     * Makes a call to the AarnaRegistry smart contract using the `find_project_by_cid(string)uint64` ABI method.
+     *
+     * Id of the project filed with this CID, or NO_ID if there is none.
+     * 
+     * This method is a readonly method; calling it with onComplete of NoOp will result in a simulated transaction rather than a real transaction.
+     *
+     * @param params The params for the smart contract call
+     * @returns The call result
+     */
+    findProjectByCid: async (params: CallParams<AarnaRegistryArgs['obj']['find_project_by_cid(string)uint64'] | AarnaRegistryArgs['tuple']['find_project_by_cid(string)uint64']> & SendParams & {onComplete?: OnApplicationComplete.NoOpOC}) => {
+      const result = await this.appClient.send.call(AarnaRegistryParamsFactory.findProjectByCid(params))
+      return {...result, return: result.return as unknown as (undefined | AarnaRegistryReturns['find_project_by_cid(string)uint64'])}
+    },
+
+    /**
+     * Makes a call to the AarnaRegistry smart contract using the `get_pending_ids(uint64,uint64)uint64[]` ABI method.
+     *
+     * Next `count` pending project ids after `after` (NO_ID = from the start).
+     * 
+     * This method is a readonly method; calling it with onComplete of NoOp will result in a simulated transaction rather than a real transaction.
+     *
+     * @param params The params for the smart contract call
+     * @returns The call result
+     */
+    getPendingIds: async (params: CallParams<AarnaRegistryArgs['obj']['get_pending_ids(uint64,uint64)uint64[]'] | AarnaRegistryArgs['tuple']['get_pending_ids(uint64,uint64)uint64[]']> & SendParams & {onComplete?: OnApplicationComplete.NoOpOC}) => {
+      const result = await this.appClient.send.call(AarnaRegistryParamsFactory.getPendingIds(params))
+      return {...result, return: result.return as unknown as (undefined | AarnaRegistryReturns['get_pending_ids(uint64,uint64)uint64[]'])}
+    },
+
+    /**
+     * Makes a call to the AarnaRegistry smart contract using the `get_verified_ids(uint64,uint64)uint64[]` ABI method.
+     *
+     * Next `count` verified, not yet issued ids after `after` (NO_ID = start).
+     * 
+     * This method is a readonly method; calling it with onComplete of NoOp will result in a simulated transaction rather than a real transaction.
+     *
+     * @param params The params for the smart contract call
+     * @returns The call result
+     */
+    getVerifiedIds: async (params: CallParams<AarnaRegistryArgs['obj']['get_verified_ids(uint64,uint64)uint64[]'] | AarnaRegistryArgs['tuple']['get_verified_ids(uint64,uint64)uint64[]']> & SendParams & {onComplete?: OnApplicationComplete.NoOpOC}) => {
+      const result = await this.appClient.send.call(AarnaRegistryParamsFactory.getVerifiedIds(params))
+      return {...result, return: result.return as unknown as (undefined | AarnaRegistryReturns['get_verified_ids(uint64,uint64)uint64[]'])}
+    },
+
+    /**
+     * Makes a call to the AarnaRegistry smart contract using the `get_projects_by_submitter(address,uint64,uint64)uint64[]` ABI method.
+     *
+     * Project ids filed by `addr`, oldest first, paged by position.
+     * 
+     * This method is a readonly method; calling it with onComplete of NoOp will result in a simulated transaction rather than a real transaction.
+     *
+     * @param params The params for the smart contract call
+     * @returns The call result
+     */
+    getProjectsBySubmitter: async (params: CallParams<AarnaRegistryArgs['obj']['get_projects_by_submitter(address,uint64,uint64)uint64[]'] | AarnaRegistryArgs['tuple']['get_projects_by_submitter(address,uint64,uint64)uint64[]']> & SendParams & {onComplete?: OnApplicationComplete.NoOpOC}) => {
+      const result = await this.appClient.send.call(AarnaRegistryParamsFactory.getProjectsBySubmitter(params))
+      return {...result, return: result.return as unknown as (undefined | AarnaRegistryReturns['get_projects_by_submitter(address,uint64,uint64)uint64[]'])}
+    },
+
+    /**
+     * Makes a call to the AarnaRegistry smart contract using the `get_listings_by_seller(address,uint64,uint64)uint64[]` ABI method.
+     *
+    * Open listing ids of `addr`, paged by position. Closing a listing moves
+    the seller's last id into its slot, so order is not chronological.
+
+     * 
+     * This method is a readonly method; calling it with onComplete of NoOp will result in a simulated transaction rather than a real transaction.
+     *
+     * @param params The params for the smart contract call
+     * @returns The call result
+     */
+    getListingsBySeller: async (params: CallParams<AarnaRegistryArgs['obj']['get_listings_by_seller(address,uint64,uint64)uint64[]'] | AarnaRegistryArgs['tuple']['get_listings_by_seller(address,uint64,uint64)uint64[]']> & SendParams & {onComplete?: OnApplicationComplete.NoOpOC}) => {
+      const result = await this.appClient.send.call(AarnaRegistryParamsFactory.getListingsBySeller(params))
+      return {...result, return: result.return as unknown as (undefined | AarnaRegistryReturns['get_listings_by_seller(address,uint64,uint64)uint64[]'])}
+    },
+
+    /**
+     * Makes a call to the AarnaRegistry smart contract using the `get_stats()(uint64,uint64,uint64,uint64,uint64,uint64,uint64,uint64,uint64,uint64)` ABI method.
+     *
+     * Every aggregate counter in one call; volume_traded is in microAlgo.
+     * 
+     * This method is a readonly method; calling it with onComplete of NoOp will result in a simulated transaction rather than a real transaction.
+     *
+     * @param params The params for the smart contract call
+     * @returns The call result
+     */
+    getStats: async (params: CallParams<AarnaRegistryArgs['obj']['get_stats()(uint64,uint64,uint64,uint64,uint64,uint64,uint64,uint64,uint64,uint64)'] | AarnaRegistryArgs['tuple']['get_stats()(uint64,uint64,uint64,uint64,uint64,uint64,uint64,uint64,uint64,uint64)']> & SendParams & {onComplete?: OnApplicationComplete.NoOpOC} = {args: []}) => {
+      const result = await this.appClient.send.call(AarnaRegistryParamsFactory.getStats(params))
+      return {...result, return: result.return as unknown as (undefined | AarnaRegistryReturns['get_stats()(uint64,uint64,uint64,uint64,uint64,uint64,uint64,uint64,uint64,uint64)'])}
+    },
+
+    /**
+     * Makes a call to the AarnaRegistry smart contract using the `get_best_offers(uint64)(uint64,uint64,uint64)[]` ABI method.
+     *
+    * The `count` cheapest active offers, in price then listing-time order.
+    Capped at MAX_BOOK_PAGE and by the available opcode budget.
+
+     * 
+     * This method is a readonly method; calling it with onComplete of NoOp will result in a simulated transaction rather than a real transaction.
+     *
+     * @param params The params for the smart contract call
+     * @returns The call result
+     */
+    getBestOffers: async (params: CallParams<AarnaRegistryArgs['obj']['get_best_offers(uint64)(uint64,uint64,uint64)[]'] | AarnaRegistryArgs['tuple']['get_best_offers(uint64)(uint64,uint64,uint64)[]']> & SendParams & {onComplete?: OnApplicationComplete.NoOpOC}) => {
+      const result = await this.appClient.send.call(AarnaRegistryParamsFactory.getBestOffers(params))
+      return {...result, return: result.return as unknown as (undefined | AarnaRegistryReturns['get_best_offers(uint64)(uint64,uint64,uint64)[]'])}
+    },
+
+    /**
+     * Makes a call to the AarnaRegistry smart contract using the `get_depth(uint64)(uint64,uint64,uint64)[]` ABI method.
+     *
+    * Aggregate depth per price level, cheapest first, for every level priced
+    at or below `price_limit` (up to MAX_BOOK_PAGE levels).
+
+     * 
+     * This method is a readonly method; calling it with onComplete of NoOp will result in a simulated transaction rather than a real transaction.
+     *
+     * @param params The params for the smart contract call
+     * @returns The call result
+     */
+    getDepth: async (params: CallParams<AarnaRegistryArgs['obj']['get_depth(uint64)(uint64,uint64,uint64)[]'] | AarnaRegistryArgs['tuple']['get_depth(uint64)(uint64,uint64,uint64)[]']> & SendParams & {onComplete?: OnApplicationComplete.NoOpOC}) => {
+      const result = await this.appClient.send.call(AarnaRegistryParamsFactory.getDepth(params))
+      return {...result, return: result.return as unknown as (undefined | AarnaRegistryReturns['get_depth(uint64)(uint64,uint64,uint64)[]'])}
+    },
+
+    /**
+     * Makes a call to the AarnaRegistry smart contract using the `get_price_hint(uint64)uint64` ABI method.
+     *
+    * The `prev_price` for list_for_sale at `price`: the highest listed price
+    below it, or 0. Walks the book, so simulate it with extra budget.
+
+     * 
+     * This method is a readonly method; calling it with onComplete of NoOp will result in a simulated transaction rather than a real transaction.
+     *
+     * @param params The params for the smart contract call
+     * @returns The call result
+     */
+    getPriceHint: async (params: CallParams<AarnaRegistryArgs['obj']['get_price_hint(uint64)uint64'] | AarnaRegistryArgs['tuple']['get_price_hint(uint64)uint64']> & SendParams & {onComplete?: OnApplicationComplete.NoOpOC}) => {
+      const result = await this.appClient.send.call(AarnaRegistryParamsFactory.getPriceHint(params))
+      return {...result, return: result.return as unknown as (undefined | AarnaRegistryReturns['get_price_hint(uint64)uint64'])}
+    },
+
+    /**
+     * Makes a call to the AarnaRegistry smart contract using the `get_listing(uint64)(address,uint64,uint64,uint64)` ABI method.
+     *
+     * Closed or never-used ids read back as an all-zero, inactive record.
+     * 
+     * This method is a readonly method; calling it with onComplete of NoOp will result in a simulated transaction rather than a real transaction.
+     *
+     * @param params The params for the smart contract call
+     * @returns The call result
+     */
+    getListing: async (params: CallParams<AarnaRegistryArgs['obj']['get_listing(uint64)(address,uint64,uint64,uint64)'] | AarnaRegistryArgs['tuple']['get_listing(uint64)(address,uint64,uint64,uint64)']> & SendParams & {onComplete?: OnApplicationComplete.NoOpOC}) => {
+      const result = await this.appClient.send.call(AarnaRegistryParamsFactory.getListing(params))
+      return {...result, return: result.return as unknown as (undefined | AarnaRegistryReturns['get_listing(uint64)(address,uint64,uint64,uint64)'])}
     },
 
     /**
-     * Makes a call to the AarnaRegistry smart contract using the `get_total_credits_issued()uint64` ABI method.
+     * Makes a call to the AarnaRegistry smart contract using the `get_listing_count()uint64` ABI method.
+     *
+     * Upper bound on listing ids (ids are recycled), not the open count.
      * 
      * This method is a readonly method; calling it with onComplete of NoOp will result in a simulated transaction rather than a real transaction.
      *
      * @param params The params for the smart contract call
      * @returns The call result
      */
-    getTotalCreditsIssued: async (params: CallParams<AarnaRegistryArgs['obj']['get_total_credits_issued()uint64'] | AarnaRegistryArgs['tuple']['get_total_credits_issued()uint64']> & SendParams & {onComplete?: OnApplicationComplete.NoOpOC} = {args: []}) => {
-      const result = await this.appClient.send.call(AarnaRegistryParamsFactory.getTotalCreditsIssued(params))
-      return {...result, return: result.return as unknown as (undefined | AarnaRegistryReturns['get_total_credits_issued()uint64'])}
+    getListingCount: async (params: CallParams<AarnaRegistryArgs['obj']['get_listing_count()uint64'] | AarnaRegistryArgs['tuple']['get_listing_count()uint64']> & SendParams & {onComplete?: OnApplicationComplete.NoOpOC} = {args: []}) => {
+      const result = await this.appClient.send.call(AarnaRegistryParamsFactory.getListingCount(params))
+      return {...result, return: result.return as unknown as (undefined | AarnaRegistryReturns['get_listing_count()uint64'])}
     },
 
     /**
-     * Makes a call to the AarnaRegistry smart contract using the `get_project(uint64)(address,string,string,string,string,uint64,uint64)` ABI method.
+     * Makes a call to the AarnaRegistry smart contract using the `get_open_listing_count()uint64` ABI method.
      * 
      * This method is a readonly method; calling it with onComplete of NoOp will result in a simulated transaction rather than a real transaction.
      *
      * @param params The params for the smart contract call
      * @returns The call result
      */
-    getProject: async (params: CallParams<AarnaRegistryArgs['obj']['get_project(uint64)(address,string,string,string,string,uint64,uint64)'] | AarnaRegistryArgs['tuple']['get_project(uint64)(address,string,string,string,string,uint64,uint64)']> & SendParams & {onComplete?: OnApplicationComplete.NoOpOC}) => {
-      const result = await this.appClient.send.call(AarnaRegistryParamsFactory.getProject(params))
-      return {...result, return: result.return as unknown as (undefined | AarnaRegistryReturns['get_project(uint64)(address,string,string,string,string,uint64,uint64)'])}
+    getOpenListingCount: async (params: CallParams<AarnaRegistryArgs['obj']['get_open_listing_count()uint64'] | AarnaRegistryArgs['tuple']['get_open_listing_count()uint64']> & SendParams & {onComplete?: OnApplicationComplete.NoOpOC} = {args: []}) => {
+      const result = await this.appClient.send.call(AarnaRegistryParamsFactory.getOpenListingCount(params))
+      return {...result, return: result.return as unknown as (undefined | AarnaRegistryReturns['get_open_listing_count()uint64'])}
     },
 
     /**
-     * Makes a call to the AarnaRegistry smart contract using the `get_listing(uint64)(address,uint64,uint64,uint64)` ABI method.
+     * Makes a call to the AarnaRegistry smart contract using the `get_projects_page(uint64,uint64)(uint64,(address,string,string,string,string,uint64,uint64)[])` ABI method.
+     *
+    * Returns up to `count` projects from `start`, stopping early when the
+    return-size limit or opcode budget is reached. `next_id` is the cursor for the following call; the scan is done once it equals the project count. Metadata is capped at submission, so any one record fits a page.
+
      * 
      * This method is a readonly method; calling it with onComplete of NoOp will result in a simulated transaction rather than a real transaction.
      *
      * @param params The params for the smart contract call
      * @returns The call result
      */
-    getListing: async (params: CallParams<AarnaRegistryArgs['obj']['get_listing(uint64)(address,uint64,uint64,uint64)'] | AarnaRegistryArgs['tuple']['get_listing(uint64)(address,uint64,uint64,uint64)']> & SendParams & {onComplete?: OnApplicationComplete.NoOpOC}) => {
-      const result = await this.appClient.send.call(AarnaRegistryParamsFactory.getListing(params))
-      return {...result, return: result.return as unknown as (undefined | AarnaRegistryReturns['get_listing(uint64)(address,uint64,uint64,uint64)'])}
+    getProjectsPage: async (params: CallParams<AarnaRegistryArgs['obj']['get_projects_page(uint64,uint64)(uint64,(address,string,string,string,string,uint64,uint64)[])'] | AarnaRegistryArgs['tuple']['get_projects_page(uint64,uint64)(uint64,(address,string,string,string,string,uint64,uint64)[])']> & SendParams & {onComplete?: OnApplicationComplete.NoOpOC}) => {
+      const result = await this.appClient.send.call(AarnaRegistryParamsFactory.getProjectsPage(params))
+      return {...result, return: result.return as unknown as (undefined | AarnaRegistryReturns['get_projects_page(uint64,uint64)(uint64,(address,string,string,string,string,uint64,uint64)[])'])}
     },
 
     /**
-     * Makes a call to the AarnaRegistry smart contract using the `get_listing_count()uint64` ABI method.
+     * Makes a call to the AarnaRegistry smart contract using the `get_listings_page(uint64,uint64)(uint64,(address,uint64,uint64,uint64)[])` ABI method.
+     *
+    * Returns up to `count` listings from `start`, stopping early when the
+    return-size limit or opcode budget is reached. `next_id` is the cursor for the following call; the scan is done once it equals the listing count. Items stay positional: a freed id reads back as an all-zero record.
+
      * 
      * This method is a readonly method; calling it with onComplete of NoOp will result in a simulated transaction rather than a real transaction.
      *
      * @param params The params for the smart contract call
      * @returns The call result
      */
-    getListingCount: async (params: CallParams<AarnaRegistryArgs['obj']['get_listing_count()uint64'] | AarnaRegistryArgs['tuple']['get_listing_count()uint64']> & SendParams & {onComplete?: OnApplicationComplete.NoOpOC} = {args: []}) => {
-      const result = await this.appClient.send.call(AarnaRegistryParamsFactory.getListingCount(params))
-      return {...result, return: result.return as unknown as (undefined | AarnaRegistryReturns['get_listing_count()uint64'])}
+    getListingsPage: async (params: CallParams<AarnaRegistryArgs['obj']['get_listings_page(uint64,uint64)(uint64,(address,uint64,uint64,uint64)[])'] | AarnaRegistryArgs['tuple']['get_listings_page(uint64,uint64)(uint64,(address,uint64,uint64,uint64)[])']> & SendParams & {onComplete?: OnApplicationComplete.NoOpOC}) => {
+      const result = await this.appClient.send.call(AarnaRegistryParamsFactory.getListingsPage(params))
+      return {...result, return: result.return as unknown as (undefined | AarnaRegistryReturns['get_listings_page(uint64,uint64)(uint64,(address,uint64,uint64,uint64)[])'])}
     },
 
   }
@@ -1727,8 +3143,168 @@ export class AarnaRegistryClient {
     return result.return as unknown as AarnaRegistryReturns['get_project(uint64)(address,string,string,string,string,uint64,uint64)']
   }
 
+  /**
+   * Makes a readonly (simulated) call to the AarnaRegistry smart contract using the `get_project_header(uint64)(address,uint64,uint64)` ABI method.
+   *
+   * Status / credits / submitter only — a single 48-byte box read.
+   * 
+   * This method is a readonly method; calling it with onComplete of NoOp will result in a simulated transaction rather than a real transaction.
+   *
+   * @param params The params for the smart contract call
+   * @returns The call result
+   */
+  async getProjectHeader(params: CallParams<AarnaRegistryArgs['obj']['get_project_header(uint64)(address,uint64,uint64)'] | AarnaRegistryArgs['tuple']['get_project_header(uint64)(address,uint64,uint64)']>) {
+    const result = await this.appClient.send.call(AarnaRegistryParamsFactory.getProjectHeader(params))
+    return result.return as unknown as AarnaRegistryReturns['get_project_header(uint64)(address,uint64,uint64)']
+  }
+
+  /**
+   * Makes a readonly (simulated) call to the AarnaRegistry smart contract using the `find_project_by_cid(string)uint64` ABI method.
+   *
+   * Id of the project filed with this CID, or NO_ID if there is none.
+   * 
+   * This method is a readonly method; calling it with onComplete of NoOp will result in a simulated transaction rather than a real transaction.
+   *
+   * @param params The params for the smart contract call
+   * @returns The call result
+   */
+  async findProjectByCid(params: CallParams<AarnaRegistryArgs['obj']['find_project_by_cid(string)uint64'] | AarnaRegistryArgs['tuple']['find_project_by_cid(string)uint64']>) {
+    const result = await this.appClient.send.call(AarnaRegistryParamsFactory.findProjectByCid(params))
+    return result.return as unknown as AarnaRegistryReturns['find_project_by_cid(string)uint64']
+  }
+
+  /**
+   * Makes a readonly (simulated) call to the AarnaRegistry smart contract using the `get_pending_ids(uint64,uint64)uint64[]` ABI method.
+   *
+   * Next `count` pending project ids after `after` (NO_ID = from the start).
+   * 
+   * This method is a readonly method; calling it with onComplete of NoOp will result in a simulated transaction rather than a real transaction.
+   *
+   * @param params The params for the smart contract call
+   * @returns The call result
+   */
+  async getPendingIds(params: CallParams<AarnaRegistryArgs['obj']['get_pending_ids(uint64,uint64)uint64[]'] | AarnaRegistryArgs['tuple']['get_pending_ids(uint64,uint64)uint64[]']>) {
+    const result = await this.appClient.send.call(AarnaRegistryParamsFactory.getPendingIds(params))
+    return result.return as unknown as AarnaRegistryReturns['get_pending_ids(uint64,uint64)uint64[]']
+  }
+
+  /**
+   * Makes a readonly (simulated) call to the AarnaRegistry smart contract using the `get_verified_ids(uint64,uint64)uint64[]` ABI method.
+   *
+   * Next `count` verified, not yet issued ids after `after` (NO_ID = start).
+   * 
+   * This method is a readonly method; calling it with onComplete of NoOp will result in a simulated transaction rather than a real transaction.
+   *
+   * @param params The params for the smart contract call
+   * @returns The call result
+   */
+  async getVerifiedIds(params: CallParams<AarnaRegistryArgs['obj']['get_verified_ids(uint64,uint64)uint64[]'] | AarnaRegistryArgs['tuple']['get_verified_ids(uint64,uint64)uint64[]']>) {
+    const result = await this.appClient.send.call(AarnaRegistryParamsFactory.getVerifiedIds(params))
+    return result.return as unknown as AarnaRegistryReturns['get_verified_ids(uint64,uint64)uint64[]']
+  }
+
+  /**
+   * Makes a readonly (simulated) call to the AarnaRegistry smart contract using the `get_projects_by_submitter(address,uint64,uint64)uint64[]` ABI method.
+   *
+   * Project ids filed by `addr`, oldest first, paged by position.
+   * 
+   * This method is a readonly method; calling it with onComplete of NoOp will result in a simulated transaction rather than a real transaction.
+   *
+   * @param params The params for the smart contract call
+   * @returns The call result
+   */
+  async getProjectsBySubmitter(params: CallParams<AarnaRegistryArgs['obj']['get_projects_by_submitter(address,uint64,uint64)uint64[]'] | AarnaRegistryArgs['tuple']['get_projects_by_submitter(address,uint64,uint64)uint64[]']>) {
+    const result = await this.appClient.send.call(AarnaRegistryParamsFactory.getProjectsBySubmitter(params))
+    return result.return as unknown as AarnaRegistryReturns['get_projects_by_submitter(address,uint64,uint64)uint64[]']
+  }
+
+  /**
+   * Makes a readonly (simulated) call to the AarnaRegistry smart contract using the `get_listings_by_seller(address,uint64,uint64)uint64[]` ABI method.
+   *
+  * Open listing ids of `addr`, paged by position. Closing a listing moves
+  the seller's last id into its slot, so order is not chronological.
+
+   * 
+   * This method is a readonly method; calling it with onComplete of NoOp will result in a simulated transaction rather than a real transaction.
+   *
+   * @param params The params for the smart contract call
+   * @returns The call result
+   */
+  async getListingsBySeller(params: CallParams<AarnaRegistryArgs['obj']['get_listings_by_seller(address,uint64,uint64)uint64[]'] | AarnaRegistryArgs['tuple']['get_listings_by_seller(address,uint64,uint64)uint64[]']>) {
+    const result = await this.appClient.send.call(AarnaRegistryParamsFactory.getListingsBySeller(params))
+    return result.return as unknown as AarnaRegistryReturns['get_listings_by_seller(address,uint64,uint64)uint64[]']
+  }
+
+  /**
+   * Makes a readonly (simulated) call to the AarnaRegistry smart contract using the `get_stats()(uint64,uint64,uint64,uint64,uint64,uint64,uint64,uint64,uint64,uint64)` ABI method.
+   *
+   * Every aggregate counter in one call; volume_traded is in microAlgo.
+   * 
+   * This method is a readonly method; calling it with onComplete of NoOp will result in a simulated transaction rather than a real transaction.
+   *
+   * @param params The params for the smart contract call
+   * @returns The call result
+   */
+  async getStats(params: CallParams<AarnaRegistryArgs['obj']['get_stats()(uint64,uint64,uint64,uint64,uint64,uint64,uint64,uint64,uint64,uint64)'] | AarnaRegistryArgs['tuple']['get_stats()(uint64,uint64,uint64,uint64,uint64,uint64,uint64,uint64,uint64,uint64)']> = {args: []}) {
+    const result = await this.appClient.send.call(AarnaRegistryParamsFactory.getStats(params))
+    return result.return as unknown as AarnaRegistryReturns['get_stats()(uint64,uint64,uint64,uint64,uint64,uint64,uint64,uint64,uint64,uint64)']
+  }
+
+  /**
+   * Makes a readonly (simulated) call to the AarnaRegistry smart contract using the `get_best_offers(uint64)(uint64,uint64,uint64)[]` ABI method.
+   *
+  * The `count` cheapest active offers, in price then listing-time order.
+  Capped at MAX_BOOK_PAGE and by the available opcode budget.
+
+   * 
+   * This method is a readonly method; calling it with onComplete of NoOp will result in a simulated transaction rather than a real transaction.
+   *
+   * @param params The params for the smart contract call
+   * @returns The call result
+   */
+  async getBestOffers(params: CallParams<AarnaRegistryArgs['obj']['get_best_offers(uint64)(uint64,uint64,uint64)[]'] | AarnaRegistryArgs['tuple']['get_best_offers(uint64)(uint64,uint64,uint64)[]']>) {
+    const result = await this.appClient.send.call(AarnaRegistryParamsFactory.getBestOffers(params))
+    return result.return as unknown as AarnaRegistryReturns['get_best_offers(uint64)(uint64,uint64,uint64)[]']
+  }
+
+  /**
+   * Makes a readonly (simulated) call to the AarnaRegistry smart contract using the `get_depth(uint64)(uint64,uint64,uint64)[]` ABI method.
+   *
+  * Aggregate depth per price level, cheapest first, for every level priced
+  at or below `price_limit` (up to MAX_BOOK_PAGE levels).
+
+   * 
+   * This method is a readonly method; calling it with onComplete of NoOp will result in a simulated transaction rather than a real transaction.
+   *
+   * @param params The params for the smart contract call
+   * @returns The call result
+   */
+  async getDepth(params: CallParams<AarnaRegistryArgs['obj']['get_depth(uint64)(uint64,uint64,uint64)[]'] | AarnaRegistryArgs['tuple']['get_depth(uint64)(uint64,uint64,uint64)[]']>) {
+    const result = await this.appClient.send.call(AarnaRegistryParamsFactory.getDepth(params))
+    return result.return as unknown as AarnaRegistryReturns['get_depth(uint64)(uint64,uint64,uint64)[]']
+  }
+
+  /**
+   * Makes a readonly (simulated) call to the AarnaRegistry smart contract using the `get_price_hint(uint64)uint64` ABI method.
+   *
+  * The `prev_price` for list_for_sale at `price`: the highest listed price
+  below it, or 0. Walks the book, so simulate it with extra budget.
+
+   * 
+   * This method is a readonly method; calling it with onComplete of NoOp will result in a simulated transaction rather than a real transaction.
+   *
+   * @param params The params for the smart contract call
+   * @returns The call result
+   */
+  async getPriceHint(params: CallParams<AarnaRegistryArgs['obj']['get_price_hint(uint64)uint64'] | AarnaRegistryArgs['tuple']['get_price_hint(uint64)uint64']>) {
+    const result = await this.appClient.send.call(AarnaRegistryParamsFactory.getPriceHint(params))
+    return result.return as unknown as AarnaRegistryReturns['get_price_hint(uint64)uint64']
+  }
+
   /**
    * Makes a readonly (simulated) call to the AarnaRegistry smart contract using the `get_listing(uint64)(address,uint64,uint64,uint64)` ABI method.
+   *
+   * Closed or never-used ids read back as an all-zero, inactive record.
    * 
    * This method is a readonly method; calling it with onComplete of NoOp will result in a simulated transaction rather than a real transaction.
    *
@@ -1742,6 +3318,8 @@ export class AarnaRegistryClient {
 
   /**
    * Makes a readonly (simulated) call to the AarnaRegistry smart contract using the `get_listing_count()uint64` ABI method.
+   *
+   * Upper bound on listing ids (ids are recycled), not the open count.
    * 
    * This method is a readonly method; calling it with onComplete of NoOp will result in a simulated transaction rather than a real transaction.
    *
@@ -1753,6 +3331,53 @@ export class AarnaRegistryClient {
     return result.return as unknown as AarnaRegistryReturns['get_listing_count()uint64']
   }
 
+  /**
+   * Makes a readonly (simulated) call to the AarnaRegistry smart contract using the `get_open_listing_count()uint64` ABI method.
+   * 
+   * This method is a readonly method; calling it with onComplete of NoOp will result in a simulated transaction rather than a real transaction.
+   *
+   * @param params The params for the smart contract call
+   * @returns The call result
+   */
+  async getOpenListingCount(params: CallParams<AarnaRegistryArgs['obj']['get_open_listing_count()uint64'] | AarnaRegistryArgs['tuple']['get_open_listing_count()uint64']> = {args: []}) {
+    const result = await this.appClient.send.call(AarnaRegistryParamsFactory.getOpenListingCount(params))
+    return result.return as unknown as AarnaRegistryReturns['get_open_listing_count()uint64']
+  }
+
+  /**
+   * Makes a readonly (simulated) call to the AarnaRegistry smart contract using the `get_projects_page(uint64,uint64)(uint64,(address,string,string,string,string,uint64,uint64)[])` ABI method.
+   *
+  * Returns up to `count` projects from `start`, stopping early when the
+  return-size limit or opcode budget is reached. `next_id` is the cursor for the following call; the scan is done once it equals the project count. Metadata is capped at submission, so any one record fits a page.
+
+   * 
+   * This method is a readonly method; calling it with onComplete of NoOp will result in a simulated transaction rather than a real transaction.
+   *
+   * @param params The params for the smart contract call
+   * @returns The call result
+   */
+  async getProjectsPage(params: CallParams<AarnaRegistryArgs['obj']['get_projects_page(uint64,uint64)(uint64,(address,string,string,string,string,uint64,uint64)[])'] | AarnaRegistryArgs['tuple']['get_projects_page(uint64,uint64)(uint64,(address,string,string,string,string,uint64,uint64)[])']>) {
+    const result = await this.appClient.send.call(AarnaRegistryParamsFactory.getProjectsPage(params))
+    return result.return as unknown as AarnaRegistryReturns['get_projects_page(uint64,uint64)(uint64,(address,string,string,string,string,uint64,uint64)[])']
+  }
+
+  /**
+   * Makes a readonly (simulated) call to the AarnaRegistry smart contract using the `get_listings_page(uint64,uint64)(uint64,(address,uint64,uint64,uint64)[])` ABI method.
+   *
+  * Returns up to `count` listings from `start`, stopping early when the
+  return-size limit or opcode budget is reached. `next_id` is the cursor for the following call; the scan is done once it equals the listing count. Items stay positional: a freed id reads back as an all-zero record.
+
+   * 
+   * This method is a readonly method; calling it with onComplete of NoOp will result in a simulated transaction rather than a real transaction.
+   *
+   * @param params The params for the smart contract call
+   * @returns The call result
+   */
+  async getListingsPage(params: CallParams<AarnaRegistryArgs['obj']['get_listings_page(uint64,uint64)(uint64,(address,uint64,uint64,uint64)[])'] | AarnaRegistryArgs['tuple']['get_listings_page(uint64,uint64)(uint64,(address,uint64,uint64,uint64)[])']>) {
+    const result = await this.appClient.send.call(AarnaRegistryParamsFactory.getListingsPage(params))
+    return result.return as unknown as AarnaRegistryReturns['get_listings_page(uint64,uint64)(uint64,(address,uint64,uint64,uint64)[])']
+  }
+
   /**
    * Methods to access state for the current AarnaRegistry app
    */
@@ -1773,6 +3398,21 @@ export class AarnaRegistryClient {
           projectCount: result.project_count,
           totalCreditsIssued: result.total_credits_issued,
           listingCount: result.listing_count,
+          pendingHead: result.pending_head,
+          pendingTail: result.pending_tail,
+          verifiedHead: result.verified_head,
+          verifiedTail: result.verified_tail,
+          bestPrice: result.best_price,
+          freeListingHead: result.free_listing_head,
+          freeListingPushes: result.free_listing_pushes,
+          openListingCount: result.open_listing_count,
+          pendingCount: result.pending_count,
+          verifiedCount: result.verified_count,
+          rejectedCount: result.rejected_count,
+          issuedCount: result.issued_count,
+          escrowedTokens: result.escrowed_tokens,
+          tokensTraded: result.tokens_traded,
+          volumeTraded: result.volume_traded,
         }
       },
       /**
@@ -1792,51 +3432,215 @@ export class AarnaRegistryClient {
        */
       projectCount: async (): Promise<bigint | undefined> => { return (await this.appClient.state.global.getValue("project_count")) as bigint | undefined },
       /**
-       * Get the current value of the total_credits_issued key in global state
+       * Get the current value of the total_credits_issued key in global state
+       */
+      totalCreditsIssued: async (): Promise<bigint | undefined> => { return (await this.appClient.state.global.getValue("total_credits_issued")) as bigint | undefined },
+      /**
+       * Get the current value of the listing_count key in global state
+       */
+      listingCount: async (): Promise<bigint | undefined> => { return (await this.appClient.state.global.getValue("listing_count")) as bigint | undefined },
+      /**
+       * Get the current value of the pending_head key in global state
+       */
+      pendingHead: async (): Promise<bigint | undefined> => { return (await this.appClient.state.global.getValue("pending_head")) as bigint | undefined },
+      /**
+       * Get the current value of the pending_tail key in global state
+       */
+      pendingTail: async (): Promise<bigint | undefined> => { return (await this.appClient.state.global.getValue("pending_tail")) as bigint | undefined },
+      /**
+       * Get the current value of the verified_head key in global state
+       */
+      verifiedHead: async (): Promise<bigint | undefined> => { return (await this.appClient.state.global.getValue("verified_head")) as bigint | undefined },
+      /**
+       * Get the current value of the verified_tail key in global state
+       */
+      verifiedTail: async (): Promise<bigint | undefined> => { return (await this.appClient.state.global.getValue("verified_tail")) as bigint | undefined },
+      /**
+       * Get the current value of the best_price key in global state
+       */
+      bestPrice: async (): Promise<bigint | undefined> => { return (await this.appClient.state.global.getValue("best_price")) as bigint | undefined },
+      /**
+       * Get the current value of the free_listing_head key in global state
+       */
+      freeListingHead: async (): Promise<bigint | undefined> => { return (await this.appClient.state.global.getValue("free_listing_head")) as bigint | undefined },
+      /**
+       * Get the current value of the free_listing_pushes key in global state
+       */
+      freeListingPushes: async (): Promise<bigint | undefined> => { return (await this.appClient.state.global.getValue("free_listing_pushes")) as bigint | undefined },
+      /**
+       * Get the current value of the open_listing_count key in global state
+       */
+      openListingCount: async (): Promise<bigint | undefined> => { return (await this.appClient.state.global.getValue("open_listing_count")) as bigint | undefined },
+      /**
+       * Get the current value of the pending_count key in global state
+       */
+      pendingCount: async (): Promise<bigint | undefined> => { return (await this.appClient.state.global.getValue("pending_count")) as bigint | undefined },
+      /**
+       * Get the current value of the verified_count key in global state
+       */
+      verifiedCount: async (): Promise<bigint | undefined> => { return (await this.appClient.state.global.getValue("verified_count")) as bigint | undefined },
+      /**
+       * Get the current value of the rejected_count key in global state
+       */
+      rejectedCount: async (): Promise<bigint | undefined> => { return (await this.appClient.state.global.getValue("rejected_count")) as bigint | undefined },
+      /**
+       * Get the current value of the issued_count key in global state
+       */
+      issuedCount: async (): Promise<bigint | undefined> => { return (await this.appClient.state.global.getValue("issued_count")) as bigint | undefined },
+      /**
+       * Get the current value of the escrowed_tokens key in global state
+       */
+      escrowedTokens: async (): Promise<bigint | undefined> => { return (await this.appClient.state.global.getValue("escrowed_tokens")) as bigint | undefined },
+      /**
+       * Get the current value of the tokens_traded key in global state
+       */
+      tokensTraded: async (): Promise<bigint | undefined> => { return (await this.appClient.state.global.getValue("tokens_traded")) as bigint | undefined },
+      /**
+       * Get the current value of the volume_traded key in global state
+       */
+      volumeTraded: async (): Promise<bigint | undefined> => { return (await this.appClient.state.global.getValue("volume_traded")) as bigint | undefined },
+    },
+    /**
+     * Methods to access box state for the current AarnaRegistry app
+     */
+    box: {
+      /**
+       * Get all current keyed values from box state
+       */
+      getAll: async (): Promise<Partial<Expand<BoxKeysState>>> => {
+        const result = await this.appClient.state.box.getAll()
+        return {
+        }
+      },
+      /**
+       * Get values from the project_headers map in box state
+       */
+      projectHeaders: {
+        /**
+         * Get all current values of the project_headers map in box state
+         */
+        getMap: async (): Promise<Map<bigint, ProjectHeader>> => { return (await this.appClient.state.box.getMap("project_headers")) as Map<bigint, ProjectHeader> },
+        /**
+         * Get a current value of the project_headers map by key from box state
+         */
+        value: async (key: bigint | number): Promise<ProjectHeader | undefined> => { return await this.appClient.state.box.getMapValue("project_headers", key) as ProjectHeader | undefined },
+      },
+      /**
+       * Get values from the project_meta map in box state
+       */
+      projectMeta: {
+        /**
+         * Get all current values of the project_meta map in box state
+         */
+        getMap: async (): Promise<Map<bigint, ProjectMeta>> => { return (await this.appClient.state.box.getMap("project_meta")) as Map<bigint, ProjectMeta> },
+        /**
+         * Get a current value of the project_meta map by key from box state
+         */
+        value: async (key: bigint | number): Promise<ProjectMeta | undefined> => { return await this.appClient.state.box.getMapValue("project_meta", key) as ProjectMeta | undefined },
+      },
+      /**
+       * Get values from the queue_links map in box state
+       */
+      queueLinks: {
+        /**
+         * Get all current values of the queue_links map in box state
+         */
+        getMap: async (): Promise<Map<bigint, QueueLink>> => { return (await this.appClient.state.box.getMap("queue_links")) as Map<bigint, QueueLink> },
+        /**
+         * Get a current value of the queue_links map by key from box state
+         */
+        value: async (key: bigint | number): Promise<QueueLink | undefined> => { return await this.appClient.state.box.getMapValue("queue_links", key) as QueueLink | undefined },
+      },
+      /**
+       * Get values from the listings map in box state
+       */
+      listings: {
+        /**
+         * Get all current values of the listings map in box state
+         */
+        getMap: async (): Promise<Map<bigint, ListingRecord>> => { return (await this.appClient.state.box.getMap("listings")) as Map<bigint, ListingRecord> },
+        /**
+         * Get a current value of the listings map by key from box state
+         */
+        value: async (key: bigint | number): Promise<ListingRecord | undefined> => { return await this.appClient.state.box.getMapValue("listings", key) as ListingRecord | undefined },
+      },
+      /**
+       * Get values from the free_listings map in box state
+       */
+      freeListings: {
+        /**
+         * Get all current values of the free_listings map in box state
+         */
+        getMap: async (): Promise<Map<bigint, FreeLink>> => { return (await this.appClient.state.box.getMap("free_listings")) as Map<bigint, FreeLink> },
+        /**
+         * Get a current value of the free_listings map by key from box state
+         */
+        value: async (key: bigint | number): Promise<FreeLink | undefined> => { return await this.appClient.state.box.getMapValue("free_listings", key) as FreeLink | undefined },
+      },
+      /**
+       * Get values from the price_levels map in box state
        */
-      totalCreditsIssued: async (): Promise<bigint | undefined> => { return (await this.appClient.state.global.getValue("total_credits_issued")) as bigint | undefined },
+      priceLevels: {
+        /**
+         * Get all current values of the price_levels map in box state
+         */
+        getMap: async (): Promise<Map<bigint, PriceLevel>> => { return (await this.appClient.state.box.getMap("price_levels")) as Map<bigint, PriceLevel> },
+        /**
+         * Get a current value of the price_levels map by key from box state
+         */
+        value: async (key: bigint | number): Promise<PriceLevel | undefined> => { return await this.appClient.state.box.getMapValue("price_levels", key) as PriceLevel | undefined },
+      },
       /**
-       * Get the current value of the listing_count key in global state
+       * Get values from the listing_links map in box state
        */
-      listingCount: async (): Promise<bigint | undefined> => { return (await this.appClient.state.global.getValue("listing_count")) as bigint | undefined },
-    },
-    /**
-     * Methods to access box state for the current AarnaRegistry app
-     */
-    box: {
+      listingLinks: {
+        /**
+         * Get all current values of the listing_links map in box state
+         */
+        getMap: async (): Promise<Map<bigint, ListingLink>> => { return (await this.appClient.state.box.getMap("listing_links")) as Map<bigint, ListingLink> },
+        /**
+         * Get a current value of the listing_links map by key from box state
+         */
+        value: async (key: bigint | number): Promise<ListingLink | undefined> => { return await this.appClient.state.box.getMapValue("listing_links", key) as ListingLink | undefined },
+      },
       /**
-       * Get all current keyed values from box state
+       * Get values from the submitter_index map in box state
        */
-      getAll: async (): Promise<Partial<Expand<BoxKeysState>>> => {
-        const result = await this.appClient.state.box.getAll()
-        return {
-        }
+      submitterIndex: {
+        /**
+         * Get all current values of the submitter_index map in box state
+         */
+        getMap: async (): Promise<Map<string, bigint>> => { return (await this.appClient.state.box.getMap("submitter_index")) as Map<string, bigint> },
+        /**
+         * Get a current value of the submitter_index map by key from box state
+         */
+        value: async (key: string): Promise<bigint | undefined> => { return await this.appClient.state.box.getMapValue("submitter_index", key) as bigint | undefined },
       },
       /**
-       * Get values from the projects map in box state
+       * Get values from the seller_index map in box state
        */
-      projects: {
+      sellerIndex: {
         /**
-         * Get all current values of the projects map in box state
+         * Get all current values of the seller_index map in box state
          */
-        getMap: async (): Promise<Map<bigint, ProjectRecord>> => { return (await this.appClient.state.box.getMap("projects")) as Map<bigint, ProjectRecord> },
+        getMap: async (): Promise<Map<string, bigint>> => { return (await this.appClient.state.box.getMap("seller_index")) as Map<string, bigint> },
         /**
-         * Get a current value of the projects map by key from box state
+         * Get a current value of the seller_index map by key from box state
          */
-        value: async (key: bigint | number): Promise<ProjectRecord | undefined> => { return await this.appClient.state.box.getMapValue("projects", key) as ProjectRecord | undefined },
+        value: async (key: string): Promise<bigint | undefined> => { return await this.appClient.state.box.getMapValue("seller_index", key) as bigint | undefined },
       },
       /**
-       * Get values from the listings map in box state
+       * Get values from the cid_index map in box state
        */
-      listings: {
+      cidIndex: {
         /**
-         * Get all current values of the listings map in box state
+         * Get all current values of the cid_index map in box state
          */
-        getMap: async (): Promise<Map<bigint, ListingRecord>> => { return (await this.appClient.state.box.getMap("listings")) as Map<bigint, ListingRecord> },
+        getMap: async (): Promise<Map<Uint8Array, bigint>> => { return (await this.appClient.state.box.getMap("cid_index")) as Map<Uint8Array, bigint> },
         /**
-         * Get a current value of the listings map by key from box state
+         * Get a current value of the cid_index map by key from box state
          */
-        value: async (key: bigint | number): Promise<ListingRecord | undefined> => { return await this.appClient.state.box.getMapValue("listings", key) as ListingRecord | undefined },
+        value: async (key: Uint8Array): Promise<bigint | undefined> => { return await this.appClient.state.box.getMapValue("cid_index", key) as bigint | undefined },
       },
     },
   }
@@ -1895,6 +3699,14 @@ export class AarnaRegistryClient {
         resultMappers.push(undefined)
         return this
       },
+      /**
+       * Add a review_projects_batch((uint64,uint8,uint64)[])uint8[] method call against the AarnaRegistry contract
+       */
+      reviewProjectsBatch(params: CallParams<AarnaRegistryArgs['obj']['review_projects_batch((uint64,uint8,uint64)[])uint8[]'] | AarnaRegistryArgs['tuple']['review_projects_batch((uint64,uint8,uint64)[])uint8[]']> & {onComplete?: OnApplicationComplete.NoOpOC}) {
+        promiseChain = promiseChain.then(async () => composer.addAppCallMethodCall(await client.params.reviewProjectsBatch(params)))
+        resultMappers.push((v) => client.decodeReturnValue('review_projects_batch((uint64,uint8,uint64)[])uint8[]', v))
+        return this
+      },
       /**
        * Add a issue_credits(uint64)uint64 method call against the AarnaRegistry contract
        */
@@ -1904,21 +3716,45 @@ export class AarnaRegistryClient {
         return this
       },
       /**
-       * Add a list_for_sale(uint64,uint64)uint64 method call against the AarnaRegistry contract
+       * Add a issue_credits_batch(uint64[])uint64[] method call against the AarnaRegistry contract
+       */
+      issueCreditsBatch(params: CallParams<AarnaRegistryArgs['obj']['issue_credits_batch(uint64[])uint64[]'] | AarnaRegistryArgs['tuple']['issue_credits_batch(uint64[])uint64[]']> & {onComplete?: OnApplicationComplete.NoOpOC}) {
+        promiseChain = promiseChain.then(async () => composer.addAppCallMethodCall(await client.params.issueCreditsBatch(params)))
+        resultMappers.push((v) => client.decodeReturnValue('issue_credits_batch(uint64[])uint64[]', v))
+        return this
+      },
+      /**
+       * Add a list_for_sale(uint64,uint64,uint64,pay)uint64 method call against the AarnaRegistry contract
        */
-      listForSale(params: CallParams<AarnaRegistryArgs['obj']['list_for_sale(uint64,uint64)uint64'] | AarnaRegistryArgs['tuple']['list_for_sale(uint64,uint64)uint64']> & {onComplete?: OnApplicationComplete.NoOpOC}) {
+      listForSale(params: CallParams<AarnaRegistryArgs['obj']['list_for_sale(uint64,uint64,uint64,pay)uint64'] | AarnaRegistryArgs['tuple']['list_for_sale(uint64,uint64,uint64,pay)uint64']> & {onComplete?: OnApplicationComplete.NoOpOC}) {
         promiseChain = promiseChain.then(async () => composer.addAppCallMethodCall(await client.params.listForSale(params)))
-        resultMappers.push((v) => client.decodeReturnValue('list_for_sale(uint64,uint64)uint64', v))
+        resultMappers.push((v) => client.decodeReturnValue('list_for_sale(uint64,uint64,uint64,pay)uint64', v))
         return this
       },
       /**
-       * Add a buy_listing(uint64,uint64)void method call against the AarnaRegistry contract
+       * Add a buy_listing(uint64,pay)void method call against the AarnaRegistry contract
        */
-      buyListing(params: CallParams<AarnaRegistryArgs['obj']['buy_listing(uint64,uint64)void'] | AarnaRegistryArgs['tuple']['buy_listing(uint64,uint64)void']> & {onComplete?: OnApplicationComplete.NoOpOC}) {
+      buyListing(params: CallParams<AarnaRegistryArgs['obj']['buy_listing(uint64,pay)void'] | AarnaRegistryArgs['tuple']['buy_listing(uint64,pay)void']> & {onComplete?: OnApplicationComplete.NoOpOC}) {
         promiseChain = promiseChain.then(async () => composer.addAppCallMethodCall(await client.params.buyListing(params)))
         resultMappers.push(undefined)
         return this
       },
+      /**
+       * Add a buy_listing_partial(uint64,uint64,pay)void method call against the AarnaRegistry contract
+       */
+      buyListingPartial(params: CallParams<AarnaRegistryArgs['obj']['buy_listing_partial(uint64,uint64,pay)void'] | AarnaRegistryArgs['tuple']['buy_listing_partial(uint64,uint64,pay)void']> & {onComplete?: OnApplicationComplete.NoOpOC}) {
+        promiseChain = promiseChain.then(async () => composer.addAppCallMethodCall(await client.params.buyListingPartial(params)))
+        resultMappers.push(undefined)
+        return this
+      },
+      /**
+       * Add a sweep_listings(uint64[],uint64,uint64,pay)(uint64,uint64) method call against the AarnaRegistry contract
+       */
+      sweepListings(params: CallParams<AarnaRegistryArgs['obj']['sweep_listings(uint64[],uint64,uint64,pay)(uint64,uint64)'] | AarnaRegistryArgs['tuple']['sweep_listings(uint64[],uint64,uint64,pay)(uint64,uint64)']> & {onComplete?: OnApplicationComplete.NoOpOC}) {
+        promiseChain = promiseChain.then(async () => composer.addAppCallMethodCall(await client.params.sweepListings(params)))
+        resultMappers.push((v) => client.decodeReturnValue('sweep_listings(uint64[],uint64,uint64,pay)(uint64,uint64)', v))
+        return this
+      },
       /**
        * Add a cancel_listing(uint64)void method call against the AarnaRegistry contract
        */
@@ -1975,6 +3811,86 @@ export class AarnaRegistryClient {
         resultMappers.push((v) => client.decodeReturnValue('get_project(uint64)(address,string,string,string,string,uint64,uint64)', v))
         return this
       },
+      /**
+       * Add a get_project_header(uint64)(address,uint64,uint64) method call against the AarnaRegistry contract
+       */
+      getProjectHeader(params: CallParams<AarnaRegistryArgs['obj']['get_project_header(uint64)(address,uint64,uint64)'] | AarnaRegistryArgs['tuple']['get_project_header(uint64)(address,uint64,uint64)']> & {onComplete?: OnApplicationComplete.NoOpOC}) {
+        promiseChain = promiseChain.then(async () => composer.addAppCallMethodCall(await client.params.getProjectHeader(params)))
+        resultMappers.push((v) => client.decodeReturnValue('get_project_header(uint64)(address,uint64,uint64)', v))
+        return this
+      },
+      /**
+       * Add a find_project_by_cid(string)uint64 method call against the AarnaRegistry contract
+       */
+      findProjectByCid(params: CallParams<AarnaRegistryArgs['obj']['find_project_by_cid(string)uint64'] | AarnaRegistryArgs['tuple']['find_project_by_cid(string)uint64']> & {onComplete?: OnApplicationComplete.NoOpOC}) {
+        promiseChain = promiseChain.then(async () => composer.addAppCallMethodCall(await client.params.findProjectByCid(params)))
+        resultMappers.push((v) => client.decodeReturnValue('find_project_by_cid(string)uint64', v))
+        return this
+      },
+      /**
+       * Add a get_pending_ids(uint64,uint64)uint64[] method call against the AarnaRegistry contract
+       */
+      getPendingIds(params: CallParams<AarnaRegistryArgs['obj']['get_pending_ids(uint64,uint64)uint64[]'] | AarnaRegistryArgs['tuple']['get_pending_ids(uint64,uint64)uint64[]']> & {onComplete?: OnApplicationComplete.NoOpOC}) {
+        promiseChain = promiseChain.then(async () => composer.addAppCallMethodCall(await client.params.getPendingIds(params)))
+        resultMappers.push((v) => client.decodeReturnValue('get_pending_ids(uint64,uint64)uint64[]', v))
+        return this
+      },
+      /**
+       * Add a get_verified_ids(uint64,uint64)uint64[] method call against the AarnaRegistry contract
+       */
+      getVerifiedIds(params: CallParams<AarnaRegistryArgs['obj']['get_verified_ids(uint64,uint64)uint64[]'] | AarnaRegistryArgs['tuple']['get_verified_ids(uint64,uint64)uint64[]']> & {onComplete?: OnApplicationComplete.NoOpOC}) {
+        promiseChain = promiseChain.then(async () => composer.addAppCallMethodCall(await client.params.getVerifiedIds(params)))
+        resultMappers.push((v) => client.decodeReturnValue('get_verified_ids(uint64,uint64)uint64[]', v))
+        return this
+      },
+      /**
+       * Add a get_projects_by_submitter(address,uint64,uint64)uint64[] method call against the AarnaRegistry contract
+       */
+      getProjectsBySubmitter(params: CallParams<AarnaRegistryArgs['obj']['get_projects_by_submitter(address,uint64,uint64)uint64[]'] | AarnaRegistryArgs['tuple']['get_projects_by_submitter(address,uint64,uint64)uint64[]']> & {onComplete?: OnApplicationComplete.NoOpOC}) {
+        promiseChain = promiseChain.then(async () => composer.addAppCallMethodCall(await client.params.getProjectsBySubmitter(params)))
+        resultMappers.push((v) => client.decodeReturnValue('get_projects_by_submitter(address,uint64,uint64)uint64[]', v))
+        return this
+      },
+      /**
+       * Add a get_listings_by_seller(address,uint64,uint64)uint64[] method call against the AarnaRegistry contract
+       */
+      getListingsBySeller(params: CallParams<AarnaRegistryArgs['obj']['get_listings_by_seller(address,uint64,uint64)uint64[]'] | AarnaRegistryArgs['tuple']['get_listings_by_seller(address,uint64,uint64)uint64[]']> & {onComplete?: OnApplicationComplete.NoOpOC}) {
+        promiseChain = promiseChain.then(async () => composer.addAppCallMethodCall(await client.params.getListingsBySeller(params)))
+        resultMappers.push((v) => client.decodeReturnValue('get_listings_by_seller(address,uint64,uint64)uint64[]', v))
+        return this
+      },
+      /**
+       * Add a get_stats()(uint64,uint64,uint64,uint64,uint64,uint64,uint64,uint64,uint64,uint64) method call against the AarnaRegistry contract
+       */
+      getStats(params: CallParams<AarnaRegistryArgs['obj']['get_stats()(uint64,uint64,uint64,uint64,uint64,uint64,uint64,uint64,uint64,uint64)'] | AarnaRegistryArgs['tuple']['get_stats()(uint64,uint64,uint64,uint64,uint64,uint64,uint64,uint64,uint64,uint64)']> & {onComplete?: OnApplicationComplete.NoOpOC}) {
+        promiseChain = promiseChain.then(async () => composer.addAppCallMethodCall(await client.params.getStats(params)))
+        resultMappers.push((v) => client.decodeReturnValue('get_stats()(uint64,uint64,uint64,uint64,uint64,uint64,uint64,uint64,uint64,uint64)', v))
+        return this
+      },
+      /**
+       * Add a get_best_offers(uint64)(uint64,uint64,uint64)[] method call against the AarnaRegistry contract
+       */
+      getBestOffers(params: CallParams<AarnaRegistryArgs['obj']['get_best_offers(uint64)(uint64,uint64,uint64)[]'] | AarnaRegistryArgs['tuple']['get_best_offers(uint64)(uint64,uint64,uint64)[]']> & {onComplete?: OnApplicationComplete.NoOpOC}) {
+        promiseChain = promiseChain.then(async () => composer.addAppCallMethodCall(await client.params.getBestOffers(params)))
+        resultMappers.push((v) => client.decodeReturnValue('get_best_offers(uint64)(uint64,uint64,uint64)[]', v))
+        return this
+      },
+      /**
+       * Add a get_depth(uint64)(uint64,uint64,uint64)[] method call against the AarnaRegistry contract
+       */
+      getDepth(params: CallParams<AarnaRegistryArgs['obj']['get_depth(uint64)(uint64,uint64,uint64)[]'] | AarnaRegistryArgs['tuple']['get_depth(uint64)(uint64,uint64,uint64)[]']> & {onComplete?: OnApplicationComplete.NoOpOC}) {
+        promiseChain = promiseChain.then(async () => composer.addAppCallMethodCall(await client.params.getDepth(params)))
+        resultMappers.push((v) => client.decodeReturnValue('get_depth(uint64)(uint64,uint64,uint64)[]', v))
+        return this
+      },
+      /**
+       * Add a get_price_hint(uint64)uint64 method call against the AarnaRegistry contract
+       */
+      getPriceHint(params: CallParams<AarnaRegistryArgs['obj']['get_price_hint(uint64)uint64'] | AarnaRegistryArgs['tuple']['get_price_hint(uint64)uint64']> & {onComplete?: OnApplicationComplete.NoOpOC}) {
+        promiseChain = promiseChain.then(async () => composer.addAppCallMethodCall(await client.params.getPriceHint(params)))
+        resultMappers.push((v) => client.decodeReturnValue('get_price_hint(uint64)uint64', v))
+        return this
+      },
       /**
        * Add a get_listing(uint64)(address,uint64,uint64,uint64) method call against the AarnaRegistry contract
        */
@@ -1991,6 +3907,30 @@ export class AarnaRegistryClient {
         resultMappers.push((v) => client.decodeReturnValue('get_listing_count()uint64', v))
         return this
       },
+      /**
+       * Add a get_open_listing_count()uint64 method call against the AarnaRegistry contract
+       */
+      getOpenListingCount(params: CallParams<AarnaRegistryArgs['obj']['get_open_listing_count()uint64'] | AarnaRegistryArgs['tuple']['get_open_listing_count()uint64']> & {onComplete?: OnApplicationComplete.NoOpOC}) {
+        promiseChain = promiseChain.then(async () => composer.addAppCallMethodCall(await client.params.getOpenListingCount(params)))
+        resultMappers.push((v) => client.decodeReturnValue('get_open_listing_count()uint64', v))
+        return this
+      },
+      /**
+       * Add a get_projects_page(uint64,uint64)(uint64,(address,string,string,string,string,uint64,uint64)[]) method call against the AarnaRegistry contract
+       */
+      getProjectsPage(params: CallParams<AarnaRegistryArgs['obj']['get_projects_page(uint64,uint64)(uint64,(address,string,string,string,string,uint64,uint64)[])'] | AarnaRegistryArgs['tuple']['get_projects_page(uint64,uint64)(uint64,(address,string,string,string,string,uint64,uint64)[])']> & {onComplete?: OnApplicationComplete.NoOpOC}) {
+        promiseChain = promiseChain.then(async () => composer.addAppCallMethodCall(await client.params.getProjectsPage(params)))
+        resultMappers.push((v) => client.decodeReturnValue('get_projects_page(uint64,uint64)(uint64,(address,string,string,string,string,uint64,uint64)[])', v))
+        return this
+      },
+      /**
+       * Add a get_listings_page(uint64,uint64)(uint64,(address,uint64,uint64,uint64)[]) method call against the AarnaRegistry contract
+       */
+      getListingsPage(params: CallParams<AarnaRegistryArgs['obj']['get_listings_page(uint64,uint64)(uint64,(address,uint64,uint64,uint64)[])'] | AarnaRegistryArgs['tuple']['get_listings_page(uint64,uint64)(uint64,(address,uint64,uint64,uint64)[])']> & {onComplete?: OnApplicationComplete.NoOpOC}) {
+        promiseChain = promiseChain.then(async () => composer.addAppCallMethodCall(await client.params.getListingsPage(params)))
+        resultMappers.push((v) => client.decodeReturnValue('get_listings_page(uint64,uint64)(uint64,(address,uint64,uint64,uint64)[])', v))
+        return this
+      },
       /**
        * Add a clear state call to the AarnaRegistry contract
        */
@@ -2062,7 +4002,9 @@ export type AarnaRegistryComposer<TReturns extends [...any[]] = []> = {
   /**
    * Calls the submit_project(string,string,string,string)uint64 ABI method.
    *
-   * Developer submits a new project. Returns the project index.
+  * Developer submits a new project. Returns the project index.
+  Each evidence bundle (CID) can back only one project, and the encoded metadata is capped at MAX_META_BYTES so the record can always be read.
+
    *
    * @param args The arguments for the contract call
    * @param params Any additional parameters for the call
@@ -2092,6 +4034,19 @@ export type AarnaRegistryComposer<TReturns extends [...any[]] = []> = {
    */
   rejectProject(params?: CallParams<AarnaRegistryArgs['obj']['reject_project(uint64)void'] | AarnaRegistryArgs['tuple']['reject_project(uint64)void']>): AarnaRegistryComposer<[...TReturns, AarnaRegistryReturns['reject_project(uint64)void'] | undefined]>
 
+  /**
+   * Calls the review_projects_batch((uint64,uint8,uint64)[])uint8[] ABI method.
+   *
+  * Validator approves / rejects many projects in one call.
+  Ids that are unknown, no longer pending or carry an invalid decision are skipped and reported; the returned codes line up with `decisions`. At most MAX_REVIEW_BATCH decisions, as each applied one logs an event.
+
+   *
+   * @param args The arguments for the contract call
+   * @param params Any additional parameters for the call
+   * @returns The typed transaction composer so you can fluently chain multiple calls or call execute to execute all queued up transactions
+   */
+  reviewProjectsBatch(params?: CallParams<AarnaRegistryArgs['obj']['review_projects_batch((uint64,uint8,uint64)[])uint8[]'] | AarnaRegistryArgs['tuple']['review_projects_batch((uint64,uint8,uint64)[])uint8[]']>): AarnaRegistryComposer<[...TReturns, AarnaRegistryReturns['review_projects_batch((uint64,uint8,uint64)[])uint8[]'] | undefined]>
+
   /**
    * Calls the issue_credits(uint64)uint64 ABI method.
    *
@@ -2106,33 +4061,74 @@ export type AarnaRegistryComposer<TReturns extends [...any[]] = []> = {
   issueCredits(params?: CallParams<AarnaRegistryArgs['obj']['issue_credits(uint64)uint64'] | AarnaRegistryArgs['tuple']['issue_credits(uint64)uint64']>): AarnaRegistryComposer<[...TReturns, AarnaRegistryReturns['issue_credits(uint64)uint64'] | undefined]>
 
   /**
-   * Calls the list_for_sale(uint64,uint64)uint64 ABI method.
+   * Calls the issue_credits_batch(uint64[])uint64[] ABI method.
+   *
+  * Validator issues credits for up to MAX_ISSUE_BATCH verified projects in
+  one call. Transfers go out as one inner group with zero fees, so the outer transaction pays for all of them. Unknown or unverified ids are skipped with an amount of 0; the amounts line up with `project_ids`.
+
+   *
+   * @param args The arguments for the contract call
+   * @param params Any additional parameters for the call
+   * @returns The typed transaction composer so you can fluently chain multiple calls or call execute to execute all queued up transactions
+   */
+  issueCreditsBatch(params?: CallParams<AarnaRegistryArgs['obj']['issue_credits_batch(uint64[])uint64[]'] | AarnaRegistryArgs['tuple']['issue_credits_batch(uint64[])uint64[]']>): AarnaRegistryComposer<[...TReturns, AarnaRegistryReturns['issue_credits_batch(uint64[])uint64[]'] | undefined]>
+
+  /**
+   * Calls the list_for_sale(uint64,uint64,uint64,pay)uint64 ABI method.
    *
   * List AARNA tokens for sale using clawback to escrow.
-  Returns the listing index.
+  `prev_price` is the highest listed price below `price_per_token` (0 if there is none; see get_price_hint), only needed when no listing has that price yet. `deposit` (to the app, from the seller) funds the listing's boxes: LISTING_DEPOSIT, or LISTING_REFUND when a freed id is reused, with any excess refunded. Returns the listing index.
+
+   *
+   * @param args The arguments for the contract call
+   * @param params Any additional parameters for the call
+   * @returns The typed transaction composer so you can fluently chain multiple calls or call execute to execute all queued up transactions
+   */
+  listForSale(params?: CallParams<AarnaRegistryArgs['obj']['list_for_sale(uint64,uint64,uint64,pay)uint64'] | AarnaRegistryArgs['tuple']['list_for_sale(uint64,uint64,uint64,pay)uint64']>): AarnaRegistryComposer<[...TReturns, AarnaRegistryReturns['list_for_sale(uint64,uint64,uint64,pay)uint64'] | undefined]>
+
+  /**
+   * Calls the buy_listing(uint64,pay)void ABI method.
+   *
+  * Buy tokens from a listing. Transfers tokens to buyer and ALGO to seller.
+  `payment` (to the app, from the buyer) must cover the cost; any excess is refunded.
+
+   *
+   * @param args The arguments for the contract call
+   * @param params Any additional parameters for the call
+   * @returns The typed transaction composer so you can fluently chain multiple calls or call execute to execute all queued up transactions
+   */
+  buyListing(params?: CallParams<AarnaRegistryArgs['obj']['buy_listing(uint64,pay)void'] | AarnaRegistryArgs['tuple']['buy_listing(uint64,pay)void']>): AarnaRegistryComposer<[...TReturns, AarnaRegistryReturns['buy_listing(uint64,pay)void'] | undefined]>
+
+  /**
+   * Calls the buy_listing_partial(uint64,uint64,pay)void ABI method.
+   *
+  * Buy part of a listing. The rest stays listed at the same price; the
+  listing closes once its amount reaches zero. Paid for like buy_listing.
 
    *
    * @param args The arguments for the contract call
    * @param params Any additional parameters for the call
    * @returns The typed transaction composer so you can fluently chain multiple calls or call execute to execute all queued up transactions
    */
-  listForSale(params?: CallParams<AarnaRegistryArgs['obj']['list_for_sale(uint64,uint64)uint64'] | AarnaRegistryArgs['tuple']['list_for_sale(uint64,uint64)uint64']>): AarnaRegistryComposer<[...TReturns, AarnaRegistryReturns['list_for_sale(uint64,uint64)uint64'] | undefined]>
+  buyListingPartial(params?: CallParams<AarnaRegistryArgs['obj']['buy_listing_partial(uint64,uint64,pay)void'] | AarnaRegistryArgs['tuple']['buy_listing_partial(uint64,uint64,pay)void']>): AarnaRegistryComposer<[...TReturns, AarnaRegistryReturns['buy_listing_partial(uint64,uint64,pay)void'] | undefined]>
 
   /**
-   * Calls the buy_listing(uint64,uint64)void ABI method.
+   * Calls the sweep_listings(uint64[],uint64,uint64,pay)(uint64,uint64) ABI method.
    *
-   * Buy tokens from a listing. Transfers tokens to buyer and ALGO to seller.
+  * Fill listings in the given order until `max_quantity` tokens are bought
+  or `max_total_price` would be exceeded; the last one may fill partially. Closed or unknown ids are skipped. `payment` (to the app, from the buyer) must cover what is spent. All seller payments (each with the LISTING_REFUND of a listing bought out), a single token transfer to the buyer and the refund of the unspent payment go out as one inner group (at most MAX_SWEEP_FILLS listings). Returns the tokens filled and the ALGO spent.
+
    *
    * @param args The arguments for the contract call
    * @param params Any additional parameters for the call
    * @returns The typed transaction composer so you can fluently chain multiple calls or call execute to execute all queued up transactions
    */
-  buyListing(params?: CallParams<AarnaRegistryArgs['obj']['buy_listing(uint64,uint64)void'] | AarnaRegistryArgs['tuple']['buy_listing(uint64,uint64)void']>): AarnaRegistryComposer<[...TReturns, AarnaRegistryReturns['buy_listing(uint64,uint64)void'] | undefined]>
+  sweepListings(params?: CallParams<AarnaRegistryArgs['obj']['sweep_listings(uint64[],uint64,uint64,pay)(uint64,uint64)'] | AarnaRegistryArgs['tuple']['sweep_listings(uint64[],uint64,uint64,pay)(uint64,uint64)']>): AarnaRegistryComposer<[...TReturns, AarnaRegistryReturns['sweep_listings(uint64[],uint64,uint64,pay)(uint64,uint64)'] | undefined]>
 
   /**
    * Calls the cancel_listing(uint64)void ABI method.
    *
-   * Seller cancels their listing. Escrowed tokens returned.
+   * Seller cancels their listing. Escrowed tokens and LISTING_REFUND returned.
    *
    * @param args The arguments for the contract call
    * @param params Any additional parameters for the call
@@ -2194,9 +4190,129 @@ export type AarnaRegistryComposer<TReturns extends [...any[]] = []> = {
    */
   getProject(params?: CallParams<AarnaRegistryArgs['obj']['get_project(uint64)(address,string,string,string,string,uint64,uint64)'] | AarnaRegistryArgs['tuple']['get_project(uint64)(address,string,string,string,string,uint64,uint64)']>): AarnaRegistryComposer<[...TReturns, AarnaRegistryReturns['get_project(uint64)(address,string,string,string,string,uint64,uint64)'] | undefined]>
 
+  /**
+   * Calls the get_project_header(uint64)(address,uint64,uint64) ABI method.
+   *
+   * Status / credits / submitter only — a single 48-byte box read.
+   *
+   * @param args The arguments for the contract call
+   * @param params Any additional parameters for the call
+   * @returns The typed transaction composer so you can fluently chain multiple calls or call execute to execute all queued up transactions
+   */
+  getProjectHeader(params?: CallParams<AarnaRegistryArgs['obj']['get_project_header(uint64)(address,uint64,uint64)'] | AarnaRegistryArgs['tuple']['get_project_header(uint64)(address,uint64,uint64)']>): AarnaRegistryComposer<[...TReturns, AarnaRegistryReturns['get_project_header(uint64)(address,uint64,uint64)'] | undefined]>
+
+  /**
+   * Calls the find_project_by_cid(string)uint64 ABI method.
+   *
+   * Id of the project filed with this CID, or NO_ID if there is none.
+   *
+   * @param args The arguments for the contract call
+   * @param params Any additional parameters for the call
+   * @returns The typed transaction composer so you can fluently chain multiple calls or call execute to execute all queued up transactions
+   */
+  findProjectByCid(params?: CallParams<AarnaRegistryArgs['obj']['find_project_by_cid(string)uint64'] | AarnaRegistryArgs['tuple']['find_project_by_cid(string)uint64']>): AarnaRegistryComposer<[...TReturns, AarnaRegistryReturns['find_project_by_cid(string)uint64'] | undefined]>
+
+  /**
+   * Calls the get_pending_ids(uint64,uint64)uint64[] ABI method.
+   *
+   * Next `count` pending project ids after `after` (NO_ID = from the start).
+   *
+   * @param args The arguments for the contract call
+   * @param params Any additional parameters for the call
+   * @returns The typed transaction composer so you can fluently chain multiple calls or call execute to execute all queued up transactions
+   */
+  getPendingIds(params?: CallParams<AarnaRegistryArgs['obj']['get_pending_ids(uint64,uint64)uint64[]'] | AarnaRegistryArgs['tuple']['get_pending_ids(uint64,uint64)uint64[]']>): AarnaRegistryComposer<[...TReturns, AarnaRegistryReturns['get_pending_ids(uint64,uint64)uint64[]'] | undefined]>
+
+  /**
+   * Calls the get_verified_ids(uint64,uint64)uint64[] ABI method.
+   *
+   * Next `count` verified, not yet issued ids after `after` (NO_ID = start).
+   *
+   * @param args The arguments for the contract call
+   * @param params Any additional parameters for the call
+   * @returns The typed transaction composer so you can fluently chain multiple calls or call execute to execute all queued up transactions
+   */
+  getVerifiedIds(params?: CallParams<AarnaRegistryArgs['obj']['get_verified_ids(uint64,uint64)uint64[]'] | AarnaRegistryArgs['tuple']['get_verified_ids(uint64,uint64)uint64[]']>): AarnaRegistryComposer<[...TReturns, AarnaRegistryReturns['get_verified_ids(uint64,uint64)uint64[]'] | undefined]>
+
+  /**
+   * Calls the get_projects_by_submitter(address,uint64,uint64)uint64[] ABI method.
+   *
+   * Project ids filed by `addr`, oldest first, paged by position.
+   *
+   * @param args The arguments for the contract call
+   * @param params Any additional parameters for the call
+   * @returns The typed transaction composer so you can fluently chain multiple calls or call execute to execute all queued up transactions
+   */
+  getProjectsBySubmitter(params?: CallParams<AarnaRegistryArgs['obj']['get_projects_by_submitter(address,uint64,uint64)uint64[]'] | AarnaRegistryArgs['tuple']['get_projects_by_submitter(address,uint64,uint64)uint64[]']>): AarnaRegistryComposer<[...TReturns, AarnaRegistryReturns['get_projects_by_submitter(address,uint64,uint64)uint64[]'] | undefined]>
+
+  /**
+   * Calls the get_listings_by_seller(address,uint64,uint64)uint64[] ABI method.
+   *
+  * Open listing ids of `addr`, paged by position. Closing a listing moves
+  the seller's last id into its slot, so order is not chronological.
+
+   *
+   * @param args The arguments for the contract call
+   * @param params Any additional parameters for the call
+   * @returns The typed transaction composer so you can fluently chain multiple calls or call execute to execute all queued up transactions
+   */
+  getListingsBySeller(params?: CallParams<AarnaRegistryArgs['obj']['get_listings_by_seller(address,uint64,uint64)uint64[]'] | AarnaRegistryArgs['tuple']['get_listings_by_seller(address,uint64,uint64)uint64[]']>): AarnaRegistryComposer<[...TReturns, AarnaRegistryReturns['get_listings_by_seller(address,uint64,uint64)uint64[]'] | undefined]>
+
+  /**
+   * Calls the get_stats()(uint64,uint64,uint64,uint64,uint64,uint64,uint64,uint64,uint64,uint64) ABI method.
+   *
+   * Every aggregate counter in one call; volume_traded is in microAlgo.
+   *
+   * @param args The arguments for the contract call
+   * @param params Any additional parameters for the call
+   * @returns The typed transaction composer so you can fluently chain multiple calls or call execute to execute all queued up transactions
+   */
+  getStats(params?: CallParams<AarnaRegistryArgs['obj']['get_stats()(uint64,uint64,uint64,uint64,uint64,uint64,uint64,uint64,uint64,uint64)'] | AarnaRegistryArgs['tuple']['get_stats()(uint64,uint64,uint64,uint64,uint64,uint64,uint64,uint64,uint64,uint64)']>): AarnaRegistryComposer<[...TReturns, AarnaRegistryReturns['get_stats()(uint64,uint64,uint64,uint64,uint64,uint64,uint64,uint64,uint64,uint64)'] | undefined]>
+
+  /**
+   * Calls the get_best_offers(uint64)(uint64,uint64,uint64)[] ABI method.
+   *
+  * The `count` cheapest active offers, in price then listing-time order.
+  Capped at MAX_BOOK_PAGE and by the available opcode budget.
+
+   *
+   * @param args The arguments for the contract call
+   * @param params Any additional parameters for the call
+   * @returns The typed transaction composer so you can fluently chain multiple calls or call execute to execute all queued up transactions
+   */
+  getBestOffers(params?: CallParams<AarnaRegistryArgs['obj']['get_best_offers(uint64)(uint64,uint64,uint64)[]'] | AarnaRegistryArgs['tuple']['get_best_offers(uint64)(uint64,uint64,uint64)[]']>): AarnaRegistryComposer<[...TReturns, AarnaRegistryReturns['get_best_offers(uint64)(uint64,uint64,uint64)[]'] | undefined]>
+
+  /**
+   * Calls the get_depth(uint64)(uint64,uint64,uint64)[] ABI method.
+   *
+  * Aggregate depth per price level, cheapest first, for every level priced
+  at or below `price_limit` (up to MAX_BOOK_PAGE levels).
+
+   *
+   * @param args The arguments for the contract call
+   * @param params Any additional parameters for the call
+   * @returns The typed transaction composer so you can fluently chain multiple calls or call execute to execute all queued up transactions
+   */
+  getDepth(params?: CallParams<AarnaRegistryArgs['obj']['get_depth(uint64)(uint64,uint64,uint64)[]'] | AarnaRegistryArgs['tuple']['get_depth(uint64)(uint64,uint64,uint64)[]']>): AarnaRegistryComposer<[...TReturns, AarnaRegistryReturns['get_depth(uint64)(uint64,uint64,uint64)[]'] | undefined]>
+
+  /**
+   * Calls the get_price_hint(uint64)uint64 ABI method.
+   *
+  * The `prev_price` for list_for_sale at `price`: the highest listed price
+  below it, or 0. Walks the book, so simulate it with extra budget.
+
+   *
+   * @param args The arguments for the contract call
+   * @param params Any additional parameters for the call
+   * @returns The typed transaction composer so you can fluently chain multiple calls or call execute to execute all queued up transactions
+   */
+  getPriceHint(params?: CallParams<AarnaRegistryArgs['obj']['get_price_hint(uint64)uint64'] | AarnaRegistryArgs['tuple']['get_price_hint(uint64)uint64']>): AarnaRegistryComposer<[...TReturns, AarnaRegistryReturns['get_price_hint(uint64)uint64'] | undefined]>
+
   /**
    * Calls the get_listing(uint64)(address,uint64,uint64,uint64) ABI method.
    *
+   * Closed or never-used ids read back as an all-zero, inactive record.
+   *
    * @param args The arguments for the contract call
    * @param params Any additional parameters for the call
    * @returns The typed transaction composer so you can fluently chain multiple calls or call execute to execute all queued up transactions
@@ -2206,12 +4322,49 @@ export type AarnaRegistryComposer<TReturns extends [...any[]] = []> = {
   /**
    * Calls the get_listing_count()uint64 ABI method.
    *
+   * Upper bound on listing ids (ids are recycled), not the open count.
+   *
    * @param args The arguments for the contract call
    * @param params Any additional parameters for the call
    * @returns The typed transaction composer so you can fluently chain multiple calls or call execute to execute all queued up transactions
    */
   getListingCount(params?: CallParams<AarnaRegistryArgs['obj']['get_listing_count()uint64'] | AarnaRegistryArgs['tuple']['get_listing_count()uint64']>): AarnaRegistryComposer<[...TReturns, AarnaRegistryReturns['get_listing_count()uint64'] | undefined]>
 
+  /**
+   * Calls the get_open_listing_count()uint64 ABI method.
+   *
+   * @param args The arguments for the contract call
+   * @param params Any additional parameters for the call
+   * @returns The typed transaction composer so you can fluently chain multiple calls or call execute to execute all queued up transactions
+   */
+  getOpenListingCount(params?: CallParams<AarnaRegistryArgs['obj']['get_open_listing_count()uint64'] | AarnaRegistryArgs['tuple']['get_open_listing_count()uint64']>): AarnaRegistryComposer<[...TReturns, AarnaRegistryReturns['get_open_listing_count()uint64'] | undefined]>
+
+  /**
+   * Calls the get_projects_page(uint64,uint64)(uint64,(address,string,string,string,string,uint64,uint64)[]) ABI method.
+   *
+  * Returns up to `count` projects from `start`, stopping early when the
+  return-size limit or opcode budget is reached. `next_id` is the cursor for the following call; the scan is done once it equals the project count. Metadata is capped at submission, so any one record fits a page.
+
+   *
+   * @param args The arguments for the contract call
+   * @param params Any additional parameters for the call
+   * @returns The typed transaction composer so you can fluently chain multiple calls or call execute to execute all queued up transactions
+   */
+  getProjectsPage(params?: CallParams<AarnaRegistryArgs['obj']['get_projects_page(uint64,uint64)(uint64,(address,string,string,string,string,uint64,uint64)[])'] | AarnaRegistryArgs['tuple']['get_projects_page(uint64,uint64)(uint64,(address,string,string,string,string,uint64,uint64)[])']>): AarnaRegistryComposer<[...TReturns, AarnaRegistryReturns['get_projects_page(uint64,uint64)(uint64,(address,string,string,string,string,uint64,uint64)[])'] | undefined]>
+
+  /**
+   * Calls the get_listings_page(uint64,uint64)(uint64,(address,uint64,uint64,uint64)[]) ABI method.
+   *
+  * Returns up to `count` listings from `start`, stopping early when the
+  return-size limit or opcode budget is reached. `next_id` is the cursor for the following call; the scan is done once it equals the listing count. Items stay positional: a freed id reads back as an all-zero record.
+
+   *
+   * @param args The arguments for the contract call
+   * @param params Any additional parameters for the call
+   * @returns The typed transaction composer so you can fluently chain multiple calls or call execute to execute all queued up transactions
+   */
+  getListingsPage(params?: CallParams<AarnaRegistryArgs['obj']['get_listings_page(uint64,uint64)(uint64,(address,uint64,uint64,uint64)[])'] | AarnaRegistryArgs['tuple']['get_listings_page(uint64,uint64)(uint64,(address,uint64,uint64,uint64)[])']>): AarnaRegistryComposer<[...TReturns, AarnaRegistryReturns['get_listings_page(uint64,uint64)(uint64,(address,uint64,uint64,uint64)[])'] | undefined]>
+
   /**
    * Makes a clear_state call to an existing instance of the AarnaRegistry smart contract.
    *
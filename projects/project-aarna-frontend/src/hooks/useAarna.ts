@@ -32,6 +32,13 @@ export interface AarnaListing {
 const LS_APP_ID = 'aarna_app_id'
 const LS_ASSET_ID = 'aarna_asset_id'
 
+// Box MBR is 2500 + 400 * (key + value) µALGO per box
+const boxMbr = (keySize: number, valueSize: number) => 2500 + 400 * (keySize + valueSize)
+
+// Readonly calls are simulated, so they need no signer; the extra budget lets
+// a page hold more records and the price-hint walk cover a deeper book.
+const READ_OPTIONS = { skipSignatures: true, allowUnnamedResources: true, extraOpcodeBudget: 20_000 }
+
 export function useAarna() {
     const { transactionSigner, activeAddress } = useWallet()
     const { enqueueSnackbar } = useSnackbar()
@@ -88,6 +95,7 @@ export function useAarna() {
         if (msg.includes('project not verified')) return 'Project must be verified before issuing credits'
         if (msg.includes('listing not active')) return 'This listing is no longer active'
         if (msg.includes('insufficient payment')) return 'Not enough ALGO sent for this purchase'
+        if (msg.includes('insufficient deposit')) return 'Not enough ALGO sent for the listing deposit'
         if (msg.includes('only seller can cancel')) return 'Only the seller can cancel this listing'
         if (msg.includes('no AARNA token')) return 'Create the AARNA token first'
         if (msg.includes('assert failed') || msg.includes('Error resolving execution info via simulate')) {
@@ -125,45 +133,51 @@ export function useAarna() {
                 localStorage.setItem(LS_ASSET_ID, onChainAssetId.toString())
             }
 
-            // Fetch projects — direct box reads (no signer required)
+            // Fetch projects — paged readonly calls, resumed from next_id until
+            // the whole range is read (a page stops early at the return limit)
+            const sender = client.appAddress
             const onChain: AarnaProject[] = []
-            for (let i = 0; i < count; i++) {
-                try {
-                    const rec = await client.state.box.projects.value(i)
-                    if (!rec) continue
-                    const statusNum = Number(rec.status ?? 0)
+            for (let start = 0; start < count;) {
+                const { returns } = await client.newGroup()
+                    .getProjectsPage({ args: { start, count: count - start }, sender })
+                    .simulate(READ_OPTIONS)
+                const page = returns[0]!
+                page.items.forEach(([submitter, name, location, ecosystem, cid, status, credits], i) => {
                     onChain.push({
-                        id: i,
-                        name: rec.name ?? '',
-                        location: rec.location ?? '',
-                        ecosystem: rec.ecosystem ?? '',
-                        cid: rec.cid ?? '',
-                        status: STATUS_MAP[statusNum] ?? 'pending',
-                        credits: Number(rec.credits ?? 0),
-                        submitter: rec.submitter ?? '',
+                        id: start + i,
+                        name, location, ecosystem, cid,
+                        status: STATUS_MAP[Number(status)] ?? 'pending',
+                        credits: Number(credits),
+                        submitter,
                     })
-                } catch (e) {
-                    console.warn(`Could not fetch project ${i}:`, e)
-                }
+                })
+                const next = Number(page.next_id)
+                if (next <= start) { console.warn(`Could not fetch project ${start}`); break }
+                start = next
             }
             setProjects(onChain)
 
-            // Fetch listings — direct box reads (no signer required)
+            // Fetch listings — same paging; ids are recycled, so a freed id
+            // reads back as an all-zero, inactive record and is skipped
             const onChainListings: AarnaListing[] = []
-            for (let i = 0; i < lCount; i++) {
-                try {
-                    const rec = await client.state.box.listings.value(i)
-                    if (!rec) continue
+            for (let start = 0; start < lCount;) {
+                const { returns } = await client.newGroup()
+                    .getListingsPage({ args: { start, count: lCount - start }, sender })
+                    .simulate(READ_OPTIONS)
+                const page = returns[0]!
+                page.items.forEach(([seller, amount, price, active], i) => {
+                    if (Number(active) !== 1) return
                     onChainListings.push({
-                        id: i,
-                        seller: rec.seller ?? '',
-                        amount: Number(rec.amount ?? 0),
-                        pricePerToken: Number(rec.price ?? 0),
-                        active: Number(rec.active ?? 0) === 1,
+                        id: start + i,
+                        seller,
+                        amount: Number(amount),
+                        pricePerToken: Number(price),
+                        active: true,
                     })
-                } catch (e) {
-                    console.warn(`Could not fetch listing ${i}:`, e)
-                }
+                })
+                const next = Number(page.next_id)
+                if (next <= start) { console.warn(`Could not fetch listing ${start}`); break }
+                start = next
             }
             setListings(onChainListings)
         } catch (e) {
@@ -274,18 +288,22 @@ export function useAarna() {
         if (!ensureWallet() || !needClient()) return undefined
         setBusy(true)
         try {
-            // Calculate MBR for the new project box dynamically
-            // Box key = "p" prefix (1 byte) + uint64 (8 bytes) = 9 bytes
-            // Box value = 32 (address) + 2+len(name) + 2+len(location) + 2+len(ecosystem) + 2+len(cid) + 8 (status) + 8 (credits)
+            // Calculate MBR for the new project's boxes dynamically
+            // "h" header: 32 (submitter) + 8 (status) + 8 (credits)
+            // "m" metadata: 2+2+len(name) + 2+2+len(location) + 2+2+len(ecosystem) + 2+2+len(cid)
+            // "q" review-queue link: 8 (prev) + 8 (next); all three keyed by prefix + uint64 = 9 bytes
+            // "c" CID index: prefix + sha256(cid) = 33 bytes -> uint64 project id
+            // "s" submitter index: count box (prefix + address) and the id page it appends to
+            // (prefix + address + uint64), both counted as new in case this starts them
             const encoder = new TextEncoder()
-            const valueSize = 32 + (2 + encoder.encode(name).length) + (2 + encoder.encode(location).length)
-                + (2 + encoder.encode(ecosystem).length) + (2 + encoder.encode(cid).length) + 8 + 8
-            const boxKeySize = 9  // "p" + uint64
-            const boxMbr = 2500 + 400 * (boxKeySize + valueSize) + 50_000 // extra buffer
+            const metaSize = [name, location, ecosystem, cid]
+                .reduce((size, field) => size + 4 + encoder.encode(field).length, 0)
+            const mbr = boxMbr(9, 48) + boxMbr(9, metaSize) + boxMbr(9, 16) + boxMbr(33, 8)
+                + boxMbr(33, 8) + boxMbr(41, 8)
             const appAddr = appClient.appAddress
             await algorand.send.payment({
                 sender: activeAddress!, receiver: appAddr,
-                amount: AlgoAmount.MicroAlgo(boxMbr), signer: transactionSigner,
+                amount: AlgoAmount.MicroAlgo(mbr), signer: transactionSigner,
             })
             const r = await appClient.send.submitProject({
                 args: { name, location, ecosystem, cid },
@@ -439,14 +457,25 @@ export function useAarna() {
         if (!ensureWallet() || !needClient()) return
         setBusy(true)
         try {
-            // Fund MBR for new listing box (~56 bytes = ~57_300 µAlgo)
-            const appAddr = appClient.appAddress
-            await algorand.send.payment({
-                sender: activeAddress!, receiver: appAddr,
-                amount: AlgoAmount.MicroAlgo(57_300), signer: transactionSigner,
+            // Deposit the MBR of the listing's boxes, counting every optional one as new
+            // (the contract's LISTING_DEPOSIT): "l" listing (56 bytes), "k" order-book
+            // link (24), "o" price level (48), all keyed by prefix + uint64; "t" seller
+            // index count and id page. It is refunded when the listing closes, and the
+            // part a reused listing id doesn't need comes back straight away.
+            const mbr = boxMbr(9, 56) + boxMbr(9, 24) + boxMbr(9, 48) + boxMbr(33, 8) + boxMbr(41, 8)
+            const deposit = await algorand.createTransaction.payment({
+                sender: activeAddress!, receiver: appClient.appAddress,
+                amount: AlgoAmount.MicroAlgo(mbr),
             })
+            // Look up the price hint in a simulated call; list_for_sale only checks it
+            const { returns } = await appClient.newGroup()
+                .getPriceHint({ args: { price: BigInt(pricePerToken) }, sender: activeAddress! })
+                .simulate(READ_OPTIONS)
             const r = await appClient.send.listForSale({
-                args: { amount: BigInt(amount), pricePerToken: BigInt(pricePerToken) },
+                args: {
+                    amount: BigInt(amount), pricePerToken: BigInt(pricePerToken), prevPrice: returns[0]!,
+                    deposit: { txn: deposit, signer: transactionSigner },
+                },
                 sender: activeAddress!, signer: transactionSigner,
                 populateAppCallResources: true,
                 extraFee: AlgoAmount.MicroAlgo(2_000),
@@ -470,15 +499,13 @@ export function useAarna() {
         setBusy(true)
         try {
             const totalCost = BigInt(listing.amount) * BigInt(listing.pricePerToken)
-            // Fund the contract so it can pay the seller via inner txn
-            const appAddr = appClient.appAddress
-            await algorand.send.payment({
-                sender: activeAddress!, receiver: appAddr,
+            // The payment rides in the same atomic group; the app forwards it to the seller
+            const payment = await algorand.createTransaction.payment({
+                sender: activeAddress!, receiver: appClient.appAddress,
                 amount: AlgoAmount.MicroAlgo(Number(totalCost)),
-                signer: transactionSigner,
             })
             await appClient.send.buyListing({
-                args: { listingId: BigInt(listingId), payment: totalCost },
+                args: { listingId: BigInt(listingId), payment: { txn: payment, signer: transactionSigner } },
                 sender: activeAddress!, signer: transactionSigner,
                 populateAppCallResources: true,
                 extraFee: AlgoAmount.MicroAlgo(4_000),